@@ -0,0 +1,167 @@
+# Bad pixel maps of the FOCAS chips and their repair.
+#
+# A map is a set of boolean masks of the overscan removed and trimmed
+# data of a chip (see bias_overscan.chip_shape), for each DET-ID and
+# binning, one mask for each repair method:
+# 'column': bad columns, interpolated along X from the nearest good
+#           pixels on both sides
+# 'row':    bad rows, interpolated along Y
+# 'pixel':  bad pixels, replaced by the average of their good 4
+#           neighbours
+# The masks are stored bit-packed in data/badpix.npz (made by
+# util/create_focas_badpix.py), which is read the first time a map is
+# needed.
+
+import os
+import threading
+import numpy as np
+
+badpix_file = os.path.join(os.path.dirname(__file__), 'data', 'badpix.npz')
+
+repair_methods = ('column', 'row', 'pixel')
+
+_masks = None
+_lock = threading.Lock()
+
+
+def save_masks(filepath, masks):
+    # masks: dict of {method: mask} dicts, keyed by (DET-ID, BIN-FCT1,
+    # BIN-FCT2)
+    arrays = {}
+    for (detid, binfac1, binfac2), chip_masks in masks.items():
+        for method, mask in chip_masks.items():
+            if method not in repair_methods:
+                raise ValueError("repair method should be one of %s: %s" % (
+                    str(repair_methods), method))
+            key = '%s_%d_%d_%d' % (method, detid, binfac1, binfac2)
+            arrays[key] = np.packbits(np.asarray(mask, dtype=bool))
+            arrays['shape_' + key] = np.array(np.shape(mask))
+    np.savez_compressed(filepath, **arrays)
+
+
+def load_masks(filepath=badpix_file):
+    # Reads the masks of a file written by save_masks(), in the same form
+    masks = {}
+    with np.load(filepath) as npz:
+        for key in npz.files:
+            if key.startswith('shape_'):
+                continue
+            method, detid, binfac1, binfac2 = key.split('_')
+            shape = tuple(npz['shape_' + key])
+            mask = np.unpackbits(npz[key], count=int(np.prod(shape)))
+            mask = mask.reshape(shape).view(bool)
+            mask.flags.writeable = False
+            chip_masks = masks.setdefault((int(detid), int(binfac1),
+                                           int(binfac2)), {})
+            chip_masks[method] = mask
+    return masks
+
+
+def get_masks(detid, binfac1, binfac2):
+    # The masks of a chip and binning, as a dict keyed by repair method
+    # (empty if there are no known bad pixels). The file is read on the
+    # first call.
+    global _masks
+    with _lock:
+        if _masks is None:
+            _masks = load_masks()
+        return _masks.get((detid, binfac1, binfac2), {})
+
+
+def _runs(mask):
+    # Runs of True along X in a 2D mask: rows, start and end (exclusive)
+    # columns. The mask is padded with a False column on both sides, so
+    # that no run spans two rows.
+    nx = mask.shape[1]
+    padded = np.zeros((mask.shape[0], nx+2), dtype=np.int8)
+    padded[:,1:-1] = mask
+    d = np.diff(padded.ravel())
+    starts = np.flatnonzero(d == 1) + 1
+    ends = np.flatnonzero(d == -1) + 1
+    return starts // (nx+2), starts % (nx+2) - 1, ends % (nx+2) - 1
+
+
+def _interp_x(data, mask):
+    # Linear interpolation along X across the runs of masked pixels,
+    # from the good pixels just before and after each run (or copy of
+    # the only one at the edges).
+    rows = np.flatnonzero(mask.any(axis=1))
+    if len(rows) == 0:
+        return
+    nx = mask.shape[1]
+    r, c0, c1 = _runs(mask[rows])
+    r = rows[r]
+    left = c0 - 1
+    right = c1
+    okl = left >= 0
+    okr = right < nx
+    keep = okl | okr
+    r, c0, c1, left, right, okl, okr = [v[keep] for v in
+                                        (r, c0, c1, left, right, okl, okr)]
+    # the same neighbour on both sides if there is only one
+    left = np.where(okl, left, right)
+    right = np.where(okr, right, left)
+
+    # expand the runs into pixels
+    lengths = c1 - c0
+    pr = np.repeat(r, lengths)
+    offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) -
+                                                   lengths, lengths)
+    pc = np.repeat(c0, lengths) + offsets
+    pl = np.repeat(left, lengths)
+    prt = np.repeat(right, lengths)
+    span = np.maximum(prt - pl, 1)
+    w = (pc - pl) / span
+    w[prt == pl] = 0.0
+    data[pr, pc] = data[pr, pl] * (1.0 - w) + data[pr, prt] * w
+
+
+def _average_neighbours(data, mask):
+    # Average of the good 4 neighbours of each masked pixel (computed
+    # from the values before the repair); pixels with no good neighbour
+    # are left as they are.
+    r, c = np.nonzero(mask)
+    ny, nx = mask.shape
+    total = np.zeros(len(r))
+    count = np.zeros(len(r))
+    for dy, dx in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+        nr = r + dy
+        nc = c + dx
+        ok = (nr >= 0) & (nr < ny) & (nc >= 0) & (nc < nx)
+        nr = np.where(ok, nr, r)
+        nc = np.where(ok, nc, c)
+        ok &= ~mask[nr, nc]
+        total += np.where(ok, data[nr, nc], 0.0)
+        count += ok
+    fix = count > 0
+    data[r[fix], c[fix]] = total[fix] / count[fix]
+
+
+def repair_pixels(data, mask, method='column'):
+    # Replaces the pixels of the 2D data flagged in mask, in place, in a
+    # single vectorized pass (see the repair methods above). Pixels
+    # without any good neighbour to use are left as they are.
+    mask = np.asarray(mask, dtype=bool)
+    if mask.shape != data.shape:
+        raise ValueError("mask should have the shape of the data %s: %s" % (
+            str(data.shape), str(mask.shape)))
+    if method == 'column':
+        _interp_x(data, mask)
+    elif method == 'row':
+        _interp_x(data.T, mask.T)
+    elif method == 'pixel':
+        _average_neighbours(data, mask)
+    else:
+        raise ValueError("repair method should be one of %s: %s" % (
+            str(repair_methods), method))
+    return data
+
+
+def repair_chip(data, detid, binfac1, binfac2):
+    # Repairs the known bad pixels of the overscan removed and trimmed
+    # data of a chip, in place.
+    masks = get_masks(detid, binfac1, binfac2)
+    for method in repair_methods:
+        if method in masks:
+            repair_pixels(data, masks[method], method=method)
+    return data
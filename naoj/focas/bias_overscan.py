@@ -2,9 +2,14 @@
 
 import numpy as np
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from astropy.io import fits
 import argparse
 from . import focasifu as fi
+from . import badpix
+from ..util import header_index
 
 # Definitions for the over scan regions in the DS9 image coordinate.
 # Format
@@ -61,7 +66,150 @@ overscan[4] = np.asarray([
     [439, 455, 456, 583, 584, 584]
     ])
 
-def bias_subtraction(inhdl, template_pfx):
+# Trim Y range
+yrange = [[51, 4220], # for 1 bin
+          [26, 2110], # for 2 bin
+          [17, 1406], # for 3 bin
+          [13,1055]]  # for 4 bin
+
+# Convert the count values to electrons.
+# From the leftmost amp of DET-ID=2 to the rightmost amp of DET-ID=1
+gain = [2.054, 1.987, 1.999, 1.918, 2.081, 2.047, 2.111, 2.087] # electron/ADU
+
+def template_levels(bias_template_data, ovs):
+    # Sum of the mean bias template levels in the left and right
+    # overscan regions of each amp. These never change for a template,
+    # so they are computed once rather than for every row.
+    return np.array([np.mean(bias_template_data[o[0]-1:o[1]]) +
+                     np.mean(bias_template_data[o[4]-1:o[5]])
+                     for o in ovs])
+
+
+def overscan_levels(scidata, ovs, nrows=5):
+    # Sum of the mean levels in the left and right overscan regions of
+    # each amp, averaged over a sliding window of 'nrows' rows.
+    # Row i of the result is centered on detector row i+nrows//2, so
+    # the result covers detector rows nrows//2 .. height-nrows//2-2,
+    # which are the rows that are bias subtracted.
+    #
+    # All the overscan columns of all the amps are gathered into one
+    # narrow array and the per-row means are reduced in a single call.
+    xidx = np.arange(scidata.shape[1])
+    regions = []
+    for o in ovs:
+        regions.append(xidx[o[0]-1:o[1]])
+        regions.append(xidx[o[4]-1:o[5]])
+    counts = np.array([len(r) for r in regions])
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    ovdata = scidata[:, np.concatenate(regions)].astype(np.float64)
+    rowmeans = np.add.reduceat(ovdata, starts, axis=1) / counts
+    rowmeans = rowmeans[:, 0::2] + rowmeans[:, 1::2]
+
+    # sliding mean over 'nrows' rows by cumulative sums
+    csum = np.zeros((rowmeans.shape[0]+1, rowmeans.shape[1]))
+    np.cumsum(rowmeans, axis=0, out=csum[1:])
+    nwin = rowmeans.shape[0] - nrows
+    return (csum[nrows:nrows+nwin] - csum[:nwin]) / nrows
+
+
+def load_bias_template(template_pfx, binfac1, detid):
+    # Reads the bias template for a binning and detector. Returns None
+    # if there is no usable template file.
+    bias_template_name = template_pfx+str(binfac1)+str(detid)+'.fits'
+    bias_template_data = None
+    if os.path.isfile(bias_template_name):
+        bias_template_hdl = fits.open(bias_template_name)
+        if fi.check_version(bias_template_hdl):
+            bias_template_data = np.array(bias_template_hdl[0].data)
+        bias_template_hdl.close()
+    return bias_template_data
+
+
+# Cache of the loaded bias templates and their per-amp template levels,
+# shared by everything that subtracts bias in this process (biassub,
+# mkflat, reconstruct_image, bias_overscan). Keyed by (template_pfx,
+# BIN-FCT1, DET-ID); an entry is dropped when the template file's
+# modification time changes, and the least recently used entries are
+# dropped beyond template_cache_size entries.
+template_cache_size = 16
+_template_cache = OrderedDict()
+_template_lock = threading.Lock()
+
+
+def get_bias_template(template_pfx, binfac1, detid):
+    # Returns the (bias_template_data, template_level) of a binning and
+    # detector from the template cache, reading the template file only
+    # if it is not cached or has changed. Returns (None, None) if there
+    # is no usable template file.
+    key = (template_pfx, binfac1, detid)
+    bias_template_name = template_pfx+str(binfac1)+str(detid)+'.fits'
+    try:
+        mtime = os.stat(bias_template_name).st_mtime_ns
+    except OSError:
+        with _template_lock:
+            _template_cache.pop(key, None)
+        return None, None
+
+    with _template_lock:
+        entry = _template_cache.get(key, None)
+        if entry is not None and entry[0] == mtime:
+            _template_cache.move_to_end(key)
+            return entry[1], entry[2]
+
+    bias_template_data = load_bias_template(template_pfx, binfac1, detid)
+    if bias_template_data is None:
+        template_level = None
+    else:
+        # shared by all users of the cache
+        bias_template_data.flags.writeable = False
+        k = 4 if detid == 1 else 0
+        template_level = template_levels(bias_template_data,
+                                         overscan[binfac1][k:k+4])
+
+    with _template_lock:
+        _template_cache[key] = (mtime, bias_template_data, template_level)
+        _template_cache.move_to_end(key)
+        while len(_template_cache) > template_cache_size:
+            _template_cache.popitem(last=False)
+    return bias_template_data, template_level
+
+
+def clear_template_cache():
+    with _template_lock:
+        _template_cache.clear()
+
+
+def lookup_template(scidata, template_pfx, templates, binfac1, detid, ovs):
+    # Returns the (bias_template_data, template_level) of a frame: from
+    # the templates dict if given, else from the template cache. Without
+    # a template file, the mean of the top 13 rows is used as bias.
+    if templates is not None and (binfac1, detid) in templates:
+        bias_template_data, template_level = templates[(binfac1, detid)]
+    else:
+        bias_template_data, template_level = \
+                get_bias_template(template_pfx, binfac1, detid)
+        if templates is not None:
+            templates[(binfac1, detid)] = (bias_template_data,
+                                           template_level)
+
+    if bias_template_data is None:
+        #print('!!! There is no bias template file, '+bias_template_name+'.')
+        #print('!!! Top overscan region is refered as bias.')
+        bias_template_data = \
+                np.mean(scidata[scidata.shape[0]-13:scidata.shape[0],:],
+                        axis=0)
+        template_level = template_levels(bias_template_data, ovs)
+    return bias_template_data, template_level
+
+
+def bias_subtraction(inhdl, template_pfx, templates=None):
+    # templates: optional dict of (bias_template_data, template_level)
+    # tuples as returned by get_bias_template(), keyed by (BIN-FCT1,
+    # DET-ID), to pin the templates for a series of frames. Missing
+    # templates are taken from the template cache and added to it.
+    # Pinned templates are not read again if their files change; without
+    # a dict, the template cache is used, which costs only an os.stat
+    # per frame.
     #print(('\t Bias subtracting for the frame ID, %s.'
     #      %inhdl[0].header['FRAMEID']))
     # Bias subtraction
@@ -88,36 +236,20 @@ def bias_subtraction(inhdl, template_pfx):
         k = 0
 
     # Checking the bias template file and making bias 1D data
-    bias_template_name = template_pfx+str(binfac1)+str(detid)+'.fits'
-    use_template = False
-    if os.path.isfile(bias_template_name):
-        bias_template_hdl = fits.open(bias_template_name)
-        if fi.check_version(bias_template_hdl):
-            bias_template_data = bias_template_hdl[0].data
-            use_template = True
-        bias_template_hdl.close()
-
-    if not use_template:
-        #print('!!! There is no bias template file, '+bias_template_name+'.')
-        #print('!!! Top overscan region is refered as bias.')
-        bias_template_data = \
-                np.mean(scidata[scidata.shape[0]-13:scidata.shape[0],:],
-                        axis=0)
+    ovs = ovs[k:k+4]
+    bias_template_data, template_level = \
+            lookup_template(scidata, template_pfx, templates, binfac1, detid,
+                            ovs)
 
     # Subtracting the bias pattern scaled by the derived sum.
+    ovlevel = overscan_levels(scidata, ovs)
+    rows = slice(2, 2+ovlevel.shape[0])
     bsdata = np.zeros((scidata.shape[0], scidata.shape[1]), dtype=np.float32)
-    for i in range(2, scidata.shape[0]-3):
-        for j in range(k,k+4):
-            template_level = np.mean(bias_template_data[ovs[j,0]-1:ovs[j,1]])
-            template_level = template_level + \
-                     np.mean(bias_template_data[ovs[j,4]-1:ovs[j,5]])
-            ovlevel = np.mean(scidata[i-2:i+3,ovs[j,0]-1:ovs[j,1]])
-            ovlevel = ovlevel + \
-                      np.mean(scidata[i-2:i+3,ovs[j,4]-1:ovs[j,5]])
-            bsdata[i,ovs[j,0]-1:ovs[j,5]] = \
-                        scidata[i,ovs[j,0]-1:ovs[j,5]] - \
-                        bias_template_data[ovs[j,0]-1:ovs[j,5]] / \
-                        template_level * ovlevel
+    for j in range(ovs.shape[0]):
+        cols = slice(ovs[j,0]-1, ovs[j,5])
+        bsdata[rows,cols] = scidata[rows,cols] - \
+                    bias_template_data[cols] / template_level[j] * \
+                    ovlevel[:,j:j+1]
 
     # Creating HDU data
     outhdu = fits.PrimaryHDU(data=bsdata)
@@ -157,12 +289,6 @@ def remove_overscan(inhdl):
     # Get the appropriate over scan region area
     ovs = overscan[binfac1]
 
-    # Trim Y range
-    yrange = [[51, 4220], # for 1 bin
-              [26, 2110], # for 2 bin
-              [17, 1406], # for 3 bin
-              [13,1055]]  # for 4 bin
-
     # Discriminating whether the flame is for left or right.
     topovlevel = 0.0
     if detid == 1:
@@ -173,10 +299,6 @@ def remove_overscan(inhdl):
     # Generating the new data array
     newdata = np.zeros((scidata.shape[0],scidata.shape[1]),dtype=np.float32)
 
-    # Convert the count values to electrons.
-    # From the leftmost amp of DET-ID=2 to the rightmost amp of DET-ID=1
-    gain = [2.054, 1.987, 1.999, 1.918, 2.081, 2.047, 2.111, 2.087] # electron/ADU
-
     # Generating the new data without overscan regions
     xmax = 0
     for i in range(k,k+4):
@@ -198,6 +320,12 @@ def remove_overscan(inhdl):
     return outhdl, True
 
 
+def repair_badpix(scidata, detid, binfct1, binfct2):
+    # Repairs the known bad pixels of the overscan removed data of a
+    # chip, in place (see badpix.py for the bad pixel maps).
+    return badpix.repair_chip(scidata, detid, binfct1, binfct2)
+
+
 def restore_badpix(inhdl):
     # Bad pixel correction
     #print('\t Restoring bad pixels for %s.'%inhdl[0].header['FRAMEID'])
@@ -206,26 +334,11 @@ def restore_badpix(inhdl):
     if not fi.check_version(inhdl):
         return inhdl, False
 
-    scidata = inhdl[0].data
-    binfct2 = inhdl[0].header['BIN-FCT2']
-    i = binfct2 - 1
-    if inhdl[0].header['DET-ID'] == 1:
-        # Bad pixel coordinates before removing overscan regions.
-        # x1,x2,y1,y2
-        badpix = np.array([
-            [397,397,2387,4225],  # for 2x1 bin
-            [397,397,1189,2105]   # for 2x2 bin
-        ])
-
-        scidata[badpix[i,2]-1:badpix[i,3],badpix[i,0]-1:badpix[i,1]] = \
-            (scidata[badpix[i,2]-1:badpix[i,3],badpix[i,0]-2:badpix[i,1]-1] + \
-             scidata[badpix[i,2]-1:badpix[i,3],badpix[i,0]:badpix[i,1]+1])/2.0
-
-    # Creating HDU data
-    outhdu = fits.PrimaryHDU(data=scidata)
-    outhdl = fits.HDUList([outhdu])
-    outhdl[0].header = inhdl[0].header
-    return outhdl, True
+    # the data are repaired in place
+    hdr = inhdl[0].header
+    repair_badpix(inhdl[0].data, hdr['DET-ID'], hdr['BIN-FCT1'],
+                  hdr['BIN-FCT2'])
+    return inhdl, True
 
 
 def stack_data(hdl_right, hdl_left):
@@ -256,6 +369,179 @@ def stack_data(hdl_right, hdl_left):
     return outhdl
 
 
+def chip_shape(hdr):
+    # Shape of the bias subtracted, overscan removed and trimmed data of
+    # a chip.
+    binfac1 = hdr['BIN-FCT1']
+    binfac2 = hdr['BIN-FCT2']
+    k = 4 if hdr['DET-ID'] == 1 else 0
+    ovs = overscan[binfac1][k:k+4]
+    y1, y2 = yrange[binfac2-1]
+    return (y2 - y1, int(np.sum(ovs[:,3] - ovs[:,2] + 1)))
+
+
+def reduce_chip(inhdl, out, template_pfx='bias_template', templates=None,
+                restore=True):
+    # Single pass version of bias_subtraction, remove_overscan and
+    # restore_badpix (if restore). The bias subtracted, gain scaled and
+    # trimmed data of the chip are written straight into 'out', of shape
+    # chip_shape(header), e.g. a view of its slot in the stacked image.
+    # The results are the same as those of the separate steps.
+    # Returns the header as updated by those steps.
+    scidata = inhdl[0].data
+    inhdr = inhdl[0].header
+    binfac1 = inhdr['BIN-FCT1']  # X direction on DS9
+    binfac2 = inhdr['BIN-FCT2']  # Y direction on DS9
+    detid = inhdr['DET-ID']
+
+    if out.shape != chip_shape(inhdr):
+        raise ValueError("output array should have shape %s: %s" % (
+            str(chip_shape(inhdr)), str(out.shape)))
+
+    # Put the version number in the FITS header
+    if fi.put_version(inhdl) is False:
+        return inhdr, False
+
+    k = 4 if detid == 1 else 0
+    ovs = overscan[binfac1][k:k+4]
+
+    bias_template_data, template_level = \
+            lookup_template(scidata, template_pfx, templates, binfac1, detid,
+                            ovs)
+    ovlevel = overscan_levels(scidata, ovs)
+
+    # Rows y1:y2 are kept; rows 2:2+len(ovlevel) are bias subtracted and
+    # the other ones are zero.
+    y1, y2 = yrange[binfac2-1]
+    b1 = max(y1, 2)
+    b2 = max(min(y2, 2+ovlevel.shape[0]), b1)
+    out[:b1-y1] = 0.0
+    out[b2-y1:] = 0.0
+
+    xmax = 0
+    for j in range(ovs.shape[0]):
+        cols = slice(ovs[j,2]-1, ovs[j,3])
+        d = ovs[j,3] - ovs[j,2] + 1
+        dst = out[b1-y1:b2-y1, xmax:xmax+d]
+        # subtract in double precision as bias_subtraction does
+        np.subtract(scidata[b1:b2,cols],
+                    bias_template_data[cols] / template_level[j] * \
+                    ovlevel[b1-2:b2-2,j:j+1],
+                    out=dst, casting='unsafe')
+        dst *= np.float32(gain[k+j])
+        xmax = xmax + d
+
+    if restore:
+        repair_badpix(out, detid, binfac1, binfac2)
+
+    # header keywords, as set by the separate steps
+    inhdr.remove('BLANK', ignore_missing=True)
+    inhdr.remove('BSCALE', ignore_missing=True)
+    inhdr.remove('BZERO', ignore_missing=True)
+    inhdr['BUNIT'] = 'electrons'
+    inhdr['TRM_Y1'] = (y1+1, 'Y start of adopped area for trimming')
+    inhdr['TRM_Y2'] = (y2, 'Y end of adopped area for trimming')
+    return inhdr, True
+
+
+def _stack_layout(hdr_right, hdr_left):
+    # Preallocated stacked image of two chips, with the CCD gap zeroed,
+    # and the views of the right and left chip slots.
+    binfac1 = hdr_right['BIN-FCT1']
+    ny, nx_right = chip_shape(hdr_right)
+    nx_left = chip_shape(hdr_left)[1]
+
+    # Set the start X of right half image
+    # CCD gap: 5 arcsec
+    # pixel scale: 0.104 arcsec/pix
+    gap_width = int(5 / 0.104 / binfac1)
+    x0 = nx_left + gap_width
+    stacked_data = np.empty((ny, x0 + nx_right), dtype=np.float32)
+    stacked_data[:, nx_left:x0] = 0.0
+    return stacked_data, stacked_data[:, x0:], stacked_data[:, :nx_left]
+
+
+def _stacked_hdl(stacked_data, hdr, nx_left, nx_gap):
+    # Writing the output fits file
+    outhdu = fits.PrimaryHDU(data=stacked_data)
+    outhdl = fits.HDUList([outhdu])
+    outhdl[0].header = hdr
+    outhdl[0].header['GAP_X1'] = (nx_left+1, 'Gap start X')
+    outhdl[0].header['GAP_X2'] = (nx_left+nx_gap, 'Gap end X')
+    return outhdl
+
+
+def stack_chips(hdl_right, hdl_left, template_pfx='bias_template',
+                templates=None, restore=True):
+    # Fused version of bias_subtraction, remove_overscan, restore_badpix
+    # (if restore) on both chips and stack_data: each chip is reduced
+    # straight into its slot of the preallocated stacked image, with the
+    # CCD gap in between. Returns the stacked HDU list and the status.
+    stacked_data, right, left = _stack_layout(hdl_right[0].header,
+                                              hdl_left[0].header)
+
+    hdr, stat = reduce_chip(hdl_right, right, template_pfx=template_pfx,
+                            templates=templates, restore=restore)
+    if stat == False:
+        return None, False
+    lhdr, stat = reduce_chip(hdl_left, left, template_pfx=template_pfx,
+                             templates=templates, restore=restore)
+    if stat == False:
+        return None, False
+
+    nx_left = left.shape[1]
+    return _stacked_hdl(stacked_data, hdr, nx_left,
+                        stacked_data.shape[1] - nx_left - right.shape[1]), True
+
+
+def _reduce_chip_file(fname, out, template_pfx, templates, restore):
+    # reduce_chip for a file. out is None in a worker process: the data
+    # are then returned to be copied into the slot.
+    with fits.open(fname) as hdl:
+        if out is None:
+            out = np.empty(chip_shape(hdl[0].header), dtype=np.float32)
+        hdr, stat = reduce_chip(hdl, out, template_pfx=template_pfx,
+                                templates=templates, restore=restore)
+    return out, hdr, stat
+
+
+def stack_chip_files(fname_right, fname_left, template_pfx='bias_template',
+                     templates=None, restore=True, concurrent=None):
+    # Same as stack_chips for the files of the two chips. The chips are
+    # independent until they are stacked, so with concurrent='thread'
+    # they are read and reduced in two threads, straight into their
+    # slots (file I/O and numpy release the GIL). With
+    # concurrent='process' they are reduced in two worker processes and
+    # copied into their slots; the templates dict is then not updated.
+    fnames = (fname_right, fname_left)
+    stacked_data, right, left = _stack_layout(fits.getheader(fname_right),
+                                              fits.getheader(fname_left))
+    slots = (right, left)
+    args = (fnames, slots, (template_pfx,)*2, (templates,)*2, (restore,)*2)
+
+    if concurrent is None:
+        results = list(map(_reduce_chip_file, *args))
+    elif concurrent == 'thread':
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            results = list(ex.map(_reduce_chip_file, *args))
+    elif concurrent == 'process':
+        with ProcessPoolExecutor(max_workers=2) as ex:
+            results = list(ex.map(_reduce_chip_file, fnames, (None,)*2,
+                                  *args[2:]))
+        for slot, result in zip(slots, results):
+            slot[...] = result[0]
+    else:
+        raise ValueError("concurrent should be None, 'thread' or "
+                         "'process': %s" % (concurrent))
+
+    if not all([result[2] for result in results]):
+        return None, False
+
+    nx_left = left.shape[1]
+    return _stacked_hdl(stacked_data, results[0][1], nx_left,
+                        stacked_data.shape[1] - nx_left - right.shape[1]), True
+
+
 def correct_header(hdl):
     #print('\t Correcting the header information.')
     hdr=hdl[0].header
@@ -300,57 +586,33 @@ def correct_header(hdl):
 
 
 def bias_overscan(ifname, rawdatadir='', template_pfx='bias_template',
-                  overwrite=False):
+                  overwrite=False, concurrent=None, index=None):
+    # concurrent: None, 'thread' or 'process' (see stack_chip_files)
+    # index: a header index of the raw data directory
+    #        (naoj.util.header_index), to look up the FRAMEID without
+    #        opening the file
     #print('\n#############################')
     #print('bias subtraction, overscan region removing, bad pixel correction, hedear correction')
 
-    basename = fits.getval(rawdatadir+ifname, 'FRAMEID')
+    getval = fits.getval if index is None else index.getval
+    basename = getval(rawdatadir+ifname, 'FRAMEID')
     ovname = basename+'.ov.fits'
     if os.path.isfile(ovname) and not overwrite:
         print(('\t Bias-subtructed and overscan-removed frame already exits. %s'%ovname))
         print('\t This procedure is skipped.')
         return ovname, True
 
-    hdl = fits.open(rawdatadir+ifname)
-    hdl, stat = bias_subtraction(hdl, template_pfx)
-    if stat == False:
-        hdl.close()
-        return ovname, False
-
-    hdl, stat = remove_overscan(hdl)
-    if stat == False:
-        hdl.close()
-        return ovname, False
-
-    hdl_right, stat = restore_badpix(hdl)
-    if stat == False:
-        hdl.close()
-        return ovname, False
-
-    hdl.close()
+    ifname2 = str('FCSA%08d.fits'%(int(basename[4:])+1))
 
-    ifname = str('FCSA%08d.fits'%(int(basename[4:])+1))
-    hdl = fits.open(rawdatadir+ifname)
-    hdl = fi.put_version(hdl)
-
-    hdl, stat = bias_subtraction(hdl, template_pfx)
+    # bias subtraction, overscan removing and bad pixel correction of
+    # both chips, straight into the stacked image
+    hdl_stacked, stat = stack_chip_files(rawdatadir+ifname,
+                                         rawdatadir+ifname2,
+                                         template_pfx=template_pfx,
+                                         concurrent=concurrent)
     if stat == False:
-        hdl.close()
         return ovname, False
 
-    hdl, stat = remove_overscan(hdl)
-    if stat == False:
-        hdl.close()
-        return ovname, False
-
-    hdl_left, stat = restore_badpix(hdl)
-    if stat == False:
-        hdl.close()
-        return ovname, False
-
-    hdl.close()
-
-    hdl_stacked = stack_data(hdl_right, hdl_left)
     hdl_stacked = correct_header(hdl_stacked)
     hdl_stacked.writeto(ovname, overwrite=overwrite)
     hdl_stacked.close()
@@ -366,7 +628,15 @@ if __name__ == '__main__':
                     help='Input FITS file for Chip 1')
     parser.add_argument('-d', help='Raw data directory', \
             dest='rawdatadir', action='store', default='')
+    parser.add_argument('-c', help='Reduce the two chips concurrently', \
+            dest='concurrent', choices=('thread', 'process'), default=None)
+    parser.add_argument('-i', help='Use the header index of the raw data directory', \
+            dest='index', action='store_true', default=False)
     args = parser.parse_args()
 
+    index = None
+    if args.index:
+        index = header_index.get_index(args.rawdatadir or '.')
     bias_overscan(args.ifname, rawdatadir=args.rawdatadir, \
-                  overwrite=args.overwrite)
+                  overwrite=args.overwrite, concurrent=args.concurrent,
+                  index=index)
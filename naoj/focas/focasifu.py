@@ -2,12 +2,11 @@ import numpy as np
 #import os
 from astropy.io import fits
 import math
-from numpy.polynomial.chebyshev import chebfit, chebval
+from numpy.polynomial.chebyshev import chebfit, chebval, chebvander
 import matplotlib.pyplot as plt
 from scipy.interpolate import interp1d
 from astropy.modeling.models import Gaussian1D
 from astropy.modeling.fitting import LevMarLSQFitter
-import copy
 
 version = 20190130
 # these seem to be unused....EJ
@@ -27,25 +26,19 @@ def weighted_average_std(data, w):
 
 
 def getmedian(data, lower=np.nan):
-    data1 = np.zeros(data.shape)
-    if lower != np.nan:
-        for i in range(data.shape[0]):
-            for j in range(data.shape[1]):
-                if data[i, j] < lower:
-                    data1[i, j] = np.nan
-                else:
-                    data1[i, j] = data[i, j]
+    # pixels below lower are ignored (no threshold if lower is nan)
+    data1 = np.array(data, dtype=np.float64)
+    data1[data1 < lower] = np.nan
     return np.nanmedian(data1)
 
 
-
 def cheb1Dfit(x, y, order=5, weight=None, niteration=0, \
               high_nsig=0.0, low_nsig=0.0):
     n = len(x)
     if weight is None:
         weight1 = np.ones(n)
     else:
-        weight1 = copy.deepcopy(weight)
+        weight1 = np.array(weight)
 
     c = chebfit(x,y,order,w=weight1)
 
@@ -57,9 +50,7 @@ def cheb1Dfit(x, y, order=5, weight=None, niteration=0, \
         # Clipiing the data
         highlimit = high_nsig * sig
         lowlimit = -low_nsig * sig
-        for j in range(n):
-            if residualdata[j] > highlimit or residualdata[j] < lowlimit:
-                weight1[j] = 0.0
+        weight1[(residualdata > highlimit) | (residualdata < lowlimit)] = 0.0
 
         # Fitting again
         c = chebfit(x,y,order,w=weight1)
@@ -67,21 +58,72 @@ def cheb1Dfit(x, y, order=5, weight=None, niteration=0, \
     return c, weight1
 
 
-def datafiltering(data, weight):
-    data_accept = np.zeros(len(data))
-    data_reject = np.zeros(len(data))
+def _chebfit_rows(van, y, w):
+    # Weighted least squares fit of each row of y with the shared
+    # Vandermonde matrix van. The normal equations of all the rows are
+    # built with two matrix products and solved at once.
+    scl = np.sqrt(np.square(van).sum(axis=0))
+    van = van / scl
+    k = van.shape[1]
+    w2 = w*w
+    outer = (van[:,:,np.newaxis] * van[:,np.newaxis,:]).reshape(-1, k*k)
+    lhs = np.dot(w2, outer).reshape(-1, k, k)
+    rhs = np.dot(w2*y, van)
+    try:
+        c = np.linalg.solve(lhs, rhs[:,:,np.newaxis])[:,:,0]
+    except np.linalg.LinAlgError:
+        # too few points left in some rows
+        c = np.einsum('rij,rj->ri', np.linalg.pinv(lhs), rhs)
+    return c / scl
+
+
+def cheb1Dfit_rows(x, y, order=5, weight=None, niteration=0, \
+                   high_nsig=0.0, low_nsig=0.0):
+    # Same as cheb1Dfit for each row of the 2D array y, with x shared by
+    # all the rows. Returns the coefficients (nrows, order+1) and the
+    # weights (nrows, len(x)). Only the rows which lost points in the
+    # clipping are fitted again.
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if weight is None:
+        weight1 = np.ones(y.shape)
+    else:
+        weight1 = np.array(np.broadcast_to(weight, y.shape), dtype=np.float64)
+
+    van = chebvander(x, order)
+    c = _chebfit_rows(van, y, weight1)
+
+    rows = np.arange(y.shape[0])
+    for k in range(niteration):
+        residualdata = y[rows] - np.dot(c[rows], van.T)
+        # Calculating weighted standard deviation
+        w = weight1[rows]
+        wsum = w.sum(axis=1)
+        mean = np.einsum('ij,ij->i', residualdata, w) / wsum
+        a = residualdata - mean[:,np.newaxis]
+        sig = np.sqrt(np.einsum('ij,ij->i', a**2, w) / wsum)
+
+        # Clipiing the data
+        clip = (residualdata > (high_nsig*sig)[:,np.newaxis]) | \
+               (residualdata < (-low_nsig*sig)[:,np.newaxis])
+        clip &= w != 0.0
+        w[clip] = 0.0
+        weight1[rows] = w
+
+        # Fitting again the rows which changed
+        changed = clip.any(axis=1)
+        rows = rows[changed]
+        if len(rows) == 0:
+            break
+        c[rows] = _chebfit_rows(van, y[rows], w[changed])
 
-    accept_num = 0
-    reject_num = 0
-    for i in range(len(data)):
-        if weight[i] == 1:
-            data_accept[accept_num] = data[i]
-            accept_num += 1
-        elif weight[i] == 0:
-            data_reject[reject_num] = data[i]
-            reject_num += 1
+    return c, weight1
 
-    return data_accept[:accept_num], data_reject[:reject_num]
+
+def datafiltering(data, weight):
+    data = np.asarray(data, dtype=np.float64)
+    weight = np.asarray(weight)
+    return np.compress(weight == 1, data), np.compress(weight == 0, data)
 
 
 def put_version(hdl):
@@ -148,6 +190,53 @@ def cross_correlate(indata, refdata, sep=0.01, kind='cubic', fit=False, \
 
     return delta
 
+def cross_correlate_fft(indata, refdata, upsample=100, fit=False, \
+                        niteration=3, high_nsig=3.0, low_nsig=3.0):
+    # FFT version of cross_correlate. The integer peak of the (zero
+    # padded, i.e. linear) cross correlation is found with a real FFT,
+    # then refined to 1/upsample pixel with an upsampled DFT of the
+    # cross power spectrum within +-1.5 pixel of the peak.
+    # indata can be a 2D array (e.g. the 24 pseudo-slits) and refdata a
+    # single row or an array of the same shape; one shift is returned
+    # for each row.
+    indata = np.asarray(indata, dtype=np.float64)
+    refdata = np.asarray(refdata, dtype=np.float64)
+    shape = np.broadcast_shapes(indata.shape, refdata.shape)
+    n = shape[-1]
+    insub = np.broadcast_to(indata, shape).reshape(-1, n)
+    refsub = np.broadcast_to(refdata, shape).reshape(-1, n)
+    if fit:
+        x = np.arange(n, dtype=np.float64)
+        coef, weight = cheb1Dfit_rows(x, insub, order=1, \
+                            niteration=niteration, \
+                            high_nsig=high_nsig, low_nsig=low_nsig)
+        insub = insub - np.dot(coef, chebvander(x, 1).T)
+        coef, weight = cheb1Dfit_rows(x, refsub, order=1, \
+                            niteration=niteration, \
+                            high_nsig=high_nsig, low_nsig=low_nsig)
+        refsub = refsub - np.dot(coef, chebvander(x, 1).T)
+    nfft = 1 << (2*n-1).bit_length()
+    cps = np.fft.rfft(insub, nfft) * np.conj(np.fft.rfft(refsub, nfft))
+
+    # integer peak, lags from -(n-1) to n-1
+    corr = np.fft.irfft(cps, nfft)
+    corr = np.concatenate((corr[:,nfft-n+1:], corr[:,:n]), axis=1)
+    peak = np.argmax(corr, axis=1) - (n-1)
+
+    # correlation at peak + d: real part of the inverse DFT of the
+    # hermitian cross power spectrum
+    f = np.arange(cps.shape[1])
+    wt = np.full(len(f), 2.0)
+    wt[0] = 1.0
+    wt[-1] = 1.0
+    d = np.arange(-int(1.5*upsample), int(1.5*upsample)+1) / float(upsample)
+    cps = cps * wt * np.exp(2j*np.pi*np.outer(peak, f)/nfft)
+    kernel = np.exp(2j*np.pi*np.outer(f, d)/nfft)
+    corr = np.dot(cps, kernel).real
+    delta = peak + d[np.argmax(corr, axis=1)]
+
+    return delta.reshape(shape[:-1])[()]
+
 def gaussfit1d(y):
     global click, ii
     click = np.zeros((2,2))
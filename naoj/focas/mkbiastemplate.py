@@ -1,23 +1,75 @@
 import numpy as np
-from scipy.stats import sigmaclip
 from astropy.io import fits
 import os
+import argparse
 from . import focasifu as fi
+from ..util import header_index
+
+def sigmaclip_mean(data, low=4.0, high=4.0, blocksize=512):
+    # Iterative sigma-clipped mean of each column of a 2D array.
+    # Same clipping as scipy.stats.sigmaclip applied column by column
+    # (iterate until no more pixels are rejected), but all the columns
+    # are clipped at once with a boolean mask. Columns that have
+    # converged are dropped from the following iterations.
+    ncols = data.shape[1]
+    mean = np.empty(ncols)
+    # process blocks of columns to bound the size of the temporaries
+    for c0 in range(0, ncols, blocksize):
+        x = data[:, c0:c0+blocksize]
+        keep = np.ones(x.shape, dtype=bool)
+        n = np.full(x.shape[1], x.shape[0])
+        cols = np.arange(x.shape[1])
+        while len(cols) > 0:
+            if len(cols) == x.shape[1]:
+                xa, ka = x, keep
+            else:
+                xa, ka = x[:, cols], keep[:, cols]
+            m = np.sum(xa, axis=0, where=ka, dtype=np.float64) / n
+            d = xa - m
+            np.square(d, out=d)
+            std = np.sqrt(np.sum(d, axis=0, where=ka) / n)
+            mean[c0 + cols] = m
+            ka &= xa >= m - std*low
+            ka &= xa <= m + std*high
+            nn = np.count_nonzero(ka, axis=0)
+            if len(cols) != x.shape[1]:
+                keep[:, cols] = ka
+            # continue only with the columns that lost pixels
+            changed = nn != n
+            cols = cols[changed]
+            n = nn[changed]
+    return mean
 
 def MkBiasTemplate(filename, nsigma=4.0, rawdatadir='', overwrite=False,
                    outputdir='.'):
-    path = os.path.join(rawdatadir, filename)
-    hdulist = fits.open(path)
-    binfac1 = hdulist[0].header['BIN-FCT1']  # X direction on DS9
-    binfac2 = hdulist[0].header['BIN-FCT2']  # Y direction on DS9
-    detid = hdulist[0].header['DET-ID']
-    scidata = hdulist[0].data
-    hdulist.close()
-
-    average1d = np.zeros(scidata.shape[1])
-    for i in range(len(average1d)):
-        clipped, low, upp = sigmaclip(scidata[:,i], low=nsigma, high=nsigma)
-        average1d[i] = np.mean(clipped)
+    # filename can be a list of bias frames of the same chip. They are
+    # combined into a single template.
+    if isinstance(filename, str):
+        filename = [filename]
+
+    frames = []
+    for fname in filename:
+        path = os.path.join(rawdatadir, fname)
+        hdulist = fits.open(path)
+        hdr = hdulist[0].header
+        if len(frames) == 0:
+            binfac1 = hdr['BIN-FCT1']  # X direction on DS9
+            binfac2 = hdr['BIN-FCT2']  # Y direction on DS9
+            detid = hdr['DET-ID']
+        elif (hdr['BIN-FCT1'] != binfac1 or hdr['DET-ID'] != detid
+              or hdulist[0].data.shape[1] != frames[0].shape[1]):
+            hdulist.close()
+            raise ValueError('Binning or detector of %s does not match '
+                             'the other bias frames.' % fname)
+        frames.append(hdulist[0].data)
+        hdulist.close()
+
+    if len(frames) == 1:
+        scidata = frames[0]
+    else:
+        # all the rows of all the frames are clipped together
+        scidata = np.concatenate(frames, axis=0)
+    average1d = sigmaclip_mean(scidata, low=nsigma, high=nsigma)
 
     outfilename = os.path.join(outputdir, 'bias_template'+str(binfac1)+str(detid)+'.fits')
     if os.path.isfile(outfilename) and not overwrite:
@@ -25,6 +77,7 @@ def MkBiasTemplate(filename, nsigma=4.0, rawdatadir='', overwrite=False,
         return
 
     hdu = fits.PrimaryHDU(data=average1d)
+    hdu.header['NCOMBINE'] = (len(frames), 'Number of combined bias frames')
     hdulist = fits.HDUList([hdu])
     hdulist = fi.put_version(hdulist)
     hdulist.writeto(outfilename, overwrite=overwrite)
@@ -33,24 +86,43 @@ def MkBiasTemplate(filename, nsigma=4.0, rawdatadir='', overwrite=False,
     return
 
 def MkTwoBiasTemplate(filename, rawdatadir='', overwrite=False,
-                      outputdir='.'):
+                      outputdir='.', index=None):
+    # filename can be a list of the bias frames of the first chip. The
+    # frames of the second chip (frame number + 1) are found
+    # automatically and each chip gets one combined template.
+    # index: a header index of the raw data directory
+    # (naoj.util.header_index), to look up the FRAMEIDs without opening
+    # the files
+    if isinstance(filename, str):
+        filename = [filename]
+
+    getval = fits.getval if index is None else index.getval
+    filenames2 = []
+    for fname in filename:
+        path = os.path.join(rawdatadir, fname)
+        basename = getval(path, 'FRAMEID')
+        filenames2.append(str('FCSA%08d.fits'%(int(basename[4:])+1)))
+
     MkBiasTemplate(filename, rawdatadir=rawdatadir, overwrite=overwrite,
                    outputdir=outputdir)
-    path = os.path.join(rawdatadir, filename)
-    basename = fits.getval(path, 'FRAMEID')
-    filename2 = str('FCSA%08d.fits'%(int(basename[4:])+1))
-    MkBiasTemplate(filename2, rawdatadir=rawdatadir, overwrite=overwrite,
+    MkBiasTemplate(filenames2, rawdatadir=rawdatadir, overwrite=overwrite,
                    outputdir=outputdir)
     return
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='This is the script for making bias template files..')
-    parser.add_argument('filename',help='Bias FITS file')
+    parser.add_argument('filename', nargs='+',
+                        help='Bias FITS file(s) of the first chip')
     parser.add_argument('-o', help='Overwrite flag', dest='overwrite',
                     action='store_true', default=False)
     parser.add_argument('-d', help='Raw data directory', \
             dest='rawdatadir', action='store', default='')
+    parser.add_argument('-i', help='Use the header index of the raw data directory', \
+            dest='index', action='store_true', default=False)
     args = parser.parse_args()
 
+    index = None
+    if args.index:
+        index = header_index.get_index(args.rawdatadir or '.')
     MkTwoBiasTemplate(args.filename, rawdatadir=args.rawdatadir, \
-                      overwrite=args.overwrite)
+                      overwrite=args.overwrite, index=index)
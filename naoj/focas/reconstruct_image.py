@@ -9,9 +9,13 @@
 import sys, os
 import re
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from astropy.io import fits
 from scipy.ndimage.interpolation import shift
+from scipy.ndimage import spline_filter1d
 import math
+import functools
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from . import focasifu as fi
 
 # local imports
@@ -76,16 +80,96 @@ def get_shift_flex(hdl):
 def get_shift_corr(hdl, flat):
     # if object is on Ch10, this function does not work well.
     data = hdl[0].data
-    dx = fi.cross_correlate(data[9,:], flat[9,:], sep=0.01, fit=False)
+    dx = fi.cross_correlate_fft(data[9,:], flat[9,:], upsample=100, fit=False)
     return dx
 
-def flatfielding(hdl, flat):
+# methods for shifting the integrated data along X (see shift_rows)
+shift_methods = ('spline', 'lanczos', 'fourier', 'ndimage')
+
+def _bspline5(x):
+    # centered quintic B-spline
+    x = np.abs(x)
+    return np.where(x < 1.0,
+                    11.0/20 - x**2/2 + x**4/4 - x**5/12,
+                    np.where(x < 2.0,
+                             17.0/40 + 5*x/8 - 7*x**2/4 + 5*x**3/4
+                             - 3*x**4/8 + x**5/24,
+                             np.where(x < 3.0, (3.0-x)**5/120, 0.0)))
+
+@functools.lru_cache(maxsize=64)
+def _shift_kernel(dx, method):
+    # The shift is the same for all the pixels, so a single set of 6 taps
+    # is used: output pixel i is the sum over k of w[k] times the
+    # (padded) input at i+ip+k. Returns the padding, ip and w.
+    pad = 12 + int(math.ceil(abs(dx)))
+    ip = int(math.floor(dx))
+    x = (dx - ip) - np.arange(-2, 4)
+    if method == 'spline':
+        w = _bspline5(x)
+    else:
+        # Lanczos (a=3) kernel, normalized
+        w = np.sinc(x) * np.sinc(x/3.0)
+        w = w / w.sum()
+    w.flags.writeable = False
+    return pad, ip-2, w
+
+@functools.lru_cache(maxsize=64)
+def _shift_phase(dx, nx):
+    # phase factors of a Fourier shift of rows of length nx (+ padding)
+    pad = 12 + int(math.ceil(abs(dx)))
+    n = nx + 2*pad
+    phase = np.exp(2j*np.pi*np.arange(n//2+1)*dx/n)
+    phase.flags.writeable = False
+    return pad, phase
+
+def shift_rows(data, dx, method='spline'):
+    # Shifts the rows of 2D data by -dx pixel along X, i.e. output pixel i
+    # is the input at i+dx; the edges are extended with the nearest
+    # pixels (mode='nearest').
+    # 'spline': quintic spline along X only; same as 'ndimage' to within
+    #           rounding, without the 2D spline filter.
+    # 'lanczos': Lanczos (a=3) interpolation.
+    # 'fourier': Fourier phase shift.
+    # 'ndimage': scipy.ndimage.shift with a 2D quintic spline.
+    # The kernels are cached for each dx.
+    if method == 'ndimage':
+        return shift(data, (0.0, -dx), order=5, mode='nearest')
+    if method not in shift_methods:
+        raise ValueError("shift method should be one of %s: %s" % (
+            str(shift_methods), method))
+
+    dx = float(dx)
+    nx = data.shape[1]
+    if method == 'fourier':
+        pad, phase = _shift_phase(dx, nx)
+        padded = np.pad(np.asarray(data, dtype=np.float64),
+                        ((0, 0), (pad, pad)), mode='edge')
+        shifted = np.fft.irfft(np.fft.rfft(padded, axis=1) * phase,
+                               padded.shape[1], axis=1)[:, pad:pad+nx]
+        return shifted.astype(data.dtype, copy=False)
+
+    pad, ip, w = _shift_kernel(dx, method)
+    padded = np.pad(np.asarray(data, dtype=np.float64),
+                    ((0, 0), (pad, pad)), mode='edge')
+    if method == 'spline':
+        # spline coefficients along X
+        padded = spline_filter1d(padded, 5, axis=1, mode='mirror')
+    shifted = np.zeros(data.shape, dtype=np.float64)
+    for k in range(len(w)):
+        i0 = pad + ip + k
+        shifted += w[k] * padded[:, i0:i0+nx]
+    return shifted.astype(data.dtype, copy=False)
+
+def flatfielding(hdl, flat, shift_method='spline', flat_avg=None):
+    # flat_avg: np.average(flat), if already computed
     # Shifting data
     dx = get_shift_flex(hdl)
-    shifted_data = shift(hdl[0].data, (0.0, -dx), order=5, mode='nearest')
+    shifted_data = shift_rows(hdl[0].data, dx, method=shift_method)
 
     # Flat fielding
-    flatted_data = shifted_data / flat * np.average(flat)
+    if flat_avg is None:
+        flat_avg = np.average(flat)
+    flatted_data = shifted_data / flat * flat_avg
 
     return flatted_data, dx
 
@@ -122,7 +206,45 @@ def creating_header(hdl, outhdl):
     return
 
 
-def integrate(hdl, regionfile=None):
+# integration plans for the regions of each binning (see get_plan)
+plans = {}
+
+def make_plan(reg):
+    # Integer start pixels (ys, xs) of the regions and their size
+    # (yw, xw). All the regions have the size of region 1.
+    xw, yw = int(reg[1, 2]), int(reg[1, 3])
+    xs = (reg[:, 0] - reg[:, 2] / 2.0).astype(np.intp)
+    ys = (reg[:, 1] - reg[:, 3] / 2.0).astype(np.intp)
+    xs.flags.writeable = False
+    ys.flags.writeable = False
+    return ys, xs, yw, xw
+
+def get_plan(binfac1):
+    # plan for the regions read at import, made on first use
+    global plans
+    if binfac1 not in plans:
+        plans[binfac1] = make_plan(regions[binfac1])
+    return plans[binfac1]
+
+def sum_regions(scidata, plan, out=None):
+    # Sums each region along Y. The regions are picked from a strided
+    # view of all the (yw, xw) windows of the image, so only the pixels
+    # of the regions are read and scidata can be memory-mapped.
+    ys, xs, yw, xw = plan
+    shape = (len(ys), xw)
+    if out is None:
+        out = np.empty(shape, dtype=np.float32)
+    elif out.shape != shape:
+        raise ValueError("output array should have shape %s: %s" % (
+            str(shape), str(out.shape)))
+    windows = sliding_window_view(scidata, (yw, xw))
+    out[...] = np.sum(windows[ys, xs], axis=1)
+    return out
+
+
+def integrate(hdl, regionfile=None, reg=None, out=None):
+    # reg: optional region data already read by read_region_file()
+    # out: optional (24, xw) float32 array for the integrated data
     scidata = hdl[0].data
     # Getting the binning information
     hdr = hdl[0].header
@@ -132,23 +254,17 @@ def integrate(hdl, regionfile=None):
         raise ValueError("X binning factor is not 1, 2 or 4: BIN-FCT1=%d" % (
             binfac1))
 
-    global regions
-    if regionfile is None:
-        reg = regions[int(binfac1)]
+    if reg is not None:
+        plan = make_plan(reg)
+    elif regionfile is None:
+        plan = get_plan(int(binfac1))
     else:
-        reg = read_region_file(regionfile)
-
-    # extract data from regions
-    xw, yw = int(reg[1, 2]), int(reg[1, 3])
+        plan = make_plan(read_region_file(regionfile))
 
     # Factor 'int(4/binfac1)' is to match Y scale to X scale in the
     # reconstructed image.
     # integrated_data[0,:] is CH24, integrated_data[23,:] is Ch01.
-    integrated_data = np.zeros((reg.shape[0], xw), np.float32)
-    for j in range(reg.shape[0]-1,-1,-1):
-        xs = int(reg[j, 0] - reg[j, 2] / 2.0)
-        ys = int(reg[j, 1] - reg[j, 3] / 2.0)
-        integrated_data[j, :] = np.sum(scidata[ys:ys+yw, xs:xs+xw], axis=0)
+    integrated_data = sum_regions(scidata, plan, out=out)
 
     # creating HDU list of the reconstruct image
     integrated_hdu = fits.PrimaryHDU(data=integrated_data)
@@ -158,67 +274,230 @@ def integrate(hdl, regionfile=None):
     return integrated_hdl
 
 
-def reconstruct_image(fitsfile_ch1, fitsfile_ch2,
-                      template_pfx='bias_template', regionfile=None,
-                      flatfile=None, shift_flg=True, smooth_flg=False):
-
-    # subtract bias and combine channels
-    hdl = bs.biassub(fitsfile_ch1, fitsfile_ch2, template_pfx=template_pfx)
-    hdr = hdl[0].header
-    binfac1 = hdr['BIN-FCT1'] # X direction on DS9
-
-    # Get integrated data
-    integrated_hdl = integrate(hdl, regionfile=regionfile)
-
-    if flatfile is not None:
-        with fits.open(flatfile) as flathdulst:
-            flatted_data, xshift =  flatfielding(integrated_hdl, flathdulst[0].data)
-        is_flatted = True
-    else:
-        flatted_data = integrated_hdl[0].data
-        is_flatted = False
-
-    # creating output data array
-    itnum = int(4/binfac1)
-    recon_im = np.zeros((flatted_data.shape[0]*itnum+1, flatted_data.shape[1]),
-                        dtype=np.float32)
+def integrate_file(fitsfile, regionfile=None, reg=None, out=None):
+    # Same as integrate() for a bias subtracted and stacked FITS file.
+    # The file is memory-mapped, so only the rows of the regions are
+    # read from disk (unless the data are scaled with BZERO/BSCALE).
+    with fits.open(fitsfile, memmap=True) as hdl:
+        integrated_hdl = integrate(hdl, regionfile=regionfile, reg=reg,
+                                   out=out)
+        integrated_hdl[0].header = hdl[0].header.copy()
+    return integrated_hdl
 
-    # creating HDU list of the reconstruct image
-    outhdu = fits.PrimaryHDU(data=recon_im)
-    outhdl = fits.HDUList([outhdu])
 
-    # creating header information
-    outhdr = outhdl[0].header
-    if is_flatted:
-        outhdr['XSHFT'] = (xshift, 'Xshift value of flat image (pix)')
-    outhdr['ISFLATED'] = (is_flatted, 'True: Flat fielding is applied')
-    creating_header(hdl, outhdl)
+def reconstruct_data(data, itnum, smooth=False, out=None):
+    # Builds the reconstructed image from the integrated (and flat
+    # fielded) data of the channels: each channel is repeated 'itnum'
+    # times (or linearly interpolated to the next channel, if smooth),
+    # Ch01 at the bottom, then a NaN border row and Ch24 (sky) on top.
+    # data can be a stack of exposures (..., 24, xw); the result is then
+    # a stack of images (..., 24*itnum+1, xw).
+    data = np.asarray(data)
+    nch, xw = data.shape[-2:]
+    ymax = nch - 1
+    shape = data.shape[:-2] + (nch*itnum+1, xw)
+    if out is None:
+        out = np.empty(shape, dtype=np.float32)
+    elif out.shape != shape:
+        raise ValueError("output array should have shape %s: %s" % (
+            str(shape), str(out.shape)))
 
-    # Inputing the output data
-    ymax = flatted_data.shape[0]-1
     ## Ch01
-    for i in range(itnum):
-        recon_im[i,:] = \
-                        flatted_data[ymax,:]
+    out[..., 0:itnum, :] = data[..., ymax:ymax+1, :]
 
     ## Ch02 - Ch23
-    for j in range(1, flatted_data.shape[0]-1):
-        for i in range(itnum):
-            if smooth_flg:
-                recon_im[j*itnum + i,:] = \
-                    ((itnum-i)*flatted_data[ymax-j,:] + i*flatted_data[ymax-j-1,:]) \
-                    / itnum
-            else:
-                recon_im[j*itnum + i,:] = flatted_data[ymax - j,:]
+    # mid[..., j-1, i, :] is row j*itnum + i
+    mid = out[..., itnum:ymax*itnum, :].reshape(
+        data.shape[:-2] + (nch-2, itnum, xw))
+    cur = data[..., ymax-1:0:-1, np.newaxis, :]
+    if smooth:
+        nxt = data[..., ymax-2::-1, np.newaxis, :]
+        wt = np.arange(itnum, dtype=np.result_type(data.dtype, np.float32))
+        wt = wt[:, np.newaxis]
+        mid[...] = ((itnum-wt)*cur + wt*nxt) / itnum
+    else:
+        mid[...] = cur
 
     ## Border line
-    recon_im[ymax*itnum,:] = np.nan
+    out[..., ymax*itnum, :] = np.nan
 
     ## Ch24 (Sky)
-    for i in range(itnum):
-        recon_im[ymax*itnum+i+1,:] = flatted_data[0,:]
+    out[..., ymax*itnum+1:, :] = data[..., 0:1, :]
+
+    return out
+
+
+class ReconstructSession(object):
+    # Holds the state shared by the reconstruction of a series of IFU
+    # frames (e.g. a night's data): the flat and the regions are read
+    # once, instead of for every frame. The bias templates come from the
+    # template cache of bias_overscan, which reads a template file again
+    # only if it was modified.
+
+    def __init__(self, template_pfx='bias_template', regionfile=None,
+                 flatfile=None, shift_flg=True, smooth_flg=False,
+                 shift_method='spline'):
+        self.template_pfx = template_pfx
+        self.shift_flg = shift_flg
+        self.smooth_flg = smooth_flg
+        self.shift_method = shift_method
+
+        if regionfile is not None:
+            self.reg = read_region_file(regionfile)
+        else:
+            self.reg = None
+
+        if flatfile is not None:
+            with fits.open(flatfile) as flathdulst:
+                self.set_flat(flathdulst[0].data.copy())
+        else:
+            self.set_flat(None)
+
+    def set_flat(self, flat):
+        # the average of the flat is computed once for all the frames
+        self.flat = flat
+        if flat is not None:
+            self.flat_avg = np.average(flat)
+        else:
+            self.flat_avg = None
+
+    def reconstruct(self, fitsfile_ch1, fitsfile_ch2):
+        # subtract bias and combine channels
+        hdl = bs.biassub(fitsfile_ch1, fitsfile_ch2,
+                         template_pfx=self.template_pfx)
+        hdr = hdl[0].header
+        binfac1 = hdr['BIN-FCT1'] # X direction on DS9
+
+        # Get integrated data
+        integrated_hdl = integrate(hdl, reg=self.reg)
+
+        if self.flat is not None:
+            flatted_data, xshift = flatfielding(integrated_hdl, self.flat,
+                                                shift_method=self.shift_method,
+                                                flat_avg=self.flat_avg)
+            is_flatted = True
+        else:
+            flatted_data = integrated_hdl[0].data
+            is_flatted = False
+
+        # creating output data array
+        itnum = int(4/binfac1)
+        recon_im = reconstruct_data(flatted_data, itnum,
+                                    smooth=self.smooth_flg)
+
+        # creating HDU list of the reconstruct image
+        outhdu = fits.PrimaryHDU(data=recon_im)
+        outhdl = fits.HDUList([outhdu])
+
+        # creating header information
+        outhdr = outhdl[0].header
+        if is_flatted:
+            outhdr['XSHFT'] = (xshift, 'Xshift value of flat image (pix)')
+        outhdr['ISFLATED'] = (is_flatted, 'True: Flat fielding is applied')
+        creating_header(hdl, outhdl)
+
+        return outhdl
+
+    def process(self, fitsfile_ch1, fitsfile_ch2, outfile):
+        # reconstruct a pair of frames and write the output file
+        outhdl = self.reconstruct(fitsfile_ch1, fitsfile_ch2)
+        outhdl.writeto(outfile, overwrite=True)
+        return outfile
+
+    def run(self, pairs, outdir='.', num_workers=1):
+        # Reconstructs a list of (ch1, ch2) file pairs, writing each
+        # output into 'outdir' as soon as it is done. The output name is
+        # that of the ch1 file with the suffix '.recon.fits'. If
+        # num_workers > 1, the pairs are processed by a pool of worker
+        # processes, each with its own session. Yields the output names
+        # in the order they finish.
+        jobs = [(f1, f2, os.path.join(outdir, output_name(f1)))
+                for f1, f2 in pairs]
+        if num_workers <= 1 or len(jobs) <= 1:
+            for f1, f2, outfile in jobs:
+                yield self.process(f1, f2, outfile)
+            return
+
+        kwargs = dict(template_pfx=self.template_pfx, shift_flg=self.shift_flg,
+                      smooth_flg=self.smooth_flg,
+                      shift_method=self.shift_method)
+        with ProcessPoolExecutor(max_workers=num_workers,
+                                 initializer=_init_worker,
+                                 initargs=(kwargs, self.reg, self.flat)) as ex:
+            futures = [ex.submit(_process_worker, *job) for job in jobs]
+            for future in as_completed(futures):
+                yield future.result()
+
+
+# session of a worker process in a process pool (see _init_worker)
+_worker = {}
+
+def _init_worker(kwargs, reg, flat):
+    session = ReconstructSession(**kwargs)
+    session.reg = reg
+    session.set_flat(flat)
+    _worker['session'] = session
+
+def _process_worker(fitsfile_ch1, fitsfile_ch2, outfile):
+    return _worker['session'].process(fitsfile_ch1, fitsfile_ch2, outfile)
+
+
+def output_name(fitsfile_ch1):
+    return os.path.splitext(os.path.basename(fitsfile_ch1))[0] + '.recon.fits'
+
+
+# name of a raw frame file, e.g. FCSA00012345.fits: the frame ID is a
+# 4-letter prefix and an 8-digit frame number
+raw_name_regex = re.compile(r'^([A-Z]{4})(\d{8})\.fits$')
+
+def pair_files(fitsfiles, index=None):
+    # Pairs up the raw frames of the two chips: the ch1 (right) frame is
+    # that of DET-ID 1, and the ch2 (left) frame is the next one, with
+    # the same prefix and DET-ID 2, e.g. FCSA00012345.fits and
+    # FCSA00012346.fits. Files that aren't named like raw frames (e.g.
+    # the .recon.fits outputs of an earlier run) are ignored. Returns the
+    # list of pairs and the list of raw frames without a partner.
+    # index: a header index of the raw data directory
+    # (naoj.util.header_index), to look up the DET-IDs without opening
+    # the files
+    getval = fits.getval if index is None else index.getval
+    def det_id(fname):
+        try:
+            return getval(fname, 'DET-ID')
+        except KeyError:
+            return None
+
+    frames = []
+    for fname in fitsfiles:
+        match = raw_name_regex.match(os.path.basename(fname))
+        if match:
+            frames.append((match.group(1), int(match.group(2)), fname))
+    frames.sort()
+
+    pairs, unpaired = [], []
+    i = 0
+    while i < len(frames):
+        pfx, num, fname = frames[i]
+        if (i+1 < len(frames) and frames[i+1][:2] == (pfx, num+1) and
+            det_id(fname) == 1 and det_id(frames[i+1][2]) == 2):
+            pairs.append((fname, frames[i+1][2]))
+            i = i + 2
+        else:
+            unpaired.append(fname)
+            i = i + 1
+    return pairs, unpaired
+
 
-    return outhdl
+def reconstruct_image(fitsfile_ch1, fitsfile_ch2,
+                      template_pfx='bias_template', regionfile=None,
+                      flatfile=None, shift_flg=True, smooth_flg=False,
+                      shift_method='spline'):
+
+    session = ReconstructSession(template_pfx=template_pfx,
+                                 regionfile=regionfile, flatfile=flatfile,
+                                 shift_flg=shift_flg, smooth_flg=smooth_flg,
+                                 shift_method=shift_method)
+    return session.reconstruct(fitsfile_ch1, fitsfile_ch2)
 
 
 # read in our regions data, so we don't have to re-read it over and over
@@ -1,13522 +1,382 @@
-info = {0: {'bad_channels': [3],
-     'color': 'red',
-     'polygon': [(0.396535162031, -0.628663752105),
-                 (0.396444292843, -0.631425958949),
-                 (0.396352852158, -0.634185981605),
-                 (0.396260837973, -0.63694380631),
-                 (0.3961682483, -0.639699419259),
-                 (0.396075081167, -0.642452806602),
-                 (0.395981334623, -0.645203954444),
-                 (0.395887006733, -0.647952848846),
-                 (0.395792095584, -0.650699475824),
-                 (0.395696599286, -0.653443821346),
-                 (0.395600515971, -0.656185871336),
-                 (0.395503843795, -0.65892561167),
-                 (0.395406580941, -0.661663028176),
-                 (0.395308725621, -0.664398106636),
-                 (0.395210276073, -0.66713083278),
-                 (0.395111230569, -0.669861192293),
-                 (0.395011587409, -0.672589170807),
-                 (0.394911344929, -0.675314753905),
-                 (0.394810501502, -0.678037927118),
-                 (0.394709055533, -0.680758675926),
-                 (0.394607005471, -0.683476985755),
-                 (0.394504349802, -0.68619284198),
-                 (0.394401087054, -0.68890622992),
-                 (0.3942972158, -0.69161713484),
-                 (0.394192734659, -0.694325541948),
-                 (0.394087642296, -0.697031436396),
-                 (0.393981937426, -0.69973480328),
-                 (0.393875618816, -0.702435627635),
-                 (0.393768685285, -0.705133894438),
-                 (0.39366113571, -0.707829588606),
-                 (0.393552969021, -0.710522694993),
-                 (0.393444184212, -0.713213198394),
-                 (0.393334780336, -0.715901083535),
-                 (0.387571615787, -0.716124389243),
-                 (0.381802785456, -0.716344077714),
-                 (0.376028390535, -0.716560164935),
-                 (0.370248532031, -0.71677266644),
-                 (0.364463310719, -0.716981597325),
-                 (0.358672827102, -0.717186972259),
-                 (0.352877181366, -0.717388805506),
-                 (0.347076473348, -0.717587110933),
-                 (0.3412708025, -0.717781902028),
-                 (0.335460267855, -0.717973191908),
-                 (0.329644967999, -0.718160993337),
-                 (0.323825001044, -0.718345318735),
-                 (0.318000464602, -0.718526180189),
-                 (0.312171455766, -0.718703589466),
-                 (0.306338071082, -0.71887755802),
-                 (0.300500406539, -0.719048097008),
-                 (0.294658557549, -0.719215217292),
-                 (0.28881261893, -0.719378929455),
-                 (0.282962684901, -0.719539243803),
-                 (0.277108849063, -0.719696170382),
-                 (0.271251204398, -0.719849718976),
-                 (0.265389843254, -0.719999899121),
-                 (0.259524857347, -0.720146720111),
-                 (0.253656337755, -0.720290191003),
-                 (0.247784374912, -0.720430320623),
-                 (0.241909058613, -0.720567117577),
-                 (0.23603047801, -0.720700590248),
-                 (0.230148721618, -0.720830746811),
-                 (0.224263877315, -0.72095759523),
-                 (0.218376032349, -0.721081143267),
-                 (0.212485273344, -0.721201398486),
-                 (0.206591686303, -0.721318368254),
-                 (0.206646147533, -0.718602332924),
-                 (0.206700287457, -0.715883672134),
-                 (0.206754106635, -0.713162404971),
-                 (0.206807605673, -0.710438550348),
-                 (0.20686078522, -0.707712127007),
-                 (0.206913645967, -0.704983153523),
-                 (0.206966188647, -0.702251648307),
-                 (0.20701841403, -0.699517629607),
-                 (0.207070322926, -0.696781115514),
-                 (0.207121916178, -0.694042123961),
-                 (0.207173194664, -0.69130067273),
-                 (0.207224159295, -0.688556779451),
-                 (0.207274811014, -0.685810461605),
-                 (0.207325150791, -0.68306173653),
-                 (0.207375179628, -0.68031062142),
-                 (0.207424898551, -0.677557133326),
-                 (0.207474308613, -0.674801289165),
-                 (0.20752341089, -0.672043105716),
-                 (0.207572206484, -0.669282599625),
-                 (0.207620696514, -0.666519787405),
-                 (0.207668882123, -0.663754685445),
-                 (0.207716764472, -0.660987310001),
-                 (0.207764344741, -0.65821767721),
-                 (0.207811624126, -0.655445803082),
-                 (0.207858603838, -0.65267170351),
-                 (0.207905285105, -0.649895394267),
-                 (0.207951669167, -0.647116891011),
-                 (0.207997757278, -0.644336209282),
-                 (0.2080435507, -0.641553364511),
-                 (0.20808905071, -0.638768372017),
-                 (0.208134258593, -0.635981247011),
-                 (0.208179175642, -0.633192004595),
-                 (0.214120429782, -0.633094448403),
-                 (0.220058995501, -0.63299414179),
-                 (0.225994791005, -0.632891077507),
-                 (0.231927733854, -0.632785248148),
-                 (0.23785774095, -0.632676646147),
-                 (0.243784728526, -0.632565263779),
-                 (0.249708612135, -0.632451093157),
-                 (0.255629306636, -0.632334126225),
-                 (0.261546726186, -0.632214354761),
-                 (0.267460784234, -0.632091770367),
-                 (0.273371393507, -0.631966364473),
-                 (0.279278466006, -0.631838128326),
-                 (0.285181913002, -0.63170705299),
-                 (0.291081645029, -0.631573129339),
-                 (0.296977571879, -0.631436348055),
-                 (0.302869602601, -0.631296699619),
-                 (0.308757645503, -0.631154174308),
-                 (0.314641608144, -0.631008762191),
-                 (0.320521397345, -0.630860453116),
-                 (0.326396919184, -0.63070923671),
-                 (0.332268079006, -0.630555102369),
-                 (0.338134781424, -0.630398039251),
-                 (0.34399693033, -0.630238036266),
-                 (0.349854428905, -0.630075082071),
-                 (0.355707179625, -0.629909165058),
-                 (0.361555084277, -0.629740273347),
-                 (0.367398043975, -0.629568394775),
-                 (0.373235959171, -0.629393516885),
-                 (0.379068729678, -0.629215626915),
-                 (0.38489625469, -0.629034711789),
-                 (0.390718432801, -0.628850758101),
-                 (0.396535162031, -0.628663752105)]},
- 1: {'color': 'violet',
-     'polygon': [(0.194357757491, -0.633425723275),
-                 (0.194316235246, -0.636216252049),
-                 (0.194274441664, -0.639004667032),
-                 (0.194232375543, -0.641790953046),
-                 (0.194190035686, -0.644575094804),
-                 (0.194147420907, -0.647357076905),
-                 (0.194104530034, -0.650136883835),
-                 (0.194061361904, -0.65291449996),
-                 (0.194017915368, -0.655689909531),
-                 (0.193974189291, -0.658463096675),
-                 (0.193930182554, -0.661234045398),
-                 (0.193885894053, -0.66400273958),
-                 (0.193841322703, -0.666769162974),
-                 (0.193796467435, -0.669533299203),
-                 (0.193751327203, -0.672295131761),
-                 (0.193705900978, -0.675054644004),
-                 (0.193660187757, -0.677811819155),
-                 (0.193614186558, -0.680566640298),
-                 (0.193567896424, -0.683319090373),
-                 (0.193521316425, -0.68606915218),
-                 (0.193474445656, -0.688816808372),
-                 (0.193427283243, -0.691562041451),
-                 (0.193379828342, -0.694304833771),
-                 (0.193332080139, -0.697045167529),
-                 (0.193284037854, -0.699783024769),
-                 (0.193235700741, -0.702518387371),
-                 (0.19318706809, -0.705251237057),
-                 (0.193138139229, -0.70798155538),
-                 (0.193088913526, -0.710709323729),
-                 (0.193039390388, -0.713434523317),
-                 (0.192989569266, -0.716157135187),
-                 (0.192939449654, -0.718877140202),
-                 (0.192889031093, -0.721594519047),
-                 (0.186986657046, -0.721701135047),
-                 (0.181081820471, -0.721804495395),
-                 (0.17517460424, -0.721904606471),
-                 (0.169265090679, -0.72200147448),
-                 (0.163353361577, -0.722095105452),
-                 (0.157439498199, -0.722185505249),
-                 (0.151523581308, -0.722272679562),
-                 (0.145605691173, -0.722356633912),
-                 (0.139685907591, -0.722437373657),
-                 (0.133764309903, -0.722514903987),
-                 (0.12784097701, -0.722589229926),
-                 (0.121915987395, -0.722660356335),
-                 (0.115989419138, -0.722728287913),
-                 (0.110061349936, -0.722793029192),
-                 (0.104131857123, -0.722854584541),
-                 (0.0982010176909, -0.722912958167),
-                 (0.0922689083083, -0.722968154111),
-                 (0.0863356053408, -0.72302017625),
-                 (0.0804011848721, -0.723069028296),
-                 (0.0744657227251, -0.723114713793),
-                 (0.0685292944825, -0.723157236119),
-                 (0.0625919755084, -0.723196598484),
-                 (0.0566538409691, -0.723232803927),
-                 (0.0507149658549, -0.723265855316),
-                 (0.0447754250016, -0.723295755345),
-                 (0.0388352931115, -0.723322506534),
-                 (0.0328946447753, -0.723346111226),
-                 (0.0269535544932, -0.723366571584),
-                 (0.0210120966967, -0.72338388959),
-                 (0.0150703457692, -0.723398067041),
-                 (0.00912837606813, -0.723409105548),
-                 (0.00318626194516, -0.723417006533),
-                 (0.00318619598193, -0.720690343452),
-                 (0.0031861377181, -0.717961030644),
-                 (0.00318608577655, -0.715229090241),
-                 (0.00318603884003, -0.712494544104),
-                 (0.00318599564966, -0.709757413831),
-                 (0.00318595500318, -0.70701772076),
-                 (0.00318591575331, -0.704275485976),
-                 (0.00318587680624, -0.701530730313),
-                 (0.00318583712004, -0.698783474359),
-                 (0.00318579570308, -0.696033738462),
-                 (0.00318575161265, -0.693281542734),
-                 (0.00318570395336, -0.690526907056),
-                 (0.00318565187587, -0.687769851078),
-                 (0.00318559457529, -0.68501039423),
-                 (0.00318553128994, -0.68224855572),
-                 (0.00318546130001, -0.679484354544),
-                 (0.00318538392611, -0.676717809482),
-                 (0.00318529852814, -0.673948939112),
-                 (0.00318520450386, -0.671177761805),
-                 (0.00318510128778, -0.668404295733),
-                 (0.00318498834997, -0.665628558873),
-                 (0.00318486519467, -0.662850569008),
-                 (0.00318473135934, -0.660070343734),
-                 (0.00318458641348, -0.657287900463),
-                 (0.00318442995743, -0.654503256421),
-                 (0.00318426162136, -0.65171642866),
-                 (0.00318408106423, -0.648927434057),
-                 (0.00318388797265, -0.646136289313),
-                 (0.00318368206001, -0.643343010967),
-                 (0.00318346306534, -0.640547615388),
-                 (0.00318323075248, -0.637750118784),
-                 (0.00318298490905, -0.634950537207),
-                 (0.00917047977163, -0.634943564301),
-                 (0.0151578319552, -0.634933998392),
-                 (0.0211449707951, -0.63492183754),
-                 (0.027131825632, -0.634907079633),
-                 (0.0331183257929, -0.634889722384),
-                 (0.0391044005719, -0.634869763334),
-                 (0.0450899792101, -0.634847199856),
-                 (0.0510749908765, -0.634822029155),
-                 (0.0570593646475, -0.634794248271),
-                 (0.063043029487, -0.63476385408),
-                 (0.0690259142265, -0.634730843297),
-                 (0.0750079475442, -0.634695212477),
-                 (0.0809890579453, -0.634656958017),
-                 (0.0869691737409, -0.634616076156),
-                 (0.0929482230281, -0.634572562979),
-                 (0.0989261336688, -0.634526414417),
-                 (0.10490283327, -0.634477626247),
-                 (0.110878249162, -0.634426194097),
-                 (0.116852308379, -0.634372113441),
-                 (0.12282493764, -0.634315379607),
-                 (0.128796063324, -0.634255987773),
-                 (0.134765611454, -0.634193932968),
-                 (0.140733507678, -0.634129210075),
-                 (0.146699677243, -0.634061813831),
-                 (0.152664044982, -0.633991738824),
-                 (0.158626535289, -0.633918979499),
-                 (0.164587072105, -0.633843530153),
-                 (0.170545578896, -0.633765384937),
-                 (0.176501978635, -0.633684537856),
-                 (0.182456193782, -0.633600982769),
-                 (0.188408146272, -0.633514713387),
-                 (0.194357757491, -0.633425723275)]},
- 2: {'color': 'violet',
-     'polygon': [(-0.0105895145339, -0.635001830363),
-                 (-0.0105869359346, -0.63780139248),
-                 (-0.0105843525629, -0.640598869465),
-                 (-0.0105817640955, -0.643394245206),
-                 (-0.0105791701839, -0.646187503425),
-                 (-0.0105765704532, -0.648978627681),
-                 (-0.0105739645016, -0.651767601363),
-                 (-0.0105713518992, -0.65455440769),
-                 (-0.0105687321866, -0.657339029704),
-                 (-0.0105661048746, -0.66012145027),
-                 (-0.0105634694424, -0.662901652071),
-                 (-0.0105608253371, -0.665679617604),
-                 (-0.0105581719721, -0.668455329177),
-                 (-0.0105555087264, -0.671228768905),
-                 (-0.0105528349431, -0.673999918709),
-                 (-0.0105501499282, -0.676768760308),
-                 (-0.0105474529496, -0.679535275216),
-                 (-0.010544743236, -0.682299444742),
-                 (-0.0105420199749, -0.685061249981),
-                 (-0.0105392823122, -0.687820671813),
-                 (-0.0105365293503, -0.690577690898),
-                 (-0.010533760147, -0.693332287673),
-                 (-0.0105309737139, -0.696084442345),
-                 (-0.0105281690151, -0.698834134888),
-                 (-0.0105253449659, -0.701581345042),
-                 (-0.0105225004313, -0.704326052302),
-                 (-0.0105196342242, -0.707068235919),
-                 (-0.010516745104, -0.709807874893),
-                 (-0.0105138317755, -0.712544947967),
-                 (-0.0105108928866, -0.715279433626),
-                 (-0.0105079270271, -0.71801131009),
-                 (-0.010504932727, -0.720740555306),
-                 (-0.0105019084548, -0.723467146951),
-                 (-0.0164439478226, -0.723463492953),
-                 (-0.0223858125623, -0.723456705078),
-                 (-0.0283274280047, -0.72344678371),
-                 (-0.0342687193574, -0.723433729028),
-                 (-0.0402096116862, -0.723417540992),
-                 (-0.0461500298949, -0.723398219347),
-                 (-0.0520898987073, -0.723375763614),
-                 (-0.0580291426482, -0.723350173086),
-                 (-0.0639676860253, -0.723321446826),
-                 (-0.0699054529112, -0.723289583661),
-                 (-0.0758423671263, -0.723254582176),
-                 (-0.0817783522214, -0.72321644071),
-                 (-0.087713331461, -0.723175157353),
-                 (-0.0936472278071, -0.723130729937),
-                 (-0.0995799639034, -0.723083156032),
-                 (-0.10551146206, -0.723032432942),
-                 (-0.111441644237, -0.722978557697),
-                 (-0.117370432033, -0.722921527049),
-                 (-0.123297746669, -0.722861337463),
-                 (-0.129223508973, -0.722797985116),
-                 (-0.135147639371, -0.722731465885),
-                 (-0.14107005787, -0.722661775342),
-                 (-0.146990684051, -0.72258890875),
-                 (-0.152909437052, -0.722512861053),
-                 (-0.158826235559, -0.722433626869),
-                 (-0.164740997798, -0.722351200487),
-                 (-0.170653641518, -0.722265575851),
-                 (-0.176564083991, -0.722176746563),
-                 (-0.182472241993, -0.722084705865),
-                 (-0.188378031803, -0.721989446639),
-                 (-0.194281369188, -0.721890961393),
-                 (-0.200182169403, -0.721789242257),
-                 (-0.200235932246, -0.719073124608),
-                 (-0.200289353166, -0.716354264867),
-                 (-0.200342435809, -0.713632688117),
-                 (-0.200395183735, -0.71090841909),
-                 (-0.200447600426, -0.708181482169),
-                 (-0.200499689283, -0.705451901396),
-                 (-0.200551453628, -0.702719700481),
-                 (-0.200602896708, -0.699984902806),
-                 (-0.200654021696, -0.697247531429),
-                 (-0.200704831691, -0.694507609096),
-                 (-0.20075532972, -0.691765158243),
-                 (-0.200805518742, -0.689020201),
-                 (-0.200855401645, -0.686272759202),
-                 (-0.200904981253, -0.683522854392),
-                 (-0.200954260322, -0.680770507824),
-                 (-0.201003241546, -0.678015740476),
-                 (-0.201051927555, -0.675258573046),
-                 (-0.201100320919, -0.672499025965),
-                 (-0.201148424145, -0.669737119398),
-                 (-0.201196239686, -0.666972873252),
-                 (-0.201243769935, -0.664206307178),
-                 (-0.201291017229, -0.661437440578),
-                 (-0.201337983851, -0.658666292611),
-                 (-0.20138467203, -0.655892882194),
-                 (-0.201431083944, -0.653117228012),
-                 (-0.201477221718, -0.650339348518),
-                 (-0.201523087427, -0.64755926194),
-                 (-0.2015686831, -0.644776986284),
-                 (-0.201614010715, -0.641992539342),
-                 (-0.201659072205, -0.639205938691),
-                 (-0.201703869458, -0.636417201703),
-                 (-0.201748404316, -0.633626345543),
-                 (-0.195799983689, -0.633709850465),
-                 (-0.189849158987, -0.633790700906),
-                 (-0.183896010474, -0.633868902893),
-                 (-0.177940617941, -0.633944462152),
-                 (-0.171983060715, -0.634017384108),
-                 (-0.166023417665, -0.63408767389),
-                 (-0.160061767213, -0.634155336343),
-                 (-0.15409818734, -0.634220376026),
-                 (-0.148132755597, -0.63428279722),
-                 (-0.142165549114, -0.634342603934),
-                 (-0.136196644611, -0.634399799907),
-                 (-0.130226118405, -0.634454388615),
-                 (-0.124254046423, -0.634506373273),
-                 (-0.118280504215, -0.634555756843),
-                 (-0.11230556696, -0.634602542036),
-                 (-0.10632930948, -0.634646731315),
-                 (-0.100351806256, -0.634688326902),
-                 (-0.0943731314343, -0.634727330779),
-                 (-0.088393358842, -0.634763744696),
-                 (-0.0824125620009, -0.634797570169),
-                 (-0.0764308141401, -0.634828808491),
-                 (-0.0704481882098, -0.634857460727),
-                 (-0.0644647568962, -0.634883527727),
-                 (-0.0584805926352, -0.634907010121),
-                 (-0.0524957676284, -0.634927908326),
-                 (-0.0465103538575, -0.634946222553),
-                 (-0.0405244231005, -0.634961952801),
-                 (-0.0345380469479, -0.63497509887),
-                 (-0.0285512968182, -0.634985660357),
-                 (-0.0225642439753, -0.634993636663),
-                 (-0.0165769595454, -0.634999026994),
-                 (-0.0105895145339, -0.635001830363)]},
- 3: {'color': 'violet',
-     'polygon': [(-0.215542603041, -0.633394789701),
-                 (-0.215494548222, -0.636184384343),
-                 (-0.215446211445, -0.638971854656),
-                 (-0.21539759076, -0.641757183378),
-                 (-0.215348684171, -0.64454035304),
-                 (-0.215299489636, -0.647321345963),
-                 (-0.215250005063, -0.650100144252),
-                 (-0.215200228313, -0.652876729793),
-                 (-0.215150157198, -0.655651084245),
-                 (-0.215099789475, -0.658423189042),
-                 (-0.215049122853, -0.661193025383),
-                 (-0.214998154984, -0.663960574227),
-                 (-0.214946883467, -0.666725816293),
-                 (-0.214895305845, -0.66948873205),
-                 (-0.214843419604, -0.672249301714),
-                 (-0.21479122217, -0.675007505243),
-                 (-0.21473871091, -0.677763322332),
-                 (-0.21468588313, -0.680516732408),
-                 (-0.214632736074, -0.683267714621),
-                 (-0.21457926692, -0.686016247846),
-                 (-0.214525472784, -0.688762310669),
-                 (-0.214471350713, -0.691505881388),
-                 (-0.214416897685, -0.694246938003),
-                 (-0.21436211061, -0.696985458213),
-                 (-0.214306986327, -0.699721419408),
-                 (-0.214251521601, -0.702454798666),
-                 (-0.214195713123, -0.705185572741),
-                 (-0.214139557509, -0.707913718063),
-                 (-0.214083051296, -0.71063921073),
-                 (-0.214026190943, -0.713362026499),
-                 (-0.213968972827, -0.716082140783),
-                 (-0.213911393244, -0.718799528641),
-                 (-0.213853448404, -0.721514164773),
-                 (-0.219745215705, -0.721402376125),
-                 (-0.225634072948, -0.721287314842),
-                 (-0.231519932531, -0.72116897087),
-                 (-0.237402706303, -0.721047333715),
-                 (-0.243282305555, -0.720922392436),
-                 (-0.24915864102, -0.720794135632),
-                 (-0.255031622866, -0.720662551438),
-                 (-0.2609011607, -0.720527627507),
-                 (-0.266767163558, -0.720389351005),
-                 (-0.272629539912, -0.720247708596),
-                 (-0.278488197662, -0.720102686433),
-                 (-0.28434304414, -0.719954270146),
-                 (-0.290193986108, -0.719802444832),
-                 (-0.296040929758, -0.71964719504),
-                 (-0.301883780716, -0.719488504759),
-                 (-0.307722444038, -0.719326357409),
-                 (-0.313556824217, -0.719160735827),
-                 (-0.319386825182, -0.718991622253),
-                 (-0.3252123503, -0.718818998315),
-                 (-0.331033302384, -0.718642845022),
-                 (-0.336849583689, -0.718463142744),
-                 (-0.342661095921, -0.718279871203),
-                 (-0.348467740239, -0.718093009453),
-                 (-0.354269417259, -0.717902535874),
-                 (-0.360066027061, -0.717708428149),
-                 (-0.365857469191, -0.717510663256),
-                 (-0.371643642668, -0.717309217446),
-                 (-0.377424445991, -0.717104066236),
-                 (-0.383199777141, -0.716895184385),
-                 (-0.388969533592, -0.716682545884),
-                 (-0.394733612312, -0.716466123937),
-                 (-0.400491909775, -0.716245890947),
-                 (-0.40060614051, -0.713563703922),
-                 (-0.40071966256, -0.710878561592),
-                 (-0.400832481412, -0.708190492832),
-                 (-0.400944602455, -0.705499526075),
-                 (-0.40105603099, -0.702805689326),
-                 (-0.401166772222, -0.70010901017),
-                 (-0.401276831268, -0.697409515775),
-                 (-0.401386213159, -0.694707232906),
-                 (-0.401494922836, -0.692002187929),
-                 (-0.401602965159, -0.689294406818),
-                 (-0.401710344903, -0.686583915168),
-                 (-0.40181706676, -0.683870738194),
-                 (-0.401923135344, -0.681154900747),
-                 (-0.40202855519, -0.678436427313),
-                 (-0.402133330754, -0.675715342028),
-                 (-0.402237466418, -0.672991668679),
-                 (-0.402340966488, -0.670265430712),
-                 (-0.402443835198, -0.667536651242),
-                 (-0.402546076711, -0.664805353054),
-                 (-0.402647695119, -0.662071558616),
-                 (-0.402748694442, -0.65933529008),
-                 (-0.402849078637, -0.656596569291),
-                 (-0.402948851592, -0.653855417793),
-                 (-0.403048017128, -0.651111856833),
-                 (-0.403146579006, -0.648365907372),
-                 (-0.403244540921, -0.645617590084),
-                 (-0.403341906508, -0.642866925367),
-                 (-0.403438679338, -0.640113933348),
-                 (-0.403534862928, -0.637358633886),
-                 (-0.403630460732, -0.63460104658),
-                 (-0.403725476149, -0.631841190774),
-                 (-0.403819912522, -0.629079085561),
-                 (-0.3980065207, -0.62925931405),
-                 (-0.392187644612, -0.629436444024),
-                 (-0.386363383601, -0.6296104966),
-                 (-0.3805338364, -0.629781492289),
-                 (-0.374699101137, -0.62994945101),
-                 (-0.36885927534, -0.630114392099),
-                 (-0.363014455934, -0.630276334324),
-                 (-0.357164739249, -0.630435295897),
-                 (-0.351310221023, -0.630591294482),
-                 (-0.3454509964, -0.63074434721),
-                 (-0.339587159935, -0.63089447069),
-                 (-0.333718805599, -0.631041681015),
-                 (-0.327846026776, -0.631185993779),
-                 (-0.321968916273, -0.631327424084),
-                 (-0.316087566313, -0.631465986548),
-                 (-0.310202068548, -0.631601695321),
-                 (-0.304312514054, -0.631734564086),
-                 (-0.298418993336, -0.631864606078),
-                 (-0.292521596335, -0.631991834084),
-                 (-0.286620412422, -0.63211626046),
-                 (-0.280715530412, -0.632237897132),
-                 (-0.274807038559, -0.632356755613),
-                 (-0.268895024561, -0.632472847003),
-                 (-0.262979575569, -0.632586182002),
-                 (-0.257060778183, -0.632696770918),
-                 (-0.251138718461, -0.632804623673),
-                 (-0.245213481925, -0.632909749809),
-                 (-0.239285153557, -0.6330121585),
-                 (-0.233353817814, -0.633111858555),
-                 (-0.227419558625, -0.633208858429),
-                 (-0.221482459402, -0.633303166224),
-                 (-0.215542603041, -0.633394789701)]},
- 4: {'color': 'violet',
-     'polygon': [(0.596406999648, -0.528979574074),
-                 (0.596286017805, -0.53176112698),
-                 (0.596164248872, -0.534540797323),
-                 (0.596041691429, -0.537318572997),
-                 (0.595918344076, -0.540094441904),
-                 (0.595794205437, -0.542868391958),
-                 (0.595669274162, -0.545640411083),
-                 (0.595543548925, -0.54841048722),
-                 (0.595417028426, -0.551178608319),
-                 (0.595289711396, -0.553944762351),
-                 (0.59516159659, -0.556708937298),
-                 (0.595032682798, -0.559471121163),
-                 (0.594902968839, -0.562231301967),
-                 (0.594772453563, -0.564989467751),
-                 (0.594641135856, -0.567745606577),
-                 (0.594509014639, -0.570499706527),
-                 (0.594376088868, -0.573251755711),
-                 (0.594242357537, -0.576001742259),
-                 (0.59410781968, -0.57874965433),
-                 (0.593972474371, -0.581495480109),
-                 (0.593836320724, -0.584239207809),
-                 (0.593699357899, -0.586980825672),
-                 (0.593561585099, -0.589720321973),
-                 (0.593423001573, -0.592457685016),
-                 (0.593283606619, -0.595192903141),
-                 (0.593143399583, -0.59792596472),
-                 (0.593002379863, -0.600656858164),
-                 (0.592860546907, -0.603385571918),
-                 (0.59271790022, -0.606112094467),
-                 (0.592574439362, -0.608836414335),
-                 (0.59243016395, -0.611558520088),
-                 (0.592285073659, -0.614278400334),
-                 (0.592139168227, -0.616996043723),
-                 (0.586570157179, -0.61729730316),
-                 (0.580992214175, -0.617594715742),
-                 (0.575405426176, -0.617888320092),
-                 (0.569809882218, -0.618178153544),
-                 (0.564205673263, -0.618464252189),
-                 (0.558592892061, -0.618746650919),
-                 (0.552971633015, -0.619025383472),
-                 (0.547341992051, -0.619300482478),
-                 (0.541704066497, -0.619571979496),
-                 (0.536057954958, -0.619839905055),
-                 (0.530403757201, -0.620104288698),
-                 (0.52474157405, -0.620365159011),
-                 (0.51907150727, -0.620622543666),
-                 (0.513393659471, -0.620876469453),
-                 (0.507708134007, -0.621126962314),
-                 (0.502015034882, -0.621374047378),
-                 (0.49631446666, -0.621617748989),
-                 (0.490606534378, -0.621858090736),
-                 (0.484891343463, -0.622095095488),
-                 (0.479168999653, -0.622328785415),
-                 (0.473439608921, -0.622559182021),
-                 (0.467703277406, -0.622786306164),
-                 (0.46196011134, -0.62301017809),
-                 (0.456210216984, -0.623230817447),
-                 (0.45045370057, -0.623448243317),
-                 (0.444690668236, -0.623662474231),
-                 (0.438921225975, -0.623873528198),
-                 (0.43314547958, -0.624081422719),
-                 (0.427363534597, -0.624286174811),
-                 (0.421575496272, -0.624487801024),
-                 (0.415781469515, -0.624686317461),
-                 (0.409981558852, -0.624881739793),
-                 (0.410074859648, -0.62211734866),
-                 (0.41016757547, -0.61935081133),
-                 (0.410259708371, -0.616582141279),
-                 (0.410351260412, -0.613811351942),
-                 (0.410442233669, -0.611038456722),
-                 (0.410532630223, -0.608263468981),
-                 (0.410622452167, -0.605486402047),
-                 (0.410711701598, -0.602707269212),
-                 (0.410800380622, -0.599926083729),
-                 (0.410888491349, -0.59714285882),
-                 (0.410976035895, -0.594357607666),
-                 (0.411063016376, -0.591570343415),
-                 (0.411149434916, -0.58878107918),
-                 (0.411235293638, -0.585989828038),
-                 (0.411320594664, -0.583196603028),
-                 (0.411405340122, -0.580401417158),
-                 (0.411489532134, -0.577604283397),
-                 (0.411573172823, -0.574805214682),
-                 (0.411656264312, -0.572004223913),
-                 (0.411738808717, -0.569201323954),
-                 (0.411820808155, -0.566396527638),
-                 (0.411902264736, -0.563589847758),
-                 (0.411983180567, -0.560781297076),
-                 (0.412063557749, -0.557970888316),
-                 (0.412143398377, -0.555158634171),
-                 (0.41222270454, -0.552344547294),
-                 (0.412301478319, -0.549528640308),
-                 (0.412379721788, -0.546710925799),
-                 (0.412457437014, -0.543891416316),
-                 (0.412534626053, -0.541070124378),
-                 (0.412611290953, -0.538247062464),
-                 (0.412687433754, -0.535422243022),
-                 (0.41853245149, -0.535262519346),
-                 (0.424371839742, -0.535100264159),
-                 (0.430205495746, -0.534935465153),
-                 (0.436033316038, -0.534768109712),
-                 (0.44185519647, -0.534598184895),
-                 (0.447671032239, -0.534425677422),
-                 (0.453480717905, -0.534250573658),
-                 (0.459284147423, -0.534072859596),
-                 (0.465081214165, -0.533892520838),
-                 (0.470871810961, -0.533709542577),
-                 (0.476655830122, -0.533523909579),
-                 (0.482433163484, -0.533335606159),
-                 (0.488203702441, -0.533144616165),
-                 (0.493967337989, -0.53295092295),
-                 (0.499723960766, -0.532754509351),
-                 (0.505473461104, -0.532555357668),
-                 (0.511215729072, -0.532353449632),
-                 (0.516950654531, -0.532148766383),
-                 (0.522678127186, -0.531941288443),
-                 (0.52839803665, -0.531730995683),
-                 (0.534110272497, -0.531517867298),
-                 (0.539814724329, -0.53130188177),
-                 (0.545511281846, -0.531083016843),
-                 (0.551199834913, -0.530861249483),
-                 (0.556880273634, -0.530636555846),
-                 (0.562552488431, -0.530408911242),
-                 (0.568216370126, -0.530178290093),
-                 (0.573871810022, -0.529944665902),
-                 (0.579518699993, -0.529708011204),
-                 (0.585156932579, -0.52946829753),
-                 (0.590786401078, -0.529225495358),
-                 (0.596406999648, -0.528979574074)]},
- 5: {'color': 'violet',
-     'polygon': [(0.399172918777, -0.535815090311),
-                 (0.399100984169, -0.538642250666),
-                 (0.399028546603, -0.541467660404),
-                 (0.398955604065, -0.544291307073),
-                 (0.398882154533, -0.547113178181),
-                 (0.398808195974, -0.549933261202),
-                 (0.398733726347, -0.552751543568),
-                 (0.398658743599, -0.555568012677),
-                 (0.39858324567, -0.558382655888),
-                 (0.398507230492, -0.561195460522),
-                 (0.398430695989, -0.564006413864),
-                 (0.39835364008, -0.566815503158),
-                 (0.398276060673, -0.569622715612),
-                 (0.398197955676, -0.572428038396),
-                 (0.398119322988, -0.575231458641),
-                 (0.398040160504, -0.578032963441),
-                 (0.397960466116, -0.58083253985),
-                 (0.397880237713, -0.583630174884),
-                 (0.397799473181, -0.586425855521),
-                 (0.397718170404, -0.589219568699),
-                 (0.397636327265, -0.592011301318),
-                 (0.397553941648, -0.594801040238),
-                 (0.397471011437, -0.597588772281),
-                 (0.397387534516, -0.600374484228),
-                 (0.397303508774, -0.603158162821),
-                 (0.3972189321, -0.605939794761),
-                 (0.39713380239, -0.608719366711),
-                 (0.397048117542, -0.611496865292),
-                 (0.396961875461, -0.614272277085),
-                 (0.396875074061, -0.617045588628),
-                 (0.39678771126, -0.619816786421),
-                 (0.396699784988, -0.622585856921),
-                 (0.396611293182, -0.625352786543),
-                 (0.390792631582, -0.6255406671),
-                 (0.384968533162, -0.625725518233),
-                 (0.379139099821, -0.625907353548),
-                 (0.373304432873, -0.626086186311),
-                 (0.367464633022, -0.626262029468),
-                 (0.361619800347, -0.626434895651),
-                 (0.355770034273, -0.626604797192),
-                 (0.349915433562, -0.626771746134),
-                 (0.344056096291, -0.626935754239),
-                 (0.338192119844, -0.627096833002),
-                 (0.332323600894, -0.627254993657),
-                 (0.326450635396, -0.627410247185),
-                 (0.320573318579, -0.627562604327),
-                 (0.314691744938, -0.627712075585),
-                 (0.308806008227, -0.627858671237),
-                 (0.30291620146, -0.628002401338),
-                 (0.297022416901, -0.628143275731),
-                 (0.291124746071, -0.628281304048),
-                 (0.285223279743, -0.628416495723),
-                 (0.279318107945, -0.62854885999),
-                 (0.273409319964, -0.628678405894),
-                 (0.267497004348, -0.628805142293),
-                 (0.261581248912, -0.628929077861),
-                 (0.255662140748, -0.629050221098),
-                 (0.249739766223, -0.629168580325),
-                 (0.243814210998, -0.629284163696),
-                 (0.237885560029, -0.629396979198),
-                 (0.231953897583, -0.629507034651),
-                 (0.226019307246, -0.629614337715),
-                 (0.220081871933, -0.629718895892),
-                 (0.214141673905, -0.629820716526),
-                 (0.20819879478, -0.629919806806),
-                 (0.208241932574, -0.627126031438),
-                 (0.208284783221, -0.624330185672),
-                 (0.208327348046, -0.621532284185),
-                 (0.208369628377, -0.618732341554),
-                 (0.208411625549, -0.615930372259),
-                 (0.208453340894, -0.613126390686),
-                 (0.20849477575, -0.610320411126),
-                 (0.208535931456, -0.607512447778),
-                 (0.208576809349, -0.604702514751),
-                 (0.208617410768, -0.601890626063),
-                 (0.20865773705, -0.599076795645),
-                 (0.208697789531, -0.596261037341),
-                 (0.208737569545, -0.593443364909),
-                 (0.208777078421, -0.590623792024),
-                 (0.208816317489, -0.587802332277),
-                 (0.208855288071, -0.584978999179),
-                 (0.208893991486, -0.582153806159),
-                 (0.208932429048, -0.579326766568),
-                 (0.208970602066, -0.576497893678),
-                 (0.209008511842, -0.573667200685),
-                 (0.209046159672, -0.570834700708),
-                 (0.209083546846, -0.568000406793),
-                 (0.209120674644, -0.565164331911),
-                 (0.209157544341, -0.562326488962),
-                 (0.209194157202, -0.559486890773),
-                 (0.209230514484, -0.556645550101),
-                 (0.209266617436, -0.553802479634),
-                 (0.209302467294, -0.55095769199),
-                 (0.20933806529, -0.548111199721),
-                 (0.20937341264, -0.545263015312),
-                 (0.209408510554, -0.542413151181),
-                 (0.20944336023, -0.539561619682),
-                 (0.215424948732, -0.539480231722),
-                 (0.22140396789, -0.539396613989),
-                 (0.227380340522, -0.539310760101),
-                 (0.23335398886, -0.539222663556),
-                 (0.239324834531, -0.539132317737),
-                 (0.245292798538, -0.539039715904),
-                 (0.251257801249, -0.538944851203),
-                 (0.257219762377, -0.538847716656),
-                 (0.263178600967, -0.538748305165),
-                 (0.269134235382, -0.538646609509),
-                 (0.275086583291, -0.538542622346),
-                 (0.281035561648, -0.538436336206),
-                 (0.286981086691, -0.538327743492),
-                 (0.292923073917, -0.538216836478),
-                 (0.298861438084, -0.538103607306),
-                 (0.304796093189, -0.537988047981),
-                 (0.310726952466, -0.537870150373),
-                 (0.316653928371, -0.537749906209),
-                 (0.322576932581, -0.53762730707),
-                 (0.328495875979, -0.537502344388),
-                 (0.334410668656, -0.537375009443),
-                 (0.340321219898, -0.537245293353),
-                 (0.346227438187, -0.537113187075),
-                 (0.352129231195, -0.536978681393),
-                 (0.358026505786, -0.536841766917),
-                 (0.363919168012, -0.536702434074),
-                 (0.369807123112, -0.536560673102),
-                 (0.37569027552, -0.536416474039),
-                 (0.381568528861, -0.536269826721),
-                 (0.387441785962, -0.536120720768),
-                 (0.393309948853, -0.535969145577),
-                 (0.399172918777, -0.535815090311)]},
- 6: {'color': 'violet',
-     'polygon': [(0.195614410658, -0.539691143693),
-                 (0.195582577121, -0.542543847427),
-                 (0.195550512042, -0.54539488837),
-                 (0.195518214291, -0.548244254183),
-                 (0.19548568273, -0.551091932459),
-                 (0.195452916208, -0.553937910726),
-                 (0.195419913567, -0.55678217644),
-                 (0.195386673639, -0.559624716992),
-                 (0.195353195249, -0.5624655197),
-                 (0.195319477211, -0.56530457181),
-                 (0.195285518333, -0.568141860498),
-                 (0.195251317413, -0.570977372865),
-                 (0.195216873244, -0.573811095938),
-                 (0.195182184612, -0.576643016668),
-                 (0.195147250296, -0.57947312193),
-                 (0.195112069069, -0.582301398519),
-                 (0.195076639699, -0.585127833155),
-                 (0.195040960948, -0.587952412473),
-                 (0.195005031575, -0.590775123029),
-                 (0.194968850335, -0.593595951296),
-                 (0.194932415979, -0.596414883663),
-                 (0.194895727255, -0.599231906433),
-                 (0.194858782909, -0.602047005823),
-                 (0.194821581686, -0.60486016796),
-                 (0.194784122329, -0.607671378885),
-                 (0.194746403582, -0.610480624544),
-                 (0.194708424188, -0.613287890794),
-                 (0.194670182891, -0.616093163396),
-                 (0.194631678438, -0.618896428016),
-                 (0.194592909577, -0.621697670224),
-                 (0.194553875061, -0.62449687549),
-                 (0.194514573643, -0.627294029185),
-                 (0.194475004086, -0.630089116577),
-                 (0.188523793482, -0.630180191607),
-                 (0.182570247353, -0.630268566167),
-                 (0.176614444148, -0.630354246633),
-                 (0.170656461772, -0.630437239237),
-                 (0.164696377602, -0.63051755006),
-                 (0.158734268506, -0.630595185042),
-                 (0.152770210863, -0.630670149976),
-                 (0.146804280577, -0.630742450508),
-                 (0.140836553101, -0.630812092143),
-                 (0.134867103452, -0.630879080235),
-                 (0.128896006233, -0.630943419998),
-                 (0.122923335653, -0.631005116496),
-                 (0.116949165545, -0.631064174648),
-                 (0.110973569385, -0.631120599226),
-                 (0.104996620317, -0.631174394853),
-                 (0.0990183911689, -0.631225566003),
-                 (0.0930389544739, -0.631274117001),
-                 (0.0870583824917, -0.631320052021),
-                 (0.0810767472288, -0.631363375085),
-                 (0.0750941204583, -0.631404090059),
-                 (0.069110573741, -0.631442200658),
-                 (0.0631261784457, -0.631477710437),
-                 (0.0571410057694, -0.631510622798),
-                 (0.0511551267579, -0.631540940978),
-                 (0.0451686123256, -0.631568668056),
-                 (0.0391815332763, -0.631593806949),
-                 (0.0331939603224, -0.631616360405),
-                 (0.0272059641055, -0.63163633101),
-                 (0.0212176152152, -0.631653721179),
-                 (0.0152289842097, -0.631668533155),
-                 (0.00924014163391, -0.631680769009),
-                 (0.00325115803955, -0.631690430638),
-                 (0.00324951115883, -0.628886394215),
-                 (0.00324784954915, -0.626080322565),
-                 (0.00324617309337, -0.623272231109),
-                 (0.00324448169354, -0.620462135122),
-                 (0.00324277527014, -0.617650049739),
-                 (0.00324105376126, -0.614835989955),
-                 (0.00323931712177, -0.612019970632),
-                 (0.00323756532273, -0.609202006496),
-                 (0.00323579835052, -0.606382112143),
-                 (0.00323401620608, -0.603560302041),
-                 (0.0032322189044, -0.600736590532),
-                 (0.00323040647365, -0.597910991834),
-                 (0.00322857895472, -0.595083520046),
-                 (0.00322673640031, -0.592254189145),
-                 (0.00322487887459, -0.589423012995),
-                 (0.00322300645237, -0.586590005344),
-                 (0.00322111921867, -0.583755179826),
-                 (0.00321921726803, -0.58091854997),
-                 (0.00321730070397, -0.578080129191),
-                 (0.00321536963858, -0.575239930804),
-                 (0.00321342419178, -0.572397968015),
-                 (0.00321146449099, -0.569554253933),
-                 (0.00320949067051, -0.566708801563),
-                 (0.00320750287111, -0.563861623815),
-                 (0.00320550123959, -0.5610127335),
-                 (0.0032034859282, -0.558162143339),
-                 (0.00320145709435, -0.555309865955),
-                 (0.00319941490008, -0.552455913885),
-                 (0.00319735951177, -0.549600299573),
-                 (0.00319529109956, -0.546743035379),
-                 (0.00319320983712, -0.543884133576),
-                 (0.00319111590127, -0.541023606351),
-                 (0.00921718355906, -0.541014769643),
-                 (0.0152431083647, -0.541003844776),
-                 (0.0212688222218, -0.540990830041),
-                 (0.0272942570661, -0.540975723565),
-                 (0.0333193448495, -0.540958523315),
-                 (0.0393440175235, -0.540939227099),
-                 (0.0453682070237, -0.54091783257),
-                 (0.0513918452522, -0.540894337223),
-                 (0.0574148640613, -0.540868738401),
-                 (0.0634371952362, -0.540841033298),
-                 (0.0694587704776, -0.540811218953),
-                 (0.075479521384, -0.540779292262),
-                 (0.0814993794342, -0.540745249972),
-                 (0.0875182759693, -0.540709088687),
-                 (0.0935361421742, -0.540670804866),
-                 (0.0995529090597, -0.540630394831),
-                 (0.105568507444, -0.54058785476),
-                 (0.111582867933, -0.540543180696),
-                 (0.117595920904, -0.540496368546),
-                 (0.123607596484, -0.540447414081),
-                 (0.129617824533, -0.540396312941),
-                 (0.135626534625, -0.540343060632),
-                 (0.141633656025, -0.540287652533),
-                 (0.147639117677, -0.540230083892),
-                 (0.153642848179, -0.540170349831),
-                 (0.159644775764, -0.540108445345),
-                 (0.165644828287, -0.540044365306),
-                 (0.171642933198, -0.539978104461),
-                 (0.177639017529, -0.539909657434),
-                 (0.183633007872, -0.539839018728),
-                 (0.189624830363, -0.539766182727),
-                 (0.195614410658, -0.539691143693)]},
- 7: {'color': 'violet',
-     'polygon': [(-0.010650326707, -0.541083024187),
-                 (-0.0106492031076, -0.543943514219),
-                 (-0.010648075839, -0.546802379457),
-                 (-0.0106469450004, -0.549659607713),
-                 (-0.0106458106868, -0.552515186718),
-                 (-0.0106446729885, -0.555369104112),
-                 (-0.0106435319907, -0.558221347448),
-                 (-0.010642387773, -0.56107190419),
-                 (-0.0106412404093, -0.563920761707),
-                 (-0.0106400899669, -0.566767907277),
-                 (-0.0106389365066, -0.569613328081),
-                 (-0.0106377800817, -0.572457011201),
-                 (-0.0106366207379, -0.575298943622),
-                 (-0.0106354585126, -0.578139112226),
-                 (-0.0106342934345, -0.580977503793),
-                 (-0.010633125523, -0.583814104995),
-                 (-0.010631954788, -0.586648902399),
-                 (-0.0106307812286, -0.58948188246),
-                 (-0.0106296048333, -0.592313031523),
-                 (-0.0106284255791, -0.595142335819),
-                 (-0.0106272434308, -0.597969781462),
-                 (-0.0106260583406, -0.600795354447),
-                 (-0.0106248702472, -0.603619040648),
-                 (-0.0106236790755, -0.606440825818),
-                 (-0.0106224847355, -0.609260695582),
-                 (-0.0106212871222, -0.612078635438),
-                 (-0.0106200861142, -0.614894630753),
-                 (-0.0106188815735, -0.61770866676),
-                 (-0.0106176733446, -0.620520728558),
-                 (-0.0106164612535, -0.623330801106),
-                 (-0.0106152451073, -0.626138869223),
-                 (-0.0106140246934, -0.628944917582),
-                 (-0.0106127997781, -0.631748930711),
-                 (-0.0166017346537, -0.631743516539),
-                 (-0.0225905115661, -0.631735534159),
-                 (-0.0285790596211, -0.631724984608),
-                 (-0.0345673078041, -0.631711868731),
-                 (-0.0405551849631, -0.631696187178),
-                 (-0.0465426197915, -0.631677940404),
-                 (-0.052529540812, -0.631657128663),
-                 (-0.05851587636, -0.631633752008),
-                 (-0.0645015545677, -0.631607810284),
-                 (-0.0704865033489, -0.631579303129),
-                 (-0.0764706503834, -0.631548229969),
-                 (-0.0824539231024, -0.631514590013),
-                 (-0.0884362486738, -0.631478382253),
-                 (-0.0944175539883, -0.631439605457),
-                 (-0.100397765645, -0.63139825817),
-                 (-0.106376809939, -0.631354338706),
-                 (-0.112354612848, -0.631307845144),
-                 (-0.118331100018, -0.631258775329),
-                 (-0.124306196753, -0.631207126865),
-                 (-0.130279828003, -0.631152897108),
-                 (-0.136251918351, -0.63109608317),
-                 (-0.142222392004, -0.631036681904),
-                 (-0.148191172778, -0.63097468991),
-                 (-0.154158184093, -0.630910103524),
-                 (-0.160123348958, -0.630842918817),
-                 (-0.166086589964, -0.630773131586),
-                 (-0.172047829276, -0.630700737354),
-                 (-0.178006988618, -0.630625731364),
-                 (-0.183963989271, -0.630548108571),
-                 (-0.189918752061, -0.630467863641),
-                 (-0.195871197352, -0.630384990941),
-                 (-0.201821245038, -0.630299484539),
-                 (-0.201863876099, -0.627504065305),
-                 (-0.201906249736, -0.62470658012),
-                 (-0.201948367622, -0.621907045342),
-                 (-0.201990231389, -0.619105477149),
-                 (-0.202031842634, -0.616301891537),
-                 (-0.202073202914, -0.613496304327),
-                 (-0.20211431375, -0.61068873117),
-                 (-0.202155176628, -0.607879187547),
-                 (-0.202195792997, -0.605067688775),
-                 (-0.202236164274, -0.602254250011),
-                 (-0.202276291842, -0.599438886251),
-                 (-0.202316177051, -0.596621612339),
-                 (-0.20235582122, -0.593802442967),
-                 (-0.202395225636, -0.590981392679),
-                 (-0.202434391559, -0.588158475875),
-                 (-0.202473320215, -0.585333706811),
-                 (-0.202512012804, -0.582507099606),
-                 (-0.202550470498, -0.579678668243),
-                 (-0.202588694441, -0.576848426571),
-                 (-0.20262668575, -0.57401638831),
-                 (-0.202664445517, -0.571182567053),
-                 (-0.202701974808, -0.568346976266),
-                 (-0.202739274665, -0.565509629296),
-                 (-0.202776346104, -0.56267053937),
-                 (-0.202813190119, -0.559829719599),
-                 (-0.202849807682, -0.556987182977),
-                 (-0.202886199741, -0.55414294239),
-                 (-0.202922367222, -0.551297010612),
-                 (-0.202958311032, -0.548449400314),
-                 (-0.202994032054, -0.545600124058),
-                 (-0.203029531153, -0.542749194308),
-                 (-0.203064809175, -0.539896623424),
-                 (-0.197076077181, -0.539966329792),
-                 (-0.191085042279, -0.540033897543),
-                 (-0.185091781094, -0.540099331611),
-                 (-0.17909636985, -0.540162636694),
-                 (-0.17309888438, -0.540223817261),
-                 (-0.167099400129, -0.540282877548),
-                 (-0.161097992163, -0.540339821568),
-                 (-0.155094735174, -0.540394653109),
-                 (-0.149089703492, -0.54044737574),
-                 (-0.143082971084, -0.54049799281),
-                 (-0.137074611571, -0.540546507451),
-                 (-0.131064698231, -0.540592922584),
-                 (-0.125053304005, -0.540637240917),
-                 (-0.119040501511, -0.540679464948),
-                 (-0.113026363051, -0.54071959697),
-                 (-0.107010960615, -0.540757639069),
-                 (-0.100994365897, -0.540793593131),
-                 (-0.0949766503011, -0.54082746084),
-                 (-0.088957884952, -0.54085924368),
-                 (-0.0829381407045, -0.54088894294),
-                 (-0.0769174881542, -0.540916559716),
-                 (-0.0708959976487, -0.540942094907),
-                 (-0.0648737392977, -0.540965549226),
-                 (-0.0588507829849, -0.540986923195),
-                 (-0.0528271983793, -0.541006217148),
-                 (-0.0468030549473, -0.541023431236),
-                 (-0.0407784219645, -0.541038565427),
-                 (-0.0347533685288, -0.541051619506),
-                 (-0.0287279635726, -0.541062593081),
-                 (-0.0227022758765, -0.541071485579),
-                 (-0.0166763740824, -0.541078296254),
-                 (-0.010650326707, -0.541083024187)]},
- 8: {'color': 'violet',
-     'polygon': [(-0.216996106518, -0.539748047765),
-                 (-0.216955855468, -0.542599486091),
-                 (-0.2169153674, -0.545449280189),
-                 (-0.216874641406, -0.548297417666),
-                 (-0.216833676556, -0.551143886025),
-                 (-0.216792471899, -0.553988672666),
-                 (-0.216751026463, -0.556831764885),
-                 (-0.216709339252, -0.55967314987),
-                 (-0.216667409251, -0.562512814696),
-                 (-0.216625235417, -0.565350746328),
-                 (-0.216582816686, -0.568186931614),
-                 (-0.21654015197, -0.571021357285),
-                 (-0.216497240153, -0.57385400995),
-                 (-0.216454080096, -0.576684876096),
-                 (-0.216410670632, -0.579513942084),
-                 (-0.216367010568, -0.582341194144),
-                 (-0.216323098682, -0.585166618377),
-                 (-0.216278933725, -0.587990200748),
-                 (-0.216234514419, -0.590811927084),
-                 (-0.216189839456, -0.593631783073),
-                 (-0.216144907495, -0.596449754258),
-                 (-0.216099717168, -0.599265826035),
-                 (-0.216054267072, -0.602079983651),
-                 (-0.216008555773, -0.604892212199),
-                 (-0.215962581801, -0.607702496615),
-                 (-0.215916343654, -0.610510821677),
-                 (-0.215869839795, -0.613317171997),
-                 (-0.215823068649, -0.616121532021),
-                 (-0.215776028605, -0.618923886025),
-                 (-0.215728718015, -0.621724218112),
-                 (-0.215681135191, -0.624522512203),
-                 (-0.215633278406, -0.627318752042),
-                 (-0.215585145893, -0.630112921185),
-                 (-0.221526574876, -0.630023330567),
-                 (-0.227465250463, -0.629931074916),
-                 (-0.233401089911, -0.629836146511),
-                 (-0.239334009966, -0.629738537293),
-                 (-0.245263926856, -0.629638238857),
-                 (-0.251190756286, -0.629535242444),
-                 (-0.257114413432, -0.629429538937),
-                 (-0.26303481294, -0.629321118849),
-                 (-0.268951868916, -0.629209972323),
-                 (-0.274865494924, -0.629096089116),
-                 (-0.280775603985, -0.628979458599),
-                 (-0.28668210857, -0.628860069743),
-                 (-0.292584920593, -0.628737911118),
-                 (-0.298483951417, -0.628612970878),
-                 (-0.304379111839, -0.628485236755),
-                 (-0.310270312096, -0.628354696053),
-                 (-0.316157461857, -0.628221335634),
-                 (-0.322040470221, -0.628085141915),
-                 (-0.327919245716, -0.627946100853),
-                 (-0.333793696292, -0.627804197941),
-                 (-0.339663729322, -0.627659418193),
-                 (-0.345529251597, -0.627511746138),
-                 (-0.351390169325, -0.627361165806),
-                 (-0.357246388126, -0.627207660724),
-                 (-0.363097813032, -0.627051213898),
-                 (-0.368944348482, -0.626891807807),
-                 (-0.374785898319, -0.626729424389),
-                 (-0.38062236579, -0.626564045032),
-                 (-0.386453653539, -0.626395650561),
-                 (-0.392279663607, -0.626224221225),
-                 (-0.398100297428, -0.626049736687),
-                 (-0.403915455825, -0.625872176012),
-                 (-0.404009321575, -0.623105252408),
-                 (-0.404102618862, -0.620336138428),
-                 (-0.404195350803, -0.617564852178),
-                 (-0.404287520463, -0.61479141154),
-                 (-0.404379130857, -0.612015834177),
-                 (-0.404470184951, -0.609238137539),
-                 (-0.404560685664, -0.606458338863),
-                 (-0.404650635865, -0.603676455184),
-                 (-0.40474003838, -0.600892503332),
-                 (-0.404828895987, -0.598106499945),
-                 (-0.40491721142, -0.595318461465),
-                 (-0.40500498737, -0.592528404149),
-                 (-0.405092226485, -0.589736344066),
-                 (-0.40517893137, -0.58694229711),
-                 (-0.405265104588, -0.584146278995),
-                 (-0.405350748664, -0.581348305266),
-                 (-0.40543586608, -0.578548391297),
-                 (-0.40552045928, -0.575746552301),
-                 (-0.405604530672, -0.572942803327),
-                 (-0.405688082622, -0.570137159268),
-                 (-0.405771117463, -0.567329634865),
-                 (-0.405853637489, -0.564520244707),
-                 (-0.40593564496, -0.561709003237),
-                 (-0.4060171421, -0.558895924756),
-                 (-0.406098131099, -0.556081023422),
-                 (-0.406178614114, -0.553264313259),
-                 (-0.406258593268, -0.550445808156),
-                 (-0.406338070653, -0.547625521872),
-                 (-0.406417048326, -0.544803468039),
-                 (-0.406495528316, -0.541979660163),
-                 (-0.406573512621, -0.539154111629),
-                 (-0.406651003206, -0.536326835704),
-                 (-0.400791325928, -0.53647022962),
-                 (-0.394926425246, -0.536611139555),
-                 (-0.389056395209, -0.536749581297),
-                 (-0.383181329236, -0.536885570211),
-                 (-0.377301320128, -0.537019121247),
-                 (-0.371416460072, -0.537150248949),
-                 (-0.365526840659, -0.537278967463),
-                 (-0.359632552886, -0.537405290544),
-                 (-0.353733687169, -0.53752923157),
-                 (-0.347830333349, -0.53765080354),
-                 (-0.341922580701, -0.537770019091),
-                 (-0.336010517943, -0.5378868905),
-                 (-0.330094233241, -0.53800142969),
-                 (-0.324173814217, -0.538113648243),
-                 (-0.318249347957, -0.5382235574),
-                 (-0.312320921016, -0.538331168069),
-                 (-0.306388619426, -0.538436490836),
-                 (-0.300452528701, -0.538539535963),
-                 (-0.294512733845, -0.538640313401),
-                 (-0.288569319355, -0.538738832789),
-                 (-0.28262236923, -0.538835103467),
-                 (-0.276671966974, -0.538929134473),
-                 (-0.270718195606, -0.539020934554),
-                 (-0.264761137658, -0.53911051217),
-                 (-0.258800875189, -0.539197875494),
-                 (-0.252837489785, -0.539283032422),
-                 (-0.246871062565, -0.539365990577),
-                 (-0.24090167419, -0.539446757308),
-                 (-0.234929404863, -0.539525339699),
-                 (-0.228954334342, -0.539601744573),
-                 (-0.222976541936, -0.539675978492),
-                 (-0.216996106518, -0.539748047765)]},
- 9: {'bad_channels': [1, 2],
-     'color': 'red',
-     'polygon': [(-0.420144943478, -0.535887910701),
-                 (-0.420063432911, -0.538712897454),
-                 (-0.419981408592, -0.541536148793),
-                 (-0.419898868486, -0.544357651362),
-                 (-0.419815810526, -0.547177391685),
-                 (-0.419732232614, -0.549995356163),
-                 (-0.419648132621, -0.552811531071),
-                 (-0.419563508386, -0.555625902554),
-                 (-0.419478357714, -0.558438456626),
-                 (-0.419392678378, -0.561249179166),
-                 (-0.419306468118, -0.564058055913),
-                 (-0.419219724638, -0.566865072467),
-                 (-0.419132445606, -0.569670214281),
-                 (-0.419044628658, -0.572473466659),
-                 (-0.418956271389, -0.575274814755),
-                 (-0.418867371359, -0.578074243566),
-                 (-0.418777926091, -0.580871737932),
-                 (-0.418687933068, -0.583667282528),
-                 (-0.418597389734, -0.586460861864),
-                 (-0.418506293494, -0.58925246028),
-                 (-0.418414641711, -0.592042061941),
-                 (-0.418322431707, -0.594829650834),
-                 (-0.418229660761, -0.597615210765),
-                 (-0.41813632611, -0.600398725352),
-                 (-0.418042424947, -0.603180178024),
-                 (-0.417947954419, -0.605959552015),
-                 (-0.417852911629, -0.608736830361),
-                 (-0.417757293632, -0.611511995891),
-                 (-0.417661097437, -0.614285031232),
-                 (-0.417564320004, -0.617055918792),
-                 (-0.417466958245, -0.619824640767),
-                 (-0.417369009019, -0.622591179127),
-                 (-0.417270469137, -0.625355515619),
-                 (-0.423066823832, -0.625169913347),
-                 (-0.428857267408, -0.624981136527),
-                 (-0.43464169737, -0.624789160782),
-                 (-0.440420010586, -0.624593961052),
-                 (-0.446192103281, -0.624395511576),
-                 (-0.451957871035, -0.624193785879),
-                 (-0.457717208773, -0.62398875676),
-                 (-0.463470010761, -0.623780396268),
-                 (-0.469216170598, -0.623568675695),
-                 (-0.474955581213, -0.623353565557),
-                 (-0.480688134853, -0.623135035575),
-                 (-0.486413723078, -0.622913054661),
-                 (-0.492132236751, -0.622687590902),
-                 (-0.49784356603, -0.62245861154),
-                 (-0.503547600359, -0.622226082956),
-                 (-0.509244228459, -0.621989970652),
-                 (-0.514933338313, -0.621750239232),
-                 (-0.52061481716, -0.621506852384),
-                 (-0.526288551482, -0.621259772863),
-                 (-0.531954426989, -0.621008962468),
-                 (-0.537612328609, -0.620754382025),
-                 (-0.543262140472, -0.620495991368),
-                 (-0.548903745895, -0.620233749314),
-                 (-0.554537027371, -0.619967613651),
-                 (-0.560161866546, -0.619697541109),
-                 (-0.565778144207, -0.619423487342),
-                 (-0.571385740263, -0.619145406908),
-                 (-0.576984533726, -0.618863253247),
-                 (-0.58257440269, -0.618576978656),
-                 (-0.588155224313, -0.618286534268),
-                 (-0.593726874792, -0.617991870033),
-                 (-0.599289229344, -0.617692934689),
-                 (-0.599443006458, -0.614978950931),
-                 (-0.5995958626, -0.612262518489),
-                 (-0.599747801449, -0.609543658553),
-                 (-0.599898826645, -0.606822392042),
-                 (-0.600048941788, -0.604098739604),
-                 (-0.600198150442, -0.601372721624),
-                 (-0.600346456131, -0.598644358232),
-                 (-0.600493862345, -0.595913669304),
-                 (-0.600640372538, -0.593180674471),
-                 (-0.600785990125, -0.590445393122),
-                 (-0.600930718492, -0.587707844412),
-                 (-0.601074560987, -0.584968047264),
-                 (-0.601217520926, -0.582226020375),
-                 (-0.601359601592, -0.579481782222),
-                 (-0.601500806235, -0.576735351068),
-                 (-0.601641138076, -0.57398674496),
-                 (-0.601780600301, -0.571235981745),
-                 (-0.601919196068, -0.568483079062),
-                 (-0.602056928505, -0.565728054357),
-                 (-0.60219380071, -0.562970924881),
-                 (-0.60232981575, -0.560211707698),
-                 (-0.602464976668, -0.557450419686),
-                 (-0.602599286474, -0.554687077544),
-                 (-0.602732748153, -0.551921697795),
-                 (-0.602865364664, -0.549154296788),
-                 (-0.602997138936, -0.546384890707),
-                 (-0.603128073874, -0.54361349557),
-                 (-0.603258172356, -0.540840127234),
-                 (-0.603387437236, -0.538064801401),
-                 (-0.603515871343, -0.535287533618),
-                 (-0.603643477478, -0.532508339284),
-                 (-0.603770258423, -0.529727233652),
-                 (-0.598152467068, -0.52996703861),
-                 (-0.592525721641, -0.530203470643),
-                 (-0.586890149173, -0.530436567999),
-                 (-0.581245875245, -0.53066636799),
-                 (-0.575593024032, -0.53089290701),
-                 (-0.569931718342, -0.531116220556),
-                 (-0.564262079657, -0.531336343249),
-                 (-0.558584228167, -0.531553308853),
-                 (-0.552898282811, -0.531767150298),
-                 (-0.547204361307, -0.531977899695),
-                 (-0.54150258019, -0.532185588358),
-                 (-0.535793054843, -0.532390246821),
-                 (-0.530075899529, -0.532591904857),
-                 (-0.524351227421, -0.532790591494),
-                 (-0.518619150629, -0.532986335035),
-                 (-0.512879780234, -0.533179163073),
-                 (-0.507133226309, -0.533369102508),
-                 (-0.501379597947, -0.533556179562),
-                 (-0.495619003289, -0.533740419797),
-                 (-0.489851549542, -0.53392184813),
-                 (-0.484077343009, -0.534100488846),
-                 (-0.478296489106, -0.534276365615),
-                 (-0.472509092385, -0.534449501504),
-                 (-0.466715256556, -0.534619918995),
-                 (-0.460915084502, -0.534787639992),
-                 (-0.455108678305, -0.534952685842),
-                 (-0.449296139255, -0.535115077342),
-                 (-0.443477567877, -0.535274834754),
-                 (-0.437653063939, -0.535431977817),
-                 (-0.431822726472, -0.535586525758),
-                 (-0.425986653785, -0.535738497306),
-                 (-0.420144943478, -0.535887910701)]},
- 10: {'color': 'violet',
-      'polygon': [(0.599946136493, -0.435716885296),
-                  (0.599850798217, -0.438554017825),
-                  (0.599754726904, -0.441389668439),
-                  (0.599657920844, -0.444223825226),
-                  (0.599560378325, -0.447056476261),
-                  (0.599462097632, -0.449887609596),
-                  (0.599363077053, -0.452717213269),
-                  (0.599263314875, -0.4555452753),
-                  (0.599162809386, -0.458371783693),
-                  (0.599061558873, -0.461196726437),
-                  (0.598959561629, -0.464020091507),
-                  (0.598856815947, -0.466841866864),
-                  (0.598753320121, -0.469662040455),
-                  (0.598649072452, -0.472480600216),
-                  (0.598544071242, -0.47529753407),
-                  (0.598438314801, -0.478112829931),
-                  (0.59833180144, -0.480926475701),
-                  (0.59822452948, -0.483738459276),
-                  (0.598116497245, -0.48654876854),
-                  (0.598007703068, -0.489357391371),
-                  (0.59789814529, -0.492164315641),
-                  (0.59778782226, -0.494969529215),
-                  (0.597676732337, -0.497773019955),
-                  (0.597564873888, -0.500574775716),
-                  (0.597452245292, -0.503374784352),
-                  (0.597338844942, -0.506173033714),
-                  (0.597224671238, -0.508969511653),
-                  (0.597109722597, -0.511764206016),
-                  (0.596993997448, -0.514557104655),
-                  (0.596877494238, -0.517348195421),
-                  (0.596760211424, -0.520137466167),
-                  (0.596642147485, -0.522924904752),
-                  (0.596523300913, -0.525710499036),
-                  (0.590900858354, -0.525955327437),
-                  (0.585269553023, -0.526197063883),
-                  (0.57962949126, -0.526435738679),
-                  (0.573980780226, -0.526671381043),
-                  (0.568323527803, -0.52690401915),
-                  (0.562657842503, -0.527133680177),
-                  (0.556983833373, -0.527360390339),
-                  (0.551301609912, -0.527584174939),
-                  (0.545611281984, -0.5278050584),
-                  (0.53991295974, -0.528023064303),
-                  (0.534206753544, -0.528238215428),
-                  (0.528492773896, -0.528450533783),
-                  (0.522771131368, -0.528660040641),
-                  (0.517041936531, -0.528866756574),
-                  (0.511305299902, -0.529070701479),
-                  (0.505561331873, -0.529271894612),
-                  (0.499810142664, -0.529470354613),
-                  (0.494051842265, -0.529666099539),
-                  (0.488286540384, -0.529859146885),
-                  (0.482514346404, -0.530049513612),
-                  (0.476735369332, -0.530237216171),
-                  (0.470949717759, -0.530422270525),
-                  (0.465157499824, -0.530604692174),
-                  (0.459358823168, -0.530784496172),
-                  (0.453553794907, -0.530961697152),
-                  (0.447742521596, -0.531136309342),
-                  (0.441925109198, -0.531308346586),
-                  (0.436101663057, -0.531477822358),
-                  (0.430272287875, -0.531644749784),
-                  (0.424437087681, -0.531809141654),
-                  (0.418596165818, -0.531971010438),
-                  (0.412749624916, -0.532130368301),
-                  (0.412824199625, -0.529301793736),
-                  (0.412898258468, -0.52647150066),
-                  (0.412971803439, -0.523639501374),
-                  (0.413044836522, -0.520805808144),
-                  (0.413117359687, -0.517970433203),
-                  (0.413189374894, -0.515133388745),
-                  (0.413260884087, -0.512294686933),
-                  (0.413331889199, -0.50945433989),
-                  (0.413402392148, -0.506612359709),
-                  (0.413472394839, -0.503768758443),
-                  (0.413541899162, -0.500923548113),
-                  (0.413610906993, -0.498076740702),
-                  (0.413679420194, -0.49522834816),
-                  (0.413747440609, -0.4923783824),
-                  (0.41381497007, -0.489526855299),
-                  (0.413882010392, -0.486673778699),
-                  (0.413948563375, -0.483819164408),
-                  (0.414014630801, -0.480963024194),
-                  (0.414080214439, -0.478105369795),
-                  (0.414145316039, -0.475246212907),
-                  (0.414209937337, -0.472385565196),
-                  (0.414274080049, -0.469523438287),
-                  (0.414337745877, -0.466659843773),
-                  (0.414400936506, -0.463794793209),
-                  (0.414463653603, -0.460928298114),
-                  (0.414525898817, -0.458060369972),
-                  (0.414587673781, -0.455191020229),
-                  (0.414648980112, -0.452320260298),
-                  (0.414709819406, -0.449448101552),
-                  (0.414770193244, -0.44657455533),
-                  (0.41483010319, -0.443699632936),
-                  (0.414889550787, -0.440823345635),
-                  (0.420772160496, -0.440696251866),
-                  (0.426649388045, -0.440567171379),
-                  (0.432521135054, -0.440436095358),
-                  (0.438387302267, -0.44030301479),
-                  (0.444247789554, -0.440167920451),
-                  (0.450102495916, -0.440030802895),
-                  (0.455951319492, -0.439891652443),
-                  (0.461794157563, -0.439750459163),
-                  (0.467630906568, -0.439607212858),
-                  (0.473461462108, -0.43946190305),
-                  (0.479285718964, -0.439314518962),
-                  (0.485103571107, -0.439165049499),
-                  (0.490914911718, -0.43901348323),
-                  (0.496719633203, -0.43885980837),
-                  (0.502517627212, -0.438704012754),
-                  (0.508308784665, -0.438546083821),
-                  (0.514092995771, -0.438386008583),
-                  (0.519870150057, -0.43822377361),
-                  (0.525640136395, -0.438059364998),
-                  (0.531402843032, -0.437892768343),
-                  (0.537158157622, -0.437723968716),
-                  (0.542905967263, -0.437552950632),
-                  (0.548646158531, -0.437379698017),
-                  (0.554378617522, -0.437204194184),
-                  (0.560103229894, -0.437026421789),
-                  (0.565819880913, -0.436846362807),
-                  (0.571528455498, -0.436663998489),
-                  (0.577228838272, -0.436479309328),
-                  (0.582920913618, -0.436292275017),
-                  (0.588604565734, -0.436102874412),
-                  (0.59427967869, -0.435911085488),
-                  (0.599946136493, -0.435716885296)]},
- 11: {'color': 'violet',
-      'polygon': [(0.401381742146, -0.441167493854),
-                  (0.401322227677, -0.444045942617),
-                  (0.401262269789, -0.44692303353),
-                  (0.401201866993, -0.449798755378),
-                  (0.401141017787, -0.452673096907),
-                  (0.401079720647, -0.455546046826),
-                  (0.401017974033, -0.458417593809),
-                  (0.400955776388, -0.46128772649),
-                  (0.400893126135, -0.464156433469),
-                  (0.400830021682, -0.467023703305),
-                  (0.400766461418, -0.469889524524),
-                  (0.400702443716, -0.472753885613),
-                  (0.400637966929, -0.475616775021),
-                  (0.400573029395, -0.478478181162),
-                  (0.400507629436, -0.481338092412),
-                  (0.400441765354, -0.484196497108),
-                  (0.400375435437, -0.487053383553),
-                  (0.400308637955, -0.489908740011),
-                  (0.400241371162, -0.492762554709),
-                  (0.400173633297, -0.495614815839),
-                  (0.40010542258, -0.498465511552),
-                  (0.400036737219, -0.501314629965),
-                  (0.399967575402, -0.504162159157),
-                  (0.399897935307, -0.50700808717),
-                  (0.399827815092, -0.509852402008),
-                  (0.399757212903, -0.512695091639),
-                  (0.39968612687, -0.515536143993),
-                  (0.399614555111, -0.518375546964),
-                  (0.399542495727, -0.521213288408),
-                  (0.399469946807, -0.524049356143),
-                  (0.399396906427, -0.526883737951),
-                  (0.399323372649, -0.529716421576),
-                  (0.399249343524, -0.532547394727),
-                  (0.393385094862, -0.532693912249),
-                  (0.387515656334, -0.532837964469),
-                  (0.381641126589, -0.53297956223),
-                  (0.375761603484, -0.533118716147),
-                  (0.369877184072, -0.533255436613),
-                  (0.363987964604, -0.533389733811),
-                  (0.358094040519, -0.53352161772),
-                  (0.352195506441, -0.533651098125),
-                  (0.346292456184, -0.533778184623),
-                  (0.340384982743, -0.533902886631),
-                  (0.334473178303, -0.534025213392),
-                  (0.328557134235, -0.534145173984),
-                  (0.322636941104, -0.534262777319),
-                  (0.31671268867, -0.534378032155),
-                  (0.310784465897, -0.534490947097),
-                  (0.304852360956, -0.534601530603),
-                  (0.298916461234, -0.534709790989),
-                  (0.292976853344, -0.534815736428),
-                  (0.287033623131, -0.53491937496),
-                  (0.281086855684, -0.535020714492),
-                  (0.275136635346, -0.535119762796),
-                  (0.269183045727, -0.535216527523),
-                  (0.263226169716, -0.535311016191),
-                  (0.257266089489, -0.535403236201),
-                  (0.25130288653, -0.535493194825),
-                  (0.245336641642, -0.53558089922),
-                  (0.239367434959, -0.53566635642),
-                  (0.233395345963, -0.53574957334),
-                  (0.227420453504, -0.535830556779),
-                  (0.221442835807, -0.535909313418),
-                  (0.215462570495, -0.535985849819),
-                  (0.209479734607, -0.536060172429),
-                  (0.209517273689, -0.533204929916),
-                  (0.209554569482, -0.530348060024),
-                  (0.209591623124, -0.527489574839),
-                  (0.209628435741, -0.524629486386),
-                  (0.209665008446, -0.521767806629),
-                  (0.209701342342, -0.518904547475),
-                  (0.209737438515, -0.516039720772),
-                  (0.209773298043, -0.513173338309),
-                  (0.209808921988, -0.51030541182),
-                  (0.209844311401, -0.507435952982),
-                  (0.209879467316, -0.504564973416),
-                  (0.209914390758, -0.501692484689),
-                  (0.209949082737, -0.498818498313),
-                  (0.209983544247, -0.495943025747),
-                  (0.21001777627, -0.493066078397),
-                  (0.210051779776, -0.490187667616),
-                  (0.210085555718, -0.487307804707),
-                  (0.210119105037, -0.484426500919),
-                  (0.210152428658, -0.481543767452),
-                  (0.210185527492, -0.478659615457),
-                  (0.210218402439, -0.475774056034),
-                  (0.21025105438, -0.472887100234),
-                  (0.210283484185, -0.469998759062),
-                  (0.210315692709, -0.467109043471),
-                  (0.210347680791, -0.46421796437),
-                  (0.210379449258, -0.461325532621),
-                  (0.21041099892, -0.458431759037),
-                  (0.210442330576, -0.455536654388),
-                  (0.210473445006, -0.452640229397),
-                  (0.210504342981, -0.449742494742),
-                  (0.210535025254, -0.446843461057),
-                  (0.210565492563, -0.443943138933),
-                  (0.216579216273, -0.443884547147),
-                  (0.222590442095, -0.443824199347),
-                  (0.22859909687, -0.443762090109),
-                  (0.234605106952, -0.443698213932),
-                  (0.240608398187, -0.443632565228),
-                  (0.246608895895, -0.443565138335),
-                  (0.252606524853, -0.443495927509),
-                  (0.258601209275, -0.443424926929),
-                  (0.264592872798, -0.443352130699),
-                  (0.27058143846, -0.443277532845),
-                  (0.276566828686, -0.443201127319),
-                  (0.282548965271, -0.443122907997),
-                  (0.288527769359, -0.443042868682),
-                  (0.294503161432, -0.442961003097),
-                  (0.300475061291, -0.442877304895),
-                  (0.306443388039, -0.442791767648),
-                  (0.312408060068, -0.442704384854),
-                  (0.318368995044, -0.442615149929),
-                  (0.32432610989, -0.442524056211),
-                  (0.330279320774, -0.442431096957),
-                  (0.336228543094, -0.442336265336),
-                  (0.342173691468, -0.442239554432),
-                  (0.348114679719, -0.442140957241),
-                  (0.354051420863, -0.442040466661),
-                  (0.359983827099, -0.441938075497),
-                  (0.3659118098, -0.44183377645),
-                  (0.371835279502, -0.441727562116),
-                  (0.377754145894, -0.441619424979),
-                  (0.383668317812, -0.441509357406),
-                  (0.389577703232, -0.441397351641),
-                  (0.395482209264, -0.441283399798),
-                  (0.401381742146, -0.441167493854)]},
- 12: {'color': 'violet',
-      'polygon': [(0.196419117022, -0.44412610446),
-                  (0.196394624598, -0.447027404743),
-                  (0.196369931213, -0.449927419333),
-                  (0.196345036164, -0.452826137677),
-                  (0.196319938736, -0.455723549178),
-                  (0.196294638197, -0.458619643194),
-                  (0.196269133804, -0.461514409039),
-                  (0.1962434248, -0.46440783598),
-                  (0.196217510413, -0.467299913238),
-                  (0.196191389857, -0.470190629987),
-                  (0.196165062333, -0.473079975353),
-                  (0.196138527028, -0.475967938416),
-                  (0.196111783116, -0.478854508206),
-                  (0.196084829756, -0.481739673704),
-                  (0.196057666093, -0.484623423843),
-                  (0.19603029126, -0.487505747504),
-                  (0.196002704375, -0.490386633519),
-                  (0.195974904543, -0.493266070667),
-                  (0.195946890856, -0.496144047677),
-                  (0.195918662391, -0.499020553224),
-                  (0.195890218213, -0.50189557593),
-                  (0.195861557373, -0.504769104363),
-                  (0.195832678911, -0.507641127038),
-                  (0.195803581851, -0.510511632413),
-                  (0.195774265205, -0.513380608892),
-                  (0.195744727975, -0.516248044821),
-                  (0.195714969146, -0.519113928489),
-                  (0.195684987694, -0.521978248127),
-                  (0.195654782582, -0.524840991908),
-                  (0.19562435276, -0.527702147944),
-                  (0.195593697166, -0.530561704288),
-                  (0.195562814729, -0.533419648932),
-                  (0.195531704364, -0.536275969806),
-                  (0.189540788723, -0.536350792345),
-                  (0.183547635499, -0.536423429879),
-                  (0.177552318879, -0.536493888109),
-                  (0.171554912582, -0.536562172613),
-                  (0.165555489869, -0.536628288852),
-                  (0.159554123569, -0.536692242164),
-                  (0.153550886092, -0.536754037769),
-                  (0.147545849453, -0.536813680759),
-                  (0.141539085286, -0.536871176107),
-                  (0.135530664869, -0.536926528658),
-                  (0.129520659135, -0.536979743131),
-                  (0.123509138699, -0.537030824116),
-                  (0.117496173874, -0.537079776075),
-                  (0.111481834687, -0.537126603339),
-                  (0.105466190902, -0.537171310107),
-                  (0.0994493120373, -0.537213900441),
-                  (0.0934312673849, -0.537254378272),
-                  (0.0874121260279, -0.53729274739),
-                  (0.0813919568598, -0.537329011449),
-                  (0.0753708286028, -0.537363173958),
-                  (0.0693488098261, -0.53739523829),
-                  (0.0633259689636, -0.537425207667),
-                  (0.0573023743323, -0.537453085172),
-                  (0.0512780941494, -0.537478873734),
-                  (0.0452531965499, -0.537502576138),
-                  (0.0392277496042, -0.537524195014),
-                  (0.0332018213347, -0.537543732842),
-                  (0.0271754797327, -0.537561191946),
-                  (0.0211487927749, -0.537576574492),
-                  (0.0151218284398, -0.537589882491),
-                  (0.00909465472336, -0.537601117791),
-                  (0.00306733965519, -0.53761028208),
-                  (0.0030649995318, -0.534746233309),
-                  (0.00306264737935, -0.531880597492),
-                  (0.00306028338403, -0.529013386484),
-                  (0.00305790773336, -0.526144612059),
-                  (0.00305552061599, -0.52327428592),
-                  (0.00305312222139, -0.520402419694),
-                  (0.00305071273951, -0.517529024938),
-                  (0.00304829236066, -0.514654113136),
-                  (0.00304586127507, -0.511777695706),
-                  (0.00304341967276, -0.508899783993),
-                  (0.00304096774335, -0.506020389279),
-                  (0.0030385056757, -0.503139522779),
-                  (0.00303603365785, -0.500257195642),
-                  (0.00303355187663, -0.497373418957),
-                  (0.00303106051769, -0.494488203748),
-                  (0.00302855976508, -0.491601560978),
-                  (0.00302604980132, -0.488713501552),
-                  (0.00302353080701, -0.485824036314),
-                  (0.00302100296076, -0.482933176052),
-                  (0.0030184664391, -0.480040931495),
-                  (0.00301592141619, -0.477147313318),
-                  (0.00301336806388, -0.474252332142),
-                  (0.00301080655137, -0.471355998531),
-                  (0.00300823704526, -0.468458322999),
-                  (0.00300565970932, -0.465559316006),
-                  (0.00300307470442, -0.462658987963),
-                  (0.00300048218855, -0.459757349229),
-                  (0.00299788231649, -0.456854410115),
-                  (0.0029952752399, -0.453950180883),
-                  (0.00299266110721, -0.451044671747),
-                  (0.00299004006354, -0.448137892875),
-                  (0.00298741225055, -0.445229854387),
-                  (0.0090448027378, -0.445221069881),
-                  (0.0151020459168, -0.445210649557),
-                  (0.0211590749885, -0.445198592162),
-                  (0.0272158232171, -0.445184896294),
-                  (0.0332722239175, -0.445169560399),
-                  (0.0393282104439, -0.445152582777),
-                  (0.0453837161766, -0.445133961582),
-                  (0.0514386745095, -0.445113694823),
-                  (0.0574930188369, -0.445091780367),
-                  (0.0635466825399, -0.445068215941),
-                  (0.0695995989732, -0.445042999132),
-                  (0.0756517014502, -0.44501612739),
-                  (0.0817029232295, -0.44498759803),
-                  (0.0877531974998, -0.444957408235),
-                  (0.0938024573653, -0.444925555056),
-                  (0.0998506358304, -0.444892035414),
-                  (0.105897665784, -0.444856846105),
-                  (0.111943479985, -0.444819983799),
-                  (0.117988011043, -0.444781445044),
-                  (0.124031191409, -0.444741226268),
-                  (0.130072953349, -0.444699323779),
-                  (0.136113228938, -0.444655733772),
-                  (0.142151950036, -0.444610452327),
-                  (0.148189048271, -0.444563475411),
-                  (0.154224455027, -0.444514798886),
-                  (0.160258101422, -0.444464418502),
-                  (0.166289918292, -0.444412329909),
-                  (0.172319836172, -0.444358528653),
-                  (0.178347785282, -0.44430301018),
-                  (0.184373695503, -0.444245769837),
-                  (0.190397496364, -0.444186802878),
-                  (0.196419117022, -0.44412610446)]},
- 13: {'color': 'violet',
-      'polygon': [(-0.010815739719, -0.44511061709),
-                  (-0.0108114741195, -0.448018681047),
-                  (-0.0108072017791, -0.450925486213),
-                  (-0.0108029228045, -0.453831022486),
-                  (-0.0107986373052, -0.456735279722),
-                  (-0.0107943453929, -0.459638247727),
-                  (-0.0107900471821, -0.46253991626),
-                  (-0.0107857427893, -0.465440275033),
-                  (-0.0107814323335, -0.468339313705),
-                  (-0.0107771159357, -0.471237021889),
-                  (-0.0107727937188, -0.474133389144),
-                  (-0.0107684658079, -0.477028404977),
-                  (-0.0107641323298, -0.479922058845),
-                  (-0.0107597934127, -0.482814340146),
-                  (-0.0107554491867, -0.485705238228),
-                  (-0.0107510997831, -0.488594742378),
-                  (-0.0107467453343, -0.49148284183),
-                  (-0.010742385974, -0.494369525759),
-                  (-0.0107380218367, -0.497254783278),
-                  (-0.0107336530575, -0.500138603443),
-                  (-0.0107292797722, -0.503020975248),
-                  (-0.0107249021169, -0.505901887622),
-                  (-0.0107205202277, -0.508781329433),
-                  (-0.0107161342407, -0.511659289482),
-                  (-0.0107117442919, -0.514535756506),
-                  (-0.0107073505163, -0.517410719171),
-                  (-0.0107029530485, -0.520284166079),
-                  (-0.010698552022, -0.523156085757),
-                  (-0.0106941475689, -0.526026466664),
-                  (-0.0106897398198, -0.528895297186),
-                  (-0.0106853289034, -0.531762565632),
-                  (-0.0106809149464, -0.534628260238),
-                  (-0.0106764980729, -0.537492369162),
-                  (-0.0167038473022, -0.537494180713),
-                  (-0.0227310463976, -0.537493927272),
-                  (-0.0287580269061, -0.53749160965),
-                  (-0.0347847202495, -0.537487228486),
-                  (-0.0408110577102, -0.537480784241),
-                  (-0.0468369704179, -0.537472277201),
-                  (-0.0528623893371, -0.537461707475),
-                  (-0.0588872452538, -0.537449074987),
-                  (-0.0649114687637, -0.537434379483),
-                  (-0.0709349902597, -0.537417620524),
-                  (-0.0769577399203, -0.537398797483),
-                  (-0.0829796476984, -0.537377909548),
-                  (-0.0890006433097, -0.537354955716),
-                  (-0.0950206562221, -0.537329934791),
-                  (-0.101039615645, -0.537302845387),
-                  (-0.10705745052, -0.537273685919),
-                  (-0.113074089509, -0.537242454608),
-                  (-0.119089460986, -0.537209149473),
-                  (-0.125103493027, -0.537173768333),
-                  (-0.131116113403, -0.537136308803),
-                  (-0.137127249567, -0.537096768292),
-                  (-0.143136828649, -0.537055144003),
-                  (-0.149144777446, -0.537011432928),
-                  (-0.155151022415, -0.536965631847),
-                  (-0.161155489664, -0.536917737326),
-                  (-0.167158104944, -0.536867745713),
-                  (-0.173158793645, -0.536815653138),
-                  (-0.179157480783, -0.536761455509),
-                  (-0.185154090999, -0.536705148511),
-                  (-0.191148548548, -0.536646727601),
-                  (-0.197140777294, -0.536586188006),
-                  (-0.203130700704, -0.536523524722),
-                  (-0.203168780228, -0.533667381474),
-                  (-0.203206642378, -0.5308096363),
-                  (-0.203244287913, -0.527950301164),
-                  (-0.203281717572, -0.525089387945),
-                  (-0.203318932076, -0.522226908432),
-                  (-0.203355932132, -0.51936287433),
-                  (-0.203392718431, -0.51649729726),
-                  (-0.203429291647, -0.513630188765),
-                  (-0.20346565244, -0.510761560304),
-                  (-0.203501801456, -0.507891423262),
-                  (-0.203537739325, -0.505019788945),
-                  (-0.203573466664, -0.502146668588),
-                  (-0.203608984076, -0.499272073351),
-                  (-0.203644292152, -0.496396014324),
-                  (-0.203679391468, -0.493518502527),
-                  (-0.203714282589, -0.490639548914),
-                  (-0.203748966067, -0.48775916437),
-                  (-0.203783442443, -0.484877359718),
-                  (-0.203817712245, -0.481994145715),
-                  (-0.203851775991, -0.479109533058),
-                  (-0.203885634187, -0.476223532384),
-                  (-0.203919287329, -0.473336154268),
-                  (-0.203952735901, -0.470447409229),
-                  (-0.203985980379, -0.46755730773),
-                  (-0.204019021226, -0.464665860178),
-                  (-0.2040518589, -0.461773076927),
-                  (-0.204084493844, -0.458878968275),
-                  (-0.204116926496, -0.455983544472),
-                  (-0.204149157282, -0.453086815716),
-                  (-0.204181186622, -0.450188792155),
-                  (-0.204213014925, -0.44728948389),
-                  (-0.204244642594, -0.444388900974),
-                  (-0.198223659738, -0.444437159707),
-                  (-0.19220042936, -0.444483728335),
-                  (-0.186175025574, -0.444528611276),
-                  (-0.18014752218, -0.444571812771),
-                  (-0.174117992668, -0.444613336887),
-                  (-0.168086510224, -0.44465318752),
-                  (-0.162053147733, -0.444691368391),
-                  (-0.156017977786, -0.444727883051),
-                  (-0.149981072683, -0.444762734876),
-                  (-0.143942504438, -0.444795927073),
-                  (-0.137902344785, -0.444827462678),
-                  (-0.131860665184, -0.444857344556),
-                  (-0.125817536823, -0.4448855754),
-                  (-0.119773030625, -0.444912157735),
-                  (-0.113727217256, -0.444937093916),
-                  (-0.107680167128, -0.444960386128),
-                  (-0.101631950405, -0.444982036389),
-                  (-0.0955826370088, -0.445002046547),
-                  (-0.0895322966287, -0.445020418283),
-                  (-0.0834809987238, -0.445037153111),
-                  (-0.077428812532, -0.445052252376),
-                  (-0.071375807076, -0.445065717259),
-                  (-0.0653220511716, -0.445077548775),
-                  (-0.059267613434, -0.445087747773),
-                  (-0.0532125622864, -0.445096314937),
-                  (-0.0471569659673, -0.445103250789),
-                  (-0.0411008925392, -0.445108555686),
-                  (-0.0350444098971, -0.445112229826),
-                  (-0.0289875857769, -0.445114273241),
-                  (-0.022930487765, -0.445114685807),
-                  (-0.0168731833073, -0.445113467238),
-                  (-0.010815739719, -0.44511061709)]},
- 14: {'color': 'violet',
-      'polygon': [(-0.218100175955, -0.444361186545),
-                  (-0.218070116414, -0.447260652057),
-                  (-0.218039840413, -0.450158839365),
-                  (-0.218009347494, -0.453055738397),
-                  (-0.217978637191, -0.455951339031),
-                  (-0.217947709029, -0.458845631102),
-                  (-0.217916562523, -0.461738604391),
-                  (-0.217885197176, -0.464630248629),
-                  (-0.217853612484, -0.467520553497),
-                  (-0.217821807931, -0.470409508621),
-                  (-0.217789782992, -0.473297103574),
-                  (-0.21775753713, -0.476183327871),
-                  (-0.217725069797, -0.479068170973),
-                  (-0.217692380432, -0.48195162228),
-                  (-0.217659468467, -0.484833671135),
-                  (-0.217626333317, -0.487714306818),
-                  (-0.217592974388, -0.490593518547),
-                  (-0.217559391072, -0.493471295478),
-                  (-0.217525582749, -0.496347626698),
-                  (-0.217491548785, -0.499222501231),
-                  (-0.217457288533, -0.502095908031),
-                  (-0.217422801332, -0.50496783598),
-                  (-0.217388086507, -0.507838273892),
-                  (-0.217353143368, -0.510707210506),
-                  (-0.217317971211, -0.513574634486),
-                  (-0.217282569316, -0.516440534419),
-                  (-0.217246936947, -0.519304898814),
-                  (-0.217211073353, -0.522167716099),
-                  (-0.217174977765, -0.525028974623),
-                  (-0.217138649398, -0.527888662646),
-                  (-0.217102087451, -0.530746768346),
-                  (-0.217065291104, -0.533603279811),
-                  (-0.217028259517, -0.53645818504),
-                  (-0.223010035626, -0.536381343508),
-                  (-0.228989176227, -0.536302356096),
-                  (-0.234965602587, -0.53622121662),
-                  (-0.240939235536, -0.536137918644),
-                  (-0.246909995467, -0.536052455473),
-                  (-0.252877802326, -0.535964820159),
-                  (-0.258842575608, -0.535875005485),
-                  (-0.26480423435, -0.535783003971),
-                  (-0.270762697132, -0.535688807865),
-                  (-0.276717882061, -0.53559240914),
-                  (-0.282669706774, -0.535493799489),
-                  (-0.28861808843, -0.535392970321),
-                  (-0.294562943703, -0.535289912756),
-                  (-0.300504188776, -0.535184617623),
-                  (-0.306441739341, -0.535077075448),
-                  (-0.312375510583, -0.534967276457),
-                  (-0.318305417183, -0.534855210565),
-                  (-0.324231373309, -0.534740867372),
-                  (-0.330153292606, -0.534624236158),
-                  (-0.336071088195, -0.534505305875),
-                  (-0.341984672663, -0.534384065144),
-                  (-0.347893958057, -0.534260502245),
-                  (-0.353798855875, -0.534134605115),
-                  (-0.359699277063, -0.534006361333),
-                  (-0.365595131999, -0.533875758123),
-                  (-0.371486330495, -0.533742782339),
-                  (-0.377372781781, -0.533607420461),
-                  (-0.383254394497, -0.533469658585),
-                  (-0.389131076688, -0.533329482419),
-                  (-0.395002735789, -0.533186877269),
-                  (-0.400869278618, -0.533041828033),
-                  (-0.406730611366, -0.532894319194),
-                  (-0.406804359779, -0.530063329839),
-                  (-0.406877619507, -0.527230654056),
-                  (-0.406950392408, -0.524396304645),
-                  (-0.407022680312, -0.521560294303),
-                  (-0.407094485023, -0.518722635624),
-                  (-0.407165808317, -0.515883341101),
-                  (-0.407236651944, -0.51304242313),
-                  (-0.407307017631, -0.510199894013),
-                  (-0.407376907078, -0.507355765958),
-                  (-0.407446321959, -0.504510051083),
-                  (-0.407515263925, -0.501662761417),
-                  (-0.407583734605, -0.498813908902),
-                  (-0.407651735603, -0.495963505398),
-                  (-0.407719268498, -0.493111562681),
-                  (-0.40778633485, -0.490258092449),
-                  (-0.407852936196, -0.487403106318),
-                  (-0.407919074049, -0.484546615833),
-                  (-0.407984749902, -0.481688632461),
-                  (-0.408049965227, -0.478829167597),
-                  (-0.408114721477, -0.475968232567),
-                  (-0.40817902008, -0.473105838626),
-                  (-0.408242862449, -0.470241996963),
-                  (-0.408306249975, -0.467376718702),
-                  (-0.408369184028, -0.464510014901),
-                  (-0.408431665962, -0.461641896557),
-                  (-0.408493697111, -0.458772374607),
-                  (-0.408555278791, -0.455901459928),
-                  (-0.408616412298, -0.453029163338),
-                  (-0.408677098912, -0.450155495601),
-                  (-0.408737339896, -0.447280467424),
-                  (-0.408797136493, -0.444404089462),
-                  (-0.408856489932, -0.441526372316),
-                  (-0.402959945314, -0.441643725698),
-                  (-0.397058384504, -0.441759126995),
-                  (-0.39115189618, -0.441872587555),
-                  (-0.385240568429, -0.441984118458),
-                  (-0.379324488761, -0.442093730525),
-                  (-0.373403744126, -0.442201434328),
-                  (-0.367478420926, -0.442307240187),
-                  (-0.361548605027, -0.442411158184),
-                  (-0.355614381779, -0.442513198161),
-                  (-0.34967583602, -0.442613369729),
-                  (-0.343733052092, -0.442711682271),
-                  (-0.337786113853, -0.442808144945),
-                  (-0.331835104684, -0.442902766688),
-                  (-0.325880107502, -0.442995556224),
-                  (-0.31992120477, -0.443086522061),
-                  (-0.313958478504, -0.443175672498),
-                  (-0.307992010283, -0.443263015629),
-                  (-0.302021881257, -0.443348559344),
-                  (-0.296048172154, -0.44343231133),
-                  (-0.290070963293, -0.443514279078),
-                  (-0.284090334581, -0.443594469883),
-                  (-0.278106365531, -0.443672890846),
-                  (-0.27211913526, -0.443749548876),
-                  (-0.266128722502, -0.443824450691),
-                  (-0.260135205608, -0.443897602824),
-                  (-0.254138662556, -0.443969011621),
-                  (-0.248139170956, -0.444038683241),
-                  (-0.242136808056, -0.444106623661),
-                  (-0.236131650742, -0.444172838677),
-                  (-0.230123775552, -0.444237333903),
-                  (-0.224113258675, -0.444300114774),
-                  (-0.218100175955, -0.444361186545)]},
- 15: {'color': 'violet',
-      'polygon': [(-0.422493267995, -0.441258399505),
-                  (-0.42242901397, -0.444134030337),
-                  (-0.422364299337, -0.44700831643),
-                  (-0.422299122814, -0.449881247121),
-                  (-0.4222334831, -0.452752811694),
-                  (-0.422167378878, -0.455622999379),
-                  (-0.422100808811, -0.458491799353),
-                  (-0.422033771546, -0.461359200733),
-                  (-0.421966265711, -0.464225192579),
-                  (-0.421898289914, -0.467089763891),
-                  (-0.421829842746, -0.469952903607),
-                  (-0.421760922776, -0.472814600602),
-                  (-0.421691528557, -0.475674843689),
-                  (-0.421621658619, -0.478533621611),
-                  (-0.421551311473, -0.481390923046),
-                  (-0.421480485609, -0.484246736599),
-                  (-0.421409179497, -0.487101050808),
-                  (-0.421337391583, -0.489953854133),
-                  (-0.421265120294, -0.492805134963),
-                  (-0.421192364034, -0.495654881608),
-                  (-0.421119121184, -0.498503082298),
-                  (-0.421045390104, -0.501349725184),
-                  (-0.420971169128, -0.504194798333),
-                  (-0.420896456569, -0.507038289728),
-                  (-0.420821250714, -0.509880187262),
-                  (-0.420745549827, -0.512720478741),
-                  (-0.420669352146, -0.51555915188),
-                  (-0.420592655885, -0.518396194297),
-                  (-0.420515459229, -0.521231593516),
-                  (-0.420437760342, -0.524065336963),
-                  (-0.420359557356, -0.52689741196),
-                  (-0.42028084838, -0.529727805728),
-                  (-0.420201631492, -0.532556505381),
-                  (-0.426044935019, -0.532405996013),
-                  (-0.431882612744, -0.532252951271),
-                  (-0.437714567282, -0.532097353167),
-                  (-0.443540700541, -0.531939183232),
-                  (-0.449360913704, -0.531778422506),
-                  (-0.455175107216, -0.531615051523),
-                  (-0.460983180768, -0.531449050306),
-                  (-0.466785033278, -0.531280398346),
-                  (-0.472580562875, -0.531109074598),
-                  (-0.47836966688, -0.530935057461),
-                  (-0.484152241788, -0.530758324771),
-                  (-0.489928183248, -0.530578853783),
-                  (-0.49569738604, -0.530396621162),
-                  (-0.501459744055, -0.530211602961),
-                  (-0.507215150273, -0.530023774615),
-                  (-0.512963496738, -0.529833110922),
-                  (-0.518704674535, -0.529639586026),
-                  (-0.524438573762, -0.529443173406),
-                  (-0.530165083508, -0.529243845857),
-                  (-0.535884091819, -0.529041575471),
-                  (-0.541595485677, -0.528836333627),
-                  (-0.547299150962, -0.528628090968),
-                  (-0.552994972428, -0.528416817385),
-                  (-0.558682833669, -0.528202482002),
-                  (-0.564362617083, -0.527985053153),
-                  (-0.570034203841, -0.527764498364),
-                  (-0.575697473849, -0.527540784338),
-                  (-0.581352305714, -0.52731387693),
-                  (-0.586998576701, -0.527083741132),
-                  (-0.592636162698, -0.526850341047),
-                  (-0.598264938173, -0.526613639873),
-                  (-0.603884776132, -0.526373599881),
-                  (-0.604008609769, -0.523588368545),
-                  (-0.604131626412, -0.520801273217),
-                  (-0.604253828745, -0.518012328574),
-                  (-0.604375219435, -0.515221549167),
-                  (-0.604495801124, -0.512428949419),
-                  (-0.604615576431, -0.509634543629),
-                  (-0.604734547957, -0.50683834598),
-                  (-0.604852718279, -0.504040370532),
-                  (-0.604970089953, -0.501240631237),
-                  (-0.605086665517, -0.498439141931),
-                  (-0.605202447485, -0.495635916342),
-                  (-0.605317438353, -0.492830968094),
-                  (-0.605431640597, -0.490024310704),
-                  (-0.605545056673, -0.48721595759),
-                  (-0.605657689018, -0.484405922072),
-                  (-0.605769540049, -0.481594217372),
-                  (-0.605880612164, -0.478780856619),
-                  (-0.605990907742, -0.47596585285),
-                  (-0.606100429147, -0.473149219014),
-                  (-0.606209178719, -0.470330967971),
-                  (-0.606317158784, -0.467511112498),
-                  (-0.606424371648, -0.464689665288),
-                  (-0.606530819601, -0.461866638953),
-                  (-0.606636504914, -0.459042046027),
-                  (-0.606741429841, -0.456215898967),
-                  (-0.60684559662, -0.453388210155),
-                  (-0.606949007468, -0.4505589919),
-                  (-0.60705166459, -0.44772825644),
-                  (-0.607153570172, -0.444896015942),
-                  (-0.607254726383, -0.442062282509),
-                  (-0.607355135376, -0.439227068173),
-                  (-0.607454799287, -0.436390384907),
-                  (-0.601790254947, -0.436578955919),
-                  (-0.596117110571, -0.436764951291),
-                  (-0.590435491703, -0.436948397783),
-                  (-0.584745522133, -0.43712932146),
-                  (-0.579047323948, -0.437307747709),
-                  (-0.573341017591, -0.43748370126),
-                  (-0.567626721912, -0.437657206203),
-                  (-0.561904554222, -0.43782828601),
-                  (-0.556174630339, -0.43799696355),
-                  (-0.550437064643, -0.438163261107),
-                  (-0.544691970115, -0.438327200398),
-                  (-0.538939458389, -0.43848880259),
-                  (-0.533179639795, -0.438648088315),
-                  (-0.527412623397, -0.438805077686),
-                  (-0.52163851704, -0.438959790312),
-                  (-0.515857427387, -0.439112245313),
-                  (-0.510069459957, -0.439262461335),
-                  (-0.504274719164, -0.439410456562),
-                  (-0.498473308349, -0.439556248731),
-                  (-0.492665329821, -0.439699855145),
-                  (-0.486850884883, -0.439841292683),
-                  (-0.481030073871, -0.439980577817),
-                  (-0.47520299618, -0.440117726618),
-                  (-0.469369750294, -0.440252754771),
-                  (-0.463530433819, -0.440385677587),
-                  (-0.457685143504, -0.440516510007),
-                  (-0.451833975276, -0.440645266621),
-                  (-0.445977024255, -0.440771961672),
-                  (-0.440114384788, -0.440896609065),
-                  (-0.434246150466, -0.441019222379),
-                  (-0.428372414152, -0.441139814876),
-                  (-0.422493267995, -0.441258399505)]},
- 16: {'color': 'skyblue',
-      'polygon': [(0.593007078944, -0.340941066894),
-                  (0.592937809829, -0.343823124456),
-                  (0.592867875976, -0.346704087249),
-                  (0.592797275902, -0.34958394431),
-                  (0.59272600811, -0.352462684639),
-                  (0.592654071094, -0.355340297206),
-                  (0.592581463335, -0.358216770949),
-                  (0.592508183306, -0.361092094775),
-                  (0.592434229468, -0.363966257557),
-                  (0.59235960027, -0.366839248138),
-                  (0.592284294152, -0.36971105533),
-                  (0.592208309545, -0.372581667913),
-                  (0.592131644869, -0.375451074638),
-                  (0.592054298532, -0.378319264224),
-                  (0.591976268936, -0.38118622536),
-                  (0.591897554471, -0.384051946705),
-                  (0.591818153519, -0.386916416891),
-                  (0.591738064452, -0.389779624517),
-                  (0.591657285634, -0.392641558156),
-                  (0.59157581542, -0.395502206351),
-                  (0.591493652156, -0.398361557618),
-                  (0.591410794181, -0.401219600443),
-                  (0.591327239826, -0.404076323287),
-                  (0.591242987413, -0.406931714584),
-                  (0.591158035259, -0.409785762739),
-                  (0.591072381671, -0.412638456133),
-                  (0.590986024951, -0.415489783121),
-                  (0.590898963395, -0.418339732032),
-                  (0.590811195291, -0.421188291172),
-                  (0.590722718923, -0.424035448819),
-                  (0.590633532569, -0.426881193232),
-                  (0.5905436345, -0.429725512643),
-                  (0.590453022985, -0.432568395262),
-                  (0.584770400996, -0.432758857392),
-                  (0.57907933175, -0.432946973213),
-                  (0.57337993127, -0.433132763834),
-                  (0.567672315386, -0.433316249517),
-                  (0.561956599676, -0.433497449723),
-                  (0.556232899416, -0.433676383146),
-                  (0.550501329528, -0.433853067754),
-                  (0.544762004533, -0.434027520823),
-                  (0.539015038505, -0.434199758976),
-                  (0.533260545033, -0.434369798211),
-                  (0.527498637177, -0.434537653938),
-                  (0.521729427434, -0.434703341005),
-                  (0.515953027701, -0.434866873734),
-                  (0.510169549246, -0.435028265942),
-                  (0.504379102675, -0.435187530973),
-                  (0.498581797906, -0.43534468172),
-                  (0.492777744142, -0.435499730654),
-                  (0.486967049848, -0.435652689845),
-                  (0.481149822733, -0.435803570982),
-                  (0.475326169723, -0.435952385398),
-                  (0.469496196951, -0.43609914409),
-                  (0.463660009734, -0.436243857735),
-                  (0.457817712567, -0.436386536712),
-                  (0.451969409104, -0.436527191118),
-                  (0.446115202149, -0.436665830783),
-                  (0.440255193648, -0.436802465287),
-                  (0.434389484681, -0.436937103974),
-                  (0.428518175457, -0.437069755967),
-                  (0.422641365305, -0.437200430181),
-                  (0.416759152677, -0.437329135332),
-                  (0.41087163514, -0.437455879952),
-                  (0.404978909381, -0.437580672401),
-                  (0.405034631504, -0.434699864009),
-                  (0.405089909097, -0.431817730939),
-                  (0.405144743597, -0.428934284269),
-                  (0.405199136426, -0.426049535039),
-                  (0.405253088983, -0.423163494255),
-                  (0.405306602653, -0.420276172884),
-                  (0.405359678801, -0.417387581857),
-                  (0.405412318774, -0.414497732067),
-                  (0.405464523903, -0.411606634371),
-                  (0.4055162955, -0.408714299592),
-                  (0.405567634857, -0.405820738512),
-                  (0.405618543252, -0.402925961879),
-                  (0.405669021941, -0.400029980403),
-                  (0.405719072167, -0.39713280476),
-                  (0.405768695152, -0.394234445587),
-                  (0.405817892101, -0.391334913485),
-                  (0.405866664202, -0.388434219019),
-                  (0.405915012626, -0.385532372718),
-                  (0.405962938525, -0.382629385076),
-                  (0.406010443035, -0.379725266548),
-                  (0.406057527275, -0.376820027554),
-                  (0.406104192347, -0.37391367848),
-                  (0.406150439335, -0.371006229674),
-                  (0.406196269306, -0.368097691447),
-                  (0.406241683312, -0.365188074078),
-                  (0.406286682387, -0.362277387808),
-                  (0.406331267548, -0.359365642842),
-                  (0.406375439798, -0.356452849352),
-                  (0.406419200121, -0.353539017471),
-                  (0.406462549486, -0.3506241573),
-                  (0.406505488846, -0.347708278904),
-                  (0.406548019138, -0.344791392313),
-                  (0.412468065335, -0.344694990135),
-                  (0.418383084616, -0.34459711006),
-                  (0.424292985386, -0.344497746663),
-                  (0.43019767512, -0.344396894434),
-                  (0.436097060352, -0.344294547777),
-                  (0.441991046663, -0.344190700991),
-                  (0.447879538677, -0.344085348266),
-                  (0.453762440045, -0.343978483671),
-                  (0.459639653447, -0.343870101137),
-                  (0.465511080576, -0.343760194454),
-                  (0.471376622142, -0.343648757245),
-                  (0.477236177858, -0.343535782963),
-                  (0.483089646447, -0.343421264866),
-                  (0.488936925631, -0.343305196007),
-                  (0.494777912136, -0.343187569214),
-                  (0.50061250169, -0.343068377068),
-                  (0.506440589023, -0.342947611892),
-                  (0.512262067876, -0.342825265719),
-                  (0.518076830998, -0.34270133028),
-                  (0.523884770157, -0.342575796975),
-                  (0.529685776146, -0.34244865685),
-                  (0.535479738792, -0.342319900572),
-                  (0.541266546965, -0.342189518401),
-                  (0.547046088593, -0.342057500165),
-                  (0.552818250675, -0.341923835225),
-                  (0.558582919297, -0.341788512448),
-                  (0.564339979648, -0.341651520175),
-                  (0.570089316042, -0.341512846181),
-                  (0.575830811938, -0.34137247765),
-                  (0.581564349967, -0.341230401128),
-                  (0.587289811953, -0.341086602488),
-                  (0.593007078944, -0.340941066894)]},
- 17: {'color': 'skyblue',
-      'polygon': [(0.392711729894, -0.344952399105),
-                  (0.392670479948, -0.347871244826),
-                  (0.392628837633, -0.350789087332),
-                  (0.392586802066, -0.353705916651),
-                  (0.392544372349, -0.356621722778),
-                  (0.392501547564, -0.359536495674),
-                  (0.392458326782, -0.362450225261),
-                  (0.392414709054, -0.36536290143),
-                  (0.392370693416, -0.368274514033),
-                  (0.39232627889, -0.371185052889),
-                  (0.392281464478, -0.37409450778),
-                  (0.392236249167, -0.377002868453),
-                  (0.392190631926, -0.379910124619),
-                  (0.39214461171, -0.382816265952),
-                  (0.392098187454, -0.385721282091),
-                  (0.392051358078, -0.388625162638),
-                  (0.392004122483, -0.39152789716),
-                  (0.391956479554, -0.394429475185),
-                  (0.391908428158, -0.397329886208),
-                  (0.391859967145, -0.400229119685),
-                  (0.391811095348, -0.403127165036),
-                  (0.391761811581, -0.406024011644),
-                  (0.39171211464, -0.408919648855),
-                  (0.391662003306, -0.411814065979),
-                  (0.391611476339, -0.414707252289),
-                  (0.391560532482, -0.417599197019),
-                  (0.391509170462, -0.420489889369),
-                  (0.391457388986, -0.423379318499),
-                  (0.391405186743, -0.426267473533),
-                  (0.391352562404, -0.429154343558),
-                  (0.391299514624, -0.432039917623),
-                  (0.391246042036, -0.434924184741),
-                  (0.391192143259, -0.437807133886),
-                  (0.385282725643, -0.437924576399),
-                  (0.379368508431, -0.438040100979),
-                  (0.373449583637, -0.43815371522),
-                  (0.367526042409, -0.438265426596),
-                  (0.361597975043, -0.438375242466),
-                  (0.35566547099, -0.438483170081),
-                  (0.349728618861, -0.438589216586),
-                  (0.343787506442, -0.438693389029),
-                  (0.3378422207, -0.438795694361),
-                  (0.331892847795, -0.438896139443),
-                  (0.325939473095, -0.438994731048),
-                  (0.319982181184, -0.439091475866),
-                  (0.314021055877, -0.439186380501),
-                  (0.308056180235, -0.439279451481),
-                  (0.302087636576, -0.439370695254),
-                  (0.296115506493, -0.439460118192),
-                  (0.290139870865, -0.439547726593),
-                  (0.284160809875, -0.439633526679),
-                  (0.278178403029, -0.439717524599),
-                  (0.272192729163, -0.439799726431),
-                  (0.26620386647, -0.439880138176),
-                  (0.26021189251, -0.439958765767),
-                  (0.25421688423, -0.440035615059),
-                  (0.248218917979, -0.440110691836),
-                  (0.242218069528, -0.440184001806),
-                  (0.236214414087, -0.440255550604),
-                  (0.230208026323, -0.440325343785),
-                  (0.224198980377, -0.44039338683),
-                  (0.218187349881, -0.440459685138),
-                  (0.212173207981, -0.440524244029),
-                  (0.206156627352, -0.44058706874),
-                  (0.200137680213, -0.440648164427),
-                  (0.200163194259, -0.437744342085),
-                  (0.20018850586, -0.434839266654),
-                  (0.200213615671, -0.431932948516),
-                  (0.200238524332, -0.429025398012),
-                  (0.200263232472, -0.426116625439),
-                  (0.200287740704, -0.423206641055),
-                  (0.200312049629, -0.420295455077),
-                  (0.200336159835, -0.417383077681),
-                  (0.200360071894, -0.414469519002),
-                  (0.200383786368, -0.411554789139),
-                  (0.200407303805, -0.408638898149),
-                  (0.200430624739, -0.40572185605),
-                  (0.200453749693, -0.402803672823),
-                  (0.200476679175, -0.399884358411),
-                  (0.200499413681, -0.396963922718),
-                  (0.200521953696, -0.394042375612),
-                  (0.200544299692, -0.391119726924),
-                  (0.200566452126, -0.388195986447),
-                  (0.200588411446, -0.385271163939),
-                  (0.200610178088, -0.382345269122),
-                  (0.200631752474, -0.379418311682),
-                  (0.200653135016, -0.376490301271),
-                  (0.200674326112, -0.373561247504),
-                  (0.200695326152, -0.370631159962),
-                  (0.200716135511, -0.367700048195),
-                  (0.200736754557, -0.364767921713),
-                  (0.200757183642, -0.361834789998),
-                  (0.200777423111, -0.358900662496),
-                  (0.200797473296, -0.355965548621),
-                  (0.20081733452, -0.353029457752),
-                  (0.200837007094, -0.35009239924),
-                  (0.200856491321, -0.3471543824),
-                  (0.206899404897, -0.34710663319),
-                  (0.212939984631, -0.347057570293),
-                  (0.218978161084, -0.347007189472),
-                  (0.225013864477, -0.346955486439),
-                  (0.231047024669, -0.346902456854),
-                  (0.237077571145, -0.346848096329),
-                  (0.243105432993, -0.346792400433),
-                  (0.249130538886, -0.346735364693),
-                  (0.255152817067, -0.346676984595),
-                  (0.261172195325, -0.346617255591),
-                  (0.267188600979, -0.3465561731),
-                  (0.273201960861, -0.346493732506),
-                  (0.279212201292, -0.346429929167),
-                  (0.285219248068, -0.346364758413),
-                  (0.291223026436, -0.346298215547),
-                  (0.297223461081, -0.346230295851),
-                  (0.303220476103, -0.346160994583),
-                  (0.309213994996, -0.346090306979),
-                  (0.315203940636, -0.346018228256),
-                  (0.321190235257, -0.34594475361),
-                  (0.327172800431, -0.34586987822),
-                  (0.333151557056, -0.345793597242),
-                  (0.339126425333, -0.345715905814),
-                  (0.345097324747, -0.345636799055),
-                  (0.351064174053, -0.345556272059),
-                  (0.357026891257, -0.3454743199),
-                  (0.362985393596, -0.345390937624),
-                  (0.368939597524, -0.345306120253),
-                  (0.374889418698, -0.345219862778),
-                  (0.380834771955, -0.345132160154),
-                  (0.3867755713, -0.345043007304),
-                  (0.392711729894, -0.344952399105)]},
- 18: {'color': 'skyblue',
-      'polygon': [(0.186967835495, -0.347259867588),
-                  (0.186949838743, -0.350198757282),
-                  (0.186931667065, -0.353136690593),
-                  (0.18691332019, -0.356073658238),
-                  (0.186894797836, -0.359009650907),
-                  (0.186876099711, -0.361944659255),
-                  (0.186857225513, -0.364878673905),
-                  (0.186838174929, -0.367811685449),
-                  (0.186818947638, -0.370743684445),
-                  (0.186799543305, -0.373674661417),
-                  (0.186779961588, -0.376604606855),
-                  (0.186760202131, -0.379533511218),
-                  (0.186740264569, -0.382461364927),
-                  (0.186720148525, -0.385388158371),
-                  (0.186699853611, -0.388313881902),
-                  (0.186679379427, -0.391238525837),
-                  (0.186658725564, -0.394162080459),
-                  (0.186637891598, -0.397084536013),
-                  (0.186616877095, -0.400005882708),
-                  (0.186595681609, -0.402926110717),
-                  (0.186574304682, -0.405845210175),
-                  (0.186552745845, -0.40876317118),
-                  (0.186531004614, -0.411679983791),
-                  (0.186509080495, -0.41459563803),
-                  (0.186486972981, -0.41751012388),
-                  (0.186464681552, -0.420423431283),
-                  (0.186442205676, -0.423335550145),
-                  (0.18641954481, -0.426246470329),
-                  (0.186396698394, -0.429156181659),
-                  (0.186373665858, -0.432064673918),
-                  (0.18635044662, -0.434971936848),
-                  (0.186327040083, -0.437877960149),
-                  (0.186303445638, -0.44078273348),
-                  (0.180277202834, -0.440838131643),
-                  (0.174248899127, -0.440891821917),
-                  (0.168218604646, -0.44094380898),
-                  (0.162186389182, -0.440994097414),
-                  (0.156152322208, -0.441042691703),
-                  (0.150116472894, -0.441089596228),
-                  (0.144078910125, -0.44113481527),
-                  (0.138039702521, -0.441178353002),
-                  (0.131998918453, -0.44122021349),
-                  (0.125956626057, -0.441260400691),
-                  (0.119912893258, -0.441298918448),
-                  (0.113867787779, -0.44133577049),
-                  (0.107821377165, -0.441370960429),
-                  (0.101773728794, -0.441404491759),
-                  (0.0957249098948, -0.44143636785),
-                  (0.089674987564, -0.441466591951),
-                  (0.0836240287805, -0.441495167184),
-                  (0.0775721004212, -0.441522096544),
-                  (0.0715192692759, -0.441547382893),
-                  (0.0654656020628, -0.441571028964),
-                  (0.0594111654425, -0.441593037354),
-                  (0.0533560260324, -0.441613410527),
-                  (0.0473002504207, -0.441632150804),
-                  (0.0412439051805, -0.44164926037),
-                  (0.0351870568824, -0.441664741267),
-                  (0.0291297721083, -0.441678595394),
-                  (0.023072117464, -0.441690824505),
-                  (0.0170141595914, -0.441701430206),
-                  (0.010955965181, -0.441710413957),
-                  (0.00489760098378, -0.441717777066),
-                  (-0.00116086617768, -0.441723520692),
-                  (-0.00721936939749, -0.441727645839),
-                  (-0.00722245151704, -0.438816879446),
-                  (-0.00722552986684, -0.435904885838),
-                  (-0.00722860434558, -0.432991674937),
-                  (-0.00723167485492, -0.430077256622),
-                  (-0.00723474129973, -0.427161640732),
-                  (-0.00723780358797, -0.424244837065),
-                  (-0.00724086163081, -0.421326855377),
-                  (-0.00724391534266, -0.418407705388),
-                  (-0.0072469646411, -0.415487396777),
-                  (-0.00725000944706, -0.412565939185),
-                  (-0.00725304968464, -0.409643342216),
-                  (-0.00725608528126, -0.406719615438),
-                  (-0.00725911616757, -0.403794768381),
-                  (-0.0072621422776, -0.400868810541),
-                  (-0.00726516354854, -0.397941751377),
-                  (-0.00726817992094, -0.395013600315),
-                  (-0.0072711913385, -0.392084366748),
-                  (-0.0072741977483, -0.389154060032),
-                  (-0.00727719910054, -0.386222689493),
-                  (-0.0072801953487, -0.383290264423),
-                  (-0.00728318644937, -0.380356794084),
-                  (-0.0072861723624, -0.377422287705),
-                  (-0.00728915305066, -0.374486754484),
-                  (-0.00729212848023, -0.371550203589),
-                  (-0.00729509862018, -0.368612644158),
-                  (-0.00729806344262, -0.365674085299),
-                  (-0.00730102292269, -0.362734536091),
-                  (-0.00730397703848, -0.359794005585),
-                  (-0.00730692577093, -0.356852502802),
-                  (-0.00730986910395, -0.353910036738),
-                  (-0.00731280702414, -0.350966616359),
-                  (-0.00731573952098, -0.348022250605),
-                  (-0.00123341565754, -0.348017636929),
-                  (0.00484886377185, -0.348011799472),
-                  (0.010931032104, -0.348004737641),
-                  (0.0170130227783, -0.3479964507),
-                  (0.0230947693296, -0.347986937771),
-                  (0.0291762053802, -0.347976197837),
-                  (0.0352572646322, -0.347964229741),
-                  (0.0413378808587, -0.347951032188),
-                  (0.0474179878954, -0.347936603748),
-                  (0.0534975196312, -0.347920942856),
-                  (0.0595764099992, -0.347904047815),
-                  (0.0656545929668, -0.347885916796),
-                  (0.0717320025255, -0.347866547844),
-                  (0.0778085726805, -0.347845938875),
-                  (0.0838842374401, -0.34782408768),
-                  (0.0899589308042, -0.347800991931),
-                  (0.0960325867531, -0.347776649178),
-                  (0.102105139236, -0.347751056855),
-                  (0.108176522157, -0.347724212281),
-                  (0.114246669366, -0.347696112664),
-                  (0.120315514642, -0.347666755102),
-                  (0.126382991682, -0.347636136587),
-                  (0.132449034089, -0.347604254008),
-                  (0.138513575352, -0.347571104155),
-                  (0.14457654884, -0.34753668372),
-                  (0.150637887782, -0.347500989301),
-                  (0.156697525253, -0.347464017405),
-                  (0.162755394159, -0.347425764452),
-                  (0.168811427223, -0.347386226778),
-                  (0.174865556969, -0.347345400637),
-                  (0.180917715701, -0.347303282206),
-                  (0.186967835495, -0.347259867588)]},
- 19: {'color': 'violet',
-      'polygon': [(-0.0108591423896, -0.348025472615),
-                  (-0.0108573026878, -0.350969824277),
-                  (-0.0108554539957, -0.353913230483),
-                  (-0.0108535963167, -0.356855682299),
-                  (-0.0108517296567, -0.359797170758),
-                  (-0.0108498540243, -0.362737686872),
-                  (-0.0108479694307, -0.36567722162),
-                  (-0.0108460758903, -0.368615765956),
-                  (-0.0108441734197, -0.371553310804),
-                  (-0.010842262039, -0.374489847059),
-                  (-0.0108403417706, -0.377425365588),
-                  (-0.0108384126403, -0.380359857226),
-                  (-0.0108364746764, -0.383293312778),
-                  (-0.0108345279106, -0.38622572302),
-                  (-0.0108325723774, -0.389157078694),
-                  (-0.0108306081141, -0.392087370512),
-                  (-0.0108286351616, -0.395016589153),
-                  (-0.0108266535634, -0.397944725263),
-                  (-0.0108246633661, -0.400871769455),
-                  (-0.0108226646198, -0.403797712306),
-                  (-0.0108206573771, -0.406722544363),
-                  (-0.0108186416942, -0.409646256133),
-                  (-0.0108166176301, -0.412568838091),
-                  (-0.0108145852471, -0.415490280674),
-                  (-0.0108125446104, -0.418410574283),
-                  (-0.0108104957884, -0.42132970928),
-                  (-0.0108084388526, -0.424247675991),
-                  (-0.0108063738772, -0.427164464702),
-                  (-0.01080430094, -0.430080065661),
-                  (-0.0108022201213, -0.432994469074),
-                  (-0.0108001315045, -0.435907665109),
-                  (-0.010798035176, -0.43881964389),
-                  (-0.0107959312249, -0.4417303955),
-                  (-0.016854357149, -0.441729011135),
-                  (-0.0229126470487, -0.441726010269),
-                  (-0.0289707336327, -0.441721393388),
-                  (-0.0350285494792, -0.44171516082),
-                  (-0.0410860270262, -0.441707312735),
-                  (-0.0471430985622, -0.441697849143),
-                  (-0.0531996962173, -0.441686769892),
-                  (-0.0592557519545, -0.441674074669),
-                  (-0.0653111975615, -0.441659763),
-                  (-0.0713659646424, -0.441643834245),
-                  (-0.0774199846099, -0.441626287603),
-                  (-0.0834731886779, -0.441607122106),
-                  (-0.0895255078538, -0.441586336624),
-                  (-0.0955768729321, -0.441563929858),
-                  (-0.101627214487, -0.441539900346),
-                  (-0.107676462865, -0.441514246458),
-                  (-0.113724548181, -0.441486966398),
-                  (-0.11977140031, -0.441458058201),
-                  (-0.125816948882, -0.441427519736),
-                  (-0.131861123274, -0.441395348704),
-                  (-0.13790385261, -0.441361542637),
-                  (-0.143945065748, -0.441326098897),
-                  (-0.14998469128, -0.44128901468),
-                  (-0.156022657527, -0.441250287011),
-                  (-0.162058892531, -0.441209912746),
-                  (-0.168093324052, -0.44116788857),
-                  (-0.17412587956, -0.441124210999),
-                  (-0.180156486238, -0.441078876378),
-                  (-0.186185070968, -0.441031880881),
-                  (-0.192211560333, -0.440983220511),
-                  (-0.198235880609, -0.4409328911),
-                  (-0.204257957762, -0.440880888307),
-                  (-0.204287010089, -0.437977541208),
-                  (-0.204315862442, -0.435072951109),
-                  (-0.204344515195, -0.432167127876),
-                  (-0.204372968716, -0.429260081333),
-                  (-0.204401223366, -0.426351821266),
-                  (-0.204429279499, -0.423442357417),
-                  (-0.204457137462, -0.42053169949),
-                  (-0.204484797594, -0.417619857152),
-                  (-0.20451226023, -0.41470684003),
-                  (-0.204539525696, -0.411792657715),
-                  (-0.204566594315, -0.408877319763),
-                  (-0.2045934664, -0.405960835693),
-                  (-0.20462014226, -0.403043214991),
-                  (-0.204646622199, -0.400124467108),
-                  (-0.204672906515, -0.397204601464),
-                  (-0.204698995498, -0.394283627444),
-                  (-0.204724889436, -0.391361554402),
-                  (-0.204750588609, -0.388438391662),
-                  (-0.204776093293, -0.385514148518),
-                  (-0.20480140376, -0.382588834232),
-                  (-0.204826520275, -0.379662458038),
-                  (-0.204851443098, -0.376735029142),
-                  (-0.204876172486, -0.373806556722),
-                  (-0.204900708691, -0.370877049927),
-                  (-0.204925051959, -0.367946517881),
-                  (-0.204949202532, -0.365014969681),
-                  (-0.204973160648, -0.362082414398),
-                  (-0.204996926542, -0.359148861077),
-                  (-0.205020500441, -0.35621431874),
-                  (-0.205043882572, -0.353278796384),
-                  (-0.205067073155, -0.35034230298),
-                  (-0.205090072408, -0.347404847478),
-                  (-0.199043678644, -0.347443648725),
-                  (-0.192995070496, -0.347481168145),
-                  (-0.18694432047, -0.347517409669),
-                  (-0.180891500847, -0.347552377106),
-                  (-0.174836683684, -0.347586074135),
-                  (-0.168779940816, -0.347618504313),
-                  (-0.16272134386, -0.347649671066),
-                  (-0.156660964217, -0.347679577691),
-                  (-0.150598873074, -0.347708227355),
-                  (-0.144535141408, -0.347735623091),
-                  (-0.138469839986, -0.347761767798),
-                  (-0.132403039366, -0.347786664242),
-                  (-0.126334809905, -0.347810315051),
-                  (-0.120265221758, -0.347832722715),
-                  (-0.114194344878, -0.347853889585),
-                  (-0.108122249024, -0.347873817874),
-                  (-0.10204900376, -0.347892509653),
-                  (-0.0959746784593, -0.347909966849),
-                  (-0.0898993423058, -0.347926191249),
-                  (-0.0838230642995, -0.347941184495),
-                  (-0.0777459132577, -0.347954948085),
-                  (-0.0716679578196, -0.347967483371),
-                  (-0.0655892664495, -0.347978791561),
-                  (-0.0595099074401, -0.347988873716),
-                  (-0.0534299489173, -0.34799773075),
-                  (-0.0473494588441, -0.348005363432),
-                  (-0.0412685050244, -0.348011772381),
-                  (-0.0351871551089, -0.348016958073),
-                  (-0.0291054765987, -0.348020920835),
-                  (-0.0230235368514, -0.348023660848),
-                  (-0.0169414030862, -0.348025178145),
-                  (-0.0108591423896, -0.348025472615)]},
- 20: {'color': 'violet',
-      'polygon': [(-0.219111995218, -0.347278120449),
-                  (-0.219086740735, -0.350214623175),
-                  (-0.219061281309, -0.353150161805),
-                  (-0.219035616701, -0.356084727371),
-                  (-0.219009746666, -0.359018310887),
-                  (-0.218983670957, -0.361950903341),
-                  (-0.21895738932, -0.364882495695),
-                  (-0.218930901498, -0.36781307889),
-                  (-0.218904207227, -0.370742643839),
-                  (-0.218877306242, -0.373671181431),
-                  (-0.218850198268, -0.376598682528),
-                  (-0.218822883029, -0.379525137964),
-                  (-0.218795360242, -0.382450538549),
-                  (-0.218767629618, -0.385374875062),
-                  (-0.218739690863, -0.388298138255),
-                  (-0.21871154368, -0.391220318851),
-                  (-0.218683187762, -0.394141407543),
-                  (-0.2186546228, -0.397061394992),
-                  (-0.218625848477, -0.399980271832),
-                  (-0.218596864471, -0.402898028662),
-                  (-0.218567670452, -0.40581465605),
-                  (-0.218538266087, -0.408730144531),
-                  (-0.218508651033, -0.411644484605),
-                  (-0.218478824943, -0.41455766674),
-                  (-0.218448787463, -0.417469681366),
-                  (-0.21841853823, -0.420380518879),
-                  (-0.218388076877, -0.423290169637),
-                  (-0.218357403027, -0.426198623961),
-                  (-0.218326516299, -0.429105872133),
-                  (-0.2182954163, -0.432011904396),
-                  (-0.218264102634, -0.434916710953),
-                  (-0.218232574895, -0.437820281966),
-                  (-0.218200832667, -0.440722607553),
-                  (-0.224214929494, -0.44066644174),
-                  (-0.230226459116, -0.440608581483),
-                  (-0.23623534577, -0.440549021498),
-                  (-0.242241513356, -0.440487756325),
-                  (-0.248244885427, -0.440424780325),
-                  (-0.254245385188, -0.440360087682),
-                  (-0.260242935489, -0.440293672401),
-                  (-0.26623745882, -0.440225528304),
-                  (-0.272228877306, -0.440155649035),
-                  (-0.2782171127, -0.44008402805),
-                  (-0.28420208638, -0.440010658625),
-                  (-0.290183719339, -0.439935533846),
-                  (-0.296161932183, -0.439858646611),
-                  (-0.302136645119, -0.439779989628),
-                  (-0.308107777953, -0.439699555414),
-                  (-0.314075250081, -0.439617336287),
-                  (-0.320038980479, -0.439533324373),
-                  (-0.325998887698, -0.439447511593),
-                  (-0.331954889855, -0.439359889667),
-                  (-0.337906904623, -0.439270450112),
-                  (-0.343854849222, -0.439179184231),
-                  (-0.349798640411, -0.439086083118),
-                  (-0.355738194476, -0.43899113765),
-                  (-0.361673427218, -0.438894338483),
-                  (-0.367604253946, -0.43879567605),
-                  (-0.373530589459, -0.438695140555),
-                  (-0.379452348042, -0.438592721969),
-                  (-0.385369443442, -0.438488410027),
-                  (-0.391281788865, -0.438382194217),
-                  (-0.397189296955, -0.438274063784),
-                  (-0.403091879782, -0.438164007715),
-                  (-0.408989448822, -0.438052014738),
-                  (-0.409049955655, -0.435171348654),
-                  (-0.409110023756, -0.432289377659),
-                  (-0.409169654276, -0.429406112147),
-                  (-0.409228848351, -0.426521562468),
-                  (-0.409287607101, -0.423635738923),
-                  (-0.40934593163, -0.420748651774),
-                  (-0.409403823029, -0.417860311237),
-                  (-0.409461282372, -0.414970727489),
-                  (-0.409518310721, -0.412079910667),
-                  (-0.409574909122, -0.409187870865),
-                  (-0.409631078606, -0.406294618143),
-                  (-0.409686820193, -0.403400162522),
-                  (-0.409742134888, -0.400504513985),
-                  (-0.409797023681, -0.397607682481),
-                  (-0.40985148755, -0.394709677923),
-                  (-0.409905527462, -0.391810510192),
-                  (-0.409959144366, -0.388910189134),
-                  (-0.410012339203, -0.386008724564),
-                  (-0.4100651129, -0.383106126264),
-                  (-0.41011746637, -0.380202403986),
-                  (-0.410169400516, -0.377297567452),
-                  (-0.410220916227, -0.374391626355),
-                  (-0.410272014382, -0.371484590358),
-                  (-0.410322695847, -0.368576469097),
-                  (-0.410372961477, -0.36566727218),
-                  (-0.410422812114, -0.362757009189),
-                  (-0.410472248591, -0.35984568968),
-                  (-0.410521271729, -0.356933323181),
-                  (-0.410569882337, -0.354019919197),
-                  (-0.410618081214, -0.351105487209),
-                  (-0.410665869148, -0.348190036673),
-                  (-0.410713246916, -0.345273577021),
-                  (-0.40478878245, -0.34535816698),
-                  (-0.398859440935, -0.345441271237),
-                  (-0.392925306349, -0.345522897617),
-                  (-0.386986462139, -0.345603053813),
-                  (-0.381042991243, -0.34568174739),
-                  (-0.375094976106, -0.34575898579),
-                  (-0.369142498699, -0.345834776337),
-                  (-0.363185640535, -0.345909126232),
-                  (-0.357224482683, -0.345982042563),
-                  (-0.351259105786, -0.346053532303),
-                  (-0.345289590075, -0.346123602313),
-                  (-0.339316015379, -0.346192259344),
-                  (-0.333338461142, -0.346259510036),
-                  (-0.327357006433, -0.346325360922),
-                  (-0.321371729959, -0.346389818427),
-                  (-0.315382710071, -0.346452888871),
-                  (-0.309390024781, -0.346514578467),
-                  (-0.303393751768, -0.346574893321),
-                  (-0.297393968387, -0.346633839434),
-                  (-0.291390751676, -0.346691422704),
-                  (-0.28538417837, -0.34674764892),
-                  (-0.279374324901, -0.346802523767),
-                  (-0.27336126741, -0.346856052822),
-                  (-0.267345081751, -0.346908241556),
-                  (-0.2613258435, -0.346959095333),
-                  (-0.255303627957, -0.347008619407),
-                  (-0.249278510155, -0.347056818923),
-                  (-0.243250564864, -0.347103698917),
-                  (-0.237219866593, -0.347149264312),
-                  (-0.231186489599, -0.34719351992),
-                  (-0.225150507887, -0.347236470438),
-                  (-0.219111995218, -0.347278120449)]},
- 21: {'bad_channels': [1,2,3,4],
-      'color': 'red',
-      'polygon': [(-0.424224797789, -0.345261597575),
-                  (-0.424178892629, -0.348176009409),
-                  (-0.424132560324, -0.351089406194),
-                  (-0.424085800032, -0.35400177844),
-                  (-0.424038610898, -0.356913116633),
-                  (-0.423990992057, -0.359823411235),
-                  (-0.423942942635, -0.362732652685),
-                  (-0.423894461743, -0.365640831394),
-                  (-0.423845548482, -0.368547937749),
-                  (-0.423796201941, -0.371453962109),
-                  (-0.423746421197, -0.374358894807),
-                  (-0.423696205316, -0.377262726148),
-                  (-0.423645553351, -0.380165446409),
-                  (-0.423594464341, -0.383067045837),
-                  (-0.423542937316, -0.385967514649),
-                  (-0.42349097129, -0.388866843034),
-                  (-0.423438565267, -0.391765021146),
-                  (-0.423385718235, -0.394662039112),
-                  (-0.423332429171, -0.39755788702),
-                  (-0.423278697039, -0.400452554931),
-                  (-0.423224520787, -0.403346032866),
-                  (-0.423169899351, -0.406238310815),
-                  (-0.423114831654, -0.409129378729),
-                  (-0.423059316602, -0.412019226524),
-                  (-0.42300335309, -0.414907844077),
-                  (-0.422946939996, -0.417795221227),
-                  (-0.422890076184, -0.420681347771),
-                  (-0.422832760504, -0.423566213469),
-                  (-0.42277499179, -0.426449808034),
-                  (-0.422716768861, -0.429332121141),
-                  (-0.422658090519, -0.432213142418),
-                  (-0.422598955552, -0.435092861449),
-                  (-0.422539362732, -0.43797126777),
-                  (-0.428419819097, -0.437846300374),
-                  (-0.434294877787, -0.437719347771),
-                  (-0.440164446882, -0.437590397296),
-                  (-0.446028433758, -0.437459435983),
-                  (-0.451886745058, -0.437326450552),
-                  (-0.457739286677, -0.437191427405),
-                  (-0.463585963733, -0.437054352615),
-                  (-0.469426680545, -0.436915211917),
-                  (-0.475261340607, -0.436773990699),
-                  (-0.481089846559, -0.436630673991),
-                  (-0.486912100163, -0.436485246456),
-                  (-0.492728002272, -0.436337692379),
-                  (-0.498537452799, -0.436187995653),
-                  (-0.504340350686, -0.436036139772),
-                  (-0.510136593875, -0.435882107818),
-                  (-0.515926079269, -0.435725882443),
-                  (-0.521708702701, -0.435567445866),
-                  (-0.527484358898, -0.435406779851),
-                  (-0.53325294144, -0.435243865697),
-                  (-0.539014342724, -0.435078684226),
-                  (-0.544768453924, -0.434911215764),
-                  (-0.550515164948, -0.434741440129),
-                  (-0.556254364396, -0.434569336613),
-                  (-0.561985939513, -0.434394883969),
-                  (-0.567709776149, -0.434218060394),
-                  (-0.573425758704, -0.434038843509),
-                  (-0.579133770086, -0.433857210346),
-                  (-0.584833691654, -0.433673137325),
-                  (-0.590525403172, -0.433486600241),
-                  (-0.59620878275, -0.433297574241),
-                  (-0.601883706791, -0.433106033808),
-                  (-0.607550049935, -0.432911952735),
-                  (-0.607644521253, -0.430072154307),
-                  (-0.607738252793, -0.427230923274),
-                  (-0.607831246643, -0.424388271359),
-                  (-0.607923504875, -0.421544210231),
-                  (-0.608015029543, -0.418698751503),
-                  (-0.608105822688, -0.415851906732),
-                  (-0.608195886334, -0.413003687427),
-                  (-0.608285222491, -0.410154105041),
-                  (-0.608373833152, -0.407303170981),
-                  (-0.608461720297, -0.404450896603),
-                  (-0.608548885888, -0.401597293215),
-                  (-0.608635331875, -0.398742372081),
-                  (-0.608721060192, -0.395886144419),
-                  (-0.608806072757, -0.3930286214),
-                  (-0.608890371474, -0.390169814157),
-                  (-0.608973958233, -0.387309733776),
-                  (-0.609056834908, -0.384448391305),
-                  (-0.609139003359, -0.381585797751),
-                  (-0.609220465433, -0.378721964082),
-                  (-0.609301222959, -0.375856901227),
-                  (-0.609381277755, -0.372990620079),
-                  (-0.609460631622, -0.370123131493),
-                  (-0.609539286349, -0.367254446289),
-                  (-0.609617243709, -0.364384575253),
-                  (-0.609694505462, -0.361513529135),
-                  (-0.609771073351, -0.358641318653),
-                  (-0.609846949109, -0.355767954493),
-                  (-0.609922134452, -0.352893447308),
-                  (-0.609996631082, -0.350017807719),
-                  (-0.610070440689, -0.347141046318),
-                  (-0.610143564946, -0.344263173667),
-                  (-0.610216005513, -0.341384200298),
-                  (-0.604515120282, -0.341532266583),
-                  (-0.598805946421, -0.341678456149),
-                  (-0.593088606097, -0.341822786044),
-                  (-0.587363219543, -0.34196527282),
-                  (-0.581629905123, -0.342105932557),
-                  (-0.575888779401, -0.342244780876),
-                  (-0.570139957201, -0.342381832959),
-                  (-0.56438355167, -0.342517103569),
-                  (-0.558619674336, -0.342650607063),
-                  (-0.552848435168, -0.342782357411),
-                  (-0.547069942632, -0.342912368211),
-                  (-0.541284303744, -0.343040652704),
-                  (-0.535491624122, -0.343167223788),
-                  (-0.529692008041, -0.343292094033),
-                  (-0.52388555848, -0.343415275694),
-                  (-0.518072377169, -0.343536780725),
-                  (-0.512252564639, -0.343656620789),
-                  (-0.506426220263, -0.343774807272),
-                  (-0.5005934423, -0.343891351297),
-                  (-0.494754327941, -0.344006263727),
-                  (-0.488908973344, -0.344119555183),
-                  (-0.483057473677, -0.344231236053),
-                  (-0.477199923155, -0.344341316498),
-                  (-0.471336415074, -0.344449806462),
-                  (-0.465467041848, -0.344556715685),
-                  (-0.459591895043, -0.344662053705),
-                  (-0.45371106541, -0.344765829871),
-                  (-0.447824642914, -0.344868053347),
-                  (-0.441932716766, -0.34496873312),
-                  (-0.43603537545, -0.345067878006),
-                  (-0.430132706752, -0.34516549666),
-                  (-0.424224797789, -0.345261597575)]},
- 22: {'color': 'skyblue',
-      'polygon': [(0.786095045233, -0.240437992756),
-                  (0.78602059234, -0.24329611233),
-                  (0.785945216109, -0.246153371791),
-                  (0.785868915725, -0.24900975981),
-                  (0.785791690384, -0.251865265026),
-                  (0.785713539281, -0.254719876046),
-                  (0.78563446162, -0.257573581446),
-                  (0.785554456609, -0.260426369768),
-                  (0.785473523464, -0.263278229524),
-                  (0.785391661405, -0.266129149194),
-                  (0.785308869663, -0.268979117227),
-                  (0.785225147472, -0.271828122041),
-                  (0.785140494079, -0.274676152021),
-                  (0.785054908737, -0.277523195523),
-                  (0.784968390708, -0.280369240872),
-                  (0.784880939267, -0.283214276363),
-                  (0.784792553694, -0.286058290258),
-                  (0.784703233286, -0.288901270794),
-                  (0.784612977347, -0.291743206173),
-                  (0.784521785195, -0.294584084572),
-                  (0.78442965616, -0.297423894137),
-                  (0.784336589585, -0.300262622986),
-                  (0.784242584829, -0.303100259208),
-                  (0.784147641262, -0.305936790865),
-                  (0.784051758271, -0.30877220599),
-                  (0.783954935259, -0.31160649259),
-                  (0.783857171645, -0.314439638645),
-                  (0.783758466864, -0.31727163211),
-                  (0.78365882037, -0.320102460913),
-                  (0.783558231634, -0.322932112956),
-                  (0.783456700147, -0.325760576118),
-                  (0.78335422542, -0.328587838252),
-                  (0.783250806983, -0.331413887189),
-                  (0.777887652386, -0.331632470511),
-                  (0.772512134636, -0.331847973658),
-                  (0.767124362698, -0.3320604753),
-                  (0.761724447534, -0.332270050661),
-                  (0.756312501955, -0.332476771645),
-                  (0.75088864048, -0.332680706962),
-                  (0.745452979195, -0.332881922244),
-                  (0.740005635618, -0.33308048017),
-                  (0.734546728572, -0.33327644057),
-                  (0.729076378059, -0.333469860544),
-                  (0.723594705139, -0.333660794568),
-                  (0.718101831816, -0.333849294593),
-                  (0.712597880928, -0.334035410154),
-                  (0.707082976036, -0.334219188461),
-                  (0.701557241325, -0.334400674499),
-                  (0.696020801503, -0.334579911121),
-                  (0.690473781708, -0.334756939133),
-                  (0.684916307416, -0.334931797385),
-                  (0.679348504354, -0.335104522853),
-                  (0.673770498419, -0.335275150721),
-                  (0.668182415595, -0.335443714461),
-                  (0.662584381879, -0.335610245906),
-                  (0.656976523209, -0.335774775329),
-                  (0.651358965393, -0.335937331508),
-                  (0.645731834045, -0.3360979418),
-                  (0.640095254519, -0.336256632206),
-                  (0.634449351856, -0.336413427435),
-                  (0.62879425072, -0.336568350965),
-                  (0.62313007535, -0.336721425106),
-                  (0.617456949505, -0.336872671055),
-                  (0.611774996422, -0.337022108953),
-                  (0.606084338765, -0.337169757938),
-                  (0.606155261106, -0.334288431825),
-                  (0.606225503852, -0.331406038424),
-                  (0.606295068446, -0.32852258864),
-                  (0.606363956323, -0.325638093344),
-                  (0.606432168905, -0.322752563376),
-                  (0.606499707603, -0.319866009539),
-                  (0.606566573818, -0.316978442608),
-                  (0.606632768939, -0.314089873321),
-                  (0.606698294344, -0.311200312383),
-                  (0.6067631514, -0.308309770468),
-                  (0.60682734146, -0.305418258213),
-                  (0.606890865869, -0.302525786226),
-                  (0.606953725957, -0.299632365077),
-                  (0.607015923046, -0.296738005306),
-                  (0.607077458443, -0.293842717418),
-                  (0.607138333444, -0.290946511883),
-                  (0.607198549334, -0.288049399141),
-                  (0.607258107384, -0.285151389595),
-                  (0.607317008856, -0.282252493616),
-                  (0.607375254997, -0.279352721543),
-                  (0.607432847043, -0.27645208368),
-                  (0.607489786218, -0.273550590298),
-                  (0.607546073734, -0.270648251635),
-                  (0.60760171079, -0.267745077894),
-                  (0.607656698573, -0.264841079249),
-                  (0.607711038258, -0.261936265838),
-                  (0.607764731007, -0.259030647767),
-                  (0.607817777969, -0.25612423511),
-                  (0.607870180284, -0.253217037906),
-                  (0.607921939075, -0.250309066165),
-                  (0.607973055455, -0.247400329863),
-                  (0.608023530525, -0.244490838943),
-                  (0.613740350306, -0.244386414685),
-                  (0.619448680967, -0.244280779938),
-                  (0.62514839716, -0.244173921529),
-                  (0.630839372416, -0.244065825384),
-                  (0.636521479165, -0.243956476473),
-                  (0.642194588759, -0.243845858754),
-                  (0.647858571495, -0.243733955112),
-                  (0.653513296635, -0.243620747301),
-                  (0.659158632439, -0.243506215877),
-                  (0.664794446192, -0.243390340135),
-                  (0.670420604235, -0.243273098041),
-                  (0.676036972003, -0.243154466157),
-                  (0.681643414057, -0.243034419574),
-                  (0.687239794128, -0.242912931831),
-                  (0.692825975158, -0.242789974837),
-                  (0.698401819343, -0.242665518795),
-                  (0.703967188184, -0.242539532111),
-                  (0.709521942537, -0.242411981312),
-                  (0.715065942663, -0.242282830955),
-                  (0.720599048293, -0.242152043533),
-                  (0.726121118679, -0.242019579382),
-                  (0.731632012664, -0.24188539658),
-                  (0.737131588744, -0.241749450848),
-                  (0.742619705142, -0.241611695441),
-                  (0.748096219878, -0.241472081044),
-                  (0.753560990849, -0.241330555656),
-                  (0.759013875906, -0.241187064481),
-                  (0.764454732943, -0.241041549803),
-                  (0.769883419982, -0.24089395087),
-                  (0.775299795267, -0.240744203763),
-                  (0.780703717358, -0.24059224127),
-                  (0.786095045233, -0.240437992756)]},
- 23: {'color': 'skyblue',
-      'polygon': [(0.594861072062, -0.244896237632),
-                  (0.594810678448, -0.247808648254),
-                  (0.594759663114, -0.250720309727),
-                  (0.594708024995, -0.253631212187),
-                  (0.594655763012, -0.256541345739),
-                  (0.594602876074, -0.259450700454),
-                  (0.59454936308, -0.262359266373),
-                  (0.594495222912, -0.265267033503),
-                  (0.594440454442, -0.268173991819),
-                  (0.594385056528, -0.271080131264),
-                  (0.594329028016, -0.273985441746),
-                  (0.594272367738, -0.276889913144),
-                  (0.594215074516, -0.2797935353),
-                  (0.594157147157, -0.282696298024),
-                  (0.594098584456, -0.285598191094),
-                  (0.594039385195, -0.288499204255),
-                  (0.593979548144, -0.291399327216),
-                  (0.593919072061, -0.294298549654),
-                  (0.593857955689, -0.297196861213),
-                  (0.593796197761, -0.300094251504),
-                  (0.593733796997, -0.302990710102),
-                  (0.593670752103, -0.305886226552),
-                  (0.593607061774, -0.308780790361),
-                  (0.593542724694, -0.311674391006),
-                  (0.593477739531, -0.314567017929),
-                  (0.593412104944, -0.317458660539),
-                  (0.593345819578, -0.320349308211),
-                  (0.593278882067, -0.323238950286),
-                  (0.593211291033, -0.326127576073),
-                  (0.593143045084, -0.329015174846),
-                  (0.593074142819, -0.331901735847),
-                  (0.593004582823, -0.334787248285),
-                  (0.59293436367, -0.337671701335),
-                  (0.587215932996, -0.337810650567),
-                  (0.58148931591, -0.337947879223),
-                  (0.575754631426, -0.338083402009),
-                  (0.570011997766, -0.338217232921),
-                  (0.564261532328, -0.338349385288),
-                  (0.558503351664, -0.338479871807),
-                  (0.552737571456, -0.338608704583),
-                  (0.546964306498, -0.338735895164),
-                  (0.541183670672, -0.338861454574),
-                  (0.535395776934, -0.338985393345),
-                  (0.529600737299, -0.339107721549),
-                  (0.523798662827, -0.339228448828),
-                  (0.517989663613, -0.339347584422),
-                  (0.512173848772, -0.339465137193),
-                  (0.506351326437, -0.339581115655),
-                  (0.500522203749, -0.339695527997),
-                  (0.49468658685, -0.339808382101),
-                  (0.488844580883, -0.339919685575),
-                  (0.482996289988, -0.340029445761),
-                  (0.477141817299, -0.340137669763),
-                  (0.471281264947, -0.340244364466),
-                  (0.465414734059, -0.340349536546),
-                  (0.459542324762, -0.340453192495),
-                  (0.453664136187, -0.340555338631),
-                  (0.447780266472, -0.340655981115),
-                  (0.44189081277, -0.340755125965),
-                  (0.435995871253, -0.340852779068),
-                  (0.430095537124, -0.34094894619),
-                  (0.424189904622, -0.341043632992),
-                  (0.418279067031, -0.341136845035),
-                  (0.412363116695, -0.341228587792),
-                  (0.406442145023, -0.34131886666),
-                  (0.40648623972, -0.338399745847),
-                  (0.406529929018, -0.335479649364),
-                  (0.406573213778, -0.332558587092),
-                  (0.406616094848, -0.329636568879),
-                  (0.40665857306, -0.326713604538),
-                  (0.406700649231, -0.323789703848),
-                  (0.406742324166, -0.320864876557),
-                  (0.406783598651, -0.317939132376),
-                  (0.406824473461, -0.315012480985),
-                  (0.406864949355, -0.31208493203),
-                  (0.40690502708, -0.309156495123),
-                  (0.406944707367, -0.306227179844),
-                  (0.406983990934, -0.303296995741),
-                  (0.407022878486, -0.30036595233),
-                  (0.407061370713, -0.297434059092),
-                  (0.407099468294, -0.294501325478),
-                  (0.407137171893, -0.291567760908),
-                  (0.407174482162, -0.288633374769),
-                  (0.40721139974, -0.285698176417),
-                  (0.407247925254, -0.282762175176),
-                  (0.407284059317, -0.27982538034),
-                  (0.407319802532, -0.276887801173),
-                  (0.407355155487, -0.273949446906),
-                  (0.407390118761, -0.271010326744),
-                  (0.407424692921, -0.268070449857),
-                  (0.407458878519, -0.265129825388),
-                  (0.407492676099, -0.262188462452),
-                  (0.407526086194, -0.259246370131),
-                  (0.407559109323, -0.256303557481),
-                  (0.407591745996, -0.253360033528),
-                  (0.407623996712, -0.25041580727),
-                  (0.40765586196, -0.247470887677),
-                  (0.413596505395, -0.247406873449),
-                  (0.419532253662, -0.247341830504),
-                  (0.425463019939, -0.247275756073),
-                  (0.431388716476, -0.247208647385),
-                  (0.437309254577, -0.247140501668),
-                  (0.443224544581, -0.247071316134),
-                  (0.449134495845, -0.247001087973),
-                  (0.455039016724, -0.246929814345),
-                  (0.460938014553, -0.246857492364),
-                  (0.466831395632, -0.246784119093),
-                  (0.472719065209, -0.246709691527),
-                  (0.478600927463, -0.246634206581),
-                  (0.484476885491, -0.246557661075),
-                  (0.49034684129, -0.246480051721),
-                  (0.496210695747, -0.246401375103),
-                  (0.502068348624, -0.246321627663),
-                  (0.507919698545, -0.246240805679),
-                  (0.513764642986, -0.246158905247),
-                  (0.519603078264, -0.246075922261),
-                  (0.525434899528, -0.245991852388),
-                  (0.531260000751, -0.245906691046),
-                  (0.537078274717, -0.24582043338),
-                  (0.542889613024, -0.245733074232),
-                  (0.548693906071, -0.245644608118),
-                  (0.554491043057, -0.245555029198),
-                  (0.560280911976, -0.245464331241),
-                  (0.56606339962, -0.2453725076),
-                  (0.571838391571, -0.245279551171),
-                  (0.577605772212, -0.245185454362),
-                  (0.583365424718, -0.245090209058),
-                  (0.589117231073, -0.244993806577),
-                  (0.594861072062, -0.244896237632)]},
- 24: {'color': 'skyblue',
-      'polygon': [(0.393876559802, -0.247696785663),
-                  (0.393845968573, -0.250643482449),
-                  (0.393815006745, -0.253589488458),
-                  (0.393783673873, -0.256534794769),
-                  (0.393751969496, -0.259479392433),
-                  (0.393719893147, -0.262423272473),
-                  (0.393687444346, -0.265366425884),
-                  (0.393654622604, -0.268308843631),
-                  (0.393621427419, -0.271250516653),
-                  (0.393587858281, -0.274191435857),
-                  (0.393553914665, -0.277131592123),
-                  (0.393519596039, -0.280070976298),
-                  (0.393484901854, -0.283009579202),
-                  (0.393449831554, -0.285947391625),
-                  (0.39341438457, -0.288884404324),
-                  (0.393378560318, -0.291820608028),
-                  (0.393342358205, -0.294755993434),
-                  (0.393305777625, -0.297690551207),
-                  (0.393268817958, -0.300624271982),
-                  (0.393231478572, -0.303557146362),
-                  (0.393193758823, -0.306489164919),
-                  (0.393155658052, -0.309420318191),
-                  (0.393117175589, -0.312350596685),
-                  (0.393078310747, -0.315279990877),
-                  (0.39303906283, -0.318208491208),
-                  (0.392999431124, -0.321136088088),
-                  (0.392959414904, -0.324062771892),
-                  (0.392919013429, -0.326988532965),
-                  (0.392878225946, -0.329913361614),
-                  (0.392837051683, -0.332837248118),
-                  (0.39279548986, -0.335760182717),
-                  (0.392753539675, -0.338682155621),
-                  (0.392711200318, -0.341603157004),
-                  (0.386774238398, -0.341688871609),
-                  (0.380832639247, -0.341773144621),
-                  (0.374886489538, -0.341855981131),
-                  (0.368935875099, -0.341937386195),
-                  (0.362980880925, -0.34201736483),
-                  (0.357021591199, -0.342095922025),
-                  (0.351058089303, -0.342173062739),
-                  (0.345090457835, -0.342248791908),
-                  (0.339118778632, -0.342323114442),
-                  (0.333143132781, -0.342396035235),
-                  (0.327163600641, -0.342467559156),
-                  (0.321180261856, -0.342537691059),
-                  (0.315193195381, -0.342606435779),
-                  (0.309202479492, -0.342673798133),
-                  (0.303208191811, -0.34273978292),
-                  (0.29721040932, -0.342804394922),
-                  (0.291209208385, -0.342867638902),
-                  (0.285204664768, -0.342929519602),
-                  (0.279196853654, -0.342990041745),
-                  (0.273185849664, -0.343049210031),
-                  (0.267171726877, -0.343107029136),
-                  (0.261154558848, -0.34316350371),
-                  (0.255134418626, -0.343218638375),
-                  (0.249111378777, -0.343272437724),
-                  (0.2430855114, -0.343324906316),
-                  (0.237056888143, -0.343376048676),
-                  (0.23102558023, -0.343425869291),
-                  (0.224991658471, -0.343474372606),
-                  (0.218955193286, -0.343521563026),
-                  (0.212916254721, -0.343567444906),
-                  (0.206874912467, -0.343612022552),
-                  (0.200831235877, -0.343655300219),
-                  (0.200852273965, -0.340715198856),
-                  (0.200873125061, -0.337774168942),
-                  (0.20089378942, -0.334832219663),
-                  (0.200914267286, -0.331889360172),
-                  (0.200934558896, -0.328945599594),
-                  (0.200954664474, -0.326000947023),
-                  (0.20097458424, -0.323055411524),
-                  (0.200994318402, -0.320109002131),
-                  (0.20101386716, -0.317161727851),
-                  (0.201033230706, -0.314213597663),
-                  (0.201052409224, -0.311264620514),
-                  (0.201071402888, -0.308314805328),
-                  (0.201090211866, -0.305364160996),
-                  (0.201108836318, -0.302412696385),
-                  (0.201127276397, -0.299460420333),
-                  (0.201145532246, -0.296507341653),
-                  (0.201163604004, -0.293553469129),
-                  (0.2011814918, -0.290598811521),
-                  (0.201199195758, -0.287643377559),
-                  (0.201216715995, -0.284687175953),
-                  (0.201234052621, -0.281730215382),
-                  (0.20125120574, -0.278772504503),
-                  (0.201268175448, -0.275814051948),
-                  (0.201284961839, -0.272854866322),
-                  (0.201301564997, -0.269894956208),
-                  (0.201317985001, -0.266934330164),
-                  (0.201334221927, -0.263972996724),
-                  (0.201350275843, -0.261010964399),
-                  (0.201366146812, -0.258048241676),
-                  (0.201381834893, -0.255084837021),
-                  (0.20139734014, -0.252120758876),
-                  (0.2014126626, -0.249156015659),
-                  (0.207474049692, -0.249125168249),
-                  (0.213533111442, -0.249093403855),
-                  (0.21958978032, -0.249060719001),
-                  (0.225643988558, -0.249027110186),
-                  (0.23169566814, -0.248992573892),
-                  (0.237744750778, -0.248957106582),
-                  (0.243791167896, -0.248920704713),
-                  (0.249834850614, -0.248883364731),
-                  (0.255875729728, -0.248845083084),
-                  (0.261913735689, -0.248805856221),
-                  (0.267948798591, -0.248765680595),
-                  (0.273980848142, -0.24872455267),
-                  (0.280009813654, -0.248682468926),
-                  (0.286035624015, -0.248639425858),
-                  (0.292058207677, -0.24859541998),
-                  (0.298077492629, -0.248550447834),
-                  (0.304093406378, -0.248504505986),
-                  (0.310105875933, -0.248457591031),
-                  (0.316114827779, -0.248409699598),
-                  (0.322120187858, -0.24836082835),
-                  (0.328121881547, -0.248310973985),
-                  (0.334119833638, -0.248260133241),
-                  (0.340113968319, -0.248208302893),
-                  (0.346104209146, -0.248155479758),
-                  (0.352090479028, -0.248101660692),
-                  (0.358072700202, -0.248046842594),
-                  (0.364050794215, -0.247991022403),
-                  (0.370024681898, -0.247934197099),
-                  (0.375994283348, -0.247876363699),
-                  (0.381959517906, -0.24781751926),
-                  (0.387920304136, -0.247757660873),
-                  (0.393876559802, -0.247696785663)]},
- 25: {'color': 'skyblue',
-      'polygon': [(0.187353724482, -0.249273548096),
-                  (0.187339953571, -0.252239113384),
-                  (0.187326012614, -0.255204014375),
-                  (0.187311901577, -0.258168242672),
-                  (0.18729762042, -0.261131789858),
-                  (0.1872831691, -0.264094647491),
-                  (0.187268547569, -0.267056807108),
-                  (0.187253755774, -0.270018260224),
-                  (0.187238793655, -0.272978998329),
-                  (0.187223661151, -0.275939012891),
-                  (0.187208358191, -0.278898295354),
-                  (0.187192884703, -0.281856837137),
-                  (0.187177240604, -0.284814629637),
-                  (0.18716142581, -0.287771664225),
-                  (0.187145440229, -0.290727932246),
-                  (0.187129283763, -0.293683425023),
-                  (0.187112956306, -0.296638133851),
-                  (0.187096457749, -0.29959205),
-                  (0.187079787973, -0.302545164714),
-                  (0.187062946853, -0.305497469212),
-                  (0.18704593426, -0.308448954684),
-                  (0.187028750053, -0.311399612295),
-                  (0.187011394087, -0.314349433184),
-                  (0.186993866208, -0.317298408458),
-                  (0.186976166256, -0.320246529202),
-                  (0.18695829406, -0.323193786469),
-                  (0.186940249445, -0.326140171285),
-                  (0.186922032224, -0.329085674647),
-                  (0.186903642205, -0.332030287524),
-                  (0.186885079186, -0.334974000855),
-                  (0.186866342956, -0.337916805551),
-                  (0.186847433295, -0.34085869249),
-                  (0.186828349976, -0.343799652522),
-                  (0.18077743085, -0.343839611059),
-                  (0.174724473656, -0.343878287309),
-                  (0.168669546252, -0.34391568518),
-                  (0.162612716265, -0.343951808503),
-                  (0.156554051111, -0.343986661035),
-                  (0.15049361801, -0.344020246452),
-                  (0.144431484002, -0.344052568345),
-                  (0.138367715963, -0.344083630218),
-                  (0.132302380616, -0.344113435487),
-                  (0.126235544551, -0.344141987471),
-                  (0.120167274238, -0.344169289395),
-                  (0.114097636039, -0.344195344384),
-                  (0.108026696224, -0.344220155459),
-                  (0.101954520983, -0.344243725535),
-                  (0.0958811764428, -0.344266057421),
-                  (0.0898067286729, -0.344287153811),
-                  (0.083731243704, -0.344307017288),
-                  (0.0776547875378, -0.344325650316),
-                  (0.0715774261586, -0.34434305524),
-                  (0.0654992255451, -0.344359234285),
-                  (0.0594202516812, -0.344374189549),
-                  (0.0533405705669, -0.344387923005),
-                  (0.0472602482282, -0.3444004365),
-                  (0.0411793507274, -0.344411731745),
-                  (0.0350979441729, -0.344421810324),
-                  (0.0290160947276, -0.344430673685),
-                  (0.022933868619, -0.344438323138),
-                  (0.0168513321468, -0.344444759859),
-                  (0.0107685516916, -0.344449984884),
-                  (0.00468559372271, -0.344453999107),
-                  (-0.0013974751943, -0.344456803285),
-                  (-0.00748058839022, -0.344458398029),
-                  (-0.00748203426554, -0.341511974501),
-                  (-0.00748347424098, -0.338564634104),
-                  (-0.00748490832126, -0.335616385667),
-                  (-0.00748633651361, -0.332667237997),
-                  (-0.00748775882764, -0.329717199873),
-                  (-0.0074891752754, -0.326766280051),
-                  (-0.00749058587118, -0.323814487264),
-                  (-0.00749199063156, -0.32086183022),
-                  (-0.00749338957527, -0.317908317604),
-                  (-0.00749478272317, -0.314953958078),
-                  (-0.00749617009822, -0.311998760282),
-                  (-0.00749755172535, -0.309042732833),
-                  (-0.00749892763136, -0.306085884326),
-                  (-0.00750029784501, -0.303128223334),
-                  (-0.00750166239681, -0.300169758409),
-                  (-0.007503021319, -0.297210498082),
-                  (-0.00750437464552, -0.294250450863),
-                  (-0.00750572241191, -0.291289625241),
-                  (-0.00750706465516, -0.288328029685),
-                  (-0.00750840141384, -0.285365672645),
-                  (-0.00750973272784, -0.28240256255),
-                  (-0.00751105863844, -0.27943870781),
-                  (-0.00751237918817, -0.276474116816),
-                  (-0.00751369442071, -0.273508797939),
-                  (-0.00751500438093, -0.270542759534),
-                  (-0.00751630911472, -0.267576009935),
-                  (-0.00751760866902, -0.26460855746),
-                  (-0.00751890309164, -0.261640410407),
-                  (-0.00752019243129, -0.258671577058),
-                  (-0.00752147673748, -0.255702065677),
-                  (-0.00752275606044, -0.252731884512),
-                  (-0.00752403045109, -0.249761041793),
-                  (-0.00142302497471, -0.249759056805),
-                  (0.00467792956925, -0.249756229275),
-                  (0.0107787662045, -0.249752558881),
-                  (0.0168794180705, -0.249748045171),
-                  (0.0229798184177, -0.249742687557),
-                  (0.0290799006044, -0.249736485322),
-                  (0.0351795980912, -0.249729437614),
-                  (0.0412788444365, -0.249721543456),
-                  (0.0473775732914, -0.24971280174),
-                  (0.0534757183937, -0.249703211234),
-                  (0.0595732135621, -0.24969277058),
-                  (0.0656699926901, -0.249681478301),
-                  (0.0717659897387, -0.249669332797),
-                  (0.0778611387298, -0.249656332352),
-                  (0.0839553737386, -0.249642475135),
-                  (0.0900486288857, -0.249627759202),
-                  (0.0961408383286, -0.249612182502),
-                  (0.102231936253, -0.249595742875),
-                  (0.108321856866, -0.24957843806),
-                  (0.114410534381, -0.249560265694),
-                  (0.120497903014, -0.249541223319),
-                  (0.126583896971, -0.249521308384),
-                  (0.132668450436, -0.249500518248),
-                  (0.13875149756, -0.249478850185),
-                  (0.144832972452, -0.249456301387),
-                  (0.150912809166, -0.249432868968),
-                  (0.156990941687, -0.249408549971),
-                  (0.163067303918, -0.249383341365),
-                  (0.169141829672, -0.249357240057),
-                  (0.175214452652, -0.249330242893),
-                  (0.18128510644, -0.24930234666),
-                  (0.187353724482, -0.249273548096)]},
- 26: {'color': 'violet',
-      'polygon': [(-0.0109215914164, -0.24983573483),
-                  (-0.0109190994224, -0.252806550707),
-                  (-0.0109165995908, -0.25577670472),
-                  (-0.0109140918731, -0.258746188637),
-                  (-0.0109115762212, -0.261714994213),
-                  (-0.0109090525879, -0.264683113184),
-                  (-0.0109065209265, -0.267650537267),
-                  (-0.0109039811913, -0.270617258164),
-                  (-0.0109014333375, -0.273583267558),
-                  (-0.010898877321, -0.276548557114),
-                  (-0.010896313099, -0.279513118481),
-                  (-0.0108937406295, -0.282476943285),
-                  (-0.0108911598718, -0.285440023138),
-                  (-0.0108885707864, -0.288402349629),
-                  (-0.010885973335, -0.29136391433),
-                  (-0.0108833674807, -0.294324708792),
-                  (-0.0108807531878, -0.297284724548),
-                  (-0.0108781304224, -0.300243953109),
-                  (-0.0108754991518, -0.303202385965),
-                  (-0.010872859345, -0.306160014589),
-                  (-0.0108702109728, -0.309116830428),
-                  (-0.0108675540075, -0.312072824911),
-                  (-0.0108648884233, -0.315027989444),
-                  (-0.0108622141962, -0.317982315411),
-                  (-0.0108595313042, -0.320935794175),
-                  (-0.0108568397271, -0.323888417075),
-                  (-0.0108541394468, -0.326840175428),
-                  (-0.0108514304475, -0.329791060526),
-                  (-0.0108487127153, -0.33274106364),
-                  (-0.0108459862385, -0.335690176015),
-                  (-0.0108432510078, -0.338638388874),
-                  (-0.0108405070162, -0.341585693412),
-                  (-0.010837754259, -0.344532080801),
-                  (-0.0169207858668, -0.344533713836),
-                  (-0.0230036902563, -0.344534137996),
-                  (-0.0290864003365, -0.344533353359),
-                  (-0.0351688488835, -0.344531359857),
-                  (-0.0412509685354, -0.344528157276),
-                  (-0.0473326917865, -0.344523745256),
-                  (-0.0534139509829, -0.34451812329),
-                  (-0.0594946783171, -0.344511290724),
-                  (-0.0655748058239, -0.344503246761),
-                  (-0.0716542653758, -0.344493990454),
-                  (-0.0777329886791, -0.344483520712),
-                  (-0.0838109072699, -0.344471836298),
-                  (-0.0898879525108, -0.344458935831),
-                  (-0.095964055587, -0.344444817785),
-                  (-0.102039147503, -0.344429480489),
-                  (-0.10811315908, -0.344412922132),
-                  (-0.114186020953, -0.344395140757),
-                  (-0.120257663566, -0.344376134271),
-                  (-0.126328017172, -0.344355900435),
-                  (-0.13239701183, -0.344334436876),
-                  (-0.1384645774, -0.34431174108),
-                  (-0.144530643543, -0.344287810398),
-                  (-0.150595139719, -0.344262642045),
-                  (-0.156657995182, -0.344236233101),
-                  (-0.16271913898, -0.344208580516),
-                  (-0.168778499953, -0.344179681106),
-                  (-0.174836006727, -0.344149531558),
-                  (-0.180891587719, -0.344118128431),
-                  (-0.186945171125, -0.344085468157),
-                  (-0.192996684926, -0.344051547043),
-                  (-0.199046056882, -0.344016361272),
-                  (-0.205093214529, -0.343979906905),
-                  (-0.205116727141, -0.341040391114),
-                  (-0.205140049305, -0.338099941532),
-                  (-0.205163181221, -0.335158567015),
-                  (-0.205186123082, -0.332216276397),
-                  (-0.205208875081, -0.329273078493),
-                  (-0.205231437403, -0.326328982096),
-                  (-0.205253810235, -0.323383995978),
-                  (-0.205275993755, -0.320438128892),
-                  (-0.205297988142, -0.317491389573),
-                  (-0.205319793569, -0.314543786735),
-                  (-0.205341410207, -0.311595329075),
-                  (-0.205362838224, -0.308646025268),
-                  (-0.205384077784, -0.305695883975),
-                  (-0.205405129048, -0.302744913837),
-                  (-0.205425992174, -0.299793123478),
-                  (-0.205446667318, -0.296840521504),
-                  (-0.205467154631, -0.293887116504),
-                  (-0.205487454264, -0.290932917052),
-                  (-0.205507566361, -0.287977931703),
-                  (-0.205527491067, -0.285022168997),
-                  (-0.205547228522, -0.282065637458),
-                  (-0.205566778865, -0.279108345595),
-                  (-0.20558614223, -0.276150301901),
-                  (-0.205605318749, -0.273191514851),
-                  (-0.205624308553, -0.27023199291),
-                  (-0.205643111769, -0.267271744525),
-                  (-0.20566172852, -0.264310778128),
-                  (-0.205680158929, -0.261349102138),
-                  (-0.205698403116, -0.25838672496),
-                  (-0.205716461197, -0.255423654984),
-                  (-0.205734333287, -0.252459900586),
-                  (-0.205752019497, -0.24949547013),
-                  (-0.199686819382, -0.249519656697),
-                  (-0.193619414292, -0.249542940315),
-                  (-0.187549875781, -0.249565324555),
-                  (-0.181478275254, -0.249586812908),
-                  (-0.175404683968, -0.249607408776),
-                  (-0.169329173033, -0.249627115475),
-                  (-0.163251813411, -0.249645936225),
-                  (-0.157172675918, -0.249663874153),
-                  (-0.151091831223, -0.249680932287),
-                  (-0.145009349852, -0.249697113554),
-                  (-0.138925302184, -0.249712420776),
-                  (-0.132839758453, -0.249726856669),
-                  (-0.126752788748, -0.249740423839),
-                  (-0.120664463012, -0.249753124781),
-                  (-0.114574851045, -0.249764961876),
-                  (-0.1084840225, -0.249775937385),
-                  (-0.102392046887, -0.249786053455),
-                  (-0.0962989935698, -0.249795312107),
-                  (-0.0902049317686, -0.249803715243),
-                  (-0.084109930559, -0.249811264637),
-                  (-0.0780140588727, -0.249817961938),
-                  (-0.0719173854981, -0.249823808668),
-                  (-0.0658199790807, -0.249828806215),
-                  (-0.0597219081237, -0.249832955841),
-                  (-0.0536232409894, -0.249836258673),
-                  (-0.0475240458996, -0.249838715705),
-                  (-0.0414243909375, -0.249840327797),
-                  (-0.0353243440484, -0.249841095677),
-                  (-0.0292239730419, -0.249841019933),
-                  (-0.0231233455936, -0.24984010102),
-                  (-0.0170225292471, -0.249838339258),
-                  (-0.0109215914164, -0.24983573483)]},
- 27: {'color': 'violet',
-      'polygon': [(-0.219818586895, -0.249447025895),
-                  (-0.21980103157, -0.252410541781),
-                  (-0.219783276984, -0.255373379837),
-                  (-0.21976532301, -0.258335531679),
-                  (-0.219747169515, -0.261296988909),
-                  (-0.219728816367, -0.264257743115),
-                  (-0.219710263429, -0.267217785871),
-                  (-0.219691510563, -0.270177108737),
-                  (-0.219672557625, -0.27313570326),
-                  (-0.219653404472, -0.27609356097),
-                  (-0.219634050956, -0.279050673384),
-                  (-0.219614496925, -0.282007032004),
-                  (-0.219594742226, -0.284962628317),
-                  (-0.219574786703, -0.287917453793),
-                  (-0.219554630194, -0.29087149989),
-                  (-0.219534272537, -0.293824758045),
-                  (-0.219513713566, -0.296777219684),
-                  (-0.219492953112, -0.299728876213),
-                  (-0.219471991, -0.302679719023),
-                  (-0.219450827056, -0.305629739489),
-                  (-0.219429461099, -0.308578928966),
-                  (-0.219407892946, -0.311527278795),
-                  (-0.219386122412, -0.314474780298),
-                  (-0.219364149305, -0.317421424776),
-                  (-0.219341973434, -0.320367203517),
-                  (-0.219319594599, -0.323312107786),
-                  (-0.2192970126, -0.326256128832),
-                  (-0.219274227233, -0.329199257882),
-                  (-0.219251238288, -0.332141486146),
-                  (-0.219228045554, -0.335082804812),
-                  (-0.219204648813, -0.338023205049),
-                  (-0.219181047846, -0.340962678003),
-                  (-0.219157242428, -0.343901214803),
-                  (-0.225196526871, -0.343858017301),
-                  (-0.231233281911, -0.343813533497),
-                  (-0.237267433849, -0.343767758856),
-                  (-0.243298908739, -0.343720688731),
-                  (-0.249327632394, -0.343672318361),
-                  (-0.255353530371, -0.343622642876),
-                  (-0.261376527975, -0.343571657298),
-                  (-0.26739655025, -0.343519356538),
-                  (-0.273413521974, -0.343465735405),
-                  (-0.279427367656, -0.343410788597),
-                  (-0.285438011529, -0.343354510709),
-                  (-0.291445377542, -0.343296896234),
-                  (-0.297449389356, -0.343237939558),
-                  (-0.303449970337, -0.343177634965),
-                  (-0.309447043547, -0.343115976637),
-                  (-0.315440531734, -0.343052958652),
-                  (-0.321430357329, -0.342988574989),
-                  (-0.327416442434, -0.342922819519),
-                  (-0.33339870881, -0.342855686016),
-                  (-0.33937707787, -0.342787168147),
-                  (-0.345351470668, -0.342717259476),
-                  (-0.351321807887, -0.342645953464),
-                  (-0.357288009824, -0.342573243466),
-                  (-0.363249996383, -0.342499122727),
-                  (-0.369207687056, -0.342423584389),
-                  (-0.375161000912, -0.342346621479),
-                  (-0.38110985658, -0.342268226916),
-                  (-0.387054172235, -0.342188393502),
-                  (-0.392993865578, -0.342107113924),
-                  (-0.398928853824, -0.34202438075),
-                  (-0.404859053678, -0.341940186423),
-                  (-0.410784381319, -0.341854523264),
-                  (-0.410829881436, -0.338935920784),
-                  (-0.410874973529, -0.336016338678),
-                  (-0.410919658335, -0.333095786285),
-                  (-0.410963936584, -0.330174272927),
-                  (-0.411007808992, -0.327251807901),
-                  (-0.411051276268, -0.324328400488),
-                  (-0.411094339112, -0.321404059946),
-                  (-0.411136998212, -0.318478795515),
-                  (-0.411179254248, -0.315552616415),
-                  (-0.41122110789, -0.312625531848),
-                  (-0.411262559799, -0.309697550998),
-                  (-0.411303610628, -0.30676868303),
-                  (-0.411344261019, -0.30383893709),
-                  (-0.411384511607, -0.30090832231),
-                  (-0.411424363016, -0.2979768478),
-                  (-0.411463815863, -0.295044522657),
-                  (-0.411502870757, -0.292111355961),
-                  (-0.411541528295, -0.289177356772),
-                  (-0.411579789069, -0.286242534139),
-                  (-0.411617653661, -0.28330689709),
-                  (-0.411655122645, -0.280370454642),
-                  (-0.411692196586, -0.277433215793),
-                  (-0.411728876043, -0.274495189527),
-                  (-0.411765161566, -0.271556384813),
-                  (-0.411801053694, -0.268616810605),
-                  (-0.411836552963, -0.265676475843),
-                  (-0.411871659899, -0.262735389452),
-                  (-0.411906375018, -0.259793560342),
-                  (-0.411940698832, -0.25685099741),
-                  (-0.411974631843, -0.253907709538),
-                  (-0.412008174547, -0.250963705595),
-                  (-0.412041327432, -0.248018994436),
-                  (-0.40609647668, -0.248079219925),
-                  (-0.40014684327, -0.248138392194),
-                  (-0.394192507431, -0.248196516052),
-                  (-0.388233548924, -0.248253596293),
-                  (-0.382270047068, -0.248309637691),
-                  (-0.376302080754, -0.248364645004),
-                  (-0.370329728473, -0.248418622977),
-                  (-0.364353068327, -0.248471576337),
-                  (-0.35837217805, -0.248523509799),
-                  (-0.352387135026, -0.248574428059),
-                  (-0.346398016301, -0.248624335801),
-                  (-0.340404898604, -0.248673237691),
-                  (-0.334407858356, -0.248721138378),
-                  (-0.328406971684, -0.248768042494),
-                  (-0.322402314437, -0.248813954648),
-                  (-0.316393962195, -0.248858879433),
-                  (-0.31038199028, -0.248902821416),
-                  (-0.304366473768, -0.248945785139),
-                  (-0.298347487497, -0.248987775119),
-                  (-0.292325106079, -0.249028795844),
-                  (-0.286299403904, -0.24906885177),
-                  (-0.280270455153, -0.249107947321),
-                  (-0.274238333799, -0.249146086884),
-                  (-0.26820311362, -0.249183274806),
-                  (-0.262164868202, -0.249219515395),
-                  (-0.256123670945, -0.249254812914),
-                  (-0.250079595065, -0.249289171577),
-                  (-0.244032713607, -0.249322595549),
-                  (-0.237983099441, -0.249355088942),
-                  (-0.231930825269, -0.249386655811),
-                  (-0.225875963628, -0.249417300151),
-                  (-0.219818586895, -0.249447025895)]},
- 28: {'color': 'violet',
-      'polygon': [(-0.425677080722, -0.248055266679),
-                  (-0.425644048873, -0.250998094997),
-                  (-0.425610612257, -0.253940212431),
-                  (-0.425576770344, -0.256881610077),
-                  (-0.425542522591, -0.259822279018),
-                  (-0.425507868452, -0.262762210321),
-                  (-0.42547280737, -0.265701395041),
-                  (-0.425437338781, -0.268639824216),
-                  (-0.425401462112, -0.271577488872),
-                  (-0.425365176783, -0.274514380019),
-                  (-0.425328482203, -0.277450488652),
-                  (-0.425291377777, -0.280385805753),
-                  (-0.425253862898, -0.283320322286),
-                  (-0.425215936951, -0.286254029201),
-                  (-0.425177599313, -0.289186917432),
-                  (-0.425138849351, -0.292118977898),
-                  (-0.425099686426, -0.295050201501),
-                  (-0.425060109888, -0.297980579126),
-                  (-0.425020119076, -0.300910101643),
-                  (-0.424979713325, -0.303838759905),
-                  (-0.424938891956, -0.306766544746),
-                  (-0.424897654284, -0.309693446985),
-                  (-0.424855999612, -0.312619457421),
-                  (-0.424813927235, -0.315544566837),
-                  (-0.424771436439, -0.318468765996),
-                  (-0.4247285265, -0.321392045645),
-                  (-0.424685196682, -0.324314396508),
-                  (-0.424641446243, -0.327235809293),
-                  (-0.424597274428, -0.330156274687),
-                  (-0.424552680473, -0.333075783358),
-                  (-0.424507663603, -0.335994325951),
-                  (-0.424462223034, -0.338911893092),
-                  (-0.424416357972, -0.341828475387),
-                  (-0.430324982901, -0.341735142317),
-                  (-0.436228369422, -0.341640306615),
-                  (-0.442126430557, -0.341543959896),
-                  (-0.448019078659, -0.341446093622),
-                  (-0.453906225385, -0.341346699096),
-                  (-0.459787781663, -0.341245767455),
-                  (-0.46566365767, -0.341143289662),
-                  (-0.471533762794, -0.341039256503),
-                  (-0.477398005611, -0.340933658575),
-                  (-0.483256293845, -0.340826486284),
-                  (-0.489108534338, -0.340717729832),
-                  (-0.494954633015, -0.340607379207),
-                  (-0.500794494843, -0.340495424183),
-                  (-0.506628023801, -0.340381854298),
-                  (-0.512455122832, -0.340266658856),
-                  (-0.518275693808, -0.340149826906),
-                  (-0.524089637486, -0.34003134724),
-                  (-0.529896853463, -0.339911208376),
-                  (-0.535697240133, -0.339789398546),
-                  (-0.541490694641, -0.339665905689),
-                  (-0.547277112832, -0.339540717431),
-                  (-0.553056389201, -0.339413821076),
-                  (-0.558828416846, -0.339285203592),
-                  (-0.564593087409, -0.339154851592),
-                  (-0.570350291025, -0.339022751325),
-                  (-0.576099916266, -0.338888888656),
-                  (-0.58184185008, -0.338753249052),
-                  (-0.587575977732, -0.338615817563),
-                  (-0.593302182744, -0.338476578805),
-                  (-0.59902034683, -0.338335516945),
-                  (-0.604730349829, -0.338192615679),
-                  (-0.610432069642, -0.338047858212),
-                  (-0.61050390095, -0.335166556951),
-                  (-0.610575053779, -0.332284188364),
-                  (-0.610645529727, -0.329400762866),
-                  (-0.610715330382, -0.326516290847),
-                  (-0.610784457312, -0.32363078267),
-                  (-0.610852912076, -0.320744248675),
-                  (-0.610920696218, -0.317856699175),
-                  (-0.610987811266, -0.314968144458),
-                  (-0.611054258736, -0.31207859479),
-                  (-0.611120040131, -0.309188060411),
-                  (-0.611185156938, -0.306296551539),
-                  (-0.611249610632, -0.303404078369),
-                  (-0.611313402674, -0.300510651073),
-                  (-0.611376534509, -0.297616279803),
-                  (-0.61143900757, -0.294720974685),
-                  (-0.611500823278, -0.291824745827),
-                  (-0.611561983036, -0.288927603314),
-                  (-0.611622488237, -0.286029557211),
-                  (-0.611682340258, -0.283130617562),
-                  (-0.611741540464, -0.28023079439),
-                  (-0.611800090203, -0.2773300977),
-                  (-0.611857990813, -0.274428537474),
-                  (-0.611915243616, -0.271526123677),
-                  (-0.611971849921, -0.268622866254),
-                  (-0.612027811022, -0.26571877513),
-                  (-0.612083128201, -0.262813860212),
-                  (-0.612137802725, -0.259908131388),
-                  (-0.612191835848, -0.257001598526),
-                  (-0.612245228809, -0.254094271479),
-                  (-0.612297982834, -0.251186160078),
-                  (-0.612350099134, -0.248277274139),
-                  (-0.612401578909, -0.245367623458),
-                  (-0.606674817546, -0.245470049148),
-                  (-0.600939997943, -0.245571210808),
-                  (-0.595197238763, -0.245671117675),
-                  (-0.589446656641, -0.245769778649),
-                  (-0.58368836626, -0.245867202315),
-                  (-0.577922480421, -0.24596339696),
-                  (-0.572149110114, -0.246058370588),
-                  (-0.56636836458, -0.246152130943),
-                  (-0.560580351383, -0.246244685519),
-                  (-0.554785176471, -0.246336041581),
-                  (-0.548982944238, -0.246426206176),
-                  (-0.543173757581, -0.246515186149),
-                  (-0.537357717965, -0.246602988156),
-                  (-0.531534925471, -0.246689618679),
-                  (-0.52570547886, -0.246775084036),
-                  (-0.519869475618, -0.246859390393),
-                  (-0.514027012014, -0.246942543777),
-                  (-0.508178183143, -0.247024550085),
-                  (-0.502323082982, -0.247105415095),
-                  (-0.496461804431, -0.247185144476),
-                  (-0.49059443936, -0.247263743795),
-                  (-0.484721078652, -0.247341218528),
-                  (-0.478841812248, -0.247417574065),
-                  (-0.472956729182, -0.24749281572),
-                  (-0.467065917626, -0.247566948739),
-                  (-0.461169464925, -0.247639978303),
-                  (-0.455267457633, -0.247711909533),
-                  (-0.44935998155, -0.247782747504),
-                  (-0.443447121754, -0.247852497239),
-                  (-0.437528962634, -0.247921163722),
-                  (-0.431605587922, -0.247988751898),
-                  (-0.425677080722, -0.248055266679)]},
- 29: {'color': 'violet',
-      'polygon': [(-0.625651578135, -0.245082412402),
-                  (-0.625596436407, -0.247989071406),
-                  (-0.625540639358, -0.250894961352),
-                  (-0.625484185751, -0.253800072364),
-                  (-0.625427074336, -0.256704394545),
-                  (-0.625369303846, -0.259607917982),
-                  (-0.625310873001, -0.262510632741),
-                  (-0.625251780509, -0.265412528872),
-                  (-0.625192025061, -0.268313596404),
-                  (-0.625131605335, -0.271213825348),
-                  (-0.625070519996, -0.274113205694),
-                  (-0.625008767693, -0.277011727414),
-                  (-0.624946347062, -0.279909380461),
-                  (-0.624883256726, -0.282806154766),
-                  (-0.624819495292, -0.28570204024),
-                  (-0.624755061355, -0.288597026776),
-                  (-0.624689953495, -0.291491104242),
-                  (-0.624624170277, -0.29438426249),
-                  (-0.624557710255, -0.297276491345),
-                  (-0.624490571966, -0.300167780616),
-                  (-0.624422753935, -0.303058120086),
-                  (-0.624354254672, -0.305947499517),
-                  (-0.624285072674, -0.308835908649),
-                  (-0.624215206424, -0.311723337198),
-                  (-0.62414465439, -0.314609774858),
-                  (-0.624073415028, -0.317495211297),
-                  (-0.624001486779, -0.320379636162),
-                  (-0.62392886807, -0.323263039073),
-                  (-0.623855557314, -0.326145409624),
-                  (-0.623781552911, -0.329026737388),
-                  (-0.623706853246, -0.331907011908),
-                  (-0.623631456692, -0.334786222701),
-                  (-0.623555361606, -0.33766435926),
-                  (-0.629228687593, -0.337517840464),
-                  (-0.634893177761, -0.337369382808),
-                  (-0.640548698465, -0.337218966457),
-                  (-0.646195113652, -0.33706657095),
-                  (-0.651832284777, -0.336912175174),
-                  (-0.657460070718, -0.336755757338),
-                  (-0.663078327691, -0.336597294951),
-                  (-0.668686909161, -0.336436764791),
-                  (-0.674285665754, -0.336274142883),
-                  (-0.67987444516, -0.336109404467),
-                  (-0.685453092043, -0.335942523975),
-                  (-0.691021447941, -0.335773474994),
-                  (-0.696579351168, -0.335602230244),
-                  (-0.702126636711, -0.335428761544),
-                  (-0.707663136126, -0.335253039779),
-                  (-0.713188677433, -0.335075034873),
-                  (-0.718703085006, -0.334894715749),
-                  (-0.724206179462, -0.334712050303),
-                  (-0.729697777548, -0.334527005364),
-                  (-0.735177692023, -0.334339546661),
-                  (-0.74064573154, -0.33414963879),
-                  (-0.746101700528, -0.333957245169),
-                  (-0.751545399061, -0.333762328011),
-                  (-0.756976622739, -0.333564848278),
-                  (-0.762395162555, -0.333364765644),
-                  (-0.767800804765, -0.333162038458),
-                  (-0.773193330752, -0.332956623698),
-                  (-0.778572516889, -0.332748476935),
-                  (-0.783938134403, -0.332537552286),
-                  (-0.789289949229, -0.332323802375),
-                  (-0.794627721865, -0.332107178286),
-                  (-0.799951207224, -0.331887629519),
-                  (-0.800061826877, -0.329067305958),
-                  (-0.800171433161, -0.326245745465),
-                  (-0.800280027946, -0.323422960291),
-                  (-0.800387613092, -0.32059896265),
-                  (-0.800494190456, -0.317773764719),
-                  (-0.800599761888, -0.31494737864),
-                  (-0.800704329231, -0.312119816518),
-                  (-0.800807894323, -0.309291090424),
-                  (-0.800910458993, -0.306461212392),
-                  (-0.801012025066, -0.303630194427),
-                  (-0.801112594355, -0.300798048496),
-                  (-0.80121216867, -0.297964786535),
-                  (-0.801310749808, -0.295130420449),
-                  (-0.801408339562, -0.292294962109),
-                  (-0.801504939714, -0.289458423355),
-                  (-0.801600552037, -0.286620815998),
-                  (-0.801695178296, -0.283782151816),
-                  (-0.801788820245, -0.280942442558),
-                  (-0.801881479629, -0.278101699945),
-                  (-0.801973158184, -0.275259935665),
-                  (-0.802063857634, -0.272417161382),
-                  (-0.802153579693, -0.269573388726),
-                  (-0.802242326064, -0.266728629303),
-                  (-0.802330098439, -0.26388289469),
-                  (-0.802416898499, -0.261036196436),
-                  (-0.802502727912, -0.258188546063),
-                  (-0.802587588336, -0.255339955066),
-                  (-0.802671481416, -0.252490434913),
-                  (-0.802754408783, -0.249639997048),
-                  (-0.802836372059, -0.246788652886),
-                  (-0.802917372849, -0.243936413817),
-                  (-0.802997412748, -0.241083291206),
-                  (-0.79764025035, -0.241234499334),
-                  (-0.79226904346, -0.24138372094),
-                  (-0.786884040618, -0.241530994487),
-                  (-0.781485484466, -0.241676356932),
-                  (-0.776073611906, -0.241819843776),
-                  (-0.770648654251, -0.241961489114),
-                  (-0.765210837369, -0.242101325684),
-                  (-0.759760381837, -0.242239384909),
-                  (-0.754297503078, -0.242375696948),
-                  (-0.748822411508, -0.242510290738),
-                  (-0.74333531267, -0.242643194038),
-                  (-0.737836407371, -0.242774433474),
-                  (-0.732325891817, -0.242904034577),
-                  (-0.726803957741, -0.243032021826),
-                  (-0.721270792533, -0.243158418691),
-                  (-0.715726579366, -0.243283247663),
-                  (-0.710171497315, -0.243406530303),
-                  (-0.704605721484, -0.243528287271),
-                  (-0.699029423118, -0.243648538363),
-                  (-0.693442769724, -0.243767302551),
-                  (-0.687845925177, -0.243884598012),
-                  (-0.682239049841, -0.244000442164),
-                  (-0.676622300667, -0.244114851695),
-                  (-0.670995831307, -0.244227842601),
-                  (-0.665359792212, -0.244339430211),
-                  (-0.659714330739, -0.244449629216),
-                  (-0.654059591243, -0.244558453705),
-                  (-0.648395715183, -0.244665917183),
-                  (-0.642722841208, -0.244772032609),
-                  (-0.637041105256, -0.244876812412),
-                  (-0.631350640639, -0.244980268524),
-                  (-0.625651578135, -0.245082412402)]},
- 30: {'color': 'skyblue',
-      'polygon': [(0.788068525473, -0.145310501727),
-                  (0.788023290986, -0.148190934934),
-                  (0.787977160072, -0.151070866231),
-                  (0.787930131991, -0.153950285308),
-                  (0.787882205996, -0.156829181827),
-                  (0.787833381333, -0.159707545422),
-                  (0.787783657241, -0.162585365701),
-                  (0.787733032954, -0.165462632241),
-                  (0.787681507698, -0.168339334593),
-                  (0.787629080695, -0.171215462277),
-                  (0.787575751162, -0.174091004786),
-                  (0.787521518309, -0.176965951583),
-                  (0.787466381342, -0.1798402921),
-                  (0.787410339463, -0.182714015741),
-                  (0.787353391869, -0.185587111879),
-                  (0.787295537754, -0.188459569858),
-                  (0.787236776306, -0.191331378991),
-                  (0.787177106714, -0.194202528559),
-                  (0.787116528159, -0.197073007814),
-                  (0.787055039824, -0.199942805975),
-                  (0.786992640886, -0.202811912233),
-                  (0.786929330521, -0.205680315745),
-                  (0.786865107905, -0.208548005637),
-                  (0.786799972212, -0.211414971004),
-                  (0.786733922613, -0.21428120091),
-                  (0.786666958282, -0.217146684385),
-                  (0.786599078389, -0.220011410428),
-                  (0.786530282108, -0.222875368008),
-                  (0.78646056861, -0.225738546059),
-                  (0.786389937069, -0.228600933484),
-                  (0.786318386661, -0.231462519155),
-                  (0.786245916561, -0.23432329191),
-                  (0.78617252595, -0.237183240557),
-                  (0.78078038121, -0.237333277422),
-                  (0.775375635617, -0.23748105218),
-                  (0.769958431125, -0.237626635267),
-                  (0.764528910058, -0.237770093694),
-                  (0.759087215015, -0.237911491176),
-                  (0.753633488771, -0.238050888263),
-                  (0.748167874187, -0.238188342468),
-                  (0.742690514127, -0.238323908386),
-                  (0.737201551369, -0.238457637814),
-                  (0.731701128528, -0.238589579865),
-                  (0.726189387981, -0.238719781082),
-                  (0.720666471795, -0.238848285543),
-                  (0.715132521656, -0.23897513497),
-                  (0.709587678806, -0.239100368829),
-                  (0.704032083979, -0.239224024427),
-                  (0.698465877342, -0.239346137011),
-                  (0.692889198443, -0.239466739859),
-                  (0.687302186152, -0.239585864369),
-                  (0.681704978617, -0.239703540148),
-                  (0.676097713213, -0.239819795095),
-                  (0.6704805265, -0.239934655482),
-                  (0.664853554184, -0.240048146032),
-                  (0.659216931071, -0.240160289996),
-                  (0.653570791039, -0.240271109228),
-                  (0.647915267001, -0.240380624251),
-                  (0.642250490872, -0.240488854331),
-                  (0.636576593544, -0.240595817537),
-                  (0.630893704857, -0.240701530812),
-                  (0.625201953577, -0.240806010026),
-                  (0.619501467371, -0.240909270041),
-                  (0.61379237279, -0.241011324765),
-                  (0.608074795251, -0.241112187208),
-                  (0.608124854535, -0.238201081017),
-                  (0.608174276135, -0.235289251871),
-                  (0.608223061095, -0.232376709583),
-                  (0.608271210445, -0.229463463933),
-                  (0.608318725206, -0.226549524669),
-                  (0.608365606382, -0.223634901512),
-                  (0.608411854968, -0.220719604148),
-                  (0.608457471945, -0.217803642236),
-                  (0.608502458281, -0.214887025405),
-                  (0.608546814934, -0.211969763253),
-                  (0.608590542846, -0.209051865349),
-                  (0.608633642949, -0.206133341233),
-                  (0.608676116162, -0.203214200415),
-                  (0.60871796339, -0.20029445238),
-                  (0.608759185527, -0.197374106581),
-                  (0.608799783455, -0.194453172443),
-                  (0.608839758042, -0.191531659366),
-                  (0.608879110144, -0.188609576721),
-                  (0.608917840604, -0.185686933852),
-                  (0.608955950255, -0.182763740075),
-                  (0.608993439915, -0.179840004683),
-                  (0.609030310391, -0.176915736938),
-                  (0.609066562476, -0.173990946082),
-                  (0.609102196951, -0.171065641326),
-                  (0.609137214587, -0.168139831859),
-                  (0.60917161614, -0.165213526846),
-                  (0.609205402354, -0.162286735426),
-                  (0.609238573962, -0.159359466713),
-                  (0.609271131683, -0.1564317298),
-                  (0.609303076224, -0.153503533756),
-                  (0.609334408281, -0.150574887625),
-                  (0.609365128536, -0.147645800431),
-                  (0.615099847591, -0.147585647078),
-                  (0.620826243251, -0.147524833585),
-                  (0.626544189246, -0.147463351981),
-                  (0.632253557801, -0.147401193464),
-                  (0.637954219638, -0.147338348346),
-                  (0.64364604397, -0.147274805997),
-                  (0.649328898505, -0.147210554781),
-                  (0.65500264945, -0.147145581994),
-                  (0.660667161514, -0.147079873799),
-                  (0.666322297914, -0.147013415155),
-                  (0.671967920381, -0.146946189749),
-                  (0.677603889177, -0.146878179921),
-                  (0.683230063097, -0.146809366588),
-                  (0.68884629949, -0.146739729165),
-                  (0.694452454271, -0.146669245483),
-                  (0.700048381941, -0.146597891705),
-                  (0.705633935604, -0.146525642239),
-                  (0.711208966993, -0.146452469644),
-                  (0.716773326491, -0.146378344542),
-                  (0.722326863159, -0.146303235515),
-                  (0.727869424768, -0.146227109011),
-                  (0.733400857824, -0.146149929236),
-                  (0.73892100761, -0.14607165805),
-                  (0.744429718219, -0.145992254857),
-                  (0.749926832595, -0.14591167649),
-                  (0.755412192571, -0.145829877097),
-                  (0.760885638925, -0.145746808017),
-                  (0.766347011415, -0.145662417659),
-                  (0.771796148842, -0.14557665137),
-                  (0.777232889097, -0.14548945131),
-                  (0.782657069222, -0.145400756307),
-                  (0.788068525473, -0.145310501727)]},
- 31: {'color': 'skyblue',
-      'polygon': [(0.596197771756, -0.147747435163),
-                  (0.596169756351, -0.150679304635),
-                  (0.596141147159, -0.153610735294),
-                  (0.596111943517, -0.156541718187),
-                  (0.596082144753, -0.159472244338),
-                  (0.596051750182, -0.162402304749),
-                  (0.596020759105, -0.1653318904),
-                  (0.595989170813, -0.168260992245),
-                  (0.595956984584, -0.171189601216),
-                  (0.595924199684, -0.174117708222),
-                  (0.595890815366, -0.177045304146),
-                  (0.595856830872, -0.179972379847),
-                  (0.595822245431, -0.182898926157),
-                  (0.595787058259, -0.185824933886),
-                  (0.595751268562, -0.188750393816),
-                  (0.595714875532, -0.191675296702),
-                  (0.595677878348, -0.194599633275),
-                  (0.595640276177, -0.197523394238),
-                  (0.595602068175, -0.200446570265),
-                  (0.595563253485, -0.203369152006),
-                  (0.595523831235, -0.206291130081),
-                  (0.595483800544, -0.209212495082),
-                  (0.595443160517, -0.212133237574),
-                  (0.595401910247, -0.215053348093),
-                  (0.595360048812, -0.217972817144),
-                  (0.595317575281, -0.220891635206),
-                  (0.595274488708, -0.223809792727),
-                  (0.595230788136, -0.226727280124),
-                  (0.595186472593, -0.229644087786),
-                  (0.595141541097, -0.232560206072),
-                  (0.595095992652, -0.235475625308),
-                  (0.595049826249, -0.238390335793),
-                  (0.595003040867, -0.241304327791),
-                  (0.589258429729, -0.241405089031),
-                  (0.583505861081, -0.241504708082),
-                  (0.5777454541, -0.241603193966),
-                  (0.571977326763, -0.241700555105),
-                  (0.566201595834, -0.24179679936),
-                  (0.560418376867, -0.24189193407),
-                  (0.554627784202, -0.241985966089),
-                  (0.548829930961, -0.242078901823),
-                  (0.543024929057, -0.24217074726),
-                  (0.537212889187, -0.242261508006),
-                  (0.531393920844, -0.242351189311),
-                  (0.525568132315, -0.242439796106),
-                  (0.519735630692, -0.24252733302),
-                  (0.513896521875, -0.242613804416),
-                  (0.508050910583, -0.24269921441),
-                  (0.502198900361, -0.242783566895),
-                  (0.496340593594, -0.242866865567),
-                  (0.490476091511, -0.242949113943),
-                  (0.484605494204, -0.243030315379),
-                  (0.478728900637, -0.243110473095),
-                  (0.472846408658, -0.243189590184),
-                  (0.466958115018, -0.243267669637),
-                  (0.461064115382, -0.243344714353),
-                  (0.455164504346, -0.243420727153),
-                  (0.449259375452, -0.243495710797),
-                  (0.443348821208, -0.243569667994),
-                  (0.437432933102, -0.243642601413),
-                  (0.431511801619, -0.243714513695),
-                  (0.425585516264, -0.243785407463),
-                  (0.419654165577, -0.243855285328),
-                  (0.413717837152, -0.243924149901),
-                  (0.40777661766, -0.243992003797),
-                  (0.407805338869, -0.241045639265),
-                  (0.407833675623, -0.238098609115),
-                  (0.407861628376, -0.235150922205),
-                  (0.407889197571, -0.232202587363),
-                  (0.407916383642, -0.229253613395),
-                  (0.407943187014, -0.226304009076),
-                  (0.407969608103, -0.22335378316),
-                  (0.407995647314, -0.220402944372),
-                  (0.408021305045, -0.217451501414),
-                  (0.408046581684, -0.214499462962),
-                  (0.408071477611, -0.211546837667),
-                  (0.408095993197, -0.208593634158),
-                  (0.408120128805, -0.205639861037),
-                  (0.408143884788, -0.202685526886),
-                  (0.408167261494, -0.19973064026),
-                  (0.408190259261, -0.196775209694),
-                  (0.40821287842, -0.193819243699),
-                  (0.408235119293, -0.190862750764),
-                  (0.408256982196, -0.187905739357),
-                  (0.408278467437, -0.184948217924),
-                  (0.408299575317, -0.181990194889),
-                  (0.40832030613, -0.179031678656),
-                  (0.408340660162, -0.176072677608),
-                  (0.408360637693, -0.17311320011),
-                  (0.408380238997, -0.170153254503),
-                  (0.408399464339, -0.167192849113),
-                  (0.408418313981, -0.164231992244),
-                  (0.408436788176, -0.161270692183),
-                  (0.408454887171, -0.158308957198),
-                  (0.408472611207, -0.15534679554),
-                  (0.408489960521, -0.15238421544),
-                  (0.408506935342, -0.149421225114),
-                  (0.414460968763, -0.149378297906),
-                  (0.420410187231, -0.149334766989),
-                  (0.426354507504, -0.149290632092),
-                  (0.432293845442, -0.149245893022),
-                  (0.438228115982, -0.149200549659),
-                  (0.444157233114, -0.149154601942),
-                  (0.450081109854, -0.149108049869),
-                  (0.455999658224, -0.149060893486),
-                  (0.461912789221, -0.149013132873),
-                  (0.467820412799, -0.148964768139),
-                  (0.473722437842, -0.148915799406),
-                  (0.479618772139, -0.148866226801),
-                  (0.485509322365, -0.148816050438),
-                  (0.491393994053, -0.148765270405),
-                  (0.497272691572, -0.148713886748),
-                  (0.503145318109, -0.148661899455),
-                  (0.50901177564, -0.148609308434),
-                  (0.514871964914, -0.148556113501),
-                  (0.520725785428, -0.148502314349),
-                  (0.526573135412, -0.148447910537),
-                  (0.532413911801, -0.148392901456),
-                  (0.538248010221, -0.148337286312),
-                  (0.54407532497, -0.148281064096),
-                  (0.549895748999, -0.148224233559),
-                  (0.555709173893, -0.148166793179),
-                  (0.561515489857, -0.148108741132),
-                  (0.567314585699, -0.148050075261),
-                  (0.573106348814, -0.14799079304),
-                  (0.578890665172, -0.147930891536),
-                  (0.584667419306, -0.147870367379),
-                  (0.590436494295, -0.147809216714),
-                  (0.596197771756, -0.147747435163)]},
- 32: {'color': 'skyblue',
-      'polygon': [(0.394696633387, -0.149424365211),
-                  (0.39467879205, -0.152389107312),
-                  (0.394660590174, -0.155353441224),
-                  (0.39464202756, -0.158317358771),
-                  (0.394623104005, -0.161280851758),
-                  (0.394603819299, -0.164243911975),
-                  (0.394584173229, -0.167206531192),
-                  (0.394564165574, -0.170168701163),
-                  (0.394543796107, -0.173130413623),
-                  (0.394523064596, -0.176091660289),
-                  (0.394501970803, -0.179052432857),
-                  (0.394480514483, -0.182012723007),
-                  (0.394458695386, -0.184972522396),
-                  (0.394436513253, -0.187931822663),
-                  (0.394413967821, -0.190890615426),
-                  (0.394391058819, -0.193848892282),
-                  (0.39436778597, -0.196806644806),
-                  (0.394344148987, -0.199763864555),
-                  (0.39432014758, -0.20272054306),
-                  (0.394295781449, -0.205676671831),
-                  (0.394271050286, -0.208632242358),
-                  (0.394245953779, -0.211587246106),
-                  (0.394220491604, -0.214541674516),
-                  (0.394194663432, -0.217495519008),
-                  (0.394168468923, -0.220448770977),
-                  (0.394141907732, -0.223401421792),
-                  (0.394114979504, -0.226353462801),
-                  (0.394087683875, -0.229304885326),
-                  (0.394060020473, -0.232255680662),
-                  (0.394031988917, -0.235205840081),
-                  (0.394003588818, -0.238155354828),
-                  (0.393974819775, -0.241104216123),
-                  (0.39394568138, -0.24405241516),
-                  (0.387988826095, -0.244113658438),
-                  (0.382027443425, -0.244173901337),
-                  (0.376061615455, -0.244233146634),
-                  (0.370091423476, -0.244291397143),
-                  (0.364116948003, -0.244348655716),
-                  (0.358138268797, -0.244404925244),
-                  (0.352155464887, -0.244460208662),
-                  (0.346168614593, -0.244514508946),
-                  (0.340177795542, -0.244567829116),
-                  (0.334183084698, -0.244620172234),
-                  (0.328184558374, -0.244671541407),
-                  (0.322182292262, -0.244721939783),
-                  (0.31617636145, -0.244771370553),
-                  (0.310166840442, -0.244819836947),
-                  (0.304153803183, -0.244867342234),
-                  (0.298137323079, -0.244913889719),
-                  (0.292117473015, -0.244959482741),
-                  (0.286094325382, -0.245004124671),
-                  (0.280067952089, -0.245047818907),
-                  (0.274038424593, -0.245090568876),
-                  (0.268005813911, -0.245132378023),
-                  (0.261970190647, -0.245173249815),
-                  (0.255931625004, -0.245213187735),
-                  (0.249890186813, -0.245252195273),
-                  (0.243845945542, -0.245290275932),
-                  (0.237798970324, -0.245327433216),
-                  (0.23174932997, -0.245363670627),
-                  (0.22569709299, -0.245398991664),
-                  (0.219642327608, -0.245433399816),
-                  (0.213585101786, -0.24546689856),
-                  (0.207525483234, -0.245499491352),
-                  (0.201463539431, -0.245531181626),
-                  (0.201477818585, -0.242564995643),
-                  (0.201491914957, -0.239598171491),
-                  (0.201505828577, -0.236630717497),
-                  (0.201519559473, -0.23366264197),
-                  (0.201533107671, -0.230693953198),
-                  (0.201546473191, -0.227724659447),
-                  (0.20155965605, -0.224754768965),
-                  (0.201572656261, -0.221784289979),
-                  (0.201585473836, -0.218813230697),
-                  (0.201598108781, -0.215841599308),
-                  (0.201610561102, -0.212869403982),
-                  (0.2016228308, -0.209896652871),
-                  (0.201634917874, -0.206923354109),
-                  (0.201646822321, -0.203949515811),
-                  (0.201658544135, -0.200975146076),
-                  (0.201670083307, -0.198000252984),
-                  (0.201681439828, -0.195024844598),
-                  (0.201692613685, -0.192048928966),
-                  (0.201703604864, -0.189072514119),
-                  (0.201714413349, -0.186095608071),
-                  (0.201725039124, -0.18311821882),
-                  (0.201735482168, -0.180140354351),
-                  (0.201745742461, -0.17716202263),
-                  (0.201755819982, -0.174183231612),
-                  (0.201765714708, -0.171203989235),
-                  (0.201775426614, -0.168224303422),
-                  (0.201784955677, -0.165244182085),
-                  (0.20179430187, -0.16226363312),
-                  (0.201803465167, -0.159282664409),
-                  (0.20181244554, -0.156301283824),
-                  (0.201821242963, -0.153319499222),
-                  (0.201829857408, -0.150337318447),
-                  (0.207903619892, -0.150317575824),
-                  (0.213975054514, -0.150297291683),
-                  (0.22004409477, -0.150276463224),
-                  (0.226110673998, -0.150255087655),
-                  (0.232174725369, -0.150233162194),
-                  (0.238236181864, -0.150210684078),
-                  (0.244294976263, -0.150187650564),
-                  (0.250351041124, -0.15016405894),
-                  (0.256404308768, -0.150139906528),
-                  (0.262454711258, -0.150115190689),
-                  (0.268502180383, -0.150089908828),
-                  (0.274546647639, -0.150064058401),
-                  (0.280588044208, -0.15003763692),
-                  (0.286626300941, -0.150010641954),
-                  (0.292661348333, -0.14998307114),
-                  (0.298693116511, -0.149954922183),
-                  (0.304721535203, -0.149926192862),
-                  (0.310746533725, -0.149896881033),
-                  (0.316768040954, -0.149866984636),
-                  (0.322785985312, -0.149836501693),
-                  (0.328800294736, -0.149805430318),
-                  (0.334810896663, -0.149773768717),
-                  (0.340817718003, -0.149741515187),
-                  (0.346820685117, -0.149708668125),
-                  (0.352819723794, -0.149675226028),
-                  (0.358814759226, -0.149641187489),
-                  (0.364805715988, -0.149606551206),
-                  (0.370792518008, -0.14957131598),
-                  (0.376775088549, -0.149535480712),
-                  (0.38275335018, -0.149499044408),
-                  (0.388727224756, -0.149462006172),
-                  (0.394696633387, -0.149424365211)]},
- 33: {'bad_channels': [3, 4],
-      'color': 'red',
-      'polygon': [(0.187776696458, -0.150607165433),
-                  (0.18776770607, -0.153590131409),
-                  (0.187758545238, -0.15657270112),
-                  (0.187749213998, -0.159554866732),
-                  (0.187739712387, -0.1625366204),
-                  (0.187730040444, -0.165517954266),
-                  (0.187720198203, -0.168498860458),
-                  (0.1877101857, -0.171479331092),
-                  (0.187700002971, -0.17445935827),
-                  (0.18768965005, -0.177438934082),
-                  (0.18767912697, -0.180418050601),
-                  (0.187668433765, -0.183396699889),
-                  (0.187657570465, -0.18637487399),
-                  (0.187646537101, -0.189352564936),
-                  (0.187635333702, -0.192329764742),
-                  (0.187623960297, -0.195306465409),
-                  (0.187612416911, -0.19828265892),
-                  (0.187600703568, -0.201258337244),
-                  (0.187588820293, -0.204233492334),
-                  (0.187576767105, -0.207208116123),
-                  (0.187564544024, -0.210182200531),
-                  (0.187552151066, -0.213155737459),
-                  (0.187539588247, -0.216128718789),
-                  (0.187526855578, -0.219101136388),
-                  (0.18751395307, -0.222072982102),
-                  (0.187500880728, -0.225044247762),
-                  (0.187487638559, -0.228014925177),
-                  (0.187474226562, -0.230985006139),
-                  (0.187460644736, -0.233954482419),
-                  (0.187446893077, -0.23692334577),
-                  (0.187432971575, -0.239891587925),
-                  (0.18741888022, -0.242859200596),
-                  (0.187404618995, -0.245826175474),
-                  (0.1813354856, -0.245852843833),
-                  (0.175264315409, -0.245878622804),
-                  (0.169191174943, -0.24590351565),
-                  (0.163116130592, -0.245927525584),
-                  (0.157039248622, -0.245950655761),
-                  (0.150960595201, -0.245972909278),
-                  (0.1448802364, -0.245994289165),
-                  (0.138798238217, -0.246014798386),
-                  (0.132714666581, -0.246034439829),
-                  (0.12662958737, -0.246053216307),
-                  (0.120543066419, -0.246071130552),
-                  (0.114455169534, -0.246088185209),
-                  (0.108365962504, -0.246104382835),
-                  (0.102275511106, -0.246119725897),
-                  (0.0961838811234, -0.246134216762),
-                  (0.090091138348, -0.246147857701),
-                  (0.0839973485942, -0.246160650879),
-                  (0.0779025777063, -0.246172598357),
-                  (0.0718068915676, -0.246183702088),
-                  (0.0657103561079, -0.24619396391),
-                  (0.0596130373119, -0.24620338555),
-                  (0.0535150012265, -0.246211968616),
-                  (0.0474163139672, -0.246219714596),
-                  (0.0413170417257, -0.246226624858),
-                  (0.0352172507752, -0.246232700644),
-                  (0.029117007477, -0.246237943073),
-                  (0.0230163782855, -0.246242353134),
-                  (0.0169154297535, -0.246245931687),
-                  (0.0108142285374, -0.246248679464),
-                  (0.00471284140113, -0.246250597063),
-                  (-0.00138866477951, -0.246251684949),
-                  (-0.00749022301292, -0.246251943455),
-                  (-0.00749062418694, -0.243279686236),
-                  (-0.0074910204973, -0.240306793531),
-                  (-0.00749141199938, -0.237333273502),
-                  (-0.00749179874882, -0.234359134297),
-                  (-0.00749218080159, -0.231384384046),
-                  (-0.00749255821387, -0.228409030867),
-                  (-0.00749293104204, -0.225433082861),
-                  (-0.00749329934251, -0.222456548115),
-                  (-0.00749366317177, -0.219479434703),
-                  (-0.00749402258637, -0.216501750682),
-                  (-0.0074943776427, -0.213523504097),
-                  (-0.00749472839703, -0.210544702979),
-                  (-0.00749507490553, -0.207565355345),
-                  (-0.00749541722408, -0.204585469199),
-                  (-0.00749575540829, -0.201605052531),
-                  (-0.00749608951347, -0.19862411332),
-                  (-0.00749641959453, -0.19564265953),
-                  (-0.00749674570591, -0.192660699116),
-                  (-0.00749706790165, -0.189678240017),
-                  (-0.00749738623523, -0.186695290162),
-                  (-0.0074977007595, -0.183711857468),
-                  (-0.00749801152679, -0.180727949841),
-                  (-0.00749831858874, -0.177743575175),
-                  (-0.00749862199626, -0.174758741353),
-                  (-0.00749892179957, -0.171773456246),
-                  (-0.00749921804805, -0.168787727716),
-                  (-0.00749951079032, -0.165801563615),
-                  (-0.00749980007416, -0.162814971782),
-                  (-0.00750008594633, -0.159827960048),
-                  (-0.00750036845284, -0.156840536235),
-                  (-0.00750064763858, -0.153852708152),
-                  (-0.00750092354758, -0.150864483603),
-                  (-0.00138730045512, -0.15086403347),
-                  (0.00472626736655, -0.150863103869),
-                  (0.0108397124665, -0.150861694614),
-                  (0.0169529675116, -0.150859805391),
-                  (0.0230659652855, -0.150857435762),
-                  (0.0291786386867, -0.150854585164),
-                  (0.0352909207265, -0.150851252913),
-                  (0.0414027445267, -0.150847438201),
-                  (0.0475140433172, -0.150843140102),
-                  (0.0536247504324, -0.150838357573),
-                  (0.0597347993085, -0.150833089453),
-                  (0.0658441234792, -0.150827334471),
-                  (0.0719526565719, -0.150821091242),
-                  (0.0780603323029, -0.150814358276),
-                  (0.0841670844731, -0.150807133975),
-                  (0.0902728469618, -0.150799416643),
-                  (0.0963775537219, -0.150791204483),
-                  (0.102481138773, -0.150782495602),
-                  (0.108583536196, -0.15077328802),
-                  (0.114684680123, -0.150763579665),
-                  (0.120784504736, -0.150753368385),
-                  (0.126882944253, -0.150742651948),
-                  (0.13297993292, -0.150731428045),
-                  (0.139075405009, -0.150719694301),
-                  (0.145169294799, -0.150707448272),
-                  (0.151261536575, -0.150694687455),
-                  (0.157352064613, -0.150681409291),
-                  (0.16344081317, -0.15066761117),
-                  (0.169527716473, -0.150653290437),
-                  (0.175612708711, -0.150638444395),
-                  (0.181695724016, -0.150623070314),
-                  (0.187776696458, -0.150607165433)]},
- 34: {'color': 'violet',
-      'polygon': [(-0.0109948898159, -0.150885055847),
-                  (-0.0109926227084, -0.153873270396),
-                  (-0.0109903493576, -0.156861088346),
-                  (-0.0109880697254, -0.159848501893),
-                  (-0.010985783772, -0.162835503225),
-                  (-0.0109834914572, -0.16582208452),
-                  (-0.0109811927395, -0.168808237945),
-                  (-0.0109788875766, -0.171793955659),
-                  (-0.0109765759254, -0.174779229809),
-                  (-0.010974257742, -0.177764052533),
-                  (-0.0109719329815, -0.180748415958),
-                  (-0.0109696015986, -0.183732312199),
-                  (-0.0109672635468, -0.186715733361),
-                  (-0.0109649187794, -0.189698671538),
-                  (-0.0109625672488, -0.192681118811),
-                  (-0.0109602089068, -0.195663067252),
-                  (-0.0109578437049, -0.198644508917),
-                  (-0.0109554715938, -0.201625435854),
-                  (-0.0109530925239, -0.204605840097),
-                  (-0.0109507064453, -0.207585713666),
-                  (-0.0109483133074, -0.21056504857),
-                  (-0.0109459130598, -0.213543836805),
-                  (-0.0109435056513, -0.216522070352),
-                  (-0.0109410910308, -0.219499741181),
-                  (-0.0109386691471, -0.222476841247),
-                  (-0.0109362399488, -0.22545336249),
-                  (-0.0109338033843, -0.228429296838),
-                  (-0.0109313594024, -0.231404636203),
-                  (-0.0109289079516, -0.234379372484),
-                  (-0.0109264489806, -0.237353497563),
-                  (-0.0109239824385, -0.24032700331),
-                  (-0.0109215082744, -0.243299881576),
-                  (-0.0109190264377, -0.246272124199),
-                  (-0.0170205259275, -0.246274776579),
-                  (-0.0231219041332, -0.246276599646),
-                  (-0.0292230936242, -0.246277593208),
-                  (-0.0353240268404, -0.24627775694),
-                  (-0.0414246360902, -0.246277090382),
-                  (-0.0475248535485, -0.246275592935),
-                  (-0.0536246112546, -0.246273263869),
-                  (-0.059723841111, -0.246270102318),
-                  (-0.0658224748822, -0.246266107283),
-                  (-0.071920444193, -0.246261277631),
-                  (-0.0780176805281, -0.246255612099),
-                  (-0.0841141152311, -0.246249109293),
-                  (-0.0902096795038, -0.246241767689),
-                  (-0.0963043044059, -0.246233585635),
-                  (-0.102397920854, -0.246224561355),
-                  (-0.108490459623, -0.246214692947),
-                  (-0.114581851344, -0.246203978386),
-                  (-0.120672026504, -0.24619241553),
-                  (-0.126760915448, -0.246180002114),
-                  (-0.132848448378, -0.24616673576),
-                  (-0.138934555353, -0.246152613975),
-                  (-0.145019166287, -0.246137634157),
-                  (-0.151102210953, -0.246121793594),
-                  (-0.157183618979, -0.246105089467),
-                  (-0.16326331985, -0.246087518855),
-                  (-0.16934124291, -0.246069078738),
-                  (-0.175417317355, -0.246049765996),
-                  (-0.181491472242, -0.246029577417),
-                  (-0.187563636478, -0.246008509697),
-                  (-0.193633738829, -0.245986559442),
-                  (-0.199701707914, -0.245963723177),
-                  (-0.205767472204, -0.245939997342),
-                  (-0.205784756892, -0.242974109153),
-                  (-0.205801856049, -0.240007571572),
-                  (-0.205818769777, -0.237040392907),
-                  (-0.205835498176, -0.234072581451),
-                  (-0.205852041342, -0.231104145489),
-                  (-0.205868399373, -0.22813509329),
-                  (-0.205884572359, -0.225165433112),
-                  (-0.205900560393, -0.222195173201),
-                  (-0.205916363563, -0.219224321792),
-                  (-0.205931981956, -0.216252887108),
-                  (-0.205947415655, -0.213280877358),
-                  (-0.205962664744, -0.210308300743),
-                  (-0.205977729302, -0.20733516545),
-                  (-0.205992609409, -0.204361479658),
-                  (-0.20600730514, -0.201387251532),
-                  (-0.20602181657, -0.198412489228),
-                  (-0.20603614377, -0.19543720089),
-                  (-0.206050286813, -0.192461394653),
-                  (-0.206064245766, -0.18948507864),
-                  (-0.206078020696, -0.186508260965),
-                  (-0.206091611668, -0.183530949731),
-                  (-0.206105018745, -0.180553153032),
-                  (-0.206118241989, -0.177574878951),
-                  (-0.206131281459, -0.174596135561),
-                  (-0.206144137212, -0.171616930929),
-                  (-0.206156809306, -0.168637273107),
-                  (-0.206169297794, -0.165657170141),
-                  (-0.206181602729, -0.162676630068),
-                  (-0.206193724163, -0.159695660915),
-                  (-0.206205662144, -0.156714270699),
-                  (-0.206217416721, -0.153732467431),
-                  (-0.206228987941, -0.150750259111),
-                  (-0.200151202135, -0.150762395355),
-                  (-0.194071211743, -0.150773993952),
-                  (-0.187989087731, -0.150785058076),
-                  (-0.18190490097, -0.150795590852),
-                  (-0.175818722238, -0.150805595349),
-                  (-0.169730622223, -0.150815074577),
-                  (-0.163640671517, -0.150824031481),
-                  (-0.157548940622, -0.15083246894),
-                  (-0.151455499944, -0.150840389759),
-                  (-0.145360419795, -0.150847796666),
-                  (-0.139263770389, -0.15085469231),
-                  (-0.133165621846, -0.150861079255),
-                  (-0.127066044183, -0.150866959978),
-                  (-0.120965107322, -0.150872336864),
-                  (-0.114862881079, -0.150877212201),
-                  (-0.10875943517, -0.150881588181),
-                  (-0.102654839205, -0.150885466895),
-                  (-0.0965491626873, -0.150888850326),
-                  (-0.0904424750133, -0.150891740354),
-                  (-0.0843348454695, -0.150894138747),
-                  (-0.0782263432313, -0.150896047159),
-                  (-0.0721170373619, -0.150897467132),
-                  (-0.0660069968101, -0.150898400089),
-                  (-0.0598962904098, -0.150898847335),
-                  (-0.0537849868782, -0.150898810054),
-                  (-0.0476731548148, -0.150898289309),
-                  (-0.0415608627008, -0.150897286037),
-                  (-0.0354481788977, -0.150895801052),
-                  (-0.029335171647, -0.150893835043),
-                  (-0.0232219090698, -0.15089138857),
-                  (-0.0171084591663, -0.15088846207),
-                  (-0.0109948898159, -0.150885055847)]},
- 35: {'color': 'violet',
-      'polygon': [(-0.220309114581, -0.15063784261),
-                  (-0.220296144559, -0.153619198065),
-                  (-0.220282978384, -0.156600147954),
-                  (-0.220269616004, -0.159580684254),
-                  (-0.220256057367, -0.162560798933),
-                  (-0.220242302419, -0.16554048395),
-                  (-0.220228351103, -0.168519731257),
-                  (-0.220214203363, -0.171498532795),
-                  (-0.220199859138, -0.174476880496),
-                  (-0.220185318366, -0.177454766282),
-                  (-0.220170580986, -0.180432182068),
-                  (-0.220155646932, -0.183409119757),
-                  (-0.220140516137, -0.186385571244),
-                  (-0.220125188531, -0.189361528412),
-                  (-0.220109664045, -0.192336983136),
-                  (-0.220093942605, -0.19531192728),
-                  (-0.220078024136, -0.198286352698),
-                  (-0.220061908562, -0.201260251234),
-                  (-0.220045595804, -0.204233614721),
-                  (-0.220029085779, -0.207206434981),
-                  (-0.220012378406, -0.210178703826),
-                  (-0.219995473598, -0.213150413057),
-                  (-0.219978371268, -0.216121554464),
-                  (-0.219961071326, -0.219092119825),
-                  (-0.21994357368, -0.222062100907),
-                  (-0.219925878235, -0.225031489466),
-                  (-0.219907984895, -0.228000277246),
-                  (-0.219889893561, -0.23096845598),
-                  (-0.21987160413, -0.233936017387),
-                  (-0.219853116499, -0.236902953178),
-                  (-0.219834430562, -0.239869255046),
-                  (-0.21981554621, -0.242834914676),
-                  (-0.219796463331, -0.24579992374),
-                  (-0.225854410416, -0.245774725139),
-                  (-0.231909841937, -0.245748620641),
-                  (-0.23796268556, -0.245721606291),
-                  (-0.24401286879, -0.245693678072),
-                  (-0.250060318972, -0.24566483191),
-                  (-0.256104963284, -0.245635063674),
-                  (-0.262146728734, -0.245604369183),
-                  (-0.268185542158, -0.245572744208),
-                  (-0.274221330212, -0.245540184475),
-                  (-0.28025401937, -0.245506685664),
-                  (-0.286283535917, -0.245472243421),
-                  (-0.292309805942, -0.24543685335),
-                  (-0.298332755332, -0.245400511025),
-                  (-0.304352309764, -0.245363211986),
-                  (-0.310368394701, -0.245324951746),
-                  (-0.316380935377, -0.245285725791),
-                  (-0.322389856794, -0.245245529581),
-                  (-0.328395083707, -0.245204358557),
-                  (-0.334396540618, -0.245162208137),
-                  (-0.340394151763, -0.245119073722),
-                  (-0.3463878411, -0.245074950696),
-                  (-0.352377532296, -0.245029834425),
-                  (-0.358363148714, -0.244983720265),
-                  (-0.364344613399, -0.244936603554),
-                  (-0.370321849062, -0.244888479621),
-                  (-0.376294778066, -0.244839343779),
-                  (-0.382263322407, -0.244789191332),
-                  (-0.388227403696, -0.244738017571),
-                  (-0.394186943143, -0.244685817773),
-                  (-0.400141861535, -0.244632587204),
-                  (-0.406092079214, -0.244578321115),
-                  (-0.41203751606, -0.244523014743),
-                  (-0.412071751515, -0.241576763494),
-                  (-0.41210559902, -0.238629833675),
-                  (-0.412139059026, -0.235682234084),
-                  (-0.412172131978, -0.232733973506),
-                  (-0.412204818312, -0.229785060714),
-                  (-0.412237118459, -0.226835504466),
-                  (-0.412269032841, -0.223885313511),
-                  (-0.412300561875, -0.220934496583),
-                  (-0.41233170597, -0.217983062403),
-                  (-0.412362465529, -0.215031019681),
-                  (-0.412392840947, -0.212078377116),
-                  (-0.412422832615, -0.209125143392),
-                  (-0.412452440915, -0.206171327183),
-                  (-0.412481666224, -0.203216937151),
-                  (-0.412510508911, -0.200261981945),
-                  (-0.412538969341, -0.197306470204),
-                  (-0.41256704787, -0.194350410553),
-                  (-0.41259474485, -0.191393811607),
-                  (-0.412622060625, -0.188436681969),
-                  (-0.412648995534, -0.185479030232),
-                  (-0.41267554991, -0.182520864975),
-                  (-0.412701724079, -0.179562194768),
-                  (-0.412727518361, -0.176603028168),
-                  (-0.412752933071, -0.173643373723),
-                  (-0.412777968517, -0.170683239967),
-                  (-0.412802625002, -0.167722635425),
-                  (-0.412826902823, -0.164761568612),
-                  (-0.412850802272, -0.161800048029),
-                  (-0.412874323632, -0.158838082169),
-                  (-0.412897467185, -0.155875679514),
-                  (-0.412920233204, -0.152912848533),
-                  (-0.412942621957, -0.149949597687),
-                  (-0.406984410121, -0.149980667568),
-                  (-0.40102147114, -0.15001109247),
-                  (-0.395053882717, -0.150040874744),
-                  (-0.389081722132, -0.150070016816),
-                  (-0.383105066266, -0.150098521181),
-                  (-0.377123991616, -0.150126390407),
-                  (-0.371138574327, -0.150153627131),
-                  (-0.365148890203, -0.150180234057),
-                  (-0.359155014727, -0.150206213958),
-                  (-0.353157023087, -0.150231569671),
-                  (-0.347154990182, -0.150256304093),
-                  (-0.341148990646, -0.150280420185),
-                  (-0.335139098861, -0.150303920963),
-                  (-0.32912538897, -0.150326809497),
-                  (-0.323107934893, -0.150349088911),
-                  (-0.317086810338, -0.150370762375),
-                  (-0.311062088813, -0.150391833104),
-                  (-0.305033843638, -0.150412304353),
-                  (-0.299002147955, -0.150432179417),
-                  (-0.292967074738, -0.150451461621),
-                  (-0.286928696799, -0.150470154321),
-                  (-0.280887086801, -0.150488260898),
-                  (-0.274842317264, -0.150505784753),
-                  (-0.268794460569, -0.150522729304),
-                  (-0.262743588969, -0.150539097979),
-                  (-0.256689774589, -0.150554894215),
-                  (-0.250633089439, -0.150570121452),
-                  (-0.24457360541, -0.150584783127),
-                  (-0.238511394287, -0.15059888267),
-                  (-0.232446527743, -0.150612423499),
-                  (-0.226379077351, -0.150625409019),
-                  (-0.220309114581, -0.15063784261)]},
- 36: {'color': 'violet',
-      'polygon': [(-0.426611617968, -0.149914013303),
-                  (-0.426589713646, -0.152875491307),
-                  (-0.426567418314, -0.155836547726),
-                  (-0.426544731676, -0.158797174058),
-                  (-0.426521653429, -0.16175736179),
-                  (-0.426498183264, -0.1647171024),
-                  (-0.426474320864, -0.167676387351),
-                  (-0.42645006591, -0.170635208099),
-                  (-0.426425418071, -0.173593556086),
-                  (-0.426400377016, -0.176551422746),
-                  (-0.426374942402, -0.179508799498),
-                  (-0.426349113884, -0.182465677753),
-                  (-0.426322891108, -0.185422048908),
-                  (-0.426296273714, -0.188377904351),
-                  (-0.426269261335, -0.191333235457),
-                  (-0.4262418536, -0.194288033588),
-                  (-0.426214050129, -0.197242290099),
-                  (-0.426185850535, -0.200195996327),
-                  (-0.426157254426, -0.203149143604),
-                  (-0.426128261402, -0.206101723244),
-                  (-0.426098871056, -0.209053726552),
-                  (-0.426069082976, -0.212005144822),
-                  (-0.42603889674, -0.214955969334),
-                  (-0.426008311923, -0.217906191355),
-                  (-0.425977328088, -0.220855802143),
-                  (-0.425945944795, -0.22380479294),
-                  (-0.425914161595, -0.226753154979),
-                  (-0.425881978033, -0.229700879476),
-                  (-0.425849393645, -0.232647957639),
-                  (-0.425816407961, -0.23559438066),
-                  (-0.425783020502, -0.23854013972),
-                  (-0.425749230784, -0.241485225985),
-                  (-0.425715038313, -0.244429630611),
-                  (-0.431644127969, -0.244368375305),
-                  (-0.437568086916, -0.244306060217),
-                  (-0.443486832167, -0.244242680499),
-                  (-0.449400280106, -0.244178231275),
-                  (-0.45530834646, -0.244112707634),
-                  (-0.461210946269, -0.244046104628),
-                  (-0.467107993851, -0.243978417263),
-                  (-0.47299940277, -0.2439096405),
-                  (-0.478885085801, -0.243839769244),
-                  (-0.48476495489, -0.243768798343),
-                  (-0.490638921123, -0.243696722577),
-                  (-0.496506894678, -0.243623536652),
-                  (-0.502368784793, -0.243549235197),
-                  (-0.508224499714, -0.24347381275),
-                  (-0.514073946663, -0.243397263752),
-                  (-0.519917031781, -0.243319582541),
-                  (-0.525753660089, -0.243240763336),
-                  (-0.531583735437, -0.243160800234),
-                  (-0.537407160454, -0.243079687193),
-                  (-0.543223836497, -0.242997418027),
-                  (-0.549033663596, -0.242913986387),
-                  (-0.554836540402, -0.242829385755),
-                  (-0.560632364128, -0.242743609429),
-                  (-0.566421030491, -0.242656650506),
-                  (-0.572202433653, -0.242568501873),
-                  (-0.577976466156, -0.242479156189),
-                  (-0.583743018864, -0.242388605869),
-                  (-0.58950198089, -0.242296843069),
-                  (-0.595253239535, -0.242203859668),
-                  (-0.600996680215, -0.242109647253),
-                  (-0.606732186391, -0.242014197095),
-                  (-0.612459639494, -0.241917500136),
-                  (-0.612511721955, -0.239006177583),
-                  (-0.612563172053, -0.236094122271),
-                  (-0.612613990921, -0.233181343923),
-                  (-0.612664179677, -0.230267852243),
-                  (-0.612713739423, -0.227353656918),
-                  (-0.612762671251, -0.224438767619),
-                  (-0.612810976235, -0.221523193999),
-                  (-0.61285865544, -0.218606945696),
-                  (-0.612905709911, -0.215690032329),
-                  (-0.612952140686, -0.212772463504),
-                  (-0.612997948782, -0.209854248808),
-                  (-0.613043135208, -0.206935397812),
-                  (-0.613087700956, -0.204015920072),
-                  (-0.613131647005, -0.201095825127),
-                  (-0.613174974319, -0.198175122499),
-                  (-0.613217683849, -0.195253821697),
-                  (-0.613259776531, -0.19233193221),
-                  (-0.61330125329, -0.189409463516),
-                  (-0.613342115033, -0.186486425073),
-                  (-0.613382362654, -0.183562826325),
-                  (-0.613421997036, -0.180638676702),
-                  (-0.613461019044, -0.177713985615),
-                  (-0.613499429532, -0.174788762462),
-                  (-0.613537229338, -0.171863016625),
-                  (-0.613574419285, -0.16893675747),
-                  (-0.613611000186, -0.166009994349),
-                  (-0.613646972837, -0.163082736598),
-                  (-0.613682338019, -0.160154993538),
-                  (-0.613717096501, -0.157226774474),
-                  (-0.613751249037, -0.154298088696),
-                  (-0.613784796367, -0.151368945481),
-                  (-0.613817739216, -0.148439354089),
-                  (-0.608074001819, -0.148496068518),
-                  (-0.602322359081, -0.148552076926),
-                  (-0.596562926934, -0.148607382222),
-                  (-0.590795819249, -0.148661987102),
-                  (-0.585021147915, -0.14871589407),
-                  (-0.579239022914, -0.148769105452),
-                  (-0.573449552387, -0.14882162342),
-                  (-0.567652842712, -0.148873450006),
-                  (-0.561848998562, -0.148924587115),
-                  (-0.556038122979, -0.148975036548),
-                  (-0.550220317434, -0.149024800008),
-                  (-0.544395681892, -0.14907387912),
-                  (-0.538564314869, -0.149122275443),
-                  (-0.532726313494, -0.14916999048),
-                  (-0.526881773564, -0.149217025691),
-                  (-0.521030789603, -0.149263382508),
-                  (-0.515173454912, -0.149309062339),
-                  (-0.509309861621, -0.149354066582),
-                  (-0.503440100744, -0.149398396632),
-                  (-0.497564262224, -0.149442053892),
-                  (-0.491682434982, -0.149485039779),
-                  (-0.485794706962, -0.149527355733),
-                  (-0.479901165176, -0.149569003221),
-                  (-0.474001895747, -0.149609983746),
-                  (-0.468096983949, -0.149650298853),
-                  (-0.462186514252, -0.149689950131),
-                  (-0.456270570352, -0.149728939222),
-                  (-0.450349235215, -0.149767267819),
-                  (-0.444422591111, -0.149804937678),
-                  (-0.438490719649, -0.149841950613),
-                  (-0.432553701807, -0.149878308506),
-                  (-0.426611617968, -0.149914013303)]},
- 37: {'color': 'violet',
-      'polygon': [(-0.62712200826, -0.148249050955),
-                  (-0.627087772979, -0.151175744559),
-                  (-0.627052915318, -0.154101987417),
-                  (-0.62701743452, -0.157027770199),
-                  (-0.626981329813, -0.159953083558),
-                  (-0.626944600411, -0.162877918133),
-                  (-0.626907245515, -0.165802264547),
-                  (-0.626869264308, -0.168726113407),
-                  (-0.626830655961, -0.171649455306),
-                  (-0.62679141963, -0.174572280819),
-                  (-0.626751554455, -0.177494580508),
-                  (-0.626711059561, -0.180416344916),
-                  (-0.626669934061, -0.183337564575),
-                  (-0.626628177052, -0.186258229996),
-                  (-0.626585787616, -0.189178331677),
-                  (-0.62654276482, -0.1920978601),
-                  (-0.626499107719, -0.19501680573),
-                  (-0.62645481535, -0.197935159017),
-                  (-0.626409886738, -0.200852910392),
-                  (-0.626364320892, -0.203770050274),
-                  (-0.626318116809, -0.206686569062),
-                  (-0.626271273469, -0.20960245714),
-                  (-0.626223789837, -0.212517704877),
-                  (-0.626175664867, -0.215432302623),
-                  (-0.626126897496, -0.218346240713),
-                  (-0.626077486646, -0.221259509464),
-                  (-0.626027431228, -0.224172099176),
-                  (-0.625976730135, -0.227084000135),
-                  (-0.625925382248, -0.229995202606),
-                  (-0.625873386433, -0.232905696839),
-                  (-0.625820741541, -0.235815473066),
-                  (-0.62576744641, -0.238724521503),
-                  (-0.625713499863, -0.241632832347),
-                  (-0.631413340957, -0.241532774577),
-                  (-0.637104591409, -0.241431426158),
-                  (-0.642787120544, -0.241328775904),
-                  (-0.648460795148, -0.241224812159),
-                  (-0.654125479379, -0.24111952277),
-                  (-0.659781034682, -0.241012895067),
-                  (-0.665427319688, -0.24090491583),
-                  (-0.671064190127, -0.240795571267),
-                  (-0.676691498725, -0.240684846983),
-                  (-0.682309095108, -0.240572727953),
-                  (-0.687916825702, -0.240459198489),
-                  (-0.693514533622, -0.240344242213),
-                  (-0.699102058576, -0.240227842024),
-                  (-0.704679236745, -0.240109980065),
-                  (-0.710245900683, -0.23999063769),
-                  (-0.715801879197, -0.239869795429),
-                  (-0.72134699723, -0.239747432955),
-                  (-0.726881075751, -0.239623529046),
-                  (-0.732403931624, -0.239498061548),
-                  (-0.737915377493, -0.239371007337),
-                  (-0.743415221651, -0.23924234228),
-                  (-0.748903267915, -0.239112041197),
-                  (-0.754379315494, -0.238980077816),
-                  (-0.759843158855, -0.238846424736),
-                  (-0.765294587589, -0.238711053379),
-                  (-0.77073338627, -0.23857393395),
-                  (-0.776159334316, -0.23843503539),
-                  (-0.781572205843, -0.23829432533),
-                  (-0.786971769521, -0.238151770047),
-                  (-0.792357788423, -0.238007334411),
-                  (-0.797730019874, -0.23786098184),
-                  (-0.803088215294, -0.237712674247),
-                  (-0.803166383797, -0.234857656927),
-                  (-0.803243596462, -0.232001792219),
-                  (-0.803319854825, -0.229145091383),
-                  (-0.803395160407, -0.226287565654),
-                  (-0.803469514712, -0.223429226243),
-                  (-0.803542919233, -0.220570084337),
-                  (-0.803615375444, -0.2177101511),
-                  (-0.803686884807, -0.21484943767),
-                  (-0.803757448766, -0.211987955165),
-                  (-0.80382706875, -0.209125714676),
-                  (-0.803895746174, -0.206262727273),
-                  (-0.803963482434, -0.203399004002),
-                  (-0.804030278912, -0.200534555889),
-                  (-0.804096136971, -0.197669393932),
-                  (-0.804161057959, -0.194803529111),
-                  (-0.804225043208, -0.191936972382),
-                  (-0.804288094029, -0.189069734679),
-                  (-0.804350211721, -0.186201826912),
-                  (-0.804411397562, -0.183333259972),
-                  (-0.804471652811, -0.180464044726),
-                  (-0.804530978714, -0.17759419202),
-                  (-0.804589376494, -0.174723712678),
-                  (-0.804646847359, -0.171852617503),
-                  (-0.804703392498, -0.168980917276),
-                  (-0.804759013079, -0.166108622757),
-                  (-0.804813710255, -0.163235744686),
-                  (-0.804867485157, -0.16036229378),
-                  (-0.804920338899, -0.157488280735),
-                  (-0.804972272575, -0.154613716229),
-                  (-0.805023287259, -0.151738610917),
-                  (-0.805073384007, -0.148862975433),
-                  (-0.805122563855, -0.145986820392),
-                  (-0.799741767198, -0.146072059205),
-                  (-0.7943471436, -0.146156157099),
-                  (-0.788938940783, -0.146239142988),
-                  (-0.783517400515, -0.146321044307),
-                  (-0.778082758759, -0.146401887078),
-                  (-0.772635245825, -0.146481695952),
-                  (-0.76717508652, -0.146560494275),
-                  (-0.761702500292, -0.146638304128),
-                  (-0.756217701369, -0.146715146388),
-                  (-0.75072089891, -0.14679104077),
-                  (-0.745212297132, -0.146866005879),
-                  (-0.739692095452, -0.146940059256),
-                  (-0.73416048862, -0.147013217423),
-                  (-0.728617666846, -0.147085495931),
-                  (-0.723063815933, -0.147156909398),
-                  (-0.717499117401, -0.147227471556),
-                  (-0.711923748608, -0.147297195293),
-                  (-0.706337882875, -0.147366092687),
-                  (-0.700741689605, -0.147434175051),
-                  (-0.695135334397, -0.147501452969),
-                  (-0.689518979159, -0.147567936333),
-                  (-0.683892782225, -0.147633634378),
-                  (-0.678256898461, -0.147698555717),
-                  (-0.672611479374, -0.147762708374),
-                  (-0.666956673214, -0.14782609982),
-                  (-0.661292625081, -0.147888737001),
-                  (-0.655619477025, -0.147950626368),
-                  (-0.649937368141, -0.14801177391),
-                  (-0.64424643467, -0.148072185181),
-                  (-0.63854681009, -0.148131865328),
-                  (-0.632838625211, -0.148190819115),
-                  (-0.62712200826, -0.148249050955)]},
- 38: {'color': 'skyblue',
-      'polygon': [(0.789042491986, -0.0494619344669),
-                  (0.789027435415, -0.0523533406028),
-                  (0.789011501503, -0.05524457359),
-                  (0.788994689859, -0.0581356238067),
-                  (0.788977000082, -0.0610264816174),
-                  (0.788958431753, -0.0639171373723),
-                  (0.788938984444, -0.0668075814071),
-                  (0.788918657711, -0.0696978040421),
-                  (0.788897451099, -0.0725877955821),
-                  (0.788875364139, -0.075477546316),
-                  (0.788852396351, -0.0783670465159),
-                  (0.788828547241, -0.081256286437),
-                  (0.788803816304, -0.0841452563171),
-                  (0.788778203022, -0.0870339463761),
-                  (0.788751706866, -0.0899223468154),
-                  (0.788724327294, -0.0928104478178),
-                  (0.788696063753, -0.0956982395467),
-                  (0.788666915679, -0.098585712146),
-                  (0.788636882497, -0.101472855739),
-                  (0.788605963619, -0.10435966043),
-                  (0.788574158449, -0.1072461163),
-                  (0.788541466379, -0.11013221341),
-                  (0.788507886789, -0.1130179418),
-                  (0.788473419052, -0.115903291485),
-                  (0.788438062527, -0.118788252462),
-                  (0.788401816567, -0.1216728147),
-                  (0.788364680513, -0.124556968147),
-                  (0.788326653697, -0.127440702728),
-                  (0.788287735442, -0.130324008343),
-                  (0.788247925062, -0.133206874866),
-                  (0.788207221862, -0.136089292149),
-                  (0.788165625139, -0.138971250016),
-                  (0.78812313418, -0.141852738268),
-                  (0.782711111048, -0.141942530906),
-                  (0.777286360922, -0.142030790984),
-                  (0.771849048211, -0.142117582923),
-                  (0.766399336497, -0.142202967677),
-                  (0.760937388477, -0.14228700287),
-                  (0.755463365906, -0.142369742934),
-                  (0.749977429542, -0.142451239238),
-                  (0.7444797391, -0.142531540222),
-                  (0.7389704532, -0.142610691514),
-                  (0.733449729326, -0.142688736057),
-                  (0.727917723784, -0.142765714222),
-                  (0.722374591661, -0.142841663924),
-                  (0.716820486793, -0.142916620731),
-                  (0.711255561729, -0.142990617971),
-                  (0.705679967701, -0.143063686836),
-                  (0.700093854595, -0.143135856482),
-                  (0.694497370925, -0.143207154123),
-                  (0.688890663814, -0.143277605129),
-                  (0.683273878965, -0.143347233115),
-                  (0.677647160648, -0.14341606003),
-                  (0.672010651681, -0.143484106237),
-                  (0.666364493415, -0.143551390602),
-                  (0.660708825721, -0.143617930567),
-                  (0.655043786981, -0.14368374223),
-                  (0.649369514075, -0.143748840417),
-                  (0.643686142379, -0.143813238755),
-                  (0.637993805757, -0.143876949737),
-                  (0.632292636555, -0.143939984791),
-                  (0.626582765602, -0.144002354341),
-                  (0.62086432221, -0.14406406787),
-                  (0.615137434172, -0.14412513398),
-                  (0.609402227766, -0.144185560444),
-                  (0.609430794342, -0.141255551074),
-                  (0.609458751096, -0.138325128847),
-                  (0.609486098662, -0.135394302695),
-                  (0.609512837663, -0.132463081532),
-                  (0.609538968709, -0.129531474251),
-                  (0.609564492399, -0.126599489727),
-                  (0.609589409318, -0.123667136813),
-                  (0.60961372004, -0.120734424344),
-                  (0.609637425128, -0.117801361139),
-                  (0.609660525129, -0.114867955997),
-                  (0.609683020582, -0.111934217698),
-                  (0.609704912012, -0.109000155008),
-                  (0.609726199932, -0.106065776674),
-                  (0.609746884842, -0.103131091428),
-                  (0.60976696723, -0.100196107985),
-                  (0.609786447575, -0.0972608350457),
-                  (0.609805326339, -0.0943252812955),
-                  (0.609823603976, -0.091389455405),
-                  (0.609841280925, -0.0884533660308),
-                  (0.609858357614, -0.085517021816),
-                  (0.60987483446, -0.0825804313903),
-                  (0.609890711866, -0.0796436033708),
-                  (0.609905990224, -0.0767065463621),
-                  (0.609920669914, -0.0737692689571),
-                  (0.609934751302, -0.0708317797372),
-                  (0.609948234745, -0.0678940872727),
-                  (0.609961120585, -0.0649562001236),
-                  (0.609973409155, -0.0620181268395),
-                  (0.609985100772, -0.0590798759607),
-                  (0.609996195744, -0.0561414560181),
-                  (0.610006694366, -0.0532028755338),
-                  (0.61001659692, -0.0502641430217),
-                  (0.615760394613, -0.0502430717811),
-                  (0.621495959564, -0.0502218636809),
-                  (0.627223165229, -0.0502005151971),
-                  (0.632941883326, -0.0501790220188),
-                  (0.638651983821, -0.0501573789902),
-                  (0.644353334912, -0.0501355800483),
-                  (0.650045803015, -0.0501136181595),
-                  (0.655729252753, -0.050091485253),
-                  (0.661403546944, -0.0500691721519),
-                  (0.667068546588, -0.0500466685012),
-                  (0.672724110865, -0.0500239626935),
-                  (0.67837009712, -0.0500010417917),
-                  (0.684006360863, -0.049977891449),
-                  (0.68963275576, -0.0499544958256),
-                  (0.695249133632, -0.0499308375029),
-                  (0.700855344454, -0.0499068973943),
-                  (0.706451236354, -0.0498826546531),
-                  (0.712036655615, -0.0498580865767),
-                  (0.717611446678, -0.0498331685088),
-                  (0.723175452149, -0.0498078737363),
-                  (0.728728512807, -0.0497821733848),
-                  (0.734270467607, -0.0497560363096),
-                  (0.7398011537, -0.0497294289829),
-                  (0.74532040644, -0.0497023153783),
-                  (0.750828059401, -0.0496746568509),
-                  (0.756323944395, -0.049646412014),
-                  (0.761807891492, -0.0496175366117),
-                  (0.767279729041, -0.049587983388),
-                  (0.772739283697, -0.0495577019514),
-                  (0.778186380443, -0.0495266386358),
-                  (0.783620842627, -0.0494947363575),
-                  (0.789042491986, -0.0494619344669)]},
- 39: {'color': 'skyblue',
-      'polygon': [(0.596732681147, -0.0502177249925),
-                  (0.596724049641, -0.0531592158762),
-                  (0.596714839675, -0.0561005553835),
-                  (0.596705050976, -0.0590417350596),
-                  (0.596694683262, -0.0619827464423),
-                  (0.59668373624, -0.0649235810606),
-                  (0.596672209602, -0.0678642304349),
-                  (0.596660103033, -0.070804686076),
-                  (0.596647416202, -0.0737449394851),
-                  (0.596634148769, -0.0766849821532),
-                  (0.596620300383, -0.0796248055607),
-                  (0.596605870678, -0.0825644011768),
-                  (0.59659085928, -0.0855037604591),
-                  (0.596575265802, -0.0884428748535),
-                  (0.596559089844, -0.0913817357933),
-                  (0.596542330997, -0.0943203346988),
-                  (0.596524988839, -0.0972586629773),
-                  (0.596507062935, -0.100196712022),
-                  (0.59648855284, -0.103134473212),
-                  (0.596469458098, -0.106071937913),
-                  (0.596449778239, -0.109009097473),
-                  (0.596429512784, -0.111945943227),
-                  (0.596408661239, -0.114882466493),
-                  (0.596387223101, -0.117818658573),
-                  (0.596365197853, -0.120754510751),
-                  (0.59634258497, -0.123690014296),
-                  (0.59631938391, -0.126625160458),
-                  (0.596295594123, -0.12955994047),
-                  (0.596271215046, -0.132494345543),
-                  (0.596246246103, -0.135428366875),
-                  (0.596220686709, -0.138361995639),
-                  (0.596194536264, -0.141295222992),
-                  (0.596167794157, -0.14422804007),
-                  (0.590405965529, -0.144288308078),
-                  (0.584636345292, -0.144347963772),
-                  (0.578859051776, -0.144407011364),
-                  (0.573074201848, -0.144465454544),
-                  (0.567281910911, -0.144523296525),
-                  (0.561482292927, -0.144580540081),
-                  (0.555675460425, -0.144637187583),
-                  (0.549861524515, -0.144693241039),
-                  (0.544040594908, -0.144748702123),
-                  (0.538212779927, -0.144803572211),
-                  (0.532378186527, -0.144857852412),
-                  (0.526536920314, -0.144911543594),
-                  (0.520689085559, -0.144964646417),
-                  (0.514834785221, -0.145017161354),
-                  (0.508974120964, -0.145069088718),
-                  (0.503107193182, -0.145120428686),
-                  (0.497234101014, -0.145171181322),
-                  (0.49135494237, -0.145221346593),
-                  (0.485469813949, -0.145270924394),
-                  (0.479578811266, -0.145319914564),
-                  (0.47368202867, -0.145368316902),
-                  (0.467779559372, -0.145416131185),
-                  (0.461871495462, -0.14546335718),
-                  (0.455957927941, -0.145509994659),
-                  (0.450038946738, -0.145556043415),
-                  (0.444114640735, -0.145601503266),
-                  (0.438185097797, -0.145646374074),
-                  (0.432250404791, -0.145690655747),
-                  (0.426310647612, -0.145734348255),
-                  (0.42036591121, -0.145777451633),
-                  (0.414416279611, -0.145819965987),
-                  (0.408461835948, -0.145861891508),
-                  (0.40847802042, -0.14289801851),
-                  (0.408493831164, -0.139933761492),
-                  (0.408509268385, -0.136969128598),
-                  (0.408524332285, -0.134004127962),
-                  (0.408539023059, -0.131038767701),
-                  (0.408553340898, -0.128073055917),
-                  (0.408567285985, -0.125107000699),
-                  (0.408580858502, -0.122140610122),
-                  (0.408594058625, -0.119173892248),
-                  (0.408606886523, -0.116206855125),
-                  (0.408619342363, -0.113239506789),
-                  (0.408631426306, -0.110271855264),
-                  (0.40864313851, -0.107303908564),
-                  (0.408654479127, -0.104335674687),
-                  (0.408665448305, -0.101367161626),
-                  (0.408676046188, -0.0983983773576),
-                  (0.408686272916, -0.0954293298524),
-                  (0.408696128625, -0.0924600270695),
-                  (0.408705613446, -0.0894904769585),
-                  (0.408714727506, -0.0865206874603),
-                  (0.40872347093, -0.0835506665071),
-                  (0.408731843837, -0.0805804220227),
-                  (0.408739846342, -0.0776099619232),
-                  (0.408747478559, -0.074639294117),
-                  (0.408754740596, -0.0716684265056),
-                  (0.408761632557, -0.0686973669836),
-                  (0.408768154544, -0.0657261234393),
-                  (0.408774306653, -0.0627547037552),
-                  (0.40878008898, -0.059783115808),
-                  (0.408785501614, -0.0568113674694),
-                  (0.408790544643, -0.0538394666061),
-                  (0.40879521815, -0.0508674210805),
-                  (0.414756083513, -0.0508497690196),
-                  (0.420712169622, -0.0508319198826),
-                  (0.426663395253, -0.0508138756504),
-                  (0.432609678315, -0.0507956384471),
-                  (0.438550935824, -0.0507772105335),
-                  (0.444487083869, -0.0507585943013),
-                  (0.450418037592, -0.0507397922654),
-                  (0.456343711152, -0.0507208070552),
-                  (0.462264017704, -0.0507016414061),
-                  (0.468178869364, -0.0506822981483),
-                  (0.474088177183, -0.0506627801961),
-                  (0.479991851122, -0.0506430905352),
-                  (0.485889800017, -0.0506232322093),
-                  (0.491781931556, -0.0506032083051),
-                  (0.497668152248, -0.0505830219369),
-                  (0.503548367397, -0.0505626762292),
-                  (0.50942248107, -0.0505421742985),
-                  (0.515290396075, -0.0505215192333),
-                  (0.521152013926, -0.0505007140736),
-                  (0.527007234824, -0.0504797617879),
-                  (0.532855957622, -0.0504586652495),
-                  (0.538698079803, -0.0504374272114),
-                  (0.544533497451, -0.0504160502789),
-                  (0.550362105226, -0.0503945368815),
-                  (0.556183796338, -0.0503728892426),
-                  (0.561998462521, -0.0503511093477),
-                  (0.567805994009, -0.050329198911),
-                  (0.573606279512, -0.0503071593397),
-                  (0.579399206188, -0.0502849916976),
-                  (0.585184659627, -0.0502626966654),
-                  (0.590962523821, -0.0502402745002),
-                  (0.596732681147, -0.0502177249925)]},
- 40: {'color': 'skyblue',
-      'polygon': [(0.395037465145, -0.0509122461781),
-                  (0.395032291438, -0.0538859862351),
-                  (0.395026761359, -0.0568595821203),
-                  (0.395020874837, -0.0598330259996),
-                  (0.395014631798, -0.0628063100344),
-                  (0.395008032163, -0.0657794263814),
-                  (0.395001075853, -0.0687523671926),
-                  (0.394993762784, -0.0717251246145),
-                  (0.394986092868, -0.0746976907879),
-                  (0.394978066018, -0.0776700578473),
-                  (0.394969682138, -0.080642217921),
-                  (0.394960941134, -0.0836141631303),
-                  (0.394951842907, -0.0865858855892),
-                  (0.394942387352, -0.0895573774041),
-                  (0.394932574365, -0.0925286306734),
-                  (0.394922403835, -0.095499637487),
-                  (0.394911875651, -0.0984703899263),
-                  (0.394900989694, -0.101440880063),
-                  (0.394889745845, -0.10441109996),
-                  (0.394878143981, -0.10738104167),
-                  (0.394866183973, -0.110350697235),
-                  (0.394853865691, -0.113320058686),
-                  (0.394841188998, -0.116289118044),
-                  (0.394828153755, -0.119257867319),
-                  (0.394814759819, -0.122226298506),
-                  (0.394801007043, -0.125194403592),
-                  (0.394786895274, -0.128162174548),
-                  (0.394772424356, -0.131129603334),
-                  (0.394757594128, -0.134096681896),
-                  (0.394742404426, -0.137063402166),
-                  (0.39472685508, -0.140029756062),
-                  (0.394710945915, -0.142995735488),
-                  (0.394694676752, -0.145961332332),
-                  (0.388724900276, -0.145999757447),
-                  (0.382750659996, -0.1460375948),
-                  (0.376772034703, -0.146074845094),
-                  (0.370789102452, -0.146111509139),
-                  (0.364801940581, -0.146147587845),
-                  (0.35881062574, -0.146183082227),
-                  (0.352815233914, -0.146217993408),
-                  (0.346815840444, -0.146252322611),
-                  (0.340812520058, -0.146286071166),
-                  (0.334805346886, -0.146319240506),
-                  (0.328794394492, -0.146351832161),
-                  (0.322779735893, -0.146383847765),
-                  (0.316761443582, -0.146415289045),
-                  (0.31073958955, -0.146446157823),
-                  (0.304714245314, -0.146476456011),
-                  (0.298685481931, -0.14650618561),
-                  (0.292653370026, -0.146535348702),
-                  (0.286617979812, -0.146563947451),
-                  (0.28057938111, -0.146591984095),
-                  (0.274537643371, -0.146619460943),
-                  (0.268492835695, -0.146646380371),
-                  (0.262445026854, -0.146672744817),
-                  (0.256394285307, -0.146698556774),
-                  (0.250340679224, -0.146723818788),
-                  (0.244284276502, -0.146748533451),
-                  (0.238225144785, -0.146772703393),
-                  (0.23216335148, -0.146796331284),
-                  (0.226098963777, -0.14681941982),
-                  (0.220032048665, -0.146841971723),
-                  (0.213962672947, -0.146863989734),
-                  (0.207890903261, -0.146885476604),
-                  (0.201816806089, -0.146906435094),
-                  (0.201824221563, -0.143923430157),
-                  (0.201831453917, -0.140940053588),
-                  (0.201838503124, -0.137956313183),
-                  (0.201845369159, -0.134972216728),
-                  (0.201852051993, -0.131987771998),
-                  (0.201858551602, -0.129002986757),
-                  (0.201864867958, -0.12601786876),
-                  (0.201871001037, -0.123032425753),
-                  (0.201876950812, -0.120046665471),
-                  (0.201882717259, -0.11706059564),
-                  (0.201888300354, -0.114074223979),
-                  (0.201893700073, -0.111087558197),
-                  (0.201898916393, -0.108100605996),
-                  (0.201903949292, -0.105113375068),
-                  (0.201908798748, -0.1021258731),
-                  (0.201913464742, -0.0991381077706),
-                  (0.201917947253, -0.0961500867517),
-                  (0.201922246263, -0.0931618177085),
-                  (0.201926361755, -0.0901733082998),
-                  (0.201930293712, -0.0871845661786),
-                  (0.201934042118, -0.0841955989921),
-                  (0.201937606959, -0.0812064143821),
-                  (0.201940988223, -0.0782170199854),
-                  (0.201944185898, -0.0752274234338),
-                  (0.201947199972, -0.0722376323548),
-                  (0.201950030438, -0.0692476543717),
-                  (0.201952677287, -0.0662574971037),
-                  (0.201955140512, -0.0632671681665),
-                  (0.20195742011, -0.0602766751727),
-                  (0.201959516075, -0.0572860257315),
-                  (0.201961428406, -0.0542952274498),
-                  (0.201963157101, -0.0513042879317),
-                  (0.208043369539, -0.0512950733697),
-                  (0.21412124983, -0.0512856796445),
-                  (0.220196731762, -0.0512761045546),
-                  (0.226269749015, -0.051266345935),
-                  (0.232340235143, -0.0512564016638),
-                  (0.238408123563, -0.0512462696693),
-                  (0.244473347533, -0.0512359479365),
-                  (0.250535840144, -0.0512254345138),
-                  (0.256595534296, -0.0512147275195),
-                  (0.262652362686, -0.0512038251487),
-                  (0.268706257787, -0.0511927256796),
-                  (0.274757151832, -0.0511814274798),
-                  (0.280804976795, -0.0511699290124),
-                  (0.286849664371, -0.0511582288425),
-                  (0.292891145958, -0.051146325643),
-                  (0.298929352634, -0.0511342181998),
-                  (0.30496421514, -0.0511219054182),
-                  (0.310995663858, -0.0511093863276),
-                  (0.31702362879, -0.0510966600865),
-                  (0.323048039531, -0.0510837259878),
-                  (0.329068825257, -0.0510705834628),
-                  (0.335085914692, -0.0510572320853),
-                  (0.34109923609, -0.051043671576),
-                  (0.347108717213, -0.0510299018053),
-                  (0.353114285303, -0.0510159227966),
-                  (0.359115867059, -0.0510017347292),
-                  (0.365113388615, -0.0509873379399),
-                  (0.37110677551, -0.0509727329252),
-                  (0.377095952668, -0.0509579203423),
-                  (0.383080844369, -0.0509429010098),
-                  (0.389061374223, -0.050927675908),
-                  (0.395037465145, -0.0509122461781)]},
- 41: {'color': 'skyblue',
-      'polygon': [(0.187843242553, -0.0513506927467),
-                  (0.187841212118, -0.0543424390402),
-                  (0.187839010429, -0.0573340441861),
-                  (0.18783663749, -0.0603255005871),
-                  (0.187834093306, -0.0633168006431),
-                  (0.187831377884, -0.0663079367516),
-                  (0.187828491231, -0.0692989013071),
-                  (0.187825433358, -0.0722896867008),
-                  (0.187822204276, -0.0752802853206),
-                  (0.187818803998, -0.0782706895504),
-                  (0.187815232537, -0.08126089177),
-                  (0.187811489909, -0.084250884355),
-                  (0.187807576132, -0.0872406596762),
-                  (0.187803491223, -0.0902302100993),
-                  (0.187799235201, -0.0932195279848),
-                  (0.187794808088, -0.0962086056879),
-                  (0.187790209906, -0.0991974355576),
-                  (0.187785440678, -0.102186009937),
-                  (0.187780500428, -0.105174321162),
-                  (0.187775389182, -0.108162361563),
-                  (0.187770106965, -0.111150123462),
-                  (0.187764653806, -0.114137599176),
-                  (0.187759029733, -0.11712478101),
-                  (0.187753234775, -0.120111661266),
-                  (0.187747268962, -0.123098232234),
-                  (0.187741132325, -0.126084486198),
-                  (0.187734824894, -0.129070415431),
-                  (0.187728346703, -0.132056012198),
-                  (0.187721697783, -0.135041268756),
-                  (0.187714878168, -0.138026177349),
-                  (0.18770788789, -0.141010730213),
-                  (0.187700726984, -0.143994919574),
-                  (0.187693395484, -0.146978737646),
-                  (0.181612043373, -0.146996835893),
-                  (0.175528649638, -0.147014417299),
-                  (0.169443280198, -0.147031484578),
-                  (0.16335600091, -0.147048040415),
-                  (0.15726687758, -0.147064087462),
-                  (0.151175975973, -0.14707962833),
-                  (0.145083361829, -0.147094665586),
-                  (0.13898910087, -0.147109201746),
-                  (0.132893258812, -0.147123239273),
-                  (0.126795901376, -0.147136780568),
-                  (0.120697094296, -0.147149827966),
-                  (0.114596903328, -0.147162383736),
-                  (0.108495394261, -0.14717445007),
-                  (0.102392632923, -0.147186029081),
-                  (0.0962886851877, -0.147197122802),
-                  (0.0901836169861, -0.147207733175),
-                  (0.0840774943094, -0.147217862056),
-                  (0.077970383217, -0.147227511203),
-                  (0.0718623498425, -0.147236682277),
-                  (0.0657534603993, -0.147245376838),
-                  (0.0596437811855, -0.147253596341),
-                  (0.0535333785894, -0.147261342132),
-                  (0.047422319093, -0.14726861545),
-                  (0.0413106692768, -0.147275417418),
-                  (0.0351984958232, -0.147281749046),
-                  (0.0290858655196, -0.147287611225),
-                  (0.0229728452616, -0.147293004727),
-                  (0.0168595020557, -0.147297930203),
-                  (0.0107459030209, -0.147302388183),
-                  (0.00463211539167, -0.14730637907),
-                  (-0.00148179348142, -0.147309903145),
-                  (-0.00759575612972, -0.147312960562),
-                  (-0.00759731317476, -0.144323896035),
-                  (-0.00759886710648, -0.141334459856),
-                  (-0.00760041796084, -0.138344659791),
-                  (-0.00760196577278, -0.135354503596),
-                  (-0.00760351057599, -0.132363999019),
-                  (-0.00760505240297, -0.129373153801),
-                  (-0.00760659128508, -0.126381975675),
-                  (-0.00760812725241, -0.123390472365),
-                  (-0.00760966033377, -0.120398651591),
-                  (-0.00761119055682, -0.117406521062),
-                  (-0.00761271794781, -0.114414088484),
-                  (-0.00761424253176, -0.111421361554),
-                  (-0.00761576433237, -0.108428347963),
-                  (-0.00761728337201, -0.105435055398),
-                  (-0.00761879967175, -0.102441491536),
-                  (-0.00762031325124, -0.099447664051),
-                  (-0.00762182412888, -0.0964535806117),
-                  (-0.00762333232163, -0.0934592488804),
-                  (-0.0076248378451, -0.0904646765145),
-                  (-0.00762634071356, -0.0874698711668),
-                  (-0.00762784093988, -0.0844748404852),
-                  (-0.00762933853551, -0.0814795921132),
-                  (-0.0076308335106, -0.0784841336901),
-                  (-0.00763232587391, -0.0754884728511),
-                  (-0.00763381563274, -0.0724926172276),
-                  (-0.00763530279309, -0.0694965744474),
-                  (-0.00763678735956, -0.0665003521349),
-                  (-0.00763826933536, -0.0635039579111),
-                  (-0.00763974872237, -0.0605073993945),
-                  (-0.0076412255211, -0.0575106842004),
-                  (-0.00764269973067, -0.0545138199416),
-                  (-0.00764417134891, -0.0515168142289),
-                  (-0.00152398433363, -0.0515137008657),
-                  (0.00459615007503, -0.0515104624713),
-                  (0.0107161641065, -0.0515070989118),
-                  (0.0168359901003, -0.0515036099354),
-                  (0.0229555605057, -0.0514999951741),
-                  (0.0290748078818, -0.0514962541441),
-                  (0.0351936648968, -0.0514923862478),
-                  (0.0413120643269, -0.0514883907755),
-                  (0.0474299390557, -0.0514842669068),
-                  (0.053547222072, -0.0514800137135),
-                  (0.0596638464684, -0.0514756301617),
-                  (0.0657797454389, -0.0514711151144),
-                  (0.0718948522768, -0.0514664673347),
-                  (0.078009100371, -0.0514616854889),
-                  (0.0841224232036, -0.0514567681497),
-                  (0.0902347543454, -0.0514517138002),
-                  (0.0963460274527, -0.0514465208375),
-                  (0.102456176262, -0.0514411875766),
-                  (0.108565134586, -0.0514357122553),
-                  (0.114672836306, -0.0514300930381),
-                  (0.120779215371, -0.0514243280212),
-                  (0.126884205786, -0.0514184152374),
-                  (0.132987741609, -0.051412352661),
-                  (0.139089756941, -0.0514061382133),
-                  (0.145190185922, -0.051399769768),
-                  (0.151288962721, -0.0513932451566),
-                  (0.157386021527, -0.0513865621742),
-                  (0.163481296541, -0.0513797185858),
-                  (0.169574721965, -0.0513727121319),
-                  (0.175666231995, -0.0513655405348),
-                  (0.181755760809, -0.0513582015048),
-                  (0.187843242553, -0.0513506927467)]},
- 42: {'color': 'violet',
-      'polygon': [(-0.0110711296209, -0.051652159518),
-                  (-0.0110703596472, -0.054649154431),
-                  (-0.0110695839592, -0.0576460075196),
-                  (-0.011068802557, -0.0606427111716),
-                  (-0.0110680154397, -0.0636392577719),
-                  (-0.0110672226048, -0.0666356397032),
-                  (-0.0110664240485, -0.0696318493455),
-                  (-0.0110656197658, -0.0726278790754),
-                  (-0.0110648097502, -0.0756237212666),
-                  (-0.0110639939939, -0.0786193682892),
-                  (-0.0110631724878, -0.08161481251),
-                  (-0.0110623452214, -0.0846100462914),
-                  (-0.0110615121828, -0.0876050619922),
-                  (-0.0110606733587, -0.0905998519669),
-                  (-0.0110598287346, -0.0935944085653),
-                  (-0.0110589782945, -0.0965887241325),
-                  (-0.011058122021, -0.0995827910091),
-                  (-0.0110572598956, -0.10257660153),
-                  (-0.0110563918981, -0.105570148026),
-                  (-0.0110555180073, -0.10856342282),
-                  (-0.0110546382004, -0.111556418231),
-                  (-0.0110537524536, -0.114549126573),
-                  (-0.0110528607413, -0.117541540151),
-                  (-0.0110519630371, -0.120533651266),
-                  (-0.011051059313, -0.123525452211),
-                  (-0.01105014954, -0.126516935272),
-                  (-0.0110492336875, -0.129508092731),
-                  (-0.0110483117238, -0.132498916858),
-                  (-0.0110473836162, -0.13548939992),
-                  (-0.0110464493305, -0.138479534173),
-                  (-0.0110455088315, -0.141469311867),
-                  (-0.0110445620827, -0.144458725244),
-                  (-0.0110436090467, -0.147447766537),
-                  (-0.0171575084714, -0.147448543412),
-                  (-0.0232712884344, -0.147448852996),
-                  (-0.0293848810411, -0.14744869501),
-                  (-0.0354982182763, -0.147448069043),
-                  (-0.0416112320046, -0.147446974562),
-                  (-0.0477238539706, -0.147445410905),
-                  (-0.0538360157992, -0.147443377285),
-                  (-0.0599476489967, -0.147440872792),
-                  (-0.0660586849513, -0.14743789639),
-                  (-0.0721690549345, -0.147434446925),
-                  (-0.0782786901019, -0.14743052312),
-                  (-0.0843875214946, -0.14742612358),
-                  (-0.0904954800411, -0.147421246793),
-                  (-0.0966024965577, -0.147415891134),
-                  (-0.102708501751, -0.147410054866),
-                  (-0.10881342622, -0.147403736141),
-                  (-0.114917200455, -0.147396933005),
-                  (-0.121019754842, -0.1473896434),
-                  (-0.127121019666, -0.147381865167),
-                  (-0.133220925105, -0.14737359605),
-                  (-0.139319401242, -0.147364833697),
-                  (-0.145416378059, -0.147355575668),
-                  (-0.151511785439, -0.147345819432),
-                  (-0.157605553172, -0.147335562377),
-                  (-0.163697610952, -0.147324801811),
-                  (-0.16978788838, -0.147313534967),
-                  (-0.175876314964, -0.147301759004),
-                  (-0.18196282012, -0.147289471016),
-                  (-0.188047333174, -0.147276668034),
-                  (-0.194129783359, -0.14726334703),
-                  (-0.200210099818, -0.147249504921),
-                  (-0.206288211605, -0.147235138577),
-                  (-0.206298090612, -0.144252080986),
-                  (-0.206307786241, -0.141268643561),
-                  (-0.206317298536, -0.138284834269),
-                  (-0.20632662754, -0.135300661068),
-                  (-0.206335773292, -0.132316131907),
-                  (-0.206344735834, -0.129331254731),
-                  (-0.206353515203, -0.126346037472),
-                  (-0.206362111435, -0.12336048806),
-                  (-0.206370524568, -0.120374614414),
-                  (-0.206378754634, -0.117388424446),
-                  (-0.206386801668, -0.114401926063),
-                  (-0.206394665701, -0.111415127163),
-                  (-0.206402346764, -0.108428035638),
-                  (-0.206409844886, -0.105440659374),
-                  (-0.206417160096, -0.102453006249),
-                  (-0.206424292422, -0.0994650841357),
-                  (-0.206431241889, -0.0964769009004),
-                  (-0.206438008523, -0.0934884644027),
-                  (-0.206444592348, -0.0904997824968),
-                  (-0.206450993388, -0.0875108630307),
-                  (-0.206457211663, -0.0845217138469),
-                  (-0.206463247197, -0.0815323427822),
-                  (-0.206469100009, -0.0785427576681),
-                  (-0.206474770118, -0.0755529663309),
-                  (-0.206480257544, -0.0725629765915),
-                  (-0.206485562304, -0.0695727962661),
-                  (-0.206490684414, -0.0665824331659),
-                  (-0.206495623892, -0.0635918950976),
-                  (-0.206500380752, -0.0606011898633),
-                  (-0.20650495501, -0.0576103252606),
-                  (-0.206509346678, -0.0546193090831),
-                  (-0.206513555771, -0.0516281491203),
-                  (-0.200429304524, -0.0516312867998),
-                  (-0.194342848077, -0.0516342472696),
-                  (-0.188254256955, -0.0516370332274),
-                  (-0.182163601623, -0.0516396473469),
-                  (-0.176070952482, -0.0516420922721),
-                  (-0.169976379869, -0.0516443706116),
-                  (-0.163879954062, -0.0516464849331),
-                  (-0.157781745271, -0.0516484377584),
-                  (-0.151681823645, -0.0516502315584),
-                  (-0.145580259266, -0.0516518687474),
-                  (-0.139477122149, -0.0516533516789),
-                  (-0.133372482242, -0.0516546826407),
-                  (-0.127266409422, -0.0516558638501),
-                  (-0.121158973495, -0.0516568974496),
-                  (-0.115050244192, -0.0516577855031),
-                  (-0.10894029117, -0.0516585299911),
-                  (-0.102829184007, -0.0516591328075),
-                  (-0.0967169922029, -0.0516595957555),
-                  (-0.0906037851729, -0.0516599205444),
-                  (-0.0844896322496, -0.0516601087863),
-                  (-0.0783746026784, -0.0516601619928),
-                  (-0.0722587656159, -0.0516600815727),
-                  (-0.0661421901276, -0.0516598688288),
-                  (-0.0600249451857, -0.0516595249558),
-                  (-0.0539070996672, -0.0516590510381),
-                  (-0.0477887223514, -0.051658448048),
-                  (-0.0416698819183, -0.0516577168438),
-                  (-0.0355506469468, -0.0516568581686),
-                  (-0.0294310859128, -0.0516558726486),
-                  (-0.0233112671879, -0.0516547607928),
-                  (-0.0171912590378, -0.051653522992),
-                  (-0.0110711296209, -0.051652159518)]},
- 43: {'bad_channels': [3, 4],
-      'color': 'red',
-      'polygon': [(-0.220597706093, -0.0515874068469),
-                  (-0.220593492809, -0.0545777187323),
-                  (-0.220589084242, -0.057567886758),
-                  (-0.220584480376, -0.060557903116),
-                  (-0.220579681191, -0.063547759994),
-                  (-0.22057468667, -0.0665374495757),
-                  (-0.220569496792, -0.0695269640397),
-                  (-0.220564111536, -0.0725162955604),
-                  (-0.220558530881, -0.075505436307),
-                  (-0.220552754805, -0.078494378444),
-                  (-0.220546783284, -0.0814831141305),
-                  (-0.220540616295, -0.0844716355205),
-                  (-0.220534253811, -0.0874599347625),
-                  (-0.220527695806, -0.0904480039994),
-                  (-0.220520942254, -0.0934358353686),
-                  (-0.220513993126, -0.0964234210013),
-                  (-0.220506848393, -0.0994107530229),
-                  (-0.220499508024, -0.102397823553),
-                  (-0.220491971987, -0.105384624704),
-                  (-0.22048424025, -0.108371148583),
-                  (-0.220476312779, -0.11135738729),
-                  (-0.220468189538, -0.114343332919),
-                  (-0.220459870492, -0.117328977556),
-                  (-0.220451355602, -0.12031431328),
-                  (-0.22044264483, -0.123299332165),
-                  (-0.220433738135, -0.126284026276),
-                  (-0.220424635475, -0.129268387671),
-                  (-0.220415336808, -0.1322524084),
-                  (-0.220405842089, -0.135236080508),
-                  (-0.220396151271, -0.138219396029),
-                  (-0.220386264309, -0.141202346991),
-                  (-0.220376181152, -0.144184925413),
-                  (-0.22036590175, -0.147167123307),
-                  (-0.226436194944, -0.147150508019),
-                  (-0.232503976177, -0.147133354772),
-                  (-0.238569174003, -0.147115660256),
-                  (-0.244631716876, -0.147097421143),
-                  (-0.25069153315, -0.147078634087),
-                  (-0.256748551073, -0.147059295736),
-                  (-0.262802698782, -0.147039402729),
-                  (-0.268853904305, -0.147018951708),
-                  (-0.274902095549, -0.146997939317),
-                  (-0.280947200298, -0.146976362211),
-                  (-0.286989146211, -0.146954217057),
-                  (-0.293027860809, -0.14693150054),
-                  (-0.29906327147, -0.14690820937),
-                  (-0.305095305425, -0.146884340283),
-                  (-0.311123889747, -0.146859890045),
-                  (-0.31714895134, -0.146834855458),
-                  (-0.323170416933, -0.146809233366),
-                  (-0.329188213069, -0.146783020652),
-                  (-0.335202266091, -0.146756214249),
-                  (-0.341212502134, -0.14672881114),
-                  (-0.347218847108, -0.146700808362),
-                  (-0.353221226689, -0.146672203009),
-                  (-0.359219566302, -0.146642992235),
-                  (-0.365213791104, -0.146613173257),
-                  (-0.371203825972, -0.146582743358),
-                  (-0.377189595483, -0.146551699886),
-                  (-0.383171023896, -0.146520040262),
-                  (-0.389148035135, -0.146487761977),
-                  (-0.395120552764, -0.146454862595),
-                  (-0.401088499973, -0.146421339754),
-                  (-0.40705179955, -0.146387191166),
-                  (-0.413010373861, -0.146352414621),
-                  (-0.413029705276, -0.143388281519),
-                  (-0.413048659995, -0.140423755105),
-                  (-0.413067238269, -0.137458843796),
-                  (-0.413085440346, -0.134493555998),
-                  (-0.413103266465, -0.131527900107),
-                  (-0.413120716864, -0.128561884511),
-                  (-0.413137791772, -0.125595517585),
-                  (-0.413154491415, -0.122628807696),
-                  (-0.413170816014, -0.119661763201),
-                  (-0.413186765782, -0.116694392446),
-                  (-0.413202340931, -0.113726703768),
-                  (-0.413217541663, -0.110758705495),
-                  (-0.413232368181, -0.107790405945),
-                  (-0.413246820677, -0.104821813427),
-                  (-0.413260899341, -0.101852936239),
-                  (-0.413274604359, -0.0988837826726),
-                  (-0.41328793591, -0.0959143610073),
-                  (-0.413300894169, -0.0929446795154),
-                  (-0.413313479306, -0.0899747464595),
-                  (-0.413325691486, -0.0870045700936),
-                  (-0.413337530869, -0.084034158663),
-                  (-0.413348997611, -0.0810635204041),
-                  (-0.413360091862, -0.0780926635449),
-                  (-0.41337081377, -0.075121596305),
-                  (-0.413381163474, -0.0721503268955),
-                  (-0.413391141113, -0.0691788635196),
-                  (-0.413400746817, -0.0662072143721),
-                  (-0.413409980714, -0.06323538764),
-                  (-0.413418842928, -0.0602633915024),
-                  (-0.413427333575, -0.0572912341307),
-                  (-0.413435452771, -0.0543189236887),
-                  (-0.413443200623, -0.0513464683328),
-                  (-0.407478065295, -0.0513575783096),
-                  (-0.401508232833, -0.0513684465038),
-                  (-0.395533779771, -0.0513790730667),
-                  (-0.389554782225, -0.0513894582944),
-                  (-0.383571315922, -0.0513996026268),
-                  (-0.377583456219, -0.0514095066445),
-                  (-0.371591278128, -0.051419171067),
-                  (-0.365594856334, -0.0514285967496),
-                  (-0.359594265218, -0.0514377846805),
-                  (-0.353589578873, -0.0514467359772),
-                  (-0.347580871124, -0.0514554518828),
-                  (-0.341568215544, -0.0514639337625),
-                  (-0.335551685469, -0.0514721830992),
-                  (-0.329531354018, -0.051480201489),
-                  (-0.323507294101, -0.0514879906372),
-                  (-0.317479578437, -0.0514955523527),
-                  (-0.311448279564, -0.0515028885439),
-                  (-0.305413469854, -0.0515100012131),
-                  (-0.29937522152, -0.0515168924514),
-                  (-0.29333360663, -0.0515235644334),
-                  (-0.287288697115, -0.0515300194116),
-                  (-0.281240564778, -0.0515362597107),
-                  (-0.275189281302, -0.0515422877222),
-                  (-0.26913491826, -0.051548105898),
-                  (-0.263077547117, -0.0515537167454),
-                  (-0.257017239242, -0.0515591228202),
-                  (-0.250954065909, -0.0515643267217),
-                  (-0.244888098305, -0.0515693310858),
-                  (-0.238819407534, -0.0515741385795),
-                  (-0.232748064621, -0.0515787518949),
-                  (-0.226674140515, -0.0515831737428),
-                  (-0.220597706093, -0.0515874068469)]},
- 44: {'color': 'violet',
-      'polygon': [(-0.427232143124, -0.0514477031704),
-                  (-0.427223770245, -0.0544184008139),
-                  (-0.427215012882, -0.0573889532247),
-                  (-0.427205870917, -0.0603593522131),
-                  (-0.427196344228, -0.0633295895814),
-                  (-0.427186432688, -0.0662996571243),
-                  (-0.427176136162, -0.0692695466282),
-                  (-0.427165454514, -0.0722392498718),
-                  (-0.4271543876, -0.0752087586251),
-                  (-0.427142935273, -0.07817806465),
-                  (-0.427131097378, -0.0811471597),
-                  (-0.427118873758, -0.0841160355199),
-                  (-0.427106264249, -0.0870846838456),
-                  (-0.427093268681, -0.0900530964045),
-                  (-0.427079886881, -0.0930212649149),
-                  (-0.427066118668, -0.0959891810861),
-                  (-0.427051963858, -0.0989568366184),
-                  (-0.427037422262, -0.101924223203),
-                  (-0.427022493682, -0.104891332521),
-                  (-0.427007177918, -0.107858156244),
-                  (-0.426991474764, -0.110824686037),
-                  (-0.426975384007, -0.113790913551),
-                  (-0.426958905431, -0.11675683043),
-                  (-0.426942038811, -0.119722428308),
-                  (-0.42692478392, -0.122687698808),
-                  (-0.426907140524, -0.125652633545),
-                  (-0.426889108382, -0.128617224122),
-                  (-0.42687068725, -0.131581462133),
-                  (-0.426851876875, -0.134545339162),
-                  (-0.426832677001, -0.137508846782),
-                  (-0.426813087365, -0.140471976555),
-                  (-0.4267931077, -0.143434720034),
-                  (-0.426772737729, -0.146397068762),
-                  (-0.432715079206, -0.146360858932),
-                  (-0.438652354919, -0.146324011554),
-                  (-0.444584484544, -0.146286524801),
-                  (-0.450511387161, -0.146248396912),
-                  (-0.456432981221, -0.146209626197),
-                  (-0.462349184515, -0.146170211031),
-                  (-0.468259914135, -0.14613014985),
-                  (-0.474165086441, -0.146089441149),
-                  (-0.480064617027, -0.146048083476),
-                  (-0.485958420674, -0.14600607543),
-                  (-0.491846411318, -0.145963415654),
-                  (-0.497728502003, -0.14592010283),
-                  (-0.503604604843, -0.145876135671),
-                  (-0.509474630973, -0.145831512918),
-                  (-0.515338490505, -0.145786233329),
-                  (-0.52119609248, -0.145740295672),
-                  (-0.52704734482, -0.145693698718),
-                  (-0.532892154278, -0.14564644123),
-                  (-0.538730426382, -0.145598521954),
-                  (-0.544562065385, -0.145549939609),
-                  (-0.550386974207, -0.145500692874),
-                  (-0.556205054379, -0.145450780379),
-                  (-0.562016205984, -0.145400200691),
-                  (-0.567820327597, -0.145348952299),
-                  (-0.573617316219, -0.145297033605),
-                  (-0.579407067218, -0.145244442903),
-                  (-0.585189474259, -0.14519117837),
-                  (-0.590964429237, -0.145137238044),
-                  (-0.59673182221, -0.145082619813),
-                  (-0.602491541324, -0.14502732139),
-                  (-0.608243472739, -0.144971340302),
-                  (-0.613987500559, -0.144914673866),
-                  (-0.614018459739, -0.141984162418),
-                  (-0.614048816411, -0.13905323204),
-                  (-0.614078571242, -0.136121891932),
-                  (-0.61410772489, -0.133190151278),
-                  (-0.614136277995, -0.13025801925),
-                  (-0.614164231183, -0.127325505003),
-                  (-0.614191585067, -0.124392617678),
-                  (-0.614218340246, -0.121459366402),
-                  (-0.614244497303, -0.118525760289),
-                  (-0.614270056809, -0.115591808437),
-                  (-0.61429501932, -0.11265751993),
-                  (-0.614319385376, -0.10972290384),
-                  (-0.614343155506, -0.106787969221),
-                  (-0.614366330221, -0.103852725118),
-                  (-0.614388910021, -0.10091718056),
-                  (-0.614410895389, -0.0979813445606),
-                  (-0.614432286798, -0.0950452261226),
-                  (-0.614453084701, -0.0921088342341),
-                  (-0.614473289541, -0.0891721778701),
-                  (-0.614492901744, -0.0862352659921),
-                  (-0.614511921725, -0.0832981075488),
-                  (-0.614530349882, -0.0803607114756),
-                  (-0.614548186598, -0.0774230866952),
-                  (-0.614565432245, -0.0744852421174),
-                  (-0.614582087178, -0.0715471866395),
-                  (-0.614598151738, -0.0686089291461),
-                  (-0.614613626252, -0.0656704785096),
-                  (-0.614628511033, -0.0627318435899),
-                  (-0.614642806381, -0.0597930332353),
-                  (-0.614656512577, -0.0568540562816),
-                  (-0.614669629894, -0.0539149215531),
-                  (-0.614682158585, -0.0509756378625),
-                  (-0.608929914099, -0.0509935524227),
-                  (-0.603169833398, -0.051011287995),
-                  (-0.597402031185, -0.0510288422948),
-                  (-0.591626620116, -0.0510462129166),
-                  (-0.58584371087, -0.0510633973546),
-                  (-0.580053412226, -0.0510803930211),
-                  (-0.574255831129, -0.0510971972651),
-                  (-0.568451072761, -0.0511138073893),
-                  (-0.562639240605, -0.0511302206667),
-                  (-0.556820436513, -0.051146434356),
-                  (-0.550994760769, -0.0511624457165),
-                  (-0.545162312148, -0.0511782520219),
-                  (-0.539323187979, -0.0511938505732),
-                  (-0.533477484202, -0.0512092387116),
-                  (-0.527625295424, -0.0512244138293),
-                  (-0.521766714977, -0.0512393733809),
-                  (-0.515901834969, -0.0512541148933),
-                  (-0.510030746337, -0.0512686359748),
-                  (-0.504153538897, -0.0512829343243),
-                  (-0.498270301393, -0.0512970077389),
-                  (-0.492381121548, -0.0513108541211),
-                  (-0.486486086103, -0.0513244714862),
-                  (-0.48058528087, -0.0513378579675),
-                  (-0.474678790766, -0.0513510118223),
-                  (-0.468766699865, -0.0513639314365),
-                  (-0.462849091429, -0.051376615329),
-                  (-0.456926047954, -0.0513890621555),
-                  (-0.450997651202, -0.0514012707114),
-                  (-0.445063982244, -0.0514132399349),
-                  (-0.439125121488, -0.0514249689086),
-                  (-0.433181148718, -0.0514364568616),
-                  (-0.427232143124, -0.0514477031704)]},
- 45: {'color': 'violet',
-      'polygon': [(-0.627893340319, -0.0509559228256),
-                  (-0.627880008178, -0.0538923794452),
-                  (-0.627866070296, -0.0568286864907),
-                  (-0.627851526412, -0.0597648350897),
-                  (-0.627836376248, -0.0627008163579),
-                  (-0.627820619511, -0.0656366213989),
-                  (-0.627804255893, -0.0685722413042),
-                  (-0.627787285071, -0.0715076671529),
-                  (-0.627769706708, -0.0744428900115),
-                  (-0.627751520448, -0.077377900934),
-                  (-0.627732725926, -0.0803126909615),
-                  (-0.627713322756, -0.083247251122),
-                  (-0.627693310541, -0.0861815724309),
-                  (-0.627672688868, -0.0891156458899),
-                  (-0.627651457308, -0.0920494624877),
-                  (-0.627629615418, -0.0949830131995),
-                  (-0.627607162739, -0.0979162889869),
-                  (-0.627584098798, -0.100849280798),
-                  (-0.627560423106, -0.103781979567),
-                  (-0.62753613516, -0.106714376214),
-                  (-0.627511234442, -0.109646461645),
-                  (-0.627485720418, -0.112578226754),
-                  (-0.62745959254, -0.115509662417),
-                  (-0.627432850245, -0.118440759499),
-                  (-0.627405492955, -0.12137150885),
-                  (-0.627377520077, -0.124301901304),
-                  (-0.627348931003, -0.127231927682),
-                  (-0.627319725109, -0.130161578791),
-                  (-0.627289901759, -0.13309084542),
-                  (-0.627259460299, -0.136019718348),
-                  (-0.627228400063, -0.138948188335),
-                  (-0.627196720368, -0.141876246129),
-                  (-0.627164420517, -0.144803882462),
-                  (-0.632881507828, -0.144745916128),
-                  (-0.63859016761, -0.144687249023),
-                  (-0.644290271708, -0.144627876981),
-                  (-0.64998168939, -0.144567795484),
-                  (-0.65566428725, -0.144506999637),
-                  (-0.661337929125, -0.144445484144),
-                  (-0.667002475991, -0.144383243276),
-                  (-0.672657785874, -0.144320270842),
-                  (-0.678303713749, -0.144256560165),
-                  (-0.68394011144, -0.144192104046),
-                  (-0.689566827513, -0.144126894735),
-                  (-0.695183707178, -0.144060923895),
-                  (-0.700790592176, -0.143994182573),
-                  (-0.706387320671, -0.143926661161),
-                  (-0.711973727141, -0.143858349365),
-                  (-0.717549642259, -0.143789236161),
-                  (-0.72311489278, -0.143719309763),
-                  (-0.72866930142, -0.143648557582),
-                  (-0.734212686737, -0.143576966185),
-                  (-0.739744863008, -0.143504521255),
-                  (-0.745265640098, -0.143431207547),
-                  (-0.750774823339, -0.143357008845),
-                  (-0.756272213394, -0.143281907917),
-                  (-0.761757606126, -0.14320588647),
-                  (-0.767230792462, -0.143128925101),
-                  (-0.772691558257, -0.14305100325),
-                  (-0.778139684148, -0.14297209915),
-                  (-0.783574945419, -0.142892189776),
-                  (-0.788997111848, -0.142811250793),
-                  (-0.794405947564, -0.142729256502),
-                  (-0.799801210895, -0.142646179787),
-                  (-0.805182654215, -0.142561992058),
-                  (-0.805229281426, -0.139684745268),
-                  (-0.805274994796, -0.13680701226),
-                  (-0.805319795282, -0.133928803566),
-                  (-0.805363683817, -0.131050129696),
-                  (-0.805406661316, -0.128171001143),
-                  (-0.805448728672, -0.125291428378),
-                  (-0.805489886757, -0.122411421855),
-                  (-0.805530136425, -0.119530992007),
-                  (-0.805569478505, -0.116650149248),
-                  (-0.805607913808, -0.113768903975),
-                  (-0.805645443123, -0.110887266562),
-                  (-0.805682067217, -0.10800524737),
-                  (-0.805717786835, -0.105122856736),
-                  (-0.805752602704, -0.102240104982),
-                  (-0.805786515527, -0.0993570024107),
-                  (-0.805819525984, -0.0964735593065),
-                  (-0.805851634735, -0.0935897859364),
-                  (-0.80588284242, -0.0907056925494),
-                  (-0.805913149653, -0.0878212893771),
-                  (-0.80594255703, -0.0849365866336),
-                  (-0.805971065122, -0.0820515945158),
-                  (-0.805998674481, -0.0791663232038),
-                  (-0.806025385633, -0.0762807828606),
-                  (-0.806051199085, -0.0733949836329),
-                  (-0.80607611532, -0.0705089356507),
-                  (-0.8061001348, -0.067622649028),
-                  (-0.806123257964, -0.0647361338628),
-                  (-0.806145485227, -0.0618494002372),
-                  (-0.806166816986, -0.058962458218),
-                  (-0.80618725361, -0.0560753178564),
-                  (-0.806206795449, -0.0531879891888),
-                  (-0.80622544283, -0.0503004822365),
-                  (-0.800832488373, -0.0503249966362),
-                  (-0.795425852418, -0.0503491174299),
-                  (-0.790005778703, -0.050372866511),
-                  (-0.7845725052, -0.0503962642844),
-                  (-0.779126264254, -0.0504193297284),
-                  (-0.773667282728, -0.0504420804548),
-                  (-0.768195782144, -0.0504645327677),
-                  (-0.762711978815, -0.050486701721),
-                  (-0.75721608398, -0.0505086011742),
-                  (-0.751708303943, -0.0505302438468),
-                  (-0.746188840197, -0.0505516413715),
-                  (-0.740657889552, -0.0505728043459),
-                  (-0.735115644265, -0.0505937423825),
-                  (-0.729562292164, -0.0506144641583),
-                  (-0.723998016764, -0.0506349774617),
-                  (-0.718422997392, -0.0506552892392),
-                  (-0.712837409303, -0.0506754056401),
-                  (-0.707241423796, -0.0506953320606),
-                  (-0.701635208325, -0.0507150731854),
-                  (-0.696018926613, -0.0507346330298),
-                  (-0.690392738759, -0.0507540149787),
-                  (-0.684756801348, -0.0507732218259),
-                  (-0.679111267551, -0.0507922558109),
-                  (-0.673456287235, -0.0508111186556),
-                  (-0.667792007056, -0.0508298115994),
-                  (-0.662118570565, -0.0508483354325),
-                  (-0.656436118302, -0.0508666905292),
-                  (-0.650744787889, -0.0508848768792),
-                  (-0.645044714129, -0.0509028941183),
-                  (-0.639336029088, -0.0509207415574),
-                  (-0.633618862195, -0.0509384182113),
-                  (-0.627893340319, -0.0509559228256)]},
- 46: {'color': 'skyblue',
-      'polygon': [(0.789055145497, 0.0465581271327),
-                  (0.789069347166, 0.0436663740128),
-                  (0.789082676092, 0.0407744793624),
-                  (0.789095132387, 0.0378824526229),
-                  (0.789106716146, 0.0349903032335),
-                  (0.789117427448, 0.0320980406316),
-                  (0.789127266357, 0.029205674253),
-                  (0.789136232919, 0.0263132135326),
-                  (0.789144327164, 0.023420667905),
-                  (0.789151549107, 0.0205280468046),
-                  (0.789157898748, 0.0176353596665),
-                  (0.789163376069, 0.0147426159266),
-                  (0.789167981036, 0.0118498250225),
-                  (0.789171713602, 0.0089569963936),
-                  (0.789174573701, 0.00606413948177),
-                  (0.789176561253, 0.00317126373187),
-                  (0.789177676163, 0.000278378592144),
-                  (0.789177918318, -0.00261450648522),
-                  (0.789177287594, -0.00550738204363),
-                  (0.789175783846, -0.00840023862163),
-                  (0.789173406918, -0.0112930667523),
-                  (0.789170156637, -0.014185856963),
-                  (0.789166032815, -0.0170785997746),
-                  (0.78916103525, -0.019971285701),
-                  (0.789155163723, -0.0228639052491),
-                  (0.789148418003, -0.0257564489176),
-                  (0.789140797842, -0.028648907197),
-                  (0.789132302978, -0.0315412705692),
-                  (0.789122933134, -0.0344335295064),
-                  (0.78911268802, -0.0373256744713),
-                  (0.789101567331, -0.0402176959163),
-                  (0.789089570746, -0.0431095842829),
-                  (0.789076697933, -0.0460013300014),
-                  (0.783654913649, -0.0460326082885),
-                  (0.77822031297, -0.0460630101064),
-                  (0.772773074554, -0.0460925959995),
-                  (0.767313375427, -0.0461214229417),
-                  (0.761841390956, -0.0461495444843),
-                  (0.756357294816, -0.0461770108995),
-                  (0.750861258968, -0.0462038693201),
-                  (0.745353453633, -0.0462301638748),
-                  (0.73983404727, -0.0462559358195),
-                  (0.734303206559, -0.046281223665),
-                  (0.728761096382, -0.0463060633007),
-                  (0.72320787981, -0.0463304881146),
-                  (0.717643718091, -0.0463545291091),
-                  (0.712068770636, -0.0463782150142),
-                  (0.706483195016, -0.046401572396),
-                  (0.700887146949, -0.0464246257628),
-                  (0.695280780301, -0.0464473976671),
-                  (0.689664247079, -0.0464699088044),
-                  (0.684037697433, -0.0464921781087),
-                  (0.678401279653, -0.0465142228452),
-                  (0.672755140174, -0.0465360586995),
-                  (0.667099423579, -0.0465576998636),
-                  (0.661434272601, -0.0465791591194),
-                  (0.655759828134, -0.0466004479188),
-                  (0.650076229241, -0.0466215764612),
-                  (0.644383613157, -0.0466425537682),
-                  (0.638682115307, -0.0466633877551),
-                  (0.632971869313, -0.0466840853006),
-                  (0.62725300701, -0.0467046523133),
-                  (0.621525658457, -0.0467250937953),
-                  (0.615789951956, -0.0467454139042),
-                  (0.610046014062, -0.046765616012),
-                  (0.61005433828, -0.0438265849782),
-                  (0.610062067215, -0.0408874289128),
-                  (0.610069201099, -0.0379481562999),
-                  (0.610075740153, -0.0350087756175),
-                  (0.610081684586, -0.0320692953383),
-                  (0.610087034594, -0.0291297239297),
-                  (0.610091790362, -0.0261900698546),
-                  (0.61009595206, -0.0232503415715),
-                  (0.610099519849, -0.0203105475354),
-                  (0.610102493876, -0.0173706961978),
-                  (0.610104874276, -0.0144307960072),
-                  (0.610106661172, -0.0114908554099),
-                  (0.610107854674, -0.00855088285008),
-                  (0.610108454881, -0.0056108867702),
-                  (0.610108461878, -0.00267087561173),
-                  (0.610107875738, 0.000269142184654),
-                  (0.610106696523, 0.00320915817855),
-                  (0.61010492428, 0.00614916392944),
-                  (0.610102559047, 0.00908915099626),
-                  (0.610099600847, 0.0120291109369),
-                  (0.610096049691, 0.0149690353081),
-                  (0.610091905577, 0.0179089156644),
-                  (0.610087168492, 0.0208487435585),
-                  (0.61008183841, 0.0237885105401),
-                  (0.61007591529, 0.0267282081563),
-                  (0.610069399081, 0.0296678279502),
-                  (0.610062289719, 0.0326073614616),
-                  (0.610054587127, 0.0355468002257),
-                  (0.610046291215, 0.038486135773),
-                  (0.61003740188, 0.0414253596293),
-                  (0.610027919006, 0.0443644633145),
-                  (0.610017842466, 0.0473034383431),
-                  (0.615762113647, 0.0472846196202),
-                  (0.621498158647, 0.0472654281615),
-                  (0.627225850606, 0.0472458637189),
-                  (0.632945060826, 0.047225926819),
-                  (0.638655658748, 0.0472056188252),
-                  (0.644357511931, 0.0471849420029),
-                  (0.650050486028, 0.0471638995871),
-                  (0.655734444767, 0.0471424958531),
-                  (0.661409249928, 0.0471207361892),
-                  (0.667074761326, 0.0470986271734),
-                  (0.672730836792, 0.0470761766518),
-                  (0.678377332157, 0.0470533938208),
-                  (0.684014101231, 0.0470302893121),
-                  (0.689640995795, 0.0470068752807),
-                  (0.695257865579, 0.0469831654964),
-                  (0.700864558257, 0.046959175438),
-                  (0.706460919428, 0.0469349223914),
-                  (0.712046792612, 0.0469104255507),
-                  (0.717622019236, 0.0468857061233),
-                  (0.723186438631, 0.0468607874375),
-                  (0.728739888022, 0.046835695055),
-                  (0.734282202525, 0.0468104568859),
-                  (0.739813215145, 0.0467851033086),
-                  (0.745332756773, 0.0467596672923),
-                  (0.750840656187, 0.0467341845247),
-                  (0.756336740053, 0.0467086935424),
-                  (0.761820832932, 0.0466832358666),
-                  (0.767292757282, 0.0466578561419),
-                  (0.772752333468, 0.0466326022803),
-                  (0.778199379769, 0.0466075256083),
-                  (0.783633712396, 0.0465826810199),
-                  (0.789055145497, 0.0465581271327)]},
- 47: {'color': 'skyblue',
-      'polygon': [(0.59674242855, 0.0474292836273),
-                  (0.59675159837, 0.0444875523758),
-                  (0.596760191964, 0.0415456930123),
-                  (0.596768209457, 0.0386037139714),
-                  (0.596775650965, 0.0356616236818),
-                  (0.596782516589, 0.0327194305666),
-                  (0.596788806419, 0.0297771430438),
-                  (0.596794520534, 0.0268347695261),
-                  (0.596799658999, 0.0238923184224),
-                  (0.596804221867, 0.0209497981369),
-                  (0.596808209181, 0.0180072170705),
-                  (0.59681162097, 0.0150645836208),
-                  (0.596814457253, 0.0121219061825),
-                  (0.596816718033, 0.00917919314778),
-                  (0.596818403307, 0.00623645290695),
-                  (0.596819513055, 0.00329369384854),
-                  (0.596820047248, 0.00035092435991),
-                  (0.596820005843, -0.00259184717237),
-                  (0.596819388788, -0.00553461236214),
-                  (0.596818196017, -0.00847736282317),
-                  (0.596816427453, -0.0114200901688),
-                  (0.596814083007, -0.0143627860115),
-                  (0.596811162578, -0.0173054419624),
-                  (0.596807666054, -0.0202480496308),
-                  (0.596803593311, -0.0231906006241),
-                  (0.596798944214, -0.0261330865468),
-                  (0.596793718614, -0.0290754990006),
-                  (0.596787916353, -0.0320178295836),
-                  (0.59678153726, -0.0349600698899),
-                  (0.596774581152, -0.0379022115096),
-                  (0.596767047836, -0.0408442460277),
-                  (0.596758937106, -0.043786165024),
-                  (0.596750248744, -0.046727960073),
-                  (0.590979950911, -0.0467463189076),
-                  (0.585201947481, -0.046764565903),
-                  (0.579416356067, -0.0467827011734),
-                  (0.573623292663, -0.0468007243674),
-                  (0.567822871663, -0.0468186347109),
-                  (0.562015205885, -0.0468364310484),
-                  (0.556200406597, -0.0468541118816),
-                  (0.550378583539, -0.0468716754069),
-                  (0.544549844947, -0.0468891195507),
-                  (0.538714297581, -0.0469064420031),
-                  (0.532872046747, -0.0469236402494),
-                  (0.527023196326, -0.0469407116006),
-                  (0.521167848799, -0.0469576532221),
-                  (0.515306105272, -0.04697446216),
-                  (0.509438065509, -0.0469911353672),
-                  (0.503563827953, -0.047007669727),
-                  (0.497683489756, -0.0470240620758),
-                  (0.491797146808, -0.0470403092237),
-                  (0.485904893762, -0.047056407975),
-                  (0.480006824068, -0.0470723551457),
-                  (0.474103029993, -0.0470881475814),
-                  (0.468193602658, -0.0471037821726),
-                  (0.462278632059, -0.0471192558699),
-                  (0.456358207102, -0.0471345656972),
-                  (0.450432415627, -0.0471497087641),
-                  (0.444501344437, -0.0471646822775),
-                  (0.43856507933, -0.0471794835518),
-                  (0.432623705123, -0.0471941100182),
-                  (0.426677305684, -0.0472085592331),
-                  (0.420725963959, -0.0472228288855),
-                  (0.414769761998, -0.0472369168035),
-                  (0.408808780985, -0.0472508209599),
-                  (0.408814001337, -0.044278480495),
-                  (0.408818852447, -0.0413060209763),
-                  (0.40882333438, -0.0383334502516),
-                  (0.408827447199, -0.0353607761662),
-                  (0.408831190963, -0.0323880065635),
-                  (0.408834565727, -0.0294151492849),
-                  (0.408837571543, -0.0264422121705),
-                  (0.408840208461, -0.0234692030597),
-                  (0.408842476527, -0.0204961297909),
-                  (0.408844375783, -0.0175230002024),
-                  (0.408845906269, -0.0145498221326),
-                  (0.40884706802, -0.0115766034204),
-                  (0.40884786107, -0.00860335190536),
-                  (0.408848285448, -0.00563007542831),
-                  (0.40884834118, -0.00265678183158),
-                  (0.408848028291, 0.000316521040676),
-                  (0.408847346799, 0.00328982534208),
-                  (0.408846296721, 0.00626312322372),
-                  (0.40884487807, 0.00923640683378),
-                  (0.408843090857, 0.0122096683173),
-                  (0.408840935088, 0.0151828998155),
-                  (0.408838410766, 0.0181560934662),
-                  (0.408835517891, 0.0211292414025),
-                  (0.408832256459, 0.0241023357532),
-                  (0.408828626463, 0.0270753686422),
-                  (0.408824627894, 0.0300483321882),
-                  (0.408820260735, 0.0330212185045),
-                  (0.408815524971, 0.0359940196983),
-                  (0.40881042058, 0.038966727871),
-                  (0.408804947537, 0.0419393351174),
-                  (0.408799105813, 0.0449118335254),
-                  (0.408792895376, 0.0478842151762),
-                  (0.414754151709, 0.0478739833043),
-                  (0.420710623932, 0.047863546159),
-                  (0.426662231113, 0.0478528995919),
-                  (0.432608891477, 0.0478420392546),
-                  (0.438550522372, 0.0478309606037),
-                  (0.444487040247, 0.047819658908),
-                  (0.450418360617, 0.0478081292553),
-                  (0.456344398035, 0.0477963665609),
-                  (0.462265066064, 0.0477843655776),
-                  (0.468180277247, 0.0477721209054),
-                  (0.474089943077, 0.0477596270036),
-                  (0.479993973963, 0.0477468782035),
-                  (0.485892279207, 0.0477338687224),
-                  (0.491784766968, 0.0477205926785),
-                  (0.497671344234, 0.0477070441076),
-                  (0.50355191679, 0.0476932169808),
-                  (0.509426389189, 0.0476791052236),
-                  (0.515294664722, 0.0476647027365),
-                  (0.521156645385, 0.047650003417),
-                  (0.527012231851, 0.0476350011829),
-                  (0.53286132344, 0.0476196899975),
-                  (0.538703818085, 0.0476040638962),
-                  (0.544539612306, 0.0475881170146),
-                  (0.550368601178, 0.0475718436186),
-                  (0.556190678302, 0.0475552381363),
-                  (0.562005735775, 0.0475382951909),
-                  (0.56781366416, 0.0475210096364),
-                  (0.57361435246, 0.047503376595),
-                  (0.579407688084, 0.0474853914958),
-                  (0.585193556824, 0.047467050116),
-                  (0.590971842823, 0.0474483486247),
-                  (0.59674242855, 0.0474292836273)]},
- 48: {'color': 'skyblue',
-      'polygon': [(0.395060520247, 0.0477896186012),
-                  (0.395067058632, 0.0448155376574),
-                  (0.395073241376, 0.0418413409254),
-                  (0.395079068505, 0.0388670362989),
-                  (0.395084540039, 0.035892631665),
-                  (0.395089655994, 0.0329181349037),
-                  (0.395094416386, 0.0299435538887),
-                  (0.395098821225, 0.0269688964876),
-                  (0.395102870519, 0.0239941705621),
-                  (0.395106564273, 0.0210193839683),
-                  (0.395109902488, 0.0180445445574),
-                  (0.395112885165, 0.0150696601752),
-                  (0.395115512299, 0.0120947386634),
-                  (0.395117783884, 0.00911978785921),
-                  (0.395119699909, 0.00614481559586),
-                  (0.395121260362, 0.00316982970308),
-                  (0.395122465228, 0.000194838007267),
-                  (0.395123314489, -0.0027801516681),
-                  (0.395123808124, -0.00575513150218),
-                  (0.395123946109, -0.0087300936764),
-                  (0.395123728418, -0.0117050303741),
-                  (0.395123155021, -0.0146799337803),
-                  (0.395122225887, -0.0176547960811),
-                  (0.395120940981, -0.0206296094637),
-                  (0.395119300266, -0.0236043661157),
-                  (0.395117303701, -0.026579058225),
-                  (0.395114951244, -0.0295536779793),
-                  (0.395112242849, -0.0325282175659),
-                  (0.395109178467, -0.0355026691709),
-                  (0.395105758048, -0.0384770249796),
-                  (0.395101981538, -0.0414512771755),
-                  (0.39509784888, -0.0444254179401),
-                  (0.395093360014, -0.0473994394528),
-                  (0.389117185535, -0.0474138375249),
-                  (0.38313657179, -0.047428044917),
-                  (0.377151595835, -0.0474420604214),
-                  (0.371162334034, -0.047455882994),
-                  (0.365168862079, -0.0474695117538),
-                  (0.359171255023, -0.0474829459835),
-                  (0.353169587302, -0.0474961851285),
-                  (0.34716393276, -0.0475092287956),
-                  (0.341154364676, -0.0475220767515),
-                  (0.335140955787, -0.0475347289204),
-                  (0.329123778313, -0.0475471853811),
-                  (0.323102903981, -0.0475594463647),
-                  (0.31707840405, -0.0475715122502),
-                  (0.311050349329, -0.0475833835614),
-                  (0.305018810207, -0.0475950609623),
-                  (0.29898385667, -0.0476065452527),
-                  (0.292945558323, -0.0476178373633),
-                  (0.286903984414, -0.0476289383509),
-                  (0.280859203855, -0.0476398493928),
-                  (0.274811285238, -0.0476505717813),
-                  (0.268760296861, -0.0476611069179),
-                  (0.262706306743, -0.0476714563076),
-                  (0.256649382645, -0.0476816215524),
-                  (0.250589592089, -0.0476916043453),
-                  (0.244527002375, -0.0477014064637),
-                  (0.238461680598, -0.0477110297631),
-                  (0.232393693668, -0.0477204761705),
-                  (0.226323108324, -0.0477297476773),
-                  (0.220249991149, -0.0477388463333),
-                  (0.214174408589, -0.0477477742392),
-                  (0.208096426967, -0.0477565335404),
-                  (0.202016112496, -0.0477651264198),
-                  (0.20201753416, -0.0447739078704),
-                  (0.202018772155, -0.0417825722886),
-                  (0.202019826485, -0.0387911272718),
-                  (0.202020697158, -0.0357995804165),
-                  (0.202021384182, -0.0328079393183),
-                  (0.202021887566, -0.0298162115728),
-                  (0.202022207322, -0.0268244047752),
-                  (0.202022343463, -0.0238325265212),
-                  (0.202022296003, -0.0208405844069),
-                  (0.202022064957, -0.017848586029),
-                  (0.202021650345, -0.0148565389856),
-                  (0.202021052183, -0.0118644508758),
-                  (0.202020270493, -0.00887232930048),
-                  (0.202019305296, -0.00588018186235),
-                  (0.202018156617, -0.00288801616626),
-                  (0.202016824478, 0.00010416018053),
-                  (0.202015308908, 0.00309633956808),
-                  (0.202013609932, 0.00608851438351),
-                  (0.202011727581, 0.00908067701073),
-                  (0.202009661884, 0.0120728198302),
-                  (0.202007412872, 0.0150649352187),
-                  (0.20200498058, 0.0180570155489),
-                  (0.20200236504, 0.0210490531893),
-                  (0.201999566289, 0.024041040504),
-                  (0.201996584362, 0.0270329698524),
-                  (0.201993419298, 0.0300248335886),
-                  (0.201990071135, 0.0330166240619),
-                  (0.201986539912, 0.0360083336158),
-                  (0.201982825672, 0.0389999545882),
-                  (0.201978928455, 0.0419914793113),
-                  (0.201974848305, 0.0449829001106),
-                  (0.201970585265, 0.0479742093056),
-                  (0.208051361103, 0.0479711004449),
-                  (0.21412980237, 0.0479678118953),
-                  (0.22020584254, 0.047964345267),
-                  (0.226279414982, 0.0479607021009),
-                  (0.232350452946, 0.0479568838614),
-                  (0.238418889548, 0.0479528919285),
-                  (0.24448465776, 0.0479487275899),
-                  (0.250547690388, 0.0479443920336),
-                  (0.256607920062, 0.0479398863404),
-                  (0.262665279216, 0.047935211476),
-                  (0.268719700075, 0.0479303682842),
-                  (0.274771114634, 0.0479253574788),
-                  (0.280819454644, 0.0479201796373),
-                  (0.286864651592, 0.0479148351932),
-                  (0.29290663668, 0.0479093244293),
-                  (0.298945340812, 0.0479036474714),
-                  (0.304980694568, 0.0478978042816),
-                  (0.311012628187, 0.047891794652),
-                  (0.317041071547, 0.0478856181991),
-                  (0.323065954142, 0.047879274358),
-                  (0.32908720506, 0.047872762377),
-                  (0.335104752964, 0.0478660813128),
-                  (0.341118526066, 0.0478592300259),
-                  (0.347128452108, 0.0478522071762),
-                  (0.353134458333, 0.0478450112195),
-                  (0.359136471466, 0.047837640404),
-                  (0.365134417689, 0.0478300927672),
-                  (0.371128222613, 0.0478223661341),
-                  (0.377117811258, 0.0478144581149),
-                  (0.383103108021, 0.0478063661039),
-                  (0.389084036657, 0.047798087279),
-                  (0.395060520247, 0.0477896186012)]},
- 49: {'color': 'skyblue',
-      'polygon': [(0.187892743845, 0.0479576631245),
-                  (0.187896274877, 0.0449655477033),
-                  (0.187899635346, 0.0419733208006),
-                  (0.187902825209, 0.0389809900894),
-                  (0.187905844421, 0.0359885632366),
-                  (0.187908692941, 0.0329960479029),
-                  (0.187911370728, 0.0300034517433),
-                  (0.18791387774, 0.027010782407),
-                  (0.187916213941, 0.0240180475378),
-                  (0.187918379291, 0.0210252547745),
-                  (0.187920373755, 0.0180324117509),
-                  (0.187922197298, 0.0150395260962),
-                  (0.187923849884, 0.0120466054349),
-                  (0.187925331483, 0.00905365738778),
-                  (0.187926642063, 0.00606068957136),
-                  (0.187927781595, 0.0030677095986),
-                  (0.1879295474, -0.00291825638091),
-                  (0.187930173622, -0.00591122717784),
-                  (0.187930628692, -0.0089041797109),
-                  (0.187930912586, -0.0118971063817),
-                  (0.187931025285, -0.0148899995938),
-                  (0.18793096677, -0.0178828517529),
-                  (0.187930737022, -0.020875655266),
-                  (0.187930336026, -0.0238684025416),
-                  (0.187929763768, -0.0268610859891),
-                  (0.187929020235, -0.029853698019),
-                  (0.187928105416, -0.0328462310419),
-                  (0.187927019301, -0.0358386774689),
-                  (0.187925761884, -0.038831029711),
-                  (0.187924333156, -0.0418232801787),
-                  (0.187922733115, -0.0448154212822),
-                  (0.187920961757, -0.0478074454306),
-                  (0.181833384061, -0.0478143327829),
-                  (0.175743758343, -0.0478210630723),
-                  (0.16965215046, -0.0478276385815),
-                  (0.16355862624, -0.0478340615885),
-                  (0.157463251496, -0.0478403343605),
-                  (0.15136609203, -0.0478464591474),
-                  (0.145267213649, -0.0478524381756),
-                  (0.139166682172, -0.0478582736419),
-                  (0.133064563437, -0.0478639677076),
-                  (0.126960923313, -0.0478695224929),
-                  (0.120855827707, -0.0478749400708),
-                  (0.114749342569, -0.0478802224623),
-                  (0.108641533901, -0.0478853716303),
-                  (0.102532467766, -0.0478903894753),
-                  (0.0964222102886, -0.0478952778298),
-                  (0.0903108276656, -0.0479000384539),
-                  (0.084198386169, -0.047904673031),
-                  (0.078084952151, -0.0479091831628),
-                  (0.0719705920492, -0.0479135703659),
-                  (0.0658553723898, -0.0479178360675),
-                  (0.0597393597918, -0.0479219816019),
-                  (0.0536226209701, -0.0479260082071),
-                  (0.0475052227384, -0.0479299170213),
-                  (0.0413872320112, -0.0479337090806),
-                  (0.035268715807, -0.0479373853154),
-                  (0.0291497412491, -0.0479409465489),
-                  (0.0230303755677, -0.047944393494),
-                  (0.0169106861006, -0.047947726752),
-                  (0.0107907402945, -0.0479509468104),
-                  (0.00467060570534, -0.0479540540417),
-                  (-0.00144965000155, -0.0479570487022),
-                  (-0.0075699590513, -0.047959930931),
-                  (-0.0075713093714, -0.0449626422767),
-                  (-0.00757265714955, -0.0419652364085),
-                  (-0.00757400237828, -0.0389677209292),
-                  (-0.00757534504896, -0.0359701034407),
-                  (-0.00757668515166, -0.0329723915437),
-                  (-0.00757802267512, -0.0299745928381),
-                  (-0.00757935760697, -0.0269767149233),
-                  (-0.00758068993352, -0.0239787653981),
-                  (-0.00758201963993, -0.0209807518613),
-                  (-0.00758334671016, -0.0179826819116),
-                  (-0.00758467112698, -0.0149845631479),
-                  (-0.00758599287209, -0.0119864031697),
-                  (-0.00758731192599, -0.00898820957695),
-                  (-0.00758862826811, -0.00598998997057),
-                  (-0.00758994187683, -0.00299175195251),
-                  (-0.00759256080221, 0.00300474890444),
-                  (-0.00759386607044, 0.00600299653229),
-                  (-0.0075951685084, 0.00900123214939),
-                  (-0.00759646808945, 0.0119994481454),
-                  (-0.00759776478597, 0.0149976369078),
-                  (-0.00759905856955, 0.0179957908214),
-                  (-0.00760034941078, 0.0209939022684),
-                  (-0.00760163727949, 0.0239919636282),
-                  (-0.00760292214468, 0.026989967277),
-                  (-0.00760420397455, 0.0299879055877),
-                  (-0.00760548273658, 0.0329857709297),
-                  (-0.00760675839746, 0.0359835556687),
-                  (-0.00760803092325, 0.0389812521666),
-                  (-0.00760930027934, 0.0419788527811),
-                  (-0.00761056643049, 0.0449763498657),
-                  (-0.00761182934079, 0.0479737357692),
-                  (-0.00149115875251, 0.0479766205015),
-                  (0.00462946362228, 0.0479792779283),
-                  (0.0107499700313, 0.0479817082526),
-                  (0.0168702928144, 0.047983911784),
-                  (0.022990364404, 0.0479858889373),
-                  (0.0291101173246, 0.0479876402317),
-                  (0.0352294841924, 0.0479891662885),
-                  (0.0413483977147, 0.0479904678293),
-                  (0.047466790689, 0.0479915456739),
-                  (0.0535845960016, 0.0479924007376),
-                  (0.0597017466263, 0.0479930340282),
-                  (0.0658181756223, 0.0479934466434),
-                  (0.0719338161324, 0.0479936397668),
-                  (0.0780486013803, 0.0479936146647),
-                  (0.0841624646678, 0.0479933726821),
-                  (0.0902753393717, 0.0479929152385),
-                  (0.0963871589404, 0.0479922438233),
-                  (0.10249785689, 0.0479913599917),
-                  (0.108607366799, 0.0479902653591),
-                  (0.114715622307, 0.0479889615965),
-                  (0.120822557103, 0.047987450425),
-                  (0.126928104929, 0.04798573361),
-                  (0.133032199566, 0.0479838129557),
-                  (0.139134774831, 0.0479816902991),
-                  (0.145235764573, 0.0479793675036),
-                  (0.151335102659, 0.0479768464527),
-                  (0.157432722974, 0.0479741290437),
-                  (0.163528559407, 0.0479712171807),
-                  (0.169622545846, 0.0479681127678),
-                  (0.175714616167, 0.0479648177023),
-                  (0.181804704225, 0.0479613338673),
-                  (0.187892743845, 0.0479576631245)]},
- 50: {'color': 'violet',
-      'polygon': [(-0.0111927476848, 0.0479299210707),
-                  (-0.0111938230571, 0.0449325383238),
-                  (-0.0111948920153, 0.0419350444952),
-                  (-0.0111959545886, 0.0389374472367),
-                  (-0.0111970108053, 0.0359397541956),
-                  (-0.0111980606932, 0.032941973015),
-                  (-0.0111991042796, 0.0299441113338),
-                  (-0.0112001415908, 0.0269461767873),
-                  (-0.0112011726528, 0.023948177007),
-                  (-0.0112021974905, 0.0209501196209),
-                  (-0.0112032161284, 0.0179520122538),
-                  (-0.0112042285898, 0.0149538625274),
-                  (-0.0112052348975, 0.0119556780608),
-                  (-0.0112062350734, 0.00895746647008),
-                  (-0.0112072291383, 0.00595923536909),
-                  (-0.0112082171125, 0.0029609923694),
-                  (-0.0112101748642, -0.0030354988899),
-                  (-0.0112111446771, -0.0060337319358),
-                  (-0.0112121084699, -0.00903194645254),
-                  (-0.011213066258, -0.0120301348368),
-                  (-0.0112140180554, -0.0150282894861),
-                  (-0.0112149638752, -0.0180264027989),
-                  (-0.0112159037293, -0.0210244671744),
-                  (-0.0112168376287, -0.0240224750118),
-                  (-0.0112177655829, -0.0270204187109),
-                  (-0.0112186876007, -0.0300182906713),
-                  (-0.0112196036893, -0.0330160832922),
-                  (-0.011220513855, -0.0360137889727),
-                  (-0.0112214181027, -0.0390114001112),
-                  (-0.0112223164362, -0.0420089091049),
-                  (-0.011223208858, -0.0450063083503),
-                  (-0.0112240953693, -0.0480035902426),
-                  (-0.0173443479583, -0.0480016180692),
-                  (-0.0234644776779, -0.0479995332112),
-                  (-0.0295844163627, -0.0479973354315),
-                  (-0.0357040957405, -0.0479950243749),
-                  (-0.0418234474341, -0.0479925995683),
-                  (-0.0479424029627, -0.0479900604214),
-                  (-0.0540608937428, -0.0479874062278),
-                  (-0.0601788510909, -0.0479846361662),
-                  (-0.0662962062244, -0.0479817493015),
-                  (-0.0724128902642, -0.0479787445874),
-                  (-0.0785288342367, -0.0479756208672),
-                  (-0.0846439690756, -0.0479723768769),
-                  (-0.0907582256242, -0.047969011247),
-                  (-0.0968715346379, -0.0479655225057),
-                  (-0.102983826786, -0.0479619090811),
-                  (-0.109095032654, -0.0479581693049),
-                  (-0.115205082748, -0.0479543014152),
-                  (-0.121313907491, -0.0479503035603),
-                  (-0.127421437233, -0.0479461738021),
-                  (-0.133527602247, -0.0479419101205),
-                  (-0.139632332734, -0.0479375104169),
-                  (-0.145735558823, -0.0479329725187),
-                  (-0.151837210575, -0.0479282941839),
-                  (-0.157937217982, -0.0479234731053),
-                  (-0.164035510973, -0.0479185069157),
-                  (-0.170132019408, -0.0479133931923),
-                  (-0.176226673086, -0.0479081294625),
-                  (-0.182319401744, -0.0479027132083),
-                  (-0.188410135053, -0.0478971418721),
-                  (-0.194498802627, -0.0478914128618),
-                  (-0.200585334013, -0.0478855235569),
-                  (-0.206669658701, -0.0478794713135),
-                  (-0.20667182257, -0.0448880258075),
-                  (-0.206673803718, -0.0418964616389),
-                  (-0.20667560216, -0.038904786582),
-                  (-0.20667721791, -0.0359130084075),
-                  (-0.206678650982, -0.0329211348835),
-                  (-0.206679901389, -0.0299291737748),
-                  (-0.206680969144, -0.0269371328437),
-                  (-0.20668185426, -0.0239450198497),
-                  (-0.206682556748, -0.0209528425502),
-                  (-0.206683076619, -0.0179606087002),
-                  (-0.206683413885, -0.0149683260526),
-                  (-0.206683568556, -0.0119760023585),
-                  (-0.206683540643, -0.00898364536718),
-                  (-0.206683330155, -0.00599126282655),
-                  (-0.206682937101, -0.00299886248301),
-                  (-0.206681603334, 0.00298596063268),
-                  (-0.206680662638, 0.00597836791715),
-                  (-0.20667953941, 0.00897076202877),
-                  (-0.20667823366, 0.0119631352252),
-                  (-0.206676745394, 0.0149554797644),
-                  (-0.206675074621, 0.0179477879044),
-                  (-0.206673221347, 0.0209400519032),
-                  (-0.206671185578, 0.0239322640184),
-                  (-0.206668967323, 0.0269244165072),
-                  (-0.206666566587, 0.0299165016262),
-                  (-0.206663983377, 0.032908511631),
-                  (-0.206661217698, 0.0359004387763),
-                  (-0.206658269558, 0.0388922753155),
-                  (-0.20665513896, 0.0418840135007),
-                  (-0.206651825912, 0.044875645582),
-                  (-0.206648330418, 0.0478671638082),
-                  (-0.200563692722, 0.0478722913412),
-                  (-0.194476851693, 0.0478772334907),
-                  (-0.188387877482, 0.0478819881242),
-                  (-0.182296840176, 0.0478865531108),
-                  (-0.176203809798, 0.0478909263272),
-                  (-0.170108856312, 0.0478951056646),
-                  (-0.164012049617, 0.0478990890341),
-                  (-0.157913459554, 0.0479028743734),
-                  (-0.151813155904, 0.0479064596524),
-                  (-0.145711208384, 0.0479098428789),
-                  (-0.139607686654, 0.0479130221042),
-                  (-0.13350266031, 0.0479159954285),
-                  (-0.127396198885, 0.047918761006),
-                  (-0.121288371851, 0.0479213170499),
-                  (-0.115179248612, 0.0479236618373),
-                  (-0.109068898511, 0.0479257937137),
-                  (-0.102957390821, 0.0479277110971),
-                  (-0.0968447947467, 0.0479294124827),
-                  (-0.0907311794234, 0.0479308964461),
-                  (-0.0846166139148, 0.0479321616477),
-                  (-0.0785011672115, 0.0479332068354),
-                  (-0.0723849082292, 0.0479340308483),
-                  (-0.0662679058069, 0.0479346326194),
-                  (-0.0601502287056, 0.0479350111782),
-                  (-0.0540319456063, 0.0479351656532),
-                  (-0.0479131251086, 0.047935095274),
-                  (-0.0417938357289, 0.0479347993732),
-                  (-0.0356741458993, 0.0479342773881),
-                  (-0.0295541239657, 0.0479335288615),
-                  (-0.0234338381869, 0.0479325534434),
-                  (-0.017313356733, 0.0479313508913),
-                  (-0.0111927476848, 0.0479299210707)]},
- 51: {'color': 'violet',
-      'polygon': [(-0.220619589019, 0.0475919027605),
-                  (-0.220623577563, 0.0446012216879),
-                  (-0.220627371151, 0.0416104271117),
-                  (-0.220630969775, 0.0386195267947),
-                  (-0.220634373429, 0.035628528498),
-                  (-0.220637582104, 0.0326374399815),
-                  (-0.220640595793, 0.0296462690038),
-                  (-0.220643414486, 0.0266550233224),
-                  (-0.220646038175, 0.0236637106942),
-                  (-0.22064846685, 0.0206723388752),
-                  (-0.220650700504, 0.0176809156212),
-                  (-0.220652739125, 0.0146894486878),
-                  (-0.220654582705, 0.0116979458302),
-                  (-0.220656231232, 0.0087064148042),
-                  (-0.220657684697, 0.00571486336558),
-                  (-0.220658943088, 0.00272329927077),
-                  (-0.220660006394, -0.000268269723104),
-                  (-0.220660874603, -0.00325983585808),
-                  (-0.220661547704, -0.00625139137511),
-                  (-0.220662025684, -0.00924292851394),
-                  (-0.220662308531, -0.0122344395129),
-                  (-0.22066239623, -0.0152259166086),
-                  (-0.220662288768, -0.0182173520361),
-                  (-0.220661986131, -0.0212087380284),
-                  (-0.220661488305, -0.0242000668164),
-                  (-0.220660795274, -0.0271913306286),
-                  (-0.220659907023, -0.0301825216914),
-                  (-0.220658823535, -0.0331736322281),
-                  (-0.220657544794, -0.0361646544596),
-                  (-0.220656070782, -0.0391555806036),
-                  (-0.220654401481, -0.0421464028749),
-                  (-0.220652536873, -0.0451371134847),
-                  (-0.220650476938, -0.0481277046411),
-                  (-0.226727012101, -0.0481203686752),
-                  (-0.23280103672, -0.0481128575042),
-                  (-0.238872479933, -0.0481051684654),
-                  (-0.244941270807, -0.04809729891),
-                  (-0.251007338336, -0.0480892462094),
-                  (-0.257070611432, -0.048081007761),
-                  (-0.263131018926, -0.0480725809949),
-                  (-0.26918848956, -0.0480639633792),
-                  (-0.275242951985, -0.0480551524267),
-                  (-0.281294334753, -0.0480461457005),
-                  (-0.28734256631, -0.0480369408204),
-                  (-0.293387574991, -0.0480275354683),
-                  (-0.299429289013, -0.0480179273944),
-                  (-0.305467636461, -0.0480081144228),
-                  (-0.311502545289, -0.0479980944575),
-                  (-0.317533943299, -0.0479878654875),
-                  (-0.323561758141, -0.0479774255923),
-                  (-0.329585917293, -0.0479667729476),
-                  (-0.335606348057, -0.0479559058301),
-                  (-0.341622977538, -0.0479448226224),
-                  (-0.347635732638, -0.0479335218183),
-                  (-0.353644540038, -0.0479220020268),
-                  (-0.359649326182, -0.0479102619768),
-                  (-0.365650017263, -0.0478983005213),
-                  (-0.371646539205, -0.0478861166415),
-                  (-0.377638817642, -0.0478737094499),
-                  (-0.383626777908, -0.0478610781945),
-                  (-0.389610345005, -0.0478482222613),
-                  (-0.395589443591, -0.0478351411777),
-                  (-0.401563997955, -0.0478218346146),
-                  (-0.407533931995, -0.0478083023886),
-                  (-0.413499169191, -0.0477945444643),
-                  (-0.413504402994, -0.0448218087261),
-                  (-0.41350926567, -0.0418489536604),
-                  (-0.413513757314, -0.0388759873938),
-                  (-0.413517878018, -0.0359029180464),
-                  (-0.413521627868, -0.0329297537314),
-                  (-0.413525006944, -0.0299565025557),
-                  (-0.413528015324, -0.02698317262),
-                  (-0.413530653082, -0.0240097720187),
-                  (-0.413532920285, -0.0210363088406),
-                  (-0.413534816997, -0.0180627911682),
-                  (-0.413536343278, -0.0150892270789),
-                  (-0.413537499183, -0.0121156246444),
-                  (-0.413538284763, -0.009141991931),
-                  (-0.413538700064, -0.00616833700027),
-                  (-0.413538745129, -0.00319466790864),
-                  (-0.413538419994, -0.000220992707906),
-                  (-0.413537724694, 0.00275268055468),
-                  (-0.413536659258, 0.00572634383617),
-                  (-0.413535223709, 0.00869998909778),
-                  (-0.413533418068, 0.0116736083046),
-                  (-0.413531242351, 0.0146471934256),
-                  (-0.41352869657, 0.017620736433),
-                  (-0.41352578073, 0.0205942293026),
-                  (-0.413522494836, 0.0235676640131),
-                  (-0.413518838884, 0.0265410325463),
-                  (-0.413514812869, 0.0295143268864),
-                  (-0.41351041678, 0.0324875390202),
-                  (-0.413505650603, 0.0354606609368),
-                  (-0.413500514316, 0.038433684627),
-                  (-0.413495007898, 0.0414066020837),
-                  (-0.413489131318, 0.0443794053009),
-                  (-0.413482884543, 0.0473520862743),
-                  (-0.407517066714, 0.0473619863287),
-                  (-0.401546559093, 0.0473717261728),
-                  (-0.3955714385, 0.0473813076131),
-                  (-0.389591781311, 0.0473907322523),
-                  (-0.383607663478, 0.0474000014925),
-                  (-0.377619160554, 0.0474091165383),
-                  (-0.371626347715, 0.0474180784003),
-                  (-0.365629299783, 0.0474268878988),
-                  (-0.359628091241, 0.0474355456683),
-                  (-0.353622796259, 0.0474440521617),
-                  (-0.34761348871, 0.047452407655),
-                  (-0.341600242184, 0.0474606122524),
-                  (-0.335583130012, 0.0474686658915),
-                  (-0.329562225276, 0.0474765683489),
-                  (-0.323537600825, 0.0474843192457),
-                  (-0.317509329292, 0.0474919180532),
-                  (-0.311477483106, 0.0474993640995),
-                  (-0.305442134504, 0.0475066565751),
-                  (-0.299403355545, 0.0475137945396),
-                  (-0.29336121812, 0.0475207769282),
-                  (-0.287315793961, 0.0475276025584),
-                  (-0.281267154655, 0.0475342701362),
-                  (-0.275215371651, 0.0475407782635),
-                  (-0.269160516268, 0.0475471254448),
-                  (-0.263102659703, 0.0475533100942),
-                  (-0.257041873041, 0.047559330542),
-                  (-0.250978227259, 0.0475651850424),
-                  (-0.244911793234, 0.0475708717799),
-                  (-0.238842641748, 0.0475763888769),
-                  (-0.232770843492, 0.0475817344003),
-                  (-0.226696469073, 0.047586906369),
-                  (-0.220619589019, 0.0475919027605)]},
- 52: {'color': 'violet',
-      'polygon': [(-0.427381410358, 0.0472370797345),
-                  (-0.427384000754, 0.0442661853934),
-                  (-0.427386207639, 0.041295167146),
-                  (-0.427388031064, 0.0383240330228),
-                  (-0.427389471076, 0.0353527910558),
-                  (-0.427390527716, 0.0323814492786),
-                  (-0.427391201022, 0.0294100157268),
-                  (-0.427391491025, 0.0264384984382),
-                  (-0.427391397751, 0.023466905453),
-                  (-0.427390921223, 0.0204952448139),
-                  (-0.427390061457, 0.0175235245665),
-                  (-0.427388818465, 0.0145517527597),
-                  (-0.427387192253, 0.0115799374454),
-                  (-0.427385182824, 0.00860808667929),
-                  (-0.427382790175, 0.00563620852056),
-                  (-0.427380014298, 0.00266431103248),
-                  (-0.42737685518, -0.000307597717573),
-                  (-0.427373312803, -0.00327950965786),
-                  (-0.427369387145, -0.00625141671212),
-                  (-0.427365078179, -0.00922331079931),
-                  (-0.427360385871, -0.0121951838335),
-                  (-0.427355310185, -0.0151670277235),
-                  (-0.427349851079, -0.0181388343731),
-                  (-0.427344008505, -0.0211105956803),
-                  (-0.427337782412, -0.0240823035375),
-                  (-0.427331172742, -0.0270539498314),
-                  (-0.427324179435, -0.0300255264426),
-                  (-0.427316802423, -0.0329970252454),
-                  (-0.427309041634, -0.0359684381079),
-                  (-0.427300896993, -0.0389397568916),
-                  (-0.427292368417, -0.0419109734515),
-                  (-0.42728345582, -0.0448820796355),
-                  (-0.427274159111, -0.0478530672848),
-                  (-0.433223262719, -0.0478464399076),
-                  (-0.439167333515, -0.0478395838215),
-                  (-0.445106292318, -0.0478324996908),
-                  (-0.45104005935, -0.0478251883297),
-                  (-0.456968554209, -0.0478176507007),
-                  (-0.462891695832, -0.0478098879134),
-                  (-0.468809402459, -0.0478019012222),
-                  (-0.474721591601, -0.0477936920237),
-                  (-0.480628179998, -0.0477852618534),
-                  (-0.48652908358, -0.0477766123822),
-                  (-0.492424217431, -0.0477677454121),
-                  (-0.498313495742, -0.0477586628709),
-                  (-0.504196831772, -0.0477493668075),
-                  (-0.510074137799, -0.0477398593854),
-                  (-0.515945325079, -0.0477301428758),
-                  (-0.521810303795, -0.0477202196509),
-                  (-0.527668983007, -0.0477100921753),
-                  (-0.533521270608, -0.0476997629976),
-                  (-0.539367073262, -0.0476892347411),
-                  (-0.54520629636, -0.0476785100935),
-                  (-0.55103884396, -0.0476675917961),
-                  (-0.556864618728, -0.0476564826325),
-                  (-0.562683521886, -0.0476451854158),
-                  (-0.568495453148, -0.0476337029759),
-                  (-0.574300310657, -0.0476220381453),
-                  (-0.580097990927, -0.0476101937446),
-                  (-0.585888388772, -0.0475981725666),
-                  (-0.591671397243, -0.04758597736),
-                  (-0.597446907559, -0.0475736108123),
-                  (-0.603214809038, -0.0475610755312),
-                  (-0.608974989021, -0.0475483740258),
-                  (-0.614727332804, -0.0475355086864),
-                  (-0.614740297538, -0.0445959345058),
-                  (-0.614752674393, -0.041656239946),
-                  (-0.614764463557, -0.0387164337729),
-                  (-0.614775665205, -0.0357765247417),
-                  (-0.614786279497, -0.0328365215969),
-                  (-0.614796306579, -0.0298964330731),
-                  (-0.614805746582, -0.0269562678942),
-                  (-0.614814599623, -0.0240160347745),
-                  (-0.614822865805, -0.0210757424186),
-                  (-0.614830545216, -0.0181353995214),
-                  (-0.61483763793, -0.0151950147686),
-                  (-0.614844144005, -0.0122545968368),
-                  (-0.614850063488, -0.00931415439374),
-                  (-0.614855396408, -0.00637369609855),
-                  (-0.614860142781, -0.00343323060197),
-                  (-0.61486430261, -0.000492766546598),
-                  (-0.614867875881, 0.00244768743288),
-                  (-0.614870862567, 0.0053881227094),
-                  (-0.614873262627, 0.00832853066329),
-                  (-0.614875076004, 0.011268902682),
-                  (-0.614876302628, 0.0142092301599),
-                  (-0.614876942413, 0.0171495044977),
-                  (-0.61487699526, 0.0200897171028),
-                  (-0.614876461055, 0.0230298593882),
-                  (-0.614875339669, 0.025969922773),
-                  (-0.61487363096, 0.0289098986814),
-                  (-0.61487133477, 0.031849778543),
-                  (-0.614868450926, 0.0347895537921),
-                  (-0.614864979243, 0.0377292158674),
-                  (-0.614860919518, 0.0406687562121),
-                  (-0.614856271538, 0.043608166273),
-                  (-0.614851035071, 0.0465474375006),
-                  (-0.609098313357, 0.046573050436),
-                  (-0.60333773955, 0.046598339496),
-                  (-0.597569428915, 0.0466233111334),
-                  (-0.591793494716, 0.0466479718579),
-                  (-0.586010048279, 0.0466723282147),
-                  (-0.580219199066, 0.0466963867646),
-                  (-0.574421054735, 0.0467201540653),
-                  (-0.568615721203, 0.0467436366529),
-                  (-0.562803302715, 0.0467668410252),
-                  (-0.556983901895, 0.0467897736256),
-                  (-0.551157619815, 0.0468124408276),
-                  (-0.545324556046, 0.0468348489211),
-                  (-0.539484808718, 0.0468570040982),
-                  (-0.533638474575, 0.0468789124414),
-                  (-0.527785649024, 0.0469005799114),
-                  (-0.521926426196, 0.0469220123365),
-                  (-0.516060898987, 0.0469432154024),
-                  (-0.510189159115, 0.046964194643),
-                  (-0.504311297165, 0.0469849554315),
-                  (-0.498427402635, 0.0470055029731),
-                  (-0.492537563983, 0.0470258422976),
-                  (-0.48664186867, 0.0470459782532),
-                  (-0.480740403204, 0.0470659155007),
-                  (-0.474833253183, 0.0470856585083),
-                  (-0.468920503329, 0.0471052115478),
-                  (-0.463002237535, 0.04712457869),
-                  (-0.457078538899, 0.0471437638023),
-                  (-0.451149489758, 0.0471627705456),
-                  (-0.44521517173, 0.0471816023729),
-                  (-0.439275665743, 0.047200262527),
-                  (-0.433331052069, 0.0472187540404),
-                  (-0.427381410358, 0.0472370797345)]},
- 53: {'color': 'violet',
-      'polygon': [(-0.627969027882, 0.0464948242112),
-                  (-0.627976137934, 0.043558361451),
-                  (-0.627982642406, 0.0406217594483),
-                  (-0.627988541538, 0.0376850268054),
-                  (-0.627993835554, 0.0347481721284),
-                  (-0.627998524663, 0.0318112040272),
-                  (-0.628002609059, 0.0288741311163),
-                  (-0.628006088921, 0.0259369620145),
-                  (-0.628008964413, 0.022999705346),
-                  (-0.628011235683, 0.0200623697398),
-                  (-0.628012902864, 0.0171249638309),
-                  (-0.628013966073, 0.0141874962599),
-                  (-0.628014425414, 0.0112499756737),
-                  (-0.628014280975, 0.00831241072568),
-                  (-0.628013532826, 0.00537481007601),
-                  (-0.628012181025, 0.00243718239184),
-                  (-0.628010225615, -0.000500463652357),
-                  (-0.62800766662, -0.0034381193745),
-                  (-0.628004504054, -0.00637577608468),
-                  (-0.628000737911, -0.00931342508487),
-                  (-0.627996368174, -0.0122510576687),
-                  (-0.627991394807, -0.0151886651211),
-                  (-0.627985817761, -0.0181262387183),
-                  (-0.627979636972, -0.0210637697274),
-                  (-0.627972852361, -0.024001249406),
-                  (-0.627965463831, -0.0269386690025),
-                  (-0.627957471273, -0.0298760197551),
-                  (-0.627948874561, -0.0328132928925),
-                  (-0.627939673556, -0.0357504796327),
-                  (-0.627929868102, -0.0386875711837),
-                  (-0.627919458027, -0.0416245587427),
-                  (-0.627908443146, -0.0445614334962),
-                  (-0.627896823258, -0.0474981866195),
-                  (-0.633622526368, -0.0474813197577),
-                  (-0.639339875856, -0.0474643005089),
-                  (-0.645048744876, -0.0474471303202),
-                  (-0.650749004031, -0.047429810372),
-                  (-0.656440521282, -0.0474123415513),
-                  (-0.662123161862, -0.0473947244226),
-                  (-0.667796788183, -0.0473769591993),
-                  (-0.673461259746, -0.0473590457124),
-                  (-0.679116433041, -0.0473409833794),
-                  (-0.684762161458, -0.047322771171),
-                  (-0.69039829518, -0.0473044075777),
-                  (-0.696024681088, -0.0472858905741),
-                  (-0.701641162657, -0.047267217583),
-                  (-0.707247579848, -0.0472483854378),
-                  (-0.712843769008, -0.0472293903435),
-                  (-0.718429562752, -0.047210227837),
-                  (-0.72400478986, -0.0471908927458),
-                  (-0.729569275162, -0.0471713791455),
-                  (-0.735122839419, -0.0471516803158),
-                  (-0.740665299211, -0.047131788696),
-                  (-0.746196466814, -0.0471116958377),
-                  (-0.751716150082, -0.0470913923577),
-                  (-0.757224152321, -0.0470708678889),
-                  (-0.762720272163, -0.0470501110294),
-                  (-0.768204303441, -0.0470291092911),
-                  (-0.773676035056, -0.0470078490459),
-                  (-0.779135250846, -0.0469863154719),
-                  (-0.784581729455, -0.0469644924964),
-                  (-0.790015244189, -0.0469423627388),
-                  (-0.795435562886, -0.0469199074517),
-                  (-0.800842447768, -0.0468971064601),
-                  (-0.806235655303, -0.0468739380997),
-                  (-0.806251977278, -0.0439860739295),
-                  (-0.806267405683, -0.0410980630636),
-                  (-0.806281940751, -0.0382099154642),
-                  (-0.806295582695, -0.0353216410801),
-                  (-0.806308331704, -0.0324332498468),
-                  (-0.806320187942, -0.0295447516868),
-                  (-0.806331151554, -0.0266561565102),
-                  (-0.80634122266, -0.0237674742144),
-                  (-0.806350401359, -0.020878714685),
-                  (-0.806358687726, -0.0179898877958),
-                  (-0.806366081814, -0.015101003409),
-                  (-0.806372583652, -0.0122120713759),
-                  (-0.806378193249, -0.00932310153689),
-                  (-0.806382910589, -0.00643410372199),
-                  (-0.806386735635, -0.00354508775105),
-                  (-0.806389668327, -0.000656063434187),
-                  (-0.806391708582, 0.00223295942788),
-                  (-0.806392856295, 0.00512197104348),
-                  (-0.806393111339, 0.00801096162962),
-                  (-0.806392473563, 0.0108999214116),
-                  (-0.806390942795, 0.0137888406226),
-                  (-0.806388518842, 0.0166777095035),
-                  (-0.806385201486, 0.019566518302),
-                  (-0.806380990488, 0.0224552572727),
-                  (-0.806375885588, 0.0253439166767),
-                  (-0.806369886502, 0.0282324867807),
-                  (-0.806362992927, 0.031120957857),
-                  (-0.806355204534, 0.0340093201829),
-                  (-0.806346520976, 0.0368975640405),
-                  (-0.806336941882, 0.0397856797159),
-                  (-0.80632646686, 0.0426736574988),
-                  (-0.806315095497, 0.0455614876825),
-                  (-0.800921478698, 0.0455963062085),
-                  (-0.795514236413, 0.0456308427317),
-                  (-0.790093605748, 0.0456650802848),
-                  (-0.784659818472, 0.045699003442),
-                  (-0.779213101147, 0.0457325982501),
-                  (-0.773753675249, 0.0457658521628),
-                  (-0.76828175729, 0.0457987539754),
-                  (-0.762797558941, 0.0458312937618),
-                  (-0.757301287148, 0.0458634628133),
-                  (-0.751793144247, 0.0458952535786),
-                  (-0.746273328084, 0.0459266596056),
-                  (-0.740742032125, 0.0459576754847),
-                  (-0.735199445566, 0.045988296794),
-                  (-0.729645753449, 0.0460185200453),
-                  (-0.724081136764, 0.0460483426327),
-                  (-0.718505772557, 0.0460777627815),
-                  (-0.712919834038, 0.0461067794998),
-                  (-0.707323490681, 0.0461353925304),
-                  (-0.701716908324, 0.0461636023054),
-                  (-0.696100249274, 0.0461914099007),
-                  (-0.690473672398, 0.0462188169936),
-                  (-0.684837333227, 0.0462458258203),
-                  (-0.679191384043, 0.0462724391361),
-                  (-0.673535973978, 0.0462986601754),
-                  (-0.667871249101, 0.0463244926146),
-                  (-0.662197352511, 0.0463499405355),
-                  (-0.656514424422, 0.0463750083898),
-                  (-0.650822602251, 0.0463997009654),
-                  (-0.645122020703, 0.0464240233539),
-                  (-0.639412811852, 0.0464479809187),
-                  (-0.633695105226, 0.0464715792651),
-                  (-0.627969027882, 0.0464948242112)]},
- 54: {'color': 'skyblue',
-      'polygon': [(0.788126855977, 0.14234268596),
-                  (0.788170454115, 0.13946103198),
-                  (0.788213166516, 0.136578919024),
-                  (0.788254993828, 0.133696356872),
-                  (0.788295936685, 0.130813355284),
-                  (0.788335995708, 0.127929924004),
-                  (0.788375171498, 0.125046072762),
-                  (0.788413464643, 0.12216181127),
-                  (0.788450875712, 0.119277149225),
-                  (0.788487405261, 0.116392096308),
-                  (0.788523053829, 0.113506662187),
-                  (0.788557821937, 0.110620856516),
-                  (0.788591710091, 0.107734688933),
-                  (0.788624718783, 0.104848169064),
-                  (0.788656848485, 0.101961306523),
-                  (0.788688099654, 0.0990741109104),
-                  (0.788718472733, 0.0961865918148),
-                  (0.788747968145, 0.0932987588132),
-                  (0.788776586299, 0.0904106214715),
-                  (0.788804327586, 0.0875221893448),
-                  (0.788831192383, 0.0846334719781),
-                  (0.788857181047, 0.0817444789064),
-                  (0.788882293922, 0.0788552196553),
-                  (0.788906531334, 0.0759657037417),
-                  (0.788929893592, 0.0730759406736),
-                  (0.78895238099, 0.0701859399515),
-                  (0.788973993804, 0.0672957110679),
-                  (0.788994732294, 0.0644052635083),
-                  (0.789014596705, 0.0615146067516),
-                  (0.789033587264, 0.0586237502705),
-                  (0.789051704181, 0.0557327035319),
-                  (0.789068947652, 0.0528414759975),
-                  (0.789085317853, 0.0499500771241),
-                  (0.783664199088, 0.049976071937),
-                  (0.778230175939, 0.0500023364049),
-                  (0.772783434425, 0.0500288119263),
-                  (0.767324158497, 0.0500554436316),
-                  (0.761852530024, 0.050082180226),
-                  (0.756368728781, 0.0501089738367),
-                  (0.750872932444, 0.0501357798651),
-                  (0.745365316578, 0.0501625568426),
-                  (0.739846054633, 0.0501892662911),
-                  (0.734315317943, 0.0502158725876),
-                  (0.728773275722, 0.050242342833),
-                  (0.723220095062, 0.050268646724),
-                  (0.717655940941, 0.0502947564308),
-                  (0.712080976219, 0.0503206464764),
-                  (0.706495361649, 0.0503462936214),
-                  (0.700899255879, 0.0503716767515),
-                  (0.695292815462, 0.0503967767694),
-                  (0.689676194865, 0.0504215764894),
-                  (0.68404954648, 0.050446060536),
-                  (0.678413020635, 0.0504702152459),
-                  (0.672766765607, 0.0504940285732),
-                  (0.667110927638, 0.0505174899979),
-                  (0.661445650947, 0.0505405904374),
-                  (0.655771077751, 0.0505633221614),
-                  (0.650087348279, 0.0505856787099),
-                  (0.644394600791, 0.0506076548137),
-                  (0.638692971602, 0.0506292463185),
-                  (0.632982595095, 0.0506504501114),
-                  (0.627263603747, 0.05067126405),
-                  (0.621536128151, 0.0506916868951),
-                  (0.615800297037, 0.0507117182449),
-                  (0.610056237298, 0.0507313584727),
-                  (0.610044586437, 0.0536700159048),
-                  (0.610032341364, 0.0566085178841),
-                  (0.610019501897, 0.0595468558962),
-                  (0.610006067843, 0.0624850214192),
-                  (0.609992038994, 0.0654230059228),
-                  (0.60997741513, 0.0683608008684),
-                  (0.609962196018, 0.0712983977081),
-                  (0.609946381412, 0.0742357878852),
-                  (0.609929971051, 0.077172962833),
-                  (0.609912964663, 0.0801099139752),
-                  (0.609895361961, 0.0830466327248),
-                  (0.609877162646, 0.0859831104845),
-                  (0.609858366404, 0.0889193386456),
-                  (0.60983897291, 0.0918553085885),
-                  (0.609818981823, 0.0947910116814),
-                  (0.60979839279, 0.097726439281),
-                  (0.609777205444, 0.100661582731),
-                  (0.609755419404, 0.103596433364),
-                  (0.609733034276, 0.106530982496),
-                  (0.609710049652, 0.109465221435),
-                  (0.609686465111, 0.11239914147),
-                  (0.609662280216, 0.11533273388),
-                  (0.609637494518, 0.118265989928),
-                  (0.609612107555, 0.121198900862),
-                  (0.609586118849, 0.124131457916),
-                  (0.60955952791, 0.127063652309),
-                  (0.609532334231, 0.129995475244),
-                  (0.609504537294, 0.132926917908),
-                  (0.609476136566, 0.135857971473),
-                  (0.609447131499, 0.138788627094),
-                  (0.609417521531, 0.141718875908),
-                  (0.609387306087, 0.144648709038),
-                  (0.615123508632, 0.144589515835),
-                  (0.620851408618, 0.144529437347),
-                  (0.62657087874, 0.14446847006),
-                  (0.632281789887, 0.144406611257),
-                  (0.637984011111, 0.144343859076),
-                  (0.643677409606, 0.144280212585),
-                  (0.649361850684, 0.144215671855),
-                  (0.655037197751, 0.144150238031),
-                  (0.660703312285, 0.144083913412),
-                  (0.666360053813, 0.144016701536),
-                  (0.672007279894, 0.143948607259),
-                  (0.677644846095, 0.143879636844),
-                  (0.683272605973, 0.143809798056),
-                  (0.688890411056, 0.14373910025),
-                  (0.694498110826, 0.143667554473),
-                  (0.700095552705, 0.143595173561),
-                  (0.705682582034, 0.143521972249),
-                  (0.711259042065, 0.143447967274),
-                  (0.716824773941, 0.143373177489),
-                  (0.72237961669, 0.143297623979),
-                  (0.727923407211, 0.14322133018),
-                  (0.733455980264, 0.143144322002),
-                  (0.738977168462, 0.143066627954),
-                  (0.744486802266, 0.142988279283),
-                  (0.749984709977, 0.1429093101),
-                  (0.755470717732, 0.142829757526),
-                  (0.760944649502, 0.142749661835),
-                  (0.766406327093, 0.142669066601),
-                  (0.771855570142, 0.142588018853),
-                  (0.777292196122, 0.14250656923),
-                  (0.782716020347, 0.142424772148),
-                  (0.788126855977, 0.14234268596)]},
- 55: {'color': 'skyblue',
-      'polygon': [(0.596063451375, 0.144878283746),
-                  (0.596093606376, 0.141945617129),
-                  (0.596123174017, 0.139012537593),
-                  (0.596152154848, 0.136079053968),
-                  (0.596180549404, 0.133145175063),
-                  (0.596208358209, 0.130210909674),
-                  (0.59623558177, 0.12727626658),
-                  (0.596262220583, 0.124341254543),
-                  (0.596288275129, 0.12140588231),
-                  (0.596313745876, 0.118470158612),
-                  (0.596338633279, 0.115534092166),
-                  (0.596362937778, 0.112597691673),
-                  (0.596386659803, 0.10966096582),
-                  (0.596409799767, 0.106723923279),
-                  (0.596432358072, 0.103786572711),
-                  (0.596454335105, 0.100848922758),
-                  (0.596475731243, 0.0979109820544),
-                  (0.596496546847, 0.0949727592175),
-                  (0.596516782265, 0.0920342628537),
-                  (0.596536437835, 0.0890955015567),
-                  (0.596555513878, 0.0861564839082),
-                  (0.596574010706, 0.0832172184778),
-                  (0.596591928614, 0.0802777138243),
-                  (0.596609267889, 0.0773379784949),
-                  (0.596626028801, 0.0743980210263),
-                  (0.59664221161, 0.0714578499449),
-                  (0.596657816562, 0.0685174737669),
-                  (0.59667284389, 0.0655769009987),
-                  (0.596687293816, 0.0626361401377),
-                  (0.596701166549, 0.059695199672),
-                  (0.596714462284, 0.0567540880811),
-                  (0.596727181205, 0.0538128138364),
-                  (0.596739323484, 0.0508713854012),
-                  (0.590968896581, 0.0508881703086),
-                  (0.585190767702, 0.0509045714313),
-                  (0.579405054394, 0.0509205923394),
-                  (0.573611872531, 0.0509362370383),
-                  (0.567811336336, 0.0509515099241),
-                  (0.562003558415, 0.0509664157396),
-                  (0.556188649783, 0.0509809595335),
-                  (0.550366719891, 0.050995146621),
-                  (0.544537876657, 0.0510089825464),
-                  (0.538702226496, 0.0510224730482),
-                  (0.532859874349, 0.0510356240249),
-                  (0.527010923711, 0.0510484415037),
-                  (0.521155476665, 0.0510609316102),
-                  (0.515293633907, 0.0510731005405),
-                  (0.509425494781, 0.0510849545341),
-                  (0.503551157307, 0.051096499849),
-                  (0.497670718213, 0.0511077427384),
-                  (0.491784272962, 0.0511186894282),
-                  (0.485891915788, 0.0511293460968),
-                  (0.47999373972, 0.0511397188561),
-                  (0.474089836619, 0.051149813733),
-                  (0.468180297203, 0.0511596366537),
-                  (0.462265211082, 0.0511691934281),
-                  (0.456344666784, 0.0511784897359),
-                  (0.450418751787, 0.0511875311139),
-                  (0.44448755255, 0.0511963229442),
-                  (0.43855115454, 0.0512048704441),
-                  (0.432609642264, 0.051213178656),
-                  (0.426663099299, 0.0512212524395),
-                  (0.420711608317, 0.0512290964641),
-                  (0.414755251118, 0.051236715202),
-                  (0.408794108658, 0.0512441129234),
-                  (0.408785332362, 0.0542162212488),
-                  (0.408776187276, 0.0571881884262),
-                  (0.408766673358, 0.0601600065047),
-                  (0.408756790562, 0.0631316675248),
-                  (0.408746538835, 0.0661031635181),
-                  (0.408735918123, 0.0690744865073),
-                  (0.408724928367, 0.0720456285055),
-                  (0.408713569502, 0.0750165815165),
-                  (0.408701841461, 0.0779873375339),
-                  (0.408689744173, 0.0809578885412),
-                  (0.408677277559, 0.0839282265116),
-                  (0.408664441539, 0.0868983434074),
-                  (0.408651236029, 0.0898682311803),
-                  (0.408637660936, 0.0928378817705),
-                  (0.408623716166, 0.0958072871069),
-                  (0.40860940162, 0.0987764391068),
-                  (0.408594717193, 0.101745329676),
-                  (0.408579662775, 0.104713950706),
-                  (0.408564238251, 0.10768229408),
-                  (0.408548443503, 0.110650351664),
-                  (0.408532278405, 0.113618115315),
-                  (0.408515742827, 0.116585576874),
-                  (0.408498836634, 0.119552728171),
-                  (0.408481559684, 0.122519561022),
-                  (0.408463911831, 0.125486067227),
-                  (0.408445892924, 0.128452238576),
-                  (0.408427502804, 0.131418066842),
-                  (0.408408741307, 0.134383543785),
-                  (0.408389608265, 0.137348661149),
-                  (0.408370103502, 0.140313410666),
-                  (0.408350226836, 0.14327778405),
-                  (0.408329978079, 0.146241773003),
-                  (0.414285326804, 0.146209958549),
-                  (0.42023584932, 0.146177526071),
-                  (0.426181463323, 0.146144469102),
-                  (0.432122085671, 0.146110780923),
-                  (0.438057632366, 0.146076454571),
-                  (0.443988018517, 0.146041482843),
-                  (0.449913158321, 0.146005858309),
-                  (0.455832965028, 0.145969573314),
-                  (0.461747350917, 0.145932619995),
-                  (0.467656227267, 0.145894990285),
-                  (0.473559504327, 0.145856675933),
-                  (0.479457091287, 0.145817668513),
-                  (0.485348896254, 0.145777959437),
-                  (0.491234826213, 0.145737539978),
-                  (0.49711478701, 0.145696401281),
-                  (0.502988683311, 0.145654534385),
-                  (0.508856418581, 0.145611930244),
-                  (0.514717895051, 0.145568579747),
-                  (0.520573013687, 0.145524473742),
-                  (0.526421674165, 0.145479603062),
-                  (0.532263774835, 0.145433958553),
-                  (0.538099212699, 0.145387531099),
-                  (0.543927883374, 0.145340311654),
-                  (0.549749681069, 0.145292291274),
-                  (0.555564498548, 0.145243461153),
-                  (0.561372227111, 0.145193812654),
-                  (0.567172756555, 0.145143337353),
-                  (0.57296597515, 0.145092027071),
-                  (0.578751769611, 0.145039873924),
-                  (0.584530025065, 0.144986870361),
-                  (0.590300625029, 0.144933009215),
-                  (0.596063451375, 0.144878283746)]},
- 56: {'color': 'skyblue',
-      'polygon': [(0.394556380106, 0.146326607392),
-                  (0.394574637131, 0.1433608945),
-                  (0.394592535564, 0.140394798191),
-                  (0.394610075573, 0.137428326737),
-                  (0.394627257322, 0.134461488396),
-                  (0.394644080968, 0.131494291411),
-                  (0.394660546663, 0.12852674401),
-                  (0.394676654553, 0.125558854407),
-                  (0.394692404779, 0.122590630802),
-                  (0.394707797477, 0.119622081382),
-                  (0.394722832778, 0.116653214317),
-                  (0.394737510807, 0.113684037766),
-                  (0.394751831685, 0.110714559875),
-                  (0.394765795528, 0.107744788776),
-                  (0.394779402446, 0.104774732587),
-                  (0.394792652546, 0.101804399415),
-                  (0.39480554593, 0.0988337973535),
-                  (0.394818082694, 0.095862934484),
-                  (0.394830262932, 0.092891818876),
-                  (0.394842086731, 0.0899204585869),
-                  (0.394853554176, 0.0869488616627),
-                  (0.394864665346, 0.0839770361381),
-                  (0.394875420317, 0.0810049900366),
-                  (0.39488581916, 0.0780327313706),
-                  (0.394895861943, 0.0750602681423),
-                  (0.39490554873, 0.0720876083431),
-                  (0.39491487958, 0.0691147599546),
-                  (0.394923854549, 0.0661417309483),
-                  (0.39493247369, 0.0631685292862),
-                  (0.39494073705, 0.0601951629211),
-                  (0.394948644676, 0.0572216397965),
-                  (0.394956196607, 0.0542479678471),
-                  (0.394963392883, 0.0512741549992),
-                  (0.388986939718, 0.051283694681),
-                  (0.383006041931, 0.0512930306531),
-                  (0.377020776453, 0.0513021660164),
-                  (0.371031219544, 0.0513111036537),
-                  (0.36503744682, 0.0513198462291),
-                  (0.359039533278, 0.0513283961891),
-                  (0.353037553321, 0.0513367557638),
-                  (0.347031580787, 0.0513449269686),
-                  (0.341021688966, 0.0513529116068),
-                  (0.335007950633, 0.0513607112722),
-                  (0.328990438067, 0.051368327353),
-                  (0.322969223072, 0.051375761035),
-                  (0.316944377007, 0.0513830133059),
-                  (0.310915970802, 0.0513900849606),
-                  (0.304884074985, 0.0513969766053),
-                  (0.298848759697, 0.0514036886635),
-                  (0.292810094722, 0.0514102213812),
-                  (0.2867681495, 0.0514165748333),
-                  (0.280722993149, 0.0514227489293),
-                  (0.274674694488, 0.0514287434203),
-                  (0.268623322052, 0.0514345579051),
-                  (0.262568944112, 0.0514401918374),
-                  (0.256511628694, 0.0514456445331),
-                  (0.250451443596, 0.0514509151769),
-                  (0.244388456404, 0.05145600283),
-                  (0.238322734511, 0.0514609064377),
-                  (0.232254345131, 0.0514656248364),
-                  (0.226183355315, 0.0514701567618),
-                  (0.220109831967, 0.0514745008562),
-                  (0.214033841858, 0.0514786556763),
-                  (0.207955451638, 0.0514826197012),
-                  (0.201874727854, 0.0514863913395),
-                  (0.20187018375, 0.0544774366547),
-                  (0.201865456977, 0.0574683459283),
-                  (0.20186054758, 0.0604591114504),
-                  (0.201855455608, 0.0634497255036),
-                  (0.201850181108, 0.0664401803628),
-                  (0.201844724128, 0.0694304682947),
-                  (0.201839084717, 0.0724205815578),
-                  (0.201833262924, 0.0754105124023),
-                  (0.201827258799, 0.0784002530696),
-                  (0.201821072391, 0.0813897957924),
-                  (0.201814703751, 0.0843791327941),
-                  (0.201808152927, 0.0873682562891),
-                  (0.201801419972, 0.0903571584823),
-                  (0.201794504934, 0.0933458315688),
-                  (0.201787407863, 0.096334267734),
-                  (0.201780128811, 0.0993224591533),
-                  (0.201772667825, 0.102310397992),
-                  (0.201765024956, 0.105298076404),
-                  (0.201757200254, 0.108285486535),
-                  (0.201749193765, 0.111272620517),
-                  (0.201741005539, 0.114259470474),
-                  (0.201732635624, 0.117246028516),
-                  (0.201724084065, 0.120232286743),
-                  (0.20171535091, 0.123218237245),
-                  (0.201706436202, 0.126203872099),
-                  (0.201697339988, 0.129189183369),
-                  (0.201688062311, 0.13217416311),
-                  (0.201678603212, 0.135158803362),
-                  (0.201668962732, 0.138143096155),
-                  (0.201659140913, 0.141127033505),
-                  (0.201649137793, 0.144110607417),
-                  (0.201638953408, 0.147093809882),
-                  (0.207714476008, 0.14707826821),
-                  (0.213787666, 0.147062184218),
-                  (0.219858455981, 0.147045558818),
-                  (0.225926778411, 0.147028392817),
-                  (0.231992565594, 0.147010686907),
-                  (0.238055749671, 0.146992441661),
-                  (0.244116262604, 0.14697365752),
-                  (0.250174036161, 0.146954334787),
-                  (0.256229001902, 0.146934473619),
-                  (0.262281091165, 0.146914074016),
-                  (0.268330235048, 0.146893135817),
-                  (0.274376364394, 0.146871658687),
-                  (0.280419409777, 0.146849642116),
-                  (0.286459301481, 0.146827085404),
-                  (0.292495969485, 0.146803987656),
-                  (0.298529343445, 0.146780347779),
-                  (0.304559352674, 0.146756164467),
-                  (0.310585926126, 0.146731436201),
-                  (0.316608992374, 0.146706161241),
-                  (0.322628479591, 0.146680337615),
-                  (0.328644315532, 0.14665396312),
-                  (0.334656427511, 0.146627035312),
-                  (0.340664742379, 0.146599551504),
-                  (0.346669186507, 0.146571508758),
-                  (0.352669685758, 0.146542903882),
-                  (0.35866616547, 0.146513733429),
-                  (0.364658550431, 0.146483993691),
-                  (0.370646764857, 0.146453680695),
-                  (0.376630732364, 0.146422790204),
-                  (0.382610375951, 0.146391317715),
-                  (0.388585617971, 0.146359258457),
-                  (0.394556380106, 0.146326607392)]},
- 57: {'color': 'skyblue',
-      'polygon': [(0.187697245464, 0.147190411874),
-                  (0.187708408327, 0.144206406781),
-                  (0.18771940241, 0.141222030685),
-                  (0.187730227666, 0.138237291581),
-                  (0.187740884046, 0.135252197455),
-                  (0.187751371499, 0.132266756277),
-                  (0.187761689976, 0.129280976009),
-                  (0.187771839425, 0.126294864597),
-                  (0.187781819792, 0.123308429977),
-                  (0.187791631024, 0.120321680073),
-                  (0.187801273066, 0.117334622797),
-                  (0.187810745864, 0.11434726605),
-                  (0.187820049362, 0.111359617721),
-                  (0.187829183504, 0.108371685689),
-                  (0.187838148233, 0.105383477822),
-                  (0.187846943491, 0.102395001975),
-                  (0.187855569222, 0.0994062659962),
-                  (0.187864025369, 0.0964172777199),
-                  (0.187872311872, 0.093428044972),
-                  (0.187880428675, 0.0904385755677),
-                  (0.187888375719, 0.0874488773126),
-                  (0.187896152947, 0.0844589580024),
-                  (0.187903760301, 0.0814688254235),
-                  (0.187911197723, 0.0784784873527),
-                  (0.187918465156, 0.0754879515579),
-                  (0.187925562544, 0.0724972257981),
-                  (0.187932489829, 0.0695063178235),
-                  (0.187939246955, 0.0665152353756),
-                  (0.187945833867, 0.0635239861879),
-                  (0.187952250509, 0.0605325779856),
-                  (0.187958496827, 0.057541018486),
-                  (0.187964572768, 0.0545493153988),
-                  (0.187970478277, 0.0515574764262),
-                  (0.181882562457, 0.0515574619286),
-                  (0.175792597183, 0.0515572467134),
-                  (0.169700648649, 0.0515568289801),
-                  (0.163606783017, 0.051556206906),
-                  (0.157511066427, 0.0515553786527),
-                  (0.151413565007, 0.0515543423741),
-                  (0.145314344882, 0.0515530962227),
-                  (0.139213472183, 0.051551638357),
-                  (0.133111013052, 0.0515499669483),
-                  (0.127007033654, 0.0515480801866),
-                  (0.120901600181, 0.0515459762878),
-                  (0.114794778862, 0.0515436534996),
-                  (0.108686635963, 0.0515411101072),
-                  (0.102577237803, 0.0515383444396),
-                  (0.0964666507475, 0.0515353548752),
-                  (0.0903549412239, 0.0515321398466),
-                  (0.0842421757203, 0.0515286978465),
-                  (0.0781284207915, 0.0515250274322),
-                  (0.0720137430628, 0.0515211272303),
-                  (0.0658982092336, 0.0515169959413),
-                  (0.0597818860803, 0.0515126323436),
-                  (0.0536648404596, 0.0515080352977),
-                  (0.0475471393105, 0.0515032037495),
-                  (0.0414288496565, 0.0514981367339),
-                  (0.0353100386077, 0.0514928333781),
-                  (0.0291907733622, 0.051487292904),
-                  (0.0230711212075, 0.0514815146312),
-                  (0.0169511495211, 0.051475497979),
-                  (0.0108309257714, 0.0514692424686),
-                  (0.00471051751853, 0.0514627477248),
-                  (-0.00141000758626, 0.0514560134772),
-                  (-0.00753058179984, 0.0514490395618),
-                  (-0.00753384759165, 0.054446157665),
-                  (-0.00753711004, 0.0574431403791),
-                  (-0.00754036910146, 0.0604399800322),
-                  (-0.00754362473211, 0.0634366689471),
-                  (-0.00754687688774, 0.0664331994409),
-                  (-0.00755012552369, 0.0694295638246),
-                  (-0.00755337059496, 0.0724257544034),
-                  (-0.00755661205631, 0.0754217634763),
-                  (-0.00755984986219, 0.0784175833356),
-                  (-0.00756308396683, 0.0814132062673),
-                  (-0.00756631432429, 0.0844086245502),
-                  (-0.0075695408884, 0.0874038304567),
-                  (-0.00757276361287, 0.0903988162515),
-                  (-0.00757598245139, 0.0933935741923),
-                  (-0.0075791973575, 0.096388096529),
-                  (-0.00758240828472, 0.0993823755041),
-                  (-0.00758561518657, 0.102376403352),
-                  (-0.00758881801664, 0.105370172299),
-                  (-0.00759201672855, 0.108363674564),
-                  (-0.007595211276, 0.111356902355),
-                  (-0.00759840161285, 0.114349847876),
-                  (-0.0076015876931, 0.117342503317),
-                  (-0.00760476947096, 0.120334860862),
-                  (-0.00760794690083, 0.123326912687),
-                  (-0.00761111993742, 0.126318650955),
-                  (-0.00761428853565, 0.129310067824),
-                  (-0.00761745265081, 0.132301155438),
-                  (-0.00762061223847, 0.135291905935),
-                  (-0.00762376725464, 0.138282311441),
-                  (-0.0076269176557, 0.141272364071),
-                  (-0.00763006339847, 0.144262055934),
-                  (-0.00763320444017, 0.147251379123),
-                  (-0.00151811084041, 0.147258369768),
-                  (0.00459694205995, 0.147264778289),
-                  (0.0107118868578, 0.147270604957),
-                  (0.0168266562166, 0.147275850134),
-                  (0.0229411828656, 0.147280514272),
-                  (0.029055399598, 0.147284597911),
-                  (0.0351692392695, 0.147288101676),
-                  (0.0412826347968, 0.147291026276),
-                  (0.0473955191556, 0.147293372503),
-                  (0.0535078253781, 0.147295141226),
-                  (0.059619486551, 0.147296333386),
-                  (0.0657304358122, 0.14729695),
-                  (0.0718406063488, 0.14729699215),
-                  (0.0779499313932, 0.14729646098),
-                  (0.0840583442198, 0.147295357697),
-                  (0.0901657781413, 0.147293683558),
-                  (0.0962721665044, 0.147291439872),
-                  (0.102377442686, 0.147288627991),
-                  (0.108481540088, 0.147285249306),
-                  (0.114584392132, 0.14728130524),
-                  (0.120685932255, 0.147276797244),
-                  (0.126786093903, 0.147271726789),
-                  (0.132884810524, 0.147266095361),
-                  (0.138982015564, 0.147259904452),
-                  (0.145077642456, 0.147253155555),
-                  (0.15117162462, 0.147245850159),
-                  (0.157263895446, 0.147237989735),
-                  (0.163354388295, 0.147229575737),
-                  (0.169443036484, 0.147220609588),
-                  (0.175529773281, 0.147211092674),
-                  (0.181614531894, 0.14720102634),
-                  (0.187697245464, 0.147190411874)]},
- 58: {'color': 'violet',
-      'polygon': [(-0.0112054766744, 0.1472782061),
-                  (-0.0112043299021, 0.144288890637),
-                  (-0.011203175389, 0.141299206409),
-                  (-0.011202013172, 0.138309161321),
-                  (-0.0112008432884, 0.135318763264),
-                  (-0.0111996657758, 0.132328020124),
-                  (-0.0111984806723, 0.129336939772),
-                  (-0.0111972880163, 0.126345530073),
-                  (-0.0111960878466, 0.123353798879),
-                  (-0.0111948802022, 0.120361754035),
-                  (-0.0111936651226, 0.117369403374),
-                  (-0.0111924426473, 0.114376754723),
-                  (-0.0111912128162, 0.111383815898),
-                  (-0.0111899756693, 0.108390594706),
-                  (-0.0111887312468, 0.105397098945),
-                  (-0.011187479589, 0.102403336407),
-                  (-0.0111862207364, 0.0994093148723),
-                  (-0.0111849547296, 0.096415042115),
-                  (-0.011183681609, 0.0934205259006),
-                  (-0.0111824014151, 0.0904257739868),
-                  (-0.0111811141886, 0.0874307941238),
-                  (-0.01117981997, 0.0844355940541),
-                  (-0.0111785187995, 0.0814401815131),
-                  (-0.0111772107174, 0.078444564229),
-                  (-0.0111758957639, 0.075448749923),
-                  (-0.0111745739789, 0.0724527463095),
-                  (-0.0111732454022, 0.0694565610967),
-                  (-0.0111719100731, 0.0664602019859),
-                  (-0.0111705680308, 0.0634636766727),
-                  (-0.0111692193143, 0.0604669928462),
-                  (-0.011167863962, 0.05747015819),
-                  (-0.0111665020121, 0.0544731803821),
-                  (-0.0111651335023, 0.0514760670948),
-                  (-0.0172856476327, 0.0514724712714),
-                  (-0.0234060345213, 0.0514686356737),
-                  (-0.0295262260986, 0.0514645604841),
-                  (-0.0356461542061, 0.0514602459925),
-                  (-0.0417657505977, 0.051455692596),
-                  (-0.0478849469402, 0.0514509007983),
-                  (-0.0540036748152, 0.0514458712085),
-                  (-0.0601218657201, 0.05144060454),
-                  (-0.0662394510697, 0.0514351016085),
-                  (-0.0723563621976, 0.0514293633308),
-                  (-0.0784725303578, 0.051423390722),
-                  (-0.0845878867267, 0.0514171848935),
-                  (-0.090702362404, 0.0514107470501),
-                  (-0.0968158884151, 0.0514040784876),
-                  (-0.102928395712, 0.0513971805887),
-                  (-0.109039815176, 0.0513900548206),
-                  (-0.115150077617, 0.0513827027306),
-                  (-0.121259113779, 0.0513751259425),
-                  (-0.127366854336, 0.0513673261524),
-                  (-0.133473229898, 0.0513593051244),
-                  (-0.13957817101, 0.0513510646859),
-                  (-0.145681608154, 0.051342606723),
-                  (-0.151783471749, 0.0513339331753),
-                  (-0.157883692152, 0.0513250460307),
-                  (-0.163982199658, 0.0513159473202),
-                  (-0.170078924502, 0.0513066391124),
-                  (-0.176173796858, 0.0512971235073),
-                  (-0.182266746838, 0.0512874026309),
-                  (-0.188357704492, 0.0512774786291),
-                  (-0.194446599809, 0.0512673536611),
-                  (-0.200533362714, 0.0512570298936),
-                  (-0.206617923067, 0.0512465094937),
-                  (-0.206616482123, 0.054237757537),
-                  (-0.206614858698, 0.0572288671657),
-                  (-0.206613052792, 0.0602198306185),
-                  (-0.206611064402, 0.0632106401313),
-                  (-0.206608893526, 0.0662012879367),
-                  (-0.206606540161, 0.0691917662645),
-                  (-0.206604004306, 0.0721820673407),
-                  (-0.206601285958, 0.0751721833876),
-                  (-0.206598385114, 0.0781621066238),
-                  (-0.206595301771, 0.0811518292637),
-                  (-0.206592035926, 0.0841413435175),
-                  (-0.206588587575, 0.0871306415908),
-                  (-0.206584956715, 0.0901197156846),
-                  (-0.206581143343, 0.0931085579948),
-                  (-0.206577147454, 0.0960971607122),
-                  (-0.206572969043, 0.0990855160225),
-                  (-0.206568608107, 0.102073616106),
-                  (-0.206564064641, 0.105061453136),
-                  (-0.206559338639, 0.108049019281),
-                  (-0.206554430096, 0.111036306703),
-                  (-0.206549339006, 0.114023307558),
-                  (-0.206544065363, 0.117010013994),
-                  (-0.206538609161, 0.119996418154),
-                  (-0.206532970392, 0.122982512173),
-                  (-0.206527149049, 0.125968288178),
-                  (-0.206521145125, 0.128953738289),
-                  (-0.20651495861, 0.131938854619),
-                  (-0.206508589496, 0.134923629272),
-                  (-0.206502037774, 0.137908054344),
-                  (-0.206495303433, 0.140892121924),
-                  (-0.206488386463, 0.14387582409),
-                  (-0.206481286853, 0.146859152913),
-                  (-0.200402217695, 0.146881007403),
-                  (-0.194320952604, 0.146902311143),
-                  (-0.188237561468, 0.146923062593),
-                  (-0.182152114081, 0.146943260194),
-                  (-0.176064680141, 0.146962902373),
-                  (-0.169975329256, 0.14698198755),
-                  (-0.163884130943, 0.147000514146),
-                  (-0.157791154636, 0.147018480587),
-                  (-0.151696469682, 0.147035885315),
-                  (-0.145600145348, 0.147052726789),
-                  (-0.13950225082, 0.147069003495),
-                  (-0.133402855205, 0.147084713948),
-                  (-0.127302027533, 0.147099856701),
-                  (-0.121199836757, 0.14711443035),
-                  (-0.115096351753, 0.147128433536),
-                  (-0.108991641326, 0.147141864955),
-                  (-0.102885774203, 0.147154723358),
-                  (-0.0967788190392, 0.147167007556),
-                  (-0.0906708444169, 0.147178716428),
-                  (-0.0845619188449, 0.147189848922),
-                  (-0.0784521107596, 0.147200404056),
-                  (-0.0723414885253, 0.147210380927),
-                  (-0.0662301204339, 0.147219778712),
-                  (-0.0601180747053, 0.147228596666),
-                  (-0.0540054194876, 0.147236834132),
-                  (-0.047892222857, 0.14724449054),
-                  (-0.0417785528182, 0.147251565406),
-                  (-0.0356644773042, 0.147258058338),
-                  (-0.0295500641771, 0.147263969035),
-                  (-0.0234353812279, 0.147269297289),
-                  (-0.0173204961769, 0.147274042985),
-                  (-0.0112054766744, 0.1472782061)]},
- 59: {'color': 'violet',
-      'polygon': [(-0.220588747243, 0.146772032318),
-                  (-0.220596052838, 0.143789574908),
-                  (-0.220603163073, 0.140806743543),
-                  (-0.220610077963, 0.137823546158),
-                  (-0.220616797523, 0.134839990681),
-                  (-0.220623321769, 0.13185608503),
-                  (-0.220629650713, 0.128871837117),
-                  (-0.220635784369, 0.125887254843),
-                  (-0.220641722749, 0.122902346103),
-                  (-0.220647465865, 0.119917118785),
-                  (-0.220653013727, 0.116931580767),
-                  (-0.220658366345, 0.113945739923),
-                  (-0.220663523729, 0.110959604117),
-                  (-0.220668485889, 0.107973181207),
-                  (-0.220673252833, 0.104986479047),
-                  (-0.220677824569, 0.101999505483),
-                  (-0.220682201104, 0.0990122683526),
-                  (-0.220686382446, 0.0960247754914),
-                  (-0.220690368602, 0.0930370347274),
-                  (-0.220694159577, 0.0900490538834),
-                  (-0.220697755378, 0.0870608407773),
-                  (-0.22070115601, 0.0840724032217),
-                  (-0.220704361479, 0.0810837490247),
-                  (-0.220707371789, 0.0780948859897),
-                  (-0.220710186945, 0.0751058219158),
-                  (-0.220712806951, 0.0721165645982),
-                  (-0.22071523181, 0.0691271218278),
-                  (-0.220717461527, 0.0661375013921),
-                  (-0.220719496105, 0.0631477110751),
-                  (-0.220721335546, 0.0601577586575),
-                  (-0.220722979854, 0.0571676519167),
-                  (-0.220724429031, 0.0541773986277),
-                  (-0.220725683079, 0.0511870065623),
-                  (-0.226802428278, 0.0511750632017),
-                  (-0.232876667168, 0.0511629327577),
-                  (-0.238948329227, 0.0511506172981),
-                  (-0.245017343851, 0.0511381188489),
-                  (-0.251083640351, 0.0511254393865),
-                  (-0.257147147946, 0.0511125808314),
-                  (-0.26320779576, 0.0510995450408),
-                  (-0.269265512814, 0.0510863338013),
-                  (-0.275320228022, 0.0510729488222),
-                  (-0.281371870181, 0.0510593917282),
-                  (-0.287420367967, 0.0510456640526),
-                  (-0.293465649924, 0.0510317672299),
-                  (-0.299507644457, 0.0510177025896),
-                  (-0.305546279823, 0.0510034713486),
-                  (-0.311581484118, 0.0509890746051),
-                  (-0.317613185271, 0.0509745133314),
-                  (-0.323641311029, 0.050959788368),
-                  (-0.329665788946, 0.0509449004166),
-                  (-0.33568654637, 0.0509298500343),
-                  (-0.341703510431, 0.0509146376273),
-                  (-0.347716608023, 0.0508992634452),
-                  (-0.353725765793, 0.0508837275751),
-                  (-0.359730910122, 0.0508680299364),
-                  (-0.365731967111, 0.0508521702751),
-                  (-0.37172886256, 0.0508361481595),
-                  (-0.377721521951, 0.0508199629746),
-                  (-0.38370987043, 0.0508036139185),
-                  (-0.389693832784, 0.0507870999975),
-                  (-0.395673333422, 0.0507704200227),
-                  (-0.401648296352, 0.0507535726062),
-                  (-0.407618645157, 0.0507365561582),
-                  (-0.413584302972, 0.050719368884),
-                  (-0.413580370652, 0.0536917409681),
-                  (-0.41357606781, 0.056663964947),
-                  (-0.413571394386, 0.0596360328181),
-                  (-0.413566350313, 0.0626079365786),
-                  (-0.413560935523, 0.0655796682256),
-                  (-0.413555149939, 0.0685512197554),
-                  (-0.413548993483, 0.0715225831637),
-                  (-0.413542466069, 0.0744937504451),
-                  (-0.413535567609, 0.0774647135926),
-                  (-0.413528298009, 0.080435464598),
-                  (-0.41352065717, 0.0834059954509),
-                  (-0.413512644988, 0.0863762981387),
-                  (-0.413504261354, 0.0893463646463),
-                  (-0.413495506155, 0.0923161869562),
-                  (-0.413486379272, 0.0952857570474),
-                  (-0.413476880581, 0.0982550668958),
-                  (-0.413467009953, 0.101224108474),
-                  (-0.413456767255, 0.104192873749),
-                  (-0.413446152346, 0.107161354686),
-                  (-0.413435165082, 0.110129543245),
-                  (-0.413423805314, 0.113097431379),
-                  (-0.413412072886, 0.116065011038),
-                  (-0.413399967636, 0.119032274167),
-                  (-0.4133874894, 0.121999212703),
-                  (-0.413374638005, 0.124965818579),
-                  (-0.413361413274, 0.127932083721),
-                  (-0.413347815023, 0.130898000046),
-                  (-0.413333843065, 0.133863559467),
-                  (-0.413319497203, 0.136828753889),
-                  (-0.413304777239, 0.139793575208),
-                  (-0.413289682965, 0.142758015313),
-                  (-0.413274214169, 0.145722066083),
-                  (-0.40731403095, 0.145763322977),
-                  (-0.401349140039, 0.145804015358),
-                  (-0.395379620053, 0.145844146814),
-                  (-0.389405549095, 0.14588372068),
-                  (-0.383427004774, 0.145922740044),
-                  (-0.37744406423, 0.145961207751),
-                  (-0.371456804154, 0.145999126406),
-                  (-0.36546530081, 0.146036498378),
-                  (-0.359469630057, 0.146073325807),
-                  (-0.353469867364, 0.146109610607),
-                  (-0.347466087835, 0.146145354473),
-                  (-0.34145836622, 0.146180558887),
-                  (-0.335446776937, 0.146215225122),
-                  (-0.329431394086, 0.146249354251),
-                  (-0.323412291469, 0.14628294715),
-                  (-0.317389542598, 0.146316004508),
-                  (-0.311363220716, 0.146348526832),
-                  (-0.305333398807, 0.146380514456),
-                  (-0.29930014961, 0.146411967546),
-                  (-0.293263545631, 0.146442886105),
-                  (-0.287223659157, 0.146473269989),
-                  (-0.281180562266, 0.146503118905),
-                  (-0.275134326834, 0.146532432423),
-                  (-0.269085024553, 0.146561209985),
-                  (-0.263032726931, 0.146589450909),
-                  (-0.25697750531, 0.146617154401),
-                  (-0.250919430869, 0.146644319558),
-                  (-0.244858574631, 0.146670945382),
-                  (-0.238795007476, 0.14669703078),
-                  (-0.232728800143, 0.14672257458),
-                  (-0.226660023239, 0.146747575531),
-                  (-0.220588747243, 0.146772032318)]},
- 60: {'color': 'violet',
-      'polygon': [(-0.427001682246, 0.14557202539),
-                  (-0.427018058176, 0.142609769472),
-                  (-0.427034045964, 0.139647122798),
-                  (-0.427049645847, 0.13668409351),
-                  (-0.427064858057, 0.13372068974),
-                  (-0.427079682817, 0.130756919615),
-                  (-0.427094120345, 0.12779279125),
-                  (-0.427108170853, 0.124828312757),
-                  (-0.427121834544, 0.121863492237),
-                  (-0.427135111618, 0.118898337788),
-                  (-0.427148002269, 0.115932857498),
-                  (-0.427160506681, 0.112967059451),
-                  (-0.427172625036, 0.110000951725),
-                  (-0.427184357509, 0.107034542392),
-                  (-0.427195704268, 0.10406783952),
-                  (-0.427206665475, 0.101100851171),
-                  (-0.427217241289, 0.0981335854038),
-                  (-0.42722743186, 0.0951660502715),
-                  (-0.427237237333, 0.0921982538243),
-                  (-0.427246657849, 0.0892302041088),
-                  (-0.427255693542, 0.0862619091682),
-                  (-0.427264344541, 0.0832933770429),
-                  (-0.427272610969, 0.0803246157705),
-                  (-0.427280492943, 0.0773556333863),
-                  (-0.427287990575, 0.0743864379237),
-                  (-0.427295103974, 0.0714170374141),
-                  (-0.427301833239, 0.0684474398875),
-                  (-0.427308178468, 0.0654776533728),
-                  (-0.427314139751, 0.0625076858977),
-                  (-0.427319717173, 0.0595375454896),
-                  (-0.427324910816, 0.0565672401752),
-                  (-0.427329720754, 0.0535967779813),
-                  (-0.427334147057, 0.0506261669348),
-                  (-0.433283734278, 0.050609055034),
-                  (-0.4392282936, 0.0505917620585),
-                  (-0.44516774533, 0.0505742850884),
-                  (-0.451102009153, 0.0505566209903),
-                  (-0.457031004095, 0.0505387664181),
-                  (-0.462954648495, 0.050520717814),
-                  (-0.468872859964, 0.0505024714094),
-                  (-0.474785555357, 0.0504840232272),
-                  (-0.480692650732, 0.0504653690845),
-                  (-0.486594061312, 0.0504465045953),
-                  (-0.492489701449, 0.0504274251748),
-                  (-0.498379484582, 0.050408126043),
-                  (-0.504263323195, 0.0503886022305),
-                  (-0.510141128774, 0.0503688485836),
-                  (-0.516012811766, 0.0503488597711),
-                  (-0.521878281529, 0.0503286302909),
-                  (-0.52773744629, 0.0503081544783),
-                  (-0.533590213094, 0.050287426514),
-                  (-0.539436487755, 0.0502664404337),
-                  (-0.545276174807, 0.0502451901384),
-                  (-0.55110917745, 0.0502236694046),
-                  (-0.556935397497, 0.0502018718967),
-                  (-0.562754735322, 0.0501797911792),
-                  (-0.568567089798, 0.0501574207301),
-                  (-0.574372358244, 0.0501347539553),
-                  (-0.580170436366, 0.0501117842039),
-                  (-0.585961218192, 0.0500885047838),
-                  (-0.591744596014, 0.0500649089795),
-                  (-0.597520460324, 0.0500409900696),
-                  (-0.603288699748, 0.0500167413459),
-                  (-0.609049200979, 0.0499921561336),
-                  (-0.614801848709, 0.0499672278121),
-                  (-0.614794358469, 0.0529061830543),
-                  (-0.614786279016, 0.0558449728551),
-                  (-0.614777610064, 0.0587835886769),
-                  (-0.614768351312, 0.0617220219833),
-                  (-0.614758502443, 0.0646602642396),
-                  (-0.614748063127, 0.0675983069123),
-                  (-0.614737033019, 0.0705361414683),
-                  (-0.614725411759, 0.0734737593751),
-                  (-0.614713198974, 0.0764111520999),
-                  (-0.614700394274, 0.0793483111096),
-                  (-0.614686997257, 0.0822852278703),
-                  (-0.614673007504, 0.0852218938468),
-                  (-0.614658424582, 0.0881583005022),
-                  (-0.614643248045, 0.0910944392978),
-                  (-0.61462747743, 0.0940303016922),
-                  (-0.614611112262, 0.0969658791413),
-                  (-0.614594152048, 0.0999011630977),
-                  (-0.614576596284, 0.10283614501),
-                  (-0.614558444448, 0.105770816324),
-                  (-0.614539696007, 0.108705168478),
-                  (-0.614520350409, 0.111639192909),
-                  (-0.614500407091, 0.114572881046),
-                  (-0.614479865474, 0.117506224313),
-                  (-0.614458724963, 0.120439214127),
-                  (-0.614436984951, 0.1233718419),
-                  (-0.614414644814, 0.126304099033),
-                  (-0.614391703914, 0.129235976924),
-                  (-0.614368161599, 0.132167466959),
-                  (-0.614344017201, 0.135098560518),
-                  (-0.614319270038, 0.138029248969),
-                  (-0.614293919413, 0.140959523674),
-                  (-0.614267964616, 0.143889375981),
-                  (-0.608522769815, 0.143953333089),
-                  (-0.602769621513, 0.144016461488),
-                  (-0.597008637241, 0.144078771292),
-                  (-0.591239932614, 0.144140272632),
-                  (-0.585463621392, 0.144200975624),
-                  (-0.579679815532, 0.144260890356),
-                  (-0.573888625253, 0.144320026864),
-                  (-0.568090159082, 0.144378395112),
-                  (-0.562284523917, 0.144436004979),
-                  (-0.556471825075, 0.144492866235),
-                  (-0.550652166343, 0.144548988531),
-                  (-0.544825650035, 0.144604381382),
-                  (-0.538992377035, 0.144659054153),
-                  (-0.53315244685, 0.144713016043),
-                  (-0.527305957654, 0.144766276079),
-                  (-0.521453006339, 0.144818843101),
-                  (-0.515593688556, 0.14487072575),
-                  (-0.509728098761, 0.144921932462),
-                  (-0.503856330261, 0.144972471458),
-                  (-0.497978475249, 0.145022350736),
-                  (-0.492094624851, 0.145071578062),
-                  (-0.486204869166, 0.145120160968),
-                  (-0.4803092973, 0.145168106742),
-                  (-0.47440799741, 0.145215422426),
-                  (-0.468501056737, 0.14526211481),
-                  (-0.46258856164, 0.14530819043),
-                  (-0.456670597639, 0.145353655563),
-                  (-0.45074724944, 0.145398516228),
-                  (-0.444818600971, 0.145442778181),
-                  (-0.438884735418, 0.145486446915),
-                  (-0.432945735248, 0.145529527662),
-                  (-0.427001682246, 0.14557202539)]},
- 61: {'color': 'violet',
-      'polygon': [(-0.627464466718, 0.143818614413),
-                  (-0.627491979618, 0.140891668695),
-                  (-0.62751887022, 0.137964297767),
-                  (-0.627545139269, 0.135036510334),
-                  (-0.627570787498, 0.132108315091),
-                  (-0.627595815622, 0.129179720725),
-                  (-0.627620224342, 0.12625073591),
-                  (-0.627644014343, 0.123321369316),
-                  (-0.627667186294, 0.120391629599),
-                  (-0.627689740852, 0.117461525413),
-                  (-0.627711678654, 0.114531065399),
-                  (-0.627733000327, 0.111600258194),
-                  (-0.627753706477, 0.10866911243),
-                  (-0.6277737977, 0.105737636729),
-                  (-0.627793274573, 0.10280583971),
-                  (-0.62781213766, 0.0998737299866),
-                  (-0.627830387509, 0.0969413161675),
-                  (-0.627848024652, 0.0940086068572),
-                  (-0.627865049606, 0.0910756106563),
-                  (-0.627881462873, 0.0881423361622),
-                  (-0.627897264941, 0.0852087919694),
-                  (-0.62791245628, 0.0822749866697),
-                  (-0.627927037347, 0.0793409288531),
-                  (-0.627941008583, 0.0764066271078),
-                  (-0.627954370413, 0.0734720900207),
-                  (-0.627967123248, 0.0705373261779),
-                  (-0.627979267483, 0.0676023441653),
-                  (-0.627990803498, 0.0646671525682),
-                  (-0.628001731657, 0.0617317599728),
-                  (-0.62801205231, 0.0587961749658),
-                  (-0.62802176579, 0.0558604061348),
-                  (-0.628030872417, 0.0529244620692),
-                  (-0.628039372494, 0.04998835136),
-                  (-0.633765197921, 0.0499637354256),
-                  (-0.639482648541, 0.0499387472917),
-                  (-0.645191597226, 0.0499133809936),
-                  (-0.650891914382, 0.049887630778),
-                  (-0.656583467873, 0.0498614911323),
-                  (-0.662266122933, 0.049834956815),
-                  (-0.667939742091, 0.0498080228872),
-                  (-0.673604185082, 0.0497806847453),
-                  (-0.679259308763, 0.0497529381552),
-                  (-0.684904967023, 0.0497247792875),
-                  (-0.690541010699, 0.0496962047541),
-                  (-0.696167287477, 0.0496672116461),
-                  (-0.701783641809, 0.0496377975732),
-                  (-0.707389914811, 0.0496079607041),
-                  (-0.712985944173, 0.0495776998087),
-                  (-0.718571564055, 0.0495470143012),
-                  (-0.724146604995, 0.0495159042854),
-                  (-0.729710893805, 0.0494843706003),
-                  (-0.735264253466, 0.0494524148682),
-                  (-0.740806503027, 0.0494200395438),
-                  (-0.746337457499, 0.0493872479648),
-                  (-0.751856927746, 0.0493540444042),
-                  (-0.757364720377, 0.0493204341238),
-                  (-0.762860637634, 0.0492864234297),
-                  (-0.768344477279, 0.0492520197288),
-                  (-0.77381603248, 0.0492172315878),
-                  (-0.779275091698, 0.0491820687925),
-                  (-0.784721438563, 0.0491465424103),
-                  (-0.790154851759, 0.0491106648527),
-                  (-0.795575104903, 0.0490744499409),
-                  (-0.80098196642, 0.0490379129724),
-                  (-0.806375199418, 0.0490010707889),
-                  (-0.806361802349, 0.05188851884),
-                  (-0.806347507334, 0.054775788369),
-                  (-0.80633231387, 0.0576628696767),
-                  (-0.806316221434, 0.0605497530651),
-                  (-0.806299229482, 0.0634364288361),
-                  (-0.806281337449, 0.0663228872916),
-                  (-0.80626254475, 0.0692091187326),
-                  (-0.806242850777, 0.0720951134589),
-                  (-0.806222254905, 0.0749808617686),
-                  (-0.806200756486, 0.0778663539574),
-                  (-0.806178354854, 0.0807515803181),
-                  (-0.806155049321, 0.0836365311402),
-                  (-0.806130839182, 0.0865211967092),
-                  (-0.806105723709, 0.0894055673061),
-                  (-0.806079702157, 0.0922896332066),
-                  (-0.80605277376, 0.0951733846812),
-                  (-0.806024937734, 0.0980568119938),
-                  (-0.805996193275, 0.100939905402),
-                  (-0.805966539561, 0.103822655154),
-                  (-0.80593597575, 0.106705051494),
-                  (-0.805904500984, 0.109587084653),
-                  (-0.805872114384, 0.112468744857),
-                  (-0.805838815053, 0.115350022318),
-                  (-0.805804602079, 0.118230907242),
-                  (-0.805769474529, 0.12111138982),
-                  (-0.805733431455, 0.123991460233),
-                  (-0.805696471889, 0.12687110865),
-                  (-0.805658594847, 0.129750325226),
-                  (-0.80561979933, 0.132629100104),
-                  (-0.80558008432, 0.135507423411),
-                  (-0.805539448784, 0.13838528526),
-                  (-0.80549789167, 0.141262675748),
-                  (-0.800115409892, 0.141357486903),
-                  (-0.794719269913, 0.141451379186),
-                  (-0.789309699299, 0.141544339026),
-                  (-0.783886920969, 0.141636354477),
-                  (-0.778451153292, 0.141727415145),
-                  (-0.773002610188, 0.141817512112),
-                  (-0.767541501218, 0.141906637868),
-                  (-0.762068031686, 0.141994786242),
-                  (-0.756582402729, 0.142081952333),
-                  (-0.751084811413, 0.142168132444),
-                  (-0.745575450823, 0.142253324021),
-                  (-0.740054510154, 0.142337525589),
-                  (-0.734522174805, 0.142420736693),
-                  (-0.72897862646, 0.14250295784),
-                  (-0.723424043182, 0.142584190438),
-                  (-0.717858599499, 0.142664436749),
-                  (-0.712282466485, 0.142743699829),
-                  (-0.706695811847, 0.142821983478),
-                  (-0.701098800009, 0.142899292192),
-                  (-0.69549159219, 0.142975631111),
-                  (-0.689874346489, 0.143051005976),
-                  (-0.684247217961, 0.14312542308),
-                  (-0.678610358697, 0.143198889227),
-                  (-0.672963917899, 0.143271411688),
-                  (-0.667308041959, 0.14334299816),
-                  (-0.66164287453, 0.143413656728),
-                  (-0.655968556604, 0.143483395827),
-                  (-0.650285226579, 0.143552224203),
-                  (-0.644593020334, 0.143620150879),
-                  (-0.638892071297, 0.143687185124),
-                  (-0.633182510515, 0.143753336416),
-                  (-0.627464466718, 0.143818614413)]},
- 62: {'color': 'skyblue',
-      'polygon': [(0.786190994499, 0.237561643427),
-                  (0.786262915753, 0.234700928197),
-                  (0.786333920954, 0.231839416331),
-                  (0.786404011222, 0.228977118407),
-                  (0.786473187668, 0.226114044974),
-                  (0.786541451389, 0.223250206551),
-                  (0.786608803472, 0.220385613623),
-                  (0.78667524499, 0.217520276652),
-                  (0.786740777004, 0.214654206065),
-                  (0.786805400563, 0.211787412264),
-                  (0.786869116704, 0.208919905622),
-                  (0.78693192645, 0.206051696483),
-                  (0.786993830811, 0.203182795166),
-                  (0.787054830785, 0.20031321196),
-                  (0.787114927355, 0.19744295713),
-                  (0.787174121491, 0.194572040914),
-                  (0.787232414152, 0.191700473524),
-                  (0.787289806278, 0.188828265146),
-                  (0.787346298801, 0.185955425944),
-                  (0.787401892634, 0.183081966053),
-                  (0.78745658868, 0.180207895588),
-                  (0.787510387824, 0.177333224637),
-                  (0.78756329094, 0.174457963267),
-                  (0.787615298885, 0.171582121522),
-                  (0.787666412503, 0.168705709422),
-                  (0.787716632622, 0.165828736966),
-                  (0.787765960056, 0.16295121413),
-                  (0.787814395604, 0.160073150871),
-                  (0.78786194005, 0.157194557122),
-                  (0.787908594162, 0.154315442799),
-                  (0.787954358695, 0.151435817795),
-                  (0.787999234386, 0.148555691985),
-                  (0.788043221958, 0.145675075224),
-                  (0.782632806346, 0.145762580184),
-                  (0.777209401514, 0.145849779869),
-                  (0.771773194193, 0.145936615867),
-                  (0.766324368958, 0.146023033716),
-                  (0.76086310823, 0.146108982733),
-                  (0.755389592266, 0.146194415855),
-                  (0.749903999161, 0.14627928948),
-                  (0.744406504846, 0.146363563311),
-                  (0.73889728309, 0.146447200213),
-                  (0.733376505499, 0.146530166063),
-                  (0.727844341526, 0.146612429611),
-                  (0.722300958473, 0.146693962346),
-                  (0.716746521499, 0.146774738366),
-                  (0.711181193629, 0.146854734243),
-                  (0.70560513576, 0.146933928909),
-                  (0.70001850668, 0.147012303529),
-                  (0.69442146307, 0.147089841387),
-                  (0.688814159527, 0.147166527778),
-                  (0.683196748572, 0.147242349894),
-                  (0.677569380666, 0.147317296722),
-                  (0.67193220423, 0.147391358943),
-                  (0.66628536566, 0.147464528833),
-                  (0.660629009346, 0.14753680017),
-                  (0.65496327769, 0.147608168142),
-                  (0.649288311129, 0.147678629261),
-                  (0.643604248152, 0.147748181276),
-                  (0.637911225325, 0.147816823092),
-                  (0.632209377313, 0.147884554694),
-                  (0.6264988369, 0.147951377067),
-                  (0.620779735016, 0.148017292128),
-                  (0.615052200761, 0.148082302655),
-                  (0.609316361429, 0.148146412219),
-                  (0.609286432408, 0.151075291813),
-                  (0.609255895802, 0.154003726554),
-                  (0.609224750969, 0.15693170749),
-                  (0.60919299725, 0.159859225648),
-                  (0.609160633975, 0.162786272038),
-                  (0.609127660457, 0.165712837651),
-                  (0.609094075994, 0.168638913458),
-                  (0.609059879872, 0.171564490411),
-                  (0.609025071359, 0.174489559444),
-                  (0.60898964971, 0.177414111469),
-                  (0.608953614164, 0.180338137377),
-                  (0.608916963948, 0.183261628043),
-                  (0.608879698271, 0.186184574316),
-                  (0.608841816328, 0.189106967027),
-                  (0.608803317299, 0.192028796986),
-                  (0.608764200349, 0.194950054981),
-                  (0.608724464628, 0.197870731779),
-                  (0.608684109271, 0.200790818123),
-                  (0.608643133398, 0.203710304737),
-                  (0.608601536112, 0.20662918232),
-                  (0.608559316504, 0.209547441551),
-                  (0.608516473645, 0.212465073083),
-                  (0.608473006596, 0.215382067549),
-                  (0.608428914399, 0.218298415557),
-                  (0.608384196082, 0.221214107692),
-                  (0.608338850656, 0.224129134515),
-                  (0.608292877119, 0.227043486563),
-                  (0.608246274451, 0.229957154349),
-                  (0.608199041618, 0.232870128362),
-                  (0.608151177569, 0.235782399066),
-                  (0.608102681239, 0.238693956899),
-                  (0.608053551546, 0.241604792276),
-                  (0.613773053713, 0.241499817294),
-                  (0.619484104022, 0.241393430735),
-                  (0.625186575094, 0.241285626265),
-                  (0.6308803379, 0.24117639839),
-                  (0.636565261748, 0.24106574253),
-                  (0.642241214257, 0.240953655088),
-                  (0.647908061338, 0.240840133533),
-                  (0.653565667183, 0.240725176481),
-                  (0.659213894236, 0.240608783776),
-                  (0.664852603185, 0.24049095658),
-                  (0.670481652939, 0.240371697463),
-                  (0.676100900617, 0.240251010496),
-                  (0.68171020153, 0.240128901352),
-                  (0.687309409168, 0.240005377402),
-                  (0.692898375184, 0.239880447824),
-                  (0.698476949387, 0.239754123709),
-                  (0.704044979725, 0.239626418176),
-                  (0.709602312277, 0.239497346484),
-                  (0.715148791243, 0.239366926153),
-                  (0.720684258935, 0.239235177092),
-                  (0.726208555771, 0.23910212172),
-                  (0.731721520267, 0.238967785105),
-                  (0.737222989033, 0.238832195096),
-                  (0.74271279677, 0.238695382465),
-                  (0.748190776263, 0.238557381052),
-                  (0.753656758388, 0.238418227914),
-                  (0.759110572102, 0.238277963483),
-                  (0.764552044456, 0.238136631718),
-                  (0.769981000586, 0.237994280275),
-                  (0.775397263727, 0.237850960673),
-                  (0.780800655217, 0.237706728467),
-                  (0.786190994499, 0.237561643427)]},
- 63: {'color': 'skyblue',
-      'polygon': [(0.594802474709, 0.241895239848),
-                  (0.594851085772, 0.238981449789),
-                  (0.594899082672, 0.236066942006),
-                  (0.594946466452, 0.233151726027),
-                  (0.594993238137, 0.230235811354),
-                  (0.595039398738, 0.227319207465),
-                  (0.595084949252, 0.224401923815),
-                  (0.595129890657, 0.221483969834),
-                  (0.59517422392, 0.218565354927),
-                  (0.595217949989, 0.215646088477),
-                  (0.5952610698, 0.212726179844),
-                  (0.595303584271, 0.209805638363),
-                  (0.595345494307, 0.206884473346),
-                  (0.595386800798, 0.203962694085),
-                  (0.595427504617, 0.201040309846),
-                  (0.595467606624, 0.198117329876),
-                  (0.595507107664, 0.195193763397),
-                  (0.595546008566, 0.192269619611),
-                  (0.595584310145, 0.189344907698),
-                  (0.595622013202, 0.186419636817),
-                  (0.595659118521, 0.183493816104),
-                  (0.595695626874, 0.180567454676),
-                  (0.595731539018, 0.17764056163),
-                  (0.595766855693, 0.17471314604),
-                  (0.595801577628, 0.171785216962),
-                  (0.595835705536, 0.168856783431),
-                  (0.595869240114, 0.165927854463),
-                  (0.595902182048, 0.162998439053),
-                  (0.595934532007, 0.160068546179),
-                  (0.595966290648, 0.157138184798),
-                  (0.595997458612, 0.154207363849),
-                  (0.596028036527, 0.151276092254),
-                  (0.596058025006, 0.148344378915),
-                  (0.590295638958, 0.148403606942),
-                  (0.584525475393, 0.148461955091),
-                  (0.578747652465, 0.148519430163),
-                  (0.57296228669, 0.148576039388),
-                  (0.567169492973, 0.148631790382),
-                  (0.561369384637, 0.148686691094),
-                  (0.55556207345, 0.148740749764),
-                  (0.549747669658, 0.148793974886),
-                  (0.543926282006, 0.148846375158),
-                  (0.538098017776, 0.148897959455),
-                  (0.532262982809, 0.148948736786),
-                  (0.526421281538, 0.148998716262),
-                  (0.520573017019, 0.149047907062),
-                  (0.514718290954, 0.149096318409),
-                  (0.508857203727, 0.149143959533),
-                  (0.502989854431, 0.14919083965),
-                  (0.497116340897, 0.149236967935),
-                  (0.491236759725, 0.149282353496),
-                  (0.485351206312, 0.149327005358),
-                  (0.479459774882, 0.149370932436),
-                  (0.473562558515, 0.149414143519),
-                  (0.467659649176, 0.149456647253),
-                  (0.461751137745, 0.149498452124),
-                  (0.455837114045, 0.149539566442),
-                  (0.449917666871, 0.149579998328),
-                  (0.443992884019, 0.149619755703),
-                  (0.438062852312, 0.149658846274),
-                  (0.432127657632, 0.149697277527),
-                  (0.426187384943, 0.149735056714),
-                  (0.420242118324, 0.14977219085),
-                  (0.414291940993, 0.149808686703),
-                  (0.408336935332, 0.149844550788),
-                  (0.408317362312, 0.152807645398),
-                  (0.408297416376, 0.155770328392),
-                  (0.408277097304, 0.158732591405),
-                  (0.40825640487, 0.161694426055),
-                  (0.40823533884, 0.164655823945),
-                  (0.408213898974, 0.16761677666),
-                  (0.408192085026, 0.17057727577),
-                  (0.408169896741, 0.173537312828),
-                  (0.408147333857, 0.176496879369),
-                  (0.408124396105, 0.179455966913),
-                  (0.40810108321, 0.182414566962),
-                  (0.408077394886, 0.185372670999),
-                  (0.408053330842, 0.188330270493),
-                  (0.408028890779, 0.191287356892),
-                  (0.408004074388, 0.194243921629),
-                  (0.407978881355, 0.197199956118),
-                  (0.407953311355, 0.200155451755),
-                  (0.407927364056, 0.203110399917),
-                  (0.407901039118, 0.206064791965),
-                  (0.407874336191, 0.20901861924),
-                  (0.407847254919, 0.211971873065),
-                  (0.407819794934, 0.214924544743),
-                  (0.407791955861, 0.217876625561),
-                  (0.407763737316, 0.220828106784),
-                  (0.407735138905, 0.22377897966),
-                  (0.407706160226, 0.226729235418),
-                  (0.407676800866, 0.229678865266),
-                  (0.407647060404, 0.232627860393),
-                  (0.407616938408, 0.235576211971),
-                  (0.407586434438, 0.238523911149),
-                  (0.407555548043, 0.241470949057),
-                  (0.407524278761, 0.244417316807),
-                  (0.413467097266, 0.244356348456),
-                  (0.419405006435, 0.244294334084),
-                  (0.425337921097, 0.244231264791),
-                  (0.431265755258, 0.244167131382),
-                  (0.437188422073, 0.244101924376),
-                  (0.443105833827, 0.244035634009),
-                  (0.449017901907, 0.243968250249),
-                  (0.454924536782, 0.243899762803),
-                  (0.460825647977, 0.243830161126),
-                  (0.466721144048, 0.243759434439),
-                  (0.472610932559, 0.243687571737),
-                  (0.478494920056, 0.243614561807),
-                  (0.484373012044, 0.243540393246),
-                  (0.490245112961, 0.243465054474),
-                  (0.496111126153, 0.243388533758),
-                  (0.50197095385, 0.243310819231),
-                  (0.507824497141, 0.243231898915),
-                  (0.513671655948, 0.243151760742),
-                  (0.519512329, 0.243070392584),
-                  (0.525346413812, 0.24298778228),
-                  (0.531173806656, 0.242903917661),
-                  (0.536994402537, 0.242818786584),
-                  (0.542808095171, 0.242732376969),
-                  (0.548614776956, 0.242644676823),
-                  (0.554414338948, 0.242555674289),
-                  (0.56020667084, 0.242465357676),
-                  (0.565991660935, 0.242373715506),
-                  (0.57176919612, 0.242280736551),
-                  (0.577539161846, 0.242186409885),
-                  (0.583301442102, 0.242090724927),
-                  (0.589055919391, 0.241993671493),
-                  (0.594802474709, 0.241895239848)]},
- 64: {'color': 'skyblue',
-      'polygon': [(0.39372083347, 0.244528847983),
-                  (0.393751487144, 0.241580666962),
-                  (0.393781772726, 0.238631818405),
-                  (0.393811690637, 0.235682311166),
-                  (0.393841241288, 0.232732154079),
-                  (0.393870425082, 0.22978135596),
-                  (0.393899242409, 0.226829925602),
-                  (0.393927693655, 0.223877871784),
-                  (0.393955779193, 0.220925203261),
-                  (0.393983499389, 0.217971928771),
-                  (0.394010854599, 0.215018057034),
-                  (0.39403784517, 0.21206359675),
-                  (0.394064471444, 0.209108556601),
-                  (0.394090733749, 0.20615294525),
-                  (0.39411663241, 0.203196771342),
-                  (0.39414216774, 0.200240043502),
-                  (0.394167340045, 0.197282770341),
-                  (0.394192149624, 0.194324960447),
-                  (0.394216596768, 0.191366622394),
-                  (0.39424068176, 0.188407764736),
-                  (0.394264404874, 0.18544839601),
-                  (0.394287766378, 0.182488524737),
-                  (0.394310766533, 0.179528159418),
-                  (0.394333405592, 0.176567308538),
-                  (0.394355683801, 0.173605980566),
-                  (0.394377601399, 0.170644183953),
-                  (0.394399158617, 0.167681927133),
-                  (0.394420355682, 0.164719218525),
-                  (0.394441192811, 0.161756066528),
-                  (0.394461670216, 0.15879247953),
-                  (0.394481788104, 0.155828465897),
-                  (0.394501546673, 0.152864033984),
-                  (0.394520946115, 0.149899192128),
-                  (0.388550508357, 0.14993199421),
-                  (0.382575588829, 0.149964189276),
-                  (0.376596265928, 0.149995782449),
-                  (0.37061261738, 0.150026778583),
-                  (0.364624720265, 0.150057182262),
-                  (0.358632651043, 0.150086997803),
-                  (0.352636485576, 0.150116229255),
-                  (0.346636299154, 0.150144880402),
-                  (0.340632166515, 0.150172954766),
-                  (0.334624161869, 0.15020045561),
-                  (0.32861235892, 0.150227385943),
-                  (0.322596830891, 0.150253748519),
-                  (0.31657765054, 0.15027954585),
-                  (0.310554890183, 0.150304780205),
-                  (0.304528621717, 0.150329453616),
-                  (0.298498916638, 0.150353567885),
-                  (0.29246584606, 0.150377124594),
-                  (0.286429480734, 0.150400125102),
-                  (0.280389891071, 0.150422570563),
-                  (0.274347147155, 0.150444461924),
-                  (0.268301318762, 0.150465799937),
-                  (0.26225247538, 0.150486585166),
-                  (0.256200686223, 0.150506817994),
-                  (0.250146020251, 0.150526498631),
-                  (0.24408854618, 0.150545627123),
-                  (0.238028332505, 0.150564203359),
-                  (0.231965447508, 0.150582227079),
-                  (0.225899959277, 0.150599697883),
-                  (0.219831935721, 0.150616615241),
-                  (0.213761444579, 0.150632978498),
-                  (0.207688553437, 0.150648786887),
-                  (0.201613329741, 0.150664039532),
-                  (0.201602389649, 0.153646399486),
-                  (0.201591268444, 0.156628362346),
-                  (0.201579966158, 0.159609920052),
-                  (0.20156848282, 0.162591064525),
-                  (0.201556818458, 0.165571787676),
-                  (0.201544973097, 0.1685520814),
-                  (0.201532946762, 0.171531937581),
-                  (0.201520739472, 0.174511348087),
-                  (0.201508351248, 0.177490304773),
-                  (0.201495782106, 0.180468799478),
-                  (0.201483032059, 0.183446824029),
-                  (0.201470101119, 0.186424370238),
-                  (0.201456989295, 0.189401429901),
-                  (0.201443696593, 0.192377994802),
-                  (0.201430223016, 0.195354056708),
-                  (0.201416568564, 0.198329607371),
-                  (0.201402733235, 0.201304638531),
-                  (0.201388717022, 0.20427914191),
-                  (0.201374519916, 0.207253109215),
-                  (0.201360141905, 0.21022653214),
-                  (0.201345582972, 0.21319940236),
-                  (0.201330843099, 0.216171711539),
-                  (0.201315922261, 0.219143451322),
-                  (0.201300820432, 0.222114613339),
-                  (0.201285537582, 0.225085189205),
-                  (0.201270073675, 0.228055170519),
-                  (0.201254428673, 0.231024548862),
-                  (0.201238602533, 0.233993315803),
-                  (0.201222595209, 0.236961462891),
-                  (0.201206406649, 0.23992898166),
-                  (0.201190036798, 0.242895863628),
-                  (0.201173485595, 0.245862100297),
-                  (0.207237770499, 0.24583484097),
-                  (0.213299721071, 0.245806666274),
-                  (0.219359268418, 0.245777576213),
-                  (0.225416343442, 0.245747570646),
-                  (0.231470876824, 0.245716649277),
-                  (0.237522799015, 0.245684811649),
-                  (0.243572040219, 0.24565205713),
-                  (0.249618530382, 0.245618384909),
-                  (0.25566219918, 0.245583793985),
-                  (0.261702976, 0.245548283158),
-                  (0.267740789931, 0.24551185102),
-                  (0.273775569746, 0.245474495949),
-                  (0.279807243889, 0.245436216097),
-                  (0.285835740456, 0.245397009384),
-                  (0.291860987184, 0.245356873491),
-                  (0.297882911432, 0.245315805849),
-                  (0.303901440165, 0.245273803636),
-                  (0.309916499935, 0.245230863766),
-                  (0.315928016869, 0.245186982884),
-                  (0.321935916646, 0.245142157358),
-                  (0.327940124482, 0.245096383277),
-                  (0.333940565111, 0.245049656441),
-                  (0.339937162766, 0.245001972356),
-                  (0.34592984116, 0.244953326232),
-                  (0.351918523468, 0.244903712977),
-                  (0.357903132307, 0.244853127194),
-                  (0.363883589712, 0.244801563177),
-                  (0.369859817124, 0.244749014908),
-                  (0.375831735359, 0.244695476056),
-                  (0.381799264598, 0.244640939977),
-                  (0.387762324357, 0.244585399711),
-                  (0.39372083347, 0.244528847983)]},
- 65: {'color': 'skyblue',
-      'polygon': [(0.187194225767, 0.245900615315),
-                  (0.187209321435, 0.242933542297),
-                  (0.187224248413, 0.239965824918),
-                  (0.18723900675, 0.236997471659),
-                  (0.187253596489, 0.234028490985),
-                  (0.187268017671, 0.231058891345),
-                  (0.187282270331, 0.228088681172),
-                  (0.187296354503, 0.225117868882),
-                  (0.187310270212, 0.222146462876),
-                  (0.187324017485, 0.219174471539),
-                  (0.187337596341, 0.21620190324),
-                  (0.187351006799, 0.213228766333),
-                  (0.18736424887, 0.210255069156),
-                  (0.187377322567, 0.207280820032),
-                  (0.187390227896, 0.204306027267),
-                  (0.18740296486, 0.201330699153),
-                  (0.18741553346, 0.198354843969),
-                  (0.187427933694, 0.195378469975),
-                  (0.187440165557, 0.192401585419),
-                  (0.187452229041, 0.189424198533),
-                  (0.187464124134, 0.186446317534),
-                  (0.187475850823, 0.183467950626),
-                  (0.187487409093, 0.180489105996),
-                  (0.187498798924, 0.17750979182),
-                  (0.187510020296, 0.174530016257),
-                  (0.187521073185, 0.171549787453),
-                  (0.187531957566, 0.168569113539),
-                  (0.187542673411, 0.165588002634),
-                  (0.187553220692, 0.162606462842),
-                  (0.187563599375, 0.159624502253),
-                  (0.187573809428, 0.156642128945),
-                  (0.187583850816, 0.153659350981),
-                  (0.187593723502, 0.150676176411),
-                  (0.181511261383, 0.150690545405),
-                  (0.175426755984, 0.150704354166),
-                  (0.169340274196, 0.150717601388),
-                  (0.163251882841, 0.150730285709),
-                  (0.157161648677, 0.150742405724),
-                  (0.151069638413, 0.15075395999),
-                  (0.144975918713, 0.150764947035),
-                  (0.138880556206, 0.150775365362),
-                  (0.132783617498, 0.150785213463),
-                  (0.12668516917, 0.15079448982),
-                  (0.120585277795, 0.150803192918),
-                  (0.114484009939, 0.150811321245),
-                  (0.10838143217, 0.150818873304),
-                  (0.102277611064, 0.150825847619),
-                  (0.096172613207, 0.150832242738),
-                  (0.090066505207, 0.150838057243),
-                  (0.0839593536933, 0.150843289751),
-                  (0.0778512253239, 0.150847938926),
-                  (0.0717421867892, 0.150852003477),
-                  (0.0656323048165, 0.150855482169),
-                  (0.0595216461733, 0.150858373823),
-                  (0.053410277671, 0.150860677326),
-                  (0.0472982661684, 0.150862391628),
-                  (0.041185678574, 0.150863515753),
-                  (0.0350725818497, 0.150864048795),
-                  (0.0289590430123, 0.15086398993),
-                  (0.0228451291361, 0.150863338412),
-                  (0.0167309073551, 0.150862093577),
-                  (0.0106164448645, 0.150860254848),
-                  (0.00450180892264, 0.150857821736),
-                  (-0.00161293314804, 0.150854793839),
-                  (-0.00772771395935, 0.150851170846),
-                  (-0.00772917928694, 0.153839654785),
-                  (-0.00773063984775, 0.156827744654),
-                  (-0.00773209560569, 0.159815432503),
-                  (-0.00773354652532, 0.162802710371),
-                  (-0.00773499257176, 0.165789570286),
-                  (-0.00773643371079, 0.168776004263),
-                  (-0.00773786990888, 0.171762004308),
-                  (-0.00773930113311, 0.174747562413),
-                  (-0.00774072735132, 0.177732670558),
-                  (-0.00774214853206, 0.180717320711),
-                  (-0.00774356464458, 0.183701504829),
-                  (-0.00774497565899, 0.186685214855),
-                  (-0.00774638154613, 0.18966844272),
-                  (-0.00774778227759, 0.192651180343),
-                  (-0.00774917782584, 0.195633419628),
-                  (-0.0077505681642, 0.198615152468),
-                  (-0.00775195326679, 0.201596370742),
-                  (-0.00775333310861, 0.204577066316),
-                  (-0.00775470766558, 0.207557231041),
-                  (-0.00775607691443, 0.210536856757),
-                  (-0.00775744083288, 0.213515935288),
-                  (-0.00775879939951, 0.216494458445),
-                  (-0.00776015259385, 0.219472418025),
-                  (-0.00776150039636, 0.22244980581),
-                  (-0.00776284278848, 0.225426613569),
-                  (-0.00776417975257, 0.228402833054),
-                  (-0.00776551127194, 0.231378456006),
-                  (-0.00776683733091, 0.234353474147),
-                  (-0.00776815791474, 0.237327879188),
-                  (-0.00776947300972, 0.240301662823),
-                  (-0.00777078260307, 0.24327481673),
-                  (-0.00777208668299, 0.246247332573),
-                  (-0.00166858713152, 0.24625100685),
-                  (0.00443488376996, 0.24625373696),
-                  (0.0105382591124, 0.246255523341),
-                  (0.0166414720219, 0.246256366496),
-                  (0.0227444556559, 0.246256266998),
-                  (0.0288471431999, 0.246255225485),
-                  (0.0349494678632, 0.246253242658),
-                  (0.0410513628753, 0.246250319276),
-                  (0.0471527614816, 0.246246456158),
-                  (0.0532535969392, 0.246241654176),
-                  (0.0593538025126, 0.246235914252),
-                  (0.065453311469, 0.246229237354),
-                  (0.0715520570736, 0.246221624493),
-                  (0.0776499725847, 0.246213076716),
-                  (0.0837469912482, 0.246203595104),
-                  (0.0898430462928, 0.246193180764),
-                  (0.0959380709241, 0.246181834826),
-                  (0.102031998319, 0.246169558436),
-                  (0.108124761619, 0.246156352749),
-                  (0.114216293924, 0.246142218925),
-                  (0.120306528289, 0.246127158121),
-                  (0.12639539771, 0.246111171485),
-                  (0.132482835125, 0.246094260148),
-                  (0.138568773402, 0.246076425217),
-                  (0.144653145333, 0.246057667767),
-                  (0.150735883623, 0.246037988837),
-                  (0.156816920889, 0.246017389416),
-                  (0.162896189642, 0.24599587044),
-                  (0.168973622288, 0.245973432781),
-                  (0.175049151109, 0.245950077242),
-                  (0.181122708263, 0.245925804542),
-                  (0.187194225767, 0.245900615315)]},
- 66: {'color': 'violet',
-      'polygon': [(-0.0112709836284, 0.246225309489),
-                  (-0.0112698215427, 0.243252795331),
-                  (-0.0112686508183, 0.240279643175),
-                  (-0.0112674714672, 0.237305861357),
-                  (-0.0112662835024, 0.234331458197),
-                  (-0.0112650869376, 0.231356441999),
-                  (-0.0112638817879, 0.228380821054),
-                  (-0.0112626680689, 0.225404603636),
-                  (-0.0112614457973, 0.222427798004),
-                  (-0.0112602149907, 0.219450412403),
-                  (-0.0112589756676, 0.216472455066),
-                  (-0.0112577278474, 0.213493934207),
-                  (-0.0112564715504, 0.210514858029),
-                  (-0.0112552067978, 0.20753523472),
-                  (-0.0112539336118, 0.204555072453),
-                  (-0.0112526520151, 0.20157437939),
-                  (-0.0112513620318, 0.198593163677),
-                  (-0.0112500636863, 0.195611433447),
-                  (-0.0112487570042, 0.19262919682),
-                  (-0.0112474420118, 0.189646461903),
-                  (-0.0112461187361, 0.186663236789),
-                  (-0.0112447872052, 0.183679529559),
-                  (-0.0112434474477, 0.180695348281),
-                  (-0.011242099493, 0.17771070101),
-                  (-0.0112407433712, 0.17472559579),
-                  (-0.0112393791135, 0.171740040651),
-                  (-0.0112380067512, 0.168754043612),
-                  (-0.0112366263168, 0.165767612679),
-                  (-0.0112352378432, 0.162780755848),
-                  (-0.0112338413639, 0.1597934811),
-                  (-0.0112324369133, 0.156805796408),
-                  (-0.0112310245261, 0.153817709733),
-                  (-0.0112296042379, 0.150829229022),
-                  (-0.017344311149, 0.150824448959),
-                  (-0.0234588831641, 0.150819073499),
-                  (-0.0295732526525, 0.150813102665),
-                  (-0.0356873519146, 0.15080653657),
-                  (-0.0418011131804, 0.150799375423),
-                  (-0.0479144686097, 0.150791619521),
-                  (-0.0540273502914, 0.150783269256),
-                  (-0.0601396902436, 0.150774325106),
-                  (-0.0662514204127, 0.150764787638),
-                  (-0.0723624726738, 0.150754657508),
-                  (-0.0784727788301, 0.150743935451),
-                  (-0.0845822706128, 0.150732622288),
-                  (-0.0906908796809, 0.150720718915),
-                  (-0.0967985376211, 0.150708226307),
-                  (-0.102905175947, 0.150695145508),
-                  (-0.109010726099, 0.150681477632),
-                  (-0.115115119445, 0.150667223859),
-                  (-0.121218287276, 0.150652385428),
-                  (-0.127320160813, 0.150636963634),
-                  (-0.133420671197, 0.150620959825),
-                  (-0.139519749494, 0.150604375394),
-                  (-0.145617326695, 0.150587211776),
-                  (-0.151713333709, 0.150569470443),
-                  (-0.157807701367, 0.150551152895),
-                  (-0.163900360418, 0.15053226066),
-                  (-0.169991241528, 0.150512795281),
-                  (-0.176080275278, 0.150492758316),
-                  (-0.182167392159, 0.150472151329),
-                  (-0.188252522576, 0.150450975881),
-                  (-0.194335596837, 0.150429233528),
-                  (-0.200416545158, 0.15040692581),
-                  (-0.206495297651, 0.150384054248),
-                  (-0.206488088336, 0.153366538509),
-                  (-0.206480696293, 0.156348624098),
-                  (-0.206473121506, 0.159330303048),
-                  (-0.206465363959, 0.162311567379),
-                  (-0.206457423635, 0.165292409102),
-                  (-0.206449300516, 0.168272820216),
-                  (-0.206440994581, 0.17125279271),
-                  (-0.206432505812, 0.174232318564),
-                  (-0.206423834186, 0.177211389744),
-                  (-0.206414979681, 0.180189998205),
-                  (-0.206405942272, 0.183168135892),
-                  (-0.206396721935, 0.186145794738),
-                  (-0.206387318643, 0.189122966661),
-                  (-0.206377732368, 0.192099643569),
-                  (-0.20636796308, 0.195075817358),
-                  (-0.206358010748, 0.19805147991),
-                  (-0.20634787534, 0.201026623094),
-                  (-0.206337556821, 0.204001238766),
-                  (-0.206327055155, 0.206975318767),
-                  (-0.206316370304, 0.209948854926),
-                  (-0.206305502227, 0.212921839059),
-                  (-0.206294450883, 0.215894262963),
-                  (-0.206283216229, 0.218866118427),
-                  (-0.206271798217, 0.221837397219),
-                  (-0.2062601968, 0.224808091096),
-                  (-0.206248411927, 0.227778191798),
-                  (-0.206236443546, 0.230747691051),
-                  (-0.206224291599, 0.233716580563),
-                  (-0.20621195603, 0.236684852027),
-                  (-0.206199436778, 0.239652497121),
-                  (-0.20618673378, 0.242619507504),
-                  (-0.206173846969, 0.245585874821),
-                  (-0.200106398314, 0.245620364198),
-                  (-0.194036759005, 0.245653925389),
-                  (-0.187964998961, 0.245686557681),
-                  (-0.181891187942, 0.245718260318),
-                  (-0.175815395552, 0.245749032504),
-                  (-0.169737691247, 0.245778873412),
-                  (-0.16365814434, 0.245807782193),
-                  (-0.157576824005, 0.245835757982),
-                  (-0.151493799286, 0.245862799901),
-                  (-0.145409139097, 0.245888907072),
-                  (-0.13932291223, 0.245914078619),
-                  (-0.133235187359, 0.245938313673),
-                  (-0.127146033043, 0.245961611382),
-                  (-0.121055517732, 0.245983970915),
-                  (-0.11496370977, 0.246005391466),
-                  (-0.108870677398, 0.246025872259),
-                  (-0.10277648876, 0.246045412555),
-                  (-0.0966812119053, 0.246064011655),
-                  (-0.0905849147904, 0.246081668906),
-                  (-0.0844876652856, 0.246098383701),
-                  (-0.0783895311763, 0.246114155488),
-                  (-0.0722905801665, 0.246128983769),
-                  (-0.0661908798824, 0.246142868106),
-                  (-0.0600904978751, 0.246155808122),
-                  (-0.0539895016239, 0.246167803504),
-                  (-0.0478879585394, 0.246178854006),
-                  (-0.0417859359664, 0.24618895945),
-                  (-0.0356835011872, 0.246198119727),
-                  (-0.0295807214242, 0.246206334799),
-                  (-0.0234776638434, 0.246213604701),
-                  (-0.0173743955574, 0.246219929538),
-                  (-0.0112709836284, 0.246225309489)]},
- 67: {'color': 'violet',
-      'polygon': [(-0.220288401186, 0.245488551299),
-                  (-0.220301911188, 0.242523085298),
-                  (-0.220315224334, 0.239556975336),
-                  (-0.220328340704, 0.236590229779),
-                  (-0.220341260375, 0.233622856975),
-                  (-0.220353983423, 0.230654865255),
-                  (-0.220366509916, 0.227686262934),
-                  (-0.220378839924, 0.22471705831),
-                  (-0.220390973512, 0.221747259665),
-                  (-0.220402910742, 0.218776875267),
-                  (-0.220414651674, 0.215805913366),
-                  (-0.220426196367, 0.2128343822),
-                  (-0.220437544874, 0.20986228999),
-                  (-0.220448697248, 0.206889644942),
-                  (-0.22045965354, 0.203916455249),
-                  (-0.220470413798, 0.200942729088),
-                  (-0.220480978067, 0.197968474625),
-                  (-0.220491346392, 0.194993700011),
-                  (-0.220501518815, 0.192018413381),
-                  (-0.220511495376, 0.189042622861),
-                  (-0.220521276112, 0.186066336562),
-                  (-0.220530861061, 0.183089562583),
-                  (-0.220540250257, 0.180112309009),
-                  (-0.220549443733, 0.177134583916),
-                  (-0.220558441521, 0.174156395364),
-                  (-0.220567243651, 0.171177751405),
-                  (-0.220575850151, 0.168198660077),
-                  (-0.220584261049, 0.16521912941),
-                  (-0.22059247637, 0.162239167418),
-                  (-0.22060049614, 0.15925878211),
-                  (-0.220608320381, 0.15627798148),
-                  (-0.220615949116, 0.153296773515),
-                  (-0.220623382366, 0.150315166189),
-                  (-0.226694331664, 0.150289619025),
-                  (-0.232762781736, 0.150263514442),
-                  (-0.238828662098, 0.150236853732),
-                  (-0.244891902133, 0.150209638118),
-                  (-0.250952431091, 0.150181868747),
-                  (-0.25701017808, 0.150153546684),
-                  (-0.263065072058, 0.1501246729),
-                  (-0.269117041827, 0.150095248266),
-                  (-0.275166016026, 0.150065273549),
-                  (-0.281211923119, 0.150034749396),
-                  (-0.28725469139, 0.150003676334),
-                  (-0.293294248929, 0.149972054759),
-                  (-0.299330523628, 0.149939884928),
-                  (-0.305363443163, 0.14990716695),
-                  (-0.311392934988, 0.149873900783),
-                  (-0.317418926321, 0.149840086222),
-                  (-0.323441344134, 0.149805722895),
-                  (-0.329460115135, 0.149770810252),
-                  (-0.335475165759, 0.149735347562),
-                  (-0.34148642215, 0.149699333904),
-                  (-0.347493810149, 0.14966276816),
-                  (-0.353497255277, 0.149625649011),
-                  (-0.359496682716, 0.149587974925),
-                  (-0.365492017298, 0.14954974416),
-                  (-0.371483183479, 0.149510954748),
-                  (-0.377470105327, 0.149471604499),
-                  (-0.383452706499, 0.149431690988),
-                  (-0.389430910221, 0.149391211556),
-                  (-0.395404639269, 0.1493501633),
-                  (-0.401373815946, 0.149308543074),
-                  (-0.407338362058, 0.149266347482),
-                  (-0.413298198893, 0.149223572875),
-                  (-0.413282206422, 0.152186738367),
-                  (-0.413265838642, 0.155149488549),
-                  (-0.413249095314, 0.158111815262),
-                  (-0.413231976192, 0.161073710338),
-                  (-0.413214481025, 0.164035165595),
-                  (-0.413196609552, 0.166996172844),
-                  (-0.413178361509, 0.169956723883),
-                  (-0.413159736623, 0.172916810498),
-                  (-0.413140734616, 0.175876424463),
-                  (-0.413121355202, 0.17883555754),
-                  (-0.413101598088, 0.18179420148),
-                  (-0.413081462974, 0.184752348017),
-                  (-0.413060949552, 0.187709988875),
-                  (-0.413040057509, 0.190667115763),
-                  (-0.413018786522, 0.193623720375),
-                  (-0.412997136263, 0.196579794391),
-                  (-0.412975106394, 0.199535329476),
-                  (-0.412952696571, 0.20249031728),
-                  (-0.412929906441, 0.205444749436),
-                  (-0.412906735645, 0.208398617563),
-                  (-0.412883183815, 0.211351913261),
-                  (-0.412859250573, 0.214304628114),
-                  (-0.412834935537, 0.217256753689),
-                  (-0.412810238312, 0.220208281536),
-                  (-0.412785158498, 0.223159203185),
-                  (-0.412759695685, 0.226109510149),
-                  (-0.412733849455, 0.22905919392),
-                  (-0.412707619382, 0.232008245974),
-                  (-0.412681005028, 0.234956657763),
-                  (-0.412654005949, 0.237904420723),
-                  (-0.412626621691, 0.240851526267),
-                  (-0.412598851791, 0.243797965788),
-                  (-0.406650765752, 0.243865561342),
-                  (-0.400697922422, 0.243932167571),
-                  (-0.394740403688, 0.243997790064),
-                  (-0.388778290818, 0.24406243412),
-                  (-0.382811664491, 0.244126104746),
-                  (-0.376840604812, 0.244188806662),
-                  (-0.370865191337, 0.244250544307),
-                  (-0.364885503088, 0.244311321845),
-                  (-0.35890161858, 0.244371143168),
-                  (-0.352913615831, 0.244430011901),
-                  (-0.346921572389, 0.244487931413),
-                  (-0.340925565342, 0.244544904817),
-                  (-0.33492567134, 0.244600934981),
-                  (-0.32892196661, 0.244656024534),
-                  (-0.322914526973, 0.24471017587),
-                  (-0.316903427858, 0.24476339116),
-                  (-0.310888744318, 0.244815672356),
-                  (-0.304870551045, 0.244867021199),
-                  (-0.298848922383, 0.244917439229),
-                  (-0.292823932342, 0.244966927791),
-                  (-0.28679565461, 0.245015488043),
-                  (-0.280764162568, 0.245063120963),
-                  (-0.2747295293, 0.24510982736),
-                  (-0.268691827607, 0.245155607882),
-                  (-0.262651130012, 0.245200463023),
-                  (-0.256607508781, 0.245244393128),
-                  (-0.250561035923, 0.24528739841),
-                  (-0.244511783208, 0.24532947895),
-                  (-0.238459822171, 0.24537063471),
-                  (-0.232405224125, 0.24541086554),
-                  (-0.226348060166, 0.245450171186),
-                  (-0.220288401186, 0.245488551299)]},
- 68: {'color': 'violet',
-      'polygon': [(-0.426182101763, 0.243691684817),
-                  (-0.42621169868, 0.240747104558),
-                  (-0.426240895389, 0.237801855888),
-                  (-0.426269692393, 0.234855947442),
-                  (-0.426298090185, 0.231909387834),
-                  (-0.42632608925, 0.22896218566),
-                  (-0.426353690063, 0.226014349492),
-                  (-0.426380893088, 0.223065887883),
-                  (-0.426407698782, 0.220116809368),
-                  (-0.426434107591, 0.21716712246),
-                  (-0.426460119953, 0.214216835654),
-                  (-0.426485736298, 0.211265957428),
-                  (-0.426510957046, 0.20831449624),
-                  (-0.426535782607, 0.205362460532),
-                  (-0.426560213386, 0.202409858728),
-                  (-0.426584249776, 0.199456699234),
-                  (-0.426607892164, 0.196502990442),
-                  (-0.426631140927, 0.193548740727),
-                  (-0.426653996435, 0.190593958447),
-                  (-0.42667645905, 0.187638651946),
-                  (-0.426698529125, 0.184682829554),
-                  (-0.426720207006, 0.181726499584),
-                  (-0.42674149303, 0.178769670339),
-                  (-0.426762387528, 0.175812350104),
-                  (-0.426782890823, 0.172854547153),
-                  (-0.426803003229, 0.169896269748),
-                  (-0.426822725055, 0.166937526136),
-                  (-0.4268420566, 0.163978324553),
-                  (-0.426860998158, 0.161018673224),
-                  (-0.426879550014, 0.158058580361),
-                  (-0.426897712447, 0.155098054168),
-                  (-0.42691548573, 0.152137102834),
-                  (-0.426932870126, 0.14917573454),
-                  (-0.432876632843, 0.149132573062),
-                  (-0.438815341732, 0.149088812891),
-                  (-0.444748914903, 0.149044448978),
-                  (-0.450677269781, 0.148999476012),
-                  (-0.456600323072, 0.148953888413),
-                  (-0.462517990734, 0.148907680339),
-                  (-0.468430187945, 0.148860845686),
-                  (-0.474336829073, 0.148813378085),
-                  (-0.480237827637, 0.148765270911),
-                  (-0.486133096276, 0.148716517278),
-                  (-0.492022546713, 0.148667110052),
-                  (-0.497906089716, 0.148617041846),
-                  (-0.503783635065, 0.14856630503),
-                  (-0.509655091506, 0.148514891737),
-                  (-0.515520366719, 0.148462793867),
-                  (-0.521379367272, 0.148410003095),
-                  (-0.527231998581, 0.148356510878),
-                  (-0.533078164867, 0.148302308467),
-                  (-0.538917769111, 0.148247386912),
-                  (-0.54475071301, 0.148191737075),
-                  (-0.550576896933, 0.148135349642),
-                  (-0.556396219867, 0.148078215134),
-                  (-0.562208579378, 0.148020323917),
-                  (-0.568013871552, 0.147961666223),
-                  (-0.573811990953, 0.14790223216),
-                  (-0.579602830565, 0.147842011726),
-                  (-0.585386281743, 0.147780994834),
-                  (-0.591162234156, 0.14771917132),
-                  (-0.596930575736, 0.147656530971),
-                  (-0.602691192617, 0.147593063538),
-                  (-0.608443969083, 0.147528758763),
-                  (-0.614188787505, 0.147463606398),
-                  (-0.614161347554, 0.150392501849),
-                  (-0.614133301122, 0.153320947048),
-                  (-0.614104647435, 0.156248933297),
-                  (-0.614075385706, 0.159176451886),
-                  (-0.614045515132, 0.162103494089),
-                  (-0.614015034894, 0.165030051169),
-                  (-0.613983944162, 0.167956114374),
-                  (-0.613952242089, 0.170881674936),
-                  (-0.613919927811, 0.173806724074),
-                  (-0.613887000454, 0.176731252987),
-                  (-0.613853459124, 0.179655252863),
-                  (-0.613819302918, 0.182578714868),
-                  (-0.613784530912, 0.185501630154),
-                  (-0.613749142172, 0.188423989853),
-                  (-0.613713135747, 0.191345785079),
-                  (-0.613676510671, 0.194267006927),
-                  (-0.613639265965, 0.197187646471),
-                  (-0.613601400633, 0.200107694767),
-                  (-0.613562913666, 0.203027142847),
-                  (-0.613523804039, 0.205945981725),
-                  (-0.613484070712, 0.20886420239),
-                  (-0.613443712632, 0.211781795811),
-                  (-0.61340272873, 0.214698752932),
-                  (-0.613361117921, 0.217615064673),
-                  (-0.613318879108, 0.220530721931),
-                  (-0.613276011177, 0.223445715578),
-                  (-0.613232513, 0.226360036459),
-                  (-0.613188383434, 0.229273675394),
-                  (-0.613143621323, 0.232186623176),
-                  (-0.613098225493, 0.235098870572),
-                  (-0.613052194758, 0.238010408318),
-                  (-0.613005527916, 0.240921227124),
-                  (-0.607276462672, 0.241026766527),
-                  (-0.601539255248, 0.241130955689),
-                  (-0.595794026684, 0.241233808187),
-                  (-0.590040896246, 0.241335337584),
-                  (-0.584279981479, 0.241435557397),
-                  (-0.578511398245, 0.241534481083),
-                  (-0.572735260772, 0.241632122009),
-                  (-0.566951681693, 0.241728493438),
-                  (-0.561160772093, 0.241823608507),
-                  (-0.555362641544, 0.24191748021),
-                  (-0.549557398155, 0.242010121381),
-                  (-0.543745148603, 0.242101544676),
-                  (-0.537925998182, 0.242191762561),
-                  (-0.532100050834, 0.242280787298),
-                  (-0.526267409191, 0.242368630929),
-                  (-0.520428174612, 0.242455305268),
-                  (-0.514582447222, 0.242540821889),
-                  (-0.508730325943, 0.242625192113),
-                  (-0.502871908535, 0.242708427003),
-                  (-0.497007291626, 0.242790537355),
-                  (-0.49113657075, 0.242871533686),
-                  (-0.48525984038, 0.242951426235),
-                  (-0.479377193955, 0.243030224951),
-                  (-0.473488723919, 0.24310793949),
-                  (-0.467594521751, 0.243184579211),
-                  (-0.46169467799, 0.243260153174),
-                  (-0.455789282273, 0.243334670133),
-                  (-0.449878423357, 0.243408138537),
-                  (-0.443962189153, 0.243480566528),
-                  (-0.438040666749, 0.24355196194),
-                  (-0.432113942443, 0.243622332297),
-                  (-0.426182101763, 0.243691684817)]},
- 69: {'color': 'violet',
-      'polygon': [(-0.626237567708, 0.240632263132),
-                  (-0.626284376392, 0.237724509284),
-                  (-0.626330528937, 0.234816031026),
-                  (-0.626376026596, 0.231906837718),
-                  (-0.626420870612, 0.228996938696),
-                  (-0.626465062208, 0.226086343263),
-                  (-0.626508602597, 0.223175060696),
-                  (-0.626551492975, 0.220263100245),
-                  (-0.626593734521, 0.217350471132),
-                  (-0.626635328403, 0.214437182554),
-                  (-0.626676275772, 0.211523243681),
-                  (-0.626716577763, 0.20860866366),
-                  (-0.626756235499, 0.205693451612),
-                  (-0.626795250085, 0.202777616636),
-                  (-0.626833622612, 0.199861167805),
-                  (-0.626871354157, 0.196944114174),
-                  (-0.62690844578, 0.194026464771),
-                  (-0.626944898527, 0.191108228606),
-                  (-0.62698071343, 0.188189414667),
-                  (-0.627015891503, 0.185270031922),
-                  (-0.627050433748, 0.182350089319),
-                  (-0.62708434115, 0.179429595787),
-                  (-0.627117614678, 0.176508560238),
-                  (-0.627150255289, 0.173586991564),
-                  (-0.627182263921, 0.170664898641),
-                  (-0.627213641499, 0.167742290326),
-                  (-0.627244388934, 0.164819175463),
-                  (-0.627274507118, 0.161895562878),
-                  (-0.627303996931, 0.158971461381),
-                  (-0.627332859237, 0.156046879771),
-                  (-0.627361094884, 0.153121826829),
-                  (-0.627388704706, 0.150196311324),
-                  (-0.62741568952, 0.147270342013),
-                  (-0.633133353077, 0.147199536459),
-                  (-0.638842529369, 0.147127842585),
-                  (-0.644543089612, 0.147055250668),
-                  (-0.650234902715, 0.146981751166),
-                  (-0.655917835212, 0.146907334745),
-                  (-0.661591751195, 0.146831992319),
-                  (-0.667256512247, 0.146755715075),
-                  (-0.672911977366, 0.146678494515),
-                  (-0.678558002899, 0.146600322489),
-                  (-0.684194442464, 0.146521191235),
-                  (-0.689821146881, 0.14644109342),
-                  (-0.695437964093, 0.146360022174),
-                  (-0.701044739089, 0.146277971142),
-                  (-0.706641313832, 0.146194934521),
-                  (-0.712227527174, 0.146110907108),
-                  (-0.717803214778, 0.146025884348),
-                  (-0.723368209039, 0.145939862379),
-                  (-0.728922339, 0.145852838088),
-                  (-0.734465430268, 0.145764809157),
-                  (-0.739997304932, 0.14567577412),
-                  (-0.745517781473, 0.145585732417),
-                  (-0.751026674683, 0.14549468445),
-                  (-0.756523795572, 0.145402631644),
-                  (-0.762008951281, 0.145309576505),
-                  (-0.767481944992, 0.145215522682),
-                  (-0.772942575836, 0.145120475034),
-                  (-0.778390638803, 0.14502443969),
-                  (-0.783825924642, 0.144927424123),
-                  (-0.789248219777, 0.144829437214),
-                  (-0.794657306201, 0.144730489325),
-                  (-0.800052961384, 0.144630592373),
-                  (-0.805434958177, 0.144529759905),
-                  (-0.805393202435, 0.147406082209),
-                  (-0.805350521398, 0.150281900783),
-                  (-0.805306913941, 0.15315720565),
-                  (-0.805262378924, 0.156031986815),
-                  (-0.805216915192, 0.158906234262),
-                  (-0.805170521578, 0.161779937955),
-                  (-0.805123196897, 0.164653087837),
-                  (-0.805074939952, 0.167525673829),
-                  (-0.805025749534, 0.170397685828),
-                  (-0.804975624418, 0.173269113709),
-                  (-0.804924563367, 0.176139947322),
-                  (-0.804872565132, 0.179010176493),
-                  (-0.80481962845, 0.181879791021),
-                  (-0.804765752048, 0.18474878068),
-                  (-0.804710934639, 0.187617135215),
-                  (-0.804655174927, 0.190484844346),
-                  (-0.804598471601, 0.193351897761),
-                  (-0.804540823344, 0.19621828512),
-                  (-0.804482228825, 0.199083996055),
-                  (-0.804422686705, 0.201949020163),
-                  (-0.804362195632, 0.204813347013),
-                  (-0.804300754249, 0.207676966138),
-                  (-0.804238361186, 0.210539867042),
-                  (-0.804175015067, 0.213402039191),
-                  (-0.804110714506, 0.216263472019),
-                  (-0.804045458109, 0.219124154922),
-                  (-0.803979244477, 0.221984077261),
-                  (-0.8039120722, 0.224843228361),
-                  (-0.803843939863, 0.227701597506),
-                  (-0.803774846046, 0.230559173944),
-                  (-0.803704789321, 0.233415946882),
-                  (-0.803633768255, 0.236271905486),
-                  (-0.798273751424, 0.236432422284),
-                  (-0.792899993074, 0.236591388597),
-                  (-0.787512706938, 0.236748793376),
-                  (-0.782112103066, 0.236904627299),
-                  (-0.776698387889, 0.237058882698),
-                  (-0.771271764283, 0.237211553472),
-                  (-0.765832431629, 0.237362635016),
-                  (-0.76038058588, 0.237512124141),
-                  (-0.754916419618, 0.237660019005),
-                  (-0.749440122117, 0.237806319037),
-                  (-0.743951879408, 0.23795102487),
-                  (-0.738451874337, 0.238094138278),
-                  (-0.732940286623, 0.238235662101),
-                  (-0.727417292924, 0.238375600192),
-                  (-0.721883066891, 0.238513957347),
-                  (-0.716337779233, 0.238650739252),
-                  (-0.71078159777, 0.23878595242),
-                  (-0.705214687493, 0.238919604137),
-                  (-0.699637210626, 0.239051702411),
-                  (-0.694049326677, 0.239182255911),
-                  (-0.688451192498, 0.239311273926),
-                  (-0.682842962341, 0.23943876631),
-                  (-0.677224787913, 0.239564743436),
-                  (-0.671596818431, 0.239689216148),
-                  (-0.665959200678, 0.239812195723),
-                  (-0.660312079054, 0.239933693821),
-                  (-0.654655595632, 0.24005372245),
-                  (-0.648989890209, 0.240172293923),
-                  (-0.643315100359, 0.24028942082),
-                  (-0.637631361483, 0.240405115954),
-                  (-0.631938806863, 0.240519392334),
-                  (-0.626237567708, 0.240632263132)]},
- 70: {'color': 'skyblue',
-      'polygon': [(0.783183154053, 0.332197936521),
-                  (0.783289758103, 0.329369819531),
-                  (0.783395405111, 0.326540535923),
-                  (0.783500096439, 0.323710097574),
-                  (0.783603833446, 0.32087851631),
-                  (0.783706617488, 0.318045803909),
-                  (0.783808449916, 0.315211972102),
-                  (0.783909332079, 0.312377032576),
-                  (0.784009265318, 0.309540996969),
-                  (0.784108250971, 0.306703876875),
-                  (0.784206290372, 0.303865683843),
-                  (0.784303384847, 0.30102642938),
-                  (0.784399535718, 0.298186124947),
-                  (0.784494744299, 0.295344781963),
-                  (0.7845890119, 0.292502411807),
-                  (0.784682339823, 0.289659025813),
-                  (0.784774729364, 0.286814635277),
-                  (0.78486618181, 0.283969251453),
-                  (0.784956698443, 0.281122885556),
-                  (0.785046280537, 0.27827554876),
-                  (0.785134929355, 0.275427252203),
-                  (0.785222646156, 0.272578006982),
-                  (0.785309432188, 0.269727824157),
-                  (0.785395288691, 0.266876714753),
-                  (0.785480216896, 0.264024689754),
-                  (0.785564218025, 0.261171760112),
-                  (0.785647293291, 0.258317936741),
-                  (0.785729443897, 0.25546323052),
-                  (0.785810671036, 0.252607652293),
-                  (0.785890975892, 0.24975121287),
-                  (0.785970359636, 0.246893923027),
-                  (0.786048823432, 0.244035793508),
-                  (0.786126368431, 0.241176835021),
-                  (0.780737280765, 0.241316414287),
-                  (0.775335134253, 0.241455109452),
-                  (0.769920109071, 0.241592860782),
-                  (0.764492383523, 0.241729612768),
-                  (0.759052134036, 0.241865313955),
-                  (0.753599535153, 0.241999916759),
-                  (0.748134759526, 0.242133377303),
-                  (0.742657977917, 0.242265655252),
-                  (0.737169359189, 0.242396713655),
-                  (0.731669070312, 0.242526518786),
-                  (0.726157276361, 0.242655039998),
-                  (0.720634140516, 0.242782249575),
-                  (0.715099824069, 0.242908122592),
-                  (0.709554486426, 0.243032636777),
-                  (0.703998285116, 0.243155772381),
-                  (0.698431375793, 0.243277512046),
-                  (0.692853912248, 0.243397840683),
-                  (0.687266046417, 0.243516745351),
-                  (0.681667928391, 0.243634215141),
-                  (0.676059706427, 0.243750241063),
-                  (0.670441526961, 0.243864815937),
-                  (0.66481353462, 0.243977934289),
-                  (0.659175872234, 0.244089592248),
-                  (0.653528680855, 0.244199787451),
-                  (0.64787209977, 0.244308518945),
-                  (0.642206266516, 0.244415787097),
-                  (0.636531316899, 0.244521593509),
-                  (0.63084738501, 0.244625940929),
-                  (0.625154603245, 0.244728833174),
-                  (0.61945310232, 0.244830275049),
-                  (0.613743011296, 0.244930272272),
-                  (0.608024457595, 0.245028831404),
-                  (0.607970176867, 0.247938121998),
-                  (0.607915260059, 0.250846661216),
-                  (0.607859706042, 0.253754439368),
-                  (0.607803513668, 0.256661446736),
-                  (0.607746681774, 0.259567673578),
-                  (0.607689209181, 0.262473110125),
-                  (0.607631094696, 0.265377746578),
-                  (0.607572337107, 0.268281573114),
-                  (0.607512935187, 0.27118457988),
-                  (0.607452887694, 0.274086756996),
-                  (0.60739219337, 0.276988094555),
-                  (0.60733085094, 0.279888582619),
-                  (0.607268859112, 0.282788211222),
-                  (0.607206216581, 0.285686970372),
-                  (0.607142922022, 0.288584850043),
-                  (0.607078974097, 0.291481840182),
-                  (0.607014371451, 0.294377930707),
-                  (0.606949112711, 0.297273111503),
-                  (0.60688319649, 0.300167372427),
-                  (0.606816621383, 0.303060703304),
-                  (0.606749385971, 0.305953093928),
-                  (0.606681488817, 0.308844534061),
-                  (0.606612928467, 0.311735013434),
-                  (0.606543703453, 0.314624521746),
-                  (0.606473812289, 0.317513048663),
-                  (0.606403253473, 0.320400583817),
-                  (0.606332025487, 0.323287116809),
-                  (0.606260126796, 0.326172637205),
-                  (0.606187555849, 0.329057134536),
-                  (0.606114311079, 0.331940598301),
-                  (0.606040390902, 0.334823017963),
-                  (0.605965793717, 0.337704382948),
-                  (0.611659260028, 0.337562741714),
-                  (0.617344059723, 0.337419123172),
-                  (0.62302006659, 0.337273518265),
-                  (0.628687153085, 0.337125918852),
-                  (0.634345190331, 0.336976317785),
-                  (0.639994048106, 0.336824708991),
-                  (0.645633594833, 0.336671087555),
-                  (0.651263697577, 0.336515449809),
-                  (0.656884222035, 0.336357793424),
-                  (0.662495032533, 0.336198117501),
-                  (0.668095992017, 0.336036422673),
-                  (0.673686962056, 0.335872711204),
-                  (0.679267802831, 0.335706987095),
-                  (0.684838373137, 0.335539256195),
-                  (0.690398530379, 0.33536952631),
-                  (0.695948130576, 0.335197807324),
-                  (0.701487028357, 0.335024111319),
-                  (0.707015076963, 0.334848452694),
-                  (0.712532128254, 0.334670848305),
-                  (0.718038032705, 0.33449131759),
-                  (0.723532639421, 0.334309882707),
-                  (0.729015796133, 0.334126568681),
-                  (0.734487349213, 0.333941403547),
-                  (0.739947143679, 0.333754418503),
-                  (0.745395023205, 0.333565648063),
-                  (0.750830830133, 0.333375130222),
-                  (0.756254405488, 0.333182906617),
-                  (0.761665588988, 0.332989022704),
-                  (0.767064219061, 0.332793527924),
-                  (0.772450132866, 0.332596475894),
-                  (0.777823166306, 0.332397924586),
-                  (0.783183154053, 0.332197936521)]},
- 71: {'color': 'skyblue',
-      'polygon': [(0.592824401868, 0.338115611055),
-                  (0.592894153534, 0.335231218218),
-                  (0.592963247458, 0.332345775788),
-                  (0.593031685219, 0.329459294265),
-                  (0.593099468375, 0.326571784116),
-                  (0.593166598471, 0.32368325577),
-                  (0.593233077033, 0.320793719626),
-                  (0.593298905572, 0.317903186048),
-                  (0.59336408558, 0.315011665367),
-                  (0.593428618536, 0.312119167882),
-                  (0.593492505901, 0.309225703859),
-                  (0.593555749117, 0.306331283533),
-                  (0.593618349615, 0.303435917106),
-                  (0.593680308804, 0.300539614751),
-                  (0.59374162808, 0.297642386608),
-                  (0.593802308822, 0.294744242788),
-                  (0.593862352393, 0.29184519337),
-                  (0.593921760138, 0.288945248405),
-                  (0.593980533388, 0.286044417913),
-                  (0.594038673457, 0.283142711886),
-                  (0.594096181641, 0.280240140284),
-                  (0.594153059223, 0.277336713042),
-                  (0.594209307469, 0.274432440063),
-                  (0.594264927627, 0.271527331225),
-                  (0.59431992093, 0.268621396376),
-                  (0.594374288597, 0.265714645336),
-                  (0.594428031829, 0.2628070879),
-                  (0.594481151811, 0.259898733832),
-                  (0.594533649712, 0.256989592872),
-                  (0.594585526688, 0.254079674732),
-                  (0.594636783875, 0.251168989099),
-                  (0.594687422397, 0.248257545631),
-                  (0.594737443359, 0.245345353964),
-                  (0.588991624025, 0.245445130023),
-                  (0.583237876218, 0.24554350885),
-                  (0.577476318971, 0.245640500286),
-                  (0.571707069813, 0.245736114626),
-                  (0.565930244796, 0.24583036256),
-                  (0.560145958513, 0.245923255126),
-                  (0.554354324131, 0.246014803662),
-                  (0.548555453403, 0.246105019758),
-                  (0.542749456701, 0.246193915219),
-                  (0.536936443037, 0.246281502014),
-                  (0.531116520085, 0.246367792246),
-                  (0.52528979421, 0.246452798111),
-                  (0.519456370488, 0.246536531863),
-                  (0.513616352734, 0.246619005782),
-                  (0.507769843525, 0.246700232143),
-                  (0.501916944227, 0.246780223184),
-                  (0.496057755015, 0.246858991083),
-                  (0.490192374902, 0.246936547928),
-                  (0.484320901764, 0.247012905697),
-                  (0.478443432361, 0.247088076232),
-                  (0.472560062366, 0.247162071218),
-                  (0.466670886386, 0.247234902168),
-                  (0.460775997991, 0.247306580399),
-                  (0.454875489732, 0.24737711702),
-                  (0.448969453172, 0.247446522916),
-                  (0.443057978907, 0.247514808732),
-                  (0.43714115659, 0.247581984863),
-                  (0.431219074954, 0.247648061442),
-                  (0.42529182184, 0.24771304833),
-                  (0.419359484216, 0.247776955106),
-                  (0.413422148203, 0.247839791061),
-                  (0.407479899095, 0.247901565189),
-                  (0.407447725246, 0.250846440748),
-                  (0.407415166994, 0.253790617742),
-                  (0.407382223837, 0.256734087194),
-                  (0.407348895259, 0.259676840112),
-                  (0.407315180735, 0.262618867479),
-                  (0.407281079729, 0.26556016026),
-                  (0.407246591695, 0.268500709397),
-                  (0.407211716073, 0.271440505812),
-                  (0.407176452295, 0.274379540407),
-                  (0.407140799779, 0.277317804059),
-                  (0.407104757932, 0.280255287627),
-                  (0.40706832615, 0.283191981947),
-                  (0.407031503818, 0.286127877833),
-                  (0.406994290307, 0.289062966078),
-                  (0.406956684978, 0.29199723745),
-                  (0.406918687177, 0.2949306827),
-                  (0.40688029624, 0.297863292551),
-                  (0.40684151149, 0.300795057706),
-                  (0.406802332238, 0.303725968847),
-                  (0.406762757781, 0.306656016629),
-                  (0.406722787404, 0.309585191688),
-                  (0.406682420378, 0.312513484633),
-                  (0.406641655962, 0.315440886052),
-                  (0.406600493402, 0.318367386509),
-                  (0.406558931928, 0.321292976544),
-                  (0.406516970761, 0.324217646671),
-                  (0.406474609103, 0.327141387383),
-                  (0.406431846147, 0.330064189145),
-                  (0.406388681069, 0.332986042401),
-                  (0.406345113031, 0.335906937567),
-                  (0.406301141183, 0.338826865036),
-                  (0.40625676466, 0.341745815172),
-                  (0.412179971103, 0.341657746978),
-                  (0.418098136766, 0.341568176488),
-                  (0.424011172455, 0.341477092051),
-                  (0.429918988173, 0.341384481682),
-                  (0.435821493103, 0.341290333075),
-                  (0.441718595589, 0.341194633609),
-                  (0.447610203122, 0.341097370361),
-                  (0.453496222321, 0.340998530113),
-                  (0.459376558914, 0.34089809937),
-                  (0.465251117723, 0.340796064374),
-                  (0.471119802648, 0.340692411113),
-                  (0.476982516644, 0.340587125349),
-                  (0.48283916171, 0.340480192625),
-                  (0.48868963887, 0.340371598295),
-                  (0.494533848154, 0.340261327538),
-                  (0.500371688582, 0.340149365386),
-                  (0.506203058149, 0.340035696748),
-                  (0.512027853804, 0.339920306435),
-                  (0.517845971439, 0.33980317919),
-                  (0.523657305867, 0.33968429972),
-                  (0.529461750809, 0.339563652725),
-                  (0.535259198876, 0.339441222932),
-                  (0.541049541556, 0.339316995137),
-                  (0.546832669194, 0.339190954235),
-                  (0.55260847098, 0.339063085268),
-                  (0.558376834932, 0.338933373462),
-                  (0.564137647883, 0.338801804277),
-                  (0.569890795462, 0.338668363448),
-                  (0.575636162086, 0.338533037043),
-                  (0.581373630942, 0.338395811507),
-                  (0.587103083973, 0.33825667372),
-                  (0.592824401868, 0.338115611055)]},
- 72: {'color': 'skyblue',
-      'polygon': [(0.392552148662, 0.341853804353),
-                  (0.392594654034, 0.338932929598),
-                  (0.392636770863, 0.336011081511),
-                  (0.392678499964, 0.333088269677),
-                  (0.392719842136, 0.330164503656),
-                  (0.392760798166, 0.327239792984),
-                  (0.392801368828, 0.324314147172),
-                  (0.392841554879, 0.321387575707),
-                  (0.392881357067, 0.318460088052),
-                  (0.392920776124, 0.315531693646),
-                  (0.392959812769, 0.312602401904),
-                  (0.392998467708, 0.309672222217),
-                  (0.393036741635, 0.306741163955),
-                  (0.393074635231, 0.303809236462),
-                  (0.393112149164, 0.300876449062),
-                  (0.39314928409, 0.297942811054),
-                  (0.393186040652, 0.295008331716),
-                  (0.393222419481, 0.292073020303),
-                  (0.393258421196, 0.289136886047),
-                  (0.393294046405, 0.28619993816),
-                  (0.393329295704, 0.28326218583),
-                  (0.393364169675, 0.280323638225),
-                  (0.393398668891, 0.277384304489),
-                  (0.393432793913, 0.274444193748),
-                  (0.393466545291, 0.271503315104),
-                  (0.393499923563, 0.268561677639),
-                  (0.393532929255, 0.265619290413),
-                  (0.393565562886, 0.262676162466),
-                  (0.393597824961, 0.259732302817),
-                  (0.393629715975, 0.256787720465),
-                  (0.393661236412, 0.253842424388),
-                  (0.393692386748, 0.250896423542),
-                  (0.393723167446, 0.247949726865),
-                  (0.387765224474, 0.248008549233),
-                  (0.381802727577, 0.248066345722),
-                  (0.375835758045, 0.248123123673),
-                  (0.369864396483, 0.248178890111),
-                  (0.363888722837, 0.248233651746),
-                  (0.357908816407, 0.24828741497),
-                  (0.351924755878, 0.248340185862),
-                  (0.345936619331, 0.248391970187),
-                  (0.339944484269, 0.248442773401),
-                  (0.333948427634, 0.248492600651),
-                  (0.32794852583, 0.248541456783),
-                  (0.321944854736, 0.248589346342),
-                  (0.315937489733, 0.24863627358),
-                  (0.309926505713, 0.24868224246),
-                  (0.303911977108, 0.24872725666),
-                  (0.297893977898, 0.248771319582),
-                  (0.291872581634, 0.248814434357),
-                  (0.285847861455, 0.248856603851),
-                  (0.279819890103, 0.248897830673),
-                  (0.27378873994, 0.248938117184),
-                  (0.267754482963, 0.248977465502),
-                  (0.261717190824, 0.249015877511),
-                  (0.25567693484, 0.249053354869),
-                  (0.249633786011, 0.249089899017),
-                  (0.243587815034, 0.249125511187),
-                  (0.237539092319, 0.249160192411),
-                  (0.231487687998, 0.249193943529),
-                  (0.225433671945, 0.249226765199),
-                  (0.219377113785, 0.249258657905),
-                  (0.213318082908, 0.249289621966),
-                  (0.207256648482, 0.249319657547),
-                  (0.201192879465, 0.249348764664),
-                  (0.201176615898, 0.25231356223),
-                  (0.201160170622, 0.255277687307),
-                  (0.201143543553, 0.258241131328),
-                  (0.201126734606, 0.261203885706),
-                  (0.201109743689, 0.264165941839),
-                  (0.201092570704, 0.267127291106),
-                  (0.201075215548, 0.27008792487),
-                  (0.201057678115, 0.273047834477),
-                  (0.20103995829, 0.276007011253),
-                  (0.201022055954, 0.27896544651),
-                  (0.201003970983, 0.281923131539),
-                  (0.200985703247, 0.284880057615),
-                  (0.200967252608, 0.287836215994),
-                  (0.200948618925, 0.290791597915),
-                  (0.200929802049, 0.293746194599),
-                  (0.200910801826, 0.296699997247),
-                  (0.200891618094, 0.299652997042),
-                  (0.200872250687, 0.30260518515),
-                  (0.20085269943, 0.305556552718),
-                  (0.200832964143, 0.308507090871),
-                  (0.20081304464, 0.311456790719),
-                  (0.200792940725, 0.314405643352),
-                  (0.2007726522, 0.317353639839),
-                  (0.200752178855, 0.320300771231),
-                  (0.200731520476, 0.323247028559),
-                  (0.200710676842, 0.326192402835),
-                  (0.200689647722, 0.329136885049),
-                  (0.200668432881, 0.332080466174),
-                  (0.200647032074, 0.33502313716),
-                  (0.200625445049, 0.337964888938),
-                  (0.200603671548, 0.340905712419),
-                  (0.200581711303, 0.343845598492),
-                  (0.206628630478, 0.343804015378),
-                  (0.212673200897, 0.343761128244),
-                  (0.218715351443, 0.343716935941),
-                  (0.224755010701, 0.343671437128),
-                  (0.230792106946, 0.343624630268),
-                  (0.23682656813, 0.343576513611),
-                  (0.242858321872, 0.34352708519),
-                  (0.248887295445, 0.34347634281),
-                  (0.254913415762, 0.343424284036),
-                  (0.260936609366, 0.343370906192),
-                  (0.266956802416, 0.343316206342),
-                  (0.272973920673, 0.343260181289),
-                  (0.278987889488, 0.343202827562),
-                  (0.284998633789, 0.343144141411),
-                  (0.291006078068, 0.343084118795),
-                  (0.297010146362, 0.343022755379),
-                  (0.303010762247, 0.342960046523),
-                  (0.309007848818, 0.342895987275),
-                  (0.315001328675, 0.342830572368),
-                  (0.320991123913, 0.342763796208),
-                  (0.326977156101, 0.342695652872),
-                  (0.332959346272, 0.342626136101),
-                  (0.338937614905, 0.342555239297),
-                  (0.34491188191, 0.342482955516),
-                  (0.350882066614, 0.342409277463),
-                  (0.356848087745, 0.342334197494),
-                  (0.362809863414, 0.342257707608),
-                  (0.368767311103, 0.342179799448),
-                  (0.374720347644, 0.342100464297),
-                  (0.380668889207, 0.34201969308),
-                  (0.386612851282, 0.341937476363),
-                  (0.392552148662, 0.341853804353)]},
- 73: {'color': 'skyblue',
-      'polygon': [(0.186696244661, 0.344049368378),
-                  (0.186716071456, 0.341108651486),
-                  (0.186735724655, 0.338166998322),
-                  (0.186755204503, 0.335224417976),
-                  (0.186774511238, 0.332280919516),
-                  (0.186793645088, 0.329336511992),
-                  (0.186812606275, 0.326391204433),
-                  (0.186831395016, 0.323445005847),
-                  (0.186850011517, 0.320497925223),
-                  (0.186868455982, 0.317549971528),
-                  (0.186886728605, 0.314601153713),
-                  (0.186904829573, 0.311651480708),
-                  (0.186922759069, 0.308700961421),
-                  (0.186940517267, 0.305749604746),
-                  (0.186958104336, 0.302797419553),
-                  (0.186975520439, 0.299844414696),
-                  (0.186992765731, 0.29689059901),
-                  (0.187009840363, 0.293935981311),
-                  (0.187026744479, 0.290980570397),
-                  (0.187043478217, 0.288024375047),
-                  (0.18706004171, 0.285067404021),
-                  (0.187076435083, 0.282109666064),
-                  (0.187092658459, 0.2791511699),
-                  (0.187108711952, 0.276191924236),
-                  (0.187124595672, 0.273231937762),
-                  (0.187140309725, 0.27027121915),
-                  (0.187155854209, 0.267309777054),
-                  (0.187171229219, 0.264347620112),
-                  (0.187186434844, 0.261384756943),
-                  (0.187201471168, 0.25842119615),
-                  (0.18721633827, 0.255456946318),
-                  (0.187231036224, 0.252492016016),
-                  (0.187245565101, 0.249526413795),
-                  (0.181174591253, 0.249553958707),
-                  (0.175101577557, 0.249580573677),
-                  (0.169026592049, 0.24960625808),
-                  (0.162949702623, 0.249631011203),
-                  (0.156870977043, 0.249654832251),
-                  (0.150790482948, 0.249677720355),
-                  (0.144708287867, 0.249699674583),
-                  (0.138624459224, 0.249720693945),
-                  (0.132539064347, 0.249740777406),
-                  (0.126452170477, 0.249759923887),
-                  (0.120363844775, 0.249778132279),
-                  (0.114274154331, 0.249795401447),
-                  (0.108183166171, 0.249811730237),
-                  (0.102090947263, 0.249827117486),
-                  (0.0959975645241, 0.249841562027),
-                  (0.0899030848281, 0.249855062694),
-                  (0.0838075750112, 0.249867618331),
-                  (0.0777111018784, 0.249879227797),
-                  (0.0716137322088, 0.249889889972),
-                  (0.0655155327617, 0.24989960376),
-                  (0.059416570282, 0.249908368099),
-                  (0.0533169115052, 0.249916181961),
-                  (0.0472166231627, 0.249923044361),
-                  (0.0411157719865, 0.249928954358),
-                  (0.0350144247138, 0.249933911061),
-                  (0.0289126480917, 0.249937913629),
-                  (0.0228105088814, 0.249940961281),
-                  (0.0167080738623, 0.249943053292),
-                  (0.0106054098364, 0.249944189001),
-                  (0.00450258363156, 0.249944367811),
-                  (-0.0016003378939, 0.249943589189),
-                  (-0.00770328784813, 0.249941852673),
-                  (-0.00770363260685, 0.252912907394),
-                  (-0.00770397202518, 0.255883296907),
-                  (-0.00770430609816, 0.25885301281),
-                  (-0.00770463482172, 0.261822046683),
-                  (-0.00770495819287, 0.264790390088),
-                  (-0.00770527620952, 0.267758034574),
-                  (-0.00770558887061, 0.270724971672),
-                  (-0.00770589617605, 0.273691192894),
-                  (-0.00770619812675, 0.276656689739),
-                  (-0.00770649472454, 0.279621453685),
-                  (-0.00770678597226, 0.282585476196),
-                  (-0.00770707187368, 0.285548748716),
-                  (-0.0077073524335, 0.288511262673),
-                  (-0.00770762765737, 0.291473009475),
-                  (-0.00770789755188, 0.294433980516),
-                  (-0.00770816212452, 0.297394167167),
-                  (-0.00770842138368, 0.300353560785),
-                  (-0.00770867533868, 0.303312152705),
-                  (-0.00770892399967, 0.306269934246),
-                  (-0.00770916737767, 0.309226896707),
-                  (-0.0077094054846, 0.312183031367),
-                  (-0.00770963833321, 0.315138329487),
-                  (-0.00770986593699, 0.318092782308),
-                  (-0.00771008831035, 0.321046381052),
-                  (-0.00771030546844, 0.323999116921),
-                  (-0.00771051742714, 0.326950981096),
-                  (-0.00771072420318, 0.329901964738),
-                  (-0.007710925814, 0.332852058988),
-                  (-0.0077111222777, 0.335801254967),
-                  (-0.00771131361313, 0.338749543772),
-                  (-0.00771149983987, 0.341696916483),
-                  (-0.0077116809781, 0.344643364155),
-                  (-0.00162579245784, 0.3446451235),
-                  (0.00446007852642, 0.344645564532),
-                  (0.0105458653723, 0.344644687842),
-                  (0.016631501477, 0.34464249406),
-                  (0.0227169202308, 0.344638983851),
-                  (0.0288020550096, 0.344634157913),
-                  (0.0348868391682, 0.344628016976),
-                  (0.0409712060334, 0.344620561797),
-                  (0.0470550888965, 0.344611793156),
-                  (0.0531384210065, 0.344601711856),
-                  (0.0592211355625, 0.344590318714),
-                  (0.0653031657067, 0.344577614563),
-                  (0.0713844445166, 0.34456360024),
-                  (0.0774649049978, 0.344548276587),
-                  (0.0835444800763, 0.344531644441),
-                  (0.0896231025904, 0.344513704632),
-                  (0.0957007052835, 0.344494457976),
-                  (0.101777220795, 0.344473905268),
-                  (0.107852581655, 0.344452047277),
-                  (0.113926720271, 0.344428884736),
-                  (0.119999568925, 0.344404418341),
-                  (0.126071059761, 0.344378648736),
-                  (0.13214112478, 0.344351576513),
-                  (0.138209695826, 0.344323202199),
-                  (0.144276704584, 0.34429352625),
-                  (0.150342082563, 0.344262549043),
-                  (0.156405761093, 0.344230270868),
-                  (0.162467671314, 0.344196691918),
-                  (0.168527744163, 0.344161812281),
-                  (0.174585910371, 0.344125631933),
-                  (0.180642100444, 0.344088150725),
-                  (0.186696244661, 0.344049368378)]},
- 74: {'color': 'violet',
-      'polygon': [(-0.0113330206547, 0.344445209188),
-                  (-0.0113326631127, 0.341498705148),
-                  (-0.011332297099, 0.338551276701),
-                  (-0.011331922598, 0.33560293279),
-                  (-0.0113315395945, 0.332653682334),
-                  (-0.0113311480739, 0.329703534234),
-                  (-0.0113307480222, 0.326752497368),
-                  (-0.011330339426, 0.323800580592),
-                  (-0.0113299222726, 0.320847792745),
-                  (-0.0113294965497, 0.317894142642),
-                  (-0.0113290622459, 0.314939639081),
-                  (-0.0113286193505, 0.311984290837),
-                  (-0.0113281678532, 0.309028106668),
-                  (-0.0113277077448, 0.306071095311),
-                  (-0.0113272390166, 0.303113265484),
-                  (-0.0113267616607, 0.300154625887),
-                  (-0.0113262756699, 0.297195185199),
-                  (-0.011325781038, 0.294234952083),
-                  (-0.0113252777593, 0.29127393518),
-                  (-0.0113247658292, 0.288312143115),
-                  (-0.0113242452437, 0.285349584495),
-                  (-0.0113237159998, 0.282386267908),
-                  (-0.0113231780952, 0.279422201925),
-                  (-0.0113226315285, 0.276457395098),
-                  (-0.0113220762994, 0.273491855964),
-                  (-0.0113215124081, 0.270525593039),
-                  (-0.0113209398559, 0.267558614825),
-                  (-0.0113203586451, 0.264590929807),
-                  (-0.0113197687787, 0.26162254645),
-                  (-0.0113191702607, 0.258653473206),
-                  (-0.011318563096, 0.255683718509),
-                  (-0.0113179472905, 0.252713290776),
-                  (-0.0113173228509, 0.249742198409),
-                  (-0.0174202097474, 0.24973783319),
-                  (-0.0235229518456, 0.249732509962),
-                  (-0.0296254821026, 0.249726228527),
-                  (-0.0357277334259, 0.249718988759),
-                  (-0.0418296386702, 0.249710790601),
-                  (-0.0479311306339, 0.249701634072),
-                  (-0.0540321420565, 0.249691519255),
-                  (-0.0601326056148, 0.249680446306),
-                  (-0.0662324539199, 0.249668415446),
-                  (-0.0723316195144, 0.249655426963),
-                  (-0.0784300348687, 0.249641481206),
-                  (-0.0845276323781, 0.249626578588),
-                  (-0.0906243443596, 0.249610719576),
-                  (-0.0967201030481, 0.249593904695),
-                  (-0.102814840594, 0.249576134521),
-                  (-0.108908489058, 0.249557409675),
-                  (-0.115000980411, 0.249537730827),
-                  (-0.121092246525, 0.24951709868),
-                  (-0.127182219175, 0.249495513978),
-                  (-0.133270830032, 0.24947297749),
-                  (-0.139358010659, 0.249449490014),
-                  (-0.145443692509, 0.249425052364),
-                  (-0.151527806918, 0.249399665371),
-                  (-0.157610285102, 0.249373329872),
-                  (-0.163691058153, 0.249346046707),
-                  (-0.169770057033, 0.249317816712),
-                  (-0.175847212568, 0.24928864071),
-                  (-0.181922455445, 0.249258519509),
-                  (-0.187995716205, 0.24922745389),
-                  (-0.19406692524, 0.249195444605),
-                  (-0.200136012781, 0.249162492365),
-                  (-0.206202908899, 0.249128597835),
-                  (-0.206189102809, 0.252093524669),
-                  (-0.206175112711, 0.255057781685),
-                  (-0.206160938528, 0.258021360454),
-                  (-0.206146580178, 0.260984252527),
-                  (-0.206132037577, 0.26394644944),
-                  (-0.206117310638, 0.266907942706),
-                  (-0.206102399268, 0.269868723822),
-                  (-0.206087303373, 0.272828784265),
-                  (-0.206072022854, 0.275788115492),
-                  (-0.206056557608, 0.278746708941),
-                  (-0.206040907528, 0.281704556031),
-                  (-0.206025072502, 0.284661648157),
-                  (-0.206009052416, 0.287617976697),
-                  (-0.20599284715, 0.290573533007),
-                  (-0.20597645658, 0.29352830842),
-                  (-0.205959880577, 0.296482294252),
-                  (-0.205943119007, 0.299435481792),
-                  (-0.205926171733, 0.302387862311),
-                  (-0.20590903861, 0.305339427055),
-                  (-0.205891719492, 0.308290167248),
-                  (-0.205874214224, 0.311240074092),
-                  (-0.205856522647, 0.314189138766),
-                  (-0.205838644599, 0.317137352423),
-                  (-0.205820579908, 0.320084706194),
-                  (-0.2058023284, 0.323031191186),
-                  (-0.205783889893, 0.325976798481),
-                  (-0.205765264201, 0.328921519135),
-                  (-0.20574645113, 0.331865344181),
-                  (-0.205727450482, 0.334808264624),
-                  (-0.205708262051, 0.337750271445),
-                  (-0.205688885624, 0.340691355599),
-                  (-0.205669320985, 0.343631508013),
-                  (-0.199619656674, 0.343677417589),
-                  (-0.193567795545, 0.343722004598),
-                  (-0.187513808101, 0.343765269443),
-                  (-0.181457764596, 0.343807212448),
-                  (-0.17539973505, 0.34384783387),
-                  (-0.169339789254, 0.343887133901),
-                  (-0.163277996779, 0.343925112683),
-                  (-0.157214426987, 0.343961770307),
-                  (-0.151149149041, 0.343997106826),
-                  (-0.145082231908, 0.344031122259),
-                  (-0.139013744372, 0.344063816597),
-                  (-0.132943755043, 0.344095189813),
-                  (-0.126872332361, 0.344125241863),
-                  (-0.120799544607, 0.344153972695),
-                  (-0.11472545991, 0.344181382252),
-                  (-0.108650146255, 0.344207470483),
-                  (-0.10257367149, 0.344232237338),
-                  (-0.0964961033343, 0.344255682783),
-                  (-0.0904175093855, 0.344277806797),
-                  (-0.0843379571268, 0.344298609381),
-                  (-0.0782575139341, 0.344318090556),
-                  (-0.0721762470834, 0.344336250374),
-                  (-0.0660942237581, 0.344353088914),
-                  (-0.0600115110552, 0.344368606288),
-                  (-0.0539281759933, 0.344382802644),
-                  (-0.0478442855186, 0.344395678167),
-                  (-0.0417599065125, 0.34440723308),
-                  (-0.0356751057978, 0.344417467646),
-                  (-0.0295899501461, 0.344426382172),
-                  (-0.0235045062843, 0.344433977005),
-                  (-0.0174188409012, 0.344440252532),
-                  (-0.0113330206547, 0.344445209188)]},
- 75: {'color': 'violet',
-      'polygon': [(-0.219693992977, 0.343508165945),
-                  (-0.219714737294, 0.340568946962),
-                  (-0.219735279736, 0.337628794907),
-                  (-0.219755620551, 0.334687718873),
-                  (-0.219775759978, 0.331745727925),
-                  (-0.219795698249, 0.328802831102),
-                  (-0.219815435591, 0.325859037417),
-                  (-0.219834972223, 0.322914355856),
-                  (-0.219854308358, 0.31996879538),
-                  (-0.219873444202, 0.317022364925),
-                  (-0.219892379955, 0.3140750734),
-                  (-0.219911115811, 0.311126929693),
-                  (-0.219929651958, 0.308177942663),
-                  (-0.219947988578, 0.30522812115),
-                  (-0.219966125847, 0.302277473965),
-                  (-0.219984063936, 0.299326009901),
-                  (-0.22000180301, 0.296373737724),
-                  (-0.220019343228, 0.293420666179),
-                  (-0.220036684746, 0.290466803988),
-                  (-0.220053827711, 0.28751215985),
-                  (-0.22007077227, 0.284556742445),
-                  (-0.22008751856, 0.281600560428),
-                  (-0.220104066716, 0.278643622436),
-                  (-0.220120416869, 0.275685937081),
-                  (-0.220136569143, 0.27272751296),
-                  (-0.22015252366, 0.269768358644),
-                  (-0.220168280535, 0.266808482687),
-                  (-0.220183839882, 0.263847893623),
-                  (-0.220199201808, 0.260886599965),
-                  (-0.220214366418, 0.25792461021),
-                  (-0.220229333811, 0.254961932831),
-                  (-0.220244104085, 0.251998576288),
-                  (-0.220258677331, 0.249034549019),
-                  (-0.22631780321, 0.248996969122),
-                  (-0.232374433818, 0.248958449294),
-                  (-0.238428498239, 0.248918989829),
-                  (-0.244479925346, 0.248878590924),
-                  (-0.250528643794, 0.248837252671),
-                  (-0.256574582012, 0.248794975052),
-                  (-0.26261766819, 0.248751757923),
-                  (-0.268657830274, 0.248707601012),
-                  (-0.274694995953, 0.248662503911),
-                  (-0.280729092649, 0.248616466063),
-                  (-0.286760047508, 0.248569486755),
-                  (-0.292787787385, 0.248521565113),
-                  (-0.298812238837, 0.248472700091),
-                  (-0.304833328106, 0.248422890461),
-                  (-0.31085098111, 0.24837213481),
-                  (-0.316865123428, 0.248320431526),
-                  (-0.322875680287, 0.248267778796),
-                  (-0.32888257655, 0.248214174594),
-                  (-0.334885736696, 0.248159616673),
-                  (-0.340885084812, 0.248104102561),
-                  (-0.34688054457, 0.248047629552),
-                  (-0.352872039219, 0.247990194698),
-                  (-0.35885949156, 0.247931794805),
-                  (-0.364842823937, 0.24787242642),
-                  (-0.370821958212, 0.247812085835),
-                  (-0.376796815752, 0.24775076907),
-                  (-0.382767317407, 0.247688471876),
-                  (-0.388733383492, 0.247625189723),
-                  (-0.394694933768, 0.247560917801),
-                  (-0.400651887419, 0.247495651011),
-                  (-0.406604163033, 0.24742938396),
-                  (-0.412551678577, 0.247362110961),
-                  (-0.412522436184, 0.250307056968),
-                  (-0.412492806714, 0.253251309345),
-                  (-0.412462789664, 0.25619485939),
-                  (-0.412432384525, 0.259137698381),
-                  (-0.412401590775, 0.26207981757),
-                  (-0.412370407882, 0.265021208187),
-                  (-0.412338835306, 0.267961861434),
-                  (-0.412306872494, 0.270901768492),
-                  (-0.412274518884, 0.273840920515),
-                  (-0.412241773904, 0.27677930863),
-                  (-0.41220863697, 0.279716923939),
-                  (-0.412175107487, 0.282653757518),
-                  (-0.41214118485, 0.285589800414),
-                  (-0.412106868443, 0.288525043647),
-                  (-0.412072157637, 0.29145947821),
-                  (-0.412037051793, 0.294393095065),
-                  (-0.412001550261, 0.297325885148),
-                  (-0.411965652378, 0.300257839363),
-                  (-0.41192935747, 0.303188948586),
-                  (-0.41189266485, 0.306119203661),
-                  (-0.411855573821, 0.309048595402),
-                  (-0.411818083673, 0.311977114591),
-                  (-0.411780193681, 0.314904751979),
-                  (-0.411741903112, 0.317831498283),
-                  (-0.411703211217, 0.320757344191),
-                  (-0.411664117237, 0.323682280352),
-                  (-0.411624620397, 0.326606297387),
-                  (-0.411584719911, 0.329529385878),
-                  (-0.411544414979, 0.332451536375),
-                  (-0.41150370479, 0.335372739392),
-                  (-0.411462588516, 0.338292985407),
-                  (-0.411421065319, 0.341212264862),
-                  (-0.405492086707, 0.341305493819),
-                  (-0.399558257137, 0.341397278907),
-                  (-0.393619663071, 0.341487628141),
-                  (-0.387676390249, 0.341576549196),
-                  (-0.381728523705, 0.341664049416),
-                  (-0.375776147784, 0.341750135814),
-                  (-0.369819346166, 0.341834815077),
-                  (-0.363858201875, 0.341918093575),
-                  (-0.357892797307, 0.341999977362),
-                  (-0.351923214237, 0.342080472188),
-                  (-0.345949533844, 0.342159583497),
-                  (-0.339971836722, 0.342237316442),
-                  (-0.333990202902, 0.342313675887),
-                  (-0.328004711861, 0.342388666415),
-                  (-0.322015442544, 0.342462292338),
-                  (-0.316022473376, 0.342534557699),
-                  (-0.310025882279, 0.342605466287),
-                  (-0.304025746684, 0.342675021639),
-                  (-0.298022143549, 0.342743227052),
-                  (-0.292015149371, 0.342810085589),
-                  (-0.2860048402, 0.342875600088),
-                  (-0.279991291655, 0.342939773172),
-                  (-0.273974578933, 0.343002607256),
-                  (-0.267954776826, 0.343064104556),
-                  (-0.261931959734, 0.343124267097),
-                  (-0.255906201673, 0.343183096724),
-                  (-0.249877576291, 0.34324059511),
-                  (-0.243846156882, 0.343296763761),
-                  (-0.237812016392, 0.343351604032),
-                  (-0.231775227436, 0.343405117128),
-                  (-0.225735862304, 0.343457304119),
-                  (-0.219693992977, 0.343508165945)]},
- 76: {'color': 'violet',
-      'polygon': [(-0.425087637655, 0.341018955369),
-                  (-0.425129821913, 0.338101676774),
-                  (-0.425171582535, 0.335183427509),
-                  (-0.425212920422, 0.332264217181),
-                  (-0.42525383646, 0.329344055362),
-                  (-0.425294331521, 0.326422951587),
-                  (-0.425334406462, 0.323500915354),
-                  (-0.425374062131, 0.320577956128),
-                  (-0.425413299357, 0.317654083335),
-                  (-0.425452118959, 0.314729306369),
-                  (-0.425490521744, 0.311803634591),
-                  (-0.425528508503, 0.308877077325),
-                  (-0.425566080016, 0.305949643865),
-                  (-0.425603237049, 0.303021343471),
-                  (-0.425639980357, 0.300092185371),
-                  (-0.425676310681, 0.297162178762),
-                  (-0.425712228751, 0.294231332809),
-                  (-0.425747735284, 0.291299656648),
-                  (-0.425782830985, 0.288367159384),
-                  (-0.425817516547, 0.28543385009),
-                  (-0.425851792651, 0.282499737814),
-                  (-0.425885659967, 0.279564831573),
-                  (-0.425919119154, 0.276629140356),
-                  (-0.425952170856, 0.273692673123),
-                  (-0.425984815711, 0.27075543881),
-                  (-0.426017054341, 0.267817446322),
-                  (-0.42604888736, 0.264878704542),
-                  (-0.426080315371, 0.261939222323),
-                  (-0.426111338963, 0.258999008494),
-                  (-0.426141958717, 0.256058071861),
-                  (-0.426172175205, 0.253116421203),
-                  (-0.426201988984, 0.250174065275),
-                  (-0.426231400605, 0.247231012809),
-                  (-0.432162616626, 0.247158422145),
-                  (-0.438088712584, 0.247084798602),
-                  (-0.444009602781, 0.247010134904),
-                  (-0.449925200751, 0.246934423462),
-                  (-0.455835419229, 0.24685765638),
-                  (-0.461740170129, 0.246779825451),
-                  (-0.467639364514, 0.24670092216),
-                  (-0.473532912567, 0.246620937684),
-                  (-0.479420723563, 0.246539862896),
-                  (-0.485302705839, 0.246457688367),
-                  (-0.491178766763, 0.246374404367),
-                  (-0.497048812706, 0.246290000877),
-                  (-0.502912749006, 0.246204467584),
-                  (-0.508770479938, 0.246117793894),
-                  (-0.514621908681, 0.246029968936),
-                  (-0.520466937283, 0.245940981571),
-                  (-0.52630546663, 0.245850820398),
-                  (-0.532137396404, 0.245759473763),
-                  (-0.537962625056, 0.245666929774),
-                  (-0.543781049762, 0.245573176304),
-                  (-0.549592566389, 0.245478201012),
-                  (-0.555397069459, 0.245381991347),
-                  (-0.561194452107, 0.245284534569),
-                  (-0.566984606041, 0.245185817759),
-                  (-0.572767421509, 0.245085827837),
-                  (-0.578542787249, 0.244984551582),
-                  (-0.584310590453, 0.244881975642),
-                  (-0.590070716727, 0.244778086562),
-                  (-0.595823050043, 0.244672870801),
-                  (-0.601567472697, 0.244566314749),
-                  (-0.60730386527, 0.244458404758),
-                  (-0.613032106575, 0.244349127159),
-                  (-0.612985078073, 0.24725830872),
-                  (-0.612937409189, 0.250166741108),
-                  (-0.612889098656, 0.253074414906),
-                  (-0.612840145191, 0.255981320663),
-                  (-0.612790547497, 0.258887448897),
-                  (-0.612740304263, 0.261792790092),
-                  (-0.612689414163, 0.2646973347),
-                  (-0.612637875856, 0.267601073137),
-                  (-0.612585687988, 0.270503995785),
-                  (-0.612532849189, 0.27340609299),
-                  (-0.612479358076, 0.276307355062),
-                  (-0.612425213249, 0.279207772274),
-                  (-0.612370413298, 0.282107334862),
-                  (-0.612314956794, 0.285006033024),
-                  (-0.612258842298, 0.287903856918),
-                  (-0.612202068353, 0.290800796663),
-                  (-0.612144633491, 0.293696842339),
-                  (-0.612086536228, 0.296591983985),
-                  (-0.612027775067, 0.299486211598),
-                  (-0.611968348497, 0.302379515133),
-                  (-0.611908254992, 0.305271884502),
-                  (-0.611847493012, 0.308163309574),
-                  (-0.611786061006, 0.311053780175),
-                  (-0.611723957406, 0.313943286084),
-                  (-0.611661180632, 0.316831817037),
-                  (-0.61159772909, 0.319719362722),
-                  (-0.611533601173, 0.322605912782),
-                  (-0.61146879526, 0.32549145681),
-                  (-0.611403309717, 0.328375984355),
-                  (-0.611337142896, 0.331259484912),
-                  (-0.611270293137, 0.334141947932),
-                  (-0.611202758766, 0.337023362811),
-                  (-0.60549927748, 0.337175324326),
-                  (-0.599787383143, 0.337325375802),
-                  (-0.594067200565, 0.337473534525),
-                  (-0.588338853021, 0.33761981774),
-                  (-0.582602462279, 0.337764242626),
-                  (-0.576858148625, 0.337906826271),
-                  (-0.571106030889, 0.33804758565),
-                  (-0.565346226473, 0.338186537602),
-                  (-0.559578851378, 0.338323698808),
-                  (-0.55380402023, 0.338459085776),
-                  (-0.548021846304, 0.338592714819),
-                  (-0.542232441553, 0.33872460204),
-                  (-0.536435916634, 0.338854763314),
-                  (-0.53063238093, 0.338983214275),
-                  (-0.524821942582, 0.339109970303),
-                  (-0.519004708506, 0.339235046508),
-                  (-0.513180784424, 0.339358457722),
-                  (-0.507350274889, 0.339480218484),
-                  (-0.501513283305, 0.339600343034),
-                  (-0.495669911957, 0.339718845304),
-                  (-0.489820262031, 0.339835738907),
-                  (-0.483964433639, 0.339951037133),
-                  (-0.478102525844, 0.34006475294),
-                  (-0.47223463668, 0.340176898952),
-                  (-0.466360863182, 0.340287487451),
-                  (-0.460481301399, 0.340396530375),
-                  (-0.454596046426, 0.340504039315),
-                  (-0.448705192418, 0.340610025513),
-                  (-0.44280883262, 0.340714499856),
-                  (-0.436907059382, 0.340817472883),
-                  (-0.430999964184, 0.340918954777),
-                  (-0.425087637655, 0.341018955369)]},
- 77: {'color': 'violet',
-      'polygon': [(-0.624274562884, 0.33666968727),
-                  (-0.624345138843, 0.333791483655),
-                  (-0.624415009378, 0.330912224623),
-                  (-0.624484176195, 0.328031920872),
-                  (-0.624552640992, 0.32515058305),
-                  (-0.624620405449, 0.322268221756),
-                  (-0.624687471238, 0.319384847536),
-                  (-0.624753840016, 0.316500470889),
-                  (-0.624819513427, 0.313615102266),
-                  (-0.624884493104, 0.310728752069),
-                  (-0.624948780663, 0.307841430653),
-                  (-0.625012377712, 0.304953148326),
-                  (-0.625075285842, 0.302063915354),
-                  (-0.625137506632, 0.299173741953),
-                  (-0.625199041647, 0.296282638299),
-                  (-0.625259892439, 0.29339061452),
-                  (-0.625320060546, 0.290497680706),
-                  (-0.625379547492, 0.287603846901),
-                  (-0.62543835479, 0.284709123108),
-                  (-0.625496483934, 0.281813519291),
-                  (-0.625553936409, 0.278917045371),
-                  (-0.625610713683, 0.276019711232),
-                  (-0.625666817212, 0.273121526717),
-                  (-0.625722248435, 0.270222501632),
-                  (-0.625777008781, 0.267322645745),
-                  (-0.62583109966, 0.264421968787),
-                  (-0.625884522473, 0.261520480452),
-                  (-0.625937278601, 0.258618190399),
-                  (-0.625989369416, 0.255715108253),
-                  (-0.626040796271, 0.252811243603),
-                  (-0.626091560508, 0.249906606005),
-                  (-0.626141663452, 0.247001204981),
-                  (-0.626191106415, 0.244095050022),
-                  (-0.631891508438, 0.243983095484),
-                  (-0.63758321565, 0.243869713115),
-                  (-0.643266096723, 0.243754889569),
-                  (-0.648940018273, 0.243638611663),
-                  (-0.654604844802, 0.243520866409),
-                  (-0.660260438653, 0.243401641051),
-                  (-0.66590665996, 0.243280923101),
-                  (-0.671543366593, 0.243158700374),
-                  (-0.67717041411, 0.243034961033),
-                  (-0.682787655702, 0.242909693626),
-                  (-0.688394942142, 0.24278288713),
-                  (-0.69399212173, 0.242654530997),
-                  (-0.699579040239, 0.242524615195),
-                  (-0.705155540862, 0.242393130262),
-                  (-0.710721464154, 0.242260067349),
-                  (-0.716276647981, 0.242125418277),
-                  (-0.721820927458, 0.241989175586),
-                  (-0.727354134896, 0.241851332587),
-                  (-0.732876099747, 0.241711883425),
-                  (-0.738386648541, 0.241570823131),
-                  (-0.743885604831, 0.241428147686),
-                  (-0.749372789134, 0.24128385408),
-                  (-0.754848018876, 0.241137940376),
-                  (-0.760311108324, 0.240990405776),
-                  (-0.765761868536, 0.240841250691),
-                  (-0.771200107295, 0.240690476804),
-                  (-0.776625629051, 0.240538087149),
-                  (-0.78203823486, 0.240384086179),
-                  (-0.787437722321, 0.240228479845),
-                  (-0.792823885521, 0.240071275669),
-                  (-0.798196514966, 0.239912482831),
-                  (-0.803555397524, 0.239752112244),
-                  (-0.80348111266, 0.242606255766),
-                  (-0.803405859159, 0.245459550598),
-                  (-0.803329635576, 0.24831198573),
-                  (-0.803252440462, 0.251163550108),
-                  (-0.803174272366, 0.25401423263),
-                  (-0.803095129834, 0.256864022151),
-                  (-0.803015011411, 0.259712907478),
-                  (-0.802933915639, 0.262560877368),
-                  (-0.80285184106, 0.265407920532),
-                  (-0.802768786217, 0.26825402563),
-                  (-0.802684749649, 0.271099181273),
-                  (-0.802599729901, 0.273943376019),
-                  (-0.802513725514, 0.276786598376),
-                  (-0.802426735034, 0.279628836796),
-                  (-0.802338757008, 0.282470079682),
-                  (-0.802249789986, 0.285310315377),
-                  (-0.80215983252, 0.288149532172),
-                  (-0.802068883168, 0.290987718303),
-                  (-0.801976940491, 0.293824861945),
-                  (-0.801884003054, 0.296660951217),
-                  (-0.80179006943, 0.299495974181),
-                  (-0.801695138196, 0.302329918836),
-                  (-0.801599207937, 0.305162773123),
-                  (-0.801502277246, 0.30799452492),
-                  (-0.801404344721, 0.310825162046),
-                  (-0.801305408971, 0.313654672252),
-                  (-0.801205468615, 0.316483043229),
-                  (-0.801104522279, 0.319310262602),
-                  (-0.801002568602, 0.322136317931),
-                  (-0.800899606234, 0.324961196708),
-                  (-0.800795633835, 0.32778488636),
-                  (-0.80069065008, 0.330607374244),
-                  (-0.7953644437, 0.33083123104),
-                  (-0.790024417168, 0.331052849862),
-                  (-0.784670763789, 0.331272222298),
-                  (-0.779303674486, 0.331489341785),
-                  (-0.77392333782, 0.331704203521),
-                  (-0.768529940003, 0.331916804376),
-                  (-0.763123664926, 0.33212714281),
-                  (-0.757704694171, 0.332335218792),
-                  (-0.752273207037, 0.332541033718),
-                  (-0.746829380559, 0.332744590336),
-                  (-0.74137338953, 0.332945892672),
-                  (-0.735905406525, 0.333144945954),
-                  (-0.73042560192, 0.333341756544),
-                  (-0.724934143919, 0.333536331868),
-                  (-0.719431198578, 0.33372868035),
-                  (-0.713916929824, 0.333918811347),
-                  (-0.708391499485, 0.334106735088),
-                  (-0.702855067313, 0.33429246261),
-                  (-0.697307791007, 0.334476005705),
-                  (-0.691749826242, 0.334657376857),
-                  (-0.68618132669, 0.334836589192),
-                  (-0.680602444052, 0.33501365642),
-                  (-0.675013328078, 0.335188592792),
-                  (-0.669414126598, 0.335361413042),
-                  (-0.663804985545, 0.335532132343),
-                  (-0.658186048983, 0.335700766263),
-                  (-0.652557459137, 0.335867330718),
-                  (-0.646919356413, 0.336031841929),
-                  (-0.641271879432, 0.336194316385),
-                  (-0.635615165051, 0.3363547708),
-                  (-0.629949348396, 0.336513222076),
-                  (-0.624274562884, 0.33666968727)]},
- 78: {'color': 'skyblue',
-      'polygon': [(0.590229735787, 0.433062180138),
-                  (0.590320258593, 0.430218877399),
-                  (0.590410060836, 0.42737415282),
-                  (0.590499144663, 0.424528018376),
-                  (0.590587512206, 0.421680485985),
-                  (0.590675165576, 0.418831567509),
-                  (0.59076210687, 0.415981274756),
-                  (0.590848338166, 0.413129619478),
-                  (0.590933861528, 0.410276613377),
-                  (0.591018678999, 0.4074222681),
-                  (0.591102792607, 0.404566595244),
-                  (0.591186204362, 0.401709606356),
-                  (0.59126891626, 0.398851312934),
-                  (0.591350930276, 0.395991726425),
-                  (0.591432248369, 0.39313085823),
-                  (0.591512872484, 0.390268719703),
-                  (0.591592804544, 0.387405322151),
-                  (0.59167204646, 0.384540676835),
-                  (0.591750600122, 0.381674794971),
-                  (0.591828467406, 0.378807687731),
-                  (0.59190565017, 0.375939366245),
-                  (0.591982150253, 0.373069841597),
-                  (0.592057969481, 0.37019912483),
-                  (0.59213310966, 0.367327226947),
-                  (0.592207572581, 0.364454158908),
-                  (0.592281360016, 0.361579931633),
-                  (0.592354473723, 0.358704556001),
-                  (0.59242691544, 0.355828042853),
-                  (0.592498686891, 0.352950402991),
-                  (0.59256978978, 0.350071647178),
-                  (0.592640225799, 0.34719178614),
-                  (0.592709996618, 0.344310830565),
-                  (0.592779103894, 0.341428791104),
-                  (0.587058776292, 0.341575741473),
-                  (0.581330307187, 0.34172075123),
-                  (0.575593815853, 0.34186383302),
-                  (0.569849420315, 0.342004999982),
-                  (0.564097237371, 0.342144265695),
-                  (0.558337382597, 0.342281644117),
-                  (0.552569970365, 0.342417149541),
-                  (0.546795113855, 0.342550796538),
-                  (0.541012925072, 0.342682599912),
-                  (0.535223514856, 0.342812574658),
-                  (0.5294269929, 0.342940735913),
-                  (0.523623467766, 0.343067098921),
-                  (0.517813046896, 0.343191678992),
-                  (0.511995836634, 0.343314491466),
-                  (0.506171942234, 0.343435551678),
-                  (0.500341467884, 0.343554874926),
-                  (0.494504516716, 0.343672476441),
-                  (0.488661190826, 0.343788371359),
-                  (0.482811591289, 0.34390257469),
-                  (0.476955818175, 0.3440151013),
-                  (0.471093970567, 0.344125965882),
-                  (0.465226146578, 0.344235182933),
-                  (0.459352443365, 0.344342766742),
-                  (0.453472957151, 0.344448731362),
-                  (0.447587783236, 0.344553090598),
-                  (0.44169701602, 0.344655857991),
-                  (0.435800749015, 0.344757046801),
-                  (0.429899074864, 0.344856669998),
-                  (0.42399208536, 0.344954740246),
-                  (0.418079871458, 0.345051269896),
-                  (0.412162523298, 0.345146270974),
-                  (0.406240130217, 0.345239755176),
-                  (0.406197001735, 0.348156485189),
-                  (0.406153465143, 0.35107220627),
-                  (0.406109519506, 0.353986908675),
-                  (0.406065163874, 0.356900582629),
-                  (0.406020397279, 0.359813218335),
-                  (0.405975218742, 0.362724805964),
-                  (0.405929627266, 0.36563533566),
-                  (0.405883621838, 0.368544797541),
-                  (0.405837201431, 0.371453181695),
-                  (0.405790365, 0.374360478179),
-                  (0.405743111485, 0.377266677025),
-                  (0.40569543981, 0.38017176823),
-                  (0.405647348882, 0.383075741766),
-                  (0.405598837591, 0.385978587571),
-                  (0.405549904812, 0.388880295553),
-                  (0.405500549403, 0.39178085559),
-                  (0.405450770202, 0.394680257524),
-                  (0.405400566034, 0.39757849117),
-                  (0.405349935704, 0.400475546306),
-                  (0.405298878001, 0.403371412678),
-                  (0.405247391695, 0.406266079999),
-                  (0.405195475541, 0.409159537947),
-                  (0.405143128273, 0.412051776164),
-                  (0.405090348608, 0.414942784256),
-                  (0.405037135246, 0.417832551796),
-                  (0.404983486867, 0.420721068318),
-                  (0.404929402135, 0.423608323317),
-                  (0.404874879692, 0.426494306253),
-                  (0.404819918164, 0.429379006545),
-                  (0.404764516156, 0.432262413574),
-                  (0.404708672256, 0.43514451668),
-                  (0.40465238503, 0.438025305163),
-                  (0.4105481214, 0.437903704882),
-                  (0.416438630892, 0.437780109822),
-                  (0.422323819648, 0.43765450529),
-                  (0.428203593068, 0.43752687624),
-                  (0.434077855799, 0.437397207271),
-                  (0.439946511731, 0.437265482645),
-                  (0.445809463987, 0.437131686296),
-                  (0.451666614915, 0.436995801849),
-                  (0.457517866081, 0.436857812626),
-                  (0.463363118262, 0.436717701674),
-                  (0.469202271441, 0.436575451773),
-                  (0.475035224797, 0.436431045462),
-                  (0.480861876699, 0.43628446506),
-                  (0.486682124703, 0.436135692683),
-                  (0.492495865545, 0.435984710278),
-                  (0.498302995133, 0.435831499642),
-                  (0.504103408545, 0.435676042453),
-                  (0.509897000023, 0.435518320299),
-                  (0.51568366297, 0.435358314713),
-                  (0.521463289944, 0.435196007203),
-                  (0.527235772657, 0.435031379292),
-                  (0.533001001969, 0.434864412554),
-                  (0.538758867888, 0.434695088652),
-                  (0.544509259568, 0.434523389386),
-                  (0.550252065304, 0.434349296735),
-                  (0.555987172536, 0.434172792902),
-                  (0.561714467843, 0.43399386037),
-                  (0.567433836948, 0.433812481946),
-                  (0.573145164714, 0.433628640823),
-                  (0.578848335149, 0.433442320632),
-                  (0.584543231407, 0.433253505505),
-                  (0.590229735787, 0.433062180138)]},
- 79: {'color': 'skyblue',
-      'polygon': [(0.390862960421, 0.438179726982),
-                  (0.390917886208, 0.435296792651),
-                  (0.39097238729, 0.432412550136),
-                  (0.391026465031, 0.429527010066),
-                  (0.391080120777, 0.426640183029),
-                  (0.391133355854, 0.423752079575),
-                  (0.391186171571, 0.420862710214),
-                  (0.391238569215, 0.417972085418),
-                  (0.391290550059, 0.415080215623),
-                  (0.391342115356, 0.412187111226),
-                  (0.39139326634, 0.409292782591),
-                  (0.391444004229, 0.406397240044),
-                  (0.391494330222, 0.403500493878),
-                  (0.391544245501, 0.400602554351),
-                  (0.391593751231, 0.397703431687),
-                  (0.39164284856, 0.394803136078),
-                  (0.391691538617, 0.391901677681),
-                  (0.391739822516, 0.388999066624),
-                  (0.391787701355, 0.386095313),
-                  (0.391835176212, 0.383190426874),
-                  (0.391882248152, 0.380284418277),
-                  (0.391928918222, 0.377377297212),
-                  (0.391975187453, 0.374469073652),
-                  (0.392021056861, 0.371559757539),
-                  (0.392066527445, 0.368649358788),
-                  (0.392111600189, 0.365737887282),
-                  (0.39215627606, 0.362825352879),
-                  (0.392200556012, 0.359911765407),
-                  (0.392244440981, 0.356997134668),
-                  (0.392287931891, 0.354081470434),
-                  (0.392331029647, 0.351164782453),
-                  (0.392373735144, 0.348247080444),
-                  (0.392416049257, 0.345328374101),
-                  (0.38647747981, 0.345415094192),
-                  (0.380534242891, 0.345500343724),
-                  (0.374586423849, 0.345584132552),
-                  (0.36863410734, 0.34566647017),
-                  (0.362677377339, 0.345747365714),
-                  (0.356716317156, 0.345826827959),
-                  (0.350751009454, 0.345904865318),
-                  (0.344781536267, 0.345981485848),
-                  (0.338807979009, 0.346056697249),
-                  (0.332830418496, 0.346130506867),
-                  (0.326848934959, 0.346202921698),
-                  (0.320863608059, 0.346273948389),
-                  (0.314874516902, 0.34634359325),
-                  (0.308881740056, 0.346411862249),
-                  (0.302885355563, 0.346478761025),
-                  (0.296885440956, 0.346544294891),
-                  (0.290882073272, 0.34660846884),
-                  (0.284875329066, 0.346671287554),
-                  (0.278865284428, 0.346732755407),
-                  (0.272852014992, 0.346792876478),
-                  (0.266835595953, 0.346851654554),
-                  (0.260816102081, 0.34690909314),
-                  (0.254793607733, 0.346965195467),
-                  (0.248768186865, 0.347019964501),
-                  (0.242739913047, 0.347073402952),
-                  (0.236708859475, 0.34712551328),
-                  (0.230675098983, 0.347176297709),
-                  (0.224638704057, 0.347225758232),
-                  (0.218599746844, 0.347273896622),
-                  (0.212558299168, 0.34732071444),
-                  (0.206514432537, 0.347366213047),
-                  (0.20046821816, 0.34741039361),
-                  (0.200446906922, 0.350348171089),
-                  (0.200425407891, 0.353284981619),
-                  (0.200403720762, 0.356220815998),
-                  (0.200381845225, 0.359155665004),
-                  (0.200359780957, 0.362089519391),
-                  (0.20033752763, 0.365022369892),
-                  (0.200315084906, 0.367954207217),
-                  (0.200292452438, 0.370885022052),
-                  (0.200269629871, 0.373814805061),
-                  (0.20024661684, 0.376743546884),
-                  (0.200223412972, 0.379671238138),
-                  (0.200200017885, 0.382597869413),
-                  (0.200176431186, 0.385523431279),
-                  (0.200152652474, 0.388447914277),
-                  (0.200128681339, 0.391371308925),
-                  (0.20010451736, 0.394293605715),
-                  (0.200080160107, 0.397214795115),
-                  (0.200055609141, 0.400134867563),
-                  (0.20003086401, 0.403053813474),
-                  (0.200005924256, 0.405971623233),
-                  (0.199980789409, 0.4088882872),
-                  (0.199955458988, 0.411803795707),
-                  (0.199929932502, 0.414718139055),
-                  (0.19990420945, 0.41763130752),
-                  (0.19987828932, 0.420543291346),
-                  (0.19985217159, 0.423454080748),
-                  (0.199825855726, 0.426363665912),
-                  (0.199799341184, 0.429272036991),
-                  (0.199772627408, 0.432179184108),
-                  (0.19974571383, 0.435085097355),
-                  (0.199718599873, 0.43798976679),
-                  (0.199691284948, 0.44089318244),
-                  (0.205714402434, 0.440835756948),
-                  (0.211735133998, 0.440776613005),
-                  (0.21775340541, 0.440715747989),
-                  (0.223769142038, 0.44065315904),
-                  (0.229782268843, 0.440588843043),
-                  (0.235792710362, 0.440522796625),
-                  (0.241800390705, 0.440455016138),
-                  (0.247805233538, 0.440385497657),
-                  (0.253807162077, 0.440314236968),
-                  (0.259806099073, 0.440241229557),
-                  (0.265801966805, 0.440166470604),
-                  (0.271794687069, 0.440089954975),
-                  (0.277784181165, 0.440011677208),
-                  (0.283770369889, 0.439931631513),
-                  (0.289753173523, 0.439849811758),
-                  (0.295732511821, 0.439766211464),
-                  (0.301708304002, 0.439680823798),
-                  (0.307680468739, 0.439593641566),
-                  (0.313648924145, 0.439504657205),
-                  (0.319613587769, 0.43941386278),
-                  (0.32557437658, 0.439321249976),
-                  (0.33153120696, 0.439226810094),
-                  (0.337483994694, 0.439130534049),
-                  (0.343432654955, 0.43903241236),
-                  (0.349377102301, 0.438932435154),
-                  (0.355317250661, 0.43883059216),
-                  (0.361253013324, 0.438726872705),
-                  (0.367184302932, 0.438621265718),
-                  (0.373111031468, 0.438513759726),
-                  (0.379033110251, 0.438404342854),
-                  (0.384950449917, 0.43829300283),
-                  (0.390862960421, 0.438179726982)]},
- 80: {'color': 'skyblue',
-      'polygon': [(0.185785057005, 0.4409631817),
-                  (0.185812134731, 0.438058787617),
-                  (0.185839026482, 0.435153142527),
-                  (0.185865732794, 0.432246256376),
-                  (0.185892254198, 0.429338139079),
-                  (0.185918591212, 0.426428800516),
-                  (0.185944744342, 0.423518250537),
-                  (0.185970714085, 0.42060649896),
-                  (0.185996500929, 0.417693555575),
-                  (0.186022105349, 0.414779430139),
-                  (0.186047527812, 0.41186413238),
-                  (0.186072768774, 0.408947671997),
-                  (0.186097828682, 0.406030058663),
-                  (0.186122707972, 0.403111302019),
-                  (0.186147407072, 0.400191411681),
-                  (0.1861719264, 0.397270397236),
-                  (0.186196266363, 0.394348268246),
-                  (0.18622042736, 0.391425034245),
-                  (0.186244409781, 0.388500704741),
-                  (0.186268214007, 0.385575289218),
-                  (0.186291840409, 0.382648797132),
-                  (0.18631528935, 0.379721237918),
-                  (0.186338561183, 0.376792620981),
-                  (0.186361656255, 0.373862955706),
-                  (0.186384574901, 0.370932251453),
-                  (0.18640731745, 0.368000517557),
-                  (0.186429884221, 0.365067763331),
-                  (0.186452275526, 0.362133998064),
-                  (0.186474491668, 0.359199231023),
-                  (0.186496532942, 0.356263471451),
-                  (0.186518399636, 0.353326728571),
-                  (0.186540092028, 0.350389011583),
-                  (0.18656161039, 0.347450329663),
-                  (0.180508163481, 0.347486821881),
-                  (0.174452670349, 0.34752199855),
-                  (0.168395200786, 0.347555860018),
-                  (0.162335824352, 0.347588406499),
-                  (0.156274610382, 0.347619638082),
-                  (0.150211627998, 0.347649554742),
-                  (0.144146946119, 0.347678156346),
-                  (0.138080633467, 0.347705442665),
-                  (0.132012758583, 0.34773141338),
-                  (0.125943389832, 0.347756068091),
-                  (0.11987259541, 0.347779406327),
-                  (0.11380044336, 0.347801427551),
-                  (0.107727001574, 0.347822131169),
-                  (0.101652337807, 0.347841516538),
-                  (0.0955765196792, 0.347859582973),
-                  (0.0894996146927, 0.347876329755),
-                  (0.083421690233, 0.347891756135),
-                  (0.0773428135805, 0.347905861342),
-                  (0.0712630519174, 0.347918644592),
-                  (0.0651824723363, 0.347930105088),
-                  (0.0591011418475, 0.347940242032),
-                  (0.0530191273869, 0.347949054625),
-                  (0.0469364958241, 0.347956542075),
-                  (0.0408533139691, 0.347962703602),
-                  (0.0347696485804, 0.34796753844),
-                  (0.0286855663723, 0.347971045842),
-                  (0.0226011340218, 0.347973225087),
-                  (0.0165164181763, 0.347974075477),
-                  (0.0104314854605, 0.347973596345),
-                  (0.00434640248366, 0.347971787056),
-                  (-0.0017387641534, 0.34796864701),
-                  (-0.00782394785125, 0.347964175643),
-                  (-0.00782544168305, 0.350908624555),
-                  (-0.00782693011325, 0.353852120317),
-                  (-0.00782841316084, 0.356794653892),
-                  (-0.00782989084536, 0.359736216224),
-                  (-0.00783136318691, 0.362676798234),
-                  (-0.0078328302061, 0.365616390815),
-                  (-0.00783429192401, 0.368554984843),
-                  (-0.00783574836223, 0.371492571165),
-                  (-0.00783719954279, 0.374429140606),
-                  (-0.00783864548811, 0.377364683966),
-                  (-0.00784008622111, 0.380299192021),
-                  (-0.00784152176504, 0.38323265552),
-                  (-0.00784295214351, 0.386165065189),
-                  (-0.00784437738056, 0.389096411726),
-                  (-0.00784579750047, 0.392026685804),
-                  (-0.00784721252793, 0.394955878068),
-                  (-0.00784862248787, 0.397883979139),
-                  (-0.00785002740554, 0.400810979607),
-                  (-0.00785142730641, 0.403736870038),
-                  (-0.00785282221625, 0.406661640966),
-                  (-0.00785421216105, 0.4095852829),
-                  (-0.00785559716701, 0.412507786318),
-                  (-0.00785697726056, 0.41542914167),
-                  (-0.0078583524683, 0.418349339373),
-                  (-0.00785972281705, 0.421268369818),
-                  (-0.00786108833381, 0.424186223363),
-                  (-0.00786244904569, 0.427102890335),
-                  (-0.00786380498002, 0.430018361028),
-                  (-0.00786515616426, 0.432932625706),
-                  (-0.007866502626, 0.435845674599),
-                  (-0.00786784439305, 0.438757497903),
-                  (-0.00786918149328, 0.441668085782),
-                  (-0.00180691890353, 0.441672495093),
-                  (0.00425533806256, 0.441675193811),
-                  (0.0103175224903, 0.441676182615),
-                  (0.0163795674281, 0.441675462182),
-                  (0.0224414058763, 0.44167303318),
-                  (0.0285029707769, 0.441668896268),
-                  (0.0345641950025, 0.441663052094),
-                  (0.0406250113459, 0.44165550129),
-                  (0.0466853525092, 0.441646244467),
-                  (0.0527451510933, 0.441635282215),
-                  (0.0588043395875, 0.441622615096),
-                  (0.0648628503585, 0.441608243639),
-                  (0.07092061564, 0.441592168337),
-                  (0.0769775675224, 0.441574389639),
-                  (0.0830336379419, 0.441554907948),
-                  (0.0890887586702, 0.44153372361),
-                  (0.0951428613037, 0.441510836915),
-                  (0.101195877253, 0.441486248082),
-                  (0.107247737734, 0.441459957259),
-                  (0.113298373754, 0.441431964513),
-                  (0.119347716104, 0.441402269821),
-                  (0.125395695346, 0.441370873067),
-                  (0.131442241808, 0.44133777403),
-                  (0.137487285564, 0.441302972378),
-                  (0.143530756432, 0.44126646766),
-                  (0.14957258396, 0.441228259296),
-                  (0.155612697415, 0.441188346569),
-                  (0.161651025773, 0.441146728617),
-                  (0.16768749771, 0.441103404422),
-                  (0.173722041589, 0.441058372803),
-                  (0.179754585451, 0.441011632408),
-                  (0.185785057005, 0.4409631817)]},
- 81: {'color': 'violet',
-      'polygon': [(-0.0114527355719, 0.441745311854),
-                  (-0.0114522241437, 0.438834762116),
-                  (-0.0114517047045, 0.435922976684),
-                  (-0.011451177234, 0.433009965399),
-                  (-0.0114506417115, 0.430095738066),
-                  (-0.0114500981167, 0.42718030446),
-                  (-0.0114495464289, 0.424263674319),
-                  (-0.0114489866276, 0.421345857352),
-                  (-0.0114484186921, 0.418426863234),
-                  (-0.0114478426016, 0.41550670161),
-                  (-0.0114472583357, 0.412585382094),
-                  (-0.0114466658735, 0.409662914269),
-                  (-0.0114460651945, 0.406739307687),
-                  (-0.011445456278, 0.403814571873),
-                  (-0.0114448391033, 0.400888716322),
-                  (-0.0114442136501, 0.397961750499),
-                  (-0.0114435798978, 0.395033683843),
-                  (-0.011442937826, 0.392104525764),
-                  (-0.0114422874146, 0.389174285643),
-                  (-0.0114416286434, 0.386242972838),
-                  (-0.0114409614925, 0.383310596677),
-                  (-0.0114402859421, 0.380377166463),
-                  (-0.0114396019726, 0.377442691472),
-                  (-0.0114389095647, 0.374507180957),
-                  (-0.0114382086991, 0.371570644143),
-                  (-0.0114374993571, 0.36863309023),
-                  (-0.01143678152, 0.365694528397),
-                  (-0.0114360551696, 0.362754967794),
-                  (-0.0114353202879, 0.359814417551),
-                  (-0.0114345768573, 0.356872886772),
-                  (-0.0114338248606, 0.353930384538),
-                  (-0.0114330642808, 0.350986919907),
-                  (-0.0114322951017, 0.348042501916),
-                  (-0.0175173511052, 0.348036614789),
-                  (-0.023602251125, 0.348029394726),
-                  (-0.0296869285092, 0.348020841296),
-                  (-0.0357713165751, 0.348010954112),
-                  (-0.0418553486026, 0.347999732823),
-                  (-0.0479389578274, 0.347987177124),
-                  (-0.0540220774336, 0.347973286746),
-                  (-0.0601046405471, 0.347958061461),
-                  (-0.0661865802286, 0.347941501078),
-                  (-0.0722678294662, 0.347923605443),
-                  (-0.0783483211688, 0.347904374434),
-                  (-0.0844279881588, 0.347883807961),
-                  (-0.0905067631647, 0.347861905963),
-                  (-0.0965845788143, 0.347838668404),
-                  (-0.102661367627, 0.347814095271),
-                  (-0.108737062007, 0.347788186568),
-                  (-0.114811594234, 0.347760942316),
-                  (-0.120884896459, 0.347732362543),
-                  (-0.126956900694, 0.347702447283),
-                  (-0.133027538804, 0.347671196573),
-                  (-0.139096742501, 0.347638610442),
-                  (-0.145164443335, 0.347604688911),
-                  (-0.151230572685, 0.347569431985),
-                  (-0.157295061753, 0.347532839644),
-                  (-0.163357841553, 0.347494911844),
-                  (-0.169418842905, 0.347455648504),
-                  (-0.175477996424, 0.3474150495),
-                  (-0.181535232511, 0.347373114663),
-                  (-0.187590481348, 0.347329843765),
-                  (-0.193643672884, 0.347285236517),
-                  (-0.199694736827, 0.347239292559),
-                  (-0.205743602636, 0.347192011453),
-                  (-0.205724048439, 0.350130060992),
-                  (-0.205704305093, 0.353067149404),
-                  (-0.205684372348, 0.3560032675),
-                  (-0.205664249948, 0.358938406065),
-                  (-0.205643937631, 0.361872555851),
-                  (-0.205623435124, 0.364805707585),
-                  (-0.205602742151, 0.367737851962),
-                  (-0.205581858424, 0.370668979648),
-                  (-0.20556078365, 0.373599081278),
-                  (-0.205539517526, 0.376528147456),
-                  (-0.205518059743, 0.379456168755),
-                  (-0.205496409982, 0.382383135718),
-                  (-0.205474567917, 0.385309038853),
-                  (-0.205452533211, 0.388233868638),
-                  (-0.205430305522, 0.391157615517),
-                  (-0.205407884496, 0.3940802699),
-                  (-0.205385269773, 0.397001822165),
-                  (-0.205362460981, 0.399922262654),
-                  (-0.205339457742, 0.402841581674),
-                  (-0.205316259666, 0.405759769499),
-                  (-0.205292866354, 0.408676816366),
-                  (-0.2052692774, 0.411592712474),
-                  (-0.205245492386, 0.414507447987),
-                  (-0.205221510884, 0.417421013033),
-                  (-0.205197332458, 0.4203333977),
-                  (-0.205172956661, 0.423244592038),
-                  (-0.205148383037, 0.426154586059),
-                  (-0.205123611116, 0.429063369736),
-                  (-0.205098640424, 0.431970933),
-                  (-0.20507347047, 0.434877265742),
-                  (-0.205048100758, 0.437782357815),
-                  (-0.205022530778, 0.440686199025),
-                  (-0.198997137368, 0.440746100745),
-                  (-0.192969518024, 0.440804260483),
-                  (-0.186939744665, 0.440860680091),
-                  (-0.180907888866, 0.440915361296),
-                  (-0.174874021869, 0.440968305718),
-                  (-0.1688382146, 0.441019514873),
-                  (-0.162800537678, 0.44106899018),
-                  (-0.156761061428, 0.441116732969),
-                  (-0.150719855896, 0.441162744491),
-                  (-0.144676990858, 0.441207025921),
-                  (-0.138632535836, 0.441249578364),
-                  (-0.132586560106, 0.441290402868),
-                  (-0.126539132715, 0.441329500422),
-                  (-0.12049032249, 0.441366871967),
-                  (-0.11444019805, 0.4414025184),
-                  (-0.108388827819, 0.441436440579),
-                  (-0.102336280039, 0.441468639328),
-                  (-0.0962826227777, 0.441499115442),
-                  (-0.0902279239453, 0.441527869693),
-                  (-0.0841722513032, 0.441554902829),
-                  (-0.0781156724761, 0.441580215585),
-                  (-0.072058254964, 0.441603808679),
-                  (-0.0660000661532, 0.441625682821),
-                  (-0.0599411733278, 0.441645838711),
-                  (-0.0538816436816, 0.441664277046),
-                  (-0.0478215443287, 0.441680998516),
-                  (-0.0417609423149, 0.441696003814),
-                  (-0.0356999046293, 0.441709293627),
-                  (-0.0296384982147, 0.441720868646),
-                  (-0.0235767899794, 0.441730729562),
-                  (-0.017514846808, 0.441738877067),
-                  (-0.0114527355719, 0.441745311854)]},
- 82: {'color': 'violet',
-      'polygon': [(-0.218826045381, 0.440505825563),
-                  (-0.21885445026, 0.437602941255),
-                  (-0.218882640458, 0.434698804018),
-                  (-0.218910616529, 0.431793424083),
-                  (-0.218938379014, 0.428886811641),
-                  (-0.218965928445, 0.42597897684),
-                  (-0.218993265339, 0.423069929786),
-                  (-0.219020390207, 0.420159680545),
-                  (-0.219047303546, 0.417248239143),
-                  (-0.219074005842, 0.414335615565),
-                  (-0.219100497572, 0.411421819761),
-                  (-0.219126779203, 0.408506861637),
-                  (-0.219152851189, 0.405590751064),
-                  (-0.219178713976, 0.402673497877),
-                  (-0.219204368, 0.39975511187),
-                  (-0.219229813685, 0.396835602804),
-                  (-0.219255051447, 0.393914980404),
-                  (-0.219280081692, 0.390993254356),
-                  (-0.219304904815, 0.388070434315),
-                  (-0.219329521204, 0.3851465299),
-                  (-0.219353931236, 0.382221550695),
-                  (-0.219378135278, 0.379295506252),
-                  (-0.219402133691, 0.37636840609),
-                  (-0.219425926822, 0.373440259693),
-                  (-0.219449515015, 0.370511076516),
-                  (-0.219472898602, 0.367580865979),
-                  (-0.219496077906, 0.364649637473),
-                  (-0.219519053243, 0.361717400356),
-                  (-0.219541824921, 0.358784163957),
-                  (-0.219564393238, 0.355849937575),
-                  (-0.219586758486, 0.352914730478),
-                  (-0.219608920947, 0.349978551906),
-                  (-0.219630880899, 0.347041411067),
-                  (-0.225671989694, 0.346991613361),
-                  (-0.231710593323, 0.346940475131),
-                  (-0.237746619749, 0.346887995365),
-                  (-0.243779996622, 0.346834172919),
-                  (-0.249810651266, 0.346779006513),
-                  (-0.255838510667, 0.346722494716),
-                  (-0.261863501462, 0.346664635942),
-                  (-0.267885549925, 0.34660542844),
-                  (-0.27390458196, 0.346544870285),
-                  (-0.279920523081, 0.346482959367),
-                  (-0.285933298408, 0.346419693387),
-                  (-0.291942832648, 0.346355069844),
-                  (-0.297949050083, 0.346289086029),
-                  (-0.303951874558, 0.346221739015),
-                  (-0.309951229467, 0.346153025648),
-                  (-0.315947037739, 0.346082942539),
-                  (-0.321939221822, 0.346011486057),
-                  (-0.32792770367, 0.345938652319),
-                  (-0.33391240473, 0.345864437185),
-                  (-0.339893245923, 0.345788836243),
-                  (-0.34587014763, 0.345711844811),
-                  (-0.351843029679, 0.345633457923),
-                  (-0.357811811325, 0.345553670323),
-                  (-0.363776411237, 0.34547247646),
-                  (-0.369736747479, 0.345389870478),
-                  (-0.375692737494, 0.345305846213),
-                  (-0.381644298087, 0.345220397186),
-                  (-0.387591345408, 0.345133516597),
-                  (-0.393533794932, 0.345045197317),
-                  (-0.399471561446, 0.344955431888),
-                  (-0.405404559023, 0.344864212517),
-                  (-0.41133270101, 0.344771531067),
-                  (-0.411289516807, 0.347688648396),
-                  (-0.411245923109, 0.350604768367),
-                  (-0.411201919023, 0.353519881264),
-                  (-0.411157503638, 0.356433977331),
-                  (-0.411112676031, 0.359347046774),
-                  (-0.411067435263, 0.362259079758),
-                  (-0.411021780381, 0.365170066407),
-                  (-0.410975710419, 0.368079996805),
-                  (-0.410929224394, 0.370988860994),
-                  (-0.410882321309, 0.373896648973),
-                  (-0.410835000151, 0.376803350699),
-                  (-0.410787259893, 0.379708956086),
-                  (-0.410739099493, 0.382613455002),
-                  (-0.410690517893, 0.385516837272),
-                  (-0.410641514018, 0.388419092677),
-                  (-0.41059208678, 0.391320210951),
-                  (-0.410542235074, 0.39422018178),
-                  (-0.410491957779, 0.397118994808),
-                  (-0.410441253758, 0.400016639626),
-                  (-0.41039012186, 0.402913105781),
-                  (-0.410338560915, 0.405808382769),
-                  (-0.410286569738, 0.408702460038),
-                  (-0.410234147128, 0.411595326986),
-                  (-0.410181291867, 0.41448697296),
-                  (-0.410128002721, 0.417377387256),
-                  (-0.41007427844, 0.420266559118),
-                  (-0.410020117756, 0.423154477738),
-                  (-0.409965519385, 0.426041132254),
-                  (-0.409910482026, 0.428926511751),
-                  (-0.409855004361, 0.431810605261),
-                  (-0.409799085056, 0.434693401757),
-                  (-0.40974272276, 0.437574890159),
-                  (-0.40384065767, 0.437695260697),
-                  (-0.397933592176, 0.437813689385),
-                  (-0.392021618255, 0.437930187321),
-                  (-0.386104827063, 0.438044765213),
-                  (-0.380183308956, 0.438157433386),
-                  (-0.374257153494, 0.438268201782),
-                  (-0.368326449465, 0.43837707997),
-                  (-0.362391284891, 0.43848407715),
-                  (-0.356451747047, 0.438589202157),
-                  (-0.350507922474, 0.438692463469),
-                  (-0.344559896994, 0.438793869213),
-                  (-0.33860775572, 0.438893427174),
-                  (-0.332651583078, 0.438991144796),
-                  (-0.326691462813, 0.439087029198),
-                  (-0.320727478009, 0.439181087175),
-                  (-0.314759711101, 0.439273325208),
-                  (-0.308788243889, 0.439363749474),
-                  (-0.302813157552, 0.439452365851),
-                  (-0.296834532665, 0.439539179928),
-                  (-0.290852449208, 0.439624197015),
-                  (-0.284866986586, 0.43970742215),
-                  (-0.278878223636, 0.439788860107),
-                  (-0.27288623865, 0.439868515409),
-                  (-0.266891109379, 0.439946392331),
-                  (-0.260892913054, 0.440022494913),
-                  (-0.254891726399, 0.44009682697),
-                  (-0.248887625641, 0.440169392097),
-                  (-0.242880686527, 0.440240193683),
-                  (-0.236870984337, 0.440309234914),
-                  (-0.230858593897, 0.44037651879),
-                  (-0.224843589592, 0.440442048125),
-                  (-0.218826045381, 0.440505825563)]},
- 83: {'color': 'violet',
-      'polygon': [(-0.42333489152, 0.437174647383),
-                  (-0.423393188344, 0.434295243835),
-                  (-0.423451023688, 0.431414526664),
-                  (-0.423508398966, 0.428532507031),
-                  (-0.423565315575, 0.425649196039),
-                  (-0.423621774896, 0.422764604736),
-                  (-0.423677778292, 0.419878744113),
-                  (-0.42373332711, 0.416991625107),
-                  (-0.423788422681, 0.414103258601),
-                  (-0.423843066317, 0.411213655424),
-                  (-0.423897259316, 0.408322826352),
-                  (-0.423951002956, 0.40543078211),
-                  (-0.424004298503, 0.402537533369),
-                  (-0.424057147202, 0.399643090752),
-                  (-0.424109550285, 0.39674746483),
-                  (-0.424161508967, 0.393850666124),
-                  (-0.424213024445, 0.390952705108),
-                  (-0.424264097901, 0.388053592204),
-                  (-0.424314730503, 0.385153337789),
-                  (-0.4243649234, 0.382251952193),
-                  (-0.424414677727, 0.379349445697),
-                  (-0.424463994603, 0.376445828538),
-                  (-0.42451287513, 0.373541110906),
-                  (-0.424561320398, 0.370635302949),
-                  (-0.424609331477, 0.367728414767),
-                  (-0.424656909426, 0.364820456418),
-                  (-0.424704055286, 0.361911437917),
-                  (-0.424750770084, 0.359001369237),
-                  (-0.424797054832, 0.356090260307),
-                  (-0.424842910526, 0.353178121016),
-                  (-0.42488833815, 0.350264961213),
-                  (-0.424933338671, 0.347350790703),
-                  (-0.424977913043, 0.344435619255),
-                  (-0.430889418498, 0.344337624292),
-                  (-0.436795686965, 0.344238129139),
-                  (-0.44269662761, 0.344137123819),
-                  (-0.448592148746, 0.344034597999),
-                  (-0.454482157812, 0.343930540993),
-                  (-0.460366561351, 0.343824941757),
-                  (-0.466245264991, 0.343717788898),
-                  (-0.472118173422, 0.343609070669),
-                  (-0.477985190371, 0.343498774972),
-                  (-0.483846218588, 0.343386889364),
-                  (-0.489701159813, 0.343273401061),
-                  (-0.49554991476, 0.343158296938),
-                  (-0.501392383096, 0.343041563539),
-                  (-0.507228463408, 0.342923187083),
-                  (-0.513058053192, 0.342803153468),
-                  (-0.518881048818, 0.34268144828),
-                  (-0.524697345513, 0.342558056804),
-                  (-0.530506837336, 0.342432964033),
-                  (-0.536309417151, 0.342306154678),
-                  (-0.542104976605, 0.342177613177),
-                  (-0.5478934061, 0.342047323715),
-                  (-0.553674594774, 0.341915270231),
-                  (-0.559448430468, 0.341781436436),
-                  (-0.565214799708, 0.341645805827),
-                  (-0.570973587675, 0.341508361707),
-                  (-0.57672467818, 0.341369087202),
-                  (-0.582467953641, 0.341227965277),
-                  (-0.588203295053, 0.341084978764),
-                  (-0.593930581967, 0.340940110376),
-                  (-0.599649692459, 0.340793342735),
-                  (-0.605360503106, 0.340644658393),
-                  (-0.611062888962, 0.340494039863),
-                  (-0.610992428463, 0.343373159088),
-                  (-0.610921278467, 0.346251196584),
-                  (-0.610849437253, 0.349128141536),
-                  (-0.610776903088, 0.352003983072),
-                  (-0.610703674227, 0.354878710267),
-                  (-0.610629748913, 0.35775231214),
-                  (-0.610555125376, 0.360624777654),
-                  (-0.610479801835, 0.363496095717),
-                  (-0.610403776496, 0.366366255178),
-                  (-0.610327047555, 0.36923524483),
-                  (-0.610249613195, 0.372103053404),
-                  (-0.610171471588, 0.374969669575),
-                  (-0.610092620895, 0.377835081956),
-                  (-0.610013059265, 0.380699279101),
-                  (-0.609932784838, 0.383562249499),
-                  (-0.609851795742, 0.386423981581),
-                  (-0.609770090094, 0.38928446371),
-                  (-0.609687666002, 0.392143684191),
-                  (-0.609604521564, 0.395001631259),
-                  (-0.609520654865, 0.397858293088),
-                  (-0.609436063985, 0.400713657783),
-                  (-0.60935074699, 0.403567713384),
-                  (-0.60926470194, 0.406420447863),
-                  (-0.609177926884, 0.409271849124),
-                  (-0.609090419864, 0.412121905001),
-                  (-0.60900217891, 0.41497060326),
-                  (-0.608913202048, 0.417817931595),
-                  (-0.608823487292, 0.420663877629),
-                  (-0.608733032652, 0.423508428914),
-                  (-0.608641836126, 0.426351572928),
-                  (-0.608549895709, 0.429193297075),
-                  (-0.608457209386, 0.432033588687),
-                  (-0.602789203227, 0.432230485812),
-                  (-0.597112454275, 0.432424839698),
-                  (-0.591427089771, 0.432616672238),
-                  (-0.585733235785, 0.432806005258),
-                  (-0.580031017226, 0.432992860488),
-                  (-0.574320557842, 0.433177259537),
-                  (-0.568601980224, 0.433359223871),
-                  (-0.562875405815, 0.433538774783),
-                  (-0.557140954912, 0.433715933376),
-                  (-0.551398746675, 0.433890720543),
-                  (-0.545648899132, 0.434063156942),
-                  (-0.539891529189, 0.434233262983),
-                  (-0.534126752634, 0.434401058809),
-                  (-0.528354684147, 0.43456656428),
-                  (-0.52257543731, 0.434729798959),
-                  (-0.516789124615, 0.434890782096),
-                  (-0.510995857472, 0.435049532618),
-                  (-0.505195746221, 0.435206069117),
-                  (-0.499388900142, 0.435360409838),
-                  (-0.493575427462, 0.43551257267),
-                  (-0.487755435371, 0.43566257514),
-                  (-0.481929030031, 0.4358104344),
-                  (-0.476096316585, 0.435956167226),
-                  (-0.470257399172, 0.436099790008),
-                  (-0.464412380937, 0.436241318746),
-                  (-0.458561364044, 0.436380769049),
-                  (-0.452704449687, 0.436518156125),
-                  (-0.446841738104, 0.436653494785),
-                  (-0.44097332859, 0.436786799437),
-                  (-0.435099319509, 0.436918084087),
-                  (-0.429219808305, 0.437047362336),
-                  (-0.42333489152, 0.437174647383)]},
- 84: {'color': 'skyblue',
-      'polygon': [(0.586636865519, 0.526568915669),
-                  (0.586752552811, 0.523780019885),
-                  (0.586867438734, 0.520989263993),
-                  (0.58698152601, 0.518196662642),
-                  (0.587094817344, 0.515402230371),
-                  (0.587207315421, 0.512605981613),
-                  (0.587319022912, 0.509807930694),
-                  (0.587429942467, 0.507008091838),
-                  (0.58754007672, 0.504206479167),
-                  (0.587649428287, 0.501403106705),
-                  (0.587757999768, 0.498597988379),
-                  (0.587865793743, 0.495791138021),
-                  (0.587972812777, 0.492982569369),
-                  (0.588079059416, 0.490172296071),
-                  (0.588184536189, 0.487360331687),
-                  (0.588289245609, 0.484546689686),
-                  (0.588393190169, 0.481731383456),
-                  (0.588496372347, 0.478914426297),
-                  (0.588598794603, 0.476095831429),
-                  (0.588700459379, 0.473275611992),
-                  (0.588801369101, 0.470453781044),
-                  (0.588901526177, 0.467630351568),
-                  (0.589000932997, 0.464805336471),
-                  (0.589099591935, 0.461978748585),
-                  (0.589197505347, 0.45915060067),
-                  (0.589294675574, 0.456320905413),
-                  (0.589391104936, 0.453489675431),
-                  (0.589486795738, 0.450656923273),
-                  (0.589581750268, 0.447822661421),
-                  (0.589675970797, 0.44498690229),
-                  (0.589769459577, 0.442149658229),
-                  (0.589862218846, 0.439310941526),
-                  (0.589954250821, 0.436470764404),
-                  (0.584268942123, 0.436663847189),
-                  (0.578575235272, 0.436854397965),
-                  (0.572873247827, 0.43704243215),
-                  (0.567163096515, 0.437227965728),
-                  (0.561444897223, 0.43741101518),
-                  (0.555718764998, 0.437591597433),
-                  (0.549984814045, 0.437769729793),
-                  (0.544243157728, 0.437945429899),
-                  (0.538493908565, 0.438118715664),
-                  (0.532737178232, 0.438289605228),
-                  (0.52697307756, 0.43845811691),
-                  (0.52120171654, 0.438624269167),
-                  (0.515423204321, 0.438788080542),
-                  (0.509637649214, 0.438949569635),
-                  (0.503845158694, 0.439108755054),
-                  (0.498045839402, 0.439265655388),
-                  (0.49223979715, 0.439420289167),
-                  (0.486427136924, 0.43957267483),
-                  (0.480607962888, 0.439722830698),
-                  (0.47478237839, 0.439870774944),
-                  (0.468950485962, 0.440016525567),
-                  (0.463112387332, 0.440160100366),
-                  (0.457268183427, 0.440301516918),
-                  (0.451417974374, 0.440440792555),
-                  (0.445561859516, 0.440577944347),
-                  (0.439699937409, 0.440712989084),
-                  (0.433832305834, 0.440845943254),
-                  (0.427959061803, 0.440976823034),
-                  (0.422080301564, 0.441105644272),
-                  (0.416196120614, 0.441232422477),
-                  (0.410306613701, 0.441357172807),
-                  (0.404411874832, 0.441479910057),
-                  (0.404354683952, 0.444357796083),
-                  (0.404297045252, 0.447234333035),
-                  (0.404238957217, 0.450109510035),
-                  (0.404180418312, 0.452983316156),
-                  (0.404121426983, 0.455855740428),
-                  (0.404061981653, 0.458726771831),
-                  (0.404002080727, 0.4615963993),
-                  (0.403941722587, 0.464464611719),
-                  (0.403880905596, 0.467331397923),
-                  (0.403819628093, 0.470196746698),
-                  (0.4037578884, 0.473060646774),
-                  (0.403695684813, 0.475923086831),
-                  (0.403633015608, 0.478784055495),
-                  (0.403569879039, 0.481643541335),
-                  (0.403506273339, 0.484501532865),
-                  (0.403442196717, 0.48735801854),
-                  (0.40337764736, 0.490212986758),
-                  (0.403312623431, 0.493066425854),
-                  (0.403247123074, 0.495918324105),
-                  (0.403181144405, 0.498768669723),
-                  (0.40311468552, 0.501617450856),
-                  (0.403047744489, 0.504464655587),
-                  (0.402980319361, 0.507310271932),
-                  (0.402912408159, 0.510154287837),
-                  (0.402844008882, 0.51299669118),
-                  (0.402775119504, 0.515837469765),
-                  (0.402705737977, 0.518676611326),
-                  (0.402635862225, 0.52151410352),
-                  (0.402565490149, 0.524349933927),
-                  (0.402494619623, 0.52718409005),
-                  (0.402423248496, 0.530016559311),
-                  (0.402351374591, 0.53284732905),
-                  (0.408210990072, 0.532693705417),
-                  (0.414065135306, 0.532537536537),
-                  (0.419913711858, 0.532378804224),
-                  (0.42575662068, 0.532217489916),
-                  (0.431593762114, 0.532053574677),
-                  (0.437425035902, 0.531887039218),
-                  (0.443250341184, 0.531717863908),
-                  (0.449069576506, 0.531546028795),
-                  (0.454882639828, 0.531371513618),
-                  (0.460689428528, 0.531194297831),
-                  (0.46648983941, 0.531014360625),
-                  (0.472283768711, 0.530831680948),
-                  (0.478071112111, 0.53064623753),
-                  (0.483851764741, 0.53045800891),
-                  (0.489625621192, 0.530266973468),
-                  (0.495392575529, 0.530073109449),
-                  (0.501152521297, 0.529876394997),
-                  (0.506905351535, 0.529676808193),
-                  (0.512650958791, 0.529474327086),
-                  (0.518389235131, 0.529268929734),
-                  (0.524120072157, 0.529060594247),
-                  (0.52984336102, 0.528849298823),
-                  (0.535558992436, 0.528635021799),
-                  (0.5412668567, 0.528417741698),
-                  (0.54696684371, 0.528197437276),
-                  (0.552658842978, 0.527974087577),
-                  (0.558342743653, 0.527747671987),
-                  (0.564018434542, 0.527518170293),
-                  (0.569685804127, 0.527285562741),
-                  (0.575344740591, 0.527049830103),
-                  (0.580995131838, 0.526810953739),
-                  (0.586636865519, 0.526568915669)]},
- 85: {'color': 'skyblue',
-      'polygon': [(0.388786863883, 0.533062025058),
-                  (0.388857254678, 0.53022885777),
-                  (0.388927163697, 0.527394000537),
-                  (0.38899659304, 0.524557465905),
-                  (0.389065544779, 0.521719266342),
-                  (0.389134020961, 0.518879414233),
-                  (0.38920202361, 0.516037921891),
-                  (0.389269554722, 0.513194801552),
-                  (0.389336616269, 0.510350065379),
-                  (0.389403210201, 0.507503725461),
-                  (0.38946933844, 0.504655793821),
-                  (0.389535002888, 0.501806282411),
-                  (0.389600205419, 0.498955203115),
-                  (0.389664947888, 0.496102567753),
-                  (0.389729232122, 0.49324838808),
-                  (0.389793059929, 0.490392675788),
-                  (0.389856433092, 0.487535442508),
-                  (0.389919353371, 0.484676699811),
-                  (0.389981822505, 0.481816459208),
-                  (0.390043842209, 0.478954732153),
-                  (0.390105414177, 0.476091530044),
-                  (0.390166540082, 0.473226864223),
-                  (0.390227221573, 0.470360745979),
-                  (0.39028746028, 0.467493186546),
-                  (0.390347257809, 0.464624197109),
-                  (0.390406615748, 0.461753788799),
-                  (0.390465535661, 0.458881972699),
-                  (0.390524019095, 0.456008759844),
-                  (0.390582067571, 0.453134161219),
-                  (0.390639682596, 0.450258187764),
-                  (0.390696865652, 0.447380850372),
-                  (0.390753618203, 0.444502159891),
-                  (0.390809941692, 0.441622127127),
-                  (0.384898581399, 0.441735510634),
-                  (0.378982384061, 0.441846939513),
-                  (0.373061439918, 0.441956426564),
-                  (0.36713583852, 0.442063984187),
-                  (0.361205668746, 0.44216962438),
-                  (0.355271018803, 0.44227335874),
-                  (0.349331976242, 0.442375198463),
-                  (0.343388627965, 0.44247515434),
-                  (0.337441060237, 0.442573236762),
-                  (0.331489358691, 0.442669455719),
-                  (0.325533608343, 0.442763820807),
-                  (0.319573893598, 0.442856341225),
-                  (0.313610298261, 0.442947025783),
-                  (0.307642905549, 0.443035882907),
-                  (0.301671798098, 0.44312292064),
-                  (0.295697057975, 0.443208146649),
-                  (0.289718766689, 0.443291568235),
-                  (0.283737005199, 0.443373192332),
-                  (0.277751853923, 0.443453025519),
-                  (0.271763392755, 0.443531074027),
-                  (0.265771701067, 0.443607343742),
-                  (0.259776857725, 0.443681840219),
-                  (0.253778941098, 0.443754568685),
-                  (0.247778029067, 0.443825534051),
-                  (0.241774199037, 0.443894740918),
-                  (0.235767527948, 0.443962193587),
-                  (0.229758092283, 0.444027896068),
-                  (0.223745968081, 0.444091852087),
-                  (0.217731230945, 0.444154065101),
-                  (0.211713956057, 0.4442145383),
-                  (0.205694218182, 0.444273274623),
-                  (0.199672091685, 0.444330276761),
-                  (0.199643866325, 0.447230922243),
-                  (0.199615438155, 0.450130282012),
-                  (0.199586806538, 0.453028345951),
-                  (0.199557970822, 0.455925103904),
-                  (0.199528930346, 0.458820545678),
-                  (0.199499684434, 0.461714661043),
-                  (0.199470232398, 0.464607439731),
-                  (0.199440573539, 0.467498871432),
-                  (0.199410707142, 0.4703889458),
-                  (0.199380632482, 0.473277652444),
-                  (0.199350348818, 0.476164980933),
-                  (0.199319855397, 0.479050920795),
-                  (0.199289151453, 0.48193546151),
-                  (0.199258236204, 0.484818592519),
-                  (0.199227108857, 0.487700303212),
-                  (0.199195768603, 0.490580582938),
-                  (0.19916421462, 0.493459420994),
-                  (0.19913244607, 0.496336806631),
-                  (0.199100462101, 0.49921272905),
-                  (0.199068261847, 0.502087177401),
-                  (0.199035844427, 0.504960140783),
-                  (0.199003208944, 0.507831608242),
-                  (0.198970354485, 0.51070156877),
-                  (0.198937280124, 0.513570011303),
-                  (0.198903984916, 0.516436924722),
-                  (0.198870467904, 0.519302297849),
-                  (0.19883672811, 0.522166119446),
-                  (0.198802764544, 0.525028378218),
-                  (0.198768576197, 0.527889062806),
-                  (0.198734162043, 0.530748161788),
-                  (0.198699521041, 0.533605663676),
-                  (0.19866465213, 0.53646155692),
-                  (0.204656875055, 0.536390114025),
-                  (0.210646636298, 0.536316497074),
-                  (0.21663385749, 0.536240701529),
-                  (0.222618459769, 0.536162722553),
-                  (0.228600363772, 0.536082554999),
-                  (0.234579489629, 0.536000193399),
-                  (0.240555756949, 0.535915631959),
-                  (0.246529084818, 0.535828864543),
-                  (0.252499391789, 0.535739884673),
-                  (0.258466595874, 0.535648685514),
-                  (0.264430614535, 0.535555259867),
-                  (0.270391364681, 0.535459600164),
-                  (0.276348762661, 0.535361698454),
-                  (0.282302724252, 0.535261546402),
-                  (0.288253164661, 0.535159135277),
-                  (0.294199998512, 0.535054455949),
-                  (0.300143139847, 0.534947498877),
-                  (0.306082502115, 0.534838254111),
-                  (0.312017998171, 0.534726711278),
-                  (0.317949540269, 0.534612859583),
-                  (0.323877040062, 0.534496687803),
-                  (0.329800408593, 0.53437818428),
-                  (0.335719556294, 0.534257336924),
-                  (0.341634392985, 0.534134133202),
-                  (0.347544827866, 0.534008560145),
-                  (0.35345076952, 0.533880604339),
-                  (0.359352125909, 0.53375025193),
-                  (0.365248804371, 0.533617488619),
-                  (0.371140711621, 0.533482299671),
-                  (0.37702775375, 0.533344669908),
-                  (0.382909836224, 0.533204583719),
-                  (0.388786863883, 0.533062025058)]},
- 86: {'color': 'skyblue',
-      'polygon': [(0.184719734692, 0.536624154424),
-                  (0.184753181149, 0.53376720865),
-                  (0.184786416646, 0.530908657806),
-                  (0.184819442163, 0.528048513406),
-                  (0.18485225867, 0.525186786898),
-                  (0.184884867117, 0.522323489664),
-                  (0.184917268438, 0.519458633027),
-                  (0.184949463554, 0.516592228246),
-                  (0.184981453367, 0.513724286521),
-                  (0.185013238768, 0.510854818994),
-                  (0.185044820628, 0.507983836749),
-                  (0.185076199808, 0.505111350813),
-                  (0.185107377151, 0.502237372161),
-                  (0.185138353487, 0.499361911713),
-                  (0.185169129631, 0.496484980335),
-                  (0.185199706385, 0.493606588845),
-                  (0.185230084535, 0.490726748008),
-                  (0.185260264855, 0.487845468541),
-                  (0.185290248106, 0.484962761114),
-                  (0.185320035034, 0.482078636346),
-                  (0.185349626372, 0.479193104816),
-                  (0.185379022841, 0.476306177052),
-                  (0.185408225148, 0.473417863542),
-                  (0.185437233988, 0.470528174729),
-                  (0.185466050043, 0.467637121013),
-                  (0.185494673982, 0.464744712754),
-                  (0.185523106462, 0.461850960271),
-                  (0.18555134813, 0.458955873842),
-                  (0.185579399618, 0.456059463707),
-                  (0.185607261547, 0.453161740068),
-                  (0.185634934527, 0.450262713087),
-                  (0.185662419156, 0.447362392893),
-                  (0.18568971602, 0.444460789577),
-                  (0.179660206042, 0.444510059303),
-                  (0.173628623214, 0.444557603367),
-                  (0.167595039938, 0.444603423348),
-                  (0.161559528277, 0.444647520644),
-                  (0.155522159969, 0.444689896474),
-                  (0.149483006435, 0.444730551895),
-                  (0.143442138793, 0.444769487805),
-                  (0.137399627866, 0.444806704957),
-                  (0.131355544194, 0.444842203962),
-                  (0.125309958043, 0.444875985303),
-                  (0.119262939415, 0.444908049342),
-                  (0.113214558063, 0.444938396326),
-                  (0.107164883497, 0.444967026398),
-                  (0.101113984995, 0.444993939603),
-                  (0.0950619316171, 0.445019135896),
-                  (0.0890087922118, 0.44504261515),
-                  (0.082954635429, 0.445064377162),
-                  (0.0768995297302, 0.445084421662),
-                  (0.0708435433987, 0.445102748316),
-                  (0.0647867445506, 0.445119356734),
-                  (0.0587292011454, 0.445134246478),
-                  (0.0526709809965, 0.445147417064),
-                  (0.0466121517817, 0.445158867971),
-                  (0.0405527810544, 0.445168598642),
-                  (0.034492936254, 0.445176608491),
-                  (0.0284326847165, 0.445182896908),
-                  (0.0223720936855, 0.445187463262),
-                  (0.0163112303228, 0.445190306904),
-                  (0.0102501617194, 0.445191427171),
-                  (0.00418895490606, 0.445190823389),
-                  (-0.00187232313556, 0.445188494876),
-                  (-0.00793360546206, 0.445184440943),
-                  (-0.00793473861111, 0.448092265208),
-                  (-0.0079358671735, 0.450998822248),
-                  (-0.00793699117813, 0.453904102077),
-                  (-0.00793811065407, 0.45680809467),
-                  (-0.00793922563062, 0.459710789967),
-                  (-0.00794033613718, 0.462612177869),
-                  (-0.00794144220345, 0.465512248236),
-                  (-0.00794254385926, 0.468410990892),
-                  (-0.00794364113474, 0.471308395617),
-                  (-0.00794473406029, 0.474204452151),
-                  (-0.00794582266656, 0.477099150193),
-                  (-0.00794690698453, 0.479992479398),
-                  (-0.00794798704555, 0.482884429377),
-                  (-0.00794906288135, 0.485774989699),
-                  (-0.00795013452409, 0.488664149885),
-                  (-0.00795120200635, 0.491551899412),
-                  (-0.00795226536127, 0.494438227709),
-                  (-0.00795332462249, 0.497323124157),
-                  (-0.00795437982433, 0.500206578088),
-                  (-0.00795543100173, 0.503088578786),
-                  (-0.00795647819035, 0.505969115482),
-                  (-0.00795752142665, 0.508848177356),
-                  (-0.00795856074791, 0.511725753537),
-                  (-0.00795959619242, 0.514601833097),
-                  (-0.00796062779941, 0.517476405056),
-                  (-0.00796165560914, 0.520349458376),
-                  (-0.00796267966317, 0.523220981964),
-                  (-0.00796370000421, 0.526090964666),
-                  (-0.00796471667638, 0.52895939527),
-                  (-0.00796572972527, 0.531826262504),
-                  (-0.00796673919797, 0.534691555034),
-                  (-0.00796774514328, 0.537555261461),
-                  (-0.00193562050313, 0.537559250331),
-                  (0.00409651164145, 0.537561102927),
-                  (0.0101285830022, 0.537560820015),
-                  (0.0161605252161, 0.537558402299),
-                  (0.022192269831, 0.53755385042),
-                  (0.0282237482911, 0.537547164957),
-                  (0.0342548919221, 0.537538346416),
-                  (0.0402856319175, 0.537527395234),
-                  (0.046315899324, 0.537514311773),
-                  (0.0523456250273, 0.537499096313),
-                  (0.0583747397386, 0.537481749051),
-                  (0.0644031739806, 0.537462270095),
-                  (0.0704308580737, 0.53744065946),
-                  (0.0764577221226, 0.53741691706),
-                  (0.082483696003, 0.537391042702),
-                  (0.088508709348, 0.537363036085),
-                  (0.0945326915355, 0.537332896788),
-                  (0.100555571675, 0.537300624265),
-                  (0.106577278595, 0.537266217841),
-                  (0.112597740829, 0.537229676699),
-                  (0.118616886606, 0.537190999878),
-                  (0.124634643836, 0.537150186263),
-                  (0.130650940098, 0.537107234575),
-                  (0.136665702628, 0.537062143369),
-                  (0.142678858308, 0.537014911017),
-                  (0.148690333655, 0.536965535706),
-                  (0.154700054807, 0.53691401543),
-                  (0.160707947514, 0.536860347974),
-                  (0.166713937128, 0.536804530911),
-                  (0.172717948588, 0.536746561593),
-                  (0.178719906413, 0.536686437138),
-                  (0.184719734692, 0.536624154424)]},
- 87: {'color': 'skyblue',
-      'polygon': [(-0.0217183624071, 0.537640544373),
-                  (-0.0217180856589, 0.534776947059),
-                  (-0.0217177900023, 0.531911762659),
-                  (-0.0217174754577, 0.529045002594),
-                  (-0.0217171420463, 0.526176678221),
-                  (-0.0217167897895, 0.523306800833),
-                  (-0.0217164187089, 0.520435381664),
-                  (-0.0217160288269, 0.517562431889),
-                  (-0.0217156201656, 0.514687962622),
-                  (-0.0217151927474, 0.511811984922),
-                  (-0.0217147465948, 0.50893450979),
-                  (-0.0217142817301, 0.506055548172),
-                  (-0.0217137981755, 0.503175110961),
-                  (-0.0217132959531, 0.500293208996),
-                  (-0.0217127750849, 0.497409853064),
-                  (-0.0217122355922, 0.494525053901),
-                  (-0.0217116774964, 0.491638822193),
-                  (-0.0217111008183, 0.488751168577),
-                  (-0.0217105055783, 0.485862103642),
-                  (-0.0217098917962, 0.482971637928),
-                  (-0.0217092594917, 0.480079781931),
-                  (-0.0217086086834, 0.4771865461),
-                  (-0.0217079393899, 0.474291940839),
-                  (-0.0217072516288, 0.471395976509),
-                  (-0.0217065454173, 0.468498663428),
-                  (-0.021705820772, 0.465600011869),
-                  (-0.0217050777085, 0.462700032068),
-                  (-0.0217043162423, 0.459798734216),
-                  (-0.0217035363878, 0.456896128467),
-                  (-0.0217027381589, 0.453992224933),
-                  (-0.0217019215688, 0.451087033688),
-                  (-0.02170108663, 0.448180564769),
-                  (-0.0217002333542, 0.445272828176),
-                  (-0.0277610338935, 0.445259971697),
-                  (-0.0338215547091, 0.445245386488),
-                  (-0.0398817288787, 0.44522907189),
-                  (-0.0459414894491, 0.445211027242),
-                  (-0.0520007694248, 0.445191251881),
-                  (-0.058059501757, 0.445169745143),
-                  (-0.0641176193324, 0.445146506361),
-                  (-0.0701750549612, 0.445121534864),
-                  (-0.0762317413664, 0.445094829973),
-                  (-0.0822876111719, 0.445066391001),
-                  (-0.0883425968908, 0.44503621725),
-                  (-0.0943966309143, 0.445004308007),
-                  (-0.1004496455, 0.444970662543),
-                  (-0.106501572758, 0.444935280107),
-                  (-0.112552344644, 0.444898159923),
-                  (-0.118601892942, 0.444859301186),
-                  (-0.124650149256, 0.444818703056),
-                  (-0.130697044996, 0.444776364656),
-                  (-0.136742511367, 0.444732285065),
-                  (-0.142786479356, 0.444686463312),
-                  (-0.148828879721, 0.444638898371),
-                  (-0.154869642977, 0.444589589155),
-                  (-0.160908699386, 0.444538534509),
-                  (-0.166945978941, 0.444485733206),
-                  (-0.172981411356, 0.444431183936),
-                  (-0.179014926056, 0.444374885302),
-                  (-0.185046452157, 0.444316835812),
-                  (-0.19107591846, 0.444257033872),
-                  (-0.197103253434, 0.444195477776),
-                  (-0.203128385206, 0.444132165702),
-                  (-0.209151241547, 0.444067095699),
-                  (-0.215171749858, 0.444000265686),
-                  (-0.215146044431, 0.446900605764),
-                  (-0.215120125636, 0.449799660247),
-                  (-0.215093992877, 0.452697418728),
-                  (-0.215067645545, 0.455593870755),
-                  (-0.215041083021, 0.458489005829),
-                  (-0.215014304671, 0.461382813406),
-                  (-0.214987309853, 0.464275282891),
-                  (-0.21496009791, 0.467166403642),
-                  (-0.214932668173, 0.47005616497),
-                  (-0.214905019964, 0.472944556134),
-                  (-0.214877152589, 0.475831566341),
-                  (-0.214849065344, 0.478717184749),
-                  (-0.214820757512, 0.481601400463),
-                  (-0.214792228363, 0.484484202536),
-                  (-0.214763477154, 0.487365579964),
-                  (-0.214734503132, 0.490245521692),
-                  (-0.214705305529, 0.493124016608),
-                  (-0.214675883565, 0.496001053542),
-                  (-0.214646236449, 0.49887662127),
-                  (-0.214616363373, 0.501750708508),
-                  (-0.214586263522, 0.504623303911),
-                  (-0.214555936063, 0.507494396078),
-                  (-0.214525380154, 0.510363973543),
-                  (-0.214494594937, 0.513232024782),
-                  (-0.214463579545, 0.516098538204),
-                  (-0.214432333094, 0.518963502157),
-                  (-0.214400854691, 0.521826904923),
-                  (-0.214369143427, 0.524688734716),
-                  (-0.214337198383, 0.527548979686),
-                  (-0.214305018625, 0.530407627913),
-                  (-0.214272603207, 0.533264667408),
-                  (-0.214239951171, 0.536120086111),
-                  (-0.208249841092, 0.536201335407),
-                  (-0.202257317323, 0.536280379049),
-                  (-0.19626245498, 0.536357221029),
-                  (-0.190265328718, 0.53643186515),
-                  (-0.184266012745, 0.536504315037),
-                  (-0.178264580835, 0.536574574137),
-                  (-0.172261106348, 0.536642645735),
-                  (-0.166255662245, 0.536708532958),
-                  (-0.160248321099, 0.536772238785),
-                  (-0.15423915512, 0.536833766052),
-                  (-0.148228236162, 0.53689311746),
-                  (-0.142215635744, 0.536950295582),
-                  (-0.136201425064, 0.537005302871),
-                  (-0.130185675017, 0.537058141664),
-                  (-0.124168456208, 0.537108814191),
-                  (-0.118149838972, 0.537157322577),
-                  (-0.112129893386, 0.537203668852),
-                  (-0.106108689288, 0.537247854953),
-                  (-0.100086296291, 0.53728988273),
-                  (-0.0940627838003, 0.537329753952),
-                  (-0.0880382210299, 0.537367470307),
-                  (-0.0820126770164, 0.537403033412),
-                  (-0.0759862206367, 0.537436444812),
-                  (-0.0699589206231, 0.537467705986),
-                  (-0.0639308455796, 0.537496818346),
-                  (-0.057902063997, 0.537523783245),
-                  (-0.0518726442692, 0.537548601976),
-                  (-0.0458426547087, 0.537571275773),
-                  (-0.039812163562, 0.537591805814),
-                  (-0.0337812390252, 0.537610193224),
-                  (-0.0277499492597, 0.537626439072),
-                  (-0.0217183624071, 0.537640544373)]},
- 88: {'color': 'skyblue',
-      'polygon': [(-0.228158221348, 0.535984219634),
-                  (-0.228193721139, 0.533129991392),
-                  (-0.228228967386, 0.530274137716),
-                  (-0.228263961119, 0.527416670739),
-                  (-0.228298703353, 0.524557602522),
-                  (-0.22833319509, 0.521696945056),
-                  (-0.228367437321, 0.518834710264),
-                  (-0.22840143102, 0.51597091),
-                  (-0.228435177149, 0.513105556051),
-                  (-0.228468676657, 0.510238660138),
-                  (-0.228501930479, 0.507370233918),
-                  (-0.228534939537, 0.504500288984),
-                  (-0.228567704738, 0.501628836866),
-                  (-0.228600226978, 0.498755889031),
-                  (-0.228632507137, 0.495881456886),
-                  (-0.228664546082, 0.493005551779),
-                  (-0.228696344669, 0.490128184997),
-                  (-0.228727903738, 0.487249367771),
-                  (-0.228759224117, 0.484369111273),
-                  (-0.22879030662, 0.481487426619),
-                  (-0.228821152048, 0.47860432487),
-                  (-0.228851761188, 0.475719817032),
-                  (-0.228882134816, 0.472833914057),
-                  (-0.228912273694, 0.469946626845),
-                  (-0.228942178569, 0.467057966241),
-                  (-0.228971850178, 0.464167943042),
-                  (-0.229001289244, 0.461276567992),
-                  (-0.229030496477, 0.458383851785),
-                  (-0.229059472574, 0.455489805066),
-                  (-0.22908821822, 0.452594438433),
-                  (-0.229116734088, 0.449697762434),
-                  (-0.229145020837, 0.446799787572),
-                  (-0.229173079116, 0.4439005243),
-                  (-0.235185221537, 0.443828559446),
-                  (-0.241194696716, 0.443754823264),
-                  (-0.247201429861, 0.443679312799),
-                  (-0.253205345724, 0.443602024905),
-                  (-0.259206368592, 0.443522956238),
-                  (-0.265204422268, 0.443442103247),
-                  (-0.271199430065, 0.443359462164),
-                  (-0.277191314782, 0.443275028995),
-                  (-0.2831799987, 0.443188799511),
-                  (-0.289165403562, 0.443100769241),
-                  (-0.29514745056, 0.44301093346),
-                  (-0.301126060324, 0.44291928718),
-                  (-0.307101152905, 0.442825825144),
-                  (-0.313072647763, 0.442730541815),
-                  (-0.319040463749, 0.442633431369),
-                  (-0.325004519098, 0.442534487684),
-                  (-0.330964731407, 0.442433704334),
-                  (-0.336921017628, 0.442331074581),
-                  (-0.342873294047, 0.442226591364),
-                  (-0.348821476277, 0.442120247294),
-                  (-0.354765479238, 0.442012034646),
-                  (-0.360705217145, 0.441901945353),
-                  (-0.366640603496, 0.441789970996),
-                  (-0.372571551054, 0.441676102798),
-                  (-0.378497971837, 0.441560331621),
-                  (-0.384419777099, 0.441442647956),
-                  (-0.390336877322, 0.441323041921),
-                  (-0.396249182198, 0.441201503251),
-                  (-0.402156600615, 0.4410780213),
-                  (-0.408059040647, 0.440952585029),
-                  (-0.413956409537, 0.440825183009),
-                  (-0.419848613682, 0.440695803414),
-                  (-0.41979187651, 0.44357278381),
-                  (-0.419734677278, 0.446448415439),
-                  (-0.419677014508, 0.449322686914),
-                  (-0.419618886703, 0.452195586787),
-                  (-0.419560292349, 0.455067103547),
-                  (-0.419501229915, 0.457937225624),
-                  (-0.419441697854, 0.460805941384),
-                  (-0.4193816946, 0.46367323913),
-                  (-0.41932121857, 0.4665391071),
-                  (-0.419260268164, 0.469403533468),
-                  (-0.419198841764, 0.472266506342),
-                  (-0.419136937737, 0.475128013762),
-                  (-0.419074554429, 0.477988043704),
-                  (-0.419011690172, 0.480846584071),
-                  (-0.41894834328, 0.483703622702),
-                  (-0.418884512048, 0.486559147361),
-                  (-0.418820194757, 0.489413145746),
-                  (-0.418755389668, 0.492265605481),
-                  (-0.418690095027, 0.495116514117),
-                  (-0.418624309062, 0.497965859131),
-                  (-0.418558029985, 0.500813627929),
-                  (-0.418491255989, 0.503659807839),
-                  (-0.418423985255, 0.506504386113),
-                  (-0.418356215942, 0.509347349926),
-                  (-0.418287946196, 0.512188686376),
-                  (-0.418219174145, 0.51502838248),
-                  (-0.418149897903, 0.517866425177),
-                  (-0.418080115565, 0.520702801323),
-                  (-0.418009825211, 0.523537497694),
-                  (-0.417939024907, 0.52637050098),
-                  (-0.417867712702, 0.52920179779),
-                  (-0.417795886628, 0.532031374646),
-                  (-0.411938614518, 0.532192060719),
-                  (-0.406075965047, 0.532350222815),
-                  (-0.400208037393, 0.532505876697),
-                  (-0.394334929864, 0.532659037671),
-                  (-0.388456739903, 0.532809720587),
-                  (-0.382573564096, 0.532957939846),
-                  (-0.376685498176, 0.533103709402),
-                  (-0.370792637032, 0.533247042768),
-                  (-0.364895074716, 0.533387953021),
-                  (-0.358992904453, 0.533526452806),
-                  (-0.353086218648, 0.533662554347),
-                  (-0.347175108894, 0.533796269447),
-                  (-0.341259665986, 0.533927609498),
-                  (-0.335339979928, 0.534056585489),
-                  (-0.32941613994, 0.534183208013),
-                  (-0.323488234478, 0.534307487273),
-                  (-0.317556351235, 0.53442943309),
-                  (-0.311620577159, 0.534549054914),
-                  (-0.305680998462, 0.534666361829),
-                  (-0.299737700634, 0.534781362564),
-                  (-0.293790768452, 0.5348940655),
-                  (-0.287840285997, 0.53500447868),
-                  (-0.281886336664, 0.535112609817),
-                  (-0.275929003174, 0.535218466305),
-                  (-0.269968367593, 0.535322055226),
-                  (-0.264004511337, 0.53542338336),
-                  (-0.258037515196, 0.535522457195),
-                  (-0.252067459338, 0.535619282934),
-                  (-0.246094423332, 0.535713866509),
-                  (-0.240118486155, 0.535806213584),
-                  (-0.234139726212, 0.535896329571),
-                  (-0.228158221348, 0.535984219634)]},
- 89: {'color': 'skyblue',
-      'polygon': [(-0.431263406152, 0.531672488742),
-                  (-0.431338838535, 0.528845352616),
-                  (-0.431413736726, 0.52601648714),
-                  (-0.431488102741, 0.523185905914),
-                  (-0.431561938582, 0.520353622453),
-                  (-0.431635246233, 0.517519650185),
-                  (-0.431708027664, 0.514684002454),
-                  (-0.431780284831, 0.51184669252),
-                  (-0.431852019672, 0.509007733563),
-                  (-0.431923234112, 0.50616713868),
-                  (-0.431993930057, 0.503324920888),
-                  (-0.432064109401, 0.500481093125),
-                  (-0.432133774017, 0.497635668251),
-                  (-0.432202925767, 0.494788659048),
-                  (-0.432271566491, 0.49194007822),
-                  (-0.432339698018, 0.4890899384),
-                  (-0.432407322158, 0.486238252142),
-                  (-0.432474440702, 0.483385031927),
-                  (-0.432541055429, 0.480530290166),
-                  (-0.432607168098, 0.477674039194),
-                  (-0.432672780452, 0.474816291279),
-                  (-0.432737894218, 0.471957058614),
-                  (-0.432802511103, 0.469096353328),
-                  (-0.432866632801, 0.466234187477),
-                  (-0.432930260986, 0.463370573052),
-                  (-0.432993397316, 0.460505521975),
-                  (-0.433056043433, 0.457639046102),
-                  (-0.433118200961, 0.454771157227),
-                  (-0.433179871504, 0.451901867074),
-                  (-0.433241056654, 0.449031187308),
-                  (-0.433301757983, 0.446159129529),
-                  (-0.433361977046, 0.443285705273),
-                  (-0.433421715381, 0.440410926017),
-                  (-0.439296122455, 0.440276447004),
-                  (-0.445164950572, 0.4401399337),
-                  (-0.451028101416, 0.440001372114),
-                  (-0.456885475747, 0.439860747849),
-                  (-0.462736973385, 0.439718046106),
-                  (-0.468582493195, 0.439573251684),
-                  (-0.474421933082, 0.439426348981),
-                  (-0.480255189972, 0.439277322),
-                  (-0.486082159805, 0.439126154351),
-                  (-0.491902737519, 0.438972829257),
-                  (-0.497716817045, 0.438817329559),
-                  (-0.503524291289, 0.438659637723),
-                  (-0.509325052127, 0.438499735846),
-                  (-0.515118990391, 0.438337605668),
-                  (-0.520905995861, 0.438173228578),
-                  (-0.526685957256, 0.438006585622),
-                  (-0.532458762221, 0.437837657523),
-                  (-0.538224297323, 0.437666424684),
-                  (-0.543982448037, 0.437492867206),
-                  (-0.549733098744, 0.437316964902),
-                  (-0.555476132719, 0.437138697315),
-                  (-0.561211432123, 0.436958043727),
-                  (-0.566938878001, 0.436774983188),
-                  (-0.572658350271, 0.436589494526),
-                  (-0.578369727723, 0.436401556371),
-                  (-0.584072888007, 0.43621114718),
-                  (-0.589767707636, 0.436018245253),
-                  (-0.595454061977, 0.435822828765),
-                  (-0.601131825248, 0.435624875784),
-                  (-0.60680087052, 0.435424364306),
-                  (-0.612461069707, 0.435221272277),
-                  (-0.61811229357, 0.435015577629),
-                  (-0.618017021668, 0.437849984707),
-                  (-0.617920980498, 0.440682908784),
-                  (-0.61782416802, 0.443514336759),
-                  (-0.617726582191, 0.446344255451),
-                  (-0.617628220961, 0.449172651599),
-                  (-0.61752908228, 0.451999511861),
-                  (-0.617429164093, 0.454824822812),
-                  (-0.617328464343, 0.457648570946),
-                  (-0.617226980974, 0.460470742672),
-                  (-0.617124711924, 0.463291324314),
-                  (-0.617021655133, 0.466110302112),
-                  (-0.616917808538, 0.46892766222),
-                  (-0.616813170079, 0.471743390703),
-                  (-0.616707737692, 0.474557473541),
-                  (-0.616601509318, 0.477369896623),
-                  (-0.616494482897, 0.48018064575),
-                  (-0.61638665637, 0.482989706632),
-                  (-0.616278027682, 0.485797064887),
-                  (-0.616168594779, 0.488602706042),
-                  (-0.616058355613, 0.49140661553),
-                  (-0.615947308137, 0.494208778691),
-                  (-0.615835450309, 0.49700918077),
-                  (-0.615722780093, 0.499807806916),
-                  (-0.615609295458, 0.502604642182),
-                  (-0.61549499438, 0.505399671521),
-                  (-0.61537987484, 0.508192879791),
-                  (-0.615263934828, 0.510984251748),
-                  (-0.61514717234, 0.513773772051),
-                  (-0.615029585384, 0.516561425253),
-                  (-0.614911171974, 0.519347195808),
-                  (-0.614791930137, 0.522131068066),
-                  (-0.614671857908, 0.524913026274),
-                  (-0.609065609047, 0.525171605824),
-                  (-0.603450058654, 0.525426866781),
-                  (-0.597825333692, 0.525678836944),
-                  (-0.592191560557, 0.52592754406),
-                  (-0.586548865059, 0.526173015796),
-                  (-0.58089737239, 0.526415279707),
-                  (-0.575237207098, 0.526654363207),
-                  (-0.569568493068, 0.526890293541),
-                  (-0.563891353494, 0.527123097759),
-                  (-0.558205910861, 0.527352802693),
-                  (-0.552512286925, 0.527579434932),
-                  (-0.546810602693, 0.5278030208),
-                  (-0.541100978408, 0.528023586336),
-                  (-0.53538353353, 0.528241157276),
-                  (-0.529658386726, 0.528455759034),
-                  (-0.523925655849, 0.528667416683),
-                  (-0.518185457933, 0.528876154944),
-                  (-0.512437909178, 0.529081998167),
-                  (-0.506683124938, 0.529284970321),
-                  (-0.500921219716, 0.529485094981),
-                  (-0.495152307154, 0.529682395315),
-                  (-0.489376500022, 0.529876894078),
-                  (-0.483593910218, 0.530068613598),
-                  (-0.477804648759, 0.530257575772),
-                  (-0.472008825775, 0.530443802057),
-                  (-0.466206550511, 0.530627313464),
-                  (-0.460397931317, 0.530808130552),
-                  (-0.454583075653, 0.530986273426),
-                  (-0.448762090082, 0.531161761731),
-                  (-0.442935080274, 0.53133461465),
-                  (-0.437102151003, 0.531504850903),
-                  (-0.431263406152, 0.531672488742)]},
- 90: {'color': 'skyblue',
-      'polygon': [(0.582166589131, 0.617998019561),
-                  (0.582312378751, 0.615279928498),
-                  (0.582457267641, 0.612559411619),
-                  (0.582601259145, 0.609836488889),
-                  (0.582744356585, 0.607111180054),
-                  (0.582886563261, 0.604383504642),
-                  (0.583027882454, 0.601653481972),
-                  (0.583168317425, 0.598921131157),
-                  (0.583307871413, 0.596186471105),
-                  (0.583446547638, 0.593449520528),
-                  (0.5835843493, 0.590710297941),
-                  (0.58372127958, 0.587968821671),
-                  (0.583857341636, 0.585225109857),
-                  (0.583992538611, 0.582479180457),
-                  (0.584126873624, 0.579731051248),
-                  (0.584260349779, 0.576980739835),
-                  (0.584392970157, 0.574228263649),
-                  (0.584524737822, 0.571473639955),
-                  (0.58465565582, 0.568716885851),
-                  (0.584785727175, 0.565958018277),
-                  (0.584914954894, 0.563197054014),
-                  (0.585043341965, 0.560434009688),
-                  (0.585170891359, 0.557668901776),
-                  (0.585297606025, 0.554901746605),
-                  (0.585423488897, 0.552132560359),
-                  (0.585548542888, 0.549361359078),
-                  (0.585672770895, 0.546588158664),
-                  (0.585796175794, 0.543812974884),
-                  (0.585918760445, 0.541035823372),
-                  (0.58604052769, 0.53825671963),
-                  (0.586161480351, 0.535475679033),
-                  (0.586281621234, 0.532692716831),
-                  (0.586400953125, 0.529907848154),
-                  (0.580761048499, 0.53014786149),
-                  (0.57511247475, 0.530384683931),
-                  (0.569455343968, 0.53061833365),
-                  (0.563789768013, 0.530848829482),
-                  (0.558115858493, 0.531076190856),
-                  (0.552433726742, 0.531300437723),
-                  (0.546743483794, 0.531521590501),
-                  (0.541045240362, 0.531739670006),
-                  (0.535339106816, 0.5319546974),
-                  (0.529625193166, 0.532166694132),
-                  (0.52390360904, 0.532375681888),
-                  (0.518174463666, 0.532581682539),
-                  (0.512437865856, 0.532784718095),
-                  (0.506693923989, 0.532984810656),
-                  (0.500942745994, 0.533181982374),
-                  (0.495184439335, 0.533376255409),
-                  (0.489419111002, 0.533567651892),
-                  (0.483646867488, 0.533756193888),
-                  (0.477867814786, 0.533941903362),
-                  (0.472082058372, 0.534124802145),
-                  (0.466289703195, 0.534304911906),
-                  (0.460490853666, 0.534482254125),
-                  (0.454685613649, 0.53465685006),
-                  (0.448874086453, 0.53482872073),
-                  (0.443056374822, 0.534997886888),
-                  (0.437232580925, 0.535164368997),
-                  (0.431402806355, 0.535328187218),
-                  (0.425567152118, 0.535489361383),
-                  (0.419725718626, 0.535647910985),
-                  (0.413878605697, 0.535803855159),
-                  (0.408025912543, 0.535957212669),
-                  (0.402167737772, 0.536108001899),
-                  (0.402092818874, 0.538935140324),
-                  (0.402017391165, 0.54176053953),
-                  (0.401941452368, 0.544584186501),
-                  (0.401865000178, 0.54740606813),
-                  (0.401788032264, 0.550226171218),
-                  (0.401710546267, 0.553044482466),
-                  (0.401632539797, 0.555860988481),
-                  (0.401554010441, 0.558675675767),
-                  (0.401474955753, 0.561488530726),
-                  (0.401395373261, 0.564299539654),
-                  (0.401315260461, 0.567108688741),
-                  (0.401234614821, 0.569915964065),
-                  (0.401153433781, 0.572721351594),
-                  (0.401071714748, 0.575524837178),
-                  (0.4009894551, 0.578326406551),
-                  (0.400906652184, 0.581126045327),
-                  (0.400823303316, 0.583923738996),
-                  (0.400739405781, 0.586719472923),
-                  (0.40065495683, 0.589513232344),
-                  (0.400569953685, 0.592305002361),
-                  (0.400484393532, 0.595094767945),
-                  (0.400398273529, 0.597882513928),
-                  (0.400311590795, 0.600668224999),
-                  (0.40022434242, 0.603451885707),
-                  (0.400136525457, 0.60623348045),
-                  (0.400048136927, 0.609012993478),
-                  (0.399959173813, 0.611790408887),
-                  (0.399869633065, 0.614565710614),
-                  (0.399779511598, 0.617338882436),
-                  (0.399688806289, 0.620109907967),
-                  (0.399597513978, 0.622878770651),
-                  (0.399505631471, 0.62564545376),
-                  (0.405319246866, 0.6254595353),
-                  (0.411127094724, 0.625270435024),
-                  (0.41692907313, 0.625078130688),
-                  (0.422725079796, 0.624882599656),
-                  (0.428515012083, 0.624683818912),
-                  (0.434298767018, 0.62448176508),
-                  (0.440076241317, 0.62427641444),
-                  (0.44584733141, 0.624067742949),
-                  (0.451611933459, 0.623855726262),
-                  (0.457369943387, 0.623640339755),
-                  (0.4631212569, 0.623421558554),
-                  (0.468865769518, 0.623199357556),
-                  (0.474603376597, 0.622973711461),
-                  (0.480333973361, 0.622744594802),
-                  (0.486057454934, 0.622511981978),
-                  (0.491773716366, 0.622275847289),
-                  (0.497482652667, 0.622036164971),
-                  (0.503184158842, 0.621792909237),
-                  (0.508878129925, 0.621546054315),
-                  (0.514564461012, 0.621295574497),
-                  (0.520243047303, 0.621041444179),
-                  (0.525913784133, 0.620783637912),
-                  (0.531576567021, 0.620522130455),
-                  (0.537231291702, 0.620256896822),
-                  (0.542877854173, 0.619987912344),
-                  (0.548516150738, 0.619715152725),
-                  (0.554146078049, 0.619438594103),
-                  (0.559767533157, 0.619158213115),
-                  (0.565380413556, 0.618873986965),
-                  (0.570984617231, 0.618585893492),
-                  (0.576580042714, 0.618293911246),
-                  (0.582166589131, 0.617998019561)]},
- 91: {'color': 'skyblue',
-      'polygon': [(0.386132453436, 0.62607906711),
-                  (0.38621919171, 0.623309821007),
-                  (0.386305361515, 0.620538407674),
-                  (0.386390965982, 0.617764843667),
-                  (0.386476008208, 0.614989145377),
-                  (0.386560491249, 0.612211329026),
-                  (0.38664441813, 0.609431410676),
-                  (0.386727791835, 0.606649406229),
-                  (0.386810615317, 0.603865331435),
-                  (0.38689289149, 0.601079201889),
-                  (0.386974623238, 0.59829103304),
-                  (0.387055813407, 0.595500840192),
-                  (0.387136464811, 0.592708638507),
-                  (0.387216580231, 0.589914443009),
-                  (0.387296162415, 0.587118268585),
-                  (0.387375214077, 0.584320129991),
-                  (0.3874537379, 0.581520041853),
-                  (0.387531736537, 0.578718018671),
-                  (0.387609212605, 0.575914074819),
-                  (0.387686168694, 0.573108224551),
-                  (0.387762607362, 0.570300482005),
-                  (0.387838531135, 0.5674908612),
-                  (0.387913942512, 0.564679376042),
-                  (0.38798884396, 0.56186604033),
-                  (0.388063237917, 0.559050867749),
-                  (0.388137126792, 0.556233871884),
-                  (0.388210512965, 0.553415066213),
-                  (0.388283398788, 0.550594464114),
-                  (0.388355786584, 0.547772078866),
-                  (0.388427678649, 0.544947923652),
-                  (0.38849907725, 0.54212201156),
-                  (0.38856998463, 0.539294355587),
-                  (0.388640403, 0.536464968636),
-                  (0.382764728623, 0.536610721787),
-                  (0.376883992977, 0.536753983295),
-                  (0.370998291375, 0.536894769293),
-                  (0.365107718515, 0.537033095481),
-                  (0.359212368468, 0.537168977123),
-                  (0.353312334688, 0.537302429041),
-                  (0.347407710007, 0.537433465619),
-                  (0.341498586636, 0.537562100794),
-                  (0.33558505617, 0.537688348062),
-                  (0.329667209584, 0.537812220475),
-                  (0.323745137239, 0.537933730644),
-                  (0.317818928883, 0.538052890741),
-                  (0.311888673655, 0.538169712498),
-                  (0.305954460085, 0.538284207215),
-                  (0.300016376101, 0.538396385762),
-                  (0.294074509033, 0.538506258584),
-                  (0.288128945613, 0.538613835704),
-                  (0.282179771984, 0.53871912673),
-                  (0.276227073704, 0.538822140862),
-                  (0.270270935749, 0.538922886897),
-                  (0.264311442521, 0.539021373235),
-                  (0.258348677852, 0.539117607889),
-                  (0.252382725013, 0.539211598488),
-                  (0.246413666718, 0.539303352292),
-                  (0.24044158513, 0.539392876192),
-                  (0.234466561872, 0.539480176724),
-                  (0.228488678029, 0.539565260074),
-                  (0.22250801416, 0.539648132091),
-                  (0.216524650306, 0.539728798291),
-                  (0.210538665994, 0.539807263871),
-                  (0.204550140249, 0.539883533713),
-                  (0.198559151601, 0.539957612399),
-                  (0.198524831392, 0.542809877379),
-                  (0.19849027944, 0.545660495845),
-                  (0.198455494608, 0.548509455948),
-                  (0.198420475738, 0.551356745765),
-                  (0.198385221652, 0.554202353295),
-                  (0.198349731157, 0.557046266461),
-                  (0.198314003036, 0.559888473106),
-                  (0.198278036056, 0.562728960991),
-                  (0.198241828962, 0.565567717794),
-                  (0.198205380479, 0.568404731109),
-                  (0.198168689311, 0.57123998844),
-                  (0.198131754142, 0.574073477203),
-                  (0.198094573635, 0.576905184724),
-                  (0.198057146431, 0.579735098234),
-                  (0.198019471148, 0.582563204869),
-                  (0.197981546384, 0.585389491667),
-                  (0.197943370712, 0.588213945566),
-                  (0.197904942685, 0.591036553401),
-                  (0.19786626083, 0.593857301903),
-                  (0.197827323651, 0.596676177697),
-                  (0.19778812963, 0.599493167297),
-                  (0.197748677223, 0.602308257105),
-                  (0.19770896486, 0.605121433408),
-                  (0.197668990948, 0.607932682377),
-                  (0.197628753868, 0.610741990062),
-                  (0.197588251974, 0.613549342392),
-                  (0.197547483594, 0.616354725167),
-                  (0.19750644703, 0.619158124064),
-                  (0.197465140555, 0.621959524623),
-                  (0.197423562416, 0.624758912254),
-                  (0.197381710831, 0.627556272228),
-                  (0.197339583989, 0.630351589677),
-                  (0.203292908113, 0.630261365628),
-                  (0.209243653989, 0.630168447338),
-                  (0.21519173812, 0.630072827889),
-                  (0.221137076455, 0.629974499998),
-                  (0.227079584382, 0.629873456007),
-                  (0.233019176723, 0.629769687875),
-                  (0.23895576773, 0.629663187169),
-                  (0.244889271084, 0.629553945058),
-                  (0.250819599885, 0.629441952302),
-                  (0.256746666656, 0.629327199245),
-                  (0.262670383337, 0.629209675808),
-                  (0.268590661285, 0.629089371481),
-                  (0.274507411271, 0.628966275319),
-                  (0.280420543483, 0.62884037593),
-                  (0.286329967523, 0.628711661472),
-                  (0.29223559241, 0.62858011965),
-                  (0.298137326581, 0.628445737703),
-                  (0.304035077891, 0.628308502409),
-                  (0.309928753621, 0.628168400072),
-                  (0.315818260477, 0.628025416523),
-                  (0.321703504595, 0.627879537117),
-                  (0.32758439155, 0.627730746728),
-                  (0.333460826355, 0.62757902975),
-                  (0.339332713472, 0.627424370093),
-                  (0.34519995682, 0.627266751186),
-                  (0.35106245978, 0.627106155976),
-                  (0.356920125204, 0.626942566927),
-                  (0.362772855426, 0.626775966027),
-                  (0.368620552273, 0.626606334787),
-                  (0.374463117073, 0.626433654248),
-                  (0.380300450671, 0.626257904984),
-                  (0.386132453436, 0.62607906711)]},
- 92: {'color': 'skyblue',
-      'polygon': [(0.183538908205, 0.630400778723),
-                  (0.183579697145, 0.627604149527),
-                  (0.183620231165, 0.624805484059),
-                  (0.183660511959, 0.622004797107),
-                  (0.183700541197, 0.619202103322),
-                  (0.18374032052, 0.616397417218),
-                  (0.183779851541, 0.613590753177),
-                  (0.183819135849, 0.61078212545),
-                  (0.183858175006, 0.607971548163),
-                  (0.183896970551, 0.605159035318),
-                  (0.183935523995, 0.602344600795),
-                  (0.183973836826, 0.599528258354),
-                  (0.184011910508, 0.596710021643),
-                  (0.184049746482, 0.593889904194),
-                  (0.184087346165, 0.591067919427),
-                  (0.18412471095, 0.588244080656),
-                  (0.18416184221, 0.585418401089),
-                  (0.184198741294, 0.58259089383),
-                  (0.18423540953, 0.579761571881),
-                  (0.184271848223, 0.576930448145),
-                  (0.18430805866, 0.574097535431),
-                  (0.184344042105, 0.571262846451),
-                  (0.184379799801, 0.568426393824),
-                  (0.184415332972, 0.565588190081),
-                  (0.184450642823, 0.562748247662),
-                  (0.184485730537, 0.559906578924),
-                  (0.18452059728, 0.557063196137),
-                  (0.184555244197, 0.55421811149),
-                  (0.184589672418, 0.551371337089),
-                  (0.18462388305, 0.548522884965),
-                  (0.184657877184, 0.54567276707),
-                  (0.184691655895, 0.542820995279),
-                  (0.184725220237, 0.539967581396),
-                  (0.178726619042, 0.540031077302),
-                  (0.1727258855, 0.540092398347),
-                  (0.166723095673, 0.540151547711),
-                  (0.160718325189, 0.540208528328),
-                  (0.154711649251, 0.540263342898),
-                  (0.148703142651, 0.540315993896),
-                  (0.142692879775, 0.540366483582),
-                  (0.136680934618, 0.540414814008),
-                  (0.130667380796, 0.54046098703),
-                  (0.124652291555, 0.540505004312),
-                  (0.118635739782, 0.540546867338),
-                  (0.11261779802, 0.540586577422),
-                  (0.106598538479, 0.540624135712),
-                  (0.100578033044, 0.540659543199),
-                  (0.0945563532947, 0.540692800727),
-                  (0.0885335705115, 0.540723908999),
-                  (0.0825097556914, 0.540752868582),
-                  (0.0764849795605, 0.540779679919),
-                  (0.0704593125863, 0.540804343332),
-                  (0.0644328249914, 0.540826859027),
-                  (0.0584055867668, 0.540847227106),
-                  (0.0523776676849, 0.540865447566),
-                  (0.046349137314, 0.540881520309),
-                  (0.0403200650311, 0.540895445145),
-                  (0.0342905200365, 0.540907221799),
-                  (0.0282605713674, 0.540916849912),
-                  (0.0222302879126, 0.540924329048),
-                  (0.0161997384262, 0.540929658698),
-                  (0.0101689915424, 0.540932838281),
-                  (0.00413811579006, 0.540933867149),
-                  (-0.00189282039281, 0.540932744588),
-                  (-0.00792374864406, 0.540929469824),
-                  (-0.00792440130789, 0.543789680719),
-                  (-0.00792505078215, 0.546648268846),
-                  (-0.0079256971253, 0.54950522253),
-                  (-0.00792634039823, 0.552360530023),
-                  (-0.00792698066431, 0.555214179509),
-                  (-0.00792761798959, 0.558066159096),
-                  (-0.00792825244289, 0.560916456818),
-                  (-0.00792888409603, 0.563765060633),
-                  (-0.00792951302404, 0.566611958422),
-                  (-0.00793013930524, 0.569457137985),
-                  (-0.00793076302151, 0.572300587041),
-                  (-0.00793138425843, 0.575142293228),
-                  (-0.00793200310557, 0.577982244096),
-                  (-0.00793261965663, 0.580820427112),
-                  (-0.00793323400967, 0.583656829653),
-                  (-0.00793384626738, 0.586491439006),
-                  (-0.00793445653721, 0.589324242366),
-                  (-0.00793506493184, 0.592155226836),
-                  (-0.00793567156919, 0.59498437942),
-                  (-0.00793627657279, 0.597811687026),
-                  (-0.00793688007209, 0.600637136462),
-                  (-0.00793748220272, 0.603460714433),
-                  (-0.00793808310667, 0.60628240754),
-                  (-0.0079386829328, 0.609102202279),
-                  (-0.00793928183703, 0.611920085035),
-                  (-0.00793987998262, 0.614736042083),
-                  (-0.00794047754059, 0.617550059586),
-                  (-0.00794107469005, 0.620362123589),
-                  (-0.00794167161857, 0.623172220021),
-                  (-0.00794226852241, 0.625980334688),
-                  (-0.00794286560713, 0.628786453274),
-                  (-0.00794346308777, 0.631590561339),
-                  (-0.00194870241214, 0.631593971677),
-                  (0.00404607826806, 0.631594766972),
-                  (0.0100408078991, 0.631592947958),
-                  (0.0160354153144, 0.631588515237),
-                  (0.0220298292163, 0.631581469279),
-                  (0.0280239781586, 0.631571810416),
-                  (0.0340177905288, 0.631559538843),
-                  (0.0400111945311, 0.631544654611),
-                  (0.0460041181686, 0.631527157626),
-                  (0.0519964892272, 0.631507047642),
-                  (0.0579882352584, 0.631484324261),
-                  (0.0639792835633, 0.631458986922),
-                  (0.0699695611762, 0.631431034903),
-                  (0.075958994849, 0.631400467308),
-                  (0.0819475110354, 0.631367283068),
-                  (0.0879350358761, 0.631331480931),
-                  (0.0939214951834, 0.631293059457),
-                  (0.0999068144267, 0.631252017012),
-                  (0.105890918719, 0.63120835176),
-                  (0.1118737328, 0.631162061655),
-                  (0.117855181028, 0.631113144437),
-                  (0.123835187361, 0.631061597619),
-                  (0.129813675347, 0.631007418487),
-                  (0.13579056811, 0.630950604085),
-                  (0.141765788339, 0.630891151207),
-                  (0.147739258277, 0.630829056396),
-                  (0.153710899706, 0.630764315926),
-                  (0.159680633941, 0.6306969258),
-                  (0.165648381815, 0.630626881738),
-                  (0.171614063672, 0.630554179169),
-                  (0.177577599357, 0.630478813224),
-                  (0.183538908205, 0.630400778723)]},
- 93: {'color': 'skyblue',
-      'polygon': [(-0.0217506951374, 0.631643444975),
-                  (-0.0217515010524, 0.628839471886),
-                  (-0.0217522889271, 0.626033486634),
-                  (-0.0217530586571, 0.623225503681),
-                  (-0.0217538101464, 0.620415537366),
-                  (-0.0217545433067, 0.617603601903),
-                  (-0.0217552580572, 0.614789711386),
-                  (-0.0217559543243, 0.611973879792),
-                  (-0.021756632041, 0.609156120982),
-                  (-0.0217572911468, 0.606336448704),
-                  (-0.0217579315871, 0.603514876596),
-                  (-0.0217585533133, 0.600691418186),
-                  (-0.021759156282, 0.597866086896),
-                  (-0.0217597404551, 0.595038896045),
-                  (-0.0217603057995, 0.592209858848),
-                  (-0.0217608522864, 0.589378988424),
-                  (-0.0217613798916, 0.586546297789),
-                  (-0.0217618885946, 0.583711799867),
-                  (-0.0217623783792, 0.580875507486),
-                  (-0.0217628492325, 0.578037433384),
-                  (-0.0217633011449, 0.575197590207),
-                  (-0.02176373411, 0.572355990514),
-                  (-0.0217641481244, 0.569512646777),
-                  (-0.0217645431873, 0.566667571383),
-                  (-0.0217649193004, 0.563820776637),
-                  (-0.0217652764678, 0.560972274762),
-                  (-0.0217656146957, 0.558122077902),
-                  (-0.0217659339923, 0.555270198122),
-                  (-0.0217662343674, 0.552416647411),
-                  (-0.0217665158328, 0.549561437685),
-                  (-0.0217667784013, 0.546704580784),
-                  (-0.0217670220876, 0.543846088476),
-                  (-0.021767246907, 0.540985972462),
-                  (-0.0277976420651, 0.540972692276),
-                  (-0.0338277382082, 0.540957255659),
-                  (-0.0398574671266, 0.54093966157),
-                  (-0.0458867605907, 0.540919908912),
-                  (-0.0519155503363, 0.54089799653),
-                  (-0.0579437680491, 0.540873923213),
-                  (-0.0639713453482, 0.540847687691),
-                  (-0.0699982137715, 0.540819288635),
-                  (-0.0760243047589, 0.540788724653),
-                  (-0.082049549637, 0.540755994289),
-                  (-0.0880738796033, 0.540721096022),
-                  (-0.0940972257095, 0.540684028259),
-                  (-0.100119518846, 0.540644789336),
-                  (-0.106140689727, 0.540603377513),
-                  (-0.112160668871, 0.540559790968),
-                  (-0.11817938659, 0.540514027795),
-                  (-0.124196772966, 0.540466085999),
-                  (-0.130212757844, 0.540415963491),
-                  (-0.136227270807, 0.540363658082),
-                  (-0.142240241165, 0.540309167477),
-                  (-0.14825159794, 0.540252489273),
-                  (-0.154261269843, 0.540193620946),
-                  (-0.160269185267, 0.540132559852),
-                  (-0.166275272262, 0.540069303214),
-                  (-0.172279458526, 0.540003848119),
-                  (-0.178281671384, 0.53993619151),
-                  (-0.184281837776, 0.539866330179),
-                  (-0.190279884237, 0.539794260755),
-                  (-0.196275736885, 0.539719979704),
-                  (-0.202269321402, 0.539643483313),
-                  (-0.208260563019, 0.539564767688),
-                  (-0.214249386503, 0.539483828741),
-                  (-0.214215757821, 0.542335675945),
-                  (-0.214181889492, 0.545185863595),
-                  (-0.214147780508, 0.548034379323),
-                  (-0.214113429846, 0.550881210684),
-                  (-0.214078836472, 0.553726345157),
-                  (-0.214043999338, 0.556569770138),
-                  (-0.214008917388, 0.559411472946),
-                  (-0.213973589549, 0.562251440816),
-                  (-0.21393801474, 0.565089660899),
-                  (-0.213902191865, 0.56792612026),
-                  (-0.213866119819, 0.570760805881),
-                  (-0.213829797484, 0.573593704652),
-                  (-0.213793223732, 0.576424803376),
-                  (-0.213756397422, 0.579254088765),
-                  (-0.213719317403, 0.582081547437),
-                  (-0.213681982513, 0.584907165916),
-                  (-0.213644391579, 0.587730930631),
-                  (-0.213606543419, 0.590552827913),
-                  (-0.213568436839, 0.593372843994),
-                  (-0.213530070635, 0.596190965004),
-                  (-0.213491443595, 0.599007176972),
-                  (-0.213452554497, 0.601821465821),
-                  (-0.213413402107, 0.604633817368),
-                  (-0.213373985185, 0.607444217322),
-                  (-0.213334302482, 0.610252651283),
-                  (-0.21329435274, 0.613059104735),
-                  (-0.213254134691, 0.615863563053),
-                  (-0.213213647063, 0.618666011492),
-                  (-0.213172888574, 0.621466435191),
-                  (-0.213131857935, 0.624264819167),
-                  (-0.21309055385, 0.627061148317),
-                  (-0.213048975019, 0.629855407411),
-                  (-0.207098335021, 0.629952797171),
-                  (-0.20114516992, 0.630047460238),
-                  (-0.195189558378, 0.630139403064),
-                  (-0.189231578524, 0.630228631836),
-                  (-0.183271307975, 0.630315152485),
-                  (-0.177308823848, 0.630398970693),
-                  (-0.17134420278, 0.630480091902),
-                  (-0.165377520946, 0.630558521322),
-                  (-0.159408854076, 0.630634263939),
-                  (-0.153438277474, 0.630707324523),
-                  (-0.147465866037, 0.630777707636),
-                  (-0.141491694271, 0.630845417638),
-                  (-0.135515836314, 0.630910458692),
-                  (-0.129538365951, 0.630972834775),
-                  (-0.123559356633, 0.631032549682),
-                  (-0.1175788815, 0.631089607033),
-                  (-0.111597013396, 0.631144010276),
-                  (-0.105613824892, 0.631195762695),
-                  (-0.0996293883012, 0.631244867416),
-                  (-0.0936437757025, 0.631291327408),
-                  (-0.0876570589571, 0.631335145491),
-                  (-0.0816693097293, 0.631376324339),
-                  (-0.0756805995061, 0.631414866483),
-                  (-0.0696909996158, 0.631450774315),
-                  (-0.0637005812485, 0.631484050091),
-                  (-0.057709415475, 0.631514695934),
-                  (-0.0517175732663, 0.631542713836),
-                  (-0.0457251255132, 0.631568105659),
-                  (-0.0397321430453, 0.631590873139),
-                  (-0.0337386966505, 0.631611017883),
-                  (-0.027744857094, 0.631628541376),
-                  (-0.0217506951374, 0.631643444975)]},
- 94: {'bad_channels': [2],
-      'color': 'red',
-      'polygon': [(-0.22684710537, 0.629610709844),
-                  (-0.226892675595, 0.626817780538),
-                  (-0.226937951724, 0.624022774206),
-                  (-0.226982935149, 0.621225706166),
-                  (-0.227027627253, 0.618426591611),
-                  (-0.227072029414, 0.615625445612),
-                  (-0.227116143, 0.61282228312),
-                  (-0.227159969373, 0.610017118966),
-                  (-0.227203509887, 0.607209967866),
-                  (-0.227246765884, 0.60440084442),
-                  (-0.227289738701, 0.601589763116),
-                  (-0.227332429662, 0.598776738333),
-                  (-0.227374840085, 0.59596178434),
-                  (-0.227416971275, 0.593144915299),
-                  (-0.227458824528, 0.590326145267),
-                  (-0.227500401131, 0.587505488198),
-                  (-0.227541702357, 0.584682957945),
-                  (-0.227582729472, 0.58185856826),
-                  (-0.227623483729, 0.579032332799),
-                  (-0.227663966369, 0.576204265119),
-                  (-0.227704178622, 0.573374378685),
-                  (-0.227744121708, 0.570542686865),
-                  (-0.227783796832, 0.56770920294),
-                  (-0.227823205191, 0.564873940097),
-                  (-0.227862347966, 0.562036911435),
-                  (-0.227901226328, 0.559198129969),
-                  (-0.227939841435, 0.556357608624),
-                  (-0.227978194432, 0.553515360244),
-                  (-0.228016286452, 0.550671397588),
-                  (-0.228054118614, 0.547825733334),
-                  (-0.228091692025, 0.54497838008),
-                  (-0.22812900778, 0.542129350345),
-                  (-0.228166066959, 0.539278656572),
-                  (-0.234146280924, 0.539192124092),
-                  (-0.240123744211, 0.539103347533),
-                  (-0.246098378839, 0.539012321608),
-                  (-0.252070106263, 0.53891904078),
-                  (-0.258038847358, 0.538823499255),
-                  (-0.264004522411, 0.538725690971),
-                  (-0.269967051097, 0.538625609591),
-                  (-0.275926352474, 0.538523248489),
-                  (-0.281882344964, 0.538418600747),
-                  (-0.287834946338, 0.53831165914),
-                  (-0.293784073707, 0.538202416131),
-                  (-0.299729643505, 0.538090863857),
-                  (-0.305671571477, 0.537976994126),
-                  (-0.311609772666, 0.537860798403),
-                  (-0.317544161402, 0.537742267803),
-                  (-0.323474651287, 0.537621393084),
-                  (-0.329401155184, 0.537498164633),
-                  (-0.335323585207, 0.537372572465),
-                  (-0.341241852708, 0.537244606209),
-                  (-0.347155868266, 0.537114255103),
-                  (-0.353065541677, 0.536981507984),
-                  (-0.358970781943, 0.536846353284),
-                  (-0.364871497266, 0.536708779019),
-                  (-0.370767595032, 0.536568772786),
-                  (-0.376658981807, 0.536426321752),
-                  (-0.382545563326, 0.536281412655),
-                  (-0.388427244487, 0.536134031789),
-                  (-0.394303929343, 0.535984165007),
-                  (-0.400175521093, 0.535831797711),
-                  (-0.406041922078, 0.535676914851),
-                  (-0.411903033773, 0.535519500918),
-                  (-0.417758756783, 0.535359539945),
-                  (-0.417684815681, 0.53818534329),
-                  (-0.417610354709, 0.541009383596),
-                  (-0.417535371842, 0.543831647019),
-                  (-0.417459865042, 0.546652119625),
-                  (-0.417383832255, 0.549470787385),
-                  (-0.417307271413, 0.55228763618),
-                  (-0.417230180437, 0.555102651795),
-                  (-0.417152557233, 0.557915819919),
-                  (-0.417074399692, 0.560727126144),
-                  (-0.416995705696, 0.563536555965),
-                  (-0.416916473111, 0.566344094775),
-                  (-0.416836699794, 0.569149727869),
-                  (-0.416756383587, 0.571953440438),
-                  (-0.416675522323, 0.574755217571),
-                  (-0.416594113822, 0.57755504425),
-                  (-0.416512155896, 0.580352905352),
-                  (-0.416429646343, 0.583148785647),
-                  (-0.416346582953, 0.585942669795),
-                  (-0.416262963507, 0.588734542346),
-                  (-0.416178785776, 0.591524387738),
-                  (-0.416094047522, 0.594312190294),
-                  (-0.4160087465, 0.597097934224),
-                  (-0.415922880456, 0.59988160362),
-                  (-0.415836447129, 0.602663182458),
-                  (-0.415749444252, 0.605442654591),
-                  (-0.415661869551, 0.608220003753),
-                  (-0.415573720746, 0.610995213554),
-                  (-0.415484995553, 0.61376826748),
-                  (-0.415395691684, 0.61653914889),
-                  (-0.415305806844, 0.619307841015),
-                  (-0.415215338737, 0.622074326956),
-                  (-0.415124285065, 0.624838589683),
-                  (-0.409312927576, 0.625034297945),
-                  (-0.403495925038, 0.625226828098),
-                  (-0.397673381303, 0.625416201146),
-                  (-0.391845399427, 0.625602437553),
-                  (-0.386012081664, 0.625785557243),
-                  (-0.380173529459, 0.625965579608),
-                  (-0.374329843447, 0.62614252351),
-                  (-0.36848112345, 0.626316407287),
-                  (-0.362627468474, 0.626487248756),
-                  (-0.356768976712, 0.626655065222),
-                  (-0.35090574554, 0.626819873481),
-                  (-0.345037871522, 0.62698168983),
-                  (-0.339165450411, 0.627140530071),
-                  (-0.333288577153, 0.627296409519),
-                  (-0.327407345888, 0.627449343012),
-                  (-0.321521849959, 0.627599344915),
-                  (-0.315632181915, 0.627746429131),
-                  (-0.309738433518, 0.627890609108),
-                  (-0.30384069575, 0.62803189785),
-                  (-0.29793905882, 0.62817030792),
-                  (-0.292033612175, 0.628305851456),
-                  (-0.286124444506, 0.628438540178),
-                  (-0.28021164376, 0.628568385392),
-                  (-0.274295297149, 0.628695398009),
-                  (-0.268375491162, 0.628819588544),
-                  (-0.262452311574, 0.628940967135),
-                  (-0.256525843463, 0.629059543546),
-                  (-0.250596171219, 0.629175327178),
-                  (-0.244663378555, 0.629288327083),
-                  (-0.238727548526, 0.629398551967),
-                  (-0.232788763539, 0.629506010204),
-                  (-0.22684710537, 0.629610709844)]},
- 95: {'color': 'skyblue',
-      'polygon': [(-0.428447802381, 0.624379507013),
-                  (-0.428542581212, 0.621618078487),
-                  (-0.428636752774, 0.618854412576),
-                  (-0.428730319384, 0.616088526463),
-                  (-0.428823283356, 0.613320437203),
-                  (-0.428915647005, 0.610550161716),
-                  (-0.429007412641, 0.607777716798),
-                  (-0.429098582572, 0.605003119113),
-                  (-0.429189159102, 0.602226385203),
-                  (-0.42927914453, 0.599447531485),
-                  (-0.42936854115, 0.596666574253),
-                  (-0.429457351253, 0.593883529682),
-                  (-0.42954557712, 0.591098413827),
-                  (-0.429633221029, 0.588311242627),
-                  (-0.429720285248, 0.585522031902),
-                  (-0.42980677204, 0.582730797361),
-                  (-0.429892683659, 0.579937554597),
-                  (-0.429978022349, 0.577142319095),
-                  (-0.430062790348, 0.574345106227),
-                  (-0.430146989883, 0.571545931258),
-                  (-0.430230623171, 0.568744809344),
-                  (-0.430313692419, 0.565941755539),
-                  (-0.430396199824, 0.563136784787),
-                  (-0.430478147572, 0.560329911933),
-                  (-0.430559537837, 0.55752115172),
-                  (-0.430640372783, 0.554710518787),
-                  (-0.430720654561, 0.551898027678),
-                  (-0.430800385308, 0.549083692835),
-                  (-0.430879567153, 0.546267528607),
-                  (-0.430958202206, 0.543449549244),
-                  (-0.43103629257, 0.540629768903),
-                  (-0.431113840331, 0.537808201649),
-                  (-0.431190847562, 0.534984861453),
-                  (-0.437028075543, 0.534816738726),
-                  (-0.442859477356, 0.534645994735),
-                  (-0.448684948924, 0.53447261103),
-                  (-0.454504385282, 0.534296568697),
-                  (-0.460317680575, 0.53411784835),
-                  (-0.466124728055, 0.533936430143),
-                  (-0.471925420086, 0.533752293766),
-                  (-0.477719648141, 0.533565418451),
-                  (-0.483507302812, 0.533375782975),
-                  (-0.489288273804, 0.533183365669),
-                  (-0.495062449946, 0.532988144421),
-                  (-0.500829719195, 0.532790096682),
-                  (-0.50658996864, 0.532589199477),
-                  (-0.51234308451, 0.532385429415),
-                  (-0.518088952182, 0.532178762693),
-                  (-0.523827456192, 0.531969175116),
-                  (-0.52955848024, 0.5317566421),
-                  (-0.535281907209, 0.531541138692),
-                  (-0.540997619168, 0.531322639583),
-                  (-0.546705497393, 0.531101119119),
-                  (-0.552405422376, 0.530876551326),
-                  (-0.558097273847, 0.530648909921),
-                  (-0.563780930785, 0.530418168335),
-                  (-0.569456271437, 0.53018429973),
-                  (-0.575123173341, 0.529947277027),
-                  (-0.580781513345, 0.529707072924),
-                  (-0.586431167629, 0.529463659921),
-                  (-0.592072011727, 0.529217010351),
-                  (-0.597703920555, 0.5289670964),
-                  (-0.603326768436, 0.528713890144),
-                  (-0.60894042913, 0.528457363572),
-                  (-0.614544775858, 0.528197488625),
-                  (-0.614422493651, 0.530975228746),
-                  (-0.614299375078, 0.533751004213),
-                  (-0.61417541823, 0.536524798825),
-                  (-0.614050621213, 0.539296596276),
-                  (-0.613924982149, 0.542066380146),
-                  (-0.613798499176, 0.544834133907),
-                  (-0.613671170447, 0.547599840915),
-                  (-0.613542994136, 0.550363484416),
-                  (-0.613413968434, 0.55312504754),
-                  (-0.613284091552, 0.555884513301),
-                  (-0.613153361722, 0.558641864597),
-                  (-0.613021777197, 0.561397084208),
-                  (-0.612889336253, 0.564150154796),
-                  (-0.612756037188, 0.566901058903),
-                  (-0.612621878327, 0.569649778948),
-                  (-0.612486858019, 0.572396297229),
-                  (-0.612350974638, 0.575140595922),
-                  (-0.612214226588, 0.577882657077),
-                  (-0.6120766123, 0.580622462617),
-                  (-0.611938130236, 0.583359994342),
-                  (-0.611798778886, 0.58609523392),
-                  (-0.611658556774, 0.588828162891),
-                  (-0.611517462457, 0.591558762665),
-                  (-0.611375494525, 0.594287014519),
-                  (-0.611232651605, 0.597012899599),
-                  (-0.611088932359, 0.599736398914),
-                  (-0.610944335487, 0.602457493339),
-                  (-0.610798859729, 0.605176163612),
-                  (-0.610652503864, 0.607892390332),
-                  (-0.610505266714, 0.610606153959),
-                  (-0.610357147142, 0.61331743481),
-                  (-0.610208144058, 0.616026213063),
-                  (-0.604658042203, 0.616347104393),
-                  (-0.599098384604, 0.616663797378),
-                  (-0.593529288629, 0.616976327578),
-                  (-0.587950871969, 0.617284730447),
-                  (-0.582363252571, 0.617589041302),
-                  (-0.576766548575, 0.617889295292),
-                  (-0.571160878254, 0.618185527362),
-                  (-0.565546359954, 0.618477772226),
-                  (-0.559923112038, 0.618766064342),
-                  (-0.554291252834, 0.619050437882),
-                  (-0.548650900582, 0.61933092671),
-                  (-0.543002173383, 0.619607564358),
-                  (-0.537345189153, 0.619880384001),
-                  (-0.531680065579, 0.620149418443),
-                  (-0.526006920073, 0.620414700091),
-                  (-0.520325869734, 0.620676260942),
-                  (-0.514637031305, 0.620934132564),
-                  (-0.50894052114, 0.621188346081),
-                  (-0.503236455164, 0.621438932159),
-                  (-0.497524948845, 0.621685920995),
-                  (-0.491806117155, 0.6219293423),
-                  (-0.486080074548, 0.622169225294),
-                  (-0.480346934924, 0.622405598693),
-                  (-0.474606811609, 0.622638490701),
-                  (-0.468859817325, 0.622867929002),
-                  (-0.463106064169, 0.623093940754),
-                  (-0.457345663591, 0.623316552583),
-                  (-0.451578726374, 0.623535790578),
-                  (-0.445805362614, 0.623751680287),
-                  (-0.440025681703, 0.623964246716),
-                  (-0.434239792313, 0.624173514321),
-                  (-0.428447802381, 0.624379507013)]},
- 96: {'color': 'skyblue',
-      'polygon': [(0.382861617685, 0.716651276042),
-                  (0.382971064717, 0.713964670652),
-                  (0.383079815831, 0.711275224012),
-                  (0.383187875709, 0.708582960918),
-                  (0.383295248975, 0.705887905828),
-                  (0.383401940196, 0.703190082864),
-                  (0.383507953881, 0.700489515826),
-                  (0.383613294485, 0.697786228191),
-                  (0.383717966405, 0.695080243126),
-                  (0.383821973987, 0.692371583488),
-                  (0.383925321519, 0.689660271835),
-                  (0.384028013242, 0.686946330432),
-                  (0.38413005334, 0.684229781251),
-                  (0.384231445949, 0.681510645986),
-                  (0.384332195152, 0.67878894605),
-                  (0.384432304984, 0.676064702586),
-                  (0.384531779429, 0.673337936472),
-                  (0.384630622425, 0.670608668326),
-                  (0.38472883786, 0.667876918507),
-                  (0.384826429577, 0.66514270713),
-                  (0.38492340137, 0.662406054061),
-                  (0.385019756989, 0.659666978927),
-                  (0.385115500138, 0.656925501124),
-                  (0.385210634476, 0.654181639814),
-                  (0.385305163621, 0.651435413936),
-                  (0.385399091142, 0.64868684221),
-                  (0.385492420571, 0.645935943139),
-                  (0.385585155394, 0.643182735015),
-                  (0.385677299056, 0.640427235926),
-                  (0.385768854962, 0.637669463754),
-                  (0.385859826475, 0.634909436187),
-                  (0.385950216919, 0.632147170717),
-                  (0.386040029577, 0.629382684648),
-                  (0.380209968305, 0.629559279368),
-                  (0.374374561244, 0.629732758367),
-                  (0.368533908194, 0.629903141763),
-                  (0.362688108491, 0.63007044921),
-                  (0.35683726099, 0.630234699893),
-                  (0.350981464056, 0.630395912528),
-                  (0.345120815552, 0.630554105352),
-                  (0.339255412826, 0.63070929612),
-                  (0.333385352703, 0.630861502106),
-                  (0.327510731475, 0.631010740101),
-                  (0.321631644892, 0.63115702641),
-                  (0.315748188158, 0.631300376853),
-                  (0.309860455917, 0.631440806767),
-                  (0.303968542255, 0.631578331007),
-                  (0.298072540688, 0.631712963951),
-                  (0.292172544161, 0.631844719496),
-                  (0.286268645045, 0.631973611071),
-                  (0.280360935129, 0.632099651633),
-                  (0.274449505622, 0.632222853677),
-                  (0.26853444715, 0.632343229239),
-                  (0.262615849752, 0.632460789903),
-                  (0.256693802885, 0.632575546806),
-                  (0.250768395419, 0.632687510644),
-                  (0.244839715639, 0.63279669168),
-                  (0.238907851248, 0.632903099752),
-                  (0.232972889368, 0.633006744278),
-                  (0.227034916542, 0.633107634269),
-                  (0.221094018738, 0.633205778329),
-                  (0.215150281352, 0.63330118467),
-                  (0.209203789213, 0.633393861119),
-                  (0.203254626587, 0.633483815123),
-                  (0.197302877183, 0.633571053764),
-                  (0.197258296863, 0.636361949464),
-                  (0.197213436191, 0.639150755136),
-                  (0.197168293242, 0.641937455298),
-                  (0.197122866055, 0.644722034307),
-                  (0.19707715264, 0.647504476364),
-                  (0.197031150976, 0.650284765503),
-                  (0.196984859006, 0.653062885589),
-                  (0.19693827464, 0.655838820319),
-                  (0.196891395756, 0.658612553212),
-                  (0.196844220196, 0.661384067609),
-                  (0.196796745767, 0.664153346668),
-                  (0.196748970238, 0.666920373359),
-                  (0.196700891344, 0.669685130462),
-                  (0.196652506783, 0.672447600561),
-                  (0.196603814213, 0.675207766041),
-                  (0.196554811254, 0.677965609083),
-                  (0.196505495489, 0.68072111166),
-                  (0.196455864457, 0.683474255534),
-                  (0.196405915659, 0.686225022247),
-                  (0.196355646555, 0.68897339312),
-                  (0.196305054561, 0.69171934925),
-                  (0.19625413705, 0.6944628715),
-                  (0.196202891354, 0.697203940499),
-                  (0.196151314757, 0.699942536633),
-                  (0.196099404499, 0.702678640043),
-                  (0.196047157775, 0.705412230619),
-                  (0.19599457173, 0.708143287993),
-                  (0.195941643465, 0.710871791538),
-                  (0.195888370028, 0.713597720358),
-                  (0.195834748421, 0.716321053284),
-                  (0.195780775592, 0.719041768869),
-                  (0.19572644844, 0.721759845383),
-                  (0.201631415883, 0.721653740597),
-                  (0.207533639245, 0.72154431704),
-                  (0.213433029177, 0.721431564614),
-                  (0.219329495766, 0.72131547278),
-                  (0.225222948534, 0.721196030558),
-                  (0.231113296432, 0.721073226515),
-                  (0.237000447853, 0.720947048758),
-                  (0.242884310623, 0.720817484927),
-                  (0.248764792012, 0.720684522189),
-                  (0.254641798735, 0.720548147233),
-                  (0.260515236959, 0.720408346257),
-                  (0.266385012307, 0.720265104969),
-                  (0.272251029868, 0.72011840858),
-                  (0.278113194203, 0.719968241796),
-                  (0.283971409353, 0.719814588816),
-                  (0.289825578855, 0.719657433326),
-                  (0.295675605748, 0.719496758497),
-                  (0.301521392585, 0.719332546982),
-                  (0.307362841451, 0.719164780911),
-                  (0.313199853974, 0.718993441892),
-                  (0.319032331343, 0.718818511008),
-                  (0.32486017432, 0.718639968819),
-                  (0.330683283267, 0.718457795358),
-                  (0.336501558154, 0.718271970136),
-                  (0.34231489859, 0.718082472144),
-                  (0.348123203837, 0.717889279853),
-                  (0.353926372836, 0.717692371218),
-                  (0.359724304231, 0.717491723687),
-                  (0.365516896393, 0.717287314203),
-                  (0.371304047449, 0.71707911921),
-                  (0.377085655306, 0.716867114664),
-                  (0.382861617685, 0.716651276042)]},
- 97: {'color': 'skyblue',
-      'polygon': [(0.182016356736, 0.721993881675),
-                  (0.182066743465, 0.719274398205),
-                  (0.182116799491, 0.716552284322),
-                  (0.182166527771, 0.713827561612),
-                  (0.182215931214, 0.711100251377),
-                  (0.182265012677, 0.708370374647),
-                  (0.18231377497, 0.705637952178),
-                  (0.182362220855, 0.702903004468),
-                  (0.182410353046, 0.70016555175),
-                  (0.182458174213, 0.697425614006),
-                  (0.182505686979, 0.694683210972),
-                  (0.182552893926, 0.691938362136),
-                  (0.182599797588, 0.689191086751),
-                  (0.182646400461, 0.686441403835),
-                  (0.182692704995, 0.683689332178),
-                  (0.182738713603, 0.680934890347),
-                  (0.182784428655, 0.678178096687),
-                  (0.182829852481, 0.67541896933),
-                  (0.182874987376, 0.6726575262),
-                  (0.182919835591, 0.66989378501),
-                  (0.182964399346, 0.667127763276),
-                  (0.183008680818, 0.664359478316),
-                  (0.183052682154, 0.661588947252),
-                  (0.18309640546, 0.658816187021),
-                  (0.183139852811, 0.656041214372),
-                  (0.183183026246, 0.653264045874),
-                  (0.183225927772, 0.65048469792),
-                  (0.18326855936, 0.647703186727),
-                  (0.183310922953, 0.644919528344),
-                  (0.183353020459, 0.642133738656),
-                  (0.183394853755, 0.63934583338),
-                  (0.183436424689, 0.63655582808),
-                  (0.183477735077, 0.633763738161),
-                  (0.177517982118, 0.633842436813),
-                  (0.171555998262, 0.63391844682),
-                  (0.165591864363, 0.633991773446),
-                  (0.159625660767, 0.634062421642),
-                  (0.153657467316, 0.634130396057),
-                  (0.14768736336, 0.634195701048),
-                  (0.141715427768, 0.634258340684),
-                  (0.135741738936, 0.634318318761),
-                  (0.1297663748, 0.634375638807),
-                  (0.123789412846, 0.63443030409),
-                  (0.117810930121, 0.634482317629),
-                  (0.111831003248, 0.6345316822),
-                  (0.105849708435, 0.634578400345),
-                  (0.0998671214907, 0.634622474381),
-                  (0.0938833178365, 0.634663906402),
-                  (0.08789837252, 0.634702698296),
-                  (0.0819123602294, 0.634738851742),
-                  (0.0759253553075, 0.634772368223),
-                  (0.0699374317668, 0.634803249033),
-                  (0.0639486633041, 0.634831495278),
-                  (0.0579591233159, 0.634857107889),
-                  (0.051968884914, 0.63488008762),
-                  (0.0459780209415, 0.634900435062),
-                  (0.0399866039887, 0.634918150639),
-                  (0.0339947064099, 0.634933234622),
-                  (0.0280024003397, 0.634945687125),
-                  (0.0220097577106, 0.634955508114),
-                  (0.0160168502693, 0.634962697413),
-                  (0.0100237495949, 0.634967254698),
-                  (0.0040305271163, 0.634969179511),
-                  (-0.00196274587017, 0.634968471257),
-                  (-0.00795599818235, 0.634965129204),
-                  (-0.00795655081205, 0.637764753627),
-                  (-0.00795710459917, 0.640562320373),
-                  (-0.00795765980359, 0.643357814441),
-                  (-0.00795821669701, 0.646151220692),
-                  (-0.00795877556337, 0.648942523842),
-                  (-0.00795933669934, 0.651731708464),
-                  (-0.00795990041482, 0.654518758979),
-                  (-0.00796046703348, 0.657303659656),
-                  (-0.00796103689319, 0.660086394612),
-                  (-0.00796161034665, 0.662866947803),
-                  (-0.00796218776188, 0.665645303022),
-                  (-0.00796276952278, 0.668421443901),
-                  (-0.00796335602982, 0.671195353899),
-                  (-0.00796394770046, 0.673967016307),
-                  (-0.00796454496989, 0.676736414239),
-                  (-0.00796514829165, 0.679503530628),
-                  (-0.00796575813817, 0.682268348228),
-                  (-0.00796637500153, 0.685030849604),
-                  (-0.00796699939414, 0.687791017132),
-                  (-0.00796763184934, 0.690548832993),
-                  (-0.00796827292223, 0.693304279172),
-                  (-0.00796892319025, 0.696057337449),
-                  (-0.00796958325407, 0.6988079894),
-                  (-0.00797025373828, 0.701556216391),
-                  (-0.00797093529221, 0.704301999573),
-                  (-0.00797162859064, 0.707045319878),
-                  (-0.0079723343348, 0.709786158016),
-                  (-0.00797305325293, 0.712524494467),
-                  (-0.00797378610147, 0.715260309482),
-                  (-0.00797453366565, 0.717993583074),
-                  (-0.00797529676058, 0.720724295014),
-                  (-0.00797607623207, 0.723452424829),
-                  (-0.00202735044942, 0.723456335264),
-                  (0.00392140731483, 0.723457066044),
-                  (0.00987012177075, 0.723454617574),
-                  (0.0158187174748, 0.723448990041),
-                  (0.0217671188099, 0.723440183411),
-                  (0.0277152499658, 0.723428197426),
-                  (0.0336630349196, 0.723413031605),
-                  (0.0396103974172, 0.723394685235),
-                  (0.0455572609541, 0.723373157373),
-                  (0.0515035487573, 0.723348446839),
-                  (0.0574491837677, 0.723320552212),
-                  (0.0633940886218, 0.723289471827),
-                  (0.0693381856353, 0.723255203769),
-                  (0.0752813967859, 0.723217745868),
-                  (0.0812236436972, 0.723177095696),
-                  (0.0871648476231, 0.723133250556),
-                  (0.093104929432, 0.723086207482),
-                  (0.0990438095924, 0.723035963228),
-                  (0.104981408158, 0.722982514266),
-                  (0.110917644756, 0.722925856774),
-                  (0.11685243857, 0.722865986635),
-                  (0.12278570833, 0.722802899424),
-                  (0.128717372301, 0.722736590404),
-                  (0.13464734827, 0.72266705452),
-                  (0.140575553535, 0.722594286387),
-                  (0.146501904896, 0.722518280284),
-                  (0.152426318644, 0.722439030149),
-                  (0.158348710552, 0.722356529566),
-                  (0.16426899587, 0.722270771759),
-                  (0.170187089314, 0.722181749585),
-                  (0.176102905059, 0.722089455526),
-                  (0.182016356736, 0.721993881675)]},
- 98: {'color': 'skyblue',
-      'polygon': [(-0.021708996497, 0.723471820813),
-                  (-0.0217095079845, 0.720743863385),
-                  (-0.021710012545, 0.718013322123),
-                  (-0.0217105094949, 0.715280217485),
-                  (-0.0217109981799, 0.712544569689),
-                  (-0.0217114779737, 0.709806398708),
-                  (-0.0217119482776, 0.707065724285),
-                  (-0.0217124085195, 0.704322565929),
-                  (-0.0217128581528, 0.701576942926),
-                  (-0.0217132966559, 0.698828874338),
-                  (-0.0217137235311, 0.696078379012),
-                  (-0.021714138304, 0.69332547558),
-                  (-0.0217145405225, 0.690570182467),
-                  (-0.0217149297564, 0.687812517892),
-                  (-0.0217153055962, 0.685052499874),
-                  (-0.0217156676528, 0.682290146235),
-                  (-0.0217160155565, 0.679525474605),
-                  (-0.0217163489564, 0.676758502422),
-                  (-0.0217166675199, 0.673989246943),
-                  (-0.0217169709316, 0.671217725241),
-                  (-0.0217172588933, 0.668443954211),
-                  (-0.0217175311227, 0.665667950574),
-                  (-0.0217177873533, 0.662889730879),
-                  (-0.0217180273337, 0.660109311509),
-                  (-0.0217182508267, 0.657326708683),
-                  (-0.0217184576093, 0.654541938456),
-                  (-0.0217186474715, 0.65175501673),
-                  (-0.0217188202164, 0.648965959249),
-                  (-0.0217189756593, 0.646174781606),
-                  (-0.0217191136272, 0.643381499247),
-                  (-0.0217192339587, 0.640586127472),
-                  (-0.0217193365029, 0.637788681439),
-                  (-0.0217194211195, 0.634989176165),
-                  (-0.0277120873601, 0.634972747902),
-                  (-0.0337044318927, 0.634953681229),
-                  (-0.0396963838353, 0.634931974802),
-                  (-0.0456878723033, 0.634907627151),
-                  (-0.0516788263905, 0.634880636678),
-                  (-0.0576691751498, 0.634851001654),
-                  (-0.0636588475735, 0.634818720221),
-                  (-0.0696477725745, 0.63478379039),
-                  (-0.075635878966, 0.634746210035),
-                  (-0.0816230954428, 0.634705976897),
-                  (-0.0876093505611, 0.634663088576),
-                  (-0.0935945727193, 0.634617542531),
-                  (-0.0995786901381, 0.634569336075),
-                  (-0.105561630841, 0.634518466374),
-                  (-0.111543322635, 0.634464930438),
-                  (-0.117523693089, 0.634408725122),
-                  (-0.123502669519, 0.634349847116),
-                  (-0.129480178964, 0.634288292946),
-                  (-0.135456148167, 0.634224058961),
-                  (-0.141430503559, 0.634157141334),
-                  (-0.147403171237, 0.634087536054),
-                  (-0.153374076945, 0.634015238917),
-                  (-0.159343146056, 0.633940245523),
-                  (-0.165310303553, 0.633862551265),
-                  (-0.17127547401, 0.633782151327),
-                  (-0.177238581574, 0.633699040674),
-                  (-0.183199549947, 0.633613214041),
-                  (-0.189158302365, 0.633524665932),
-                  (-0.195114761586, 0.633433390605),
-                  (-0.201068849867, 0.63333938207),
-                  (-0.207020488948, 0.633242634076),
-                  (-0.212969600037, 0.633143140102),
-                  (-0.212928173633, 0.635932828811),
-                  (-0.212886468012, 0.638720398095),
-                  (-0.212844481848, 0.64150583218),
-                  (-0.212802213808, 0.644289115155),
-                  (-0.212759662559, 0.647070230971),
-                  (-0.21271682676, 0.649849163434),
-                  (-0.212673705072, 0.652625896211),
-                  (-0.21263029615, 0.655400412818),
-                  (-0.212586598649, 0.658172696625),
-                  (-0.212542611223, 0.660942730848),
-                  (-0.212498332525, 0.663710498551),
-                  (-0.212453761207, 0.666475982638),
-                  (-0.212408895924, 0.669239165854),
-                  (-0.212363735328, 0.672000030781),
-                  (-0.212318278077, 0.674758559836),
-                  (-0.212272522829, 0.677514735266),
-                  (-0.212226468247, 0.680268539145),
-                  (-0.212180112996, 0.683019953376),
-                  (-0.212133455746, 0.68576895968),
-                  (-0.212086495173, 0.688515539598),
-                  (-0.212039229957, 0.691259674486),
-                  (-0.211991658789, 0.694001345514),
-                  (-0.211943780363, 0.696740533659),
-                  (-0.211895593383, 0.699477219704),
-                  (-0.211847096564, 0.702211384234),
-                  (-0.211798288629, 0.704943007632),
-                  (-0.211749168312, 0.707672070077),
-                  (-0.21169973436, 0.710398551537),
-                  (-0.211649985532, 0.713122431769),
-                  (-0.211599920602, 0.715843690315),
-                  (-0.211549538357, 0.718562306493),
-                  (-0.2114988376, 0.721278259401),
-                  (-0.205596986952, 0.721397401911),
-                  (-0.199692465198, 0.721513210783),
-                  (-0.193785355026, 0.72162569528),
-                  (-0.187875738583, 0.721734864302),
-                  (-0.181963697485, 0.721840726392),
-                  (-0.176049312841, 0.721943289749),
-                  (-0.170132665263, 0.722042562235),
-                  (-0.164213834888, 0.722138551383),
-                  (-0.158292901399, 0.722231264406),
-                  (-0.152369944036, 0.722320708205),
-                  (-0.146445041621, 0.722406889376),
-                  (-0.140518272578, 0.722489814219),
-                  (-0.134589714947, 0.722569488743),
-                  (-0.12865944641, 0.722645918675),
-                  (-0.122727544307, 0.722719109465),
-                  (-0.116794085662, 0.722789066297),
-                  (-0.110859147195, 0.722855794085),
-                  (-0.104922805354, 0.722919297492),
-                  (-0.0989851363246, 0.722979580923),
-                  (-0.0930462160616, 0.72303664854),
-                  (-0.0871061203036, 0.723090504258),
-                  (-0.0811649245974, 0.723141151758),
-                  (-0.075222704319, 0.723188594484),
-                  (-0.0692795346954, 0.723232835651),
-                  (-0.0633354908259, 0.723273878246),
-                  (-0.0573906477046, 0.723311725031),
-                  (-0.0514450802414, 0.72334637855),
-                  (-0.0454988632839, 0.723377841123),
-                  (-0.0395520716393, 0.723406114855),
-                  (-0.0336047800957, 0.723431201634),
-                  (-0.0276570634435, 0.723453103134),
-                  (-0.021708996497, 0.723471820813)]},
- 99: {'color': 'skyblue',
-      'polygon': [(-0.225176269592, 0.721114606762),
-                  (-0.225230566339, 0.718400422116),
-                  (-0.225284521267, 0.715683563032),
-                  (-0.22533813568, 0.712964050503),
-                  (-0.225391410898, 0.710241905302),
-                  (-0.225444348255, 0.70751714798),
-                  (-0.225496949101, 0.704789798873),
-                  (-0.225549214795, 0.702059878107),
-                  (-0.225601146711, 0.699327405597),
-                  (-0.225652746231, 0.696592401056),
-                  (-0.225704014748, 0.693854883994),
-                  (-0.225754953664, 0.691114873724),
-                  (-0.225805564389, 0.688372389367),
-                  (-0.22585584834, 0.68562744985),
-                  (-0.225905806941, 0.682880073914),
-                  (-0.22595544162, 0.680130280117),
-                  (-0.226004753813, 0.677378086834),
-                  (-0.226053744958, 0.674623512263),
-                  (-0.226102416496, 0.671866574429),
-                  (-0.226150769871, 0.669107291183),
-                  (-0.226198806531, 0.666345680207),
-                  (-0.226246527922, 0.66358175902),
-                  (-0.226293935494, 0.660815544975),
-                  (-0.226341030696, 0.658047055267),
-                  (-0.226387814975, 0.655276306932),
-                  (-0.226434289778, 0.652503316854),
-                  (-0.226480456551, 0.649728101764),
-                  (-0.226526316737, 0.646950678241),
-                  (-0.226571871777, 0.644171062722),
-                  (-0.226617123106, 0.641389271496),
-                  (-0.226662072158, 0.638605320713),
-                  (-0.226706720363, 0.635819226383),
-                  (-0.226751069144, 0.633031004378),
-                  (-0.23269116334, 0.63292191347),
-                  (-0.238628382929, 0.632810044511),
-                  (-0.244562646008, 0.632695389407),
-                  (-0.250493870036, 0.632577939735),
-                  (-0.256421971828, 0.632457686737),
-                  (-0.262346867536, 0.63233462131),
-                  (-0.268268472636, 0.632208733996),
-                  (-0.274186701919, 0.632080014971),
-                  (-0.280101469472, 0.631948454037),
-                  (-0.286012688673, 0.631814040613),
-                  (-0.291920272174, 0.631676763722),
-                  (-0.297824131894, 0.631536611988),
-                  (-0.303724179005, 0.631393573618),
-                  (-0.309620323929, 0.631247636402),
-                  (-0.31551247632, 0.631098787696),
-                  (-0.321400545062, 0.630947014418),
-                  (-0.327284438262, 0.630792303036),
-                  (-0.333164063239, 0.630634639562),
-                  (-0.339039326519, 0.630474009542),
-                  (-0.344910133834, 0.63031039805),
-                  (-0.35077639011, 0.630143789675),
-                  (-0.356637999469, 0.62997416852),
-                  (-0.362494865227, 0.62980151819),
-                  (-0.368346889884, 0.629625821787),
-                  (-0.374193975133, 0.629447061903),
-                  (-0.380036021853, 0.629265220615),
-                  (-0.385872930113, 0.629080279476),
-                  (-0.391704599171, 0.628892219513),
-                  (-0.397530927482, 0.628701021221),
-                  (-0.403351812695, 0.628506664558),
-                  (-0.409167151663, 0.628309128942),
-                  (-0.414976840448, 0.628108393248),
-                  (-0.414886340055, 0.630867686488),
-                  (-0.414795245842, 0.633624700666),
-                  (-0.414703555498, 0.636379418175),
-                  (-0.414611266711, 0.639131821265),
-                  (-0.41451837717, 0.641881892046),
-                  (-0.414424884568, 0.644629612478),
-                  (-0.4143307866, 0.647374964377),
-                  (-0.414236080965, 0.650117929406),
-                  (-0.414140765367, 0.652858489078),
-                  (-0.414044837516, 0.655596624754),
-                  (-0.413948295127, 0.658332317634),
-                  (-0.413851135924, 0.661065548764),
-                  (-0.413753357638, 0.663796299026),
-                  (-0.41365495801, 0.666524549143),
-                  (-0.41355593479, 0.669250279669),
-                  (-0.413456285741, 0.671973470991),
-                  (-0.413356008636, 0.674694103329),
-                  (-0.413255101263, 0.677412156725),
-                  (-0.413153561422, 0.680127611052),
-                  (-0.413051386932, 0.682840446),
-                  (-0.412948575624, 0.685550641083),
-                  (-0.412845125349, 0.68825817563),
-                  (-0.412741033978, 0.690963028785),
-                  (-0.412636299398, 0.693665179504),
-                  (-0.41253091952, 0.696364606551),
-                  (-0.412424892276, 0.6990612885),
-                  (-0.412318215624, 0.701755203723),
-                  (-0.412210887543, 0.704446330397),
-                  (-0.412102906041, 0.707134646495),
-                  (-0.411994269153, 0.709820129784),
-                  (-0.411884974942, 0.712502757823),
-                  (-0.411775021503, 0.715182507961),
-                  (-0.406019762649, 0.715425450093),
-                  (-0.400258596058, 0.715664449692),
-                  (-0.394491627147, 0.715899534116),
-                  (-0.388718960767, 0.716130730075),
-                  (-0.382940701184, 0.716358063633),
-                  (-0.377156952064, 0.71658156021),
-                  (-0.371367816447, 0.716801244589),
-                  (-0.365573396737, 0.71701714092),
-                  (-0.359773794685, 0.717229272726),
-                  (-0.353969111379, 0.717437662908),
-                  (-0.348159447228, 0.717642333754),
-                  (-0.342344901954, 0.71784330694),
-                  (-0.336525574588, 0.718040603545),
-                  (-0.330701563455, 0.718234244053),
-                  (-0.324872966173, 0.718424248361),
-                  (-0.319039879649, 0.718610635792),
-                  (-0.313202400075, 0.718793425097),
-                  (-0.307360622922, 0.718972634469),
-                  (-0.301514642948, 0.719148281548),
-                  (-0.295664554189, 0.719320383433),
-                  (-0.289810449969, 0.719488956691),
-                  (-0.283952422895, 0.719654017364),
-                  (-0.278090564868, 0.71981558098),
-                  (-0.27222496708, 0.719973662567),
-                  (-0.266355720029, 0.720128276654),
-                  (-0.260482913516, 0.72027943729),
-                  (-0.25460663666, 0.720427158046),
-                  (-0.248726977903, 0.720571452032),
-                  (-0.242844025021, 0.720712331902),
-                  (-0.236957865132, 0.720849809867),
-                  (-0.231068584709, 0.720983897703),
-                  (-0.225176269592, 0.721114606762)]},
- 100: {'color': 'skyblue',
-       'polygon': [(0.694125990395, -0.3396108299),
-                   (0.6939452142, -0.345430333676),
-                   (0.693761012662, -0.351244908243),
-                   (0.693573374812, -0.357054454652),
-                   (0.693382289731, -0.362858873495),
-                   (0.69318774656, -0.368658064922),
-                   (0.69298973452, -0.374451928662),
-                   (0.692788242928, -0.380240364036),
-                   (0.692583261213, -0.386023269983),
-                   (0.692374778937, -0.39180054508),
-                   (0.692162785813, -0.397572087561),
-                   (0.691947271725, -0.403337795347),
-                   (0.691728226749, -0.40909756607),
-                   (0.691505641175, -0.414851297096),
-                   (0.69127950553, -0.420598885559),
-                   (0.691049810603, -0.426340228388),
-                   (0.690816547465, -0.432075222337),
-                   (0.690579707502, -0.43780376402),
-                   (0.690339282437, -0.443525749944),
-                   (0.690095264358, -0.449241076544),
-                   (0.68984764575, -0.45494964022),
-                   (0.689596419524, -0.460651337378),
-                   (0.689341579046, -0.466346064464),
-                   (0.689083118175, -0.47203371801),
-                   (0.688821031294, -0.477714194677),
-                   (0.688555313345, -0.483387391295),
-                   (0.688285959867, -0.489053204913),
-                   (0.688012967035, -0.494711532843),
-                   (0.687736331698, -0.500362272712),
-                   (0.687456051423, -0.506005322509),
-                   (0.687172124535, -0.511640580636),
-                   (0.686884550162, -0.517267945967),
-                   (0.686593328284, -0.522887317893),
-                   (0.683915797634, -0.523036450299),
-                   (0.681235765392, -0.523184662802),
-                   (0.678553240064, -0.523331962197),
-                   (0.675868230347, -0.523478355152),
-                   (0.673180745122, -0.523623848215),
-                   (0.67049079345, -0.523768447812),
-                   (0.667798384568, -0.52391216025),
-                   (0.66510352788, -0.524054991723),
-                   (0.662406232955, -0.524196948307),
-                   (0.659706509521, -0.524338035971),
-                   (0.657004367463, -0.52447826057),
-                   (0.654299816815, -0.524617627855),
-                   (0.651592867754, -0.524756143467),
-                   (0.648883530602, -0.524893812948),
-                   (0.646171815814, -0.525030641736),
-                   (0.643457733979, -0.525166635168),
-                   (0.640741295814, -0.525301798485),
-                   (0.638022512157, -0.52543613683),
-                   (0.635301393967, -0.525569655254),
-                   (0.632577952319, -0.525702358714),
-                   (0.629852198397, -0.525834252075),
-                   (0.627124143493, -0.525965340117),
-                   (0.624393799003, -0.526095627527),
-                   (0.621661176419, -0.526225118912),
-                   (0.618926287334, -0.526353818791),
-                   (0.616189143428, -0.526481731603),
-                   (0.613449756471, -0.526608861705),
-                   (0.610708138318, -0.526735213375),
-                   (0.607964300905, -0.526860790814),
-                   (0.605218256243, -0.526985598147),
-                   (0.602470016422, -0.527109639424),
-                   (0.5997195936, -0.527232918621),
-                   (0.599962466716, -0.521553852625),
-                   (0.600202067742, -0.515867123926),
-                   (0.600438409327, -0.510172835494),
-                   (0.600671504416, -0.504471090366),
-                   (0.600901366216, -0.498761991612),
-                   (0.601128008172, -0.493045642297),
-                   (0.60135144393, -0.487322145454),
-                   (0.601571687319, -0.481591604046),
-                   (0.601788752319, -0.47585412094),
-                   (0.60200265304, -0.470109798871),
-                   (0.6022134037, -0.464358740417),
-                   (0.602421018599, -0.458601047969),
-                   (0.602625512102, -0.452836823702),
-                   (0.602826898616, -0.447066169555),
-                   (0.603025192575, -0.441289187195),
-                   (0.603220408419, -0.435505978004),
-                   (0.603412560579, -0.429716643048),
-                   (0.60360166346, -0.423921283057),
-                   (0.603787731427, -0.418119998406),
-                   (0.603970778791, -0.412312889089),
-                   (0.604150819796, -0.406500054707),
-                   (0.604327868604, -0.400681594444),
-                   (0.604501939287, -0.394857607052),
-                   (0.604673045814, -0.389028190834),
-                   (0.60484120204, -0.383193443632),
-                   (0.6050064217, -0.377353462807),
-                   (0.605168718393, -0.371508345229),
-                   (0.605328105583, -0.365658187265),
-                   (0.605484596584, -0.359803084768),
-                   (0.605638204555, -0.353943133064),
-                   (0.605788942493, -0.348078426945),
-                   (0.60593682323, -0.342209060658),
-                   (0.608727236626, -0.342135028183),
-                   (0.611515569733, -0.342060560337),
-                   (0.614301808173, -0.341985654912),
-                   (0.617085937536, -0.341910309648),
-                   (0.619867943377, -0.341834522225),
-                   (0.622647811221, -0.341758290268),
-                   (0.625425526565, -0.341681611341),
-                   (0.628201074875, -0.341604482945),
-                   (0.630974441591, -0.341526902521),
-                   (0.633745612128, -0.341448867444),
-                   (0.636514571875, -0.341370375024),
-                   (0.639281306202, -0.341291422503),
-                   (0.642045800453, -0.341212007054),
-                   (0.644808039956, -0.341132125779),
-                   (0.647568010019, -0.341051775707),
-                   (0.650325695937, -0.340970953792),
-                   (0.653081082985, -0.340889656914),
-                   (0.65583415643, -0.340807881871),
-                   (0.658584901526, -0.340725625385),
-                   (0.661333303517, -0.340642884095),
-                   (0.664079347642, -0.340559654554),
-                   (0.666823019131, -0.340475933233),
-                   (0.669564303215, -0.340391716512),
-                   (0.67230318512, -0.340307000683),
-                   (0.675039650074, -0.340221781946),
-                   (0.677773683307, -0.340136056408),
-                   (0.680505270056, -0.340049820077),
-                   (0.683234395562, -0.339963068866),
-                   (0.685961045079, -0.339875798587),
-                   (0.688685203868, -0.339788004948),
-                   (0.691406857209, -0.339699683553),
-                   (0.694125990395, -0.3396108299)]},
- 101: {'color': 'violet',
-       'polygon': [(-0.623444661602, -0.34269934079),
-                   (-0.623285278586, -0.348562157588),
-                   (-0.623122955728, -0.354420294076),
-                   (-0.622957678339, -0.360273659536),
-                   (-0.622789431494, -0.366122162703),
-                   (-0.622618200022, -0.37196571174),
-                   (-0.622443968513, -0.377804214214),
-                   (-0.62226672131, -0.383637577066),
-                   (-0.622086442514, -0.389465706582),
-                   (-0.621903115978, -0.395288508361),
-                   (-0.62171672531, -0.40110588728),
-                   (-0.621527253865, -0.406917747459),
-                   (-0.621334684752, -0.41272399222),
-                   (-0.621139000821, -0.418524524051),
-                   (-0.620940184671, -0.424319244559),
-                   (-0.620738218641, -0.430108054424),
-                   (-0.620533084808, -0.435890853355),
-                   (-0.620324764984, -0.441667540033),
-                   (-0.620113240716, -0.447438012063),
-                   (-0.619898493277, -0.453202165914),
-                   (-0.619680503662, -0.458959896859),
-                   (-0.619459252589, -0.464711098915),
-                   (-0.619234720488, -0.470455664771),
-                   (-0.619006887499, -0.476193485728),
-                   (-0.618775733465, -0.481924451615),
-                   (-0.618541237925, -0.48764845072),
-                   (-0.61830338011, -0.493365369709),
-                   (-0.618062138933, -0.499075093538),
-                   (-0.617817492985, -0.504777505367),
-                   (-0.61756942052, -0.510472486469),
-                   (-0.617317899456, -0.516159916131),
-                   (-0.617062907356, -0.521839671555),
-                   (-0.616804421425, -0.527511627753),
-                   (-0.619545561231, -0.527387428993),
-                   (-0.62228443171, -0.527262387442),
-                   (-0.625021017048, -0.527136498098),
-                   (-0.627755301332, -0.527009755898),
-                   (-0.630487268551, -0.526882155718),
-                   (-0.633216902591, -0.526753692372),
-                   (-0.635944187236, -0.52662436061),
-                   (-0.638669106166, -0.526494155122),
-                   (-0.641391642954, -0.526363070529),
-                   (-0.644111781066, -0.52623110139),
-                   (-0.646829503861, -0.526098242197),
-                   (-0.649544794585, -0.525964487379),
-                   (-0.652257636372, -0.525829831292),
-                   (-0.654968012243, -0.52569426823),
-                   (-0.657675905103, -0.525557792415),
-                   (-0.660381297741, -0.525420398),
-                   (-0.663084172824, -0.52528207907),
-                   (-0.665784512901, -0.525142829638),
-                   (-0.668482300397, -0.525002643645),
-                   (-0.671177517615, -0.52486151496),
-                   (-0.673870146728, -0.524719437379),
-                   (-0.676560169785, -0.524576404624),
-                   (-0.679247568702, -0.524432410344),
-                   (-0.681932325265, -0.52428744811),
-                   (-0.684614421126, -0.524141511419),
-                   (-0.687293837801, -0.523994593689),
-                   (-0.689970556668, -0.523846688262),
-                   (-0.692644558967, -0.523697788401),
-                   (-0.695315825794, -0.523547887288),
-                   (-0.697984338103, -0.523396978027),
-                   (-0.700650076702, -0.523245053639),
-                   (-0.703313022249, -0.523092107065),
-                   (-0.703624807455, -0.517484446451),
-                   (-0.703932448946, -0.511868437393),
-                   (-0.70423596806, -0.506244216132),
-                   (-0.704535385983, -0.500611916457),
-                   (-0.704830723755, -0.494971669829),
-                   (-0.705122002275, -0.489323605483),
-                   (-0.705409242297, -0.483667850538),
-                   (-0.705692464437, -0.478004530098),
-                   (-0.70597168917, -0.472333767347),
-                   (-0.706246936834, -0.466655683644),
-                   (-0.706518227626, -0.460970398607),
-                   (-0.706785581607, -0.4552780302),
-                   (-0.707049018695, -0.449578694816),
-                   (-0.707308558673, -0.443872507347),
-                   (-0.707564221178, -0.438159581261),
-                   (-0.707816025707, -0.432440028671),
-                   (-0.708063991611, -0.4267139604),
-                   (-0.708308138096, -0.420981486045),
-                   (-0.708548484219, -0.415242714033),
-                   (-0.708785048884, -0.409497751683),
-                   (-0.709017850844, -0.403746705252),
-                   (-0.709246908694, -0.397989679993),
-                   (-0.70947224087, -0.392226780199),
-                   (-0.709693865645, -0.386458109247),
-                   (-0.709911801125, -0.380683769643),
-                   (-0.710126065247, -0.374903863062),
-                   (-0.710336675776, -0.369118490386),
-                   (-0.710543650299, -0.363327751738),
-                   (-0.710747006222, -0.357531746516),
-                   (-0.710946760767, -0.351730573427),
-                   (-0.711142930968, -0.345924330515),
-                   (-0.711335533665, -0.340113115185),
-                   (-0.708627007987, -0.34020211768),
-                   (-0.705915835839, -0.340290559352),
-                   (-0.703202037684, -0.340378443871),
-                   (-0.700485633773, -0.34046577485),
-                   (-0.697766644155, -0.340552555845),
-                   (-0.695045088677, -0.340638790358),
-                   (-0.692320986987, -0.340724481834),
-                   (-0.689594358536, -0.340809633666),
-                   (-0.686865222584, -0.340894249192),
-                   (-0.684133598199, -0.340978331699),
-                   (-0.681399504263, -0.341061884424),
-                   (-0.678662959474, -0.341144910551),
-                   (-0.675923982348, -0.341227413216),
-                   (-0.673182591222, -0.341309395505),
-                   (-0.670438804257, -0.341390860459),
-                   (-0.667692639441, -0.341471811068),
-                   (-0.664944114592, -0.341552250279),
-                   (-0.662193247359, -0.341632180991),
-                   (-0.659440055227, -0.341711606059),
-                   (-0.656684555516, -0.341790528295),
-                   (-0.653926765388, -0.341868950467),
-                   (-0.651166701847, -0.3419468753),
-                   (-0.64840438174, -0.34202430548),
-                   (-0.645639821763, -0.342101243647),
-                   (-0.642873038461, -0.342177692407),
-                   (-0.640104048233, -0.342253654321),
-                   (-0.637332867328, -0.342329131914),
-                   (-0.634559511858, -0.342404127672),
-                   (-0.631783997788, -0.342478644045),
-                   (-0.62900634095, -0.342552683444),
-                   (-0.626226557034, -0.342626248245),
-                   (-0.623444661602, -0.34269934079)]},
- 102: {'color': 'skyblue',
-       'polygon': [(0.686497826859, 0.523493913782),
-                   (0.686791857419, 0.517873051843),
-                   (0.687081920761, 0.51224395386),
-                   (0.687368035591, 0.506606756261),
-                   (0.687650220597, 0.500961593259),
-                   (0.687928494441, 0.495308596944),
-                   (0.688202875749, 0.489647897364),
-                   (0.68847338311, 0.483979622612),
-                   (0.688740035059, 0.478303898899),
-                   (0.689002850079, 0.472620850628),
-                   (0.689261846587, 0.466930600467),
-                   (0.68951704293, 0.461233269416),
-                   (0.689768457376, 0.455528976869),
-                   (0.690016108108, 0.449817840681),
-                   (0.690260013216, 0.44409997722),
-                   (0.690500190689, 0.438375501429),
-                   (0.690736658409, 0.432644526874),
-                   (0.690969434146, 0.4269071658),
-                   (0.691198535547, 0.421163529175),
-                   (0.69142398013, 0.41541372674),
-                   (0.691645785282, 0.409657867049),
-                   (0.691863968247, 0.403896057514),
-                   (0.692078546121, 0.398128404441),
-                   (0.692289535846, 0.392355013074),
-                   (0.692496954206, 0.386575987625),
-                   (0.692700817817, 0.380791431308),
-                   (0.692901143124, 0.375001446377),
-                   (0.693097946393, 0.369206134152),
-                   (0.693291243707, 0.36340559505),
-                   (0.69348105096, 0.357599928613),
-                   (0.693667383852, 0.351789233533),
-                   (0.693850257884, 0.345973607679),
-                   (0.694029688349, 0.340153148122),
-                   (0.691309107674, 0.340243335855),
-                   (0.688585982199, 0.340333041061),
-                   (0.685860328906, 0.340422262447),
-                   (0.6831321647, 0.340510998841),
-                   (0.680401506404, 0.340599249196),
-                   (0.677668370763, 0.340687012584),
-                   (0.674932774446, 0.340774288191),
-                   (0.672194734041, 0.340861075313),
-                   (0.669454266057, 0.34094737336),
-                   (0.666711386926, 0.341033181843),
-                   (0.663966113, 0.341118500377),
-                   (0.661218460553, 0.341203328678),
-                   (0.658468445782, 0.341287666556),
-                   (0.655716084802, 0.341371513917),
-                   (0.652961393654, 0.341454870755),
-                   (0.650204388299, 0.341537737155),
-                   (0.647445084618, 0.341620113284),
-                   (0.644683498418, 0.341701999394),
-                   (0.641919645425, 0.341783395813),
-                   (0.63915354129, 0.34186430295),
-                   (0.636385201585, 0.341944721286),
-                   (0.633614641804, 0.342024651375),
-                   (0.630841877367, 0.342104093838),
-                   (0.628066923614, 0.342183049365),
-                   (0.625289795809, 0.34226151871),
-                   (0.622510509142, 0.342339502689),
-                   (0.619729078723, 0.342417002177),
-                   (0.61694551959, 0.342494018107),
-                   (0.614159846702, 0.342570551467),
-                   (0.611372074944, 0.342646603299),
-                   (0.608582219126, 0.342722174694),
-                   (0.605790293983, 0.342797266793),
-                   (0.605642890069, 0.348666559375),
-                   (0.605492630787, 0.354531241896),
-                   (0.605339501499, 0.36039122261),
-                   (0.605183487279, 0.366246409095),
-                   (0.605024572918, 0.372096708229),
-                   (0.60486274292, 0.377942026177),
-                   (0.604697981505, 0.383782268366),
-                   (0.604530272606, 0.389617339462),
-                   (0.604359599874, 0.395447143347),
-                   (0.604185946674, 0.401271583095),
-                   (0.604009296085, 0.407090560941),
-                   (0.603829630905, 0.412903978259),
-                   (0.603646933646, 0.418711735525),
-                   (0.603461186538, 0.424513732293),
-                   (0.603272371528, 0.430309867155),
-                   (0.603080470281, 0.43610003771),
-                   (0.602885464178, 0.441884140524),
-                   (0.602687334321, 0.447662071096),
-                   (0.60248606153, 0.453433723808),
-                   (0.602281626344, 0.459198991892),
-                   (0.602074009023, 0.464957767374),
-                   (0.601863189546, 0.470709941034),
-                   (0.601649147614, 0.47645540235),
-                   (0.601431862649, 0.482194039447),
-                   (0.601211313792, 0.487925739042),
-                   (0.600987479908, 0.493650386381),
-                   (0.600760339584, 0.49936786518),
-                   (0.600529871128, 0.505078057563),
-                   (0.600296052568, 0.510780843986),
-                   (0.600058861658, 0.516476103173),
-                   (0.59981827587, 0.522163712039),
-                   (0.599574272399, 0.527843545609),
-                   (0.602326573993, 0.527719853418),
-                   (0.605076689966, 0.527595382921),
-                   (0.607824607006, 0.527470132458),
-                   (0.610570311795, 0.527344100432),
-                   (0.613313791012, 0.527217285307),
-                   (0.616055031329, 0.52708968562),
-                   (0.618794019419, 0.526961299974),
-                   (0.621530741951, 0.526832127046),
-                   (0.624265185594, 0.526702165588),
-                   (0.626997337018, 0.526571414432),
-                   (0.629727182893, 0.526439872488),
-                   (0.632454709891, 0.526307538753),
-                   (0.635179904689, 0.526174412307),
-                   (0.637902753966, 0.526040492324),
-                   (0.640623244408, 0.525905778067),
-                   (0.643341362707, 0.525770268896),
-                   (0.646057095561, 0.525633964272),
-                   (0.64877042968, 0.525496863754),
-                   (0.651481351779, 0.525358967011),
-                   (0.654189848589, 0.525220273817),
-                   (0.656895906848, 0.525080784058),
-                   (0.659599513311, 0.524940497739),
-                   (0.662300654746, 0.524799414979),
-                   (0.664999317936, 0.524657536023),
-                   (0.667695489682, 0.524514861239),
-                   (0.670389156803, 0.524371391128),
-                   (0.673080306136, 0.524227126321),
-                   (0.675768924542, 0.524082067588),
-                   (0.6784549989, 0.523936215838),
-                   (0.681138516115, 0.523789572126),
-                   (0.683819463116, 0.523642137655),
-                   (0.686497826859, 0.523493913782)]},
- 103: {'color': 'violet',
-       'polygon': [(-0.617807535729, 0.52644143429),
-                   (-0.618056795636, 0.520769734707),
-                   (-0.618302586307, 0.51509008661),
-                   (-0.618544924258, 0.509402623178),
-                   (-0.618783826187, 0.503707475805),
-                   (-0.619019308951, 0.498004774139),
-                   (-0.61925138954, 0.492294646108),
-                   (-0.619480085061, 0.486577217962),
-                   (-0.619705412707, 0.480852614296),
-                   (-0.619927389748, 0.475120958086),
-                   (-0.620146033502, 0.469382370719),
-                   (-0.620361361325, 0.463636972024),
-                   (-0.620573390587, 0.457884880302),
-                   (-0.620782138659, 0.452126212356),
-                   (-0.620987622895, 0.446361083519),
-                   (-0.621189860619, 0.440589607686),
-                   (-0.62138886911, 0.434811897342),
-                   (-0.621584665587, 0.429028063587),
-                   (-0.621777267197, 0.42323821617),
-                   (-0.621966691003, 0.417442463513),
-                   (-0.622152953972, 0.411640912741),
-                   (-0.622336072963, 0.405833669706),
-                   (-0.622516064718, 0.400020839019),
-                   (-0.622692945852, 0.394202524074),
-                   (-0.622866732843, 0.388378827076),
-                   (-0.623037442023, 0.382549849067),
-                   (-0.623205089568, 0.376715689951),
-                   (-0.623369691495, 0.370876448525),
-                   (-0.623531263649, 0.3650322225),
-                   (-0.623689821699, 0.359183108528),
-                   (-0.623845381133, 0.353329202231),
-                   (-0.623997957246, 0.347470598222),
-                   (-0.624147565141, 0.341607390134),
-                   (-0.62693021108, 0.341530211164),
-                   (-0.629710713112, 0.341452549044),
-                   (-0.632489055652, 0.341374401726),
-                   (-0.635265223019, 0.341295767167),
-                   (-0.638039199437, 0.341216643331),
-                   (-0.64081096903, 0.341137028194),
-                   (-0.643580515827, 0.341056919737),
-                   (-0.646347823755, 0.340976315956),
-                   (-0.649112876644, 0.340895214857),
-                   (-0.651875658223, 0.340813614458),
-                   (-0.65463615212, 0.340731512793),
-                   (-0.657394341862, 0.340648907909),
-                   (-0.660150210874, 0.34056579787),
-                   (-0.662903742476, 0.340482180759),
-                   (-0.665654919885, 0.340398054675),
-                   (-0.668403726215, 0.340313417738),
-                   (-0.671150144473, 0.34022826809),
-                   (-0.673894157561, 0.340142603894),
-                   (-0.676635748275, 0.340056423337),
-                   (-0.679374899301, 0.339969724631),
-                   (-0.682111593219, 0.339882506013),
-                   (-0.684845812501, 0.33979476575),
-                   (-0.687577539508, 0.339706502137),
-                   (-0.690306756491, 0.339617713498),
-                   (-0.693033445591, 0.33952839819),
-                   (-0.695757588835, 0.339438554604),
-                   (-0.698479168142, 0.339348181165),
-                   (-0.701198165315, 0.339257276333),
-                   (-0.703914562044, 0.339165838608),
-                   (-0.706628339904, 0.339073866528),
-                   (-0.709339480357, 0.338981358672),
-                   (-0.712047964749, 0.338888313662),
-                   (-0.71186502643, 0.34470063017),
-                   (-0.711678494705, 0.350508067502),
-                   (-0.711488354229, 0.356310524745),
-                   (-0.711294589634, 0.362107899864),
-                   (-0.711097185542, 0.367900089666),
-                   (-0.710896126579, 0.373686989775),
-                   (-0.710691397391, 0.379468494608),
-                   (-0.710482982664, 0.385244497338),
-                   (-0.710270867137, 0.391014889876),
-                   (-0.710055035623, 0.396779562835),
-                   (-0.709835473023, 0.402538405506),
-                   (-0.709612164352, 0.408291305828),
-                   (-0.709385094754, 0.41403815036),
-                   (-0.709154249522, 0.419778824252),
-                   (-0.708919614124, 0.425513211216),
-                   (-0.708681174222, 0.4312411935),
-                   (-0.708438915694, 0.436962651856),
-                   (-0.708192824661, 0.442677465511),
-                   (-0.707942887512, 0.448385512141),
-                   (-0.707689090925, 0.454086667841),
-                   (-0.7074314219, 0.459780807093),
-                   (-0.707169867781, 0.465467802739),
-                   (-0.706904416289, 0.471147525951),
-                   (-0.706635055548, 0.476819846202),
-                   (-0.706361774118, 0.482484631235),
-                   (-0.706084561028, 0.488141747034),
-                   (-0.705803405805, 0.493791057791),
-                   (-0.70551829851, 0.499432425881),
-                   (-0.705229229776, 0.505065711826),
-                   (-0.70493619084, 0.510690774265),
-                   (-0.704639173583, 0.516307469927),
-                   (-0.704338170568, 0.521915653595),
-                   (-0.701674500724, 0.522070705416),
-                   (-0.699008069981, 0.522224849644),
-                   (-0.69633889367, 0.5223780889),
-                   (-0.693666987135, 0.522530425849),
-                   (-0.690992365734, 0.522681863202),
-                   (-0.688315044833, 0.522832403711),
-                   (-0.685635039807, 0.522982050168),
-                   (-0.682952366039, 0.523130805404),
-                   (-0.680267038917, 0.523278672283),
-                   (-0.677579073832, 0.523425653709),
-                   (-0.674888486176, 0.523571752614),
-                   (-0.672195291343, 0.523716971966),
-                   (-0.669499504725, 0.52386131476),
-                   (-0.666801141712, 0.524004784021),
-                   (-0.664100217689, 0.524147382798),
-                   (-0.661396748037, 0.524289114168),
-                   (-0.658690748129, 0.524429981231),
-                   (-0.655982233328, 0.524569987108),
-                   (-0.653271218991, 0.524709134943),
-                   (-0.650557720461, 0.524847427897),
-                   (-0.64784175307, 0.524984869152),
-                   (-0.645123332136, 0.525121461902),
-                   (-0.642402472961, 0.525257209361),
-                   (-0.639679190834, 0.525392114755),
-                   (-0.636953501024, 0.525526181322),
-                   (-0.634225418782, 0.525659412312),
-                   (-0.63149495934, 0.525791810986),
-                   (-0.628762137909, 0.525923380614),
-                   (-0.626026969678, 0.526054124471),
-                   (-0.623289469813, 0.526184045843),
-                   (-0.620549653458, 0.526313148018),
-                   (-0.617807535729, 0.52644143429)]}}
+#
+# ccd_info.py -- outlines of the HSC CCDs in the focal plane
+#
+# This is open-source software licensed under a BSD license.
+# Please see the file LICENSE.txt for details.
+#
+"""
+The outlines of the HSC CCDs, as polygons of (dRa, dDec) offsets (deg)
+from the field center, with a color for drawing each CCD, the
+channels that are bad, if any, and the direction in which the channels
+are read out.
+
+The table is stored in the binary file data/ccd_info.npz, which is only
+loaded the first time it is needed.  `info` is a dictionary keyed by
+DET-ID, for example::
+
+    from naoj.hsc.ccd_info import info
+    info[0]  # {'bad_channels': [3], 'channel_dir': (0.0, -1.0),
+             #  'color': 'red', 'polygon': [...]}
+
+get_polygons() returns the vertices as arrays instead, for vectorized
+calculations, and find_ccd() looks up the CCD (and channel) on which
+each of an array of (dRa, dDec) offsets falls.
+"""
+import os
+import threading
+
+import numpy as np
+from matplotlib.path import Path
+
+ccd_info_file = os.path.join(os.path.dirname(__file__), 'data',
+                             'ccd_info.npz')
+
+_lock = threading.Lock()
+_polygons = None
+_info = None
+_locator = None
+
+
+def load_polygons(filepath=ccd_info_file):
+    """
+    Load the CCD outlines from a file written by save_info().
+
+    Parameters
+    ----------
+    filepath : str (optional)
+        path of the .npz file.  Default: the file in the package
+
+    Returns
+    -------
+    tab : dict
+        'det_ids' : ndarray of the DET-IDs of the CCDs (int)
+        'offsets' : ndarray of offsets into 'vertices', such that the
+            outline of CCD det_ids[i] is vertices[offsets[i]:offsets[i+1]]
+        'vertices' : (n, 2) ndarray of the (dRa, dDec) vertices
+        'colors' : ndarray of the colors of the CCDs (str)
+        'bad_offsets' : ndarray of offsets into 'bad_channels', like
+            'offsets'
+        'bad_channels' : ndarray of the bad channels of all CCDs (int)
+        'channel_dirs' : (n, 2) ndarray of the (dRa, dDec) direction in
+            which the channels of each CCD go from 1 to 4 (see
+            channel_direction())
+    """
+    with np.load(filepath) as npz:
+        return {key: npz[key] for key in npz.files}
+
+
+def save_info(filepath, info):
+    """
+    Save a dictionary of CCD outlines, in the form of `info`, to a file.
+
+    Parameters
+    ----------
+    filepath : str
+        path of the .npz file to write
+    info : dict
+        a dictionary of CCD outlines keyed by DET-ID, like `info`
+    """
+    det_ids = sorted(info.keys())
+    polygons = [np.asarray(info[det_id]['polygon'], dtype=np.float64)
+                for det_id in det_ids]
+    bad_channels = [info[det_id].get('bad_channels', [])
+                    for det_id in det_ids]
+    channel_dirs = [info[det_id]['channel_dir'] for det_id in det_ids]
+    np.savez(filepath,
+             det_ids=np.array(det_ids, dtype=np.int32),
+             offsets=np.cumsum([0] + [len(p) for p in polygons]),
+             vertices=np.concatenate(polygons),
+             colors=np.array([info[det_id]['color'] for det_id in det_ids]),
+             bad_offsets=np.cumsum([0] + [len(l) for l in bad_channels]),
+             bad_channels=np.array(sum(bad_channels, []), dtype=np.int32),
+             channel_dirs=np.array(channel_dirs, dtype=np.float64))
+
+
+def get_polygons():
+    """
+    Get the CCD outlines as arrays (see load_polygons()).  The table is
+    loaded on the first call.
+    """
+    global _polygons
+    with _lock:
+        if _polygons is None:
+            _polygons = load_polygons()
+        return _polygons
+
+
+def get_info():
+    """
+    Get the dictionary of CCD outlines keyed by DET-ID (see `info`).
+    The dictionary is built on the first call.
+    """
+    global _info
+    tab = get_polygons()
+    with _lock:
+        if _info is None:
+            offsets, bad_offsets = tab['offsets'], tab['bad_offsets']
+            info = {}
+            for i, det_id in enumerate(tab['det_ids'].tolist()):
+                d = {}
+                bad_channels = tab['bad_channels'][bad_offsets[i]:
+                                                   bad_offsets[i + 1]]
+                if len(bad_channels) > 0:
+                    d['bad_channels'] = bad_channels.tolist()
+                d['channel_dir'] = tuple(tab['channel_dirs'][i].tolist())
+                d['color'] = str(tab['colors'][i])
+                d['polygon'] = list(map(tuple, tab['vertices'][offsets[i]:
+                                                               offsets[i + 1]]
+                                        .tolist()))
+                info[det_id] = d
+            _info = info
+        return _info
+
+
+def channel_direction(fliph, flipv, swapxy):
+    """
+    Get the direction on the sky in which the channels of a CCD go from 1
+    to 4 (the raw X axis), from the flips and swap that hsc_dr applies to
+    the raw CCD image to orient it in the mosaic (see
+    hsc_dr.get_ccd_data()).
+
+    The oriented images are taken to have X along -dDec and Y along -dRa,
+    which puts the serial registers of the CCDs on the outer edges of
+    each half of the focal plane.
+
+    Parameters
+    ----------
+    fliph, flipv, swapxy : bool
+        the orientation of the CCD image in hsc_dr
+
+    Returns
+    -------
+    direction : tuple of float
+        the (dRa, dDec) unit vector
+    """
+    # the raw X axis is flipped, then becomes the Y axis if transposed
+    sign = 1.0 if fliph else -1.0
+    return (sign, 0.0) if swapxy else (0.0, sign)
+
+
+def _find_corners(polygon):
+    # indices of the 4 corners of a (closed) CCD outline: the vertices
+    # where the outline turns, rather than following a (slightly curved)
+    # edge
+    seg = np.diff(polygon, axis=0)
+    angle = np.arctan2(seg[:, 1], seg[:, 0])
+    turn = angle - np.roll(angle, 1)
+    turn = (turn + np.pi) % (2 * np.pi) - np.pi
+    return np.nonzero(np.abs(turn) > np.pi / 4)[0]
+
+
+class CCDLocator(object):
+    """
+    A spatial index of the HSC CCD outlines, to look up which CCD each of
+    many (dRa, dDec) offsets falls on.
+
+    The focal plane is divided into a grid of square cells; each cell
+    holds the CCDs whose bounding box overlaps it.  A lookup bins the
+    points by cell and then tests each CCD's outline only against the
+    points in its cells.
+
+    Parameters
+    ----------
+    tab : dict (optional)
+        CCD outlines as returned by load_polygons().  Default: the table
+        in the package
+    cell_size : float (optional)
+        size (deg) of the cells of the grid.  Default: 0.02
+
+    Notes
+    -----
+    The channel of a point is found from its position across the CCD,
+    along the short edges of the outline: the short edges are divided
+    into 4 equal parts, which are channels 1 to 4 in the readout
+    direction of the CCD ('channel_dirs', see channel_direction()).
+    Points within the curvature of the edges of a channel boundary can be
+    assigned to the neighboring channel.
+    """
+
+    def __init__(self, tab=None, cell_size=0.02):
+        if tab is None:
+            tab = get_polygons()
+        self.cell_size = cell_size
+        self.det_ids = tab['det_ids']
+        offsets, vertices = tab['offsets'], tab['vertices']
+        num_ccds = len(self.det_ids)
+
+        self.paths = []
+        # corners of each CCD, ordered so that c0->c1 is a short edge in
+        # the readout direction of the channels
+        self.corners = np.empty((num_ccds, 4, 2))
+        for i in range(num_ccds):
+            polygon = vertices[offsets[i]:offsets[i + 1]]
+            self.paths.append(Path(polygon))
+            corners = polygon[_find_corners(polygon)]
+            if len(corners) != 4:
+                raise ValueError("outline of CCD %d does not have 4 corners" % (
+                    self.det_ids[i]))
+            edges = np.hypot(*(np.roll(corners, -1, axis=0) - corners).T)
+            if edges[0] > edges[1]:
+                corners = np.roll(corners, -1, axis=0)
+            if (corners[1] - corners[0]).dot(tab['channel_dirs'][i]) < 0:
+                corners = corners[[1, 0, 3, 2]]
+            self.corners[i] = corners
+
+        bad_offsets = tab['bad_offsets']
+        self.bad_channels = [tab['bad_channels'][bad_offsets[i]:
+                                                 bad_offsets[i + 1]]
+                             for i in range(num_ccds)]
+
+        # grid of cells over the focal plane
+        self.x0, self.y0 = vertices.min(axis=0)
+        x1, y1 = vertices.max(axis=0)
+        self.nx = int(np.ceil((x1 - self.x0) / cell_size)) + 1
+        self.ny = int(np.ceil((y1 - self.y0) / cell_size)) + 1
+
+        # cells overlapped by the bounding box of each CCD
+        self.cells = []
+        for i in range(num_ccds):
+            polygon = vertices[offsets[i]:offsets[i + 1]]
+            ix0, iy0 = self._to_cell(*polygon.min(axis=0))
+            ix1, iy1 = self._to_cell(*polygon.max(axis=0))
+            iy, ix = np.mgrid[iy0:iy1 + 1, ix0:ix1 + 1]
+            self.cells.append((iy * self.nx + ix).ravel())
+
+    def _to_cell(self, x, y):
+        ix = np.floor((np.asarray(x) - self.x0) / self.cell_size)
+        iy = np.floor((np.asarray(y) - self.y0) / self.cell_size)
+        return ix.astype(np.int64), iy.astype(np.int64)
+
+    def get_channels(self, idx, pts):
+        """
+        Get the channels (1-4) of points on a CCD.
+
+        Parameters
+        ----------
+        idx : int
+            the index of the CCD in the table (not the DET-ID)
+        pts : (n, 2) ndarray
+            the (dRa, dDec) offsets (deg) of points on the CCD
+
+        Returns
+        -------
+        channels : ndarray of int8
+        """
+        c0, c1, c2, c3 = self.corners[idx]
+        # fraction of the way along the long edges...
+        long_edge = c3 - c0
+        v = (pts - c0).dot(long_edge) / long_edge.dot(long_edge)
+        # ...and across the CCD, at that height
+        p0 = c0 + v[:, np.newaxis] * long_edge
+        p1 = c1 + v[:, np.newaxis] * (c2 - c1)
+        across = p1 - p0
+        u = (np.sum((pts - p0) * across, axis=1) /
+             np.sum(across * across, axis=1))
+        return (np.clip(np.floor(u * 4), 0, 3) + 1).astype(np.int8)
+
+    def locate(self, dra, ddec, exclude_bad=True, return_channel=False):
+        """
+        Find the CCDs on which points fall.
+
+        Parameters
+        ----------
+        dra, ddec : array_like
+            offsets (deg) of the points from the field center, of the same
+            shape
+        exclude_bad : bool (optional)
+            if True, points on bad channels are treated as falling in a
+            gap.  Default: True
+        return_channel : bool (optional)
+            if True, return the channels of the points too
+
+        Returns
+        -------
+        det_ids : ndarray of int32
+            the DET-IDs of the CCDs, of the same shape as `dra`, with -1
+            for points that do not fall on a CCD
+        channels : ndarray of int8
+            (only if `return_channel` is True) the channels (1-4) of the
+            points, with 0 for points that do not fall on a CCD
+        """
+        dra, ddec = np.broadcast_arrays(np.asarray(dra, dtype=np.float64),
+                                        np.asarray(ddec, dtype=np.float64))
+        shape = dra.shape
+        pts = np.column_stack((dra.ravel(), ddec.ravel()))
+        det_ids = np.full(len(pts), -1, dtype=np.int32)
+        channels = np.zeros(len(pts), dtype=np.int8)
+
+        # bin the points by cell
+        ix, iy = self._to_cell(pts[:, 0], pts[:, 1])
+        cell = np.where((ix >= 0) & (ix < self.nx) &
+                        (iy >= 0) & (iy < self.ny),
+                        iy * self.nx + ix, -1)
+        order = np.argsort(cell, kind='stable')
+        bounds = np.searchsorted(cell[order],
+                                 np.arange(self.nx * self.ny + 1))
+
+        for i, det_id in enumerate(self.det_ids):
+            # candidate points: those in the cells of this CCD
+            cells = self.cells[i]
+            cand = np.concatenate([order[bounds[c]:bounds[c + 1]]
+                                   for c in cells])
+            if len(cand) == 0:
+                continue
+            cand = cand[self.paths[i].contains_points(pts[cand])]
+            det_ids[cand] = det_id
+
+            bad = self.bad_channels[i]
+            if return_channel or (exclude_bad and len(bad) > 0):
+                ch = self.get_channels(i, pts[cand])
+                channels[cand] = ch
+                if exclude_bad and len(bad) > 0:
+                    is_bad = np.isin(ch, bad)
+                    det_ids[cand[is_bad]] = -1
+                    channels[cand[is_bad]] = 0
+
+        if return_channel:
+            return det_ids.reshape(shape), channels.reshape(shape)
+        return det_ids.reshape(shape)
+
+
+def get_locator():
+    """
+    Get a CCDLocator for the CCD outlines in the package.  It is made on
+    the first call.
+    """
+    global _locator
+    tab = get_polygons()
+    with _lock:
+        if _locator is None:
+            _locator = CCDLocator(tab)
+        return _locator
+
+
+def find_ccd(dra, ddec, exclude_bad=True, return_channel=False):
+    """
+    Find the CCDs on which points fall (see CCDLocator.locate()).
+
+    Parameters
+    ----------
+    dra, ddec : array_like
+        offsets (deg) of the points from the field center
+    exclude_bad : bool (optional)
+        if True, points on bad channels are treated as falling in a gap.
+        Default: True
+    return_channel : bool (optional)
+        if True, return the channels (1-4) of the points too
+
+    Returns
+    -------
+    det_ids : ndarray of int32
+        the DET-IDs of the CCDs, with -1 for points that do not fall on
+        a CCD
+    """
+    return get_locator().locate(dra, ddec, exclude_bad=exclude_bad,
+                                return_channel=return_channel)
+
+
+def __getattr__(name):
+    # load `info` on first access
+    if name == 'info':
+        return get_info()
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
@@ -7,6 +7,9 @@
 # Please see the file LICENSE.txt for details.
 #
 import os.path
+import threading
+
+import numpy
 
 from ginga.misc import Bunch
 
@@ -85,7 +88,7 @@ class HyperSuprimeCamDR(SuprimeCamDR):
     #
     def get_regions(self, image):
         ccd_id = int(image.get_keyword('DET-ID'))
-        return hsc_ccd_data[ccd_id]
+        return get_ccd_data()[ccd_id]
 
     def object_to_file_list(self, beedir0, beedir1, file_pfx):
         """Takes two bees directories and a file prefix for an exposure.
@@ -105,568 +108,65 @@ class HyperSuprimeCamDR(SuprimeCamDR):
 
 
 # HSC CCD DATA (in case we can't read the header)
+#
+# The overscan and effective pixel regions and the gains of the channels
+# of each CCD are stored in the binary file data/hsc_ccd_data.npz, which
+# is only loaded the first time it is needed.  `_hsc_ccd_data` is the raw
+# table, as a dictionary keyed by DET-ID, and `hsc_ccd_data` the same as
+# bunches, with the orientation of each CCD.
+
+hsc_ccd_data_file = os.path.join(os.path.dirname(__file__), 'data',
+                                 'hsc_ccd_data.npz')
+
+# keys of the region table of a channel and of a CCD
+channel_keys = ('osminx', 'osminy', 'osmaxx', 'osmaxy', 'startposx',
+                'efmaxy', 'efmaxx', 'efminy', 'efminx')
+image_keys = ('xcut', 'newwd', 'newht', 'ccd_id', 'ycut')
+
+_lock = threading.Lock()
+_ccd_data = {}
+
+
+def load_ccd_data(filepath=hsc_ccd_data_file):
+    """Load a table of CCD regions, as written by save_ccd_data(), into a
+    dictionary keyed by DET-ID, in the form of `_hsc_ccd_data`.
+    """
+    with numpy.load(filepath) as npz:
+        det_ids = npz['det_ids'].tolist()
+        channels = npz['channels'].tolist()
+        gains = npz['gains'].tolist()
+        images = npz['images'].tolist()
+
+    res = {}
+    for i, ccd_id in enumerate(det_ids):
+        d = {}
+        for j, channel in enumerate((1, 2, 3, 4)):
+            d[channel] = dict(zip(channel_keys, channels[i][j]))
+            d[channel]['gain'] = gains[i][j]
+        d['image'] = dict(zip(image_keys, images[i]))
+        res[ccd_id] = d
+    return res
+
+
+def save_ccd_data(filepath, ccd_data):
+    """Save a dictionary of CCD regions keyed by DET-ID, in the form of
+    `_hsc_ccd_data`, to a file.
+    """
+    det_ids = sorted(ccd_data.keys())
+    channels = [[[ccd_data[ccd_id][channel][key] for key in channel_keys]
+                 for channel in (1, 2, 3, 4)]
+                for ccd_id in det_ids]
+    gains = [[ccd_data[ccd_id][channel]['gain']
+              for channel in (1, 2, 3, 4)]
+             for ccd_id in det_ids]
+    images = [[ccd_data[ccd_id]['image'][key] for key in image_keys]
+              for ccd_id in det_ids]
+    numpy.savez(filepath,
+                det_ids=numpy.array(det_ids, dtype=numpy.int32),
+                channels=numpy.array(channels, dtype=numpy.int32),
+                gains=numpy.array(gains, dtype=numpy.float64),
+                images=numpy.array(images, dtype=numpy.int32))
 
-_hsc_ccd_data = {
-    0: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3599999999999999},
-        2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.1699999999999999},
-        3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.3100000000000001},
-        4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3300000000000001},
-        'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 0, 'ycut': 16}},
-    1: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.21},
-        2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.1000000000000001},
-        3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.25},
-        4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.1899999999999999},
-        'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 1, 'ycut': 16}},
-    2: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.6699999999999999},
-        2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.6200000000000001},
-        3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.8399999999999999},
-        4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.9399999999999999},
-        'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 2, 'ycut': 16}},
-    3: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3199999999999998},
-        2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.25},
-        3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.4300000000000002},
-        4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3900000000000001},
-        'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 3, 'ycut': 16}},
-    4: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.8700000000000001},
-        2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.6400000000000001},
-        3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.79},
-        4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.7999999999999998},
-        'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 4, 'ycut': 16}},
-    5: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3700000000000001},
-        2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.2599999999999998},
-        3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.4199999999999999},
-        4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3300000000000001},
-        'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 5, 'ycut': 16}},
-    6: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.2799999999999998},
-        2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.25},
-        3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.4199999999999999},
-        4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3799999999999999},
-        'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 6, 'ycut': 16}},
-    7: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3399999999999999},
-        2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.21},
-        3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.3900000000000001},
-        4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3500000000000001},
-        'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 7, 'ycut': 16}},
-    8: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3799999999999999},
-        2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.23},
-        3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.3799999999999999},
-        4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.4100000000000001},
-        'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 8, 'ycut': 16}},
-    9: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3100000000000001},
-        2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.23},
-        3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.3900000000000001},
-        4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3900000000000001},
-        'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 9, 'ycut': 16}},
-    10: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.8799999999999999},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.7599999999999998},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.8599999999999999},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.8399999999999999},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 10, 'ycut': 16}},
-    11: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.4100000000000001},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.29},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.46},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3900000000000001},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 11, 'ycut': 16}},
-    12: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.1299999999999999},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.2200000000000002},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.3799999999999999},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.4199999999999999},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 12, 'ycut': 16}},
-    13: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3700000000000001},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.29},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.46},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3399999999999999},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 13, 'ycut': 16}},
-    14: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.2999999999999998},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.2400000000000002},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.3999999999999999},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.2799999999999998},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 14, 'ycut': 16}},
-    15: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3900000000000001},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.29},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.4300000000000002},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3100000000000001},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 15, 'ycut': 16}},
-    16: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3199999999999998},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.23},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.4300000000000002},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.48},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 16, 'ycut': 16}},
-    17: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.21},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.0800000000000001},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.1800000000000002},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.1800000000000002},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 17, 'ycut': 16}},
-    18: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 4.4800000000000004},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.2799999999999998},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.4399999999999999},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.5},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 18, 'ycut': 16}},
-    19: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.6899999999999999},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.7000000000000002},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.9100000000000001},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.9399999999999999},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 19, 'ycut': 16}},
-    20: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.8700000000000001},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.7400000000000002},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.9199999999999999},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.8100000000000001},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 20, 'ycut': 16}},
-    21: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3599999999999999},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.1899999999999999},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.3199999999999998},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3500000000000001},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 21, 'ycut': 16}},
-    22: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.8900000000000001},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.8599999999999999},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 4.0300000000000002},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.8799999999999999},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 22, 'ycut': 16}},
-    23: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3500000000000001},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.29},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.4199999999999999},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.29},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 23, 'ycut': 16}},
-    24: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.1299999999999999},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.0499999999999998},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.2200000000000002},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3199999999999998},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 24, 'ycut': 16}},
-    25: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.25},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.1899999999999999},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.3399999999999999},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3599999999999999},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 25, 'ycut': 16}},
-    26: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.7000000000000002},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.6600000000000001},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.8500000000000001},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.8500000000000001},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 26, 'ycut': 16}},
-    27: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.2599999999999998},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.1600000000000001},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.27},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.23},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 27, 'ycut': 16}},
-    28: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.6299999999999999},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.5899999999999999},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.7799999999999998},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.9900000000000002},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 28, 'ycut': 16}},
-    29: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.5299999999999998},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.3100000000000001},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.1800000000000002},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3700000000000001},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 29, 'ycut': 16}},
-    30: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3599999999999999},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.2599999999999998},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.3900000000000001},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3599999999999999},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 30, 'ycut': 16}},
-    31: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.2999999999999998},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.1600000000000001},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.3199999999999998},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.2599999999999998},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 31, 'ycut': 16}},
-    32: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.6200000000000001},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.6099999999999999},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.79},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.8900000000000001},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 32, 'ycut': 16}},
-    33: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3700000000000001},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.23},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.4199999999999999},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3500000000000001},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 33, 'ycut': 16}},
-    34: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.48},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.4199999999999999},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.6099999999999999},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3999999999999999},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 34, 'ycut': 16}},
-    35: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3500000000000001},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.27},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.4300000000000002},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3300000000000001},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 35, 'ycut': 16}},
-    36: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3300000000000001},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.27},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.48},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3999999999999999},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 36, 'ycut': 16}},
-    37: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.1800000000000002},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.1899999999999999},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.3500000000000001},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.4500000000000002},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 37, 'ycut': 16}},
-    38: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.4100000000000001},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.25},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.3799999999999999},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3199999999999998},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 38, 'ycut': 16}},
-    39: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.1800000000000002},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.04},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.2400000000000002},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.0800000000000001},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 39, 'ycut': 16}},
-    40: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.2000000000000002},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.0899999999999999},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.2400000000000002},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.1600000000000001},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 40, 'ycut': 16}},
-    41: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.4199999999999999},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.2799999999999998},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.4199999999999999},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3700000000000001},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 41, 'ycut': 16}},
-    42: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.29},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.21},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.3700000000000001},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3799999999999999},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 42, 'ycut': 16}},
-    43: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.2999999999999998},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.2000000000000002},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.3500000000000001},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.29},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 43, 'ycut': 16}},
-    44: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3500000000000001},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.1499999999999999},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.2999999999999998},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3399999999999999},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 44, 'ycut': 16}},
-    45: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.2000000000000002},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.1099999999999999},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.21},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.1899999999999999},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 45, 'ycut': 16}},
-    46: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.8700000000000001},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.7000000000000002},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.8399999999999999},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.7599999999999998},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 46, 'ycut': 16}},
-    47: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3399999999999999},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.27},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.3300000000000001},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.2400000000000002},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 47, 'ycut': 16}},
-    48: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.2000000000000002},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.0800000000000001},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.25},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.1699999999999999},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 48, 'ycut': 16}},
-    49: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.1699999999999999},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.1099999999999999},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.2799999999999998},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.4100000000000001},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 49, 'ycut': 16}},
-    50: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.5299999999999998},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.48},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.6699999999999999},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.48},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 50, 'ycut': 16}},
-    51: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3799999999999999},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.2599999999999998},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.3799999999999999},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3199999999999998},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 51, 'ycut': 16}},
-    52: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.9700000000000002},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.9100000000000001},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 4.0599999999999996},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.8900000000000001},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 52, 'ycut': 16}},
-    53: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.4300000000000002},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.3399999999999999},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.52},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.4199999999999999},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 53, 'ycut': 16}},
-    54: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.6400000000000001},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.6600000000000001},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.8500000000000001},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.8399999999999999},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 54, 'ycut': 16}},
-    55: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.21},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.04},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.1499999999999999},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.1899999999999999},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 55, 'ycut': 16}},
-    56: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.1899999999999999},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.1899999999999999},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.3799999999999999},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.4399999999999999},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 56, 'ycut': 16}},
-    57: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.2599999999999998},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.1600000000000001},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.3500000000000001},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.2799999999999998},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 57, 'ycut': 16}},
-    58: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3399999999999999},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.23},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.4500000000000002},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3199999999999998},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 58, 'ycut': 16}},
-    59: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3799999999999999},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.25},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.3599999999999999},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3399999999999999},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 59, 'ycut': 16}},
-    60: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.2599999999999998},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.25},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.3799999999999999},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.5},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 60, 'ycut': 16}},
-    61: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.1699999999999999},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.1200000000000001},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.2599999999999998},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3399999999999999},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 61, 'ycut': 16}},
-    62: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3900000000000001},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.1800000000000002},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.3300000000000001},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3500000000000001},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 62, 'ycut': 16}},
-    63: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.79},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.6899999999999999},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.7999999999999998},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.71},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 63, 'ycut': 16}},
-    64: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3599999999999999},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.25},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.4100000000000001},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3500000000000001},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 64, 'ycut': 16}},
-    65: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.9700000000000002},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.8900000000000001},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 4.0599999999999996},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.8999999999999999},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 65, 'ycut': 16}},
-    66: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3700000000000001},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.2799999999999998},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.4199999999999999},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3399999999999999},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 66, 'ycut': 16}},
-    67: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.2000000000000002},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.1400000000000001},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.3100000000000001},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.4300000000000002},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 67, 'ycut': 16}},
-    68: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.27},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.1499999999999999},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.3599999999999999},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3199999999999998},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 68, 'ycut': 16}},
-    69: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.75},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.6499999999999999},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.8500000000000001},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 4.0},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 69, 'ycut': 16}},
-    70: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3100000000000001},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.29},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.4500000000000002},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.5499999999999998},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 70, 'ycut': 16}},
-    71: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.1200000000000001},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.1000000000000001},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.2599999999999998},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3700000000000001},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 71, 'ycut': 16}},
-    72: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.25},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.0499999999999998},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.1699999999999999},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.1800000000000002},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 72, 'ycut': 16}},
-    73: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.6200000000000001},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.5899999999999999},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.8399999999999999},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.9700000000000002},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 73, 'ycut': 16}},
-    74: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.2000000000000002},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.1200000000000001},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.3100000000000001},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3999999999999999},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 74, 'ycut': 16}},
-    75: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.2000000000000002},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.25},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.4199999999999999},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 4.2800000000000002},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 75, 'ycut': 16}},
-    76: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.1800000000000002},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.23},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.4199999999999999},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.4399999999999999},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 76, 'ycut': 16}},
-    77: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.1499999999999999},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.04},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.21},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3300000000000001},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 77, 'ycut': 16}},
-    78: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.7799999999999998},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 4.0899999999999999},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.9500000000000002},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.52},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 78, 'ycut': 16}},
-    79: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.8900000000000001},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.73},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.8999999999999999},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.7599999999999998},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 79, 'ycut': 16}},
-    80: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3700000000000001},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.2799999999999998},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.4199999999999999},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.4100000000000001},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 80, 'ycut': 16}},
-    81: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.1200000000000001},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.0699999999999998},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.23},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3199999999999998},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 81, 'ycut': 16}},
-    82: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.2999999999999998},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.1499999999999999},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.3300000000000001},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3300000000000001},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 82, 'ycut': 16}},
-    83: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.1699999999999999},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.1400000000000001},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.2799999999999998},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3100000000000001},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 83, 'ycut': 16}},
-    84: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.29},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.2200000000000002},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.3999999999999999},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.2200000000000002},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 84, 'ycut': 16}},
-    85: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.7000000000000002},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.6099999999999999},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.77},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.9300000000000002},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 85, 'ycut': 16}},
-    86: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.1299999999999999},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.1200000000000001},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.2799999999999998},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.2999999999999998},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 86, 'ycut': 16}},
-    87: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.4199999999999999},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.2999999999999998},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.46},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3900000000000001},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 87, 'ycut': 16}},
-    88: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.1400000000000001},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.04},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.2000000000000002},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.1299999999999999},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 88, 'ycut': 16}},
-    89: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3900000000000001},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.3300000000000001},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.5},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.4100000000000001},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 89, 'ycut': 16}},
-    90: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.5},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.3399999999999999},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.5},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.4500000000000002},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 90, 'ycut': 16}},
-    91: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.1200000000000001},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.02},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.1600000000000001},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3100000000000001},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 91, 'ycut': 16}},
-    92: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3500000000000001},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.2200000000000002},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.4199999999999999},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.5499999999999998},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 92, 'ycut': 16}},
-    93: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3300000000000001},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.25},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.4300000000000002},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.2599999999999998},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 93, 'ycut': 16}},
-    94: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.0899999999999999},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.0499999999999998},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.2000000000000002},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3199999999999998},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 94, 'ycut': 16}},
-    95: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.8199999999999998},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.7000000000000002},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.8500000000000001},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.9399999999999999},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 95, 'ycut': 16}},
-    96: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3599999999999999},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.27},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.4399999999999999},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3399999999999999},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 96, 'ycut': 16}},
-    97: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.1699999999999999},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.2000000000000002},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.3700000000000001},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.4199999999999999},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 97, 'ycut': 16}},
-    98: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.1000000000000001},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.04},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.21},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3100000000000001},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 98, 'ycut': 16}},
-    99: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3999999999999999},
-         2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.29},
-         3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.4199999999999999},
-         4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3999999999999999},
-         'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 99, 'ycut': 16}},
-    100: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.4199999999999999},
-          2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.2999999999999998},
-          3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.46},
-          4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.46},
-          'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 100, 'ycut': 16}},
-    101: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3100000000000001},
-          2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.2599999999999998},
-          3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.4500000000000002},
-          4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.1899999999999999},
-          'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 101, 'ycut': 16}},
-    102: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.7000000000000002},
-          2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.6600000000000001},
-          3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.8199999999999998},
-          4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.6200000000000001},
-          'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 102, 'ycut': 16}},
-    103: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.4199999999999999},
-          2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.2999999999999998},
-          3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.48},
-          4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.4199999999999999},
-          'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 103, 'ycut': 16}},
-    104: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3199999999999998},
-          2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.1899999999999999},
-          3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.3300000000000001},
-          4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.2200000000000002},
-          'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 104, 'ycut': 16}},
-    105: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.2799999999999998},
-          2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.23},
-          3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.3700000000000001},
-          4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.23},
-          'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 105, 'ycut': 16}},
-    106: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3500000000000001},
-          2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.27},
-          3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.4700000000000002},
-          4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3700000000000001},
-          'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 106, 'ycut': 16}},
-    107: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.1299999999999999},
-          2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.0899999999999999},
-          3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.23},
-          4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3199999999999998},
-          'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 107, 'ycut': 16}},
-    108: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3199999999999998},
-          2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.1499999999999999},
-          3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.3500000000000001},
-          4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.4100000000000001},
-          'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 108, 'ycut': 16}},
-    109: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3399999999999999},
-          2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.2999999999999998},
-          3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.4700000000000002},
-          4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.4300000000000002},
-          'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 109, 'ycut': 16}},
-    110: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3399999999999999},
-          2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.21},
-          3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.4199999999999999},
-          4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.3399999999999999},
-          'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 110, 'ycut': 16}},
-    111: {1: {'osminx': 520, 'osminy': 4225, 'osmaxx': 535, 'osmaxy': 4240, 'startposx': 0, 'efmaxy': 4224, 'efmaxx': 519, 'efminy': 49, 'efminx': 8, 'gain': 3.3599999999999999},
-          2: {'osminx': 536, 'osminy': 4225, 'osmaxx': 551, 'osmaxy': 4240, 'startposx': 512, 'efmaxy': 4224, 'efmaxx': 1063, 'efminy': 49, 'efminx': 552, 'gain': 3.29},
-          3: {'osminx': 1592, 'osminy': 4225, 'osmaxx': 1607, 'osmaxy': 4240, 'startposx': 1024, 'efmaxy': 4224, 'efmaxx': 1591, 'efminy': 49, 'efminx': 1080, 'gain': 3.5099999999999998},
-          4: {'osminx': 1608, 'osminy': 4225, 'osmaxx': 1623, 'osmaxy': 4240, 'startposx': 1536, 'efmaxy': 4224, 'efmaxx': 2135, 'efminy': 49, 'efminx': 1624, 'gain': 3.5499999999999998},
-          'image': {'xcut': 64, 'newwd': 2048, 'newht': 4176, 'ccd_id': 111, 'ycut': 16}}}
 
 ccd_aux_info1 = {
     # key is DET-ID (detector id); contents are BEE-ID and SDO-ID
@@ -784,26 +284,49 @@ ccd_aux_info1 = {
     111: {'bee_id': 0, 'sdo_id': 48},
     }
 
-hsc_ccd_data = {}
-for ccd_id in _hsc_ccd_data.keys():
-    res = Bunch.Bunch(flipv=False, fliph=False, swapxy=False)
-    for key, dv in _hsc_ccd_data[ccd_id].items():
-        res[key] = Bunch.Bunch(dv)
-
-    addl_d = ccd_aux_info1.get(ccd_id, {})
-    sdo_id = addl_d['sdo_id']
-    if addl_d['bee_id'] == 0:
-        res.fliph = True
-    if addl_d['bee_id'] == 1:
-        res.flipv = True
-
-    if ccd_id in (100, 101, 102, 103):
-        # rotated corner ccd
-        res.swapxy = True
-        res.flipv = res.fliph = False
-        if ccd_id in (100, 101):
-            res.flipv = res.fliph = True
-
-    hsc_ccd_data[ccd_id] = res
+def _make_ccd_bunches(raw_data):
+    hsc_ccd_data = {}
+    for ccd_id in raw_data.keys():
+        res = Bunch.Bunch(flipv=False, fliph=False, swapxy=False)
+        for key, dv in raw_data[ccd_id].items():
+            res[key] = Bunch.Bunch(dv)
+
+        addl_d = ccd_aux_info1.get(ccd_id, {})
+        sdo_id = addl_d['sdo_id']
+        if addl_d['bee_id'] == 0:
+            res.fliph = True
+        if addl_d['bee_id'] == 1:
+            res.flipv = True
+
+        if ccd_id in (100, 101, 102, 103):
+            # rotated corner ccd
+            res.swapxy = True
+            res.flipv = res.fliph = False
+            if ccd_id in (100, 101):
+                res.flipv = res.fliph = True
+
+        hsc_ccd_data[ccd_id] = res
+    return hsc_ccd_data
+
+
+def get_ccd_data(raw=False):
+    """Get the regions of all the HSC CCDs, keyed by DET-ID: as bunches
+    (`hsc_ccd_data`), or the raw table (`_hsc_ccd_data`) if `raw` is True.
+    The table is loaded on the first call.
+    """
+    with _lock:
+        if 'raw' not in _ccd_data:
+            _ccd_data['raw'] = load_ccd_data()
+            _ccd_data['bunch'] = _make_ccd_bunches(_ccd_data['raw'])
+        return _ccd_data['raw' if raw else 'bunch']
+
+
+def __getattr__(name):
+    # load the CCD data on first access
+    if name == 'hsc_ccd_data':
+        return get_ccd_data()
+    if name == '_hsc_ccd_data':
+        return get_ccd_data(raw=True)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
 
 #END
@@ -7,8 +7,13 @@
 # Please see the file LICENSE.txt for details.
 #
 import os
+import io
 import re, glob
+import sys
 import time
+import logging
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # 3rd party imports
 import numpy
@@ -20,6 +25,326 @@ from ginga.util import mosaic, wcs
 
 from g2base.astro.frame import Frame
 
+from ..util import combine, header_index
+
+# keys of the channel regions that an overscan plan is made from
+region_keys = ('efminx', 'efmaxx', 'efminy', 'efmaxy',
+               'osminx', 'osmaxx', 'osminy', 'osmaxy', 'startposx')
+
+# state of a worker process in a process pool (see _init_worker)
+_worker = {}
+
+
+def get_logger_state(logger):
+    """Get what a worker process needs to make a logger like `logger`
+    (see make_logger()), as loggers cannot be pickled.
+    """
+    handlers = getattr(logger, 'handlers', None)
+    if handlers is None:
+        # ginga's NullLogger
+        return dict(null=True)
+    levels = [hdlr.level for hdlr in handlers if hdlr.level > 0]
+    level = min(levels) if len(levels) > 0 else logger.getEffectiveLevel()
+    log_stderr = any(getattr(hdlr, 'stream', None) is sys.stderr
+                     for hdlr in handlers)
+    return dict(name=logger.name, level=level if level > 0 else None,
+                log_stderr=log_stderr)
+
+
+def make_logger(state):
+    """Make a logger from the state returned by get_logger_state().
+    A logger that logs to a file logs to stderr in a worker process, so
+    that several processes don't write the file at once.
+    """
+    if state.get('null', False):
+        return log.get_logger(null=True)
+    logger = log.get_logger(state['name'], level=state['level'],
+                            log_stderr=state['log_stderr'])
+    # ginga sets the level of the handlers only
+    logger.setLevel(logging.WARN if state['level'] is None
+                    else state['level'])
+    return logger
+
+
+def _init_worker(klass, logger_state, dr_state, kwargs):
+    # Loggers and images cannot be pickled, so each worker process
+    # makes its own data reduction object, with the logger settings and
+    # the attributes of the caller's object
+    dr = klass(logger=make_logger(logger_state))
+    dr.__dict__.update(dr_state)
+    # no nested pools
+    dr.num_workers = 1
+    _worker['dr'] = dr
+    _worker['kwargs'] = kwargs
+
+
+def _call_worker(method, path):
+    dr = _worker['dr']
+    ccd_id, res = getattr(dr, method)(path, **_worker['kwargs'])
+    if isinstance(res, AstroImage.AstroImage):
+        res = pack_image(res)
+    return ccd_id, res
+
+
+def get_cards(header, kwds):
+    """Return the (keyword, value, comment) cards of `header` (a ginga or
+    an astropy header) whose keywords are in the list `kwds`.
+    """
+    if hasattr(header, 'get_card'):
+        # ginga header
+        cards = [header.get_card(kwd) for kwd in header.keys()]
+        cards = [(card.key, card.value, card.comment) for card in cards]
+    else:
+        cards = [(card.keyword, card.value, card.comment)
+                 for card in header.cards]
+    return [card for card in cards if card[0].upper() in kwds]
+
+
+def hdu_to_bytes(hdu):
+    """Serialize an HDU as the bytes of a FITS extension, which can be
+    appended to a FITS file.  Tile-compressed HDUs are compressed in the
+    process, so this can be farmed out to a thread or process pool.
+    """
+    import astropy.io.fits as pyfits
+
+    buf = io.BytesIO()
+    pyfits.HDUList([pyfits.PrimaryHDU(), hdu]).writeto(
+        buf, output_verify='silentfix')
+    # strip the data-less primary HDU
+    skip = len(pyfits.PrimaryHDU().header.tostring())
+    return buf.getvalue()[skip:]
+
+
+def pack_image(image):
+    """Reduce an image to a (data, cards) tuple that can be passed
+    between processes.  `cards` is a list of (keyword, value, comment).
+    """
+    hdr = image.get_header()
+    cards = [(kwd, hdr.get_card(kwd).value, hdr.get_card(kwd).comment)
+             for kwd in hdr.keys()]
+    return (image.get_data(), cards)
+
+
+def unpack_image(packed, logger=None):
+    """Make an image from a (data, cards) tuple made by pack_image()."""
+    data_np, cards = packed
+    image = AstroImage.AstroImage(logger=logger)
+    image.set_data(data_np)
+    hdr = image.get_header()
+    for kwd, val, comment in cards:
+        hdr.set_card(kwd, val, comment=comment)
+    # reload the WCS from the restored header
+    image.update_keywords({})
+    dp.get_image_name(image, pfx='dp')
+    return image
+
+
+class LazyImage(object):
+    """A lightweight handle on the image in a FITS file.  The header is
+    only read when it is first needed, and the pixel data is only read
+    when it is asked for: the whole array through get_data() (memory-mapped
+    where the file allows it) or a slice of it through get_section().
+    Anything else is delegated to an AstroImage, which is loaded from the
+    file the first time it is needed (see get_image()); from then on, all
+    the methods answer from the AstroImage, so that they see changes to
+    its data and keywords.
+
+    Parameters
+    ----------
+    filepath : str
+        path of the FITS file
+    logger : logger (optional)
+        logger for the materialized AstroImage
+    numhdu : int (optional)
+        the index of the HDU holding the image.  Default: 0
+    """
+
+    def __init__(self, filepath, logger=None, numhdu=0):
+        self.filepath = filepath
+        self.logger = logger
+        self.numhdu = numhdu
+
+        self._header = None
+        self._fits = None
+        self._image = None
+
+    def get_header(self):
+        """Return the (astropy) header of the image; only the header of
+        the HDU is read from the file.  Once the image is loaded, return
+        the header of the AstroImage instead.
+        """
+        if self._image is not None:
+            return self._image.get_header()
+        if self._header is None:
+            import astropy.io.fits as pyfits
+
+            self._header = pyfits.getheader(self.filepath, self.numhdu)
+        return self._header
+
+    def get_keyword(self, kwd, *args):
+        """Like AstroImage.get_keyword(): return the value of keyword
+        `kwd`, or the default, if given and the keyword is missing.
+        """
+        if self._image is not None:
+            return self._image.get_keyword(kwd, *args)
+        header = self.get_header()
+        if len(args) > 0 and kwd not in header:
+            return args[0]
+        return header[kwd]
+
+    def get_size(self):
+        if self._image is not None:
+            return self._image.get_size()
+        header = self.get_header()
+        return (header['NAXIS1'], header['NAXIS2'])
+
+    def _get_hdu(self):
+        if self._fits is None:
+            import astropy.io.fits as pyfits
+
+            # astropy cannot memory-map scaled data
+            header = self.get_header()
+            memmap = not any(kwd in header
+                             for kwd in ('BZERO', 'BSCALE', 'BLANK'))
+            self._fits = pyfits.open(self.filepath, memmap=memmap)
+        return self._fits[self.numhdu]
+
+    def get_data(self):
+        """Return the data array of the image.  Data that are stored
+        unscaled are memory-mapped; scaled data (BZERO/BSCALE/BLANK) are
+        read and scaled in full.
+        """
+        if self._image is not None:
+            return self._image.get_data()
+        return self._get_hdu().data
+
+    def get_section(self, *slices):
+        """Read and return only the slice of the data array given by
+        `slices` (numpy order, i.e. rows first), e.g.
+        image.get_section(slice(0, 100), slice(0, 50)).
+        """
+        if self._image is not None:
+            return self._image.get_data()[slices]
+        return self._get_hdu().section[slices]
+
+    def get_image(self):
+        """Return the image as a fully loaded AstroImage."""
+        if self._image is None:
+            image = AstroImage.AstroImage(logger=self.logger)
+            image.load_file(self.filepath)
+            self._image = image
+            self.close()
+        return self._image
+
+    def close(self):
+        """Close the memory map of the file, if it is open."""
+        if self._fits is not None:
+            self._fits.close()
+            self._fits = None
+
+    def __array__(self, dtype=None, copy=None):
+        data = self.get_data()
+        if dtype is not None:
+            return numpy.asarray(data, dtype=dtype)
+        return numpy.asarray(data)
+
+    def __getattr__(self, name):
+        # anything else requires the full image
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.get_image(), name)
+
+
+class OverscanPlan(object):
+    """A plan for subtracting the overscan bias from, and trimming, the
+    data of a CCD image.  The slices for the overscan and effective pixel
+    regions of each channel are worked out once, so that the plan can be
+    applied cheaply to many frames.
+
+    Parameters
+    ----------
+    d : dict
+        a dictionary of information about the overscan and effective
+        pixel regions as returned by get_regions()
+    pfx : str (optional)
+        the instrument prefix of the region keywords, e.g. 'S' or 'T'
+    """
+
+    def __init__(self, d, pfx='S'):
+        info = d['image']
+        self.newwd, self.newht = info.newwd, info.newht
+
+        # header updates for the trimmed image
+        self.header = dict(NAXIS1=self.newwd, NAXIS2=self.newht)
+
+        self.channels = []
+        for channel in (1, 2, 3, 4):
+            ch = d[channel]
+
+            # calculate size of effective pixels area for this channel
+            efwd = ch.efmaxx + 1 - ch.efminx
+            efht = ch.efmaxy + 1 - ch.efminy
+
+            j = ch.startposx
+
+            # Cut effective pixel region into output array
+            xlo, xhi, ylo, yhi = j, j + efwd, 0, efht
+
+            ef_rows = slice(ch.efminy, ch.efmaxy + 1)
+            self.channels.append(Bunch.Bunch(
+                ef=(ef_rows, slice(ch.efminx, ch.efmaxx + 1)),
+                os=(ef_rows, slice(ch.osminx, ch.osmaxx + 1)),
+                out=(slice(ylo, yhi), slice(xlo, xhi))))
+
+            # Update header for effective regions
+            base = pfx + '_EF'
+            self.header["%sMN%d1" % (base, channel)] = xlo + 1
+            self.header["%sMX%d1" % (base, channel)] = xhi + 1
+            self.header["%sMN%d2" % (base, channel)] = ylo + 1
+            self.header["%sMX%d2" % (base, channel)] = yhi + 1
+
+    def apply(self, data_np, sub_bias=True, header=None, out=None):
+        """Subtract the median bias calculated from the overscan regions
+        from an image data array and trim off the overscan regions.
+
+        Parameters
+        ----------
+        data_np : numpy array
+            a 2D data array of pixel values
+        sub_bias : bool (optional)
+            if False, just trim the array.  Default: True
+        header : dict (optional)
+            if given, updated with the keywords for the trimmed image
+        out : numpy array (optional)
+            an array of the effective pixel size to hold the result; if
+            None, a new float array is made
+
+        Returns
+        -------
+        out : numpy array
+            the result data
+        """
+        if out is None:
+            out = numpy.empty((self.newht, self.newwd), dtype=float)
+        elif out.shape != (self.newht, self.newwd):
+            raise ValueError("output array shape %s doesn't match effective pixel shape %s" % (
+                str(out.shape), str((self.newht, self.newwd))))
+
+        for ch in self.channels:
+            if sub_bias:
+                # median of each row in overscan area for this channel,
+                # broadcast across the effective pixels of the row
+                ovsc_median = numpy.median(data_np[ch.os], axis=1)
+                numpy.subtract(data_np[ch.ef], ovsc_median[:, numpy.newaxis],
+                               out=out[ch.out])
+            else:
+                out[ch.out] = data_np[ch.ef]
+
+        if header is not None:
+            header.update(self.header)
+
+        return out
+
 
 class SuprimeCamDR(object):
 
@@ -38,6 +363,13 @@ class SuprimeCamDR(object):
 
         self.frameid_offsets = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
 
+        # number of worker processes used to process the CCDs of an
+        # exposure; 1 processes them serially
+        self.num_workers = 1
+
+        # cache of overscan plans, see get_overscan_plan()
+        self._overscan_plans = {}
+
         # SPCAM keywords that should be added to the primary HDU
         self.prihdr_kwds = [
             'SIMPLE', 'BITPIX', 'NAXIS', 'NAXIS1', 'NAXIS2', 'EXTEND', 'BZERO',
@@ -77,7 +409,17 @@ class SuprimeCamDR(object):
             'RADECSYS', 'CD1_1', 'CD1_2', 'CD2_1', 'CD2_2',
             ]
 
-    def load_image(self, filepath):
+    def load_image(self, filepath, lazy=False):
+        """Load the image in a FITS file.  If `lazy` is True, return a
+        LazyImage, which reads the header and data only when needed.
+
+        Note that raw CCD frames are stored scaled (BZERO), so they can't
+        be memory-mapped: get_data() on a LazyImage of a raw frame reads
+        the whole array.  Callers that need only part of the data should
+        use get_section().
+        """
+        if lazy:
+            return LazyImage(filepath, logger=self.logger)
         image = AstroImage.AstroImage(logger=self.logger)
         image.load_file(filepath)
         return image
@@ -118,6 +460,35 @@ class SuprimeCamDR(object):
             res.append(os.path.join(directory, str(fr)+'.fits'))
         return res
 
+    def get_exposures(self, index, criteria=None):
+        """Group the CCD files of this instrument in a data directory by
+        exposure, from its header index, without opening the files.
+
+        Parameters
+        ----------
+        index : HeaderIndex
+            the header index of the directory (see naoj.util.header_index)
+        criteria : dict (optional)
+            more keywords that the files should have, e.g.
+            ``{'DATA-TYP': 'DOMEFLAT'}`` (see HeaderIndex.select())
+
+        Returns
+        -------
+        exposures : dict
+            the paths of the CCD files, in the order of DET-ID, keyed by
+            the exposure number (see get_exp_num())
+        """
+        criteria = dict(criteria or {})
+        criteria['FRAMEID'] = lambda frameid: frameid.startswith(
+            self.inscode + 'A')
+        res = {}
+        for path in index.select(criteria):
+            kwds = index.get_header(path)
+            exp_num = self.get_exp_num(kwds['FRAMEID'])
+            res.setdefault(exp_num, []).append((kwds.get('DET-ID', -1), path))
+        return {exp_num: [path for det_id, path in sorted(l)]
+                for exp_num, l in res.items()}
+
     def get_file_list(self, path):
         frame = Frame(path)
         exp_num = self.get_exp_num(path)
@@ -132,14 +503,13 @@ class SuprimeCamDR(object):
             res.append(os.path.join(frame.directory, str(fr)+'.fits'))
         return res
 
-    def get_images(self, path):
+    def get_images(self, path, lazy=True):
+        """Load the images of all the CCDs of the exposure of `path`: as
+        LazyImage handles (see load_image()), which only read each file
+        when it is needed, or as AstroImages if `lazy` is False.
+        """
         filelist = self.get_file_list(path)
-        res = []
-        for path in filelist:
-            img = AstroImage.AstroImage(logger=self.logger)
-            img.load_file(path)
-            res.append(img)
-        return res
+        return [self.load_image(path, lazy=lazy) for path in filelist]
 
     def get_regions(self, image):
         """Extract the keywords defining the overscan and effective pixel
@@ -188,10 +558,46 @@ class SuprimeCamDR(object):
         return d
 
 
-    def subtract_overscan_np(self, data_np, d, sub_bias=True, header=None):
+    def get_overscan_plan(self, image, d=None):
+        """Get the overscan plan (see OverscanPlan) for a CCD image.
+        Plans are cached by their overscan and effective pixel regions,
+        so frames of a CCD with another window or readout geometry get a
+        plan of their own.
+
+        Parameters
+        ----------
+        image : AstroImage
+            a CCD image
+        d : dict (optional)
+            a dictionary of information about the overscan and effective
+            pixel regions as returned by get_regions().  If None,
+            get_regions() is called.
+
+        Returns
+        -------
+        plan : OverscanPlan
+        """
+        if d is None:
+            d = self.get_regions(image)
+        return self._get_plan(d)
+
+    def _get_plan(self, d):
+        # the regions of the channels are all that a plan is made from
+        key = (self.pfx, d['image']['newwd'], d['image']['newht']) + tuple(
+            tuple(d[channel][kwd] for kwd in region_keys)
+            for channel in (1, 2, 3, 4))
+        plan = self._overscan_plans.get(key, None)
+        if plan is None:
+            plan = OverscanPlan(d, pfx=self.pfx)
+            self._overscan_plans[key] = plan
+        return plan
+
+    def subtract_overscan_np(self, data_np, d, sub_bias=True, header=None,
+                             out=None):
         """Subtract the median bias calculated from the overscan regions
         from a SPCAM image data array.  The resulting image is trimmed to
-        remove the overscan regions.
+        remove the overscan regions.  The overscan plan is cached, as in
+        get_overscan_plan().
 
         Parameters
         ----------
@@ -200,92 +606,94 @@ class SuprimeCamDR(object):
         d: dict
             a dictionary of information about the overscan and effective
             pixel regions as returned by get_regions().
+        out: numpy array (optional)
+            an array of the effective pixel size to hold the result
 
         Returns:
         out: numpy array
             a new, smaller array with the result data
         """
-
-        # create new output array the size of the sum of the image
-        # effective pixels
-        info = d['image']
-        newwd, newht = info.newwd, info.newht
-        self.logger.debug("effective pixel size %dx%d" % (newwd, newht))
-        out = numpy.empty((newht, newwd), dtype=float)
-        if header is not None:
-            header['NAXIS1'] = newwd
-            header['NAXIS2'] = newht
-
-        # original image size
-        ht, wd = data_np.shape[:2]
-
-        for channel in (1, 2, 3, 4):
-            #print "processing channel %d" % (channel)
-            ch = d[channel]
-
-            # calculate size of effective pixels area for this channel
-            efwd = ch.efmaxx + 1 - ch.efminx
-            efht = ch.efmaxy + 1 - ch.efminy
-
-            j = ch.startposx
-
-            # Cut effective pixel region into output array
-            xlo, xhi, ylo, yhi = j, j + efwd, 0, efht
-
-            if sub_bias:
-                # get median of each row in overscan area for this channel
-                ovsc_median = numpy.median(data_np[ch.efminy:ch.efmaxy+1,
-                                                   ch.osminx:ch.osmaxx+1],
-                                           axis=1)
-                len_ovsc = ovsc_median.shape[0]
-
-                assert len_ovsc == efht, \
-                       ValueError("median array len (%d) doesn't match effective pixel len (%d)" % (
-                    len_ovsc, efht))
-
-                ovsc_median = ovsc_median.reshape((efht, 1))
-                ovsc_median = numpy.repeat(ovsc_median, efwd, axis=1)
-
-                out[ylo:yhi, xlo:xhi] = data_np[ch.efminy:ch.efmaxy+1,
-                                                ch.efminx:ch.efmaxx+1] - ovsc_median
-            else:
-                out[ylo:yhi, xlo:xhi] = data_np[ch.efminy:ch.efmaxy+1,
-                                                ch.efminx:ch.efmaxx+1]
-
-            # Update header for effective regions
-            if header is not None:
-                base = self.pfx + '_EF'
-                header["%sMN%d1" % (base, channel)] = xlo + 1
-                header["%sMX%d1" % (base, channel)] = xhi + 1
-                header["%sMN%d2" % (base, channel)] = ylo + 1
-                header["%sMX%d2" % (base, channel)] = yhi + 1
-
-        return out
+        plan = self._get_plan(d)
+        self.logger.debug("effective pixel size %dx%d" % (plan.newwd,
+                                                          plan.newht))
+        return plan.apply(data_np, sub_bias=sub_bias, header=header,
+                          out=out)
 
 
     def make_flat(self, flatlist, bias=None, flat_norm=None,
-                  logger=None):
-
-        flats = []
-        self.logger.info("making a median flat from %s" % str(flatlist))
-        for path in flatlist:
-            image = AstroImage.AstroImage(logger=logger)
-            image.load_file(path)
+                  logger=None, method='median', dtype=float,
+                  chunk_rows=256, tmpdir=None):
+        """Make a flat by combining overscan-subtracted and trimmed frames
+        of a CCD, without holding the whole stack of frames in memory.
 
-            data_np = image.get_data()
-            # TODO: subtract optional bias image
-
-            # subtract overscan and trim
-            d = self.get_regions(image)
-            header = {}
-            newarr = self.subtract_overscan_np(data_np, d,
-                                               header=header)
-
-            flats.append(newarr)
-
-        # Take the median of the individual frames
-        flat = numpy.median(numpy.array(flats), axis=0)
-        #print flat.shape
+        Parameters
+        ----------
+        flatlist : list of str
+            paths of the flat frames
+        flat_norm : float (optional)
+            if given, the flat is divided by this
+        method : str (optional)
+            'median' for an exact median, 'sigclip' for a sigma-clipped
+            mean or 'approx' for an approximate (remedian) median.
+            Default: 'median'
+        dtype : dtype (optional)
+            working precision, e.g. numpy.float32 to halve the memory and
+            disk needed.  Default: float
+        chunk_rows : int (optional)
+            for 'median' and 'sigclip', the number of rows of the stack
+            of frames combined at a time.  Default: 256
+        tmpdir : str (optional)
+            for 'median' and 'sigclip', the directory in which the stack
+            of frames is memory-mapped.  Default: the system temp dir
+
+        Returns
+        -------
+        img_flat : AstroImage
+            the flat image
+        """
+        self.logger.info("making a %s flat from %s" % (method,
+                                                       str(flatlist)))
+        if method not in ('median', 'sigclip', 'approx'):
+            raise ValueError("method should be 'median', 'sigclip' or 'approx': %s" % (
+                method))
+
+        with tempfile.TemporaryDirectory(dir=tmpdir) as tmp_dir:
+            stack = None
+            remedian = combine.Remedian(dtype=dtype)
+            for i, path in enumerate(flatlist):
+                image = AstroImage.AstroImage(logger=logger)
+                image.load_file(path)
+
+                data_np = image.get_data()
+                # TODO: subtract optional bias image
+
+                # subtract overscan and trim, straight into a slot of the
+                # memory-mapped stack of frames
+                plan = self.get_overscan_plan(image)
+                if stack is None:
+                    shape = (plan.newht, plan.newwd)
+                    if method == 'approx':
+                        stack = numpy.empty((1,) + shape, dtype=dtype)
+                    else:
+                        stack = numpy.lib.format.open_memmap(
+                            os.path.join(tmp_dir, 'stack.npy'), mode='w+',
+                            dtype=dtype, shape=(len(flatlist),) + shape)
+
+                header = {}
+                if method == 'approx':
+                    remedian.add(plan.apply(data_np, header=header,
+                                            out=stack[0]))
+                else:
+                    plan.apply(data_np, header=header, out=stack[i])
+
+            # Combine the individual frames
+            if method == 'approx':
+                flat = remedian.get_result()
+            else:
+                flat = combine.combine_stack(stack, method=method,
+                                             chunk_rows=chunk_rows,
+                                             dtype=dtype)
+            del stack
 
         # Normalize flat, if normalization term provided
         if flat_norm is not None:
@@ -296,7 +704,16 @@ class SuprimeCamDR(object):
 
 
     def make_flat_tiles(self, datadir, explist, output_pfx='flat',
-                        output_dir=None):
+                        output_dir=None, method='median', dtype=float,
+                        index=None):
+        """Make a flat for each CCD from the exposures in `explist`.
+        If `index` (a HeaderIndex of `datadir`) is given, the frames
+        that exist are looked up in it instead of on the disk.
+        """
+        if index is None:
+            exists = os.path.exists
+        else:
+            exists = index.__contains__
 
         # Get the median values for each CCD image
         flats = []
@@ -304,17 +721,18 @@ class SuprimeCamDR(object):
             flatlist = []
             for exp in explist:
                 path = os.path.join(datadir, exp.upper()+'.fits')
-                if not os.path.exists(path):
+                if not exists(path):
                     continue
                 frame = Frame(path=path)
                 frame.number += i
                 path = os.path.join(datadir, str(frame)+'.fits')
-                if not os.path.exists(path):
+                if not exists(path):
                     continue
                 flatlist.append(path)
 
             if len(flatlist) > 0:
-                flats.append(self.make_flat(flatlist))
+                flats.append(self.make_flat(flatlist, method=method,
+                                            dtype=dtype))
 
         # Normalize the flats
         # TODO: can we use a running median to speed this up without
@@ -350,8 +768,19 @@ class SuprimeCamDR(object):
         return d
 
 
-    def get_flat_name(self, pfx, image):
-        hdr = image.get_header()
+    def get_flat_name(self, pfx, image, index=None):
+        """Get the name of the flat file made from an exposure, and the
+        keywords it is made of.  `image` can also be the path of a file,
+        whose keywords are looked up in `index` (a HeaderIndex), if
+        given, or read from its header, without loading the image.
+        """
+        if isinstance(image, str):
+            if index is None:
+                hdr = header_index.read_header(image)
+            else:
+                hdr = index.get_header(image)
+        else:
+            hdr = image.get_header()
         kwds = dict([ (kwd, hdr[kwd]) for kwd in ('OBJECT', 'FILTER01',
                                                   'DATE-OBS', 'UT-STR') ])
         match = re.match(r'^(\d\d):(\d\d):(\d\d)\.\d+$', kwds['UT-STR'])
@@ -365,7 +794,8 @@ class SuprimeCamDR(object):
 
 
     def make_flat_tiles_exp(self, datadir, expstart, num_exp,
-                            output_pfx='flat', output_dir=None):
+                            output_pfx='flat', output_dir=None,
+                            method='median', dtype=float, index=None):
 
         path = os.path.join(datadir, expstart.upper()+'.fits')
 
@@ -378,7 +808,8 @@ class SuprimeCamDR(object):
 
         d = self.make_flat_tiles(datadir, explist,
                                  output_pfx=output_pfx,
-                                 output_dir=output_dir)
+                                 output_dir=output_dir,
+                                 method=method, dtype=dtype, index=index)
         return d
 
 
@@ -391,9 +822,8 @@ class SuprimeCamDR(object):
             match = re.match(r'^.+\-(\d+)\.fits$', path)
             if match:
                 ccd_id = int(match.group(1))
-                image = self.load_image(path)
-                #image = AstroImage.AstroImage(logger=self.logger)
-                #image.load_file(path)
+                # memory-mapped where the file allows it
+                image = self.load_image(path, lazy=True)
 
                 data = image.get_data()
                 d[ccd_id] = data
@@ -407,58 +837,115 @@ class SuprimeCamDR(object):
         return mval, d
 
 
-    def make_exp_tiles(self, path_exp, flat_dict={}, flat_mean=None,
-                       output_pfx='exp', output_dir=None):
+    def get_worker_state(self):
+        """Get the attributes to copy to the data reduction object of
+        each worker process in map_ccds(): all but the logger, which is
+        made again from its settings.  Subclasses with attributes that
+        cannot be pickled should leave them out.
+        """
+        return {key: val for key, val in self.__dict__.items()
+                if key != 'logger'}
 
-        files = self.get_file_list(path_exp)
-        res = {}
+    def map_ccds(self, method, paths, num_workers=None, **kwargs):
+        """Call a per-CCD method on each of a list of files.
 
-        for path in files:
-            if not os.path.exists(path):
-                continue
+        Parameters
+        ----------
+        method : str
+            name of a method of this object that takes a file path (and
+            `kwargs`) and returns a (ccd_id, result) tuple
+        paths : list of str
+            paths of the CCD files
+        num_workers : int or None (optional)
+            number of worker processes to use; if None, use the
+            `num_workers` attribute.  1 processes the files serially.
+
+        Returns
+        -------
+        results : list of (ccd_id, result) tuples, sorted by ccd_id
+        """
+        if num_workers is None:
+            num_workers = self.num_workers
+
+        if num_workers <= 1 or len(paths) <= 1:
+            results = [getattr(self, method)(path, **kwargs)
+                       for path in paths]
+        else:
+            self.logger.debug("processing %d files with %d workers" % (
+                len(paths), num_workers))
+            initargs = (self.__class__, get_logger_state(self.logger),
+                        self.get_worker_state(), kwargs)
+            with ProcessPoolExecutor(max_workers=num_workers,
+                                     initializer=_init_worker,
+                                     initargs=initargs) as ex:
+                results = list(ex.map(_call_worker,
+                                      [method] * len(paths), paths))
+            results = [(ccd_id, unpack_image(res, logger=self.logger)
+                        if isinstance(res, tuple) else res)
+                       for ccd_id, res in results]
+
+        results.sort(key=lambda tup: tup[0])
+        return results
+
+
+    def make_exp_tile(self, path, flat_dict={}, flat_mean=None,
+                      output_pfx='exp', output_dir=None):
+
+        image = self.load_image(path)
+        #image = AstroImage.AstroImage(logger=self.logger)
+        #image.load_file(path)
+
+        ccd_id = int(image.get_keyword('DET-ID'))
 
-            image = self.load_image(path)
-            #image = AstroImage.AstroImage(logger=self.logger)
-            #image.load_file(path)
+        data_np = image.get_data()
 
-            ccd_id = int(image.get_keyword('DET-ID'))
+        # subtract overscan and trim
+        plan = self.get_overscan_plan(image)
+        header = {}
+        newarr = plan.apply(data_np, header=header)
 
-            data_np = image.get_data()
+        if ccd_id in flat_dict:
+            flat = flat_dict[ccd_id]
 
-            # subtract overscan and trim
-            d = self.get_regions(image)
-            header = {}
-            newarr = self.subtract_overscan_np(data_np, d,
-                                               header=header)
+            if newarr.shape == flat.shape:
+                if flat_mean is not None:
+                    avg = flat_mean
+                else:
+                    avg = numpy.mean(flat)
 
-            if ccd_id in flat_dict:
-                flat = flat_dict[ccd_id]
+                newarr /= flat
+                newarr *= avg
 
-                if newarr.shape == flat.shape:
-                    if flat_mean is not None:
-                        avg = flat_mean
-                    else:
-                        avg = numpy.mean(flat)
+        img_exp = dp.make_image(newarr, image, header)
 
-                    newarr /= flat
-                    newarr *= avg
+        if output_dir is None:
+            return ccd_id, img_exp
 
-            img_exp = dp.make_image(newarr, image, header)
+        # write the output file
+        name = '%s-%d.fits' % (output_pfx, ccd_id)
+        outfile = os.path.join(output_dir, name)
+        self.logger.debug("Writing output file: %s" % (outfile))
+        try:
+            os.remove(outfile)
+        except OSError:
+            pass
+        img_exp.save_as_file(outfile)
+        return ccd_id, outfile
 
-            if output_dir is None:
-                res[ccd_id] = img_exp
-            else:
-                # write the output file
-                name = '%s-%d.fits' % (output_pfx, ccd_id)
-                outfile = os.path.join(output_dir, name)
-                res[ccd_id] = outfile
-                self.logger.debug("Writing output file: %s" % (outfile))
-                try:
-                    os.remove(outfile)
-                except OSError:
-                    pass
-                img_exp.save_as_file(outfile)
 
+    def make_exp_tiles(self, path_exp, flat_dict={}, flat_mean=None,
+                       output_pfx='exp', output_dir=None, num_workers=None):
+
+        files = [path for path in self.get_file_list(path_exp)
+                 if os.path.exists(path)]
+
+        results = self.map_ccds('make_exp_tile', files,
+                                num_workers=num_workers,
+                                flat_dict=flat_dict, flat_mean=flat_mean,
+                                output_pfx=output_pfx, output_dir=output_dir)
+
+        # results are in DET-ID order
+        res = dict(results)
         return res
 
 
@@ -492,19 +979,29 @@ class SuprimeCamDR(object):
         return img_mosaic
 
     def remove_overscan(self, img, sub_bias=True):
-        d = self.get_regions(img)
+        plan = self.get_overscan_plan(img)
         header = {}
-        new_data_np = self.subtract_overscan_np(img.get_data(), d,
-                                                sub_bias=sub_bias,
-                                                header=header)
+        new_data_np = plan.apply(img.get_data(), sub_bias=sub_bias,
+                                 header=header)
         img.set_data(new_data_np)
         img.update_keywords(header)
 
-    def make_quick_mosaic(self, path):
+    def load_trimmed_image(self, path):
+        img = self.load_image(path)
+        ccd_id = int(img.get_keyword('DET-ID'))
+        self.remove_overscan(img)
+        return ccd_id, img
+
+    def make_quick_mosaic(self, path, num_workers=None):
 
         # get the list of files making up this exposure
         files = self.get_file_list(path)
 
+        if num_workers is None:
+            num_workers = self.num_workers
+        if num_workers > 1:
+            return self._make_quick_mosaic_parallel(files, num_workers)
+
         img = AstroImage.AstroImage(logger=self.logger)
         img.load_file(files[0])
 
@@ -533,11 +1030,81 @@ class SuprimeCamDR(object):
         time_end = time.time()
         time_total = time_end - time_start
 
-        print ("total time: %.2f t1=%.3f t2=%.3f t3=%.3f" % (
+        self.logger.debug("total time: %.2f t1=%.3f t2=%.3f t3=%.3f" % (
             time_total, t1_sum, t2_sum, t3_sum))
         return img_mosaic
 
-    def make_multi_hdu(self, images, compress=False):
+    def _make_quick_mosaic_parallel(self, files, num_workers):
+
+        time_start = time.time()
+        # load and trim the CCDs in worker processes
+        results = self.map_ccds('load_trimmed_image', files,
+                                num_workers=num_workers)
+        time_t1 = time.time()
+
+        # mosaic them in DET-ID order
+        img = results[0][1]
+        img_mosaic = self.prepare_mosaic(img, self.fov)
+        img_mosaic.mosaic_inline([img])
+        for ccd_id, img in results[1:]:
+            img_mosaic.mosaic_inline([img], merge=True, allow_expand=False,
+                                     update_minmax=False)
+
+        time_end = time.time()
+        self.logger.debug("total time: %.2f load+trim=%.3f mosaic=%.3f (%d workers)" % (
+            time_end - time_start, time_t1 - time_start, time_end - time_t1,
+            num_workers))
+        return img_mosaic
+
+    def make_primary_hdu(self, header):
+        """Make a data-less primary HDU for a multi-HDU exposure file,
+        with the keywords of `header` that belong in the primary HDU.
+        `header` can be a ginga or an astropy header.
+        """
+        import astropy.io.fits as pyfits
+
+        hdu = pyfits.PrimaryHDU()
+        prihdr = hdu.header
+        for kwd, val, comment in get_cards(header, self.prihdr_kwds):
+            prihdr[kwd] = (val, comment)
+        return hdu
+
+    def make_image_hdu(self, data, header, compress=False):
+        """Make an image HDU for one CCD of a multi-HDU exposure file,
+        with the keywords of `header` that belong in the image HDUs.
+        `header` can be a ginga or an astropy header.
+        """
+        import astropy.io.fits as pyfits
+
+        data = data.astype(numpy.uint16, copy=False)
+
+        name = "DET-%s" % header['DET-ID']
+        if not compress:
+            hdu = pyfits.ImageHDU(data=data)
+        else:
+            hdu = pyfits.CompImageHDU(data=data,
+                                      compression_type='RICE_1',
+                                      name=name)
+
+        for kwd, val, comment in get_cards(header, self.imghdr_kwds):
+            hdu.header[kwd] = (val, comment)
+
+        # add CHECKSUM and DATASUM keywords
+        if not compress:
+            hdu.add_checksum()
+
+        return hdu
+
+    def _get_executor(self, num_workers, executor):
+        if executor == 'process':
+            return ProcessPoolExecutor(max_workers=num_workers)
+        elif executor == 'thread':
+            return ThreadPoolExecutor(max_workers=num_workers)
+        raise ValueError("executor should be 'process' or 'thread': %s" % (
+            executor))
+
+    def make_multi_hdu(self, images, compress=False, num_workers=None,
+                       executor='process'):
         """
         Pack a group of separate FITS files (a single exposure) into one
         FITS file with one primary HDU with no data and 10 image HDUs.
@@ -548,57 +1115,52 @@ class SuprimeCamDR(object):
         compress : bool (optional)
             if True, will try to Rice-compress the image HDUs.  Note that
             this slows down the process considerably.  Default: False
+        num_workers : int or None (optional)
+            if compressing, the number of workers that compress the HDUs
+            concurrently; if None, use the `num_workers` attribute
+            (1 unless set).  1 compresses them serially when the result
+            is written, which is faster on machines with few cores (see
+            util/bench_multi_hdu.py).
+        executor : str (optional)
+            'process' or 'thread': the kind of pool used for concurrent
+            compression.  Default: 'process'
         """
 
         import astropy.io.fits as pyfits
 
         fitsobj = pyfits.HDUList()
 
-        i = 0
-        hdus = {}
+        # prepare primary HDU header
+        fitsobj.append(self.make_primary_hdu(images[0].get_header()))
 
+        hdus = {}
         for image in images:
-            header = image.get_header()
-            if i == 0:
-                # prepare primary HDU header
-                hdu = pyfits.PrimaryHDU()
-                prihdr = hdu.header
-                for kwd in header.keys():
-                    if kwd.upper() in self.prihdr_kwds:
-                        card = header.get_card(kwd)
-                        val, comment = card.value, card.comment
-                        prihdr[kwd] = (val, comment)
-
-                fitsobj.append(hdu)
-
             # create each image HDU
-            data = numpy.copy(image.get_data().astype(numpy.uint16))
-
-            name = "DET-%s" % header['DET-ID']
-            if not compress:
-                hdu = pyfits.ImageHDU(data=data)
-            else:
-                hdu = pyfits.CompImageHDU(data=data,
-                                          compression_type='RICE_1',
-                                          name=name)
-
-            for kwd in header.keys():
-                if kwd.upper() in self.imghdr_kwds:
-                    card = header.get_card(kwd)
-                    val, comment = card.value, card.comment
-                    hdu.header[kwd] = (val, comment)
-
-            # add CHECKSUM and DATASUM keywords
-            if not compress:
-                hdu.add_checksum()
+            header = image.get_header()
+            hdu = self.make_image_hdu(image.get_data(), header,
+                                      compress=compress)
 
             det_id = int(header['DET-ID'])
             hdus[det_id] = hdu
-            i += 1
 
         # stack HDUs in detector ID order
         det_ids = list(hdus.keys())
         det_ids.sort()
+
+        if num_workers is None:
+            num_workers = self.num_workers
+        if compress and num_workers > 1:
+            # compress the HDUs concurrently and rebuild the HDU list
+            # from the compressed bytes, which are not compressed again
+            # when the HDU list is written out
+            buf = io.BytesIO()
+            fitsobj.writeto(buf, output_verify='silentfix')
+            with self._get_executor(num_workers, executor) as ex:
+                for hdu_bytes in ex.map(hdu_to_bytes,
+                                        [hdus[i] for i in det_ids]):
+                    buf.write(hdu_bytes)
+            return pyfits.HDUList.fromstring(buf.getvalue())
+
         for i in det_ids:
             fitsobj.append(hdus[i])
 
@@ -607,6 +1169,74 @@ class SuprimeCamDR(object):
 
         return fitsobj
 
+    def write_multi_hdu(self, paths, outfile, compress=False,
+                        num_workers=None, executor='process'):
+        """
+        Pack a group of separate FITS files (a single exposure) into one
+        FITS file with one primary HDU with no data and an image HDU for
+        each file, like make_multi_hdu().  The files are streamed into
+        the output file a few at a time, so only a few CCDs are held in
+        memory.
+
+        Parameters
+        ----------
+        paths : list of str
+            paths of the FITS files of the exposure
+        outfile : str
+            path of the output file, which must not exist
+        compress : bool (optional)
+            if True, will try to Rice-compress the image HDUs.  Note that
+            this slows down the process considerably.  Default: False
+        num_workers : int or None (optional)
+            if compressing, the number of workers that compress the HDUs
+            concurrently; if None, use the `num_workers` attribute.
+            At most this many CCDs are held in memory at once.
+        executor : str (optional)
+            'process' or 'thread': the kind of pool used for concurrent
+            compression.  Default: 'process'
+        """
+
+        import astropy.io.fits as pyfits
+
+        # sort the files into detector ID order up front, reading
+        # only their headers
+        det_ids = [int(pyfits.getval(path, 'DET-ID')) for path in paths]
+        order = sorted(range(len(paths)), key=lambda i: det_ids[i])
+
+        # primary HDU header comes from the first frame
+        hdu = self.make_primary_hdu(pyfits.getheader(paths[0]))
+        hdu.writeto(outfile, output_verify='silentfix')
+
+        if num_workers is None:
+            num_workers = self.num_workers
+        if not compress:
+            num_workers = 1
+
+        ex = None
+        if num_workers > 1:
+            ex = self._get_executor(num_workers, executor)
+
+        try:
+            with open(outfile, 'ab') as out_f:
+                for i in range(0, len(order), num_workers):
+                    hdus = []
+                    for j in order[i:i+num_workers]:
+                        self.logger.debug("packing %s" % (paths[j]))
+                        with pyfits.open(paths[j]) as in_f:
+                            hdus.append(self.make_image_hdu(in_f[0].data,
+                                                            in_f[0].header,
+                                                            compress=compress))
+                    if ex is None:
+                        res = map(hdu_to_bytes, hdus)
+                    else:
+                        res = ex.map(hdu_to_bytes, hdus)
+                    for hdu_bytes in res:
+                        out_f.write(hdu_bytes)
+                    del hdus, res
+        finally:
+            if ex is not None:
+                ex.shutdown()
+
 
     def step2(self, image):
         """
@@ -616,11 +1246,11 @@ class SuprimeCamDR(object):
         it also subtracts the bias median calculated from the overscan
         regions.
         """
-        d = self.get_regions(image)
+        plan = self.get_overscan_plan(image)
         header = {}
         data_np = image.get_data()
 
-        result = self.subtract_overscan_np(data_np, d, header=header)
+        result = plan.apply(data_np, header=header)
 
         newimage = dp.make_image(result, image, header)
         return newimage
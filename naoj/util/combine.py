@@ -0,0 +1,150 @@
+#
+# combine.py -- memory-bounded combination of stacks of images
+#
+# This is open-source software licensed under a BSD license.
+# Please see the file LICENSE.txt for details.
+#
+import numpy as np
+
+
+def combine_stack(stack, method='median', chunk_rows=256, dtype=np.float64,
+                  nsigma=3.0, niter=5, out=None):
+    """
+    Combine a stack of images pixel by pixel, a chunk of rows at a time,
+    so that only ``N x chunk_rows`` rows of the stack are in memory at once.
+
+    Parameters
+    ----------
+    stack : ndarray or list of ndarray
+        An (N, ht, wd) array or a list of N (ht, wd) arrays.  These can be
+        memory-mapped arrays.
+
+    method : str, optional, defaults to 'median'
+        'median' for an exact median, 'sigclip' for a sigma-clipped mean
+
+    chunk_rows : int, optional, defaults to 256
+        Number of rows to combine at a time
+
+    dtype : dtype, optional, defaults to numpy.float64
+        Working precision, and type of the result
+
+    nsigma : float, optional, defaults to 3.0
+        For 'sigclip', the clipping limit in standard deviations
+
+    niter : int, optional, defaults to 5
+        For 'sigclip', the maximum number of clipping iterations
+
+    out : ndarray or None, optional, defaults to None
+        A (ht, wd) array to hold the result
+
+    Returns
+    -------
+    out : ndarray
+        The combined (ht, wd) image
+    """
+    if method not in ('median', 'sigclip'):
+        raise ValueError("method should be 'median' or 'sigclip': %s" % (
+            method))
+
+    ht, wd = stack[0].shape
+    if out is None:
+        out = np.empty((ht, wd), dtype=dtype)
+
+    for row in range(0, ht, chunk_rows):
+        rows = slice(row, min(row + chunk_rows, ht))
+        chunk = np.array([frame[rows] for frame in stack], dtype=dtype)
+
+        if method == 'median':
+            out[rows] = np.median(chunk, axis=0, overwrite_input=True)
+        else:
+            out[rows] = sigclip_mean(chunk, nsigma=nsigma, niter=niter)
+
+    return out
+
+
+def sigclip_mean(data, nsigma=3.0, niter=5):
+    """
+    Sigma-clipped mean along the first axis of an array.
+
+    Parameters
+    ----------
+    data : ndarray
+        A floating point array, of which rejected values are replaced by
+        NaN in place
+
+    nsigma : float, optional, defaults to 3.0
+        The clipping limit in standard deviations
+
+    niter : int, optional, defaults to 5
+        The maximum number of clipping iterations
+
+    Returns
+    -------
+    mean : ndarray
+        The clipped mean, with one less dimension than ``data``
+    """
+    for i in range(niter):
+        mean = np.nanmean(data, axis=0)
+        limit = nsigma * np.nanstd(data, axis=0)
+        reject = np.fabs(data - mean) > limit
+        if not np.any(reject):
+            break
+        data[reject] = np.nan
+
+    return np.nanmean(data, axis=0)
+
+
+class Remedian(object):
+    """
+    Approximate median of a stream of images by the remedian method
+    (Rousseeuw & Bassett 1990).
+
+    Images are added one at a time.  Every `base` images are reduced to
+    their median, and every `base` of those medians to their median,
+    and so on, so that at most `base` images per level are held in memory.
+
+    Parameters
+    ----------
+    base : int, optional, defaults to 5
+        Number of images per level
+
+    dtype : dtype, optional, defaults to numpy.float64
+        Working precision, and type of the result
+    """
+
+    def __init__(self, base=5, dtype=np.float64):
+        self.base = base
+        self.dtype = dtype
+        self.levels = []
+
+    def add(self, data):
+        """Add an image to the stream (the data is copied)."""
+        data = np.array(data, dtype=self.dtype)
+        for level in self.levels:
+            level.append(data)
+            if len(level) < self.base:
+                return
+            data = np.median(np.array(level), axis=0)
+            del level[:]
+        self.levels.append([data])
+
+    def get_result(self):
+        """Return the approximate median of the images added so far."""
+        # weighted median of the images still held at every level; an
+        # image at level n stands for base**n of the original images
+        items, weights = [], []
+        for n, level in enumerate(self.levels):
+            items.extend(level)
+            weights.extend([self.base ** n] * len(level))
+        if len(items) == 0:
+            raise ValueError("no images have been added")
+        if len(items) == 1:
+            return items[0]
+
+        items = np.array(items)
+        weights = np.array(weights, dtype=float)
+        idx = np.argsort(items, axis=0)
+        cumwt = np.cumsum(weights[idx], axis=0)
+        k = np.argmax(cumwt >= cumwt[-1] / 2.0, axis=0)
+        items = np.take_along_axis(items, idx, axis=0)
+        return np.take_along_axis(items, k[np.newaxis], axis=0)[0]
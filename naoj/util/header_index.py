@@ -0,0 +1,474 @@
+#
+# header_index.py -- an index of the FITS header keywords of the files
+#                    in a data directory
+#
+# This is open-source software licensed under a BSD license.
+# Please see the file LICENSE.txt for details.
+#
+"""
+An index of a few FITS header keywords (FRAMEID, EXP-ID, DET-ID, ...)
+of all the FITS files in a raw data directory, so that the files can be
+looked up and grouped without opening each of them.
+
+The index is built by reading only the primary header of each file, and
+is kept in a compact table in the directory (``.header_index.npz``).
+When it is updated, only the files that are new or were modified since
+(by modification time and size) are read again::
+
+    from naoj.util import header_index
+    index = header_index.get_index('/data/FOCAS')
+    index.getval('/data/FOCAS/FCSA00012345.fits', 'FRAMEID')
+    index.select({'DATA-TYP': 'BIAS', 'DET-ID': 1})
+    index.groupby('EXP-ID')
+
+If the directory can't be written, the index is only kept in memory.
+
+get_header() and getval() check the modification time and size of the
+file and read its header again if it changed; select() and groupby()
+use the index as of the last update().
+"""
+import os
+import fnmatch
+import zipfile
+import tempfile
+import threading
+
+import numpy as np
+from astropy.io import fits
+
+index_file = '.header_index.npz'
+
+# keywords kept in the index by default
+index_keywords = ('FRAMEID', 'EXP-ID', 'DET-ID', 'DATA-TYP', 'OBJECT',
+                  'OBS-MOD', 'BIN-FCT1', 'BIN-FCT2', 'FILTER01',
+                  'FILTER02', 'FILTER03', 'DATE-OBS', 'UT-STR', 'EXPTIME',
+                  'NAXIS1', 'NAXIS2', 'INSTRUME')
+
+_lock = threading.Lock()
+_indexes = {}
+
+
+def read_header(path):
+    """
+    Read the primary header of a FITS file, and nothing else.
+
+    Parameters
+    ----------
+    path : str
+        path of the FITS file
+
+    Returns
+    -------
+    header : astropy.io.fits.Header
+
+    Raises
+    ------
+    OSError
+        if the file can't be read, or is empty (e.g. still being
+        written)
+    """
+    with open(path, 'rb') as in_f:
+        try:
+            return fits.Header.fromfile(in_f)
+        except EOFError:
+            raise OSError("No FITS header in %s" % (path))
+
+
+def get_keywords(header, keywords):
+    """
+    Get the values of some keywords of a header, as a dictionary.
+    Keywords that are missing or have no value are left out.
+    """
+    return {kwd: header[kwd] for kwd in keywords
+            if kwd in header and
+            not isinstance(header[kwd], fits.card.Undefined)}
+
+
+# types of the values in a column of mixed types, by their code in the
+# column's type array, and how each is read back from its string
+value_types = (str, bool, int, float)
+_from_str = (str, lambda s: s == 'True', int, float)
+
+
+def _type_code(val):
+    # code of the type of a header value; values of other types (e.g.
+    # complex) are kept as strings
+    try:
+        return value_types.index(type(val))
+    except ValueError:
+        return 0
+
+
+def _column(values, present):
+    # arrays for the values of a keyword in all the files: the values, of
+    # the type of the values that are present, and None if they all have
+    # the same type; or else the values as strings, and the code of the
+    # type of each value (see `value_types`)
+    codes = [_type_code(val) if ok else -1
+             for val, ok in zip(values, present)]
+    kinds = set(codes) - {-1}
+    if len(kinds) <= 1:
+        code = kinds.pop() if kinds else 0
+        kind, fill = ((str, ''), (bool, False), (np.int64, 0),
+                      (np.float64, 0.0))[code]
+        return np.array([(val if code > 0 else str(val)) if ok else fill
+                         for val, ok in zip(values, present)],
+                        dtype=kind), None
+    return (np.array([str(val) if ok else ''
+                      for val, ok in zip(values, present)], dtype=str),
+            np.array(codes, dtype=np.int8))
+
+
+def _values(npz, kwd):
+    # the values of a keyword in all the files, from the arrays written
+    # by _column()
+    values = npz['v:' + kwd].tolist()
+    if 't:' + kwd not in npz.files:
+        return values
+    return [_from_str[code](val) if code >= 0 else val
+            for val, code in zip(values, npz['t:' + kwd].tolist())]
+
+
+class HeaderIndex(object):
+    """
+    An index of the header keywords of the FITS files in a directory.
+
+    Parameters
+    ----------
+    directory : str
+        the data directory; only the files directly in it are indexed
+    keywords : sequence of str (optional)
+        the keywords to keep.  Default: `index_keywords`
+    pattern : str (optional)
+        a glob pattern of the names of the files to index.
+        Default: '*.fits'
+    filepath : str or None (optional)
+        path of the file holding the index.  Default: `index_file` in
+        the directory
+    """
+
+    def __init__(self, directory, keywords=None, pattern='*.fits',
+                 filepath=None):
+        self.directory = os.path.abspath(directory)
+        if keywords is None:
+            keywords = index_keywords
+        self.keywords = tuple(kwd.upper() for kwd in keywords)
+        self.pattern = pattern
+        if filepath is None:
+            filepath = os.path.join(self.directory, index_file)
+        self.filepath = filepath
+
+        # file name -> (mtime_ns, size, {keyword: value})
+        self._records = {}
+        self._dirty = False
+        self.load()
+
+    def load(self):
+        """
+        Load the index from its file, if it exists and was made for the
+        same keywords.
+        """
+        self._records = {}
+        try:
+            with np.load(self.filepath) as npz:
+                if tuple(npz['keywords'].tolist()) != self.keywords:
+                    return
+                names = npz['names'].tolist()
+                mtimes = npz['mtimes'].tolist()
+                sizes = npz['sizes'].tolist()
+                columns = [(kwd, _values(npz, kwd),
+                            npz['m:' + kwd].tolist())
+                           for kwd in self.keywords]
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            # no index yet, or an unusable one: start over
+            return
+        for i, name in enumerate(names):
+            kwds = {kwd: values[i] for kwd, values, present in columns
+                    if present[i]}
+            self._records[name] = (mtimes[i], sizes[i], kwds)
+
+    def save(self):
+        """
+        Write the index to its file, replacing it.  Returns False if the
+        file can't be written.
+        """
+        names = sorted(self._records.keys())
+        records = [self._records[name] for name in names]
+        arrays = {}
+        for kwd in self.keywords:
+            values = [rec[2].get(kwd) for rec in records]
+            present = [kwd in rec[2] for rec in records]
+            arrays['v:' + kwd], codes = _column(values, present)
+            if codes is not None:
+                arrays['t:' + kwd] = codes
+            arrays['m:' + kwd] = np.array(present, dtype=bool)
+
+        # write a new file and move it into place, so that a reader
+        # never sees a partial file
+        dirname = os.path.dirname(os.path.abspath(self.filepath))
+        try:
+            fd, tmppath = tempfile.mkstemp(suffix='.npz', dir=dirname)
+        except OSError:
+            return False
+        try:
+            with os.fdopen(fd, 'wb') as out_f:
+                np.savez_compressed(
+                    out_f, keywords=np.array(self.keywords, dtype=str),
+                    names=np.array(names, dtype=str),
+                    mtimes=np.array([rec[0] for rec in records],
+                                    dtype=np.int64),
+                    sizes=np.array([rec[1] for rec in records],
+                                   dtype=np.int64),
+                    **arrays)
+            os.replace(tmppath, self.filepath)
+        except OSError:
+            os.remove(tmppath)
+            return False
+        self._dirty = False
+        return True
+
+    def _read(self, name, stat):
+        hdr = read_header(os.path.join(self.directory, name))
+        kwds = get_keywords(hdr, self.keywords)
+        self._records[name] = (stat.st_mtime_ns, stat.st_size, kwds)
+        self._dirty = True
+        return kwds
+
+    def update(self, save=True):
+        """
+        Bring the index up to date with the directory: the headers of the
+        new and the modified files are read, and the files that are gone
+        are dropped.
+
+        Parameters
+        ----------
+        save : bool (optional)
+            if True (the default), write the index file if anything
+            changed
+
+        Returns
+        -------
+        num_read : int
+            the number of files whose header was read
+        """
+        num_read = 0
+        seen = set()
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if not (fnmatch.fnmatch(entry.name, self.pattern) and
+                        entry.is_file()):
+                    continue
+                seen.add(entry.name)
+                stat = entry.stat()
+                rec = self._records.get(entry.name, None)
+                if (rec is not None and rec[0] == stat.st_mtime_ns and
+                    rec[1] == stat.st_size):
+                    continue
+                try:
+                    self._read(entry.name, stat)
+                except (OSError, ValueError):
+                    # not a readable FITS file (yet)
+                    self._records.pop(entry.name, None)
+                    continue
+                num_read += 1
+
+        for name in set(self._records.keys()) - seen:
+            del self._records[name]
+            self._dirty = True
+
+        if save and self._dirty:
+            self.save()
+        return num_read
+
+    def _name(self, path):
+        # the name of a file in the index, or None if it isn't in the
+        # indexed directory
+        dirname, name = os.path.split(os.path.abspath(path))
+        if dirname != self.directory:
+            return None
+        return name
+
+    def __contains__(self, path):
+        name = self._name(path)
+        return name is not None and name in self._records
+
+    def __len__(self):
+        return len(self._records)
+
+    def paths(self):
+        """
+        Get the sorted paths of all the indexed files.
+        """
+        return [os.path.join(self.directory, name)
+                for name in sorted(self._records.keys())]
+
+    def get_header(self, path):
+        """
+        Get the indexed keywords of a file.  A file that isn't indexed
+        yet, or was modified since it was indexed, has its header read
+        (and is added to the index, if it is in the indexed directory).
+
+        Parameters
+        ----------
+        path : str
+            path of the file
+
+        Returns
+        -------
+        kwds : dict
+            the keywords of the file that are in the index, and their
+            values
+        """
+        name = self._name(path)
+        if name is None:
+            return get_keywords(read_header(path), self.keywords)
+        try:
+            stat = os.stat(os.path.join(self.directory, name))
+        except OSError:
+            # the file is gone
+            if self._records.pop(name, None) is not None:
+                self._dirty = True
+            raise
+        rec = self._records.get(name, None)
+        if (rec is not None and rec[0] == stat.st_mtime_ns and
+            rec[1] == stat.st_size):
+            return dict(rec[2])
+        return dict(self._read(name, stat))
+
+    def getval(self, path, keyword, *args):
+        """
+        Get the value of a keyword of a file, like `astropy.io.fits.getval`.
+        Keywords that aren't indexed are read from the file.
+
+        Parameters
+        ----------
+        path : str
+            path of the file
+        keyword : str
+            the keyword
+        default : (optional)
+            a value to return if the file doesn't have the keyword;
+            otherwise a KeyError is raised
+        """
+        keyword = keyword.upper()
+        if keyword not in self.keywords:
+            hdr = read_header(path)
+            return hdr.get(keyword, *args) if args else hdr[keyword]
+        kwds = self.get_header(path)
+        if args:
+            return kwds.get(keyword, args[0])
+        if keyword not in kwds:
+            raise KeyError("Keyword '%s' not found in %s" % (keyword, path))
+        return kwds[keyword]
+
+    def select(self, criteria):
+        """
+        Get the sorted paths of the files whose keywords have the given
+        values.
+
+        Parameters
+        ----------
+        criteria : dict
+            keywords and the values they should have, e.g.
+            ``{'DATA-TYP': 'BIAS', 'BIN-FCT1': 1}``; a value can also be
+            a function of the value of the keyword, that returns a bool
+
+        Returns
+        -------
+        paths : list of str
+        """
+        tests = []
+        for kwd, val in criteria.items():
+            kwd = kwd.upper()
+            if kwd not in self.keywords:
+                raise KeyError("Keyword '%s' is not indexed" % (kwd))
+            if not callable(val):
+                val = (lambda v: lambda x: x == v)(val)
+            tests.append((kwd, val))
+
+        res = []
+        for name in sorted(self._records.keys()):
+            kwds = self._records[name][2]
+            if all(kwd in kwds and test(kwds[kwd]) for kwd, test in tests):
+                res.append(os.path.join(self.directory, name))
+        return res
+
+    def groupby(self, keyword, paths=None):
+        """
+        Group files by the value of a keyword, e.g. the CCD files of each
+        exposure by 'EXP-ID'.  Files without the keyword are left out.
+        The indexed values are used for the files in the index.
+
+        Parameters
+        ----------
+        keyword : str
+            an indexed keyword
+        paths : list of str (optional)
+            the files to group, e.g. from select().  Default: all files
+
+        Returns
+        -------
+        groups : dict
+            the sorted paths of the files, keyed by the keyword value
+        """
+        keyword = keyword.upper()
+        if keyword not in self.keywords:
+            raise KeyError("Keyword '%s' is not indexed" % (keyword))
+        if paths is None:
+            paths = self.paths()
+        groups = {}
+        for path in sorted(paths):
+            rec = self._records.get(self._name(path), None)
+            kwds = rec[2] if rec is not None else self.get_header(path)
+            val = kwds.get(keyword, None)
+            if val is not None:
+                groups.setdefault(val, []).append(path)
+        return groups
+
+
+def get_index(directory, keywords=None, update=True):
+    """
+    Get the header index of a directory.  The index is made (or loaded
+    from its file) on the first call for the directory, and kept.
+
+    Parameters
+    ----------
+    directory : str
+        the data directory
+    keywords : sequence of str (optional)
+        the keywords to keep.  Default: `index_keywords`
+    update : bool (optional)
+        if True (the default), bring the index up to date with the
+        directory (see HeaderIndex.update())
+
+    Returns
+    -------
+    index : HeaderIndex
+    """
+    if keywords is None:
+        keywords = index_keywords
+    key = (os.path.abspath(directory),
+           tuple(kwd.upper() for kwd in keywords))
+    with _lock:
+        index = _indexes.get(key, None)
+        if index is None:
+            index = HeaderIndex(directory, keywords=keywords)
+            _indexes[key] = index
+        if update:
+            index.update()
+        return index
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description='Make or update the FITS'
+                                     ' header index of data directories.')
+    parser.add_argument('directory', nargs='+',
+                        help='Data directory')
+    args = parser.parse_args()
+
+    for directory in args.directory:
+        index = HeaderIndex(directory)
+        num_read = index.update()
+        print('%s: %d files, %d headers read' % (directory, len(index),
+                                                 num_read))
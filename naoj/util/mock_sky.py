@@ -4,12 +4,45 @@
 # This is open-source software licensed under a BSD license.
 # Please see the file LICENSE.txt for details.
 #
+"""
+Functions for creating mock sky images, and mock raw exposures of
+Hyper Suprime-Cam for testing the data reduction code without real data.
+
+The random numbers are drawn from the `rng` given to each function,
+which can be a seed or a ``numpy.random.Generator`` for reproducible
+images; if it is None, the global ``np.random`` state is used, as in
+the past.  mk_hsc_exposure() draws each CCD from its own seed, spawned
+from one seed for the exposure, so that the CCDs can be made in
+parallel and are the same however they are made.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 
-from astropy.modeling.functional_models import Gaussian2D
+
+def get_rng(rng=None):
+    """
+    Get the source of random numbers for the mock sky functions.
+
+    Parameters
+    ----------
+    rng : None, int, SeedSequence or Generator, optional
+        A seed for a new ``numpy.random.Generator``, or a Generator,
+        which is returned as is; if None, the global ``np.random`` state
+
+    Returns
+    -------
+    rng : Generator or module
+        Something with the ``normal()`` and ``random()`` methods of a
+        Generator
+    """
+    if rng is None or rng is np.random:
+        return np.random
+    return np.random.default_rng(rng)
 
 
-def add_bg(arr, bg_mean, bg_sdev):
+def add_bg(arr, bg_mean, bg_sdev, rng=None):
     """
     Add a background level to an image.
 
@@ -24,14 +57,97 @@ def add_bg(arr, bg_mean, bg_sdev):
     bg_sdev : float
         The standard deviation of the sky background
 
+    rng : None, int or Generator, optional
+        The source of random numbers (see get_rng())
+
     Side-effects ``arr`` to add the background.
     """
-    bg = np.random.normal(loc=bg_mean, scale=bg_sdev,
-                          size=arr.shape).astype(arr.dtype)
+    bg = get_rng(rng).normal(loc=bg_mean, scale=bg_sdev,
+                             size=arr.shape).astype(arr.dtype)
     arr += bg
 
 
-def add_star(arr, pos, amp, sdev=2.0, ellip=0.8, blur=None):
+def add_stars(arr, pos, amp, x_stddev, y_stddev, blur=None, nsig=5.0,
+              chunk_size=4096):
+    """
+    Add many fake stars to an image at once.
+
+    Each star is evaluated only in a square cutout of +/- `nsig`
+    standard deviations around its position, and the cutouts of a batch
+    of stars are accumulated with a single ``np.add.at``.
+
+    Parameters
+    ----------
+    arr : ndarray
+        sky image as a 2D numpy array
+
+    pos : (x, y) tuple of arrays
+        Positions of the stars within the field
+
+    amp : array of float
+        The amplitudes of the gaussians above the background median
+
+    x_stddev, y_stddev : array of float
+        The standard deviations of the gaussians along X and Y
+
+    blur : float or None, optional, defaults to None
+        If not None, specifies a sigma to blur the stars; the blur is
+        applied once to all the stars
+
+    nsig : float, optional, defaults to 5.0
+        The half size of the cutouts, in standard deviations
+
+    chunk_size : int, optional, defaults to 4096
+        The number of stars rendered in a batch
+
+    Side-effects ``arr`` to add the fake stellar images with the given
+    parameters.
+    """
+    x, y, amp, x_stddev, y_stddev = np.broadcast_arrays(
+        *[np.atleast_1d(np.asarray(v, dtype=np.float64))
+          for v in (pos[0], pos[1], amp, x_stddev, y_stddev)])
+    ht, wd = arr.shape
+
+    # star light, accumulated in floating point
+    if arr.dtype.kind == 'f' and blur is None and arr.flags.c_contiguous:
+        layer = arr
+    else:
+        layer = np.zeros(arr.shape, dtype=np.float32)
+    flat = layer.reshape(-1)
+
+    for i in range(0, len(x), chunk_size):
+        sl = slice(i, i + chunk_size)
+        xc, yc, a = x[sl], y[sl], amp[sl]
+        sx, sy = x_stddev[sl], y_stddev[sl]
+        rad = int(np.ceil(nsig * max(sx.max(), sy.max())))
+        off = np.arange(-rad, rad + 1)
+
+        # pixel indices of the cutouts
+        cols = np.rint(xc).astype(np.intp)[:, np.newaxis] + off
+        rows = np.rint(yc).astype(np.intp)[:, np.newaxis] + off
+
+        # separable gaussians
+        gx = np.exp(-0.5 * ((cols - xc[:, np.newaxis]) /
+                            sx[:, np.newaxis]) ** 2)
+        gy = np.exp(-0.5 * ((rows - yc[:, np.newaxis]) /
+                            sy[:, np.newaxis]) ** 2)
+        gy *= a[:, np.newaxis]
+        stamps = gy[:, :, np.newaxis] * gx[:, np.newaxis, :]
+
+        # drop the parts of the cutouts outside of the image
+        ok = (((rows >= 0) & (rows < ht))[:, :, np.newaxis] &
+              ((cols >= 0) & (cols < wd))[:, np.newaxis, :])
+        idx = rows[:, :, np.newaxis] * wd + cols[:, np.newaxis, :]
+        np.add.at(flat, idx[ok], stamps[ok].astype(layer.dtype))
+
+    if layer is not arr:
+        if blur is not None:
+            from scipy.ndimage import gaussian_filter
+            layer = gaussian_filter(layer, sigma=blur)
+        arr += layer.astype(arr.dtype)
+
+
+def add_star(arr, pos, amp, sdev=2.0, ellip=0.8, blur=None, rng=None):
     """
     Add a fake star to an image.
 
@@ -55,29 +171,22 @@ def add_star(arr, pos, amp, sdev=2.0, ellip=0.8, blur=None):
     blur : float or None, optional, defaults to None
         If not None, specifies a sigma to blur the gaussian
 
+    rng : None, int or Generator, optional
+        The source of random numbers (see get_rng())
+
     Side-effects ``arr`` to add the fake stellar image with the given
     parameters.
     """
-    ylen, xlen = arr.shape
-    x_stddev = sdev + np.random.random() * (1.0 - ellip)
-    y_stddev = sdev + np.random.random() * (1.0 - ellip)
-
-    g = Gaussian2D(amplitude=amp, x_mean=pos[1], y_mean=pos[0],
-                   x_stddev=x_stddev, y_stddev=y_stddev)
-
-    xx, yy = np.mgrid[:ylen, :xlen]
-    gauss = g(xx, yy).astype(arr.dtype)
-
-    if blur is not None:
-        from scipy.ndimage.filters import gaussian_filter
-        gauss = gaussian_filter(gauss, sigma=blur)
+    rng = get_rng(rng)
+    x_stddev = sdev + rng.random() * (1.0 - ellip)
+    y_stddev = sdev + rng.random() * (1.0 - ellip)
 
-    arr += gauss
+    add_stars(arr, pos, amp, x_stddev, y_stddev, blur=blur)
 
 
 def mk_star_image(arr, num_stars, amp_rng=None, sdev=None,
                   ellip=0.8, edge=0.6, blur=None,
-                  bg_mean=2000.0, bg_sdev=15.0):
+                  bg_mean=2000.0, bg_sdev=15.0, rng=None):
     """
     Make a fake stellar image.
 
@@ -92,6 +201,9 @@ def mk_star_image(arr, num_stars, amp_rng=None, sdev=None,
     amp_rng : (lo, hi) tuple of float
         The range of the brightness of stars to be added, default: (50, 1000)
 
+    sdev : float, optional, defaults to 2.0
+        The base standard deviation of the stars
+
     ellip : float, optional, defaults to 0.8
         A measure of the ellipticity of the star (0-1, 1 is perfect)
 
@@ -107,6 +219,9 @@ def mk_star_image(arr, num_stars, amp_rng=None, sdev=None,
     bg_sdev : float, optional, defaults to 15.0
         The standard deviation of the background
 
+    rng : None, int or Generator, optional
+        The source of random numbers (see get_rng())
+
     Returns
     -------
     locs : list of tuple
@@ -115,9 +230,12 @@ def mk_star_image(arr, num_stars, amp_rng=None, sdev=None,
 
     if amp_rng is None:
         amp_rng = (50, 1000)
+    if sdev is None:
+        sdev = 2.0
+    rng = get_rng(rng)
 
     # create array of size and initialize background
-    add_bg(arr, bg_mean, bg_sdev)
+    add_bg(arr, bg_mean, bg_sdev, rng=rng)
 
     # calculate edge limits of stars within image
     ht, wd = arr.shape
@@ -125,60 +243,295 @@ def mk_star_image(arr, num_stars, amp_rng=None, sdev=None,
     x_l, x_h = ctr_x - int(ctr_x * edge), ctr_x + int(ctr_x * edge)
     y_l, y_h = ctr_y - int(ctr_y * edge), ctr_y + int(ctr_y * edge)
 
-    # add stars within brightness levels
-    locs = []
-    for i in range(num_stars):
-        x = (x_h - x_l) * np.random.random_sample() + x_l
-        y = (y_h - y_l) * np.random.random_sample() + y_l
-        amp = ((amp_rng[1] - amp_rng[0]) * np.random.random_sample() +
-               amp_rng[0])
-        pos = (x, y)
-        locs.append(pos)
-        add_star(arr, pos, amp, ellip=ellip, blur=blur)
+    # draw the positions, brightness levels and widths of all the stars
+    # at once: x, y, amp, x_stddev, y_stddev
+    params = rng.random((5, num_stars))
+    x = (x_h - x_l) * params[0] + x_l
+    y = (y_h - y_l) * params[1] + y_l
+    amp = (amp_rng[1] - amp_rng[0]) * params[2] + amp_rng[0]
+    x_stddev = sdev + params[3] * (1.0 - ellip)
+    y_stddev = sdev + params[4] * (1.0 - ellip)
 
-    return locs
+    add_stars(arr, (x, y), amp, x_stddev, y_stddev, blur=blur)
 
+    return list(zip(x.tolist(), y.tolist()))
 
-def _rebin(arr, new_shape):
-    shape = (new_shape[0], arr.shape[0] // new_shape[0],
-             new_shape[1], arr.shape[1] // new_shape[1])
-    return arr.reshape(shape).sum(-1).sum(1)
 
+def hsc_ccd_shape(d):
+    """
+    Get the shape of a raw HSC CCD image.
 
-def rebin(arr, factor):
+    Parameters
+    ----------
+    d : dict
+        The regions of the CCD, an entry of ``hsc_dr.get_ccd_data(raw=True)``
+
+    Returns
+    -------
+    shape : (ht, wd) tuple of int
     """
-    Rebin a 2D array.
+    chs = [d[channel] for channel in (1, 2, 3, 4)]
+    ht = max([max(ch['efmaxy'], ch['osmaxy']) for ch in chs]) + 1
+    wd = max([max(ch['efmaxx'], ch['osmaxx']) for ch in chs]) + 1
+    return (ht, wd)
+
+
+def mk_hsc_ccd(det_id, exp_num=0, rng=None, num_stars=200,
+               sky_level=1000.0, bias_level=1000.0, bias_sdev=20.0,
+               read_noise=4.0, blur=None, header=None):
+    """
+    Make a mock raw HSC CCD image.
+
+    The image has the size and the overscan and effective pixel regions
+    of the CCD in the HSC CCD table: each channel has its own bias
+    level, in the overscan and effective pixels, and the sky and stars
+    (in electrons) are divided by the gain of the channel they fall on.
 
     Parameters
     ----------
-    arr : ndarray
-        2D array with an image
+    det_id : int
+        DET-ID of the CCD (0-111)
+
+    exp_num : int, optional, defaults to 0
+        The exposure number; the frame number of the first CCD
+
+    rng : None, int or Generator, optional
+        The source of random numbers (see get_rng())
+
+    num_stars : int, optional, defaults to 200
+        Number of fake stars on the CCD
+
+    sky_level : float, optional, defaults to 1000.0
+        The sky background, in electrons; its noise is the photon noise
+
+    bias_level : float, optional, defaults to 1000.0
+        The mean bias level (ADU)
+
+    bias_sdev : float, optional, defaults to 20.0
+        The standard deviation of the bias levels of the channels (ADU)
+
+    read_noise : float, optional, defaults to 4.0
+        The read noise (ADU)
+
+    blur : float or None, optional, defaults to None
+        If not None, specifies a sigma to blur the stars
 
-    factor : int
-        1, 2, 4, 8 ...
+    header : dict or None, optional, defaults to None
+        Additional keywords for the header
 
     Returns
     -------
-    arr2 : ndarray
-        Rebinned output array
+    hdu : astropy.io.fits.PrimaryHDU
+        The raw CCD image, as unsigned 16-bit integers
+    """
+    from astropy.io import fits
+    from ..hsc import hsc_dr
+
+    rng = get_rng(rng)
+    d = hsc_dr.get_ccd_data(raw=True)[det_id]
+    aux = hsc_dr.ccd_aux_info1[det_id]
+    info = d['image']
+
+    # sky and stars over the effective pixels (electrons)
+    sky = np.zeros((info['newht'], info['newwd']), dtype=np.float32)
+    mk_star_image(sky, num_stars, edge=1.0, blur=blur, bg_mean=sky_level,
+                  bg_sdev=np.sqrt(sky_level), rng=rng)
+
+    data = rng.normal(bias_level, read_noise,
+                      size=hsc_ccd_shape(d)).astype(np.float32)
+    levels = rng.normal(0.0, bias_sdev, size=4)
+
+    hdr = fits.Header()
+    hdr['BUNIT'] = 'ADU'
+    hdr['FRAMEID'] = 'HSCA%08d' % (exp_num + 100 * aux['bee_id'] +
+                                   aux['sdo_id'])
+    hdr['EXP-ID'] = 'HSCE%08d' % (exp_num)
+    hdr['DETECTOR'] = 'ccd%d' % (det_id)
+    hdr['DET-ID'] = det_id
+    hdr['BIN-FCT1'] = 1
+    hdr['BIN-FCT2'] = 1
+    hdr['T_BEEID'] = aux['bee_id']
+    hdr['T_SDOID'] = aux['sdo_id']
+    for i, channel in enumerate((1, 2, 3, 4)):
+        ch = d[channel]
+        ef_rows = slice(ch['efminy'], ch['efmaxy'] + 1)
+        ef_cols = slice(ch['efminx'], ch['efmaxx'] + 1)
+        os_cols = slice(ch['osminx'], ch['osmaxx'] + 1)
+        data[:, ef_cols] += levels[i]
+        data[:, os_cols] += levels[i]
+
+        efwd = ch['efmaxx'] + 1 - ch['efminx']
+        out = sky[:, ch['startposx']:ch['startposx'] + efwd]
+        data[ef_rows, ef_cols] += out / np.float32(ch['gain'])
+
+        hdr['T_GAIN%d' % (channel)] = ch['gain']
+        # region keywords are 1-based, as read by SuprimeCamDR.get_regions()
+        for base, kind in (('T_OS', 'os'), ('T_EF', 'ef')):
+            hdr['%sMN%d1' % (base, channel)] = ch[kind + 'minx'] + 1
+            hdr['%sMX%d1' % (base, channel)] = ch[kind + 'maxx'] + 1
+            hdr['%sMN%d2' % (base, channel)] = ch[kind + 'miny'] + 1
+            hdr['%sMX%d2' % (base, channel)] = ch[kind + 'maxy'] + 1
+    if header is not None:
+        hdr.update(header)
+
+    np.clip(np.rint(data, out=data), 0, 65535, out=data)
+    return fits.PrimaryHDU(data=data.astype(np.uint16), header=hdr)
+
+
+def _mk_hsc_ccd(det_id, seed, exp_num, directory, kwargs):
+    # make one CCD of mk_hsc_exposure(), in a worker process or not
+    hdu = mk_hsc_ccd(det_id, exp_num=exp_num, rng=seed, **kwargs)
+    if directory is None:
+        return hdu
+    path = os.path.join(directory, hdu.header['FRAMEID'] + '.fits')
+    hdu.writeto(path, overwrite=True)
+    return path
+
+
+def mk_hsc_exposure(exp_num=0, seed=None, det_ids=None, num_workers=1,
+                    directory=None, **kwargs):
+    """
+    Make a mock raw HSC exposure, one image per CCD (see mk_hsc_ccd()).
+
+    The random numbers of each CCD are drawn from its own seed, spawned
+    from `seed` for all 112 CCDs, so a CCD is the same whether it is
+    made alone or with the others, serially or in parallel.
+
+    Parameters
+    ----------
+    exp_num : int, optional, defaults to 0
+        The exposure number, a multiple of 200
+
+    seed : None, int or SeedSequence, optional
+        The seed of the exposure; if None, fresh entropy is used
+
+    det_ids : list of int or None, optional
+        The DET-IDs of the CCDs to make; all if None
+
+    num_workers : int, optional, defaults to 1
+        Number of worker processes making the CCDs; 1 makes them serially
+
+    directory : str or None, optional
+        If not None, each CCD is written there as FRAMEID.fits, by the
+        process that made it, and the paths are returned
+
+    Other keyword parameters are passed to mk_hsc_ccd().
+
+    Returns
+    -------
+    res : list of astropy.io.fits.PrimaryHDU or of str
+        The CCD images, or the paths of the files, in the order of
+        `det_ids`
+    """
+    from ..hsc import hsc_dr
+
+    if det_ids is None:
+        det_ids = list(range(hsc_dr.num_ccds))
+    seeds = np.random.SeedSequence(seed).spawn(hsc_dr.num_ccds)
+    args = [(det_id, seeds[det_id], exp_num, directory, kwargs)
+            for det_id in det_ids]
+
+    if num_workers is None or num_workers <= 1:
+        return [_mk_hsc_ccd(*arg) for arg in args]
+    with ProcessPoolExecutor(max_workers=num_workers) as ex:
+        return list(ex.map(_mk_hsc_ccd, *zip(*args)))
+
+
+rebin_methods = ('sum', 'mean', 'median')
+rebin_edges = ('pad', 'crop')
+
+
+def rebin(arr, factor, method='sum', edge='pad', out=None):
     """
-    # iteratively rebin by 2 to achieve the factor
-    while factor > 1:
-        ht, wd = arr.shape
-        # pad with an extra pixel on wd, ht if needed to rebin by 2
-        xtra_ht, xtra_wd = ht % 2, wd % 2
+    Rebin an image, or a cube of images, by an integer factor.
+
+    The blocks of ``factor`` pixels are reduced in a single pass over
+    reshaped views of the array, without copying it.
+
+    Parameters
+    ----------
+    arr : ndarray
+        2D array with an image, or an array of images whose last two
+        axes are Y and X, e.g. a 3D cube
 
-        if xtra_ht + xtra_wd > 0:
-            arr2 = np.zeros((ht + xtra_ht, wd + xtra_wd), dtype=arr.dtype)
-            arr2[0:ht, 0:wd] = arr
-            # TODO: fill extra pixels?
-            arr = arr2
-            ht, wd = arr.shape
+    factor : int or (fy, fx) tuple of int
+        The binning factor, along both axes or along Y and X
 
-        new_ht, new_wd = ht // 2, wd // 2
-        new_shape = (new_ht, new_wd)
+    method : str, optional, defaults to 'sum'
+        How the pixels of a block are combined: 'sum', 'mean' or 'median'
 
-        arr = _rebin(arr, new_shape)
-        factor /= 2
+    edge : str, optional, defaults to 'pad'
+        What is done with the pixels left over at the ends of the rows
+        and columns when the size is not a multiple of the factor: 'pad' makes
+        partial blocks of them, as if the image were padded with zeros
+        for 'sum' (the mean and median are of the real pixels only);
+        'crop' drops them
 
-    return arr
+    out : ndarray, optional
+        An array of the rebinned shape to hold the result
+
+    Returns
+    -------
+    arr2 : ndarray
+        Rebinned output array; ``arr`` itself for a factor of 1 without
+        ``out``
+    """
+    fy, fx = (factor, factor) if np.isscalar(factor) else factor
+    for f in (fy, fx):
+        if not isinstance(f, (int, np.integer)) or f < 1:
+            raise ValueError("factor should be a positive integer: %s" % (
+                str(factor)))
+    if method not in rebin_methods:
+        raise ValueError("method should be one of %s: %s" % (
+            str(rebin_methods), method))
+    if edge not in rebin_edges:
+        raise ValueError("edge should be one of %s: %s" % (
+            str(rebin_edges), edge))
+    if arr.ndim < 2:
+        raise ValueError("need an array of at least 2 dimensions")
+
+    if fy == fx == 1 and out is None:
+        return arr
+
+    ht, wd = arr.shape[-2:]
+    ny, nx = ht // fy, wd // fx
+    ry, rx = ht % fy, wd % fx
+
+    # ranges of rows and columns of whole blocks and, with padding, of
+    # the partial blocks at the ends: (input slice, block size)
+    rows = [(slice(0, ny * fy), fy)]
+    cols = [(slice(0, nx * fx), fx)]
+    if edge == 'pad':
+        if ry > 0:
+            rows.append((slice(ny * fy, ht), ry))
+        if rx > 0:
+            cols.append((slice(nx * fx, wd), rx))
+    shape = arr.shape[:-2] + (ny + (len(rows) - 1), nx + (len(cols) - 1))
+
+    if out is None:
+        # the type of the result, as numpy's sum, mean or median makes it
+        dtype = getattr(np, method)(np.zeros(1, dtype=arr.dtype)).dtype
+        out = np.empty(shape, dtype=dtype)
+    elif out.shape != shape:
+        raise ValueError("output array shape %s doesn't match rebinned shape %s" % (
+            str(out.shape), str(shape)))
+
+    for y_sl, by in rows:
+        for x_sl, bx in cols:
+            data = arr[..., y_sl, x_sl]
+            if data.size == 0:
+                continue
+            nby, nbx = data.shape[-2] // by, data.shape[-1] // bx
+            view = data.reshape(data.shape[:-2] + (nby, by, nbx, bx))
+            dst = out[..., y_sl.start // fy:y_sl.start // fy + nby,
+                      x_sl.start // fx:x_sl.start // fx + nbx]
+            if method == 'median':
+                np.median(view, axis=(-3, -1), out=dst)
+                continue
+            # add up the rows of each block first: whole rows at a time
+            rowsum = np.add.reduce(view, axis=-3, dtype=out.dtype)
+            np.add.reduce(rowsum, axis=-1, out=dst)
+            if method == 'mean':
+                np.divide(dst, by * bx, out=dst, casting='unsafe')
+
+    return out
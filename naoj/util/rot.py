@@ -37,7 +37,7 @@ def normalize_angle(ang_deg, limit=None, ang_offset=0.0):
 
     Parameters
     ----------
-    az_deg: float
+    ang_deg: float or array of float
         A traditional azimuth value where 0 deg == North
 
     limit: str or None (optional, defaults to None)
@@ -53,30 +53,20 @@ def normalize_angle(ang_deg, limit=None, ang_offset=0.0):
     To normalize to Subaru azimuth (AZ 0 == S), do
         normalize_angle(ang_deg, limit='half', ang_offset=-180.0)
     """
-    # convert to array if just a scalar
-    is_array = isinstance(ang_deg, np.ndarray)
-    if not is_array:
-        ang_deg = np.array([ang_deg], dtype=float)
-
-    ang_deg = ang_deg + ang_offset
+    ang_deg = np.array(ang_deg, dtype=float)
+    ang_deg += ang_offset
 
     # constrain to -360, +360
-    mask = np.fabs(ang_deg) >= 360.0
-    ang_deg[mask] = np.remainder(ang_deg[mask], np.sign(ang_deg[mask]) * 360.0)
+    np.fmod(ang_deg, 360.0, out=ang_deg)
     if limit is not None:
         # constrain to 0, +360
-        mask = ang_deg < 0.0
-        ang_deg[mask] += 360.0
+        np.add(ang_deg, 360.0, out=ang_deg, where=ang_deg < 0.0)
         if limit == 'half':
             # constrain to -180, +180
-            mask = ang_deg > 180.0
-            ang_deg[mask] -= 360.0
-
-    if not is_array:
-        # extract scalar
-        ang_deg = ang_deg[0]
+            np.subtract(ang_deg, 360.0, out=ang_deg, where=ang_deg > 180.0)
 
-    return ang_deg
+    # extract scalar, if a scalar was passed
+    return ang_deg[()]
 
 
 def check_rotation_limits(rot_start_deg, rot_stop_deg, min_rot_deg, max_rot_deg):
@@ -101,10 +91,8 @@ def check_rotation_limits(rot_start_deg, rot_stop_deg, min_rot_deg, max_rot_deg)
     rot_ok : bool
         True if rotation is allowed, False otherwise
     """
-    is_array = isinstance(rot_start_deg, np.ndarray)
-    if not is_array:
-        rot_start_deg = np.array([rot_start_deg], dtype=float)
-        rot_stop_deg = np.array([rot_stop_deg], dtype=float)
+    rot_start_deg = np.asarray(rot_start_deg, dtype=float)
+    rot_stop_deg = np.asarray(rot_stop_deg, dtype=float)
 
     rot_ok = np.logical_and(np.isfinite(rot_start_deg),
                             np.isfinite(rot_stop_deg))
@@ -113,9 +101,8 @@ def check_rotation_limits(rot_start_deg, rot_stop_deg, min_rot_deg, max_rot_deg)
     rot_ok = np.logical_and(rot_ok, min_rot_deg <= rot_stop_deg)
     rot_ok = np.logical_and(rot_ok, rot_stop_deg <= max_rot_deg)
 
-    if not is_array:
-        rot_ok = rot_ok[0]
-    return rot_ok
+    # extract scalar, if scalars were passed
+    return rot_ok[()]
 
 
 def calc_optimal_rotation(left_start_deg, left_stop_deg,
@@ -125,7 +112,7 @@ def calc_optimal_rotation(left_start_deg, left_stop_deg,
 
     Parameters
     ----------
-    left_start_deg : float array of float, NaNs ok
+    left_start_deg : float or array of float, NaNs ok
         Rotation possibility 1 start value(s)
 
     left_stop_deg : float or array of float, NaNs ok
@@ -137,7 +124,7 @@ def calc_optimal_rotation(left_start_deg, left_stop_deg,
     right_stop_deg : float or array of float, NaNs ok
         Rotation possibility 2 stop value(s)
 
-    cur_rot_deg : float
+    cur_rot_deg : float or array of float
         Current rotation value
 
     min_rot_deg : float
@@ -149,47 +136,24 @@ def calc_optimal_rotation(left_start_deg, left_stop_deg,
     Returns
     -------
     rot_start, rot_stop : start and stop rotation values
-        floats if rotation is allowed, NaN otherwise
+        floats if rotation is allowed, NaN otherwise; arrays of any
+        (broadcast) shape of the inputs
     """
     left_ok = check_rotation_limits(left_start_deg, left_stop_deg,
                                     min_rot_deg, max_rot_deg)
     right_ok = check_rotation_limits(right_start_deg, right_stop_deg,
                                      min_rot_deg, max_rot_deg)
 
-    is_array = isinstance(left_start_deg, np.ndarray)
-    if not is_array:
-        left_start_deg = np.array([left_start_deg], dtype=float)
-        left_stop_deg = np.array([left_stop_deg], dtype=float)
-
-    res_start = np.full_like(left_start_deg, np.nan)
-    res_stop = np.full_like(left_stop_deg, np.nan)
-    idx = np.arange(len(res_start), dtype=int)
-
-    both_ok = np.logical_and(left_ok, right_ok)
-    if np.any(both_ok):
-        delta_l = np.fabs(cur_rot_deg - left_start_deg[both_ok])
-        delta_r = np.fabs(cur_rot_deg - right_start_deg[both_ok])
-        favor_l = delta_l < delta_r
-        res_start[both_ok] = np.where(favor_l,
-                                      left_start_deg[both_ok],
-                                      right_start_deg[both_ok])
-        res_stop[both_ok] = np.where(favor_l,
-                                     left_stop_deg[both_ok],
-                                     right_stop_deg[both_ok])
-
-    just_left_ok = np.logical_and(left_ok, np.logical_not(right_ok))
-    if np.any(just_left_ok):
-        res_start[just_left_ok] = left_start_deg[just_left_ok]
-        res_stop[just_left_ok] = left_stop_deg[just_left_ok]
-
-    just_right_ok = np.logical_and(np.logical_not(left_ok), right_ok)
-    if np.any(just_right_ok):
-        res_start[just_right_ok] = right_start_deg[just_right_ok]
-        res_stop[just_right_ok] = right_stop_deg[just_right_ok]
-
-    if not is_array:
-        # extract scalars
-        res_start, res_stop = res_start[0], res_stop[0]
+    # if both are ok, favor the one closest to the current rotation
+    delta_l = np.fabs(cur_rot_deg - np.asarray(left_start_deg))
+    delta_r = np.fabs(cur_rot_deg - np.asarray(right_start_deg))
+    favor_l = np.logical_and(left_ok, np.logical_or(np.logical_not(right_ok),
+                                                    delta_l < delta_r))
+
+    res_start = np.where(favor_l, left_start_deg,
+                         np.where(right_ok, right_start_deg, np.nan))
+    res_stop = np.where(favor_l, left_stop_deg,
+                        np.where(right_ok, right_stop_deg, np.nan))
 
     return np.array([res_start, res_stop])
 
@@ -199,12 +163,12 @@ def is_north_az(az_deg):
 
     Parameters
     ----------
-    az_deg: float
+    az_deg: float or array of float
         azimuth for target (N == 0 deg)
 
     Returns
     -------
-    tf : bool
+    tf : bool or array of bool
         True if azimuth is in the North
 
     """
@@ -241,38 +205,92 @@ def calc_possible_azimuths(dec_deg, az_start_deg, az_stop_deg, obs_lat_deg,
     az_choices : list of (float, float) tuples
         List of possible azimuth start and stops in Subaru (S==0 deg) coordinates
     """
+    az_choices = calc_azimuth_candidates(dec_deg, az_start_deg, az_stop_deg,
+                                         obs_lat_deg, az_min_deg=az_min_deg,
+                                         az_max_deg=az_max_deg)
+    return [(start, stop) for start, stop in az_choices
+            if np.isfinite(start)]
+
+
+def calc_azimuth_candidates(dec_deg, az_start_deg, az_stop_deg, obs_lat_deg,
+                            az_min_deg=-270.0, az_max_deg=+270.0):
+    """Calculate possible azimuth moves for arrays of targets and times.
+
+    Like calc_possible_azimuths(), but for inputs of any (broadcastable)
+    shape, returning a fixed number of candidates.
+
+    Parameters
+    ----------
+    dec_deg : float or array of float
+        Declination of target(s) in degrees
+
+    az_start_deg: float or array of float
+        azimuth for target(s) at start of observation (N == 0 deg)
+
+    az_stop_deg: float or array of float
+        azimuth for target(s) at stop of observation (N == 0 deg, end of
+        exposure)
+
+    obs_lat_deg: float
+        Observers latitude in degrees
+
+    az_min_deg : float (optional, defaults to -270.0)
+        Minimum azimuth position
+
+    az_max_deg : float (optional, defaults to +270.0)
+        Maximum azimuth position
+
+    Returns
+    -------
+    az_choices : array of float, shape (2, 2) + shape of the inputs
+        az_choices[i] is the (start, stop) of the i-th possible azimuth
+        move in Subaru (S==0 deg) coordinates, or NaNs if it is not
+        possible.  Possible moves come first.
+    """
     # convert to Subaru azimuths in the range -180 to +180
     az_start_deg = normalize_angle(az_start_deg, limit='half', ang_offset=-180)
     az_stop_deg = normalize_angle(az_stop_deg, limit='half', ang_offset=-180)
 
     # Determine if the object is in the south or crosses the zenith
-    traverses_south = (dec_deg < obs_lat_deg) and \
-        (az_stop_deg > -90.0 and az_start_deg < 90.0)
+    traverses_south = np.logical_and(
+        np.asarray(dec_deg) < obs_lat_deg,
+        np.logical_and(az_stop_deg > -90.0, az_start_deg < 90.0))
 
     # Compute both motion paths
-    # delta = signed_delta(az_start_deg % 360, az_stop_deg % 360)
-    delta = normalize_angle(az_stop_deg, limit='full') - \
-        normalize_angle(az_start_deg, limit='full')
+    # (same as normalize_angle(az, limit='full') for az in -180 to +180)
+    delta = np.where(az_stop_deg < 0.0, az_stop_deg + 360.0, az_stop_deg) - \
+        np.where(az_start_deg < 0.0, az_start_deg + 360.0, az_start_deg)
 
     # First candidate: direct motion
-    first_path = (az_start_deg, az_start_deg + delta)
+    # (if target crosses into the south, there is only one possible az move)
+    start1 = az_start_deg
+    stop1 = np.where(traverses_south, az_stop_deg, az_start_deg + delta)
 
     # Second candidate: alternate path (opposite direction)
-    az_start2 = calc_alternate_angle(az_start_deg)
-    second_path = (az_start2, az_start2 + delta)
+    start2 = np.where(traverses_south, np.nan,
+                      calc_alternate_angle(az_start_deg))
+    stop2 = start2 + delta
 
-    # If target crosses into the south, there is only one possible az move
-    if traverses_south:
-        candidates = [(az_start_deg, az_stop_deg)]
-
-    else:
-        candidates = [first_path, second_path]
+    start1, stop1, start2, stop2 = np.broadcast_arrays(start1, stop1,
+                                                       start2, stop2)
+    az_choices = np.array([[start1, stop1], [start2, stop2]])
 
     # Filter paths within az move limits
-    result = [(start, stop) for start, stop in candidates
-              if (az_min_deg <= start <= az_max_deg and
-                  az_min_deg <= stop <= az_max_deg)]
-    return result
+    with np.errstate(invalid='ignore'):
+        ok = np.logical_and(
+            np.logical_and(az_min_deg <= az_choices[:, 0],
+                           az_choices[:, 0] <= az_max_deg),
+            np.logical_and(az_min_deg <= az_choices[:, 1],
+                           az_choices[:, 1] <= az_max_deg))
+    np.copyto(az_choices, np.nan,
+              where=np.logical_not(ok[:, np.newaxis]))
+
+    # move the second candidate up, where it is the only possible one
+    only_second = np.logical_and(np.logical_not(ok[0]), ok[1])
+    np.copyto(az_choices[0], az_choices[1], where=only_second)
+    np.copyto(az_choices[1], np.nan, where=only_second)
+
+    return az_choices
 
 
 def calc_rotator_angle(pang_deg, pa_deg, flip=False, ins_delta=0.0):
@@ -359,11 +377,9 @@ def compute_rotator_angles(pang_start_deg, pang_stop_deg, pa_deg,
     # Detect zenith crossing
     crossed_zenith = is_north_az(az_start_deg) != is_north_az(az_stop_deg)
 
-    if crossed_zenith:
-        # Apply 180° flip
-        rot_end = unwrap_angle(rot_start, rot_end + 180.0)
-    else:
-        rot_end = unwrap_angle(rot_start, rot_end)
+    # Apply 180° flip if crossed
+    rot_end = unwrap_angle(rot_start,
+                           np.where(crossed_zenith, rot_end + 180.0, rot_end))
 
     rot_end = normalize_angle(rot_end, limit='full')
 
@@ -415,5 +431,122 @@ def calc_possible_rotations(pang_start_deg, pang_stop_deg, pa_deg, ins_name,
     right_stop_deg = right_start_deg + rot_diff
     right_offset_deg = calc_alternate_angle(left_offset_deg)
 
-    return np.array([(left_start_deg, left_stop_deg, left_offset_deg),
-                     (right_start_deg, right_stop_deg, right_offset_deg)])
+    res = np.broadcast_arrays(left_start_deg, left_stop_deg, left_offset_deg,
+                              right_start_deg, right_stop_deg,
+                              right_offset_deg)
+    return np.array([res[:3], res[3:]])
+
+
+def plan_rotations(pang_start_deg, pang_stop_deg, pa_deg, ins_name,
+                   az_start_deg, az_stop_deg, dec_deg, obs_lat_deg,
+                   cur_rot_deg=0.0, cur_az_deg=None,
+                   min_rot_deg=None, max_rot_deg=None,
+                   az_min_deg=-270.0, az_max_deg=+270.0):
+    """Plan the telescope azimuth and instrument rotator moves for many
+    targets and times at once.
+
+    The inputs can be of any broadcastable shape, e.g. (N, M) arrays for
+    N targets at M times, or (N, 1) target declinations with (N, M)
+    azimuths and parallactic angles.  There are no loops over the
+    elements.
+
+    Parameters
+    ----------
+    pang_start_deg, pang_stop_deg : float or array of float
+        Parallactic angle for target(s) at start and stop of observation
+
+    pa_deg : float or array of float
+        The desired position angle(s) in degrees
+
+    ins_name : str
+        Instrument name
+
+    az_start_deg, az_stop_deg : float or array of float
+        azimuth for target(s) at start and stop of observation (N == 0 deg)
+
+    dec_deg : float or array of float
+        Declination of target(s) in degrees
+
+    obs_lat_deg : float
+        Observers latitude in degrees
+
+    cur_rot_deg : float or array of float (optional, defaults to 0.0)
+        Current rotation value
+
+    cur_az_deg : float, array of float or None (optional)
+        Current azimuth position in Subaru (S==0 deg) coordinates; if
+        given, the possible azimuth move starting closest to it is chosen,
+        otherwise the first one
+
+    min_rot_deg, max_rot_deg : float or None (optional)
+        Rotation limits; if None, the limits for the instrument in
+        `rot_limits`
+
+    az_min_deg, az_max_deg : float (optional, defaults to -270.0, +270.0)
+        Azimuth limits
+
+    Returns
+    -------
+    az_choices : array of float, shape (2, 2) + shape
+        possible azimuth (start, stop) moves, as for
+        calc_azimuth_candidates()
+
+    rot_choices : array of float, shape (2, 2) + shape
+        rot_choices[i] is the (start, stop) of the i-th possible rotation
+        (0: left, 1: right), or NaNs if it is outside the rotation limits
+
+    az_idx : array of int8, shape
+        index into az_choices of the chosen azimuth move, -1 if none
+
+    rot_idx : array of int8, shape
+        index into rot_choices of the chosen rotation, chosen as by
+        calc_optimal_rotation(), -1 if none
+    """
+    if min_rot_deg is None or max_rot_deg is None:
+        if ins_name not in rot_limits:
+            raise ValueError("no rotation limits known for '%s'" % (ins_name))
+        min_rot_deg, max_rot_deg = rot_limits[ins_name]
+
+    az_choices = calc_azimuth_candidates(dec_deg, az_start_deg, az_stop_deg,
+                                         obs_lat_deg, az_min_deg=az_min_deg,
+                                         az_max_deg=az_max_deg)
+    possible_rots = calc_possible_rotations(pang_start_deg, pang_stop_deg,
+                                            pa_deg, ins_name,
+                                            az_start_deg, az_stop_deg)
+
+    # broadcast everything to a common shape
+    shape = np.broadcast_shapes(az_choices.shape[2:],
+                                possible_rots.shape[2:])
+    if az_choices.shape[2:] != shape:
+        az_choices = np.broadcast_to(az_choices, (2, 2) + shape).copy()
+    rot_choices = possible_rots[:, :2]
+    if rot_choices.shape[2:] != shape:
+        rot_choices = np.broadcast_to(rot_choices, (2, 2) + shape).copy()
+
+    rot_ok = check_rotation_limits(rot_choices[:, 0], rot_choices[:, 1],
+                                   min_rot_deg, max_rot_deg)
+    np.copyto(rot_choices, np.nan,
+              where=np.logical_not(rot_ok[:, np.newaxis]))
+
+    # choose the rotation (see calc_optimal_rotation)
+    delta_l = np.fabs(cur_rot_deg - rot_choices[0, 0])
+    delta_r = np.fabs(cur_rot_deg - rot_choices[1, 0])
+    favor_l = np.logical_and(rot_ok[0],
+                             np.logical_or(np.logical_not(rot_ok[1]),
+                                           delta_l < delta_r))
+    rot_idx = np.where(favor_l, 0, np.where(rot_ok[1], 1, -1)).astype(np.int8)
+
+    # choose the azimuth move
+    az_ok = np.isfinite(az_choices[:, 0])
+    if cur_az_deg is None:
+        favor_first = az_ok[0]
+    else:
+        with np.errstate(invalid='ignore'):
+            favor_first = np.logical_and(
+                az_ok[0], np.logical_or(
+                    np.logical_not(az_ok[1]),
+                    np.fabs(cur_az_deg - az_choices[0, 0]) <=
+                    np.fabs(cur_az_deg - az_choices[1, 0])))
+    az_idx = np.where(favor_first, 0, np.where(az_ok[1], 1, -1)).astype(np.int8)
+
+    return az_choices, rot_choices, az_idx, rot_idx
@@ -0,0 +1,89 @@
+"""Unit Tests for the naoj.hsc.ccd_info functions"""
+
+import numpy as np
+import pytest
+from matplotlib.path import Path
+
+from naoj.hsc import ccd_info
+
+
+class TestCCDInfo(object):
+
+    def setup_class(self):
+        rng = np.random.default_rng(0)
+        self.dra = rng.uniform(-0.85, 0.85, size=20000)
+        self.ddec = rng.uniform(-0.75, 0.75, size=20000)
+
+    def test_info(self):
+        info = ccd_info.info
+        assert len(info) == 104
+        assert info[0]['bad_channels'] == [3]
+        assert 'bad_channels' not in info[1]
+        assert isinstance(info[1]['polygon'][0], tuple)
+        assert info[0]['channel_dir'] == (0.0, -1.0)
+
+    def test_find_ccd(self):
+        pts = np.column_stack((self.dra, self.ddec))
+        expected = np.full(len(pts), -1)
+        for det_id, d in ccd_info.info.items():
+            expected[Path(d['polygon']).contains_points(pts)] = det_id
+
+        res = ccd_info.find_ccd(self.dra, self.ddec, exclude_bad=False)
+        assert np.array_equal(res, expected)
+
+        res = ccd_info.find_ccd(self.dra.reshape(100, 200),
+                                self.ddec.reshape(100, 200),
+                                exclude_bad=False)
+        assert res.shape == (100, 200)
+        assert ccd_info.find_ccd(5.0, 5.0) == -1
+
+    def test_bad_channels(self):
+        det_ids, channels = ccd_info.find_ccd(self.dra, self.ddec,
+                                              exclude_bad=False,
+                                              return_channel=True)
+        assert np.all((det_ids >= 0) == (channels > 0))
+        # CCD 21 has no good channels
+        good = ccd_info.find_ccd(self.dra, self.ddec)
+        assert np.any(det_ids == 21) and not np.any(good == 21)
+        # CCD 0 has channel 3 bad
+        on_0 = det_ids == 0
+        assert np.array_equal(good[on_0] == 0, channels[on_0] != 3)
+
+    def test_bad_channel_regions(self):
+        # the bad channels, as parts of the CCD along dDec: the channels
+        # of CCDs read by BEE 1 (0, 9, 43) go from 1 to 4 towards -dDec,
+        # those of CCDs read by BEE 0 (33) towards +dDec
+        regions = {0: (0.25, 0.5), 9: (0.5, 1.0), 33: (0.5, 1.0),
+                   43: (0.0, 0.5)}
+        det_ids = ccd_info.find_ccd(self.dra, self.ddec, exclude_bad=False)
+        good = ccd_info.find_ccd(self.dra, self.ddec)
+        for det_id, (lo, hi) in regions.items():
+            # position across the (slightly tilted) CCD, towards +dDec
+            polygon = np.array(ccd_info.info[det_id]['polygon'])
+            center = polygon.mean(axis=0)
+            axis = np.linalg.svd(polygon - center)[2][1]
+            axis *= np.sign(axis[1])
+            pos = (polygon - center).dot(axis)
+            frac = ((np.column_stack((self.dra, self.ddec)) - center).dot(
+                axis) - pos.min()) / (pos.max() - pos.min())
+            on_ccd = det_ids == det_id
+            # away from the channel boundaries
+            clear = on_ccd & (np.abs(frac - lo) > 0.02) & \
+                (np.abs(frac - hi) > 0.02)
+            is_bad = (frac > lo) & (frac < hi)
+            assert np.any(clear & is_bad) and np.any(clear & ~is_bad)
+            assert np.array_equal(good[clear] == -1, is_bad[clear])
+
+    def test_channel_dirs(self):
+        # the readout directions follow the orientation of the CCD
+        # images in hsc_dr
+        pytest.importorskip('g2base')
+        from naoj.hsc import hsc_dr
+        ccd_data = hsc_dr.get_ccd_data()
+        for det_id, d in ccd_info.info.items():
+            bunch = ccd_data[det_id]
+            assert d['channel_dir'] == ccd_info.channel_direction(
+                bunch.fliph, bunch.flipv, bunch.swapxy)
+            # channels 1 to 4 are in the order of the raw X axis
+            startposx = [bunch[ch].startposx for ch in (1, 2, 3, 4)]
+            assert startposx == sorted(startposx)
@@ -0,0 +1,40 @@
+"""Unit Tests for the naoj.util.combine functions"""
+
+import numpy as np
+
+from naoj.util import combine
+
+
+class TestCombine(object):
+
+    def setup_class(self):
+        rng = np.random.default_rng(0)
+        self.frames = [rng.normal(100.0, 5.0, size=(50, 40))
+                       for i in range(9)]
+
+    def test_median(self):
+        expected = np.median(np.array(self.frames), axis=0)
+        res = combine.combine_stack(self.frames, chunk_rows=7)
+        assert np.array_equal(res, expected)
+
+        res = combine.combine_stack(np.array(self.frames), chunk_rows=64,
+                                    dtype=np.float32)
+        assert res.dtype == np.float32
+        assert np.allclose(res, expected, atol=1e-4)
+
+    def test_sigclip(self):
+        frames = np.array(self.frames)
+        frames[3, 10, 10] = 1.0e5
+        res = combine.combine_stack(frames, method='sigclip', nsigma=2.5,
+                                    chunk_rows=16)
+        expected = np.mean(np.delete(frames[:, 10, 10], 3))
+        assert np.isclose(res[10, 10], expected)
+
+    def test_remedian(self):
+        rmed = combine.Remedian(base=3)
+        for frame in self.frames:
+            rmed.add(frame)
+        expected = np.median(np.array(self.frames), axis=0)
+        res = rmed.get_result()
+        assert res.shape == expected.shape
+        assert np.median(np.fabs(res - expected)) < 2.0
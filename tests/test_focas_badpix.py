@@ -0,0 +1,106 @@
+"""Unit Tests for the naoj.focas.badpix functions"""
+
+import numpy as np
+import pytest
+
+from naoj.focas import badpix
+from naoj.focas import bias_overscan as bo
+
+
+def interp_x_loop(data, mask):
+    # reference implementation: interpolation along X, pixel by pixel
+    res = data.copy()
+    ny, nx = data.shape
+    for y in range(ny):
+        for x in range(nx):
+            if not mask[y, x]:
+                continue
+            xl = x - 1
+            while xl >= 0 and mask[y, xl]:
+                xl -= 1
+            xr = x + 1
+            while xr < nx and mask[y, xr]:
+                xr += 1
+            if xl >= 0 and xr < nx:
+                w = (x - xl) / float(xr - xl)
+                res[y, x] = data[y, xl] * (1.0 - w) + data[y, xr] * w
+            elif xl >= 0:
+                res[y, x] = data[y, xl]
+            elif xr < nx:
+                res[y, x] = data[y, xr]
+    return res
+
+
+def average_neighbours_loop(data, mask):
+    # reference implementation: average of the good 4 neighbours
+    res = data.copy()
+    ny, nx = data.shape
+    for y, x in zip(*np.nonzero(mask)):
+        vals = [data[y+dy, x+dx]
+                for dy, dx in ((-1, 0), (1, 0), (0, -1), (0, 1))
+                if 0 <= y+dy < ny and 0 <= x+dx < nx and
+                not mask[y+dy, x+dx]]
+        if len(vals) > 0:
+            res[y, x] = np.sum(vals) / len(vals)
+    return res
+
+
+class TestBadpix(object):
+
+    def setup_class(self):
+        rng = np.random.default_rng(0)
+        self.data = rng.normal(1000.0, 30.0, size=(60, 80)).astype(np.float32)
+        self.mask = rng.random(self.data.shape) < 0.2
+        # a bad column, a bad row and a fully bad row
+        self.mask[5:40, 17] = True
+        self.mask[30, 10:50] = True
+        self.mask[45, :] = True
+
+    def test_column(self):
+        res = badpix.repair_pixels(self.data.copy(), self.mask, 'column')
+        assert np.allclose(res, interp_x_loop(self.data, self.mask),
+                           rtol=1e-6)
+        # a fully bad row is left as it is
+        assert np.array_equal(res[45], self.data[45])
+
+    def test_row(self):
+        res = badpix.repair_pixels(self.data.copy(), self.mask, 'row')
+        expected = interp_x_loop(self.data.T, self.mask.T).T
+        assert np.allclose(res, expected, rtol=1e-6)
+
+    def test_pixel(self):
+        res = badpix.repair_pixels(self.data.copy(), self.mask, 'pixel')
+        assert np.allclose(res, average_neighbours_loop(self.data, self.mask),
+                           rtol=1e-6)
+        with pytest.raises(ValueError):
+            badpix.repair_pixels(self.data.copy(), self.mask, 'median')
+
+    def test_save_load(self, tmp_path):
+        filepath = str(tmp_path / 'badpix.npz')
+        masks = {(1, 2, 2): {'column': self.mask, 'pixel': ~self.mask}}
+        badpix.save_masks(filepath, masks)
+        res = badpix.load_masks(filepath)
+        assert list(res.keys()) == [(1, 2, 2)]
+        assert np.array_equal(res[(1, 2, 2)]['column'], self.mask)
+        assert np.array_equal(res[(1, 2, 2)]['pixel'], ~self.mask)
+
+    def test_repair_chip(self):
+        # same as the original bad column repair of DET-ID 1
+        rng = np.random.default_rng(1)
+        for binfac1, binfac2, bp in ((1, 1, [397, 397, 2387, 4225]),
+                                     (2, 2, [397, 397, 1189, 2105])):
+            hdr = {'BIN-FCT1': binfac1, 'BIN-FCT2': binfac2, 'DET-ID': 1}
+            data = rng.normal(1000.0, 30.0,
+                              size=bo.chip_shape(hdr)).astype(np.float32)
+            expected = data.copy()
+            expected[bp[2]-1:bp[3], bp[0]-1:bp[1]] = \
+                (expected[bp[2]-1:bp[3], bp[0]-2:bp[1]-1] +
+                 expected[bp[2]-1:bp[3], bp[0]:bp[1]+1]) / 2.0
+            badpix.repair_chip(data, 1, binfac1, binfac2)
+            assert np.array_equal(data, expected)
+
+            # no known bad pixels on DET-ID 2
+            hdr['DET-ID'] = 2
+            data = np.ones(bo.chip_shape(hdr), dtype=np.float32)
+            assert badpix.get_masks(2, binfac1, binfac2) == {}
+            assert np.all(badpix.repair_chip(data, 2, binfac1, binfac2) == 1)
@@ -0,0 +1,176 @@
+"""Unit Tests for the naoj.focas.bias_overscan functions"""
+
+import os
+
+import numpy as np
+import pytest
+from astropy.io import fits
+
+from naoj.focas import bias_overscan as bo
+from naoj.focas import focasifu as fi
+
+
+def mk_frame(detid, binfac=1, seed=0):
+    rng = np.random.default_rng(seed)
+    ht, wd = 4240 // binfac, bo.overscan[binfac][:, 5].max()
+    data = rng.normal(1000.0, 5.0, size=(ht, wd)).astype(np.float32)
+    # add a slowly varying bias pattern along the rows
+    data += np.linspace(0.0, 20.0, ht, dtype=np.float32)[:, np.newaxis]
+    hdu = fits.PrimaryHDU(data=data)
+    hdr = hdu.header
+    hdr['BIN-FCT1'] = binfac
+    hdr['BIN-FCT2'] = binfac
+    hdr['DET-ID'] = detid
+    hdr['BLANK'] = -32768
+    hdr['BSCALE'] = 1.0
+    hdr['BZERO'] = 32768
+    return fits.HDUList([hdu])
+
+
+def bias_subtraction_loop(scidata, bias_template_data, ovs, k):
+    # reference implementation: the original per-row/per-amp loop
+    bsdata = np.zeros(scidata.shape, dtype=np.float32)
+    for i in range(2, scidata.shape[0]-3):
+        for j in range(k, k+4):
+            template_level = np.mean(bias_template_data[ovs[j,0]-1:ovs[j,1]])
+            template_level = template_level + \
+                np.mean(bias_template_data[ovs[j,4]-1:ovs[j,5]])
+            ovlevel = np.mean(scidata[i-2:i+3, ovs[j,0]-1:ovs[j,1]])
+            ovlevel = ovlevel + \
+                np.mean(scidata[i-2:i+3, ovs[j,4]-1:ovs[j,5]])
+            bsdata[i, ovs[j,0]-1:ovs[j,5]] = \
+                scidata[i, ovs[j,0]-1:ovs[j,5]] - \
+                bias_template_data[ovs[j,0]-1:ovs[j,5]] / \
+                template_level * ovlevel
+    return bsdata
+
+
+class TestBiasSubtraction(object):
+
+    def check(self, detid, binfac):
+        hdl = mk_frame(detid, binfac=binfac)
+        scidata = hdl[0].data.copy()
+        template = np.mean(scidata[scidata.shape[0]-13:, :], axis=0)
+        k = 4 if detid == 1 else 0
+        expected = bias_subtraction_loop(scidata, template,
+                                         bo.overscan[binfac], k)
+
+        # no template file exists with this prefix, so the top
+        # overscan region is used as the template
+        outhdl, stat = bo.bias_subtraction(hdl, 'no_such_template')
+        assert stat
+        assert outhdl[0].data.dtype == np.float32
+        assert np.allclose(outhdl[0].data, expected, rtol=0, atol=1e-3)
+
+    def test_bias_subtraction_right(self):
+        self.check(1, 1)
+
+    def test_bias_subtraction_left_binned(self):
+        self.check(2, 4)
+
+
+class TestTemplateCache(object):
+
+    def mk_template(self, pfx, binfac, detid, level):
+        data = np.full(bo.overscan[binfac][:, 5].max(), level,
+                       dtype=np.float32)
+        hdl = fi.put_version(fits.HDUList([fits.PrimaryHDU(data=data)]))
+        hdl.writeto(pfx + str(binfac) + str(detid) + '.fits', overwrite=True)
+
+    def test_template_cache(self, tmp_path, monkeypatch):
+        pfx = str(tmp_path / 'bias_template')
+        self.mk_template(pfx, 1, 1, 1000.0)
+        bo.clear_template_cache()
+
+        loads = []
+        load_bias_template = bo.load_bias_template
+        def counting_load(*args):
+            loads.append(args)
+            return load_bias_template(*args)
+        monkeypatch.setattr(bo, 'load_bias_template', counting_load)
+
+        data, levels = bo.get_bias_template(pfx, 1, 1)
+        assert np.all(data == 1000.0) and np.allclose(levels, 2000.0)
+        for i in range(3):
+            bo.bias_subtraction(mk_frame(1), pfx)
+        assert len(loads) == 1
+
+        # a changed template file is read again
+        self.mk_template(pfx, 1, 1, 500.0)
+        os.utime(pfx + '11.fits', ns=(0, 10**9))
+        data, levels = bo.get_bias_template(pfx, 1, 1)
+        assert np.all(data == 500.0) and len(loads) == 2
+
+        # the cache is bounded
+        monkeypatch.setattr(bo, 'template_cache_size', 1)
+        self.mk_template(pfx, 1, 2, 1000.0)
+        bo.get_bias_template(pfx, 1, 2)
+        bo.get_bias_template(pfx, 1, 1)
+        assert len(bo._template_cache) == 1 and len(loads) == 4
+
+        # no template file
+        assert bo.get_bias_template(pfx, 4, 1) == (None, None)
+
+
+class TestStackChips(object):
+
+    def check(self, binfac, restore):
+        # reference: the separate steps
+        hdls = []
+        for detid in (1, 2):
+            hdl, stat = bo.bias_subtraction(mk_frame(detid, binfac, detid),
+                                            'no_such_template')
+            hdl, stat = bo.remove_overscan(hdl)
+            if restore:
+                hdl, stat = bo.restore_badpix(hdl)
+            hdls.append(hdl)
+        expected = bo.stack_data(hdls[0], hdls[1])
+
+        outhdl, stat = bo.stack_chips(mk_frame(1, binfac, 1),
+                                      mk_frame(2, binfac, 2),
+                                      template_pfx='no_such_template',
+                                      restore=restore)
+        assert stat
+        assert outhdl[0].data.dtype == np.float32
+        assert np.array_equal(outhdl[0].data, expected[0].data)
+        assert list(outhdl[0].header.items()) == \
+            list(expected[0].header.items())
+
+    def test_stack_chips(self):
+        self.check(1, True)
+
+    def test_stack_chips_binned(self):
+        self.check(2, True)
+        self.check(4, False)
+
+    def test_shape(self):
+        hdl = mk_frame(1, 2)
+        ny, nx = bo.chip_shape(hdl[0].header)
+        with pytest.raises(ValueError):
+            bo.reduce_chip(hdl, np.empty((ny, nx+1), dtype=np.float32))
+
+
+class TestStackChipFiles(object):
+
+    def test_concurrent(self, tmp_path):
+        fnames = []
+        for detid in (1, 2):
+            hdl = mk_frame(detid, 2, detid)
+            hdl[0].data = hdl[0].data.astype(np.uint16)
+            fnames.append(str(tmp_path / ('chip%d.fits' % detid)))
+            hdl.writeto(fnames[-1])
+
+        with fits.open(fnames[0]) as hdl_right, \
+             fits.open(fnames[1]) as hdl_left:
+            expected, stat = bo.stack_chips(hdl_right, hdl_left,
+                                            template_pfx='no_such_template')
+        for concurrent in (None, 'thread', 'process'):
+            outhdl, stat = bo.stack_chip_files(
+                fnames[0], fnames[1], template_pfx='no_such_template',
+                concurrent=concurrent)
+            assert stat
+            assert np.array_equal(outhdl[0].data, expected[0].data)
+            assert list(outhdl[0].header.items()) == \
+                list(expected[0].header.items())
+        with pytest.raises(ValueError):
+            bo.stack_chip_files(fnames[0], fnames[1], concurrent='gpu')
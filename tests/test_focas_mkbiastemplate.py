@@ -0,0 +1,73 @@
+"""Unit Tests for the naoj.focas.mkbiastemplate functions"""
+
+import os
+
+import numpy as np
+from scipy.stats import sigmaclip
+from astropy.io import fits
+
+from naoj.focas import mkbiastemplate as mb
+from naoj.util import header_index
+
+
+class TestSigmaclipMean(object):
+
+    def setup_class(self):
+        rng = np.random.default_rng(0)
+        self.data = rng.normal(1000.0, 5.0, size=(500, 300))
+        # add some outliers (cosmic rays, hot pixels)
+        idx = rng.integers(0, self.data.size, size=2000)
+        self.data.flat[idx] += rng.uniform(50.0, 5000.0, size=len(idx))
+
+    def test_sigmaclip_mean(self):
+        for nsigma in (2.0, 4.0):
+            expected = [np.mean(sigmaclip(self.data[:, i], low=nsigma,
+                                          high=nsigma)[0])
+                        for i in range(self.data.shape[1])]
+            for blocksize in (7, 512):
+                res = mb.sigmaclip_mean(self.data, low=nsigma, high=nsigma,
+                                        blocksize=blocksize)
+                assert np.allclose(res, expected, rtol=0, atol=1e-9)
+
+    def test_constant(self):
+        data = np.full((10, 4), 3.0)
+        assert np.array_equal(mb.sigmaclip_mean(data), [3.0]*4)
+
+    def test_frames(self, tmp_path):
+        rng = np.random.default_rng(1)
+        names = []
+        for k in range(3):
+            hdu = fits.PrimaryHDU(data=rng.normal(1000.0, 5.0, size=(40, 30)))
+            hdu.header['BIN-FCT1'] = 1
+            hdu.header['BIN-FCT2'] = 1
+            hdu.header['DET-ID'] = 1
+            names.append('bias%d.fits' % k)
+            hdu.writeto(str(tmp_path / names[-1]))
+        mb.MkBiasTemplate(names, rawdatadir=str(tmp_path),
+                          outputdir=str(tmp_path))
+        with fits.open(str(tmp_path / 'bias_template11.fits')) as hdl:
+            assert hdl[0].header['NCOMBINE'] == 3
+            data = np.concatenate([fits.getdata(str(tmp_path / n))
+                                   for n in names])
+            assert np.allclose(hdl[0].data, mb.sigmaclip_mean(data))
+
+    def test_two_chips_index(self, tmp_path, monkeypatch):
+        rng = np.random.default_rng(2)
+        for num in (101, 102):
+            hdu = fits.PrimaryHDU(data=rng.normal(1000.0, 5.0, size=(40, 30)))
+            hdu.header['FRAMEID'] = 'FCSA%08d' % num
+            hdu.header['BIN-FCT1'] = 1
+            hdu.header['BIN-FCT2'] = 1
+            hdu.header['DET-ID'] = num - 100
+            hdu.writeto(str(tmp_path / ('FCSA%08d.fits' % num)))
+        index = header_index.get_index(str(tmp_path))
+
+        # the FRAMEID is looked up in the index, not in the file
+        def getval(*args):
+            raise AssertionError('file opened for %s' % str(args))
+        monkeypatch.setattr(mb.fits, 'getval', getval)
+        mb.MkTwoBiasTemplate('FCSA00000101.fits',
+                             rawdatadir=str(tmp_path) + os.sep,
+                             outputdir=str(tmp_path), index=index)
+        for detid in (1, 2):
+            assert (tmp_path / ('bias_template1%d.fits' % detid)).exists()
@@ -0,0 +1,215 @@
+"""Unit Tests for the naoj.focas.reconstruct_image functions"""
+
+import os
+
+import numpy as np
+from scipy import ndimage
+from astropy.io import fits
+
+from naoj.focas import reconstruct_image as ri
+from naoj.focas import bias_overscan as bo
+from naoj.focas import focasifu as fi
+from naoj.util import header_index
+
+
+def reconstruct_loop(flatted_data, itnum, smooth_flg):
+    # reference implementation: the original per-row loop
+    recon_im = np.zeros((flatted_data.shape[0]*itnum+1, flatted_data.shape[1]),
+                        dtype=np.float32)
+    ymax = flatted_data.shape[0]-1
+    for i in range(itnum):
+        recon_im[i,:] = flatted_data[ymax,:]
+    for j in range(1, flatted_data.shape[0]-1):
+        for i in range(itnum):
+            if smooth_flg:
+                recon_im[j*itnum + i,:] = \
+                    ((itnum-i)*flatted_data[ymax-j,:] + i*flatted_data[ymax-j-1,:]) \
+                    / itnum
+            else:
+                recon_im[j*itnum + i,:] = flatted_data[ymax - j,:]
+    recon_im[ymax*itnum,:] = np.nan
+    for i in range(itnum):
+        recon_im[ymax*itnum+i+1,:] = flatted_data[0,:]
+    return recon_im
+
+
+class TestReconstructData(object):
+
+    def setup_class(self):
+        rng = np.random.default_rng(0)
+        self.stack = rng.normal(1000.0, 50.0, size=(3, 24, 157))
+
+    def test_reconstruct_data(self):
+        for dtype in (np.float32, np.float64):
+            data = self.stack[0].astype(dtype)
+            for itnum in (1, 2, 4):
+                for smooth in (False, True):
+                    expected = reconstruct_loop(data, itnum, smooth)
+                    res = ri.reconstruct_data(data, itnum, smooth=smooth)
+                    assert res.dtype == np.float32
+                    assert np.array_equal(res, expected, equal_nan=True)
+
+    def test_stack(self):
+        data = self.stack.astype(np.float32)
+        res = ri.reconstruct_data(data, 4, smooth=True)
+        assert res.shape == (3, 24*4+1, 157)
+        for k in range(data.shape[0]):
+            assert np.array_equal(res[k], reconstruct_loop(data[k], 4, True),
+                                  equal_nan=True)
+
+
+class TestShiftRows(object):
+
+    def setup_class(self):
+        rng = np.random.default_rng(1)
+        x = np.arange(157)
+        prof = 1000.0 / (1.0 + np.exp(-(x-10.0)/1.5)) / \
+            (1.0 + np.exp((x-147.0)/1.5))
+        self.data = (prof * (1.0 + 0.05*np.sin(x/7.0 +
+                                                rng.uniform(0, 6, (24, 1))))
+                     ).astype(np.float32)
+
+    def test_spline(self):
+        for dx in (0.3, -1.7, 2.25, -6.9):
+            expected = ndimage.shift(self.data, (0.0, -dx), order=5,
+                                     mode='nearest')
+            res = ri.shift_rows(self.data, dx, method='spline')
+            assert res.dtype == np.float32
+            assert np.allclose(res, expected, rtol=1e-6, atol=1e-3)
+
+    def test_methods(self):
+        # integer shifts are exact for all methods in the interior
+        expected = self.data[:, 2:-18]
+        for method in ri.shift_methods:
+            res = ri.shift_rows(self.data, 2.0, method=method)
+            assert np.allclose(res[:, :-20], expected, rtol=0, atol=0.05)
+        # sub-pixel shifts agree with the spline within the noise
+        spline = ri.shift_rows(self.data, 0.4, method='spline')
+        for method in ('lanczos', 'fourier'):
+            res = ri.shift_rows(self.data, 0.4, method=method)
+            assert np.allclose(res[:, 5:-5], spline[:, 5:-5], rtol=2e-2)
+
+
+class TestIntegrate(object):
+
+    def setup_class(self):
+        rng = np.random.default_rng(2)
+        self.data = rng.normal(100.0, 10.0, size=(4220, 4144)).astype(
+            np.float32)
+
+    def mk_hdl(self):
+        hdu = fits.PrimaryHDU(data=self.data)
+        hdu.header['BIN-FCT1'] = 1
+        hdu.header['BIN-FCT2'] = 1
+        return fits.HDUList([hdu])
+
+    def test_integrate(self):
+        # reference implementation: the original per-region loop
+        reg = ri.regions[1]
+        xw, yw = int(reg[1, 2]), int(reg[1, 3])
+        expected = np.zeros((reg.shape[0], xw), np.float32)
+        for j in range(reg.shape[0]):
+            xs = int(reg[j, 0] - reg[j, 2] / 2.0)
+            ys = int(reg[j, 1] - reg[j, 3] / 2.0)
+            expected[j, :] = np.sum(self.data[ys:ys+yw, xs:xs+xw], axis=0)
+
+        res = ri.integrate(self.mk_hdl())
+        assert np.array_equal(res[0].data, expected)
+        out = np.zeros((24, xw), np.float32)
+        res = ri.integrate(self.mk_hdl(), reg=reg, out=out)
+        assert res[0].data is out
+        assert np.array_equal(out, expected)
+
+    def test_integrate_file(self, tmp_path):
+        fitsfile = str(tmp_path / 'stacked.fits')
+        self.mk_hdl().writeto(fitsfile)
+        res = ri.integrate_file(fitsfile)
+        assert np.array_equal(res[0].data, ri.integrate(self.mk_hdl())[0].data)
+        assert res[0].header['BIN-FCT1'] == 1
+
+
+class TestPairFiles(object):
+
+    def mk_files(self, directory, frames):
+        # raw frames of (prefix, frame number, DET-ID)
+        paths = []
+        for pfx, num, det_id in frames:
+            path = os.path.join(directory, '%s%08d.fits' % (pfx, num))
+            hdu = fits.PrimaryHDU(data=np.zeros((2, 2), dtype=np.uint16))
+            hdu.header['DET-ID'] = det_id
+            hdu.writeto(path)
+            paths.append(path)
+        return paths
+
+    def test_pair_files(self, tmp_path):
+        paths = self.mk_files(str(tmp_path), [
+            ('FCSA', 12346, 2), ('FCSA', 12345, 1), ('FCSA', 12348, 1),
+            ('FCSB', 12349, 2), ('FCSA', 12350, 1), ('FCSA', 12351, 2)])
+        pairs, unpaired = ri.pair_files(paths)
+        assert pairs == [(paths[1], paths[0]), (paths[4], paths[5])]
+        # frames with another prefix don't pair up
+        assert unpaired == [paths[2], paths[3]]
+
+    def test_missing_frame(self, tmp_path):
+        # the ch1 frame 102 is missing: 103 is ch2 and 104 the next ch1
+        paths = self.mk_files(str(tmp_path), [
+            ('FCSA', 100, 1), ('FCSA', 101, 2), ('FCSA', 103, 2),
+            ('FCSA', 104, 1), ('FCSA', 105, 2)])
+        index = header_index.HeaderIndex(str(tmp_path))
+        index.update(save=False)
+        for idx in (None, index):
+            pairs, unpaired = ri.pair_files(paths, index=idx)
+            assert pairs == [(paths[0], paths[1]), (paths[3], paths[4])]
+            assert unpaired == [paths[2]]
+
+    def test_rerun(self, tmp_path):
+        # the outputs of an earlier run in the same directory are ignored
+        fitsfiles = self.mk_files(str(tmp_path), [('FCSA', 12345, 1),
+                                                  ('FCSA', 12346, 2)])
+        outputs = [ri.output_name(fitsfiles[0]), 'bias_template1.fits']
+        assert outputs[0] == 'FCSA00012345.recon.fits'
+        assert ri.pair_files(outputs + fitsfiles) == \
+            ([tuple(fitsfiles)], [])
+
+
+class TestReconstructSession(object):
+
+    def mk_files(self, directory):
+        paths = []
+        for detid in (1, 2):
+            rng = np.random.default_rng(detid)
+            wd = bo.overscan[1][:, 5].max()
+            data = rng.normal(1000.0, 5.0, size=(4240, wd))
+            hdu = fits.PrimaryHDU(data=data.astype(np.float32))
+            hdu.header['BIN-FCT1'] = 1
+            hdu.header['BIN-FCT2'] = 1
+            hdu.header['DET-ID'] = detid
+            paths.append(os.path.join(directory, 'FCSA0000000%d.fits' % detid))
+            hdu.writeto(paths[-1])
+        return paths
+
+    def mk_template(self, pfx, detid, level):
+        data = np.full(bo.overscan[1][:, 5].max(), level, dtype=np.float32)
+        data[::2] += 10.0
+        hdl = fi.put_version(fits.HDUList([fits.PrimaryHDU(data=data)]))
+        hdl.writeto(pfx + '1' + str(detid) + '.fits', overwrite=True)
+        os.utime(pfx + '1' + str(detid) + '.fits', ns=(0, level * 10**9))
+
+    def test_template_changed(self, tmp_path, monkeypatch):
+        # the frames have no WCS keywords to copy
+        monkeypatch.setattr(ri, 'creating_header', lambda hdl, outhdl: None)
+        paths = self.mk_files(str(tmp_path))
+        pfx = str(tmp_path / 'bias_template')
+        for detid in (1, 2):
+            self.mk_template(pfx, detid, 1000)
+
+        session = ri.ReconstructSession(template_pfx=pfx)
+        res1 = session.reconstruct(*paths)[0].data
+
+        # a long-lived session sees a rewritten template
+        self.mk_template(pfx, 1, 2000)
+        res2 = session.reconstruct(*paths)[0].data
+        expected = ri.ReconstructSession(
+            template_pfx=pfx).reconstruct(*paths)[0].data
+        assert not np.array_equal(res1, res2, equal_nan=True)
+        assert np.array_equal(res2, expected, equal_nan=True)
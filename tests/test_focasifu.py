@@ -0,0 +1,75 @@
+"""Unit Tests for the naoj.focas.focasifu functions"""
+
+import numpy as np
+from numpy.polynomial.chebyshev import chebval
+from scipy.ndimage import shift
+
+from naoj.focas import focasifu as fi
+
+
+class TestFocasIFU(object):
+
+    def setup_class(self):
+        rng = np.random.default_rng(0)
+        self.x = np.arange(500, dtype=np.float64)
+        self.y = 1000.0 + 0.01*self.x + 1e-5*(self.x-250.0)**2 + \
+            rng.normal(0.0, 3.0, size=(40, len(self.x)))
+        # add some outliers
+        self.y[rng.random(self.y.shape) < 0.02] += 100.0
+
+    def test_cheb1Dfit_rows(self):
+        c, w = fi.cheb1Dfit_rows(self.x, self.y, order=3, niteration=3,
+                                 high_nsig=3.0, low_nsig=3.0)
+        assert c.shape == (40, 4)
+        assert w.shape == self.y.shape
+        for i in range(self.y.shape[0]):
+            c1, w1 = fi.cheb1Dfit(self.x, self.y[i], order=3, niteration=3,
+                                  high_nsig=3.0, low_nsig=3.0)
+            assert np.array_equal(w[i], w1)
+            assert np.allclose(chebval(self.x, c[i]), chebval(self.x, c1),
+                               rtol=0, atol=1e-8)
+        # the outliers are rejected
+        assert np.all(w[self.y > 1080.0] == 0.0)
+
+    def test_weight(self):
+        weight = np.ones(len(self.x))
+        weight[:100] = 0.0
+        c, w = fi.cheb1Dfit(self.x, self.y[0], order=3, weight=weight)
+        assert weight[:100].sum() == 0.0 and w is not weight
+        c2, w2 = fi.cheb1Dfit_rows(self.x, self.y[:1], order=3,
+                                   weight=weight)
+        assert np.allclose(chebval(self.x, c), chebval(self.x, c2[0]),
+                           rtol=0, atol=1e-8)
+
+    def test_getmedian(self):
+        data = np.array([[1.0, 2.0, 3.0], [4.0, -5.0, np.nan]])
+        assert fi.getmedian(data) == 2.0
+        assert fi.getmedian(data, lower=0.0) == 2.5
+        assert fi.getmedian(data, lower=2.0) == 3.0
+
+    def test_datafiltering(self):
+        data = np.arange(6.0)
+        accept, reject = fi.datafiltering(data, [1, 0, 1, 2, 0, 1])
+        assert np.array_equal(accept, [0.0, 2.0, 5.0])
+        assert np.array_equal(reject, [1.0, 4.0])
+
+    def test_cross_correlate_fft(self):
+        rng = np.random.default_rng(1)
+        x = np.arange(157)
+        # pseudo-slit like profiles with some structure
+        ref = 1000.0 / (1.0 + np.exp(-(x-10.0)/1.5)) / \
+            (1.0 + np.exp((x-147.0)/1.5))
+        ref = ref * (1.0 + 0.05*np.sin(x[np.newaxis,:]/7.0 +
+                                       rng.uniform(0.0, 6.0, size=(6, 1))))
+        dx = rng.uniform(-3.0, 3.0, size=6)
+        indata = np.array([shift(r, d, order=5, mode='nearest')
+                           for r, d in zip(ref, dx)])
+        indata += rng.normal(0.0, 2.0, size=indata.shape)
+
+        res = fi.cross_correlate_fft(indata, ref)
+        assert res.shape == (6,)
+        assert np.all(np.abs(res - dx) < 0.03)
+        for i in range(2):
+            delta = fi.cross_correlate(indata[i], ref[i], sep=0.01)
+            assert abs(delta - res[i]) < 1e-9
+            assert fi.cross_correlate_fft(indata[i], ref[i]) == res[i]
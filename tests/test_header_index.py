@@ -0,0 +1,130 @@
+"""Unit Tests for the naoj.util.header_index functions"""
+
+import os
+
+import numpy as np
+import pytest
+from astropy.io import fits
+
+from naoj.util import header_index
+
+
+def mk_file(directory, frame_num, det_id, data_typ='OBJECT', exp_num=0):
+    hdu = fits.PrimaryHDU(data=np.zeros((4, 6), dtype=np.uint16))
+    hdr = hdu.header
+    hdr['FRAMEID'] = 'HSCA%08d' % (frame_num)
+    hdr['EXP-ID'] = 'HSCE%08d' % (exp_num)
+    hdr['DET-ID'] = det_id
+    hdr['DATA-TYP'] = data_typ
+    hdr['EXPTIME'] = 30.0
+    hdr['T_BEEID'] = 1
+    path = os.path.join(directory, hdr['FRAMEID'] + '.fits')
+    hdu.writeto(path, overwrite=True)
+    return path
+
+
+class TestHeaderIndex(object):
+
+    def test_update(self, tmp_path):
+        directory = str(tmp_path)
+        paths = [mk_file(directory, 200 + i, i, exp_num=200)
+                 for i in range(5)]
+        paths.append(mk_file(directory, 400, 0, data_typ='BIAS',
+                             exp_num=400))
+        (tmp_path / 'notes.txt').write_text('not a FITS file')
+        # a frame that is still being written
+        (tmp_path / 'HSCA00000500.fits').write_bytes(b'')
+
+        index = header_index.HeaderIndex(directory)
+        assert index.update() == 6
+        assert len(index) == 6 and index.paths() == sorted(paths)
+        assert paths[0] in index
+        assert index.getval(paths[1], 'DET-ID') == 1
+        assert index.getval(paths[1], 'EXPTIME') == 30.0
+        assert index.getval(paths[1], 'FILTER01', 'none') == 'none'
+        with pytest.raises(KeyError):
+            index.getval(paths[1], 'FILTER01')
+        # keywords that aren't indexed are read from the file
+        assert index.getval(paths[1], 'T_BEEID') == 1
+        with pytest.raises(OSError):
+            index.get_header(os.path.join(directory, 'HSCA00000500.fits'))
+
+        # the index is kept in the directory and only changes are read
+        index = header_index.HeaderIndex(directory)
+        assert len(index) == 6
+        assert index.getval(paths[5], 'DATA-TYP') == 'BIAS'
+        assert index.update() == 0
+
+        mk_file(directory, 202, 2, data_typ='FLAT', exp_num=200)
+        os.utime(paths[2], ns=(0, 10**9))
+        os.remove(paths[3])
+        assert index.update() == 1
+        assert len(index) == 5 and paths[3] not in index
+        assert index.getval(paths[2], 'DATA-TYP') == 'FLAT'
+        assert header_index.HeaderIndex(directory).update() == 0
+
+        # a different set of keywords makes a new index
+        index = header_index.HeaderIndex(directory, keywords=('FRAMEID',))
+        assert index.update() == 5
+
+    def test_select(self, tmp_path):
+        directory = str(tmp_path)
+        paths = [mk_file(directory, 200 + i, i % 2, exp_num=200 * (i // 2))
+                 for i in range(6)]
+        index = header_index.get_index(directory)
+
+        assert index.select({'DET-ID': 1}) == paths[1::2]
+        assert index.select({'EXP-ID': 'HSCE00000200',
+                             'DET-ID': lambda det_id: det_id < 1}) == \
+            [paths[2]]
+        with pytest.raises(KeyError):
+            index.select({'T_BEEID': 1})
+
+        groups = index.groupby('EXP-ID')
+        assert sorted(groups.keys()) == ['HSCE00000000', 'HSCE00000200',
+                                         'HSCE00000400']
+        assert groups['HSCE00000400'] == paths[4:]
+
+        # a file that isn't indexed yet
+        path = mk_file(directory, 300, 3)
+        assert path not in index
+        assert index.get_header(path)['DET-ID'] == 3
+        assert path in index
+        assert header_index.get_index(directory) is index
+
+    def test_types(self, tmp_path):
+        directory = str(tmp_path)
+        values = [1, 'A', 2.5, True, 3]
+        paths = []
+        for i, val in enumerate(values):
+            path = mk_file(directory, 200 + i, i)
+            fits.setval(path, 'OBJECT', value=val)
+            paths.append(path)
+
+        index = header_index.HeaderIndex(directory)
+        index.update()
+        # the values keep their types when the index is loaded again
+        index = header_index.HeaderIndex(directory)
+        assert index.update() == 0
+        res = [index.getval(path, 'OBJECT') for path in paths]
+        assert res == values
+        assert [type(val) for val in res] == [type(val) for val in values]
+        assert type(index.getval(paths[0], 'DET-ID')) is int
+        assert type(index.getval(paths[0], 'EXPTIME')) is float
+
+    def test_modified(self, tmp_path):
+        directory = str(tmp_path)
+        path = mk_file(directory, 200, 0)
+        index = header_index.get_index(directory)
+        assert index.getval(path, 'DATA-TYP') == 'OBJECT'
+
+        # a file changed since the last update() is read again...
+        mk_file(directory, 200, 0, data_typ='FLAT')
+        os.utime(path, ns=(0, 10**9))
+        assert index.getval(path, 'DATA-TYP') == 'FLAT'
+        assert index.select({'DATA-TYP': 'FLAT'}) == [path]
+        # ...and a file that is gone is dropped
+        os.remove(path)
+        with pytest.raises(OSError):
+            index.getval(path, 'DATA-TYP')
+        assert path not in index
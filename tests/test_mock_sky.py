@@ -1,6 +1,8 @@
 """Unit Tests for the ginga.util.mock_sky functions"""
 
 import numpy as np
+import pytest
+from astropy.io import fits
 
 from naoj.util import mock_sky as ms
 
@@ -27,3 +29,149 @@ class TestMockSky(object):
         locs = ms.mk_star_image(self.arr, expected_num)
         # should produce the number of expected stars
         assert len(locs) == expected_num
+
+    def test_add_stars(self):
+        from astropy.modeling.functional_models import Gaussian2D
+        rng = np.random.default_rng(0)
+        ht, wd = 100, 120
+        x, y = rng.uniform(-3, wd + 3, 20), rng.uniform(-3, ht + 3, 20)
+        amp = rng.uniform(50, 1000, 20)
+        sx, sy = rng.uniform(1.5, 3.0, 20), rng.uniform(1.5, 3.0, 20)
+        # reference: each star evaluated over the full frame
+        yy, xx = np.mgrid[:ht, :wd]
+        expected = np.zeros((ht, wd))
+        for i in range(len(x)):
+            expected += Gaussian2D(amp[i], x[i], y[i], sx[i], sy[i])(xx, yy)
+
+        arr = np.zeros((ht, wd))
+        ms.add_stars(arr, (x, y), amp, sx, sy, chunk_size=7)
+        assert np.allclose(arr, expected, rtol=0, atol=1e-2)
+
+    def test_mk_star_image_blur(self):
+        arr = np.zeros((300, 400), dtype=np.float32)
+        locs = ms.mk_star_image(arr, 50, blur=1.5, bg_sdev=0.0)
+        assert len(locs) == 50
+        # the stars are within the edge limits
+        x, y = np.array(locs).T
+        assert np.all((x >= 80) & (x <= 320) & (y >= 60) & (y <= 240))
+        assert np.all(arr >= 2000.0) and arr.max() > 2000.0
+
+    def test_rng(self):
+        # the same seed gives the same image
+        arrs = []
+        for i in range(2):
+            arr = np.zeros((100, 120), dtype=np.float32)
+            locs = ms.mk_star_image(arr, 10, rng=np.random.default_rng(5))
+            arrs.append(arr)
+        assert np.array_equal(arrs[0], arrs[1])
+        arr = np.zeros((100, 120), dtype=np.float32)
+        assert ms.mk_star_image(arr, 10, rng=5) == locs
+        assert np.array_equal(arr, arrs[0])
+
+        # None uses the global state
+        np.random.seed(3)
+        arr = np.zeros((100, 120), dtype=np.float32)
+        locs = ms.mk_star_image(arr, 10)
+        np.random.seed(3)
+        arr2 = np.zeros((100, 120), dtype=np.float32)
+        assert ms.mk_star_image(arr2, 10) == locs
+        assert np.array_equal(arr, arr2)
+
+
+class TestRebin(object):
+
+    def reference(self, arr, factor, method, edge):
+        # each block reduced separately
+        ht, wd = arr.shape[-2:]
+        if edge == 'crop':
+            ny, nx = ht // factor, wd // factor
+        else:
+            ny, nx = -(-ht // factor), -(-wd // factor)
+        res = np.empty(arr.shape[:-2] + (ny, nx))
+        for j in range(ny):
+            for i in range(nx):
+                block = arr[..., j*factor:(j+1)*factor,
+                            i*factor:(i+1)*factor]
+                res[..., j, i] = getattr(np, method)(block, axis=(-2, -1))
+        return res
+
+    def test_rebin(self):
+        rng = np.random.default_rng(0)
+        arr = rng.random((3, 13, 17))
+        for factor in (2, 3, 5, 20):
+            for method in ms.rebin_methods:
+                for edge in ms.rebin_edges:
+                    res = ms.rebin(arr, factor, method=method, edge=edge)
+                    assert np.allclose(res, self.reference(arr, factor,
+                                                           method, edge))
+                    # an image
+                    res = ms.rebin(arr[1], factor, method=method, edge=edge)
+                    assert np.allclose(res, self.reference(arr[1], factor,
+                                                           method, edge))
+
+    def test_rebin_sum(self):
+        # a sum of the pixels, padded with zeros, as numpy sums them
+        arr = np.arange(35, dtype=np.uint16).reshape(5, 7)
+        res = ms.rebin(arr, 4)
+        assert res.dtype == np.sum(arr).dtype
+        assert np.array_equal(res, [[arr[:4, :4].sum(), arr[:4, 4:].sum()],
+                                    [arr[4:, :4].sum(), arr[4:, 4:].sum()]])
+        assert ms.rebin(arr, 1) is arr
+        assert ms.rebin(arr, (1, 7)).shape == (5, 1)
+
+    def test_rebin_out(self):
+        arr = np.ones((8, 12), dtype=np.float32)
+        out = np.empty((4, 3), dtype=np.float32)
+        assert ms.rebin(arr, (2, 4), method='mean', out=out) is out
+        assert np.all(out == 1.0)
+        with pytest.raises(ValueError):
+            ms.rebin(arr, 3, out=out)
+        for factor in (0, 1.5):
+            with pytest.raises(ValueError):
+                ms.rebin(arr, factor)
+        with pytest.raises(ValueError):
+            ms.rebin(arr, 2, method='max')
+
+
+class TestMockHSC(object):
+
+    def setup_class(self):
+        # the CCD regions come from hsc_dr, which needs g2base
+        pytest.importorskip('g2base')
+
+    def test_mk_hsc_ccd(self):
+        from naoj.hsc import hsc_dr
+        d = hsc_dr.get_ccd_data(raw=True)[9]
+        hdu = ms.mk_hsc_ccd(9, exp_num=400, rng=1, num_stars=0,
+                            sky_level=1000.0, read_noise=0.0)
+        hdr, data = hdu.header, hdu.data
+        assert data.dtype == np.uint16
+        assert data.shape == ms.hsc_ccd_shape(d) == (4241, 2136)
+        assert hdr['DET-ID'] == 9 and hdr['EXP-ID'] == 'HSCE00000400'
+        assert hdr['FRAMEID'] == 'HSCA%08d' % (400 + 147)
+        for channel in (1, 2, 3, 4):
+            ch = d[channel]
+            assert hdr['T_EFMN%d1' % channel] == ch['efminx'] + 1
+            assert hdr['T_OSMX%d2' % channel] == ch['osmaxy'] + 1
+            assert hdr['T_GAIN%d' % channel] == ch['gain']
+
+            # sky level above the bias of the overscan, in ADU
+            ef = data[ch['efminy']:ch['efmaxy'] + 1,
+                      ch['efminx']:ch['efmaxx'] + 1]
+            bias = np.median(data[:, ch['osminx']:ch['osmaxx'] + 1])
+            assert np.isclose(np.median(ef) - bias, 1000.0 / ch['gain'],
+                              atol=1.0)
+
+    def test_mk_hsc_exposure(self, tmp_path):
+        kwargs = dict(seed=7, exp_num=200, num_stars=20)
+        hdus = ms.mk_hsc_exposure(det_ids=[0, 3, 100], **kwargs)
+        assert [hdu.header['DET-ID'] for hdu in hdus] == [0, 3, 100]
+
+        # a CCD is the same however the exposure is made
+        paths = ms.mk_hsc_exposure(det_ids=[100, 3], num_workers=2,
+                                   directory=str(tmp_path), **kwargs)
+        assert paths == [str(tmp_path / (hdus[i].header['FRAMEID'] + '.fits'))
+                         for i in (2, 1)]
+        with fits.open(paths[0]) as hdl:
+            assert np.array_equal(hdl[0].data, hdus[2].data)
+        assert not np.array_equal(hdus[0].data, hdus[1].data)
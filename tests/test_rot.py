@@ -0,0 +1,184 @@
+"""Unit Tests for the naoj.util.rot functions"""
+
+import numpy as np
+
+from naoj.util import rot
+
+
+# reference implementation: the scalar functions of rot.py before they
+# were vectorized
+
+def ref_normalize_angle(ang_deg, limit=None, ang_offset=0.0):
+    ang_deg = np.array([ang_deg + ang_offset], dtype=float)
+    mask = np.fabs(ang_deg) >= 360.0
+    ang_deg[mask] = np.remainder(ang_deg[mask], np.sign(ang_deg[mask]) * 360.0)
+    if limit is not None:
+        mask = ang_deg < 0.0
+        ang_deg[mask] += 360.0
+        if limit == 'half':
+            mask = ang_deg > 180.0
+            ang_deg[mask] -= 360.0
+    return ang_deg[0]
+
+
+def ref_alternate_angle(ang_deg):
+    return ang_deg - np.sign(ang_deg) * 360.0
+
+
+def ref_is_north_az(az_deg):
+    return np.abs(ref_normalize_angle(az_deg, limit='half')) < 90.0
+
+
+def ref_possible_azimuths(dec_deg, az_start_deg, az_stop_deg, obs_lat_deg,
+                          az_min_deg=-270.0, az_max_deg=+270.0):
+    az_start_deg = ref_normalize_angle(az_start_deg, limit='half',
+                                       ang_offset=-180)
+    az_stop_deg = ref_normalize_angle(az_stop_deg, limit='half',
+                                      ang_offset=-180)
+    traverses_south = (dec_deg < obs_lat_deg) and \
+        (az_stop_deg > -90.0 and az_start_deg < 90.0)
+    delta = ref_normalize_angle(az_stop_deg, limit='full') - \
+        ref_normalize_angle(az_start_deg, limit='full')
+    first_path = (az_start_deg, az_start_deg + delta)
+    az_start2 = ref_alternate_angle(az_start_deg)
+    second_path = (az_start2, az_start2 + delta)
+    if traverses_south:
+        candidates = [(az_start_deg, az_stop_deg)]
+    else:
+        candidates = [first_path, second_path]
+    return [(start, stop) for start, stop in candidates
+            if (az_min_deg <= start <= az_max_deg and
+                az_min_deg <= stop <= az_max_deg)]
+
+
+def ref_possible_rotations(pang_start_deg, pang_stop_deg, pa_deg, ins_name,
+                           az_start_deg, az_stop_deg):
+    ins_delta = rot.mount_offsets.get(ins_name, 0.0)
+    if rot.mount_flip.get(ins_name, False):
+        pa_deg = -pa_deg
+    rot_start = ref_normalize_angle(pang_start_deg + pa_deg + ins_delta,
+                                    limit='full')
+    rot_end = pang_stop_deg + pa_deg + ins_delta
+    if ref_is_north_az(az_start_deg) != ref_is_north_az(az_stop_deg):
+        rot_end = rot_end + 180.0
+    rot_end = rot_start + (rot_end - rot_start + 180) % 360 - 180
+    rot_end = ref_normalize_angle(rot_end, limit='full')
+    right_start = ref_alternate_angle(rot_start)
+    return [(rot_start, rot_end), (right_start,
+                                   right_start + rot_end - rot_start)]
+
+
+def ref_optimal_rotation(rots, cur_rot_deg, min_rot_deg, max_rot_deg):
+    ok = [np.isfinite(start) and np.isfinite(stop) and
+          min_rot_deg <= start <= max_rot_deg and
+          min_rot_deg <= stop <= max_rot_deg for start, stop in rots]
+    if ok[0] and ok[1]:
+        if (np.fabs(cur_rot_deg - rots[0][0]) <
+            np.fabs(cur_rot_deg - rots[1][0])):
+            return rots[0]
+        return rots[1]
+    if ok[0]:
+        return rots[0]
+    if ok[1]:
+        return rots[1]
+    return None
+
+
+class TestRot(object):
+
+    def setup_class(self):
+        rng = np.random.default_rng(0)
+        n, m = 20, 15
+        self.obs_lat = 19.8
+        self.dec = rng.uniform(-30.0, 80.0, size=(n, 1))
+        self.az_start = rng.uniform(-180.0, 180.0, size=(n, m))
+        self.az_stop = self.az_start + rng.uniform(-5.0, 5.0, size=(n, m))
+        self.pang_start = rng.uniform(-180.0, 180.0, size=(n, m))
+        self.pang_stop = self.pang_start + rng.uniform(-5.0, 5.0,
+                                                       size=(n, m))
+
+    def test_normalize_angle(self):
+        ang = np.array([-720.0, -400.0, -360.0, -190.0, -10.0, 0.0,
+                        10.0, 190.0, 360.0, 400.0, 720.0])
+        for limit in (None, 'full', 'half'):
+            res = rot.normalize_angle(ang, limit=limit)
+            assert res.shape == ang.shape
+            for a, r in zip(ang, res):
+                assert rot.normalize_angle(a, limit=limit) == r
+        assert np.array_equal(rot.normalize_angle(ang, limit='half'),
+                              [0, -40, 0, 170, -10, 0, 10, -170, 0, 40, 0])
+        assert np.array_equal(rot.is_north_az(np.array([0.0, 100.0, 300.0])),
+                              [True, False, True])
+
+    def test_azimuth_candidates(self):
+        az_choices = rot.calc_azimuth_candidates(self.dec, self.az_start,
+                                                 self.az_stop, self.obs_lat,
+                                                 az_min_deg=-200.0,
+                                                 az_max_deg=200.0)
+        assert az_choices.shape == (2, 2) + self.az_start.shape
+        for idx in np.ndindex(*self.az_start.shape):
+            expected = ref_possible_azimuths(self.dec[idx[0], 0],
+                                             self.az_start[idx],
+                                             self.az_stop[idx],
+                                             self.obs_lat,
+                                             az_min_deg=-200.0,
+                                             az_max_deg=200.0)
+            res = [tuple(az_choices[(i, slice(None)) + idx])
+                   for i in range(2)
+                   if np.isfinite(az_choices[(i, 0) + idx])]
+            assert np.allclose(res, expected, rtol=0, atol=1e-9)
+            assert rot.calc_possible_azimuths(
+                self.dec[idx[0], 0], self.az_start[idx], self.az_stop[idx],
+                self.obs_lat, az_min_deg=-200.0, az_max_deg=200.0) == res
+
+    def test_known_azimuths(self):
+        # a target in the north (dec above the latitude) can be reached
+        # both ways; one that passes the south has a single path
+        assert rot.calc_possible_azimuths(60.0, 10.0, 20.0, 19.8) == \
+            [(-170.0, -160.0), (190.0, 200.0)]
+        assert rot.calc_possible_azimuths(-20.0, 170.0, 190.0, 19.8) == \
+            [(-10.0, 10.0)]
+        assert rot.calc_possible_azimuths(60.0, 10.0, 20.0, 19.8,
+                                          az_max_deg=180.0) == \
+            [(-170.0, -160.0)]
+
+    def test_plan_rotations(self):
+        az_choices, rot_choices, az_idx, rot_idx = rot.plan_rotations(
+            self.pang_start, self.pang_stop, 30.0, 'PFS',
+            self.az_start, self.az_stop, self.dec, self.obs_lat,
+            cur_rot_deg=10.0)
+        min_rot, max_rot = rot.rot_limits['PFS']
+        num_ok = 0
+        for idx in np.ndindex(*self.az_start.shape):
+            rots = ref_possible_rotations(self.pang_start[idx],
+                                          self.pang_stop[idx], 30.0, 'PFS',
+                                          self.az_start[idx],
+                                          self.az_stop[idx])
+            expected = ref_optimal_rotation(rots, 10.0, min_rot, max_rot)
+            if expected is None:
+                assert rot_idx[idx] < 0
+            else:
+                num_ok += 1
+                assert np.allclose(
+                    rot_choices[(rot_idx[idx], slice(None)) + idx],
+                    expected, rtol=0, atol=1e-9)
+            assert az_idx[idx] == (0 if np.isfinite(az_choices[(0, 0) + idx])
+                                   else -1)
+        assert num_ok > 0
+
+    def test_known_rotations(self):
+        # PFS: no flip or mount offset; the rotator angle is the
+        # parallactic angle plus the PA, or its alternate 360 deg away
+        rots = rot.calc_possible_rotations(20.0, 25.0, 30.0, 'PFS',
+                                           100.0, 110.0)
+        assert np.allclose(rots[:, :2], [(50.0, 55.0), (-310.0, -305.0)])
+        assert np.allclose(rot.calc_optimal_rotation(
+            rots[0, 0], rots[0, 1], rots[1, 0], rots[1, 1], 10.0,
+            -174.0, 174.0), (50.0, 55.0))
+        # crossing the zenith flips the rotator by 180 deg
+        rots = rot.calc_possible_rotations(20.0, 25.0, 30.0, 'PFS',
+                                           80.0, 100.0)
+        assert np.allclose(rots[0, :2], (50.0, 235.0))
+        assert np.all(np.isnan(rot.calc_optimal_rotation(
+            rots[0, 0], rots[0, 1], rots[1, 0], rots[1, 1], 10.0,
+            -174.0, 174.0)))
@@ -0,0 +1,240 @@
+"""Unit Tests for the naoj.spcam.spcam_dr functions"""
+
+import os
+import logging
+
+import numpy as np
+import pytest
+
+pytest.importorskip('g2base')
+
+from astropy.io import fits
+from ginga import AstroImage
+from ginga.misc import log
+
+from naoj.spcam import spcam_dr
+
+
+class WorkerDR(spcam_dr.SuprimeCamDR):
+
+    def report(self, path):
+        # the state seen by the object processing a file
+        return int(path), dict(pfx=self.pfx, offsets=self.frameid_offsets,
+                               num_workers=self.num_workers,
+                               level=spcam_dr.get_logger_state(
+                                   self.logger)['level'])
+
+
+class TestMapCCDs(object):
+
+    def test_worker_state(self):
+        logger = log.get_logger('test', level=logging.DEBUG,
+                                log_stderr=True)
+        dr = WorkerDR(logger=logger)
+        dr.pfx = 'T'
+        dr.frameid_offsets = [0, 2, 4]
+        dr.num_workers = 2
+
+        results = dr.map_ccds('report', ['1', '0', '2'])
+        assert [ccd_id for ccd_id, res in results] == [0, 1, 2]
+        for ccd_id, res in results:
+            assert res == dict(pfx='T', offsets=[0, 2, 4], num_workers=1,
+                               level=logging.DEBUG)
+
+    def test_logger_state(self):
+        # a null logger stays silent
+        state = spcam_dr.get_logger_state(log.get_logger(null=True))
+        logger = spcam_dr.make_logger(state)
+        assert not logger.isEnabledFor(logging.CRITICAL)
+
+        logger = log.get_logger('test', level=logging.INFO)
+        state = spcam_dr.get_logger_state(logger)
+        assert not state['log_stderr']
+        assert spcam_dr.make_logger(state).getEffectiveLevel() == \
+            logging.WARN
+
+
+def mk_image(det_id, efht, data=None):
+    # a SPCAM-like image with 4 channels of 10 effective pixels and 2
+    # overscan pixels along X, and `efht` rows of effective pixels
+    kwds = {'DET-ID': det_id, 'BIN-FCT1': 1, 'BIN-FCT2': 1}
+    for i, channel in enumerate((1, 2, 3, 4)):
+        x0 = i * 12
+        kwds.update({'S_EFMN%d1' % channel: x0 + 1,
+                     'S_EFMX%d1' % channel: x0 + 10,
+                     'S_EFMN%d2' % channel: 1,
+                     'S_EFMX%d2' % channel: efht,
+                     'S_OSMN%d1' % channel: x0 + 11,
+                     'S_OSMX%d1' % channel: x0 + 12,
+                     'S_OSMN%d2' % channel: 1,
+                     'S_OSMX%d2' % channel: efht,
+                     'S_GAIN%d' % channel: 3.0})
+    if data is None:
+        data = np.zeros((efht, 48))
+    image = AstroImage.AstroImage(data_np=data)
+    image.update_keywords(kwds)
+    return image
+
+
+class TestOverscanPlan(object):
+
+    def test_cache(self):
+        dr = spcam_dr.SuprimeCamDR(logger=log.get_logger(null=True))
+        plan = dr.get_overscan_plan(mk_image(3, 20))
+        assert dr.get_overscan_plan(mk_image(3, 20)) is plan
+        assert (plan.newht, plan.newwd) == (20, 40)
+
+        # the same CCD and binning with another window
+        plan2 = dr.get_overscan_plan(mk_image(3, 16))
+        assert (plan2.newht, plan2.newwd) == (16, 40)
+
+        # the numpy entry point shares the cache
+        image = mk_image(3, 16, np.arange(16 * 48.0).reshape(16, 48))
+        d = dr.get_regions(image)
+        res = dr.subtract_overscan_np(image.get_data(), d, sub_bias=False)
+        assert np.array_equal(res, np.delete(image.get_data(),
+                                             [10, 11, 22, 23, 34, 35,
+                                              46, 47], axis=1))
+        assert len(dr._overscan_plans) == 2
+
+
+def mk_file(path, det_id, efht, data, scaled=False):
+    # a FITS file of the SPCAM-like image of mk_image(); raw frames are
+    # stored as scaled 16-bit integers
+    image = mk_image(det_id, efht)
+    hdu = fits.PrimaryHDU()
+    for kwd in image.get_header().keys():
+        hdu.header[kwd] = image.get_keyword(kwd)
+    if scaled:
+        hdu.data = data.astype(np.uint16)
+    else:
+        hdu.data = data.astype(np.float32)
+    hdu.writeto(path)
+    return path
+
+
+class TestLazyImage(object):
+
+    def setup_class(self):
+        self.data = np.arange(20 * 48).reshape(20, 48) % 1000 + 30000.0
+        self.dr = spcam_dr.SuprimeCamDR(logger=log.get_logger(null=True))
+
+    def test_header(self, tmp_path):
+        path = mk_file(str(tmp_path / 'a.fits'), 3, 20, self.data)
+        image = self.dr.load_image(path, lazy=True)
+        assert image.get_keyword('DET-ID') == 3
+        assert image.get_keyword('FILTER01', 'none') == 'none'
+        assert image.get_size() == (48, 20)
+        assert self.dr.get_regions(image)[1].efmaxx == 9
+        # nothing but the header was read
+        assert image._fits is None and image._image is None
+
+    def test_data(self, tmp_path):
+        for scaled in (False, True):
+            path = mk_file(str(tmp_path / ('s%d.fits' % scaled)), 3, 20,
+                           self.data, scaled=scaled)
+            image = self.dr.load_image(path, lazy=True)
+            assert np.array_equal(image.get_section(slice(2, 5),
+                                                    slice(10, 20)),
+                                  self.data[2:5, 10:20])
+            assert np.array_equal(image.get_data(), self.data)
+            assert np.array_equal(np.asarray(image), self.data)
+            # only unscaled data can be memory-mapped
+            assert image._fits._file.memmap == (not scaled)
+            assert image._image is None
+            image.close()
+
+    def test_materialized(self, tmp_path):
+        path = mk_file(str(tmp_path / 'a.fits'), 3, 20, self.data,
+                       scaled=True)
+        image = self.dr.load_image(path, lazy=True)
+        self.dr.remove_overscan(image, sub_bias=False)
+        assert image._image is not None
+        # the handle answers from the trimmed image
+        trimmed = np.delete(self.data, [10, 11, 22, 23, 34, 35, 46, 47],
+                            axis=1)
+        assert image.get_size() == (40, 20)
+        assert image.get_keyword('NAXIS1') == 40
+        assert image.get_header()['NAXIS1'] == 40
+        assert np.array_equal(image.get_data(), trimmed)
+        assert np.array_equal(image.get_section(slice(0, 2)), trimmed[:2])
+
+    def test_get_images(self, tmp_path):
+        dr = spcam_dr.SuprimeCamDR(logger=log.get_logger(null=True))
+        dr.frameid_offsets = [0, 1]
+        paths = [mk_file(str(tmp_path / ('SUPA0000000%d.fits' % i)), i, 20,
+                         self.data) for i in (0, 1)]
+        images = dr.get_images(paths[0])
+        assert [image.filepath for image in images] == paths
+        assert [image.get_keyword('DET-ID') for image in images] == [0, 1]
+        images = dr.get_images(paths[0], lazy=False)
+        assert isinstance(images[0], AstroImage.AstroImage)
+
+
+class TestMultiHDU(object):
+
+    def mk_files(self, directory, det_ids=(2, 0, 1)):
+        # raw-like CCD files, out of DET-ID order
+        rng = np.random.default_rng(0)
+        paths, data = [], {}
+        for i, det_id in enumerate(det_ids):
+            data[det_id] = rng.integers(900, 1100, size=(30, 20),
+                                        dtype=np.uint16)
+            hdu = fits.PrimaryHDU(data=data[det_id])
+            hdu.header['DET-ID'] = det_id
+            hdu.header['FRAMEID'] = 'SUPA%08d' % (det_id)
+            hdu.header['EXP-ID'] = 'SUPE00000000'
+            hdu.header['OBJECT'] = 'TEST'
+            paths.append(os.path.join(directory, 'SUPA%08d.fits' % (det_id)))
+            hdu.writeto(paths[-1])
+        return paths, data
+
+    def check(self, outfile, data, compress):
+        with fits.open(outfile) as hdul:
+            hdul.verify('exception')
+            assert len(hdul) == len(data) + 1
+            assert hdul[0].data is None
+            assert hdul[0].header['OBJECT'] == 'TEST'
+            # one HDU per CCD, in DET-ID order
+            for det_id, hdu in zip(sorted(data.keys()), hdul[1:]):
+                assert isinstance(hdu, fits.CompImageHDU) == compress
+                if not compress:
+                    assert hdu.verify_checksum() == 1
+                assert hdu.header['DET-ID'] == det_id
+                assert hdu.header['FRAMEID'] == 'SUPA%08d' % (det_id)
+                assert hdu.data.dtype == np.uint16
+                assert np.array_equal(hdu.data, data[det_id])
+
+    def test_write_multi_hdu(self, tmp_path):
+        paths, data = self.mk_files(str(tmp_path))
+        dr = spcam_dr.SuprimeCamDR(logger=log.get_logger(null=True))
+        for compress in (False, True):
+            for num_workers in (1, 2):
+                outfile = str(tmp_path / ('out%d%d.fits' % (compress,
+                                                            num_workers)))
+                dr.write_multi_hdu(paths, outfile, compress=compress,
+                                   num_workers=num_workers,
+                                   executor='thread')
+                self.check(outfile, data, compress)
+
+    def test_make_multi_hdu(self, tmp_path):
+        paths, data = self.mk_files(str(tmp_path))
+        dr = spcam_dr.SuprimeCamDR(logger=log.get_logger(null=True))
+        images = [dr.load_image(path) for path in paths]
+        # serially, by default
+        assert dr.num_workers == 1
+
+        outputs = []
+        for num_workers, executor in ((1, 'process'), (2, 'thread'),
+                                      (2, 'process')):
+            hdulist = dr.make_multi_hdu(images, compress=True,
+                                        num_workers=num_workers,
+                                        executor=executor)
+            outfile = str(tmp_path / ('out%d%s.fits' % (num_workers,
+                                                        executor)))
+            hdulist.writeto(outfile)
+            self.check(outfile, data, True)
+            with open(outfile, 'rb') as in_f:
+                outputs.append(in_f.read())
+        # the same file whether compressed serially or concurrently
+        assert outputs[1] == outputs[0] and outputs[2] == outputs[0]
@@ -0,0 +1,78 @@
+"""
+Benchmark serial vs. concurrent reduction of the two chips of a
+synthetic FOCAS frame pair with naoj.focas.biassub.biassub()
+(bias subtraction and overscan removal, stacked).
+
+Usage:
+  python bench_focas_biassub.py [-b BINNING] [-r NUM_RUNS] [-d TMPDIR]
+"""
+import sys
+import os
+import time
+import tempfile
+from argparse import ArgumentParser
+
+import numpy as np
+from astropy.io import fits
+
+from naoj.focas import bias_overscan
+from naoj.focas.biassub import biassub
+
+
+def mk_frame(path, detid, binfac=1, seed=0):
+    rng = np.random.default_rng(seed)
+    ovs = bias_overscan.overscan[binfac]
+    ht, wd = 4240 // binfac, ovs[:, 5].max()
+    data = rng.normal(1000.0, 5.0, size=(ht, wd))
+    data += np.linspace(0.0, 20.0, ht)[:, np.newaxis]
+    hdu = fits.PrimaryHDU(data=data.astype(np.uint16))
+    hdr = hdu.header
+    hdr['BIN-FCT1'] = binfac
+    hdr['BIN-FCT2'] = binfac
+    hdr['DET-ID'] = detid
+    hdu.scale('int16', bzero=32768)
+    hdu.writeto(path, overwrite=True)
+
+
+def time_biassub(fname1, fname2, concurrent, num_runs):
+    times = []
+    for i in range(num_runs):
+        time_start = time.time()
+        hdulist = biassub(fname1, fname2, template_pfx='no_such_template',
+                          concurrent=concurrent)
+        times.append(time.time() - time_start)
+    return min(times), hdulist
+
+
+def main(options, args):
+    with tempfile.TemporaryDirectory(dir=options.tmpdir) as tmpdir:
+        fname1 = os.path.join(tmpdir, 'FCSA00000001.fits')
+        fname2 = os.path.join(tmpdir, 'FCSA00000002.fits')
+        print("making a synthetic frame pair (binning %d)..." % (
+            options.binning))
+        mk_frame(fname1, 1, options.binning, seed=1)
+        mk_frame(fname2, 2, options.binning, seed=2)
+
+        t_serial, hdl_serial = time_biassub(fname1, fname2, None,
+                                            options.num_runs)
+        print("serial:  %8.3f sec" % (t_serial))
+        for concurrent in ('thread', 'process'):
+            t_conc, hdl = time_biassub(fname1, fname2, concurrent,
+                                       options.num_runs)
+            same = np.array_equal(hdl[0].data, hdl_serial[0].data)
+            print("%-8s %8.3f sec  (x%.2f, same result: %s)" % (
+                concurrent + ':', t_conc, t_serial / t_conc, same))
+
+
+if __name__ == '__main__':
+    argprs = ArgumentParser(description="Benchmark concurrent FOCAS biassub")
+    argprs.add_argument("-b", "--binning", dest="binning", type=int,
+                        default=1, choices=(1, 2, 4),
+                        help="Binning factor of the frames")
+    argprs.add_argument("-r", "--runs", dest="num_runs", type=int,
+                        default=5, help="Number of runs (best is reported)")
+    argprs.add_argument("-d", "--tmpdir", dest="tmpdir", default=None,
+                        help="Directory for the synthetic frames")
+    (options, args) = argprs.parse_known_args(sys.argv[1:])
+
+    main(options, args)
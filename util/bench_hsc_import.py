@@ -0,0 +1,92 @@
+"""
+Benchmark the start-up cost of the HSC CCD tables: importing
+naoj.hsc.ccd_info and naoj.hsc.hsc_dr, and the first access of the
+tables, each in a fresh interpreter.
+
+The modules that these import anyway (numpy, and naoj.spcam.spcam_dr
+for hsc_dr) are imported before the clock starts, as they would already
+be in a Ginga plugin or a CLI script.
+
+Optionally, compare with a CCD outline table in the form of a Python
+module (e.g. an old ccd_info.py, from `git show <rev>:naoj/hsc/ccd_info.py`),
+which is timed both compiled from source and imported from a cached
+bytecode file.
+
+Usage:
+  python bench_hsc_import.py [-r NUM_RUNS] [--legacy PATH]
+"""
+import sys
+import os
+import shutil
+import subprocess
+import tempfile
+from argparse import ArgumentParser
+
+tests = [
+    ("import ccd_info", "import numpy", "import naoj.hsc.ccd_info", ""),
+    ("import ccd_info + info", "import numpy", "import naoj.hsc.ccd_info",
+     "naoj.hsc.ccd_info.info"),
+    ("import hsc_dr", "import naoj.spcam.spcam_dr", "import naoj.hsc.hsc_dr",
+     ""),
+    ("import hsc_dr + hsc_ccd_data", "import naoj.spcam.spcam_dr",
+     "import naoj.hsc.hsc_dr", "naoj.hsc.hsc_dr.hsc_ccd_data"),
+    ]
+
+timer = """
+import time
+{preamble}
+t0 = time.perf_counter()
+{setup}
+{stmt}
+t2 = time.perf_counter()
+print(t2 - t0)
+"""
+
+
+def time_in_subprocess(preamble, setup, stmt, runs, cwd=None):
+    # run once to make sure the bytecode files are cached
+    code = timer.format(preamble=preamble, setup=setup, stmt=stmt)
+    subprocess.check_output([sys.executable, '-c', code], cwd=cwd)
+    res = [float(subprocess.check_output([sys.executable, '-c', code],
+                                         cwd=cwd))
+           for i in range(runs)]
+    return min(res)
+
+
+def main(options, args):
+
+    print("best of %d runs, each in a fresh interpreter" % (options.runs))
+    for name, preamble, setup, stmt in tests:
+        t = time_in_subprocess(preamble, setup, stmt, options.runs)
+        print("%-32s %8.1f ms" % (name, t * 1000))
+
+    if options.legacy is not None:
+        tmpdir = tempfile.mkdtemp()
+        try:
+            shutil.copy(options.legacy,
+                        os.path.join(tmpdir, 'legacy_ccd_info.py'))
+            t = time_in_subprocess(
+                "", "src = open('legacy_ccd_info.py').read()",
+                "exec(compile(src, 'legacy_ccd_info.py', 'exec'), {})",
+                options.runs, cwd=tmpdir)
+            print("%-32s %8.1f ms" % ("legacy: compile from source",
+                                      t * 1000))
+            t = time_in_subprocess("", "import legacy_ccd_info", "",
+                                   options.runs, cwd=tmpdir)
+            print("%-32s %8.1f ms" % ("legacy: import (cached .pyc)",
+                                      t * 1000))
+        finally:
+            shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':
+    argprs = ArgumentParser(description="Benchmark the import of the HSC CCD tables")
+    argprs.add_argument("-r", "--runs", dest="runs", type=int, default=5,
+                        metavar="NUM_RUNS",
+                        help="Time the best of NUM_RUNS runs")
+    argprs.add_argument("--legacy", dest="legacy", default=None,
+                        metavar="PATH",
+                        help="Compare with a CCD table module at PATH")
+    (options, args) = argprs.parse_known_args(sys.argv[1:])
+
+    main(options, args)
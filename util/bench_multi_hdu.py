@@ -0,0 +1,83 @@
+"""
+Benchmark serial vs. parallel Rice compression of a synthetic HSC
+exposure packed with SuprimeCamDR.make_multi_hdu().
+
+The compression is serial by default (the `num_workers` attribute of
+the data reduction object is 1): on a machine with few cores the worker
+pool costs more than it saves.  Use this benchmark to decide whether to
+raise it on a given machine.
+
+Usage:
+  python bench_multi_hdu.py [-n NUM_CCDS] [-w NUM_WORKERS] [-e process|thread]
+"""
+import os
+import sys
+import io
+import time
+from argparse import ArgumentParser
+
+import numpy
+
+from ginga import AstroImage
+from ginga.misc import log
+
+from naoj.hsc import hsc_dr
+
+
+def mk_exposure(num_ccds, ht=4176, wd=2048, seed=0):
+    rng = numpy.random.default_rng(seed)
+    images = []
+    for det_id in range(num_ccds):
+        data = rng.normal(1000.0, 15.0, size=(ht, wd)).astype(numpy.uint16)
+        image = AstroImage.AstroImage(data_np=data)
+        image.update_keywords({'DET-ID': det_id, 'EXP-ID': 'HSCE00000000',
+                               'FRAMEID': 'HSCA%08d' % (det_id),
+                               'OBJECT': 'BENCHMARK'})
+        images.append(image)
+    return images
+
+
+def time_pack(dr, images, num_workers, executor):
+    time_start = time.time()
+    hdulist = dr.make_multi_hdu(images, compress=True,
+                                num_workers=num_workers, executor=executor)
+    # compression happens (at the latest) when the file is written
+    buf = io.BytesIO()
+    hdulist.writeto(buf)
+    return time.time() - time_start
+
+
+def main(options, args):
+    logger = log.get_logger('bench', level=30, log_stderr=True)
+    dr = hsc_dr.HyperSuprimeCamDR(logger=logger)
+
+    print("making a synthetic exposure of %d CCDs..." % (options.num_ccds))
+    images = mk_exposure(options.num_ccds)
+    mbytes = sum([image.get_data().nbytes for image in images]) / 1.0e6
+
+    t_serial = time_pack(dr, images, 1, options.executor)
+    print("serial:   %8.2f sec  %8.1f MB/s" % (t_serial, mbytes / t_serial))
+
+    t_par = time_pack(dr, images, options.num_workers, options.executor)
+    print("parallel: %8.2f sec  %8.1f MB/s  (%d %s workers, x%.2f)" % (
+        t_par, mbytes / t_par, options.num_workers, options.executor,
+        t_serial / t_par))
+    print("%d CPU(s): parallel is %s here; the default is serial"
+          " (num_workers=%d)" % (os.cpu_count() or 1,
+                                 "faster" if t_par < t_serial else "slower",
+                                 dr.num_workers))
+
+
+if __name__ == '__main__':
+    argprs = ArgumentParser(description="Benchmark multi-HDU compression")
+    argprs.add_argument("-n", "--num-ccds", dest="num_ccds", type=int,
+                        default=hsc_dr.num_ccds,
+                        help="Number of CCDs in the exposure")
+    argprs.add_argument("-w", "--workers", dest="num_workers", type=int,
+                        default=8, help="Number of workers")
+    argprs.add_argument("-e", "--executor", dest="executor",
+                        default='process', choices=('process', 'thread'),
+                        help="Kind of worker pool")
+    (options, args) = argprs.parse_known_args(sys.argv[1:])
+
+    main(options, args)
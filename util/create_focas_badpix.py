@@ -0,0 +1,83 @@
+"""
+Program for generating the bad pixel maps of the FOCAS chips
+(naoj/focas/data/badpix.npz) that are used by naoj.focas.badpix to
+repair the overscan removed and trimmed data of each chip.
+
+The defects are boxes in the coordinates of the trimmed data of a chip
+(1-based, inclusive), given for a DET-ID and BIN-FCT2, and applied to
+every BIN-FCT1. Boxes are clipped to the size of the trimmed data.
+More defects can be read from a text file with one box per line:
+
+    DET-ID BIN-FCT2 METHOD X1 X2 Y1 Y2
+
+where METHOD is 'column', 'row' or 'pixel' (see naoj.focas.badpix).
+
+Usage:
+  python create_focas_badpix.py [-f DEFECT_FILE] [-o OUTPUT_FILE]
+"""
+import sys
+from argparse import ArgumentParser
+
+import numpy as np
+
+from naoj.focas import badpix, bias_overscan
+
+# DET-ID, BIN-FCT2, repair method, x1, x2, y1, y2
+defects = [
+    (1, 1, 'column', 397, 397, 2387, 4225),  # for 2x1 bin
+    (1, 2, 'column', 397, 397, 1189, 2105),  # for 2x2 bin
+    ]
+
+
+def read_defects(filepath):
+    res = []
+    with open(filepath, 'r') as in_f:
+        for line in in_f:
+            line = line.split('#')[0].strip()
+            if len(line) == 0:
+                continue
+            detid, binfac2, method, x1, x2, y1, y2 = line.split()
+            res.append((int(detid), int(binfac2), method,
+                        int(x1), int(x2), int(y1), int(y2)))
+    return res
+
+
+def make_masks(defects):
+    masks = {}
+    for detid, binfac2, method, x1, x2, y1, y2 in defects:
+        for binfac1 in sorted(bias_overscan.overscan.keys()):
+            shape = bias_overscan.chip_shape({'BIN-FCT1': binfac1,
+                                              'BIN-FCT2': binfac2,
+                                              'DET-ID': detid})
+            chip_masks = masks.setdefault((detid, binfac1, binfac2), {})
+            mask = chip_masks.setdefault(method,
+                                         np.zeros(shape, dtype=bool))
+            mask[y1-1:y2, x1-1:x2] = True
+    return masks
+
+
+def main(options, args):
+    all_defects = list(defects)
+    if options.defect_file is not None:
+        all_defects.extend(read_defects(options.defect_file))
+
+    masks = make_masks(all_defects)
+    badpix.save_masks(options.outfile, masks)
+    for key in sorted(masks.keys()):
+        print("DET-ID=%d BIN-FCT1=%d BIN-FCT2=%d: %s" % (
+            key[0], key[1], key[2],
+            ', '.join(['%d %s' % (np.count_nonzero(mask), method)
+                       for method, mask in masks[key].items()])))
+
+
+if __name__ == '__main__':
+    argprs = ArgumentParser(description="Make the FOCAS bad pixel maps")
+    argprs.add_argument("-f", "--defects", dest="defect_file",
+                        default=None, metavar="FILE",
+                        help="Read more defect boxes from FILE")
+    argprs.add_argument("-o", "--output", dest="outfile",
+                        default=badpix.badpix_file, metavar="FILE",
+                        help="Output file (default: the file in the package)")
+    (options, args) = argprs.parse_known_args(sys.argv[1:])
+
+    main(options, args)
@@ -1,11 +1,11 @@
 """
 Program for reading HSC detector info from a text file for the purpose
-of generating a module that can be imported into the HSCPlanner Ginga
-plugin for drawing the detector pattern outlines.
+of generating the table of CCD outlines (naoj/hsc/data/ccd_info.npz)
+that is used by the HSCPlanner Ginga plugin for drawing the detector
+pattern outlines.
 """
 import sys
 import re
-import pprint
 
 
 def read_ccd_polygon_coords(filepath):
@@ -27,15 +27,11 @@ def read_ccd_polygon_coords(filepath):
 
     return info
 
-def write_python_ccd_polygon_coords(filepath, info):
+def write_ccd_polygon_coords(filepath, info):
 
-    keys = list(info.keys())
-    keys.sort()
-
-    with open(filepath, 'w') as out_f:
-        out_f.write("info = ")
-        pprint.pprint(info, stream=out_f)
+    from naoj.hsc import ccd_info
 
+    ccd_info.save_info(filepath, info)
 
 
 def main(options, args):
@@ -46,7 +42,8 @@ def main(options, args):
     import hsc_ccd_info
     info = hsc_ccd_info.info
 
-    from naoj.hsc import hsc_dr
+    from naoj.hsc import hsc_dr, ccd_info
+    ccd_data = hsc_dr.get_ccd_data()
 
     #colors = ['green', 'skyblue', 'orange', 'purple', 'tan', 'cyan', 'gold']
     keys = list(info.keys())
@@ -55,6 +52,9 @@ def main(options, args):
         ## info[keys[i]]['color'] = colors[i % len(colors)]
         det_id = keys[i]
         addl = hsc_dr.ccd_aux_info1[det_id]
+        d = ccd_data[det_id]
+        info[det_id]['channel_dir'] = ccd_info.channel_direction(
+            d.fliph, d.flipv, d.swapxy)
         if 'bad_channels' in addl:
             info[det_id]['color'] = 'red'
             info[det_id]['bad_channels'] = addl['bad_channels']
@@ -63,7 +63,7 @@ def main(options, args):
         elif addl['bee_id'] == 1:
             info[det_id]['color'] = 'violet'
 
-    write_python_ccd_polygon_coords(outfile, info)
+    write_ccd_polygon_coords(outfile, info)
 
 if __name__ == '__main__':
     main(None, sys.argv[1:])